@@ -63,10 +63,8 @@ for i in range(min(ncon, 5)):
     ci = model.icons(i, x0)
     print 'c%d(x0) = %-g' % (i, ci)
     sgi = model.sigrad(i, x0)
-    k = sgi.keys()
-    ssgi = {}
-    for j in range(min(5, len(k))):
-        ssgi[k[j]] = sgi[k[j]]
+    ssgi = dict(zip(sgi.indices[:5].tolist(),
+                    sgi.values[:5].tolist()))
     print '∇c%d(x0) = ' % i, ssgi
 
 print
@@ -100,18 +98,20 @@ print
 for i in xrange(min(ncon, 5)):
     model.compute_scaling_cons(reset=True)
     sgi = model.sigrad(i, x0)
-    imax = max(sgi.values, key=lambda x: abs(sgi.values.get(x)))
-    imin = min(sgi.values, key=lambda x: abs(sgi.values.get(x)))
+    kmax = np.argmax(np.abs(sgi.values))
+    kmin = np.argmin(np.abs(sgi.values))
     print 'Constraint %3i: ' % i,
     print ' Max/Min gradient (unscaled): %12.5e (%3i) / %12.5e (%3i)' \
-        % (sgi[imax], imax, sgi[imin], imin)
+        % (sgi.values[kmax], sgi.indices[kmax],
+           sgi.values[kmin], sgi.indices[kmin])
     model.compute_scaling_cons()
     sgi = model.sigrad(i, x0)
-    imax = max(sgi.values, key=lambda x: abs(sgi.values.get(x)))
-    imin = min(sgi.values, key=lambda x: abs(sgi.values.get(x)))
+    kmax = np.argmax(np.abs(sgi.values))
+    kmin = np.argmin(np.abs(sgi.values))
     print 'Constraint %3i: ' % i,
     print ' Max/Min gradient ( scaled): %12.5e (%3i) / %12.5e (%3i)' \
-        % (sgi[imax], imax, sgi[imin], imin)
+        % (sgi.values[kmax], sgi.indices[kmax],
+           sgi.values[kmin], sgi.indices[kmin])
 
 # Output "solution"
 model.writesol(x0, pi0, 'And the winner is')
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Comparison of Trunk and the cubic regularization method ARC.
+
+Each problem given on the command line is solved with Trunk, with the
+truncated conjugate gradient and GLTR subproblem solvers, then with ARC. The
+Hessian is evaluated once per iteration by Trunk and once per successful
+iteration by ARC. The number of iterations, of objective, gradient and
+Hessian evaluations, of Hessian-vector products and the solve time are
+reported.
+
+    python demo_arc.py genrose rosenbr woods
+"""
+
+from nlp.model.amplmodel import AmplModel
+from nlp.optimize.arc import ARC, GLRT
+from nlp.optimize.gltr import GLTR
+from nlp.optimize.pcg import TruncatedCG
+from nlp.optimize.trunk import Trunk
+from nlp.tr.trustregion import TrustRegion
+from os.path import basename, splitext
+import sys
+
+headerfmt = "%-15s %-6s %-11s %-8s %-7s %-5s %-5s %-5s %-5s %-6s %-5s\n"
+header = headerfmt % ("problem", "nvar", "solver", "f", u"‖∇f‖", "iter",
+                      "#f", u"#∇f", "#H", "#Hv", "time")
+format = "%-15s %-6d %-11s %-8.1e %-7.1e %-5d %-5d %-5d %-5d %-6d %-5.2f\n"
+sys.stdout.write(header)
+
+for problem_name in sys.argv[1:]:
+    probname = basename(splitext(problem_name)[0])
+    for name in ["Trunk-CG", "Trunk-GLTR", "ARC"]:
+        model = AmplModel(problem_name)
+        if name == "ARC":
+            solver = ARC(model, GLRT)
+        else:
+            tr_solver = TruncatedCG if name == "Trunk-CG" else GLTR
+            solver = Trunk(model, TrustRegion(), tr_solver)
+        solver.solve()
+
+        # ARC evaluates the Hessian where it evaluates the gradient, except
+        # at the final iterate.
+        nhess = solver.iter if name != "ARC" else model.grad.ncalls - 1
+
+        sys.stdout.write(format % (probname, model.n, name, solver.f,
+                                   solver.gNorm, solver.iter,
+                                   model.obj.ncalls, model.grad.ncalls,
+                                   nhess, model.hprod.ncalls, solver.tsolve))
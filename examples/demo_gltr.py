@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""Comparison of the truncated CG and GLTR subproblem solvers in Trunk.
+
+Each problem given on the command line is solved with Trunk, first with the
+truncated conjugate gradient method, which stops on the trust-region
+boundary, then with the generalized Lanczos method, which continues on the
+boundary. The number of outer and inner iterations and the solve time are
+reported.
+
+    python demo_gltr.py genrose rosenbr woods
+"""
+
+from nlp.model.amplmodel import AmplModel
+from nlp.optimize.gltr import GLTR
+from nlp.optimize.pcg import TruncatedCG
+from nlp.optimize.trunk import Trunk
+from nlp.tr.trustregion import TrustRegion
+from os.path import basename, splitext
+import sys
+
+headerfmt = "%-15s %-6s %-11s %-8s %-7s %-5s %-6s %-5s\n"
+header = headerfmt % ("problem", "nvar", "solver", "f", u"‖∇f‖", "iter",
+                      "cgiter", "time")
+format = "%-15s %-6d %-11s %-8.1e %-7.1e %-5d %-6d %-5.2f\n"
+sys.stdout.write(header)
+
+for problem_name in sys.argv[1:]:
+    probname = basename(splitext(problem_name)[0])
+    for tr_solver in [TruncatedCG, GLTR]:
+        model = AmplModel(problem_name)
+        trunk = Trunk(model, TrustRegion(), tr_solver)
+        trunk.solve()
+
+        sys.stdout.write(format % (probname, model.n, tr_solver.__name__,
+                                   trunk.f, trunk.gNorm, trunk.iter,
+                                   trunk.total_cgiter, trunk.tsolve))
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of the limited-memory BFGS preconditioner of Trunk.
+
+Each problem given on the command line is solved with Trunk, without
+preconditioner and with a L-BFGS preconditioner built from the iterations of
+previous conjugate gradient solves, for several values of the memory.
+The total number of conjugate gradient iterations is reported.
+
+    python demo_lbfgs_precon.py genrose rosenbr woods
+"""
+
+from nlp.model.amplmodel import AmplModel
+from nlp.optimize.pcg import TruncatedCG
+from nlp.optimize.precon import LBFGSPreconditioner
+from nlp.optimize.trunk import Trunk
+from nlp.tr.trustregion import TrustRegion
+from os.path import basename, splitext
+import sys
+
+headerfmt = "%-15s %-6s %-5s %-8s %-7s %-5s %-6s %-5s\n"
+header = headerfmt % ("problem", "nvar", "pairs", "f", u"‖∇f‖", "iter",
+                      "cgiter", "time")
+format = "%-15s %-6d %-5d %-8.1e %-7.1e %-5d %-6d %-5.2f\n"
+sys.stdout.write(header)
+
+for problem_name in sys.argv[1:]:
+    probname = basename(splitext(problem_name)[0])
+    for m in [0, 2, 5, 10, 20]:
+        model = AmplModel(problem_name)
+        precon = LBFGSPreconditioner(model.n, memory=m) if m > 0 else None
+        trunk = Trunk(model, TrustRegion(), TruncatedCG,
+                      preconditioner=precon)
+        trunk.solve()
+
+        sys.stdout.write(format % (probname, model.n, m, trunk.f,
+                                   trunk.gNorm, trunk.iter,
+                                   trunk.total_cgiter, trunk.tsolve))
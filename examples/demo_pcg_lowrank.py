@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of the truncated conjugate gradient method on large Hessians.
+
+The Hessian H = D + UUᵀ, where D is diagonal and U has a few columns, is
+applied either as a linear operator, which returns a new vector at each
+product, or by a function that writes the product into a work vector.
+
+    python demo_pcg_lowrank.py [n] [rank]
+"""
+
+import numpy as np
+from scipy.linalg import blas
+from pykrylov.linop import LinearOperator
+from nlp.model.nlpmodel import QPModel
+from nlp.optimize.pcg import TruncatedCG
+from nlp.tools.timing import cputime
+import sys
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+rank = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+rng = np.random.RandomState(0)
+d = 1 + rng.rand(n)
+U = np.asfortranarray(rng.randn(n, rank) / np.sqrt(n))
+g = rng.randn(n)
+Utv = np.empty(rank)
+
+
+def operator(v):
+    return d * v + np.dot(U, np.dot(U.T, v))
+
+
+def hprod(v, out):
+    np.multiply(d, v, out=out)
+    np.dot(U.T, v, out=Utv)
+    blas.dgemv(1.0, U, Utv, beta=1.0, y=out, overwrite_y=True)
+    return out
+
+
+H = LinearOperator(n, n, operator, symmetric=True)
+
+headerfmt = "%-10s %-9s %-5s %-9s %-6s\n"
+header = headerfmt % ("product", "radius", "iter", u"‖s‖", "time")
+format = "%-10s %-9.1e %-5d %-9.2e %-6.2f\n"
+sys.stdout.write(header)
+
+for radius in [None, 10.0]:
+    for name, kwargs in [("operator", {}), ("in place", {"hprod": hprod})]:
+        cg = TruncatedCG(QPModel(g, H))
+        t = cputime()
+        cg.solve(radius=radius, reltol=1.0e-8, **kwargs)
+        t = cputime() - t
+        sys.stdout.write(format % (name, radius or np.inf, cg.niter,
+                                   cg.step_norm, t))
@@ -50,7 +50,7 @@ class LineSearch(object):
         if self._step <= self.stepmin:
             raise LineSearchFailure("initial linesearch step too small")
 
-        self._trial_iterate = self.linemodel.x + self.step * self.linemodel.d
+        self._trial_iterate = self.linemodel.trial(self.step)
         self._trial_value = kwargs.get("trial_value", None)
         if self._trial_value is None:
             self._trial_value = self.linemodel.obj(self.step, x=self.iterate)
@@ -117,6 +117,16 @@ class LineSearch(object):
     def next(self):
         raise NotImplementedError("Please subclass")
 
+    def search(self):
+        """Run the linesearch to termination and return the final step.
+
+        Subclasses may override this method with an implementation that
+        does not go through the iteration protocol.
+        """
+        for step in self:
+            pass
+        return self.step
+
 
 class ArmijoLineSearch(LineSearch):
     """Armijo backtracking linesearch."""
@@ -126,22 +136,29 @@ class ArmijoLineSearch(LineSearch):
 
         The search stops as soon as a step size t is found such that
 
-            ϕ(t) <= ϕ(0) + t * ftol * ϕ'(0)
+            ϕ(t) <= ϕᵣ + t * ftol * ϕ'(0)
 
         where 0 < ftol < 1 and ϕ'(0) is the directional derivative of
-        a merit function f in the descent direction d. true.
+        a merit function f in the descent direction d. true. The reference
+        value ϕᵣ ≥ ϕ(0) is ϕ(0) unless otherwise specified. A larger value,
+        such as the largest of the last few merit function values, results
+        in a non-monotone linesearch.
 
         :keywords:
             :ftol: constant used in Armijo condition (default: 1.0e-4)
             :bkmax: maximum number of backtracking steps (default: 20)
             :decr: factor by which to reduce the steplength
                    during the backtracking (default: 1.5).
+            :ref_value: reference value ϕᵣ (default: ϕ(0)).
         """
         name = kwargs.pop("name", "Armijo linesearch")
         super(ArmijoLineSearch, self).__init__(*args, name=name, **kwargs)
         self.__ftol = max(min(kwargs.get("ftol", 1.0e-4), 1 - sqeps), sqeps)
         self.__bkmax = max(kwargs.get("bkmax", 20), 0)
         self.__decr = max(min(kwargs.get("decr", 1.5), 100), 1.001)
+        ref_value = kwargs.get("ref_value", None)
+        self.__ref_value = self.value if ref_value is None else \
+            max(ref_value, self.value)
         self._bk = 0
         return
 
@@ -161,8 +178,13 @@ class ArmijoLineSearch(LineSearch):
     def bk(self):
         return self._bk
 
+    @property
+    def ref_value(self):
+        return self.__ref_value
+
     def next(self):
-        if self.trial_value <= self.value + self.step * self.ftol * self.slope:
+        goal = self.ref_value + self.step * self.ftol * self.slope
+        if self.trial_value <= goal:
             raise StopIteration()
 
         self._bk += 1
@@ -173,7 +195,7 @@ class ArmijoLineSearch(LineSearch):
         if self.step < self.stepmin:
             raise LineSearchFailure("linesearch step too small")
 
-        self._trial_iterate = self.linemodel.x + self.step * self.linemodel.d
+        self._trial_iterate = self.linemodel.trial(self.step)
         self._trial_value = self.linemodel.obj(self.step, x=self.iterate)
 
         return self.step
@@ -201,6 +223,8 @@ class ArmijoWolfeLineSearch(ArmijoLineSearch):
                    loose Wolfe search (default: 5.0)
             :decr: factor by which to reduce the steplength
                    during the backtracking (default: 1.5).
+            :ref_value: reference value in the Armijo condition
+                        (default: ϕ(0)).
         """
         name = kwargs.pop("name", "Armijo-Wolfe linesearch")
         super(ArmijoWolfeLineSearch, self).__init__(*args, name=name, **kwargs)
@@ -232,7 +256,7 @@ class ArmijoWolfeLineSearch(ArmijoLineSearch):
         return self._trial_slope
 
     def next(self):
-        goal = self.value + self.step * self.ftol * self.slope
+        goal = self.ref_value + self.step * self.ftol * self.slope
         armijo = self.trial_value <= goal
 
         # Increase step to try and satisfy loose Wolfe condition.
@@ -241,10 +265,9 @@ class ArmijoWolfeLineSearch(ArmijoLineSearch):
             step = self.step
             self._nw += 1
             self._step *= self.incr
-            self._trial_iterate = self.linemodel.x + \
-                self.step * self.linemodel.d
-            self._trial_value = self.linemodel.obj(self.step)
-            self._trial_slope = self.linemodel.grad(self.step)
+            self._trial_iterate = self.linemodel.trial(self.step)
+            self._trial_value, self._trial_slope = \
+                self.linemodel.obj_grad(self.step, x=self.iterate)
             return step
 
         if self._bk > self.bkmax:
@@ -262,7 +285,7 @@ class ArmijoWolfeLineSearch(ArmijoLineSearch):
         if self.step < self.stepmin:
             raise LineSearchFailure("linesearch step too small")
 
-        self._trial_iterate = self.linemodel.x + self.step * self.linemodel.d
-        self._trial_value = self.linemodel.obj(self.step)
-        self._trial_slope = self.linemodel.grad(self.step)
+        self._trial_iterate = self.linemodel.trial(self.step)
+        self._trial_value, self._trial_slope = \
+            self.linemodel.obj_grad(self.step, x=self.iterate)
         return self.step
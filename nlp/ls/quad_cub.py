@@ -95,7 +95,7 @@ class QuadraticCubicLineSearch(LineSearch):
         if self.step < self.stepmin:
             raise LineSearchFailure("linesearch step too small")
 
-        self._trial_iterate = self.linemodel.x + self.step * self.linemodel.d
+        self._trial_iterate = self.linemodel.trial(self.step)
         self._trial_value = self.linemodel.obj(self.step, x=self.iterate)
 
         return self.step  # return value of step just tested
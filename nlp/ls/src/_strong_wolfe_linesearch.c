@@ -1,25 +1,13 @@
-/* Generated by Cython 0.22 */
+/* Generated by Cython 0.23.4 */
 
 #define PY_SSIZE_T_CLEAN
-#ifndef CYTHON_USE_PYLONG_INTERNALS
-#ifdef PYLONG_BITS_IN_DIGIT
-#define CYTHON_USE_PYLONG_INTERNALS 0
-#else
-#include "pyconfig.h"
-#ifdef PYLONG_BITS_IN_DIGIT
-#define CYTHON_USE_PYLONG_INTERNALS 1
-#else
-#define CYTHON_USE_PYLONG_INTERNALS 0
-#endif
-#endif
-#endif
 #include "Python.h"
 #ifndef Py_PYTHON_H
     #error Python headers needed to compile C extensions, please install development version of Python.
 #elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03020000)
     #error Cython requires Python 2.6+ or Python 3.2+.
 #else
-#define CYTHON_ABI "0_22"
+#define CYTHON_ABI "0_23_4"
 #include <stddef.h>
 #ifndef offsetof
 #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
@@ -54,6 +42,9 @@
 #define CYTHON_COMPILING_IN_PYPY 0
 #define CYTHON_COMPILING_IN_CPYTHON 1
 #endif
+#if !defined(CYTHON_USE_PYLONG_INTERNALS) && CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x02070000
+#define CYTHON_USE_PYLONG_INTERNALS 1
+#endif
 #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
 #define Py_OptimizeFlag 0
 #endif
@@ -61,26 +52,30 @@
 #define CYTHON_FORMAT_SSIZE_T "z"
 #if PY_MAJOR_VERSION < 3
   #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
-  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos) \
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
           PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
   #define __Pyx_DefaultClassType PyClass_Type
 #else
   #define __Pyx_BUILTIN_MODULE_NAME "builtins"
-  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos) \
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
           PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
   #define __Pyx_DefaultClassType PyType_Type
 #endif
-#if PY_MAJOR_VERSION >= 3
+#ifndef Py_TPFLAGS_CHECKTYPES
   #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
   #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
   #define Py_TPFLAGS_HAVE_NEWBUFFER 0
 #endif
-#if PY_VERSION_HEX < 0x030400a1 && !defined(Py_TPFLAGS_HAVE_FINALIZE)
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
   #define Py_TPFLAGS_HAVE_FINALIZE 0
 #endif
 #if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
   #define CYTHON_PEP393_ENABLED 1
-  #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ? \
+  #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
                                               0 : _PyUnicode_Ready((PyObject *)(op)))
   #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
   #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
@@ -99,12 +94,13 @@
 #if CYTHON_COMPILING_IN_PYPY
   #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
   #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
-  #define __Pyx_PyFrozenSet_Size(s)         PyObject_Size(s)
 #else
   #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
-  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ? \
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
       PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
-  #define __Pyx_PyFrozenSet_Size(s)         PySet_Size(s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
 #endif
 #define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None)) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
 #define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None)) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
@@ -169,16 +165,18 @@
 #else
   #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
 #endif
-#ifndef CYTHON_INLINE
-  #if defined(__GNUC__)
-    #define CYTHON_INLINE __inline__
-  #elif defined(_MSC_VER)
-    #define CYTHON_INLINE __inline
-  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
-    #define CYTHON_INLINE inline
-  #else
-    #define CYTHON_INLINE
-  #endif
+#if PY_VERSION_HEX >= 0x030500B1
+#define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+#define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+#elif CYTHON_COMPILING_IN_CPYTHON && PY_MAJOR_VERSION >= 3
+typedef struct {
+    unaryfunc am_await;
+    unaryfunc am_aiter;
+    unaryfunc am_anext;
+} __Pyx_PyAsyncMethodsStruct;
+#define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+#else
+#define __Pyx_PyType_AsAsync(obj) NULL
 #endif
 #ifndef CYTHON_RESTRICT
   #if defined(__GNUC__)
@@ -191,35 +189,33 @@
     #define CYTHON_RESTRICT
   #endif
 #endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+
+#ifndef CYTHON_INLINE
+  #if defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#if defined(WIN32) || defined(MS_WINDOWS)
+  #define _USE_MATH_DEFINES
+#endif
+#include <math.h>
 #ifdef NAN
 #define __PYX_NAN() ((float) NAN)
 #else
 static CYTHON_INLINE float __PYX_NAN() {
-  /* Initialize NaN. The sign is irrelevant, an exponent with all bits 1 and
-   a nonzero mantissa means NaN. If the first bit in the mantissa is 1, it is
-   a quiet NaN. */
   float value;
   memset(&value, 0xFF, sizeof(value));
   return value;
 }
 #endif
-#define __Pyx_void_to_None(void_result) (void_result, Py_INCREF(Py_None), Py_None)
-#ifdef __cplusplus
-template<typename T>
-void __Pyx_call_destructor(T* x) {
-    x->~T();
-}
-template<typename T>
-class __Pyx_FakeReference {
-  public:
-    __Pyx_FakeReference() : ptr(NULL) { }
-    __Pyx_FakeReference(T& ref) : ptr(&ref) { }
-    T *operator->() { return ptr; }
-    operator T&() { return *ptr; }
-  private:
-    T *ptr;
-};
-#endif
 
 
 #if PY_MAJOR_VERSION >= 3
@@ -238,10 +234,6 @@ class __Pyx_FakeReference {
   #endif
 #endif
 
-#if defined(WIN32) || defined(MS_WINDOWS)
-#define _USE_MATH_DEFINES
-#endif
-#include <math.h>
 #define __PYX_HAVE___strong_wolfe_linesearch
 #define __PYX_HAVE_API___strong_wolfe_linesearch
 #include "string.h"
@@ -271,6 +263,13 @@ class __Pyx_FakeReference {
 #   define CYTHON_UNUSED
 # endif
 #endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
 typedef struct {PyObject **p; char *s; const Py_ssize_t n; const char* encoding;
                 const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
 
@@ -279,16 +278,34 @@ typedef struct {PyObject **p; char *s; const Py_ssize_t n; const char* encoding;
 #define __PYX_DEFAULT_STRING_ENCODING ""
 #define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
 #define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
-#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (    \
-    (sizeof(type) < sizeof(Py_ssize_t))  ||             \
-    (sizeof(type) > sizeof(Py_ssize_t) &&               \
-          likely(v < (type)PY_SSIZE_T_MAX ||            \
-                 v == (type)PY_SSIZE_T_MAX)  &&         \
-          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||       \
-                                v == (type)PY_SSIZE_T_MIN)))  ||  \
-    (sizeof(type) == sizeof(Py_ssize_t) &&              \
-          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||        \
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
                                v == (type)PY_SSIZE_T_MAX)))  )
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER) && defined (_M_X64)
+    #define __Pyx_sst_abs(value) _abs64(value)
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
 static CYTHON_INLINE char* __Pyx_PyObject_AsString(PyObject*);
 static CYTHON_INLINE char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
 #define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
@@ -323,8 +340,9 @@ static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u)
 #define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
 #define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
 #define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
-#define __Pyx_Owned_Py_None(b) (Py_INCREF(Py_None), Py_None)
-#define __Pyx_PyBool_FromLong(b) ((b) ? (Py_INCREF(Py_True), Py_True) : (Py_INCREF(Py_False), Py_False))
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+#define __Pyx_PyBool_FromLong(b) ((b) ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False))
 static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
 static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x);
 static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
@@ -493,7 +511,7 @@ typedef struct {
 } __Pyx_BufFmt_Context;
 
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":726
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":725
  * # in Cython to enable them only on the right systems.
  * 
  * ctypedef npy_int8       int8_t             # <<<<<<<<<<<<<<
@@ -502,7 +520,7 @@ typedef struct {
  */
 typedef npy_int8 __pyx_t_5numpy_int8_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":727
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":726
  * 
  * ctypedef npy_int8       int8_t
  * ctypedef npy_int16      int16_t             # <<<<<<<<<<<<<<
@@ -511,7 +529,7 @@ typedef npy_int8 __pyx_t_5numpy_int8_t;
  */
 typedef npy_int16 __pyx_t_5numpy_int16_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":728
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":727
  * ctypedef npy_int8       int8_t
  * ctypedef npy_int16      int16_t
  * ctypedef npy_int32      int32_t             # <<<<<<<<<<<<<<
@@ -520,7 +538,7 @@ typedef npy_int16 __pyx_t_5numpy_int16_t;
  */
 typedef npy_int32 __pyx_t_5numpy_int32_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":729
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":728
  * ctypedef npy_int16      int16_t
  * ctypedef npy_int32      int32_t
  * ctypedef npy_int64      int64_t             # <<<<<<<<<<<<<<
@@ -529,7 +547,7 @@ typedef npy_int32 __pyx_t_5numpy_int32_t;
  */
 typedef npy_int64 __pyx_t_5numpy_int64_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":733
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":732
  * #ctypedef npy_int128     int128_t
  * 
  * ctypedef npy_uint8      uint8_t             # <<<<<<<<<<<<<<
@@ -538,7 +556,7 @@ typedef npy_int64 __pyx_t_5numpy_int64_t;
  */
 typedef npy_uint8 __pyx_t_5numpy_uint8_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":734
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":733
  * 
  * ctypedef npy_uint8      uint8_t
  * ctypedef npy_uint16     uint16_t             # <<<<<<<<<<<<<<
@@ -547,7 +565,7 @@ typedef npy_uint8 __pyx_t_5numpy_uint8_t;
  */
 typedef npy_uint16 __pyx_t_5numpy_uint16_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":735
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":734
  * ctypedef npy_uint8      uint8_t
  * ctypedef npy_uint16     uint16_t
  * ctypedef npy_uint32     uint32_t             # <<<<<<<<<<<<<<
@@ -556,7 +574,7 @@ typedef npy_uint16 __pyx_t_5numpy_uint16_t;
  */
 typedef npy_uint32 __pyx_t_5numpy_uint32_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":736
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":735
  * ctypedef npy_uint16     uint16_t
  * ctypedef npy_uint32     uint32_t
  * ctypedef npy_uint64     uint64_t             # <<<<<<<<<<<<<<
@@ -565,7 +583,7 @@ typedef npy_uint32 __pyx_t_5numpy_uint32_t;
  */
 typedef npy_uint64 __pyx_t_5numpy_uint64_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":740
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":739
  * #ctypedef npy_uint128    uint128_t
  * 
  * ctypedef npy_float32    float32_t             # <<<<<<<<<<<<<<
@@ -574,7 +592,7 @@ typedef npy_uint64 __pyx_t_5numpy_uint64_t;
  */
 typedef npy_float32 __pyx_t_5numpy_float32_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":741
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":740
  * 
  * ctypedef npy_float32    float32_t
  * ctypedef npy_float64    float64_t             # <<<<<<<<<<<<<<
@@ -583,7 +601,7 @@ typedef npy_float32 __pyx_t_5numpy_float32_t;
  */
 typedef npy_float64 __pyx_t_5numpy_float64_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":750
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":749
  * # The int types are mapped a bit surprising --
  * # numpy.int corresponds to 'l' and numpy.long to 'q'
  * ctypedef npy_long       int_t             # <<<<<<<<<<<<<<
@@ -592,7 +610,7 @@ typedef npy_float64 __pyx_t_5numpy_float64_t;
  */
 typedef npy_long __pyx_t_5numpy_int_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":751
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":750
  * # numpy.int corresponds to 'l' and numpy.long to 'q'
  * ctypedef npy_long       int_t
  * ctypedef npy_longlong   long_t             # <<<<<<<<<<<<<<
@@ -601,7 +619,7 @@ typedef npy_long __pyx_t_5numpy_int_t;
  */
 typedef npy_longlong __pyx_t_5numpy_long_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":752
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":751
  * ctypedef npy_long       int_t
  * ctypedef npy_longlong   long_t
  * ctypedef npy_longlong   longlong_t             # <<<<<<<<<<<<<<
@@ -610,7 +628,7 @@ typedef npy_longlong __pyx_t_5numpy_long_t;
  */
 typedef npy_longlong __pyx_t_5numpy_longlong_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":754
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":753
  * ctypedef npy_longlong   longlong_t
  * 
  * ctypedef npy_ulong      uint_t             # <<<<<<<<<<<<<<
@@ -619,7 +637,7 @@ typedef npy_longlong __pyx_t_5numpy_longlong_t;
  */
 typedef npy_ulong __pyx_t_5numpy_uint_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":755
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":754
  * 
  * ctypedef npy_ulong      uint_t
  * ctypedef npy_ulonglong  ulong_t             # <<<<<<<<<<<<<<
@@ -628,7 +646,7 @@ typedef npy_ulong __pyx_t_5numpy_uint_t;
  */
 typedef npy_ulonglong __pyx_t_5numpy_ulong_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":756
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":755
  * ctypedef npy_ulong      uint_t
  * ctypedef npy_ulonglong  ulong_t
  * ctypedef npy_ulonglong  ulonglong_t             # <<<<<<<<<<<<<<
@@ -637,7 +655,7 @@ typedef npy_ulonglong __pyx_t_5numpy_ulong_t;
  */
 typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":758
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":757
  * ctypedef npy_ulonglong  ulonglong_t
  * 
  * ctypedef npy_intp       intp_t             # <<<<<<<<<<<<<<
@@ -646,7 +664,7 @@ typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
  */
 typedef npy_intp __pyx_t_5numpy_intp_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":759
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":758
  * 
  * ctypedef npy_intp       intp_t
  * ctypedef npy_uintp      uintp_t             # <<<<<<<<<<<<<<
@@ -655,7 +673,7 @@ typedef npy_intp __pyx_t_5numpy_intp_t;
  */
 typedef npy_uintp __pyx_t_5numpy_uintp_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":761
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":760
  * ctypedef npy_uintp      uintp_t
  * 
  * ctypedef npy_double     float_t             # <<<<<<<<<<<<<<
@@ -664,7 +682,7 @@ typedef npy_uintp __pyx_t_5numpy_uintp_t;
  */
 typedef npy_double __pyx_t_5numpy_float_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":762
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":761
  * 
  * ctypedef npy_double     float_t
  * ctypedef npy_double     double_t             # <<<<<<<<<<<<<<
@@ -673,7 +691,7 @@ typedef npy_double __pyx_t_5numpy_float_t;
  */
 typedef npy_double __pyx_t_5numpy_double_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":763
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":762
  * ctypedef npy_double     float_t
  * ctypedef npy_double     double_t
  * ctypedef npy_longdouble longdouble_t             # <<<<<<<<<<<<<<
@@ -704,7 +722,7 @@ typedef npy_longdouble __pyx_t_5numpy_longdouble_t;
 
 /*--- Type declarations ---*/
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":765
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":764
  * ctypedef npy_longdouble longdouble_t
  * 
  * ctypedef npy_cfloat      cfloat_t             # <<<<<<<<<<<<<<
@@ -713,7 +731,7 @@ typedef npy_longdouble __pyx_t_5numpy_longdouble_t;
  */
 typedef npy_cfloat __pyx_t_5numpy_cfloat_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":766
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":765
  * 
  * ctypedef npy_cfloat      cfloat_t
  * ctypedef npy_cdouble     cdouble_t             # <<<<<<<<<<<<<<
@@ -722,7 +740,7 @@ typedef npy_cfloat __pyx_t_5numpy_cfloat_t;
  */
 typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":767
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":766
  * ctypedef npy_cfloat      cfloat_t
  * ctypedef npy_cdouble     cdouble_t
  * ctypedef npy_clongdouble clongdouble_t             # <<<<<<<<<<<<<<
@@ -731,7 +749,7 @@ typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
  */
 typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":769
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":768
  * ctypedef npy_clongdouble clongdouble_t
  * 
  * ctypedef npy_cdouble     complex_t             # <<<<<<<<<<<<<<
@@ -739,6 +757,77 @@ typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
  * cdef inline object PyArray_MultiIterNew1(a):
  */
 typedef npy_cdouble __pyx_t_5numpy_complex_t;
+struct __pyx_t_24_strong_wolfe_linesearch_dcsrch_state;
+struct __pyx_ctuple_e327b__double__and_double__and_double__and_double__and_double__and_double__and_double__and_int__etc;
+typedef struct __pyx_ctuple_e327b__double__and_double__and_double__and_double__and_double__and_double__and_double__and_int__etc __pyx_ctuple_e327b__double__and_double__and_double__and_double__and_double__and_double__and_double__and_int__etc;
+
+/* "_strong_wolfe_linesearch.pyx":12
+ * # Values of the task. The corresponding strings, used by the Python
+ * # interface, are listed in `task_messages`.
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     START = 0
+ *     FG
+ */
+enum  {
+  __pyx_e_24_strong_wolfe_linesearch_START = 0,
+  __pyx_e_24_strong_wolfe_linesearch_FG,
+  __pyx_e_24_strong_wolfe_linesearch_CONVERGENCE,
+  __pyx_e_24_strong_wolfe_linesearch_WARNING_ROUNDING,
+  __pyx_e_24_strong_wolfe_linesearch_WARNING_XTOL,
+  __pyx_e_24_strong_wolfe_linesearch_WARNING_STPMAX,
+  __pyx_e_24_strong_wolfe_linesearch_WARNING_STPMIN,
+  __pyx_e_24_strong_wolfe_linesearch_ERROR_STP_STPMIN,
+  __pyx_e_24_strong_wolfe_linesearch_ERROR_STP_STPMAX,
+  __pyx_e_24_strong_wolfe_linesearch_ERROR_INITIAL_G,
+  __pyx_e_24_strong_wolfe_linesearch_ERROR_FTOL,
+  __pyx_e_24_strong_wolfe_linesearch_ERROR_GTOL,
+  __pyx_e_24_strong_wolfe_linesearch_ERROR_XTOL,
+  __pyx_e_24_strong_wolfe_linesearch_ERROR_STPMIN,
+  __pyx_e_24_strong_wolfe_linesearch_ERROR_STPMAX_STPMIN
+};
+
+/* "_strong_wolfe_linesearch.pyx":45
+ * 
+ * # Local variables of dcsrch preserved between calls.
+ * cdef struct dcsrch_state:             # <<<<<<<<<<<<<<
+ *     bint brackt
+ *     int stage
+ */
+struct __pyx_t_24_strong_wolfe_linesearch_dcsrch_state {
+  int brackt;
+  int stage;
+  double ginit;
+  double gtest;
+  double gx;
+  double gy;
+  double finit;
+  double fx;
+  double fy;
+  double stx;
+  double sty;
+  double stmin;
+  double stmax;
+  double width;
+  double width1;
+};
+
+/* "_strong_wolfe_linesearch.pyx":52
+ * 
+ * @cython.cdivision(True)
+ * cdef (double, double, double, double, double, double, double, bint) \             # <<<<<<<<<<<<<<
+ *         dcstep(double stx, double fx, double dx, double sty, double fy,
+ *                double dy, double stp, double fp, double dp, bint brackt,
+ */
+struct __pyx_ctuple_e327b__double__and_double__and_double__and_double__and_double__and_double__and_double__and_int__etc {
+  double f0;
+  double f1;
+  double f2;
+  double f3;
+  double f4;
+  double f5;
+  double f6;
+  int f7;
+};
 
 /* --- Runtime support code (head) --- */
 #ifndef CYTHON_REFNANNY
@@ -757,19 +846,19 @@ typedef npy_cdouble __pyx_t_5numpy_complex_t;
   static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
   #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
 #ifdef WITH_THREAD
-  #define __Pyx_RefNannySetupContext(name, acquire_gil) \
-          if (acquire_gil) { \
-              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure(); \
-              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__); \
-              PyGILState_Release(__pyx_gilstate_save); \
-          } else { \
-              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__); \
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
           }
 #else
-  #define __Pyx_RefNannySetupContext(name, acquire_gil) \
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
           __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
 #endif
-  #define __Pyx_RefNannyFinishContext() \
+  #define __Pyx_RefNannyFinishContext()\
           __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
   #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
   #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
@@ -792,33 +881,17 @@ typedef npy_cdouble __pyx_t_5numpy_complex_t;
   #define __Pyx_XGOTREF(r)
   #define __Pyx_XGIVEREF(r)
 #endif
-#define __Pyx_XDECREF_SET(r, v) do {                            \
-        PyObject *tmp = (PyObject *) r;                         \
-        r = v; __Pyx_XDECREF(tmp);                              \
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
     } while (0)
-#define __Pyx_DECREF_SET(r, v) do {                             \
-        PyObject *tmp = (PyObject *) r;                         \
-        r = v; __Pyx_DECREF(tmp);                               \
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
     } while (0)
 #define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
 #define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
 
-static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
-    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
-
-static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
-
-static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[], \
-    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args, \
-    const char* function_name);
-
-static CYTHON_INLINE int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
-    const char *name, int exact);
-
-static CYTHON_INLINE int  __Pyx_GetBufferAndValidate(Py_buffer* buf, PyObject* obj,
-    __Pyx_TypeInfo* dtype, int flags, int nd, int cast, __Pyx_BufFmt_StackElem* stack);
-static CYTHON_INLINE void __Pyx_SafeReleaseBuffer(Py_buffer* info);
-
 #include <string.h>
 
 static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals);
@@ -831,16 +904,6 @@ static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int
 #define __Pyx_PyString_Equals __Pyx_PyBytes_Equals
 #endif
 
-#define __Pyx_BufPtrStrided1d(type, buf, i0, s0) (type)((char*)buf + i0 * s0)
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
-
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
-
-static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void);
-
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb);
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb);
-
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
     PyTypeObject* tp = Py_TYPE(obj);
@@ -858,15 +921,71 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject
 
 static PyObject *__Pyx_GetBuiltinName(PyObject *name);
 
+static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name);
+
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
 #else
 #define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
 #endif
 
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
+
+static CYTHON_INLINE int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
+    const char *name, int exact);
+
+static CYTHON_INLINE int  __Pyx_GetBufferAndValidate(Py_buffer* buf, PyObject* obj,
+    __Pyx_TypeInfo* dtype, int flags, int nd, int cast, __Pyx_BufFmt_StackElem* stack);
+static CYTHON_INLINE void __Pyx_SafeReleaseBuffer(Py_buffer* info);
+
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb);
+
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
+
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
+
+static CYTHON_INLINE int __Pyx_IterFinish(void);
+
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
+
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
 
-#if PY_MAJOR_VERSION >= 3
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
 static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
     PyObject *value;
     value = PyDict_GetItemWithError(d, key);
@@ -886,6 +1005,8 @@ static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
     #define __Pyx_PyDict_GetItem(d, key) PyObject_GetItem(d, key)
 #endif
 
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void);
+
 static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
 
 typedef struct {
@@ -930,6 +1051,10 @@ typedef struct {
 static Py_ssize_t __Pyx_zeros[] = {0, 0, 0, 0, 0, 0, 0, 0};
 static Py_ssize_t __Pyx_minusones[] = {-1, -1, -1, -1, -1, -1, -1, -1};
 
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
 #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
     #define __Pyx_CREAL(z) ((z).real())
@@ -1028,9 +1153,7 @@ static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(do
     #endif
 #endif
 
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
-
-static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_enum__NPY_TYPES(enum NPY_TYPES value);
 
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 
@@ -1055,19 +1178,21 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
 /* Module declarations from 'cpython.buffer' */
 
-/* Module declarations from 'cpython.ref' */
-
 /* Module declarations from 'libc.string' */
 
 /* Module declarations from 'libc.stdio' */
 
-/* Module declarations from 'cpython.object' */
-
 /* Module declarations from '__builtin__' */
 
 /* Module declarations from 'cpython.type' */
 static PyTypeObject *__pyx_ptype_7cpython_4type_type = 0;
 
+/* Module declarations from 'cpython' */
+
+/* Module declarations from 'cpython.object' */
+
+/* Module declarations from 'cpython.ref' */
+
 /* Module declarations from 'libc.stdlib' */
 
 /* Module declarations from 'numpy' */
@@ -1083,8 +1208,11 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *, cha
 /* Module declarations from 'cython' */
 
 /* Module declarations from '_strong_wolfe_linesearch' */
-static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double, double, double, double, double, double, double, double, double, int, double, double); /*proto*/
-static PyObject *__pyx_f_24_strong_wolfe_linesearch_save_local_variables(int, int *, double *, int, double, double, double, double, double, double, double, double, double, double, double, double, double); /*proto*/
+static __pyx_ctuple_e327b__double__and_double__and_double__and_double__and_double__and_double__and_double__and_int__etc __pyx_f_24_strong_wolfe_linesearch_dcstep(double, double, double, double, double, double, double, double, double, int, double, double); /*proto*/
+static int __pyx_f_24_strong_wolfe_linesearch_dcsrch_core(double *, double, double, double, double, double, int, double, double, struct __pyx_t_24_strong_wolfe_linesearch_dcsrch_state *); /*proto*/
+static int __pyx_f_24_strong_wolfe_linesearch_task_code(PyObject *); /*proto*/
+static void __pyx_f_24_strong_wolfe_linesearch_load_state(struct __pyx_t_24_strong_wolfe_linesearch_dcsrch_state *, int *, double *); /*proto*/
+static void __pyx_f_24_strong_wolfe_linesearch_save_state(struct __pyx_t_24_strong_wolfe_linesearch_dcsrch_state *, int *, double *); /*proto*/
 static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t = { "int32_t", NULL, sizeof(__pyx_t_5numpy_int32_t), { 0 }, 0, IS_UNSIGNED(__pyx_t_5numpy_int32_t) ? 'U' : 'I', IS_UNSIGNED(__pyx_t_5numpy_int32_t), 0 };
 static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t = { "float64_t", NULL, sizeof(__pyx_t_5numpy_float64_t), { 0 }, 0, 'R', 0, 0 };
 #define __Pyx_MODULE_NAME "_strong_wolfe_linesearch"
@@ -1094,9 +1222,6 @@ int __pyx_module_is_main__strong_wolfe_linesearch = 0;
 static PyObject *__pyx_builtin_ValueError;
 static PyObject *__pyx_builtin_range;
 static PyObject *__pyx_builtin_RuntimeError;
-static PyObject *__pyx_pf_24_strong_wolfe_linesearch_dcsrch(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_stp, double __pyx_v_f, double __pyx_v_g, double __pyx_v_ftol, double __pyx_v_gtol, double __pyx_v_xtol, PyObject *__pyx_v_task, double __pyx_v_stpmin, double __pyx_v_stpmax, PyArrayObject *__pyx_v_isave, PyArrayObject *__pyx_v_dsave); /* proto */
-static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /* proto */
-static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info); /* proto */
 static char __pyx_k_B[] = "B";
 static char __pyx_k_H[] = "H";
 static char __pyx_k_I[] = "I";
@@ -1115,53 +1240,33 @@ static char __pyx_k_FG[] = "FG";
 static char __pyx_k_Zd[] = "Zd";
 static char __pyx_k_Zf[] = "Zf";
 static char __pyx_k_Zg[] = "Zg";
-static char __pyx_k_fm[] = "fm";
-static char __pyx_k_fx[] = "fx";
-static char __pyx_k_fy[] = "fy";
-static char __pyx_k_gm[] = "gm";
-static char __pyx_k_gx[] = "gx";
-static char __pyx_k_gy[] = "gy";
-static char __pyx_k_fxm[] = "fxm";
-static char __pyx_k_fym[] = "fym";
-static char __pyx_k_gxm[] = "gxm";
-static char __pyx_k_gym[] = "gym";
+static char __pyx_k_st[] = "st";
+static char __pyx_k_phi[] = "phi";
 static char __pyx_k_stp[] = "stp";
-static char __pyx_k_stx[] = "stx";
-static char __pyx_k_sty[] = "sty";
-static char __pyx_k_CONV[] = "CONV";
-static char __pyx_k_WARN[] = "WARN";
+static char __pyx_k_code[] = "code";
 static char __pyx_k_ftol[] = "ftol";
 static char __pyx_k_gtol[] = "gtol";
 static char __pyx_k_main[] = "__main__";
+static char __pyx_k_nfev[] = "nfev";
 static char __pyx_k_task[] = "task";
 static char __pyx_k_test[] = "__test__";
 static char __pyx_k_xtol[] = "xtol";
-static char __pyx_k_ERROR[] = "ERROR";
 static char __pyx_k_START[] = "START";
 static char __pyx_k_dsave[] = "dsave";
-static char __pyx_k_finit[] = "finit";
-static char __pyx_k_ftest[] = "ftest";
-static char __pyx_k_ginit[] = "ginit";
-static char __pyx_k_gtest[] = "gtest";
+static char __pyx_k_index[] = "index";
 static char __pyx_k_isave[] = "isave";
 static char __pyx_k_range[] = "range";
-static char __pyx_k_stage[] = "stage";
-static char __pyx_k_stmax[] = "stmax";
-static char __pyx_k_stmin[] = "stmin";
-static char __pyx_k_width[] = "width";
-static char __pyx_k_brackt[] = "brackt";
 static char __pyx_k_dcsrch[] = "dcsrch";
 static char __pyx_k_stpmax[] = "stpmax";
 static char __pyx_k_stpmin[] = "stpmin";
-static char __pyx_k_width1[] = "width1";
-static char __pyx_k_xtrapl[] = "xtrapl";
-static char __pyx_k_xtrapu[] = "xtrapu";
 static char __pyx_k_ValueError[] = "ValueError";
 static char __pyx_k_CONVERGENCE[] = "CONVERGENCE";
 static char __pyx_k_ERROR_FTOL_0[] = "ERROR: FTOL < 0";
 static char __pyx_k_ERROR_GTOL_0[] = "ERROR: GTOL < 0";
 static char __pyx_k_ERROR_XTOL_0[] = "ERROR: XTOL < 0";
 static char __pyx_k_RuntimeError[] = "RuntimeError";
+static char __pyx_k_dcsrch_search[] = "dcsrch_search";
+static char __pyx_k_task_messages[] = "task_messages";
 static char __pyx_k_ERROR_STPMIN_0[] = "ERROR: STPMIN < 0";
 static char __pyx_k_ERROR_STP_STPMAX[] = "ERROR: STP > STPMAX";
 static char __pyx_k_ERROR_STP_STPMIN[] = "ERROR: STP < STPMIN";
@@ -1172,16 +1277,14 @@ static char __pyx_k_ERROR_STPMAX_STPMIN[] = "ERROR: STPMAX < STPMIN";
 static char __pyx_k_strong_wolfe_linesearch[] = "_strong_wolfe_linesearch";
 static char __pyx_k_WARNING_XTOL_TEST_SATISFIED[] = "WARNING: XTOL TEST SATISFIED";
 static char __pyx_k_ndarray_is_not_C_contiguous[] = "ndarray is not C contiguous";
-static char __pyx_k_Users_dpo_virtualenvs_fenics_fr[] = "/Users/dpo/.virtualenvs/fenics-from-scratch/dev/NLP.py/nlp/ls/src/_strong_wolfe_linesearch.pyx";
 static char __pyx_k_WARNING_ROUNDING_ERRORS_PREVENT[] = "WARNING: ROUNDING ERRORS PREVENT PROGRESS";
+static char __pyx_k_root_package_nlp_ls_src__strong[] = "/root/package/nlp/ls/src/_strong_wolfe_linesearch.pyx";
 static char __pyx_k_unknown_dtype_code_in_numpy_pxd[] = "unknown dtype code in numpy.pxd (%d)";
 static char __pyx_k_Format_string_allocated_too_shor[] = "Format string allocated too short, see comment in numpy.pxd";
 static char __pyx_k_Non_native_byte_order_not_suppor[] = "Non-native byte order not supported";
 static char __pyx_k_ndarray_is_not_Fortran_contiguou[] = "ndarray is not Fortran contiguous";
 static char __pyx_k_Format_string_allocated_too_shor_2[] = "Format string allocated too short.";
-static PyObject *__pyx_n_s_CONV;
 static PyObject *__pyx_n_s_CONVERGENCE;
-static PyObject *__pyx_n_s_ERROR;
 static PyObject *__pyx_kp_s_ERROR_FTOL_0;
 static PyObject *__pyx_kp_s_ERROR_GTOL_0;
 static PyObject *__pyx_kp_s_ERROR_INITIAL_G_0;
@@ -1196,56 +1299,42 @@ static PyObject *__pyx_kp_u_Format_string_allocated_too_shor_2;
 static PyObject *__pyx_kp_u_Non_native_byte_order_not_suppor;
 static PyObject *__pyx_n_s_RuntimeError;
 static PyObject *__pyx_n_s_START;
-static PyObject *__pyx_kp_s_Users_dpo_virtualenvs_fenics_fr;
 static PyObject *__pyx_n_s_ValueError;
-static PyObject *__pyx_n_s_WARN;
 static PyObject *__pyx_kp_s_WARNING_ROUNDING_ERRORS_PREVENT;
 static PyObject *__pyx_kp_s_WARNING_STP_STPMAX;
 static PyObject *__pyx_kp_s_WARNING_STP_STPMIN;
 static PyObject *__pyx_kp_s_WARNING_XTOL_TEST_SATISFIED;
-static PyObject *__pyx_n_s_brackt;
+static PyObject *__pyx_n_s_code;
 static PyObject *__pyx_n_s_dcsrch;
+static PyObject *__pyx_n_s_dcsrch_search;
 static PyObject *__pyx_n_s_dsave;
 static PyObject *__pyx_n_s_f;
-static PyObject *__pyx_n_s_finit;
-static PyObject *__pyx_n_s_fm;
-static PyObject *__pyx_n_s_ftest;
 static PyObject *__pyx_n_s_ftol;
-static PyObject *__pyx_n_s_fx;
-static PyObject *__pyx_n_s_fxm;
-static PyObject *__pyx_n_s_fy;
-static PyObject *__pyx_n_s_fym;
 static PyObject *__pyx_n_s_g;
-static PyObject *__pyx_n_s_ginit;
-static PyObject *__pyx_n_s_gm;
-static PyObject *__pyx_n_s_gtest;
 static PyObject *__pyx_n_s_gtol;
-static PyObject *__pyx_n_s_gx;
-static PyObject *__pyx_n_s_gxm;
-static PyObject *__pyx_n_s_gy;
-static PyObject *__pyx_n_s_gym;
+static PyObject *__pyx_n_s_index;
 static PyObject *__pyx_n_s_isave;
 static PyObject *__pyx_n_s_main;
 static PyObject *__pyx_kp_u_ndarray_is_not_C_contiguous;
 static PyObject *__pyx_kp_u_ndarray_is_not_Fortran_contiguou;
+static PyObject *__pyx_n_s_nfev;
+static PyObject *__pyx_n_s_phi;
 static PyObject *__pyx_n_s_range;
-static PyObject *__pyx_n_s_stage;
-static PyObject *__pyx_n_s_stmax;
-static PyObject *__pyx_n_s_stmin;
+static PyObject *__pyx_kp_s_root_package_nlp_ls_src__strong;
+static PyObject *__pyx_n_s_st;
 static PyObject *__pyx_n_s_stp;
 static PyObject *__pyx_n_s_stpmax;
 static PyObject *__pyx_n_s_stpmin;
 static PyObject *__pyx_n_s_strong_wolfe_linesearch;
-static PyObject *__pyx_n_s_stx;
-static PyObject *__pyx_n_s_sty;
 static PyObject *__pyx_n_s_task;
+static PyObject *__pyx_n_s_task_messages;
 static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_kp_u_unknown_dtype_code_in_numpy_pxd;
-static PyObject *__pyx_n_s_width;
-static PyObject *__pyx_n_s_width1;
 static PyObject *__pyx_n_s_xtol;
-static PyObject *__pyx_n_s_xtrapl;
-static PyObject *__pyx_n_s_xtrapu;
+static PyObject *__pyx_pf_24_strong_wolfe_linesearch_dcsrch(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_stp, double __pyx_v_f, double __pyx_v_g, double __pyx_v_ftol, double __pyx_v_gtol, double __pyx_v_xtol, PyObject *__pyx_v_task, double __pyx_v_stpmin, double __pyx_v_stpmax, PyArrayObject *__pyx_v_isave, PyArrayObject *__pyx_v_dsave); /* proto */
+static PyObject *__pyx_pf_24_strong_wolfe_linesearch_2dcsrch_search(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_phi, double __pyx_v_stp, double __pyx_v_f, double __pyx_v_g, double __pyx_v_ftol, double __pyx_v_gtol, double __pyx_v_xtol, PyObject *__pyx_v_task, double __pyx_v_stpmin, double __pyx_v_stpmax, PyArrayObject *__pyx_v_isave, PyArrayObject *__pyx_v_dsave); /* proto */
+static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /* proto */
+static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info); /* proto */
 static PyObject *__pyx_tuple_;
 static PyObject *__pyx_tuple__2;
 static PyObject *__pyx_tuple__3;
@@ -1253,17 +1342,20 @@ static PyObject *__pyx_tuple__4;
 static PyObject *__pyx_tuple__5;
 static PyObject *__pyx_tuple__6;
 static PyObject *__pyx_tuple__7;
-static PyObject *__pyx_codeobj__8;
+static PyObject *__pyx_tuple__8;
+static PyObject *__pyx_tuple__10;
+static PyObject *__pyx_codeobj__9;
+static PyObject *__pyx_codeobj__11;
 
-/* "_strong_wolfe_linesearch.pyx":9
+/* "_strong_wolfe_linesearch.pyx":52
  * 
  * @cython.cdivision(True)
- * cdef tuple dcstep(double stx, double fx, double dx, double sty, double fy, double dy,             # <<<<<<<<<<<<<<
- *                   double stp, double fp, double dp, bint brackt, double stpmin,
- *                   double stpmax):
+ * cdef (double, double, double, double, double, double, double, bint) \             # <<<<<<<<<<<<<<
+ *         dcstep(double stx, double fx, double dx, double sty, double fy,
+ *                double dy, double stp, double fp, double dp, bint brackt,
  */
 
-static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, double __pyx_v_fx, double __pyx_v_dx, double __pyx_v_sty, double __pyx_v_fy, double __pyx_v_dy, double __pyx_v_stp, double __pyx_v_fp, double __pyx_v_dp, int __pyx_v_brackt, double __pyx_v_stpmin, double __pyx_v_stpmax) {
+static __pyx_ctuple_e327b__double__and_double__and_double__and_double__and_double__and_double__and_double__and_int__etc __pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, double __pyx_v_fx, double __pyx_v_dx, double __pyx_v_sty, double __pyx_v_fy, double __pyx_v_dy, double __pyx_v_stp, double __pyx_v_fp, double __pyx_v_dp, int __pyx_v_brackt, double __pyx_v_stpmin, double __pyx_v_stpmax) {
   double __pyx_v_gamma;
   double __pyx_v_p;
   double __pyx_v_q;
@@ -1274,8 +1366,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
   double __pyx_v_stpf;
   double __pyx_v_stpq;
   double __pyx_v_theta;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
+  __pyx_ctuple_e327b__double__and_double__and_double__and_double__and_double__and_double__and_double__and_int__etc __pyx_r;
   int __pyx_t_1;
   double __pyx_t_2;
   double __pyx_t_3;
@@ -1283,52 +1374,40 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
   double __pyx_t_5;
   long __pyx_t_6;
   int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
-  PyObject *__pyx_t_10 = NULL;
-  PyObject *__pyx_t_11 = NULL;
-  PyObject *__pyx_t_12 = NULL;
-  PyObject *__pyx_t_13 = NULL;
-  PyObject *__pyx_t_14 = NULL;
-  PyObject *__pyx_t_15 = NULL;
-  PyObject *__pyx_t_16 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("dcstep", 0);
+  __pyx_ctuple_e327b__double__and_double__and_double__and_double__and_double__and_double__and_double__and_int__etc __pyx_t_8;
 
-  /* "_strong_wolfe_linesearch.pyx":90
+  /* "_strong_wolfe_linesearch.pyx":134
  *         double gamma, p, q, r, s, sgnd, stpc, stpf, stpq, theta
  * 
- *     sgnd = dp*(dx/abs(dx))             # <<<<<<<<<<<<<<
+ *     sgnd = dp*(dx/fabs(dx))             # <<<<<<<<<<<<<<
  * 
  *     # First case: A higher function value. The minimum is bracketed.
  */
   __pyx_v_sgnd = (__pyx_v_dp * (__pyx_v_dx / fabs(__pyx_v_dx)));
 
-  /* "_strong_wolfe_linesearch.pyx":96
+  /* "_strong_wolfe_linesearch.pyx":140
  *     # cubic step is taken, otherwise the average of the cubic and
  *     # quadratic steps is taken.
  *     if fp > fx:             # <<<<<<<<<<<<<<
  *         theta = 3*(fx-fp)/(stp-stx) + dx + dp
- *         s = max(abs(theta),abs(dx),abs(dp))
+ *         s = max(fabs(theta),fabs(dx),fabs(dp))
  */
   __pyx_t_1 = ((__pyx_v_fp > __pyx_v_fx) != 0);
   if (__pyx_t_1) {
 
-    /* "_strong_wolfe_linesearch.pyx":97
+    /* "_strong_wolfe_linesearch.pyx":141
  *     # quadratic steps is taken.
  *     if fp > fx:
  *         theta = 3*(fx-fp)/(stp-stx) + dx + dp             # <<<<<<<<<<<<<<
- *         s = max(abs(theta),abs(dx),abs(dp))
+ *         s = max(fabs(theta),fabs(dx),fabs(dp))
  *         gamma = s*sqrt((theta/s)**2-(dx/s)*(dp/s))
  */
     __pyx_v_theta = ((((3.0 * (__pyx_v_fx - __pyx_v_fp)) / (__pyx_v_stp - __pyx_v_stx)) + __pyx_v_dx) + __pyx_v_dp);
 
-    /* "_strong_wolfe_linesearch.pyx":98
+    /* "_strong_wolfe_linesearch.pyx":142
  *     if fp > fx:
  *         theta = 3*(fx-fp)/(stp-stx) + dx + dp
- *         s = max(abs(theta),abs(dx),abs(dp))             # <<<<<<<<<<<<<<
+ *         s = max(fabs(theta),fabs(dx),fabs(dp))             # <<<<<<<<<<<<<<
  *         gamma = s*sqrt((theta/s)**2-(dx/s)*(dp/s))
  *         if stp < stx:
  */
@@ -1348,17 +1427,17 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
     }
     __pyx_v_s = __pyx_t_5;
 
-    /* "_strong_wolfe_linesearch.pyx":99
+    /* "_strong_wolfe_linesearch.pyx":143
  *         theta = 3*(fx-fp)/(stp-stx) + dx + dp
- *         s = max(abs(theta),abs(dx),abs(dp))
+ *         s = max(fabs(theta),fabs(dx),fabs(dp))
  *         gamma = s*sqrt((theta/s)**2-(dx/s)*(dp/s))             # <<<<<<<<<<<<<<
  *         if stp < stx:
  *             gamma = -gamma
  */
     __pyx_v_gamma = (__pyx_v_s * sqrt((pow((__pyx_v_theta / __pyx_v_s), 2.0) - ((__pyx_v_dx / __pyx_v_s) * (__pyx_v_dp / __pyx_v_s)))));
 
-    /* "_strong_wolfe_linesearch.pyx":100
- *         s = max(abs(theta),abs(dx),abs(dp))
+    /* "_strong_wolfe_linesearch.pyx":144
+ *         s = max(fabs(theta),fabs(dx),fabs(dp))
  *         gamma = s*sqrt((theta/s)**2-(dx/s)*(dp/s))
  *         if stp < stx:             # <<<<<<<<<<<<<<
  *             gamma = -gamma
@@ -1367,7 +1446,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
     __pyx_t_1 = ((__pyx_v_stp < __pyx_v_stx) != 0);
     if (__pyx_t_1) {
 
-      /* "_strong_wolfe_linesearch.pyx":101
+      /* "_strong_wolfe_linesearch.pyx":145
  *         gamma = s*sqrt((theta/s)**2-(dx/s)*(dp/s))
  *         if stp < stx:
  *             gamma = -gamma             # <<<<<<<<<<<<<<
@@ -1375,11 +1454,17 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  *         q = ((gamma-dx)+gamma) + dp
  */
       __pyx_v_gamma = (-__pyx_v_gamma);
-      goto __pyx_L4;
+
+      /* "_strong_wolfe_linesearch.pyx":144
+ *         s = max(fabs(theta),fabs(dx),fabs(dp))
+ *         gamma = s*sqrt((theta/s)**2-(dx/s)*(dp/s))
+ *         if stp < stx:             # <<<<<<<<<<<<<<
+ *             gamma = -gamma
+ *         p = (gamma-dx) + theta
+ */
     }
-    __pyx_L4:;
 
-    /* "_strong_wolfe_linesearch.pyx":102
+    /* "_strong_wolfe_linesearch.pyx":146
  *         if stp < stx:
  *             gamma = -gamma
  *         p = (gamma-dx) + theta             # <<<<<<<<<<<<<<
@@ -1388,7 +1473,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
     __pyx_v_p = ((__pyx_v_gamma - __pyx_v_dx) + __pyx_v_theta);
 
-    /* "_strong_wolfe_linesearch.pyx":103
+    /* "_strong_wolfe_linesearch.pyx":147
  *             gamma = -gamma
  *         p = (gamma-dx) + theta
  *         q = ((gamma-dx)+gamma) + dp             # <<<<<<<<<<<<<<
@@ -1397,7 +1482,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
     __pyx_v_q = (((__pyx_v_gamma - __pyx_v_dx) + __pyx_v_gamma) + __pyx_v_dp);
 
-    /* "_strong_wolfe_linesearch.pyx":104
+    /* "_strong_wolfe_linesearch.pyx":148
  *         p = (gamma-dx) + theta
  *         q = ((gamma-dx)+gamma) + dp
  *         r = p/q             # <<<<<<<<<<<<<<
@@ -1406,58 +1491,66 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
     __pyx_v_r = (__pyx_v_p / __pyx_v_q);
 
-    /* "_strong_wolfe_linesearch.pyx":105
+    /* "_strong_wolfe_linesearch.pyx":149
  *         q = ((gamma-dx)+gamma) + dp
  *         r = p/q
  *         stpc = stx + r*(stp-stx)             # <<<<<<<<<<<<<<
  *         stpq = stx + ((dx/((fx-fp)/(stp-stx)+dx))/2)*(stp-stx)
- *         if abs(stpc-stx) < abs(stpq-stx):
+ *         if fabs(stpc-stx) < fabs(stpq-stx):
  */
     __pyx_v_stpc = (__pyx_v_stx + (__pyx_v_r * (__pyx_v_stp - __pyx_v_stx)));
 
-    /* "_strong_wolfe_linesearch.pyx":106
+    /* "_strong_wolfe_linesearch.pyx":150
  *         r = p/q
  *         stpc = stx + r*(stp-stx)
  *         stpq = stx + ((dx/((fx-fp)/(stp-stx)+dx))/2)*(stp-stx)             # <<<<<<<<<<<<<<
- *         if abs(stpc-stx) < abs(stpq-stx):
+ *         if fabs(stpc-stx) < fabs(stpq-stx):
  *             stpf = stpc
  */
     __pyx_v_stpq = (__pyx_v_stx + (((__pyx_v_dx / (((__pyx_v_fx - __pyx_v_fp) / (__pyx_v_stp - __pyx_v_stx)) + __pyx_v_dx)) / 2.0) * (__pyx_v_stp - __pyx_v_stx)));
 
-    /* "_strong_wolfe_linesearch.pyx":107
+    /* "_strong_wolfe_linesearch.pyx":151
  *         stpc = stx + r*(stp-stx)
  *         stpq = stx + ((dx/((fx-fp)/(stp-stx)+dx))/2)*(stp-stx)
- *         if abs(stpc-stx) < abs(stpq-stx):             # <<<<<<<<<<<<<<
+ *         if fabs(stpc-stx) < fabs(stpq-stx):             # <<<<<<<<<<<<<<
  *             stpf = stpc
  *         else:
  */
     __pyx_t_1 = ((fabs((__pyx_v_stpc - __pyx_v_stx)) < fabs((__pyx_v_stpq - __pyx_v_stx))) != 0);
     if (__pyx_t_1) {
 
-      /* "_strong_wolfe_linesearch.pyx":108
+      /* "_strong_wolfe_linesearch.pyx":152
  *         stpq = stx + ((dx/((fx-fp)/(stp-stx)+dx))/2)*(stp-stx)
- *         if abs(stpc-stx) < abs(stpq-stx):
+ *         if fabs(stpc-stx) < fabs(stpq-stx):
  *             stpf = stpc             # <<<<<<<<<<<<<<
  *         else:
  *             stpf = stpc + (stpq-stpc)/2
  */
       __pyx_v_stpf = __pyx_v_stpc;
+
+      /* "_strong_wolfe_linesearch.pyx":151
+ *         stpc = stx + r*(stp-stx)
+ *         stpq = stx + ((dx/((fx-fp)/(stp-stx)+dx))/2)*(stp-stx)
+ *         if fabs(stpc-stx) < fabs(stpq-stx):             # <<<<<<<<<<<<<<
+ *             stpf = stpc
+ *         else:
+ */
       goto __pyx_L5;
     }
-    /*else*/ {
 
-      /* "_strong_wolfe_linesearch.pyx":110
+    /* "_strong_wolfe_linesearch.pyx":154
  *             stpf = stpc
  *         else:
  *             stpf = stpc + (stpq-stpc)/2             # <<<<<<<<<<<<<<
  *         brackt = True
  * 
  */
+    /*else*/ {
       __pyx_v_stpf = (__pyx_v_stpc + ((__pyx_v_stpq - __pyx_v_stpc) / 2.0));
     }
     __pyx_L5:;
 
-    /* "_strong_wolfe_linesearch.pyx":111
+    /* "_strong_wolfe_linesearch.pyx":155
  *         else:
  *             stpf = stpc + (stpq-stpc)/2
  *         brackt = True             # <<<<<<<<<<<<<<
@@ -1465,32 +1558,40 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  *     # Second case: A lower function value and derivatives of opposite
  */
     __pyx_v_brackt = 1;
+
+    /* "_strong_wolfe_linesearch.pyx":140
+ *     # cubic step is taken, otherwise the average of the cubic and
+ *     # quadratic steps is taken.
+ *     if fp > fx:             # <<<<<<<<<<<<<<
+ *         theta = 3*(fx-fp)/(stp-stx) + dx + dp
+ *         s = max(fabs(theta),fabs(dx),fabs(dp))
+ */
     goto __pyx_L3;
   }
 
-  /* "_strong_wolfe_linesearch.pyx":117
+  /* "_strong_wolfe_linesearch.pyx":161
  *     # stp than the secant step, the cubic step is taken, otherwise the
  *     # secant step is taken.
  *     elif sgnd < 0:             # <<<<<<<<<<<<<<
  *         theta = 3*(fx-fp)/(stp-stx) + dx + dp
- *         s = max(abs(theta),abs(dx),abs(dp))
+ *         s = max(fabs(theta),fabs(dx),fabs(dp))
  */
   __pyx_t_1 = ((__pyx_v_sgnd < 0.0) != 0);
   if (__pyx_t_1) {
 
-    /* "_strong_wolfe_linesearch.pyx":118
+    /* "_strong_wolfe_linesearch.pyx":162
  *     # secant step is taken.
  *     elif sgnd < 0:
  *         theta = 3*(fx-fp)/(stp-stx) + dx + dp             # <<<<<<<<<<<<<<
- *         s = max(abs(theta),abs(dx),abs(dp))
+ *         s = max(fabs(theta),fabs(dx),fabs(dp))
  *         gamma = s*sqrt((theta/s)**2-(dx/s)*(dp/s))
  */
     __pyx_v_theta = ((((3.0 * (__pyx_v_fx - __pyx_v_fp)) / (__pyx_v_stp - __pyx_v_stx)) + __pyx_v_dx) + __pyx_v_dp);
 
-    /* "_strong_wolfe_linesearch.pyx":119
+    /* "_strong_wolfe_linesearch.pyx":163
  *     elif sgnd < 0:
  *         theta = 3*(fx-fp)/(stp-stx) + dx + dp
- *         s = max(abs(theta),abs(dx),abs(dp))             # <<<<<<<<<<<<<<
+ *         s = max(fabs(theta),fabs(dx),fabs(dp))             # <<<<<<<<<<<<<<
  *         gamma = s*sqrt((theta/s)**2-(dx/s)*(dp/s))
  *         if stp > stx:
  */
@@ -1510,17 +1611,17 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
     }
     __pyx_v_s = __pyx_t_4;
 
-    /* "_strong_wolfe_linesearch.pyx":120
+    /* "_strong_wolfe_linesearch.pyx":164
  *         theta = 3*(fx-fp)/(stp-stx) + dx + dp
- *         s = max(abs(theta),abs(dx),abs(dp))
+ *         s = max(fabs(theta),fabs(dx),fabs(dp))
  *         gamma = s*sqrt((theta/s)**2-(dx/s)*(dp/s))             # <<<<<<<<<<<<<<
  *         if stp > stx:
  *             gamma = -gamma
  */
     __pyx_v_gamma = (__pyx_v_s * sqrt((pow((__pyx_v_theta / __pyx_v_s), 2.0) - ((__pyx_v_dx / __pyx_v_s) * (__pyx_v_dp / __pyx_v_s)))));
 
-    /* "_strong_wolfe_linesearch.pyx":121
- *         s = max(abs(theta),abs(dx),abs(dp))
+    /* "_strong_wolfe_linesearch.pyx":165
+ *         s = max(fabs(theta),fabs(dx),fabs(dp))
  *         gamma = s*sqrt((theta/s)**2-(dx/s)*(dp/s))
  *         if stp > stx:             # <<<<<<<<<<<<<<
  *             gamma = -gamma
@@ -1529,7 +1630,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
     __pyx_t_1 = ((__pyx_v_stp > __pyx_v_stx) != 0);
     if (__pyx_t_1) {
 
-      /* "_strong_wolfe_linesearch.pyx":122
+      /* "_strong_wolfe_linesearch.pyx":166
  *         gamma = s*sqrt((theta/s)**2-(dx/s)*(dp/s))
  *         if stp > stx:
  *             gamma = -gamma             # <<<<<<<<<<<<<<
@@ -1537,11 +1638,17 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  *         q = ((gamma-dp)+gamma) + dx
  */
       __pyx_v_gamma = (-__pyx_v_gamma);
-      goto __pyx_L6;
+
+      /* "_strong_wolfe_linesearch.pyx":165
+ *         s = max(fabs(theta),fabs(dx),fabs(dp))
+ *         gamma = s*sqrt((theta/s)**2-(dx/s)*(dp/s))
+ *         if stp > stx:             # <<<<<<<<<<<<<<
+ *             gamma = -gamma
+ *         p = (gamma-dp) + theta
+ */
     }
-    __pyx_L6:;
 
-    /* "_strong_wolfe_linesearch.pyx":123
+    /* "_strong_wolfe_linesearch.pyx":167
  *         if stp > stx:
  *             gamma = -gamma
  *         p = (gamma-dp) + theta             # <<<<<<<<<<<<<<
@@ -1550,7 +1657,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
     __pyx_v_p = ((__pyx_v_gamma - __pyx_v_dp) + __pyx_v_theta);
 
-    /* "_strong_wolfe_linesearch.pyx":124
+    /* "_strong_wolfe_linesearch.pyx":168
  *             gamma = -gamma
  *         p = (gamma-dp) + theta
  *         q = ((gamma-dp)+gamma) + dx             # <<<<<<<<<<<<<<
@@ -1559,7 +1666,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
     __pyx_v_q = (((__pyx_v_gamma - __pyx_v_dp) + __pyx_v_gamma) + __pyx_v_dx);
 
-    /* "_strong_wolfe_linesearch.pyx":125
+    /* "_strong_wolfe_linesearch.pyx":169
  *         p = (gamma-dp) + theta
  *         q = ((gamma-dp)+gamma) + dx
  *         r = p/q             # <<<<<<<<<<<<<<
@@ -1568,58 +1675,66 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
     __pyx_v_r = (__pyx_v_p / __pyx_v_q);
 
-    /* "_strong_wolfe_linesearch.pyx":126
+    /* "_strong_wolfe_linesearch.pyx":170
  *         q = ((gamma-dp)+gamma) + dx
  *         r = p/q
  *         stpc = stp + r*(stx-stp)             # <<<<<<<<<<<<<<
  *         stpq = stp + (dp/(dp-dx))*(stx-stp)
- *         if abs(stpc-stp) > abs(stpq-stp):
+ *         if fabs(stpc-stp) > fabs(stpq-stp):
  */
     __pyx_v_stpc = (__pyx_v_stp + (__pyx_v_r * (__pyx_v_stx - __pyx_v_stp)));
 
-    /* "_strong_wolfe_linesearch.pyx":127
+    /* "_strong_wolfe_linesearch.pyx":171
  *         r = p/q
  *         stpc = stp + r*(stx-stp)
  *         stpq = stp + (dp/(dp-dx))*(stx-stp)             # <<<<<<<<<<<<<<
- *         if abs(stpc-stp) > abs(stpq-stp):
+ *         if fabs(stpc-stp) > fabs(stpq-stp):
  *             stpf = stpc
  */
     __pyx_v_stpq = (__pyx_v_stp + ((__pyx_v_dp / (__pyx_v_dp - __pyx_v_dx)) * (__pyx_v_stx - __pyx_v_stp)));
 
-    /* "_strong_wolfe_linesearch.pyx":128
+    /* "_strong_wolfe_linesearch.pyx":172
  *         stpc = stp + r*(stx-stp)
  *         stpq = stp + (dp/(dp-dx))*(stx-stp)
- *         if abs(stpc-stp) > abs(stpq-stp):             # <<<<<<<<<<<<<<
+ *         if fabs(stpc-stp) > fabs(stpq-stp):             # <<<<<<<<<<<<<<
  *             stpf = stpc
  *         else:
  */
     __pyx_t_1 = ((fabs((__pyx_v_stpc - __pyx_v_stp)) > fabs((__pyx_v_stpq - __pyx_v_stp))) != 0);
     if (__pyx_t_1) {
 
-      /* "_strong_wolfe_linesearch.pyx":129
+      /* "_strong_wolfe_linesearch.pyx":173
  *         stpq = stp + (dp/(dp-dx))*(stx-stp)
- *         if abs(stpc-stp) > abs(stpq-stp):
+ *         if fabs(stpc-stp) > fabs(stpq-stp):
  *             stpf = stpc             # <<<<<<<<<<<<<<
  *         else:
  *             stpf = stpq
  */
       __pyx_v_stpf = __pyx_v_stpc;
+
+      /* "_strong_wolfe_linesearch.pyx":172
+ *         stpc = stp + r*(stx-stp)
+ *         stpq = stp + (dp/(dp-dx))*(stx-stp)
+ *         if fabs(stpc-stp) > fabs(stpq-stp):             # <<<<<<<<<<<<<<
+ *             stpf = stpc
+ *         else:
+ */
       goto __pyx_L7;
     }
-    /*else*/ {
 
-      /* "_strong_wolfe_linesearch.pyx":131
+    /* "_strong_wolfe_linesearch.pyx":175
  *             stpf = stpc
  *         else:
  *             stpf = stpq             # <<<<<<<<<<<<<<
  *         brackt = True
  * 
  */
+    /*else*/ {
       __pyx_v_stpf = __pyx_v_stpq;
     }
     __pyx_L7:;
 
-    /* "_strong_wolfe_linesearch.pyx":132
+    /* "_strong_wolfe_linesearch.pyx":176
  *         else:
  *             stpf = stpq
  *         brackt = True             # <<<<<<<<<<<<<<
@@ -1627,32 +1742,40 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  *     # Third case: A lower function value, derivatives of the same sign,
  */
     __pyx_v_brackt = 1;
+
+    /* "_strong_wolfe_linesearch.pyx":161
+ *     # stp than the secant step, the cubic step is taken, otherwise the
+ *     # secant step is taken.
+ *     elif sgnd < 0:             # <<<<<<<<<<<<<<
+ *         theta = 3*(fx-fp)/(stp-stx) + dx + dp
+ *         s = max(fabs(theta),fabs(dx),fabs(dp))
+ */
     goto __pyx_L3;
   }
 
-  /* "_strong_wolfe_linesearch.pyx":136
+  /* "_strong_wolfe_linesearch.pyx":180
  *     # Third case: A lower function value, derivatives of the same sign,
  *     # and the magnitude of the derivative decreases.
- *     elif abs(dp) < abs(dx):             # <<<<<<<<<<<<<<
+ *     elif fabs(dp) < fabs(dx):             # <<<<<<<<<<<<<<
  * 
  *         # The cubic step is computed only if the cubic tends to infinity
  */
   __pyx_t_1 = ((fabs(__pyx_v_dp) < fabs(__pyx_v_dx)) != 0);
   if (__pyx_t_1) {
 
-    /* "_strong_wolfe_linesearch.pyx":142
+    /* "_strong_wolfe_linesearch.pyx":186
  *         # is beyond stp. Otherwise the cubic step is defined to be the
  *         # secant step.
  *         theta = 3*(fx-fp)/(stp-stx) + dx + dp             # <<<<<<<<<<<<<<
- *         s = max(abs(theta),abs(dx),abs(dp))
+ *         s = max(fabs(theta),fabs(dx),fabs(dp))
  * 
  */
     __pyx_v_theta = ((((3.0 * (__pyx_v_fx - __pyx_v_fp)) / (__pyx_v_stp - __pyx_v_stx)) + __pyx_v_dx) + __pyx_v_dp);
 
-    /* "_strong_wolfe_linesearch.pyx":143
+    /* "_strong_wolfe_linesearch.pyx":187
  *         # secant step.
  *         theta = 3*(fx-fp)/(stp-stx) + dx + dp
- *         s = max(abs(theta),abs(dx),abs(dp))             # <<<<<<<<<<<<<<
+ *         s = max(fabs(theta),fabs(dx),fabs(dp))             # <<<<<<<<<<<<<<
  * 
  *         # The case gamma = 0 only arises if the cubic does not tend
  */
@@ -1672,7 +1795,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
     }
     __pyx_v_s = __pyx_t_3;
 
-    /* "_strong_wolfe_linesearch.pyx":147
+    /* "_strong_wolfe_linesearch.pyx":191
  *         # The case gamma = 0 only arises if the cubic does not tend
  *         # to infinity in the direction of the step.
  *         gamma = s*sqrt(max(0,(theta/s)**2-(dx/s)*(dp/s)))             # <<<<<<<<<<<<<<
@@ -1688,7 +1811,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
     }
     __pyx_v_gamma = (__pyx_v_s * sqrt(__pyx_t_4));
 
-    /* "_strong_wolfe_linesearch.pyx":148
+    /* "_strong_wolfe_linesearch.pyx":192
  *         # to infinity in the direction of the step.
  *         gamma = s*sqrt(max(0,(theta/s)**2-(dx/s)*(dp/s)))
  *         if stp > stx:             # <<<<<<<<<<<<<<
@@ -1698,7 +1821,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
     __pyx_t_1 = ((__pyx_v_stp > __pyx_v_stx) != 0);
     if (__pyx_t_1) {
 
-      /* "_strong_wolfe_linesearch.pyx":149
+      /* "_strong_wolfe_linesearch.pyx":193
  *         gamma = s*sqrt(max(0,(theta/s)**2-(dx/s)*(dp/s)))
  *         if stp > stx:
  *             gamma = -gamma             # <<<<<<<<<<<<<<
@@ -1706,11 +1829,17 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  *         q = (gamma+(dx-dp)) + gamma
  */
       __pyx_v_gamma = (-__pyx_v_gamma);
-      goto __pyx_L8;
+
+      /* "_strong_wolfe_linesearch.pyx":192
+ *         # to infinity in the direction of the step.
+ *         gamma = s*sqrt(max(0,(theta/s)**2-(dx/s)*(dp/s)))
+ *         if stp > stx:             # <<<<<<<<<<<<<<
+ *             gamma = -gamma
+ *         p = (gamma-dp) + theta
+ */
     }
-    __pyx_L8:;
 
-    /* "_strong_wolfe_linesearch.pyx":150
+    /* "_strong_wolfe_linesearch.pyx":194
  *         if stp > stx:
  *             gamma = -gamma
  *         p = (gamma-dp) + theta             # <<<<<<<<<<<<<<
@@ -1719,7 +1848,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
     __pyx_v_p = ((__pyx_v_gamma - __pyx_v_dp) + __pyx_v_theta);
 
-    /* "_strong_wolfe_linesearch.pyx":151
+    /* "_strong_wolfe_linesearch.pyx":195
  *             gamma = -gamma
  *         p = (gamma-dp) + theta
  *         q = (gamma+(dx-dp)) + gamma             # <<<<<<<<<<<<<<
@@ -1728,7 +1857,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
     __pyx_v_q = ((__pyx_v_gamma + (__pyx_v_dx - __pyx_v_dp)) + __pyx_v_gamma);
 
-    /* "_strong_wolfe_linesearch.pyx":152
+    /* "_strong_wolfe_linesearch.pyx":196
  *         p = (gamma-dp) + theta
  *         q = (gamma+(dx-dp)) + gamma
  *         r = p/q             # <<<<<<<<<<<<<<
@@ -1737,7 +1866,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
     __pyx_v_r = (__pyx_v_p / __pyx_v_q);
 
-    /* "_strong_wolfe_linesearch.pyx":153
+    /* "_strong_wolfe_linesearch.pyx":197
  *         q = (gamma+(dx-dp)) + gamma
  *         r = p/q
  *         if r < 0 and gamma != 0:             # <<<<<<<<<<<<<<
@@ -1755,7 +1884,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
     __pyx_L10_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "_strong_wolfe_linesearch.pyx":154
+      /* "_strong_wolfe_linesearch.pyx":198
  *         r = p/q
  *         if r < 0 and gamma != 0:
  *             stpc = stp + r*(stx-stp)             # <<<<<<<<<<<<<<
@@ -1763,10 +1892,18 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  *             stpc = stpmax
  */
       __pyx_v_stpc = (__pyx_v_stp + (__pyx_v_r * (__pyx_v_stx - __pyx_v_stp)));
+
+      /* "_strong_wolfe_linesearch.pyx":197
+ *         q = (gamma+(dx-dp)) + gamma
+ *         r = p/q
+ *         if r < 0 and gamma != 0:             # <<<<<<<<<<<<<<
+ *             stpc = stp + r*(stx-stp)
+ *         elif stp > stx:
+ */
       goto __pyx_L9;
     }
 
-    /* "_strong_wolfe_linesearch.pyx":155
+    /* "_strong_wolfe_linesearch.pyx":199
  *         if r < 0 and gamma != 0:
  *             stpc = stp + r*(stx-stp)
  *         elif stp > stx:             # <<<<<<<<<<<<<<
@@ -1776,7 +1913,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
     __pyx_t_1 = ((__pyx_v_stp > __pyx_v_stx) != 0);
     if (__pyx_t_1) {
 
-      /* "_strong_wolfe_linesearch.pyx":156
+      /* "_strong_wolfe_linesearch.pyx":200
  *             stpc = stp + r*(stx-stp)
  *         elif stp > stx:
  *             stpc = stpmax             # <<<<<<<<<<<<<<
@@ -1784,22 +1921,30 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  *             stpc = stpmin
  */
       __pyx_v_stpc = __pyx_v_stpmax;
+
+      /* "_strong_wolfe_linesearch.pyx":199
+ *         if r < 0 and gamma != 0:
+ *             stpc = stp + r*(stx-stp)
+ *         elif stp > stx:             # <<<<<<<<<<<<<<
+ *             stpc = stpmax
+ *         else:
+ */
       goto __pyx_L9;
     }
-    /*else*/ {
 
-      /* "_strong_wolfe_linesearch.pyx":158
+    /* "_strong_wolfe_linesearch.pyx":202
  *             stpc = stpmax
  *         else:
  *             stpc = stpmin             # <<<<<<<<<<<<<<
  * 
  *         stpq = stp + (dp/(dp-dx))*(stx-stp)
  */
+    /*else*/ {
       __pyx_v_stpc = __pyx_v_stpmin;
     }
     __pyx_L9:;
 
-    /* "_strong_wolfe_linesearch.pyx":160
+    /* "_strong_wolfe_linesearch.pyx":204
  *             stpc = stpmin
  * 
  *         stpq = stp + (dp/(dp-dx))*(stx-stp)             # <<<<<<<<<<<<<<
@@ -1808,7 +1953,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
     __pyx_v_stpq = (__pyx_v_stp + ((__pyx_v_dp / (__pyx_v_dp - __pyx_v_dx)) * (__pyx_v_stx - __pyx_v_stp)));
 
-    /* "_strong_wolfe_linesearch.pyx":162
+    /* "_strong_wolfe_linesearch.pyx":206
  *         stpq = stp + (dp/(dp-dx))*(stx-stp)
  * 
  *         if brackt:             # <<<<<<<<<<<<<<
@@ -1818,40 +1963,48 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
     __pyx_t_1 = (__pyx_v_brackt != 0);
     if (__pyx_t_1) {
 
-      /* "_strong_wolfe_linesearch.pyx":166
+      /* "_strong_wolfe_linesearch.pyx":210
  *             # closer to stp than the secant step, the cubic step is
  *             # taken, otherwise the secant step is taken.
- *             if abs(stpc-stp) < abs(stpq-stp):             # <<<<<<<<<<<<<<
+ *             if fabs(stpc-stp) < fabs(stpq-stp):             # <<<<<<<<<<<<<<
  *                 stpf = stpc
  *             else:
  */
       __pyx_t_1 = ((fabs((__pyx_v_stpc - __pyx_v_stp)) < fabs((__pyx_v_stpq - __pyx_v_stp))) != 0);
       if (__pyx_t_1) {
 
-        /* "_strong_wolfe_linesearch.pyx":167
+        /* "_strong_wolfe_linesearch.pyx":211
  *             # taken, otherwise the secant step is taken.
- *             if abs(stpc-stp) < abs(stpq-stp):
+ *             if fabs(stpc-stp) < fabs(stpq-stp):
  *                 stpf = stpc             # <<<<<<<<<<<<<<
  *             else:
  *                 stpf = stpq
  */
         __pyx_v_stpf = __pyx_v_stpc;
+
+        /* "_strong_wolfe_linesearch.pyx":210
+ *             # closer to stp than the secant step, the cubic step is
+ *             # taken, otherwise the secant step is taken.
+ *             if fabs(stpc-stp) < fabs(stpq-stp):             # <<<<<<<<<<<<<<
+ *                 stpf = stpc
+ *             else:
+ */
         goto __pyx_L13;
       }
-      /*else*/ {
 
-        /* "_strong_wolfe_linesearch.pyx":169
+      /* "_strong_wolfe_linesearch.pyx":213
  *                 stpf = stpc
  *             else:
  *                 stpf = stpq             # <<<<<<<<<<<<<<
  * 
  *             if stp > stx:
  */
+      /*else*/ {
         __pyx_v_stpf = __pyx_v_stpq;
       }
       __pyx_L13:;
 
-      /* "_strong_wolfe_linesearch.pyx":171
+      /* "_strong_wolfe_linesearch.pyx":215
  *                 stpf = stpq
  * 
  *             if stp > stx:             # <<<<<<<<<<<<<<
@@ -1861,7 +2014,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
       __pyx_t_1 = ((__pyx_v_stp > __pyx_v_stx) != 0);
       if (__pyx_t_1) {
 
-        /* "_strong_wolfe_linesearch.pyx":172
+        /* "_strong_wolfe_linesearch.pyx":216
  * 
  *             if stp > stx:
  *                 stpf = min(stp+0.66*(sty-stp),stpf)             # <<<<<<<<<<<<<<
@@ -1876,17 +2029,25 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
           __pyx_t_5 = __pyx_t_3;
         }
         __pyx_v_stpf = __pyx_t_5;
+
+        /* "_strong_wolfe_linesearch.pyx":215
+ *                 stpf = stpq
+ * 
+ *             if stp > stx:             # <<<<<<<<<<<<<<
+ *                 stpf = min(stp+0.66*(sty-stp),stpf)
+ *             else:
+ */
         goto __pyx_L14;
       }
-      /*else*/ {
 
-        /* "_strong_wolfe_linesearch.pyx":174
+      /* "_strong_wolfe_linesearch.pyx":218
  *                 stpf = min(stp+0.66*(sty-stp),stpf)
  *             else:
  *                 stpf = max(stp+0.66*(sty-stp),stpf)             # <<<<<<<<<<<<<<
  * 
  *         else:
  */
+      /*else*/ {
         __pyx_t_5 = __pyx_v_stpf;
         __pyx_t_4 = (__pyx_v_stp + (0.66 * (__pyx_v_sty - __pyx_v_stp)));
         if (((__pyx_t_5 > __pyx_t_4) != 0)) {
@@ -1897,44 +2058,60 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
         __pyx_v_stpf = __pyx_t_3;
       }
       __pyx_L14:;
+
+      /* "_strong_wolfe_linesearch.pyx":206
+ *         stpq = stp + (dp/(dp-dx))*(stx-stp)
+ * 
+ *         if brackt:             # <<<<<<<<<<<<<<
+ *             # A minimizer has been bracketed. If the cubic step is
+ *             # closer to stp than the secant step, the cubic step is
+ */
       goto __pyx_L12;
     }
-    /*else*/ {
 
-      /* "_strong_wolfe_linesearch.pyx":180
+    /* "_strong_wolfe_linesearch.pyx":224
  *             # farther from stp than the secant step, the cubic step is
  *             # taken, otherwise the secant step is taken.
- *             if abs(stpc-stp) > abs(stpq-stp):             # <<<<<<<<<<<<<<
+ *             if fabs(stpc-stp) > fabs(stpq-stp):             # <<<<<<<<<<<<<<
  *                 stpf = stpc
  *             else:
  */
+    /*else*/ {
       __pyx_t_1 = ((fabs((__pyx_v_stpc - __pyx_v_stp)) > fabs((__pyx_v_stpq - __pyx_v_stp))) != 0);
       if (__pyx_t_1) {
 
-        /* "_strong_wolfe_linesearch.pyx":181
+        /* "_strong_wolfe_linesearch.pyx":225
  *             # taken, otherwise the secant step is taken.
- *             if abs(stpc-stp) > abs(stpq-stp):
+ *             if fabs(stpc-stp) > fabs(stpq-stp):
  *                 stpf = stpc             # <<<<<<<<<<<<<<
  *             else:
  *                 stpf = stpq
  */
         __pyx_v_stpf = __pyx_v_stpc;
-        goto __pyx_L15;
-      }
-      /*else*/ {
 
-        /* "_strong_wolfe_linesearch.pyx":183
+        /* "_strong_wolfe_linesearch.pyx":224
+ *             # farther from stp than the secant step, the cubic step is
+ *             # taken, otherwise the secant step is taken.
+ *             if fabs(stpc-stp) > fabs(stpq-stp):             # <<<<<<<<<<<<<<
+ *                 stpf = stpc
+ *             else:
+ */
+        goto __pyx_L15;
+      }
+
+      /* "_strong_wolfe_linesearch.pyx":227
  *                 stpf = stpc
  *             else:
  *                 stpf = stpq             # <<<<<<<<<<<<<<
  * 
  *             stpf = min(stpmax,stpf)
  */
+      /*else*/ {
         __pyx_v_stpf = __pyx_v_stpq;
       }
       __pyx_L15:;
 
-      /* "_strong_wolfe_linesearch.pyx":185
+      /* "_strong_wolfe_linesearch.pyx":229
  *                 stpf = stpq
  * 
  *             stpf = min(stpmax,stpf)             # <<<<<<<<<<<<<<
@@ -1950,7 +2127,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
       }
       __pyx_v_stpf = __pyx_t_4;
 
-      /* "_strong_wolfe_linesearch.pyx":186
+      /* "_strong_wolfe_linesearch.pyx":230
  * 
  *             stpf = min(stpmax,stpf)
  *             stpf = max(stpmin,stpf)             # <<<<<<<<<<<<<<
@@ -1967,33 +2144,41 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
       __pyx_v_stpf = __pyx_t_5;
     }
     __pyx_L12:;
+
+    /* "_strong_wolfe_linesearch.pyx":180
+ *     # Third case: A lower function value, derivatives of the same sign,
+ *     # and the magnitude of the derivative decreases.
+ *     elif fabs(dp) < fabs(dx):             # <<<<<<<<<<<<<<
+ * 
+ *         # The cubic step is computed only if the cubic tends to infinity
+ */
     goto __pyx_L3;
   }
-  /*else*/ {
 
-    /* "_strong_wolfe_linesearch.pyx":193
+  /* "_strong_wolfe_linesearch.pyx":237
  *     # otherwise the cubic step is taken.
  *     else:
  *         if brackt:             # <<<<<<<<<<<<<<
  *             theta = 3*(fp-fy)/(sty-stp) + dy + dp
- *             s = max(abs(theta),abs(dy),abs(dp))
+ *             s = max(fabs(theta),fabs(dy),fabs(dp))
  */
+  /*else*/ {
     __pyx_t_1 = (__pyx_v_brackt != 0);
     if (__pyx_t_1) {
 
-      /* "_strong_wolfe_linesearch.pyx":194
+      /* "_strong_wolfe_linesearch.pyx":238
  *     else:
  *         if brackt:
  *             theta = 3*(fp-fy)/(sty-stp) + dy + dp             # <<<<<<<<<<<<<<
- *             s = max(abs(theta),abs(dy),abs(dp))
+ *             s = max(fabs(theta),fabs(dy),fabs(dp))
  *             gamma = s*sqrt((theta/s)**2-(dy/s)*(dp/s))
  */
       __pyx_v_theta = ((((3.0 * (__pyx_v_fp - __pyx_v_fy)) / (__pyx_v_sty - __pyx_v_stp)) + __pyx_v_dy) + __pyx_v_dp);
 
-      /* "_strong_wolfe_linesearch.pyx":195
+      /* "_strong_wolfe_linesearch.pyx":239
  *         if brackt:
  *             theta = 3*(fp-fy)/(sty-stp) + dy + dp
- *             s = max(abs(theta),abs(dy),abs(dp))             # <<<<<<<<<<<<<<
+ *             s = max(fabs(theta),fabs(dy),fabs(dp))             # <<<<<<<<<<<<<<
  *             gamma = s*sqrt((theta/s)**2-(dy/s)*(dp/s))
  *             if stp > sty:
  */
@@ -2013,17 +2198,17 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
       }
       __pyx_v_s = __pyx_t_2;
 
-      /* "_strong_wolfe_linesearch.pyx":196
+      /* "_strong_wolfe_linesearch.pyx":240
  *             theta = 3*(fp-fy)/(sty-stp) + dy + dp
- *             s = max(abs(theta),abs(dy),abs(dp))
+ *             s = max(fabs(theta),fabs(dy),fabs(dp))
  *             gamma = s*sqrt((theta/s)**2-(dy/s)*(dp/s))             # <<<<<<<<<<<<<<
  *             if stp > sty:
  *                 gamma = -gamma
  */
       __pyx_v_gamma = (__pyx_v_s * sqrt((pow((__pyx_v_theta / __pyx_v_s), 2.0) - ((__pyx_v_dy / __pyx_v_s) * (__pyx_v_dp / __pyx_v_s)))));
 
-      /* "_strong_wolfe_linesearch.pyx":197
- *             s = max(abs(theta),abs(dy),abs(dp))
+      /* "_strong_wolfe_linesearch.pyx":241
+ *             s = max(fabs(theta),fabs(dy),fabs(dp))
  *             gamma = s*sqrt((theta/s)**2-(dy/s)*(dp/s))
  *             if stp > sty:             # <<<<<<<<<<<<<<
  *                 gamma = -gamma
@@ -2032,7 +2217,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
       __pyx_t_1 = ((__pyx_v_stp > __pyx_v_sty) != 0);
       if (__pyx_t_1) {
 
-        /* "_strong_wolfe_linesearch.pyx":198
+        /* "_strong_wolfe_linesearch.pyx":242
  *             gamma = s*sqrt((theta/s)**2-(dy/s)*(dp/s))
  *             if stp > sty:
  *                 gamma = -gamma             # <<<<<<<<<<<<<<
@@ -2040,11 +2225,17 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  *             q = ((gamma-dp)+gamma) + dy
  */
         __pyx_v_gamma = (-__pyx_v_gamma);
-        goto __pyx_L17;
+
+        /* "_strong_wolfe_linesearch.pyx":241
+ *             s = max(fabs(theta),fabs(dy),fabs(dp))
+ *             gamma = s*sqrt((theta/s)**2-(dy/s)*(dp/s))
+ *             if stp > sty:             # <<<<<<<<<<<<<<
+ *                 gamma = -gamma
+ *             p = (gamma-dp) + theta
+ */
       }
-      __pyx_L17:;
 
-      /* "_strong_wolfe_linesearch.pyx":199
+      /* "_strong_wolfe_linesearch.pyx":243
  *             if stp > sty:
  *                 gamma = -gamma
  *             p = (gamma-dp) + theta             # <<<<<<<<<<<<<<
@@ -2053,7 +2244,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
       __pyx_v_p = ((__pyx_v_gamma - __pyx_v_dp) + __pyx_v_theta);
 
-      /* "_strong_wolfe_linesearch.pyx":200
+      /* "_strong_wolfe_linesearch.pyx":244
  *                 gamma = -gamma
  *             p = (gamma-dp) + theta
  *             q = ((gamma-dp)+gamma) + dy             # <<<<<<<<<<<<<<
@@ -2062,7 +2253,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
       __pyx_v_q = (((__pyx_v_gamma - __pyx_v_dp) + __pyx_v_gamma) + __pyx_v_dy);
 
-      /* "_strong_wolfe_linesearch.pyx":201
+      /* "_strong_wolfe_linesearch.pyx":245
  *             p = (gamma-dp) + theta
  *             q = ((gamma-dp)+gamma) + dy
  *             r = p/q             # <<<<<<<<<<<<<<
@@ -2071,7 +2262,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
       __pyx_v_r = (__pyx_v_p / __pyx_v_q);
 
-      /* "_strong_wolfe_linesearch.pyx":202
+      /* "_strong_wolfe_linesearch.pyx":246
  *             q = ((gamma-dp)+gamma) + dy
  *             r = p/q
  *             stpc = stp + r*(sty-stp)             # <<<<<<<<<<<<<<
@@ -2080,7 +2271,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
       __pyx_v_stpc = (__pyx_v_stp + (__pyx_v_r * (__pyx_v_sty - __pyx_v_stp)));
 
-      /* "_strong_wolfe_linesearch.pyx":203
+      /* "_strong_wolfe_linesearch.pyx":247
  *             r = p/q
  *             stpc = stp + r*(sty-stp)
  *             stpf = stpc             # <<<<<<<<<<<<<<
@@ -2088,10 +2279,18 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  *             stpf = stpmax
  */
       __pyx_v_stpf = __pyx_v_stpc;
+
+      /* "_strong_wolfe_linesearch.pyx":237
+ *     # otherwise the cubic step is taken.
+ *     else:
+ *         if brackt:             # <<<<<<<<<<<<<<
+ *             theta = 3*(fp-fy)/(sty-stp) + dy + dp
+ *             s = max(fabs(theta),fabs(dy),fabs(dp))
+ */
       goto __pyx_L16;
     }
 
-    /* "_strong_wolfe_linesearch.pyx":204
+    /* "_strong_wolfe_linesearch.pyx":248
  *             stpc = stp + r*(sty-stp)
  *             stpf = stpc
  *         elif stp > stx:             # <<<<<<<<<<<<<<
@@ -2101,7 +2300,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
     __pyx_t_1 = ((__pyx_v_stp > __pyx_v_stx) != 0);
     if (__pyx_t_1) {
 
-      /* "_strong_wolfe_linesearch.pyx":205
+      /* "_strong_wolfe_linesearch.pyx":249
  *             stpf = stpc
  *         elif stp > stx:
  *             stpf = stpmax             # <<<<<<<<<<<<<<
@@ -2109,24 +2308,32 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  *             stpf = stpmin
  */
       __pyx_v_stpf = __pyx_v_stpmax;
+
+      /* "_strong_wolfe_linesearch.pyx":248
+ *             stpc = stp + r*(sty-stp)
+ *             stpf = stpc
+ *         elif stp > stx:             # <<<<<<<<<<<<<<
+ *             stpf = stpmax
+ *         else:
+ */
       goto __pyx_L16;
     }
-    /*else*/ {
 
-      /* "_strong_wolfe_linesearch.pyx":207
+    /* "_strong_wolfe_linesearch.pyx":251
  *             stpf = stpmax
  *         else:
  *             stpf = stpmin             # <<<<<<<<<<<<<<
  * 
  *     # Update the interval which contains a minimizer.
  */
+    /*else*/ {
       __pyx_v_stpf = __pyx_v_stpmin;
     }
     __pyx_L16:;
   }
   __pyx_L3:;
 
-  /* "_strong_wolfe_linesearch.pyx":210
+  /* "_strong_wolfe_linesearch.pyx":254
  * 
  *     # Update the interval which contains a minimizer.
  *     if fp > fx:             # <<<<<<<<<<<<<<
@@ -2136,7 +2343,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
   __pyx_t_1 = ((__pyx_v_fp > __pyx_v_fx) != 0);
   if (__pyx_t_1) {
 
-    /* "_strong_wolfe_linesearch.pyx":211
+    /* "_strong_wolfe_linesearch.pyx":255
  *     # Update the interval which contains a minimizer.
  *     if fp > fx:
  *         sty = stp             # <<<<<<<<<<<<<<
@@ -2145,7 +2352,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
     __pyx_v_sty = __pyx_v_stp;
 
-    /* "_strong_wolfe_linesearch.pyx":212
+    /* "_strong_wolfe_linesearch.pyx":256
  *     if fp > fx:
  *         sty = stp
  *         fy = fp             # <<<<<<<<<<<<<<
@@ -2154,7 +2361,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
     __pyx_v_fy = __pyx_v_fp;
 
-    /* "_strong_wolfe_linesearch.pyx":213
+    /* "_strong_wolfe_linesearch.pyx":257
  *         sty = stp
  *         fy = fp
  *         dy = dp             # <<<<<<<<<<<<<<
@@ -2162,21 +2369,29 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  *         if sgnd < 0:
  */
     __pyx_v_dy = __pyx_v_dp;
+
+    /* "_strong_wolfe_linesearch.pyx":254
+ * 
+ *     # Update the interval which contains a minimizer.
+ *     if fp > fx:             # <<<<<<<<<<<<<<
+ *         sty = stp
+ *         fy = fp
+ */
     goto __pyx_L18;
   }
-  /*else*/ {
 
-    /* "_strong_wolfe_linesearch.pyx":215
+  /* "_strong_wolfe_linesearch.pyx":259
  *         dy = dp
  *     else:
  *         if sgnd < 0:             # <<<<<<<<<<<<<<
  *             sty = stx
  *             fy = fx
  */
+  /*else*/ {
     __pyx_t_1 = ((__pyx_v_sgnd < 0.0) != 0);
     if (__pyx_t_1) {
 
-      /* "_strong_wolfe_linesearch.pyx":216
+      /* "_strong_wolfe_linesearch.pyx":260
  *     else:
  *         if sgnd < 0:
  *             sty = stx             # <<<<<<<<<<<<<<
@@ -2185,7 +2400,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
       __pyx_v_sty = __pyx_v_stx;
 
-      /* "_strong_wolfe_linesearch.pyx":217
+      /* "_strong_wolfe_linesearch.pyx":261
  *         if sgnd < 0:
  *             sty = stx
  *             fy = fx             # <<<<<<<<<<<<<<
@@ -2194,7 +2409,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
       __pyx_v_fy = __pyx_v_fx;
 
-      /* "_strong_wolfe_linesearch.pyx":218
+      /* "_strong_wolfe_linesearch.pyx":262
  *             sty = stx
  *             fy = fx
  *             dy = dx             # <<<<<<<<<<<<<<
@@ -2202,11 +2417,17 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  *         fx = fp
  */
       __pyx_v_dy = __pyx_v_dx;
-      goto __pyx_L19;
+
+      /* "_strong_wolfe_linesearch.pyx":259
+ *         dy = dp
+ *     else:
+ *         if sgnd < 0:             # <<<<<<<<<<<<<<
+ *             sty = stx
+ *             fy = fx
+ */
     }
-    __pyx_L19:;
 
-    /* "_strong_wolfe_linesearch.pyx":219
+    /* "_strong_wolfe_linesearch.pyx":263
  *             fy = fx
  *             dy = dx
  *         stx = stp             # <<<<<<<<<<<<<<
@@ -2215,7 +2436,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
     __pyx_v_stx = __pyx_v_stp;
 
-    /* "_strong_wolfe_linesearch.pyx":220
+    /* "_strong_wolfe_linesearch.pyx":264
  *             dy = dx
  *         stx = stp
  *         fx = fp             # <<<<<<<<<<<<<<
@@ -2224,7 +2445,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
     __pyx_v_fx = __pyx_v_fp;
 
-    /* "_strong_wolfe_linesearch.pyx":221
+    /* "_strong_wolfe_linesearch.pyx":265
  *         stx = stp
  *         fx = fp
  *         dx = dp             # <<<<<<<<<<<<<<
@@ -2235,7 +2456,7 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
   }
   __pyx_L18:;
 
-  /* "_strong_wolfe_linesearch.pyx":224
+  /* "_strong_wolfe_linesearch.pyx":268
  * 
  *     # Compute the new step.
  *     stp = stpf             # <<<<<<<<<<<<<<
@@ -2244,249 +2465,49 @@ static PyObject *__pyx_f_24_strong_wolfe_linesearch_dcstep(double __pyx_v_stx, d
  */
   __pyx_v_stp = __pyx_v_stpf;
 
-  /* "_strong_wolfe_linesearch.pyx":226
+  /* "_strong_wolfe_linesearch.pyx":270
  *     stp = stpf
  * 
  *     return stx, fx, dx, sty, fy, dy, stp, brackt             # <<<<<<<<<<<<<<
  * 
- * @cython.boundscheck(False)
+ * @cython.cdivision(True)
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_8 = PyFloat_FromDouble(__pyx_v_stx); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_9 = PyFloat_FromDouble(__pyx_v_fx); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_9);
-  __pyx_t_10 = PyFloat_FromDouble(__pyx_v_dx); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_10);
-  __pyx_t_11 = PyFloat_FromDouble(__pyx_v_sty); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_11);
-  __pyx_t_12 = PyFloat_FromDouble(__pyx_v_fy); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_12);
-  __pyx_t_13 = PyFloat_FromDouble(__pyx_v_dy); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_13);
-  __pyx_t_14 = PyFloat_FromDouble(__pyx_v_stp); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_14);
-  __pyx_t_15 = __Pyx_PyBool_FromLong(__pyx_v_brackt); if (unlikely(!__pyx_t_15)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_15);
-  __pyx_t_16 = PyTuple_New(8); if (unlikely(!__pyx_t_16)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_16);
-  PyTuple_SET_ITEM(__pyx_t_16, 0, __pyx_t_8);
-  __Pyx_GIVEREF(__pyx_t_8);
-  PyTuple_SET_ITEM(__pyx_t_16, 1, __pyx_t_9);
-  __Pyx_GIVEREF(__pyx_t_9);
-  PyTuple_SET_ITEM(__pyx_t_16, 2, __pyx_t_10);
-  __Pyx_GIVEREF(__pyx_t_10);
-  PyTuple_SET_ITEM(__pyx_t_16, 3, __pyx_t_11);
-  __Pyx_GIVEREF(__pyx_t_11);
-  PyTuple_SET_ITEM(__pyx_t_16, 4, __pyx_t_12);
-  __Pyx_GIVEREF(__pyx_t_12);
-  PyTuple_SET_ITEM(__pyx_t_16, 5, __pyx_t_13);
-  __Pyx_GIVEREF(__pyx_t_13);
-  PyTuple_SET_ITEM(__pyx_t_16, 6, __pyx_t_14);
-  __Pyx_GIVEREF(__pyx_t_14);
-  PyTuple_SET_ITEM(__pyx_t_16, 7, __pyx_t_15);
-  __Pyx_GIVEREF(__pyx_t_15);
-  __pyx_t_8 = 0;
-  __pyx_t_9 = 0;
-  __pyx_t_10 = 0;
-  __pyx_t_11 = 0;
-  __pyx_t_12 = 0;
-  __pyx_t_13 = 0;
-  __pyx_t_14 = 0;
-  __pyx_t_15 = 0;
-  __pyx_r = ((PyObject*)__pyx_t_16);
-  __pyx_t_16 = 0;
+  __pyx_t_8.f0 = __pyx_v_stx;
+  __pyx_t_8.f1 = __pyx_v_fx;
+  __pyx_t_8.f2 = __pyx_v_dx;
+  __pyx_t_8.f3 = __pyx_v_sty;
+  __pyx_t_8.f4 = __pyx_v_fy;
+  __pyx_t_8.f5 = __pyx_v_dy;
+  __pyx_t_8.f6 = __pyx_v_stp;
+  __pyx_t_8.f7 = __pyx_v_brackt;
+  __pyx_r = __pyx_t_8;
   goto __pyx_L0;
 
-  /* "_strong_wolfe_linesearch.pyx":9
+  /* "_strong_wolfe_linesearch.pyx":52
  * 
  * @cython.cdivision(True)
- * cdef tuple dcstep(double stx, double fx, double dx, double sty, double fy, double dy,             # <<<<<<<<<<<<<<
- *                   double stp, double fp, double dp, bint brackt, double stpmin,
- *                   double stpmax):
+ * cdef (double, double, double, double, double, double, double, bint) \             # <<<<<<<<<<<<<<
+ *         dcstep(double stx, double fx, double dx, double sty, double fy,
+ *                double dy, double stp, double fp, double dp, bint brackt,
  */
 
   /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_XDECREF(__pyx_t_11);
-  __Pyx_XDECREF(__pyx_t_12);
-  __Pyx_XDECREF(__pyx_t_13);
-  __Pyx_XDECREF(__pyx_t_14);
-  __Pyx_XDECREF(__pyx_t_15);
-  __Pyx_XDECREF(__pyx_t_16);
-  __Pyx_AddTraceback("_strong_wolfe_linesearch.dcstep", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "_strong_wolfe_linesearch.pyx":229
+/* "_strong_wolfe_linesearch.pyx":273
  * 
- * @cython.boundscheck(False)
- * def dcsrch(double stp, double f, double g, double ftol, double gtol, double xtol,             # <<<<<<<<<<<<<<
- *            str task, double stpmin, double stpmax,
- *            cnp.ndarray[cnp.int32_t,ndim=1] isave,
+ * @cython.cdivision(True)
+ * cdef int dcsrch_core(double *pstp, double f, double g, double ftol,             # <<<<<<<<<<<<<<
+ *                      double gtol, double xtol, int task, double stpmin,
+ *                      double stpmax, dcsrch_state *st) nogil:
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_24_strong_wolfe_linesearch_1dcsrch(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_24_strong_wolfe_linesearch_dcsrch[] = "\n    This subroutine finds a step that satisfies a sufficient\n    decrease condition and a curvature condition.\n\n    Each call of the subroutine updates an interval with\n    endpoints stx and sty. The interval is initially chosen\n    so that it contains a minimizer of the modified function\n\n       psi(stp) = f(stp) - f(0) - ftol*stp*f'(0).\n\n    If psi(stp) <= 0 and f'(stp) >= 0 for some step, then the\n    interval is chosen so that it contains a minimizer of f.\n\n    The algorithm is designed to find a step that satisfies\n    the sufficient decrease condition\n\n       f(stp) <= f(0) + ftol*stp*f'(0),\n\n    and the curvature condition\n\n       abs(f'(stp)) <= gtol*abs(f'(0)).\n\n    If ftol is less than gtol and if, for example, the function\n    is bounded below, then there is always a step which satisfies\n    both conditions.\n\n    If no step can be found that satisfies both conditions, then\n    the algorithm stops with a warning. In this case stp only\n    satisfies the sufficient decrease condition.\n\n    :parameters:\n    stp is a double precision variable.\n     On entry stp is the current estimate of a satisfactory\n        step. On initial entry, a positive initial estimate\n        must be provided.\n     On exit stp is the current estimate of a satisfactory step\n        if task = 'FG'. If task = 'CONV' then stp satisfies\n        the sufficient decrease and curvature condition.\n\n    f is a double precision variable.\n     On initial entry f is the value of the function at 0.\n        On subsequent entries f is the value of the\n        function at stp.\n     On exit f is the value of the function at stp.\n\n    g is a double precision variable.\n     On initial entry g is the derivative of the function at 0.\n        On subsequent entries g is the derivative of the\n        function at stp.\n     On exit g is the derivative of the function at stp.\n\n    ftol is a double precision variable.\n     On entry ftol specifies a nonnegative ""tolerance for the\n        sufficient decrease condition.\n     On exit ftol is unchanged.\n\n    gtol is a double precision variable.\n     On entry gtol specifies a nonnegative tolerance for the\n        curvature condition.\n     On exit gtol is unchanged.\n\n    xtol is a double precision variable.\n     On entry xtol specifies a nonnegative relative tolerance\n        for an acceptable step. The subroutine exits with a\n        warning if the relative difference between sty and stx\n        is less than xtol.\n     On exit xtol is unchanged.\n\n    task is a character variable of length at least 60.\n     On initial entry task must be set to 'START'.\n     On exit task indicates the required action:\n\n        If task(1:2) = 'FG' then evaluate the function and\n        derivative at stp and call dcsrch again.\n\n        If task(1:4) = 'CONV' then the search is successful.\n\n        If task(1:4) = 'WARN' then the subroutine is not able\n        to satisfy the convergence conditions. The exit value of\n        stp contains the best point found during the search.\n\n        If task(1:5) = 'ERROR' then there is an error in the\n        input arguments.\n\n     On exit with convergence, a warning or an error, the\n        variable task contains additional information.\n\n    stpmin is a double precision variable.\n     On entry stpmin is a nonnegative lower bound for the step.\n     On exit stpmin is unchanged.\n\n    stpmax is a double precision variable.\n     On entry stpmax is a nonnegative upper bound for the step.\n     On exit stpmax is unchanged.\n\n    isave is an integer work array of dimension 2.\n\n    dsave is a double precision work array of dimension 13.\n    ";
-static PyMethodDef __pyx_mdef_24_strong_wolfe_linesearch_1dcsrch = {"dcsrch", (PyCFunction)__pyx_pw_24_strong_wolfe_linesearch_1dcsrch, METH_VARARGS|METH_KEYWORDS, __pyx_doc_24_strong_wolfe_linesearch_dcsrch};
-static PyObject *__pyx_pw_24_strong_wolfe_linesearch_1dcsrch(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  double __pyx_v_stp;
-  double __pyx_v_f;
-  double __pyx_v_g;
-  double __pyx_v_ftol;
-  double __pyx_v_gtol;
-  double __pyx_v_xtol;
-  PyObject *__pyx_v_task = 0;
-  double __pyx_v_stpmin;
-  double __pyx_v_stpmax;
-  PyArrayObject *__pyx_v_isave = 0;
-  PyArrayObject *__pyx_v_dsave = 0;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("dcsrch (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_stp,&__pyx_n_s_f,&__pyx_n_s_g,&__pyx_n_s_ftol,&__pyx_n_s_gtol,&__pyx_n_s_xtol,&__pyx_n_s_task,&__pyx_n_s_stpmin,&__pyx_n_s_stpmax,&__pyx_n_s_isave,&__pyx_n_s_dsave,0};
-    PyObject* values[11] = {0,0,0,0,0,0,0,0,0,0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case 11: values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
-        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
-        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
-        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
-        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_stp)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_f)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  2:
-        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_g)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  3:
-        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_ftol)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  4:
-        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_gtol)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  5:
-        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_xtol)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  6:
-        if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_task)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  7:
-        if (likely((values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_stpmin)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  8:
-        if (likely((values[8] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_stpmax)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 8); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  9:
-        if (likely((values[9] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_isave)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 9); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case 10:
-        if (likely((values[10] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_dsave)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 10); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "dcsrch") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 11) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
-      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
-      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
-      values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
-    }
-    __pyx_v_stp = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_stp == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_f = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_f == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_g = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_g == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_ftol = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_ftol == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_gtol = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_gtol == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_xtol = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_xtol == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_task = ((PyObject*)values[6]);
-    __pyx_v_stpmin = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_stpmin == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_stpmax = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_stpmax == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_isave = ((PyArrayObject *)values[9]);
-    __pyx_v_dsave = ((PyArrayObject *)values[10]);
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("_strong_wolfe_linesearch.dcsrch", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_task), (&PyString_Type), 1, "task", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_isave), __pyx_ptype_5numpy_ndarray, 1, "isave", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 231; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_dsave), __pyx_ptype_5numpy_ndarray, 1, "dsave", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_24_strong_wolfe_linesearch_dcsrch(__pyx_self, __pyx_v_stp, __pyx_v_f, __pyx_v_g, __pyx_v_ftol, __pyx_v_gtol, __pyx_v_xtol, __pyx_v_task, __pyx_v_stpmin, __pyx_v_stpmax, __pyx_v_isave, __pyx_v_dsave);
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_24_strong_wolfe_linesearch_dcsrch(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_stp, double __pyx_v_f, double __pyx_v_g, double __pyx_v_ftol, double __pyx_v_gtol, double __pyx_v_xtol, PyObject *__pyx_v_task, double __pyx_v_stpmin, double __pyx_v_stpmax, PyArrayObject *__pyx_v_isave, PyArrayObject *__pyx_v_dsave) {
+static int __pyx_f_24_strong_wolfe_linesearch_dcsrch_core(double *__pyx_v_pstp, double __pyx_v_f, double __pyx_v_g, double __pyx_v_ftol, double __pyx_v_gtol, double __pyx_v_xtol, int __pyx_v_task, double __pyx_v_stpmin, double __pyx_v_stpmax, struct __pyx_t_24_strong_wolfe_linesearch_dcsrch_state *__pyx_v_st) {
   double __pyx_v_xtrapl;
   double __pyx_v_xtrapu;
+  double __pyx_v_stp;
   int __pyx_v_brackt;
   int __pyx_v_stage;
   double __pyx_v_finit;
@@ -2509,642 +2530,479 @@ static PyObject *__pyx_pf_24_strong_wolfe_linesearch_dcsrch(CYTHON_UNUSED PyObje
   double __pyx_v_stmax;
   double __pyx_v_width;
   double __pyx_v_width1;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_dsave;
-  __Pyx_Buffer __pyx_pybuffer_dsave;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_isave;
-  __Pyx_Buffer __pyx_pybuffer_isave;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  int __pyx_r;
+  int __pyx_t_1;
   int __pyx_t_2;
-  int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  long __pyx_t_5;
-  long __pyx_t_6;
-  long __pyx_t_7;
-  long __pyx_t_8;
-  long __pyx_t_9;
-  long __pyx_t_10;
-  long __pyx_t_11;
-  long __pyx_t_12;
-  long __pyx_t_13;
-  long __pyx_t_14;
-  long __pyx_t_15;
-  long __pyx_t_16;
-  long __pyx_t_17;
-  long __pyx_t_18;
-  long __pyx_t_19;
-  int __pyx_t_20;
-  PyObject *__pyx_t_21 = NULL;
-  PyObject *__pyx_t_22 = NULL;
-  PyObject *__pyx_t_23 = NULL;
-  PyObject *__pyx_t_24 = NULL;
-  PyObject *__pyx_t_25 = NULL;
-  PyObject *__pyx_t_26 = NULL;
-  PyObject *__pyx_t_27 = NULL;
-  double __pyx_t_28;
-  double __pyx_t_29;
-  double __pyx_t_30;
-  double __pyx_t_31;
-  double __pyx_t_32;
-  double __pyx_t_33;
-  double __pyx_t_34;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("dcsrch", 0);
-  __Pyx_INCREF(__pyx_v_task);
-  __pyx_pybuffer_isave.pybuffer.buf = NULL;
-  __pyx_pybuffer_isave.refcount = 0;
-  __pyx_pybuffernd_isave.data = NULL;
-  __pyx_pybuffernd_isave.rcbuffer = &__pyx_pybuffer_isave;
-  __pyx_pybuffer_dsave.pybuffer.buf = NULL;
-  __pyx_pybuffer_dsave.refcount = 0;
-  __pyx_pybuffernd_dsave.data = NULL;
-  __pyx_pybuffernd_dsave.rcbuffer = &__pyx_pybuffer_dsave;
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_isave.rcbuffer->pybuffer, (PyObject*)__pyx_v_isave, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_pybuffernd_isave.diminfo[0].strides = __pyx_pybuffernd_isave.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_isave.diminfo[0].shape = __pyx_pybuffernd_isave.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_dsave.rcbuffer->pybuffer, (PyObject*)__pyx_v_dsave, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_pybuffernd_dsave.diminfo[0].strides = __pyx_pybuffernd_dsave.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_dsave.diminfo[0].shape = __pyx_pybuffernd_dsave.rcbuffer->pybuffer.shape[0];
-
-  /* "_strong_wolfe_linesearch.pyx":333
+  double __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  __pyx_ctuple_e327b__double__and_double__and_double__and_double__and_double__and_double__and_double__and_int__etc __pyx_t_6;
+  double __pyx_t_7;
+  double __pyx_t_8;
+  double __pyx_t_9;
+  double __pyx_t_10;
+  double __pyx_t_11;
+  double __pyx_t_12;
+
+  /* "_strong_wolfe_linesearch.pyx":282
  *     """
  *     cdef:
  *         double xtrapl=1.1, xtrapu=4             # <<<<<<<<<<<<<<
+ *         double stp = pstp[0]
  *         bint brackt
- *         int stage
  */
   __pyx_v_xtrapl = 1.1;
   __pyx_v_xtrapu = 4.0;
 
-  /* "_strong_wolfe_linesearch.pyx":341
+  /* "_strong_wolfe_linesearch.pyx":283
+ *     cdef:
+ *         double xtrapl=1.1, xtrapu=4
+ *         double stp = pstp[0]             # <<<<<<<<<<<<<<
+ *         bint brackt
+ *         int stage
+ */
+  __pyx_v_stp = (__pyx_v_pstp[0]);
+
+  /* "_strong_wolfe_linesearch.pyx":291
  * 
  *     # Initialization block.
- *     if task[0:5] == 'START':             # <<<<<<<<<<<<<<
+ *     if task == START:             # <<<<<<<<<<<<<<
  * 
  *         # Check the input arguments for errors.
  */
-  if (unlikely(__pyx_v_task == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_t_1 = PySequence_GetSlice(__pyx_v_task, 0, 5); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = (__Pyx_PyString_Equals(__pyx_t_1, __pyx_n_s_START, Py_EQ)); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = (__pyx_t_2 != 0);
-  if (__pyx_t_3) {
+  __pyx_t_1 = ((__pyx_v_task == __pyx_e_24_strong_wolfe_linesearch_START) != 0);
+  if (__pyx_t_1) {
 
-    /* "_strong_wolfe_linesearch.pyx":344
+    /* "_strong_wolfe_linesearch.pyx":294
  * 
  *         # Check the input arguments for errors.
- *         if stp < stpmin: task = 'ERROR: STP < STPMIN'             # <<<<<<<<<<<<<<
- *         if stp > stpmax: task = 'ERROR: STP > STPMAX'
- *         if g >= 0: task = 'ERROR: INITIAL G >= 0'
+ *         if stp < stpmin: task = ERROR_STP_STPMIN             # <<<<<<<<<<<<<<
+ *         if stp > stpmax: task = ERROR_STP_STPMAX
+ *         if g >= 0: task = ERROR_INITIAL_G
  */
-    __pyx_t_3 = ((__pyx_v_stp < __pyx_v_stpmin) != 0);
-    if (__pyx_t_3) {
-      __Pyx_INCREF(__pyx_kp_s_ERROR_STP_STPMIN);
-      __Pyx_DECREF_SET(__pyx_v_task, __pyx_kp_s_ERROR_STP_STPMIN);
-      goto __pyx_L4;
+    __pyx_t_1 = ((__pyx_v_stp < __pyx_v_stpmin) != 0);
+    if (__pyx_t_1) {
+      __pyx_v_task = __pyx_e_24_strong_wolfe_linesearch_ERROR_STP_STPMIN;
     }
-    __pyx_L4:;
 
-    /* "_strong_wolfe_linesearch.pyx":345
+    /* "_strong_wolfe_linesearch.pyx":295
  *         # Check the input arguments for errors.
- *         if stp < stpmin: task = 'ERROR: STP < STPMIN'
- *         if stp > stpmax: task = 'ERROR: STP > STPMAX'             # <<<<<<<<<<<<<<
- *         if g >= 0: task = 'ERROR: INITIAL G >= 0'
- *         if ftol < 0: task = 'ERROR: FTOL < 0'
- */
-    __pyx_t_3 = ((__pyx_v_stp > __pyx_v_stpmax) != 0);
-    if (__pyx_t_3) {
-      __Pyx_INCREF(__pyx_kp_s_ERROR_STP_STPMAX);
-      __Pyx_DECREF_SET(__pyx_v_task, __pyx_kp_s_ERROR_STP_STPMAX);
-      goto __pyx_L5;
+ *         if stp < stpmin: task = ERROR_STP_STPMIN
+ *         if stp > stpmax: task = ERROR_STP_STPMAX             # <<<<<<<<<<<<<<
+ *         if g >= 0: task = ERROR_INITIAL_G
+ *         if ftol < 0: task = ERROR_FTOL
+ */
+    __pyx_t_1 = ((__pyx_v_stp > __pyx_v_stpmax) != 0);
+    if (__pyx_t_1) {
+      __pyx_v_task = __pyx_e_24_strong_wolfe_linesearch_ERROR_STP_STPMAX;
     }
-    __pyx_L5:;
 
-    /* "_strong_wolfe_linesearch.pyx":346
- *         if stp < stpmin: task = 'ERROR: STP < STPMIN'
- *         if stp > stpmax: task = 'ERROR: STP > STPMAX'
- *         if g >= 0: task = 'ERROR: INITIAL G >= 0'             # <<<<<<<<<<<<<<
- *         if ftol < 0: task = 'ERROR: FTOL < 0'
- *         if gtol < 0: task = 'ERROR: GTOL < 0'
- */
-    __pyx_t_3 = ((__pyx_v_g >= 0.0) != 0);
-    if (__pyx_t_3) {
-      __Pyx_INCREF(__pyx_kp_s_ERROR_INITIAL_G_0);
-      __Pyx_DECREF_SET(__pyx_v_task, __pyx_kp_s_ERROR_INITIAL_G_0);
-      goto __pyx_L6;
-    }
-    __pyx_L6:;
-
-    /* "_strong_wolfe_linesearch.pyx":347
- *         if stp > stpmax: task = 'ERROR: STP > STPMAX'
- *         if g >= 0: task = 'ERROR: INITIAL G >= 0'
- *         if ftol < 0: task = 'ERROR: FTOL < 0'             # <<<<<<<<<<<<<<
- *         if gtol < 0: task = 'ERROR: GTOL < 0'
- *         if xtol < 0: task = 'ERROR: XTOL < 0'
- */
-    __pyx_t_3 = ((__pyx_v_ftol < 0.0) != 0);
-    if (__pyx_t_3) {
-      __Pyx_INCREF(__pyx_kp_s_ERROR_FTOL_0);
-      __Pyx_DECREF_SET(__pyx_v_task, __pyx_kp_s_ERROR_FTOL_0);
-      goto __pyx_L7;
+    /* "_strong_wolfe_linesearch.pyx":296
+ *         if stp < stpmin: task = ERROR_STP_STPMIN
+ *         if stp > stpmax: task = ERROR_STP_STPMAX
+ *         if g >= 0: task = ERROR_INITIAL_G             # <<<<<<<<<<<<<<
+ *         if ftol < 0: task = ERROR_FTOL
+ *         if gtol < 0: task = ERROR_GTOL
+ */
+    __pyx_t_1 = ((__pyx_v_g >= 0.0) != 0);
+    if (__pyx_t_1) {
+      __pyx_v_task = __pyx_e_24_strong_wolfe_linesearch_ERROR_INITIAL_G;
     }
-    __pyx_L7:;
 
-    /* "_strong_wolfe_linesearch.pyx":348
- *         if g >= 0: task = 'ERROR: INITIAL G >= 0'
- *         if ftol < 0: task = 'ERROR: FTOL < 0'
- *         if gtol < 0: task = 'ERROR: GTOL < 0'             # <<<<<<<<<<<<<<
- *         if xtol < 0: task = 'ERROR: XTOL < 0'
- *         if stpmin < 0: task = 'ERROR: STPMIN < 0'
- */
-    __pyx_t_3 = ((__pyx_v_gtol < 0.0) != 0);
-    if (__pyx_t_3) {
-      __Pyx_INCREF(__pyx_kp_s_ERROR_GTOL_0);
-      __Pyx_DECREF_SET(__pyx_v_task, __pyx_kp_s_ERROR_GTOL_0);
-      goto __pyx_L8;
-    }
-    __pyx_L8:;
-
-    /* "_strong_wolfe_linesearch.pyx":349
- *         if ftol < 0: task = 'ERROR: FTOL < 0'
- *         if gtol < 0: task = 'ERROR: GTOL < 0'
- *         if xtol < 0: task = 'ERROR: XTOL < 0'             # <<<<<<<<<<<<<<
- *         if stpmin < 0: task = 'ERROR: STPMIN < 0'
- *         if stpmax < stpmin: task = 'ERROR: STPMAX < STPMIN'
- */
-    __pyx_t_3 = ((__pyx_v_xtol < 0.0) != 0);
-    if (__pyx_t_3) {
-      __Pyx_INCREF(__pyx_kp_s_ERROR_XTOL_0);
-      __Pyx_DECREF_SET(__pyx_v_task, __pyx_kp_s_ERROR_XTOL_0);
-      goto __pyx_L9;
+    /* "_strong_wolfe_linesearch.pyx":297
+ *         if stp > stpmax: task = ERROR_STP_STPMAX
+ *         if g >= 0: task = ERROR_INITIAL_G
+ *         if ftol < 0: task = ERROR_FTOL             # <<<<<<<<<<<<<<
+ *         if gtol < 0: task = ERROR_GTOL
+ *         if xtol < 0: task = ERROR_XTOL
+ */
+    __pyx_t_1 = ((__pyx_v_ftol < 0.0) != 0);
+    if (__pyx_t_1) {
+      __pyx_v_task = __pyx_e_24_strong_wolfe_linesearch_ERROR_FTOL;
     }
-    __pyx_L9:;
 
-    /* "_strong_wolfe_linesearch.pyx":350
- *         if gtol < 0: task = 'ERROR: GTOL < 0'
- *         if xtol < 0: task = 'ERROR: XTOL < 0'
- *         if stpmin < 0: task = 'ERROR: STPMIN < 0'             # <<<<<<<<<<<<<<
- *         if stpmax < stpmin: task = 'ERROR: STPMAX < STPMIN'
- * 
+    /* "_strong_wolfe_linesearch.pyx":298
+ *         if g >= 0: task = ERROR_INITIAL_G
+ *         if ftol < 0: task = ERROR_FTOL
+ *         if gtol < 0: task = ERROR_GTOL             # <<<<<<<<<<<<<<
+ *         if xtol < 0: task = ERROR_XTOL
+ *         if stpmin < 0: task = ERROR_STPMIN
  */
-    __pyx_t_3 = ((__pyx_v_stpmin < 0.0) != 0);
-    if (__pyx_t_3) {
-      __Pyx_INCREF(__pyx_kp_s_ERROR_STPMIN_0);
-      __Pyx_DECREF_SET(__pyx_v_task, __pyx_kp_s_ERROR_STPMIN_0);
-      goto __pyx_L10;
+    __pyx_t_1 = ((__pyx_v_gtol < 0.0) != 0);
+    if (__pyx_t_1) {
+      __pyx_v_task = __pyx_e_24_strong_wolfe_linesearch_ERROR_GTOL;
     }
-    __pyx_L10:;
 
-    /* "_strong_wolfe_linesearch.pyx":351
- *         if xtol < 0: task = 'ERROR: XTOL < 0'
- *         if stpmin < 0: task = 'ERROR: STPMIN < 0'
- *         if stpmax < stpmin: task = 'ERROR: STPMAX < STPMIN'             # <<<<<<<<<<<<<<
- * 
- *         # Exit if there are errors on input.
+    /* "_strong_wolfe_linesearch.pyx":299
+ *         if ftol < 0: task = ERROR_FTOL
+ *         if gtol < 0: task = ERROR_GTOL
+ *         if xtol < 0: task = ERROR_XTOL             # <<<<<<<<<<<<<<
+ *         if stpmin < 0: task = ERROR_STPMIN
+ *         if stpmax < stpmin: task = ERROR_STPMAX_STPMIN
  */
-    __pyx_t_3 = ((__pyx_v_stpmax < __pyx_v_stpmin) != 0);
-    if (__pyx_t_3) {
-      __Pyx_INCREF(__pyx_kp_s_ERROR_STPMAX_STPMIN);
-      __Pyx_DECREF_SET(__pyx_v_task, __pyx_kp_s_ERROR_STPMAX_STPMIN);
-      goto __pyx_L11;
+    __pyx_t_1 = ((__pyx_v_xtol < 0.0) != 0);
+    if (__pyx_t_1) {
+      __pyx_v_task = __pyx_e_24_strong_wolfe_linesearch_ERROR_XTOL;
     }
-    __pyx_L11:;
 
-    /* "_strong_wolfe_linesearch.pyx":354
- * 
- *         # Exit if there are errors on input.
- *         if task[0:5] == 'ERROR':             # <<<<<<<<<<<<<<
- *             return stp, task, isave, dsave
+    /* "_strong_wolfe_linesearch.pyx":300
+ *         if gtol < 0: task = ERROR_GTOL
+ *         if xtol < 0: task = ERROR_XTOL
+ *         if stpmin < 0: task = ERROR_STPMIN             # <<<<<<<<<<<<<<
+ *         if stpmax < stpmin: task = ERROR_STPMAX_STPMIN
  * 
  */
-    if (unlikely(__pyx_v_task == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = ((__pyx_v_stpmin < 0.0) != 0);
+    if (__pyx_t_1) {
+      __pyx_v_task = __pyx_e_24_strong_wolfe_linesearch_ERROR_STPMIN;
     }
-    __pyx_t_1 = PySequence_GetSlice(__pyx_v_task, 0, 5); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = (__Pyx_PyString_Equals(__pyx_t_1, __pyx_n_s_ERROR, Py_EQ)); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_2 = (__pyx_t_3 != 0);
-    if (__pyx_t_2) {
 
-      /* "_strong_wolfe_linesearch.pyx":355
- *         # Exit if there are errors on input.
- *         if task[0:5] == 'ERROR':
- *             return stp, task, isave, dsave             # <<<<<<<<<<<<<<
+    /* "_strong_wolfe_linesearch.pyx":301
+ *         if xtol < 0: task = ERROR_XTOL
+ *         if stpmin < 0: task = ERROR_STPMIN
+ *         if stpmax < stpmin: task = ERROR_STPMAX_STPMIN             # <<<<<<<<<<<<<<
  * 
- *         # Initialize local variables.
+ *         # Exit if there are errors on input.
  */
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_1 = PyFloat_FromDouble(__pyx_v_stp); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 355; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_4 = PyTuple_New(4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 355; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
-      __Pyx_GIVEREF(__pyx_t_1);
-      __Pyx_INCREF(__pyx_v_task);
-      PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_task);
-      __Pyx_GIVEREF(__pyx_v_task);
-      __Pyx_INCREF(((PyObject *)__pyx_v_isave));
-      PyTuple_SET_ITEM(__pyx_t_4, 2, ((PyObject *)__pyx_v_isave));
-      __Pyx_GIVEREF(((PyObject *)__pyx_v_isave));
-      __Pyx_INCREF(((PyObject *)__pyx_v_dsave));
-      PyTuple_SET_ITEM(__pyx_t_4, 3, ((PyObject *)__pyx_v_dsave));
-      __Pyx_GIVEREF(((PyObject *)__pyx_v_dsave));
-      __pyx_t_1 = 0;
-      __pyx_r = __pyx_t_4;
-      __pyx_t_4 = 0;
-      goto __pyx_L0;
+    __pyx_t_1 = ((__pyx_v_stpmax < __pyx_v_stpmin) != 0);
+    if (__pyx_t_1) {
+      __pyx_v_task = __pyx_e_24_strong_wolfe_linesearch_ERROR_STPMAX_STPMIN;
     }
 
-    /* "_strong_wolfe_linesearch.pyx":358
+    /* "_strong_wolfe_linesearch.pyx":304
+ * 
+ *         # Exit if there are errors on input.
+ *         if task != START:             # <<<<<<<<<<<<<<
+ *             return task
  * 
- *         # Initialize local variables.
- *         brackt = False             # <<<<<<<<<<<<<<
- *         stage = 1
- *         finit = f
  */
-    __pyx_v_brackt = 0;
+    __pyx_t_1 = ((__pyx_v_task != __pyx_e_24_strong_wolfe_linesearch_START) != 0);
+    if (__pyx_t_1) {
 
-    /* "_strong_wolfe_linesearch.pyx":359
+      /* "_strong_wolfe_linesearch.pyx":305
+ *         # Exit if there are errors on input.
+ *         if task != START:
+ *             return task             # <<<<<<<<<<<<<<
+ * 
  *         # Initialize local variables.
- *         brackt = False
- *         stage = 1             # <<<<<<<<<<<<<<
- *         finit = f
- *         ginit = g
- */
-    __pyx_v_stage = 1;
-
-    /* "_strong_wolfe_linesearch.pyx":360
- *         brackt = False
- *         stage = 1
- *         finit = f             # <<<<<<<<<<<<<<
- *         ginit = g
- *         gtest = ftol*ginit
- */
-    __pyx_v_finit = __pyx_v_f;
-
-    /* "_strong_wolfe_linesearch.pyx":361
- *         stage = 1
- *         finit = f
- *         ginit = g             # <<<<<<<<<<<<<<
- *         gtest = ftol*ginit
- *         width = stpmax - stpmin
- */
-    __pyx_v_ginit = __pyx_v_g;
-
-    /* "_strong_wolfe_linesearch.pyx":362
- *         finit = f
- *         ginit = g
- *         gtest = ftol*ginit             # <<<<<<<<<<<<<<
- *         width = stpmax - stpmin
- *         width1 = width/0.5
  */
-    __pyx_v_gtest = (__pyx_v_ftol * __pyx_v_ginit);
+      __pyx_r = __pyx_v_task;
+      goto __pyx_L0;
 
-    /* "_strong_wolfe_linesearch.pyx":363
- *         ginit = g
- *         gtest = ftol*ginit
- *         width = stpmax - stpmin             # <<<<<<<<<<<<<<
- *         width1 = width/0.5
+      /* "_strong_wolfe_linesearch.pyx":304
  * 
- */
-    __pyx_v_width = (__pyx_v_stpmax - __pyx_v_stpmin);
-
-    /* "_strong_wolfe_linesearch.pyx":364
- *         gtest = ftol*ginit
- *         width = stpmax - stpmin
- *         width1 = width/0.5             # <<<<<<<<<<<<<<
+ *         # Exit if there are errors on input.
+ *         if task != START:             # <<<<<<<<<<<<<<
+ *             return task
  * 
- *         # The variables stx, fx, gx contain the values of the step,
  */
-    __pyx_v_width1 = (__pyx_v_width / 0.5);
+    }
 
-    /* "_strong_wolfe_linesearch.pyx":372
+    /* "_strong_wolfe_linesearch.pyx":314
  *         # The variables stp, f, g contain the values of the step,
  *         # function, and derivative at stp.
- *         stx = 0             # <<<<<<<<<<<<<<
- *         fx = finit
- *         gx = ginit
+ *         st.brackt = False             # <<<<<<<<<<<<<<
+ *         st.stage = 1
+ *         st.finit = f
  */
-    __pyx_v_stx = 0.0;
+    __pyx_v_st->brackt = 0;
 
-    /* "_strong_wolfe_linesearch.pyx":373
+    /* "_strong_wolfe_linesearch.pyx":315
  *         # function, and derivative at stp.
- *         stx = 0
- *         fx = finit             # <<<<<<<<<<<<<<
- *         gx = ginit
- *         sty = 0
- */
-    __pyx_v_fx = __pyx_v_finit;
-
-    /* "_strong_wolfe_linesearch.pyx":374
- *         stx = 0
- *         fx = finit
- *         gx = ginit             # <<<<<<<<<<<<<<
- *         sty = 0
- *         fy = finit
- */
-    __pyx_v_gx = __pyx_v_ginit;
-
-    /* "_strong_wolfe_linesearch.pyx":375
- *         fx = finit
- *         gx = ginit
- *         sty = 0             # <<<<<<<<<<<<<<
- *         fy = finit
- *         gy = ginit
- */
-    __pyx_v_sty = 0.0;
-
-    /* "_strong_wolfe_linesearch.pyx":376
- *         gx = ginit
- *         sty = 0
- *         fy = finit             # <<<<<<<<<<<<<<
- *         gy = ginit
- *         stmin = 0
- */
-    __pyx_v_fy = __pyx_v_finit;
-
-    /* "_strong_wolfe_linesearch.pyx":377
- *         sty = 0
- *         fy = finit
- *         gy = ginit             # <<<<<<<<<<<<<<
- *         stmin = 0
- *         stmax = stp + xtrapu*stp
+ *         st.brackt = False
+ *         st.stage = 1             # <<<<<<<<<<<<<<
+ *         st.finit = f
+ *         st.ginit = g
+ */
+    __pyx_v_st->stage = 1;
+
+    /* "_strong_wolfe_linesearch.pyx":316
+ *         st.brackt = False
+ *         st.stage = 1
+ *         st.finit = f             # <<<<<<<<<<<<<<
+ *         st.ginit = g
+ *         st.gtest = ftol*g
+ */
+    __pyx_v_st->finit = __pyx_v_f;
+
+    /* "_strong_wolfe_linesearch.pyx":317
+ *         st.stage = 1
+ *         st.finit = f
+ *         st.ginit = g             # <<<<<<<<<<<<<<
+ *         st.gtest = ftol*g
+ *         st.width = stpmax - stpmin
+ */
+    __pyx_v_st->ginit = __pyx_v_g;
+
+    /* "_strong_wolfe_linesearch.pyx":318
+ *         st.finit = f
+ *         st.ginit = g
+ *         st.gtest = ftol*g             # <<<<<<<<<<<<<<
+ *         st.width = stpmax - stpmin
+ *         st.width1 = st.width/0.5
+ */
+    __pyx_v_st->gtest = (__pyx_v_ftol * __pyx_v_g);
+
+    /* "_strong_wolfe_linesearch.pyx":319
+ *         st.ginit = g
+ *         st.gtest = ftol*g
+ *         st.width = stpmax - stpmin             # <<<<<<<<<<<<<<
+ *         st.width1 = st.width/0.5
+ *         st.stx = 0
+ */
+    __pyx_v_st->width = (__pyx_v_stpmax - __pyx_v_stpmin);
+
+    /* "_strong_wolfe_linesearch.pyx":320
+ *         st.gtest = ftol*g
+ *         st.width = stpmax - stpmin
+ *         st.width1 = st.width/0.5             # <<<<<<<<<<<<<<
+ *         st.stx = 0
+ *         st.fx = f
+ */
+    __pyx_v_st->width1 = (__pyx_v_st->width / 0.5);
+
+    /* "_strong_wolfe_linesearch.pyx":321
+ *         st.width = stpmax - stpmin
+ *         st.width1 = st.width/0.5
+ *         st.stx = 0             # <<<<<<<<<<<<<<
+ *         st.fx = f
+ *         st.gx = g
+ */
+    __pyx_v_st->stx = 0.0;
+
+    /* "_strong_wolfe_linesearch.pyx":322
+ *         st.width1 = st.width/0.5
+ *         st.stx = 0
+ *         st.fx = f             # <<<<<<<<<<<<<<
+ *         st.gx = g
+ *         st.sty = 0
+ */
+    __pyx_v_st->fx = __pyx_v_f;
+
+    /* "_strong_wolfe_linesearch.pyx":323
+ *         st.stx = 0
+ *         st.fx = f
+ *         st.gx = g             # <<<<<<<<<<<<<<
+ *         st.sty = 0
+ *         st.fy = f
+ */
+    __pyx_v_st->gx = __pyx_v_g;
+
+    /* "_strong_wolfe_linesearch.pyx":324
+ *         st.fx = f
+ *         st.gx = g
+ *         st.sty = 0             # <<<<<<<<<<<<<<
+ *         st.fy = f
+ *         st.gy = g
+ */
+    __pyx_v_st->sty = 0.0;
+
+    /* "_strong_wolfe_linesearch.pyx":325
+ *         st.gx = g
+ *         st.sty = 0
+ *         st.fy = f             # <<<<<<<<<<<<<<
+ *         st.gy = g
+ *         st.stmin = 0
+ */
+    __pyx_v_st->fy = __pyx_v_f;
+
+    /* "_strong_wolfe_linesearch.pyx":326
+ *         st.sty = 0
+ *         st.fy = f
+ *         st.gy = g             # <<<<<<<<<<<<<<
+ *         st.stmin = 0
+ *         st.stmax = stp + xtrapu*stp
+ */
+    __pyx_v_st->gy = __pyx_v_g;
+
+    /* "_strong_wolfe_linesearch.pyx":327
+ *         st.fy = f
+ *         st.gy = g
+ *         st.stmin = 0             # <<<<<<<<<<<<<<
+ *         st.stmax = stp + xtrapu*stp
+ *         return FG
+ */
+    __pyx_v_st->stmin = 0.0;
+
+    /* "_strong_wolfe_linesearch.pyx":328
+ *         st.gy = g
+ *         st.stmin = 0
+ *         st.stmax = stp + xtrapu*stp             # <<<<<<<<<<<<<<
+ *         return FG
+ * 
  */
-    __pyx_v_gy = __pyx_v_ginit;
-
-    /* "_strong_wolfe_linesearch.pyx":378
- *         fy = finit
- *         gy = ginit
- *         stmin = 0             # <<<<<<<<<<<<<<
- *         stmax = stp + xtrapu*stp
- *         task = 'FG'
- */
-    __pyx_v_stmin = 0.0;
-
-    /* "_strong_wolfe_linesearch.pyx":379
- *         gy = ginit
- *         stmin = 0
- *         stmax = stp + xtrapu*stp             # <<<<<<<<<<<<<<
- *         task = 'FG'
- * 
- */
-    __pyx_v_stmax = (__pyx_v_stp + (__pyx_v_xtrapu * __pyx_v_stp));
-
-    /* "_strong_wolfe_linesearch.pyx":380
- *         stmin = 0
- *         stmax = stp + xtrapu*stp
- *         task = 'FG'             # <<<<<<<<<<<<<<
- * 
- *         # Save local variables.
+    __pyx_v_st->stmax = (__pyx_v_stp + (__pyx_v_xtrapu * __pyx_v_stp));
+
+    /* "_strong_wolfe_linesearch.pyx":329
+ *         st.stmin = 0
+ *         st.stmax = stp + xtrapu*stp
+ *         return FG             # <<<<<<<<<<<<<<
+ * 
+ *     # Restore local variables.
  */
-    __Pyx_INCREF(__pyx_n_s_FG);
-    __Pyx_DECREF_SET(__pyx_v_task, __pyx_n_s_FG);
+    __pyx_r = __pyx_e_24_strong_wolfe_linesearch_FG;
+    goto __pyx_L0;
 
-    /* "_strong_wolfe_linesearch.pyx":383
+    /* "_strong_wolfe_linesearch.pyx":291
  * 
- *         # Save local variables.
- *         save_local_variables(brackt, <int *> cnp.PyArray_DATA(isave), <double *> cnp.PyArray_DATA(dsave), stage, ginit, gtest, gx, gy,             # <<<<<<<<<<<<<<
- *                              finit, fx, fy, stx, sty, stmin, stmax, width, width1)
- *         return stp, task, isave, dsave
- */
-    __pyx_t_4 = __pyx_f_24_strong_wolfe_linesearch_save_local_variables(__pyx_v_brackt, ((int *)PyArray_DATA(((PyArrayObject *)__pyx_v_isave))), ((double *)PyArray_DATA(((PyArrayObject *)__pyx_v_dsave))), __pyx_v_stage, __pyx_v_ginit, __pyx_v_gtest, __pyx_v_gx, __pyx_v_gy, __pyx_v_finit, __pyx_v_fx, __pyx_v_fy, __pyx_v_stx, __pyx_v_sty, __pyx_v_stmin, __pyx_v_stmax, __pyx_v_width, __pyx_v_width1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 383; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-    /* "_strong_wolfe_linesearch.pyx":385
- *         save_local_variables(brackt, <int *> cnp.PyArray_DATA(isave), <double *> cnp.PyArray_DATA(dsave), stage, ginit, gtest, gx, gy,
- *                              finit, fx, fy, stx, sty, stmin, stmax, width, width1)
- *         return stp, task, isave, dsave             # <<<<<<<<<<<<<<
- *         # return stp, f, g, task, isave, dsave
+ *     # Initialization block.
+ *     if task == START:             # <<<<<<<<<<<<<<
  * 
+ *         # Check the input arguments for errors.
  */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_stp); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 385; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_1 = PyTuple_New(4); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 385; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_4);
-    __Pyx_GIVEREF(__pyx_t_4);
-    __Pyx_INCREF(__pyx_v_task);
-    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_task);
-    __Pyx_GIVEREF(__pyx_v_task);
-    __Pyx_INCREF(((PyObject *)__pyx_v_isave));
-    PyTuple_SET_ITEM(__pyx_t_1, 2, ((PyObject *)__pyx_v_isave));
-    __Pyx_GIVEREF(((PyObject *)__pyx_v_isave));
-    __Pyx_INCREF(((PyObject *)__pyx_v_dsave));
-    PyTuple_SET_ITEM(__pyx_t_1, 3, ((PyObject *)__pyx_v_dsave));
-    __Pyx_GIVEREF(((PyObject *)__pyx_v_dsave));
-    __pyx_t_4 = 0;
-    __pyx_r = __pyx_t_1;
-    __pyx_t_1 = 0;
-    goto __pyx_L0;
   }
-  /*else*/ {
 
-    /* "_strong_wolfe_linesearch.pyx":391
+  /* "_strong_wolfe_linesearch.pyx":332
  * 
- *         # Restore local variables.
- *         if isave[0] == 1:             # <<<<<<<<<<<<<<
- *             brackt = True
- *         else:
- */
-    __pyx_t_5 = 0;
-    if (__pyx_t_5 < 0) __pyx_t_5 += __pyx_pybuffernd_isave.diminfo[0].shape;
-    __pyx_t_2 = (((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_int32_t *, __pyx_pybuffernd_isave.rcbuffer->pybuffer.buf, __pyx_t_5, __pyx_pybuffernd_isave.diminfo[0].strides)) == 1) != 0);
-    if (__pyx_t_2) {
-
-      /* "_strong_wolfe_linesearch.pyx":392
- *         # Restore local variables.
- *         if isave[0] == 1:
- *             brackt = True             # <<<<<<<<<<<<<<
- *         else:
- *             brackt = False
- */
-      __pyx_v_brackt = 1;
-      goto __pyx_L13;
-    }
-    /*else*/ {
-
-      /* "_strong_wolfe_linesearch.pyx":394
- *             brackt = True
- *         else:
- *             brackt = False             # <<<<<<<<<<<<<<
- *         stage = isave[1]
- *         ginit = dsave[0]
- */
-      __pyx_v_brackt = 0;
-    }
-    __pyx_L13:;
-
-    /* "_strong_wolfe_linesearch.pyx":395
- *         else:
- *             brackt = False
- *         stage = isave[1]             # <<<<<<<<<<<<<<
- *         ginit = dsave[0]
- *         gtest = dsave[1]
- */
-    __pyx_t_6 = 1;
-    if (__pyx_t_6 < 0) __pyx_t_6 += __pyx_pybuffernd_isave.diminfo[0].shape;
-    __pyx_v_stage = (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_int32_t *, __pyx_pybuffernd_isave.rcbuffer->pybuffer.buf, __pyx_t_6, __pyx_pybuffernd_isave.diminfo[0].strides));
-
-    /* "_strong_wolfe_linesearch.pyx":396
- *             brackt = False
- *         stage = isave[1]
- *         ginit = dsave[0]             # <<<<<<<<<<<<<<
- *         gtest = dsave[1]
- *         gx = dsave[2]
- */
-    __pyx_t_7 = 0;
-    if (__pyx_t_7 < 0) __pyx_t_7 += __pyx_pybuffernd_dsave.diminfo[0].shape;
-    __pyx_v_ginit = (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_dsave.rcbuffer->pybuffer.buf, __pyx_t_7, __pyx_pybuffernd_dsave.diminfo[0].strides));
-
-    /* "_strong_wolfe_linesearch.pyx":397
- *         stage = isave[1]
- *         ginit = dsave[0]
- *         gtest = dsave[1]             # <<<<<<<<<<<<<<
- *         gx = dsave[2]
- *         gy = dsave[3]
- */
-    __pyx_t_8 = 1;
-    if (__pyx_t_8 < 0) __pyx_t_8 += __pyx_pybuffernd_dsave.diminfo[0].shape;
-    __pyx_v_gtest = (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_dsave.rcbuffer->pybuffer.buf, __pyx_t_8, __pyx_pybuffernd_dsave.diminfo[0].strides));
-
-    /* "_strong_wolfe_linesearch.pyx":398
- *         ginit = dsave[0]
- *         gtest = dsave[1]
- *         gx = dsave[2]             # <<<<<<<<<<<<<<
- *         gy = dsave[3]
- *         finit = dsave[4]
- */
-    __pyx_t_9 = 2;
-    if (__pyx_t_9 < 0) __pyx_t_9 += __pyx_pybuffernd_dsave.diminfo[0].shape;
-    __pyx_v_gx = (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_dsave.rcbuffer->pybuffer.buf, __pyx_t_9, __pyx_pybuffernd_dsave.diminfo[0].strides));
-
-    /* "_strong_wolfe_linesearch.pyx":399
- *         gtest = dsave[1]
- *         gx = dsave[2]
- *         gy = dsave[3]             # <<<<<<<<<<<<<<
- *         finit = dsave[4]
- *         fx = dsave[5]
- */
-    __pyx_t_10 = 3;
-    if (__pyx_t_10 < 0) __pyx_t_10 += __pyx_pybuffernd_dsave.diminfo[0].shape;
-    __pyx_v_gy = (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_dsave.rcbuffer->pybuffer.buf, __pyx_t_10, __pyx_pybuffernd_dsave.diminfo[0].strides));
-
-    /* "_strong_wolfe_linesearch.pyx":400
- *         gx = dsave[2]
- *         gy = dsave[3]
- *         finit = dsave[4]             # <<<<<<<<<<<<<<
- *         fx = dsave[5]
- *         fy = dsave[6]
- */
-    __pyx_t_11 = 4;
-    if (__pyx_t_11 < 0) __pyx_t_11 += __pyx_pybuffernd_dsave.diminfo[0].shape;
-    __pyx_v_finit = (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_dsave.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_dsave.diminfo[0].strides));
-
-    /* "_strong_wolfe_linesearch.pyx":401
- *         gy = dsave[3]
- *         finit = dsave[4]
- *         fx = dsave[5]             # <<<<<<<<<<<<<<
- *         fy = dsave[6]
- *         stx = dsave[7]
- */
-    __pyx_t_12 = 5;
-    if (__pyx_t_12 < 0) __pyx_t_12 += __pyx_pybuffernd_dsave.diminfo[0].shape;
-    __pyx_v_fx = (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_dsave.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_dsave.diminfo[0].strides));
-
-    /* "_strong_wolfe_linesearch.pyx":402
- *         finit = dsave[4]
- *         fx = dsave[5]
- *         fy = dsave[6]             # <<<<<<<<<<<<<<
- *         stx = dsave[7]
- *         sty = dsave[8]
- */
-    __pyx_t_13 = 6;
-    if (__pyx_t_13 < 0) __pyx_t_13 += __pyx_pybuffernd_dsave.diminfo[0].shape;
-    __pyx_v_fy = (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_dsave.rcbuffer->pybuffer.buf, __pyx_t_13, __pyx_pybuffernd_dsave.diminfo[0].strides));
-
-    /* "_strong_wolfe_linesearch.pyx":403
- *         fx = dsave[5]
- *         fy = dsave[6]
- *         stx = dsave[7]             # <<<<<<<<<<<<<<
- *         sty = dsave[8]
- *         stmin = dsave[9]
- */
-    __pyx_t_14 = 7;
-    if (__pyx_t_14 < 0) __pyx_t_14 += __pyx_pybuffernd_dsave.diminfo[0].shape;
-    __pyx_v_stx = (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_dsave.rcbuffer->pybuffer.buf, __pyx_t_14, __pyx_pybuffernd_dsave.diminfo[0].strides));
-
-    /* "_strong_wolfe_linesearch.pyx":404
- *         fy = dsave[6]
- *         stx = dsave[7]
- *         sty = dsave[8]             # <<<<<<<<<<<<<<
- *         stmin = dsave[9]
- *         stmax = dsave[10]
- */
-    __pyx_t_15 = 8;
-    if (__pyx_t_15 < 0) __pyx_t_15 += __pyx_pybuffernd_dsave.diminfo[0].shape;
-    __pyx_v_sty = (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_dsave.rcbuffer->pybuffer.buf, __pyx_t_15, __pyx_pybuffernd_dsave.diminfo[0].strides));
-
-    /* "_strong_wolfe_linesearch.pyx":405
- *         stx = dsave[7]
- *         sty = dsave[8]
- *         stmin = dsave[9]             # <<<<<<<<<<<<<<
- *         stmax = dsave[10]
- *         width = dsave[11]
- */
-    __pyx_t_16 = 9;
-    if (__pyx_t_16 < 0) __pyx_t_16 += __pyx_pybuffernd_dsave.diminfo[0].shape;
-    __pyx_v_stmin = (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_dsave.rcbuffer->pybuffer.buf, __pyx_t_16, __pyx_pybuffernd_dsave.diminfo[0].strides));
-
-    /* "_strong_wolfe_linesearch.pyx":406
- *         sty = dsave[8]
- *         stmin = dsave[9]
- *         stmax = dsave[10]             # <<<<<<<<<<<<<<
- *         width = dsave[11]
- *         width1 = dsave[12]
+ *     # Restore local variables.
+ *     brackt = st.brackt             # <<<<<<<<<<<<<<
+ *     stage = st.stage
+ *     ginit = st.ginit
  */
-    __pyx_t_17 = 10;
-    if (__pyx_t_17 < 0) __pyx_t_17 += __pyx_pybuffernd_dsave.diminfo[0].shape;
-    __pyx_v_stmax = (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_dsave.rcbuffer->pybuffer.buf, __pyx_t_17, __pyx_pybuffernd_dsave.diminfo[0].strides));
+  __pyx_t_1 = __pyx_v_st->brackt;
+  __pyx_v_brackt = __pyx_t_1;
 
-    /* "_strong_wolfe_linesearch.pyx":407
- *         stmin = dsave[9]
- *         stmax = dsave[10]
- *         width = dsave[11]             # <<<<<<<<<<<<<<
- *         width1 = dsave[12]
- * 
- */
-    __pyx_t_18 = 11;
-    if (__pyx_t_18 < 0) __pyx_t_18 += __pyx_pybuffernd_dsave.diminfo[0].shape;
-    __pyx_v_width = (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_dsave.rcbuffer->pybuffer.buf, __pyx_t_18, __pyx_pybuffernd_dsave.diminfo[0].strides));
+  /* "_strong_wolfe_linesearch.pyx":333
+ *     # Restore local variables.
+ *     brackt = st.brackt
+ *     stage = st.stage             # <<<<<<<<<<<<<<
+ *     ginit = st.ginit
+ *     gtest = st.gtest
+ */
+  __pyx_t_2 = __pyx_v_st->stage;
+  __pyx_v_stage = __pyx_t_2;
+
+  /* "_strong_wolfe_linesearch.pyx":334
+ *     brackt = st.brackt
+ *     stage = st.stage
+ *     ginit = st.ginit             # <<<<<<<<<<<<<<
+ *     gtest = st.gtest
+ *     gx = st.gx
+ */
+  __pyx_t_3 = __pyx_v_st->ginit;
+  __pyx_v_ginit = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":335
+ *     stage = st.stage
+ *     ginit = st.ginit
+ *     gtest = st.gtest             # <<<<<<<<<<<<<<
+ *     gx = st.gx
+ *     gy = st.gy
+ */
+  __pyx_t_3 = __pyx_v_st->gtest;
+  __pyx_v_gtest = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":336
+ *     ginit = st.ginit
+ *     gtest = st.gtest
+ *     gx = st.gx             # <<<<<<<<<<<<<<
+ *     gy = st.gy
+ *     finit = st.finit
+ */
+  __pyx_t_3 = __pyx_v_st->gx;
+  __pyx_v_gx = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":337
+ *     gtest = st.gtest
+ *     gx = st.gx
+ *     gy = st.gy             # <<<<<<<<<<<<<<
+ *     finit = st.finit
+ *     fx = st.fx
+ */
+  __pyx_t_3 = __pyx_v_st->gy;
+  __pyx_v_gy = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":338
+ *     gx = st.gx
+ *     gy = st.gy
+ *     finit = st.finit             # <<<<<<<<<<<<<<
+ *     fx = st.fx
+ *     fy = st.fy
+ */
+  __pyx_t_3 = __pyx_v_st->finit;
+  __pyx_v_finit = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":339
+ *     gy = st.gy
+ *     finit = st.finit
+ *     fx = st.fx             # <<<<<<<<<<<<<<
+ *     fy = st.fy
+ *     stx = st.stx
+ */
+  __pyx_t_3 = __pyx_v_st->fx;
+  __pyx_v_fx = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":340
+ *     finit = st.finit
+ *     fx = st.fx
+ *     fy = st.fy             # <<<<<<<<<<<<<<
+ *     stx = st.stx
+ *     sty = st.sty
+ */
+  __pyx_t_3 = __pyx_v_st->fy;
+  __pyx_v_fy = __pyx_t_3;
 
-    /* "_strong_wolfe_linesearch.pyx":408
- *         stmax = dsave[10]
- *         width = dsave[11]
- *         width1 = dsave[12]             # <<<<<<<<<<<<<<
+  /* "_strong_wolfe_linesearch.pyx":341
+ *     fx = st.fx
+ *     fy = st.fy
+ *     stx = st.stx             # <<<<<<<<<<<<<<
+ *     sty = st.sty
+ *     stmin = st.stmin
+ */
+  __pyx_t_3 = __pyx_v_st->stx;
+  __pyx_v_stx = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":342
+ *     fy = st.fy
+ *     stx = st.stx
+ *     sty = st.sty             # <<<<<<<<<<<<<<
+ *     stmin = st.stmin
+ *     stmax = st.stmax
+ */
+  __pyx_t_3 = __pyx_v_st->sty;
+  __pyx_v_sty = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":343
+ *     stx = st.stx
+ *     sty = st.sty
+ *     stmin = st.stmin             # <<<<<<<<<<<<<<
+ *     stmax = st.stmax
+ *     width = st.width
+ */
+  __pyx_t_3 = __pyx_v_st->stmin;
+  __pyx_v_stmin = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":344
+ *     sty = st.sty
+ *     stmin = st.stmin
+ *     stmax = st.stmax             # <<<<<<<<<<<<<<
+ *     width = st.width
+ *     width1 = st.width1
+ */
+  __pyx_t_3 = __pyx_v_st->stmax;
+  __pyx_v_stmax = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":345
+ *     stmin = st.stmin
+ *     stmax = st.stmax
+ *     width = st.width             # <<<<<<<<<<<<<<
+ *     width1 = st.width1
+ * 
+ */
+  __pyx_t_3 = __pyx_v_st->width;
+  __pyx_v_width = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":346
+ *     stmax = st.stmax
+ *     width = st.width
+ *     width1 = st.width1             # <<<<<<<<<<<<<<
  * 
  *     # If psi(stp) <= 0 and f'(stp) >= 0 for some step, then the
  */
-    __pyx_t_19 = 12;
-    if (__pyx_t_19 < 0) __pyx_t_19 += __pyx_pybuffernd_dsave.diminfo[0].shape;
-    __pyx_v_width1 = (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_dsave.rcbuffer->pybuffer.buf, __pyx_t_19, __pyx_pybuffernd_dsave.diminfo[0].strides));
-  }
+  __pyx_t_3 = __pyx_v_st->width1;
+  __pyx_v_width1 = __pyx_t_3;
 
-  /* "_strong_wolfe_linesearch.pyx":413
+  /* "_strong_wolfe_linesearch.pyx":351
  *     # algorithm enters the second stage.
  * 
  *     ftest = finit + stp*gtest             # <<<<<<<<<<<<<<
@@ -3153,306 +3011,305 @@ static PyObject *__pyx_pf_24_strong_wolfe_linesearch_dcsrch(CYTHON_UNUSED PyObje
  */
   __pyx_v_ftest = (__pyx_v_finit + (__pyx_v_stp * __pyx_v_gtest));
 
-  /* "_strong_wolfe_linesearch.pyx":414
+  /* "_strong_wolfe_linesearch.pyx":352
  * 
  *     ftest = finit + stp*gtest
  *     if stage == 1 and f <= ftest and g >= 0: stage = 2             # <<<<<<<<<<<<<<
  * 
  *     # Test for warnings.
  */
-  __pyx_t_3 = ((__pyx_v_stage == 1) != 0);
-  if (__pyx_t_3) {
+  __pyx_t_4 = ((__pyx_v_stage == 1) != 0);
+  if (__pyx_t_4) {
   } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L15_bool_binop_done;
+    __pyx_t_1 = __pyx_t_4;
+    goto __pyx_L14_bool_binop_done;
   }
-  __pyx_t_3 = ((__pyx_v_f <= __pyx_v_ftest) != 0);
-  if (__pyx_t_3) {
+  __pyx_t_4 = ((__pyx_v_f <= __pyx_v_ftest) != 0);
+  if (__pyx_t_4) {
   } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L15_bool_binop_done;
+    __pyx_t_1 = __pyx_t_4;
+    goto __pyx_L14_bool_binop_done;
   }
-  __pyx_t_3 = ((__pyx_v_g >= 0.0) != 0);
-  __pyx_t_2 = __pyx_t_3;
-  __pyx_L15_bool_binop_done:;
-  if (__pyx_t_2) {
+  __pyx_t_4 = ((__pyx_v_g >= 0.0) != 0);
+  __pyx_t_1 = __pyx_t_4;
+  __pyx_L14_bool_binop_done:;
+  if (__pyx_t_1) {
     __pyx_v_stage = 2;
-    goto __pyx_L14;
   }
-  __pyx_L14:;
 
-  /* "_strong_wolfe_linesearch.pyx":417
+  /* "_strong_wolfe_linesearch.pyx":355
  * 
  *     # Test for warnings.
  *     if brackt and (stp <= stmin or stp >= stmax):             # <<<<<<<<<<<<<<
- *         task = 'WARNING: ROUNDING ERRORS PREVENT PROGRESS'
+ *         task = WARNING_ROUNDING
  *     if brackt and stmax-stmin <= xtol*stmax:
  */
-  __pyx_t_3 = (__pyx_v_brackt != 0);
-  if (__pyx_t_3) {
+  __pyx_t_4 = (__pyx_v_brackt != 0);
+  if (__pyx_t_4) {
   } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L19_bool_binop_done;
+    __pyx_t_1 = __pyx_t_4;
+    goto __pyx_L18_bool_binop_done;
   }
-  __pyx_t_3 = ((__pyx_v_stp <= __pyx_v_stmin) != 0);
-  if (!__pyx_t_3) {
+  __pyx_t_4 = ((__pyx_v_stp <= __pyx_v_stmin) != 0);
+  if (!__pyx_t_4) {
   } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L19_bool_binop_done;
+    __pyx_t_1 = __pyx_t_4;
+    goto __pyx_L18_bool_binop_done;
   }
-  __pyx_t_3 = ((__pyx_v_stp >= __pyx_v_stmax) != 0);
-  __pyx_t_2 = __pyx_t_3;
-  __pyx_L19_bool_binop_done:;
-  if (__pyx_t_2) {
+  __pyx_t_4 = ((__pyx_v_stp >= __pyx_v_stmax) != 0);
+  __pyx_t_1 = __pyx_t_4;
+  __pyx_L18_bool_binop_done:;
+  if (__pyx_t_1) {
 
-    /* "_strong_wolfe_linesearch.pyx":418
+    /* "_strong_wolfe_linesearch.pyx":356
  *     # Test for warnings.
  *     if brackt and (stp <= stmin or stp >= stmax):
- *         task = 'WARNING: ROUNDING ERRORS PREVENT PROGRESS'             # <<<<<<<<<<<<<<
+ *         task = WARNING_ROUNDING             # <<<<<<<<<<<<<<
+ *     if brackt and stmax-stmin <= xtol*stmax:
+ *         task = WARNING_XTOL
+ */
+    __pyx_v_task = __pyx_e_24_strong_wolfe_linesearch_WARNING_ROUNDING;
+
+    /* "_strong_wolfe_linesearch.pyx":355
+ * 
+ *     # Test for warnings.
+ *     if brackt and (stp <= stmin or stp >= stmax):             # <<<<<<<<<<<<<<
+ *         task = WARNING_ROUNDING
  *     if brackt and stmax-stmin <= xtol*stmax:
- *         task = 'WARNING: XTOL TEST SATISFIED'
  */
-    __Pyx_INCREF(__pyx_kp_s_WARNING_ROUNDING_ERRORS_PREVENT);
-    __Pyx_DECREF_SET(__pyx_v_task, __pyx_kp_s_WARNING_ROUNDING_ERRORS_PREVENT);
-    goto __pyx_L18;
   }
-  __pyx_L18:;
 
-  /* "_strong_wolfe_linesearch.pyx":419
+  /* "_strong_wolfe_linesearch.pyx":357
  *     if brackt and (stp <= stmin or stp >= stmax):
- *         task = 'WARNING: ROUNDING ERRORS PREVENT PROGRESS'
+ *         task = WARNING_ROUNDING
  *     if brackt and stmax-stmin <= xtol*stmax:             # <<<<<<<<<<<<<<
- *         task = 'WARNING: XTOL TEST SATISFIED'
+ *         task = WARNING_XTOL
  *     if stp == stpmax and f <= ftest and g <= gtest:
  */
-  __pyx_t_3 = (__pyx_v_brackt != 0);
-  if (__pyx_t_3) {
+  __pyx_t_4 = (__pyx_v_brackt != 0);
+  if (__pyx_t_4) {
   } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L23_bool_binop_done;
+    __pyx_t_1 = __pyx_t_4;
+    goto __pyx_L22_bool_binop_done;
   }
-  __pyx_t_3 = (((__pyx_v_stmax - __pyx_v_stmin) <= (__pyx_v_xtol * __pyx_v_stmax)) != 0);
-  __pyx_t_2 = __pyx_t_3;
-  __pyx_L23_bool_binop_done:;
-  if (__pyx_t_2) {
+  __pyx_t_4 = (((__pyx_v_stmax - __pyx_v_stmin) <= (__pyx_v_xtol * __pyx_v_stmax)) != 0);
+  __pyx_t_1 = __pyx_t_4;
+  __pyx_L22_bool_binop_done:;
+  if (__pyx_t_1) {
 
-    /* "_strong_wolfe_linesearch.pyx":420
- *         task = 'WARNING: ROUNDING ERRORS PREVENT PROGRESS'
+    /* "_strong_wolfe_linesearch.pyx":358
+ *         task = WARNING_ROUNDING
  *     if brackt and stmax-stmin <= xtol*stmax:
- *         task = 'WARNING: XTOL TEST SATISFIED'             # <<<<<<<<<<<<<<
+ *         task = WARNING_XTOL             # <<<<<<<<<<<<<<
+ *     if stp == stpmax and f <= ftest and g <= gtest:
+ *         task = WARNING_STPMAX
+ */
+    __pyx_v_task = __pyx_e_24_strong_wolfe_linesearch_WARNING_XTOL;
+
+    /* "_strong_wolfe_linesearch.pyx":357
+ *     if brackt and (stp <= stmin or stp >= stmax):
+ *         task = WARNING_ROUNDING
+ *     if brackt and stmax-stmin <= xtol*stmax:             # <<<<<<<<<<<<<<
+ *         task = WARNING_XTOL
  *     if stp == stpmax and f <= ftest and g <= gtest:
- *         task = 'WARNING: STP = STPMAX'
  */
-    __Pyx_INCREF(__pyx_kp_s_WARNING_XTOL_TEST_SATISFIED);
-    __Pyx_DECREF_SET(__pyx_v_task, __pyx_kp_s_WARNING_XTOL_TEST_SATISFIED);
-    goto __pyx_L22;
   }
-  __pyx_L22:;
 
-  /* "_strong_wolfe_linesearch.pyx":421
+  /* "_strong_wolfe_linesearch.pyx":359
  *     if brackt and stmax-stmin <= xtol*stmax:
- *         task = 'WARNING: XTOL TEST SATISFIED'
+ *         task = WARNING_XTOL
  *     if stp == stpmax and f <= ftest and g <= gtest:             # <<<<<<<<<<<<<<
- *         task = 'WARNING: STP = STPMAX'
+ *         task = WARNING_STPMAX
  *     if stp == stpmin and (f > ftest or g >= gtest):
  */
-  __pyx_t_3 = ((__pyx_v_stp == __pyx_v_stpmax) != 0);
-  if (__pyx_t_3) {
+  __pyx_t_4 = ((__pyx_v_stp == __pyx_v_stpmax) != 0);
+  if (__pyx_t_4) {
   } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L26_bool_binop_done;
+    __pyx_t_1 = __pyx_t_4;
+    goto __pyx_L25_bool_binop_done;
   }
-  __pyx_t_3 = ((__pyx_v_f <= __pyx_v_ftest) != 0);
-  if (__pyx_t_3) {
+  __pyx_t_4 = ((__pyx_v_f <= __pyx_v_ftest) != 0);
+  if (__pyx_t_4) {
   } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L26_bool_binop_done;
+    __pyx_t_1 = __pyx_t_4;
+    goto __pyx_L25_bool_binop_done;
   }
-  __pyx_t_3 = ((__pyx_v_g <= __pyx_v_gtest) != 0);
-  __pyx_t_2 = __pyx_t_3;
-  __pyx_L26_bool_binop_done:;
-  if (__pyx_t_2) {
+  __pyx_t_4 = ((__pyx_v_g <= __pyx_v_gtest) != 0);
+  __pyx_t_1 = __pyx_t_4;
+  __pyx_L25_bool_binop_done:;
+  if (__pyx_t_1) {
 
-    /* "_strong_wolfe_linesearch.pyx":422
- *         task = 'WARNING: XTOL TEST SATISFIED'
+    /* "_strong_wolfe_linesearch.pyx":360
+ *         task = WARNING_XTOL
  *     if stp == stpmax and f <= ftest and g <= gtest:
- *         task = 'WARNING: STP = STPMAX'             # <<<<<<<<<<<<<<
+ *         task = WARNING_STPMAX             # <<<<<<<<<<<<<<
+ *     if stp == stpmin and (f > ftest or g >= gtest):
+ *         task = WARNING_STPMIN
+ */
+    __pyx_v_task = __pyx_e_24_strong_wolfe_linesearch_WARNING_STPMAX;
+
+    /* "_strong_wolfe_linesearch.pyx":359
+ *     if brackt and stmax-stmin <= xtol*stmax:
+ *         task = WARNING_XTOL
+ *     if stp == stpmax and f <= ftest and g <= gtest:             # <<<<<<<<<<<<<<
+ *         task = WARNING_STPMAX
  *     if stp == stpmin and (f > ftest or g >= gtest):
- *         task = 'WARNING: STP = STPMIN'
  */
-    __Pyx_INCREF(__pyx_kp_s_WARNING_STP_STPMAX);
-    __Pyx_DECREF_SET(__pyx_v_task, __pyx_kp_s_WARNING_STP_STPMAX);
-    goto __pyx_L25;
   }
-  __pyx_L25:;
 
-  /* "_strong_wolfe_linesearch.pyx":423
+  /* "_strong_wolfe_linesearch.pyx":361
  *     if stp == stpmax and f <= ftest and g <= gtest:
- *         task = 'WARNING: STP = STPMAX'
+ *         task = WARNING_STPMAX
  *     if stp == stpmin and (f > ftest or g >= gtest):             # <<<<<<<<<<<<<<
- *         task = 'WARNING: STP = STPMIN'
+ *         task = WARNING_STPMIN
  * 
  */
-  __pyx_t_3 = ((__pyx_v_stp == __pyx_v_stpmin) != 0);
-  if (__pyx_t_3) {
+  __pyx_t_4 = ((__pyx_v_stp == __pyx_v_stpmin) != 0);
+  if (__pyx_t_4) {
   } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L30_bool_binop_done;
+    __pyx_t_1 = __pyx_t_4;
+    goto __pyx_L29_bool_binop_done;
   }
-  __pyx_t_3 = ((__pyx_v_f > __pyx_v_ftest) != 0);
-  if (!__pyx_t_3) {
+  __pyx_t_4 = ((__pyx_v_f > __pyx_v_ftest) != 0);
+  if (!__pyx_t_4) {
   } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L30_bool_binop_done;
+    __pyx_t_1 = __pyx_t_4;
+    goto __pyx_L29_bool_binop_done;
   }
-  __pyx_t_3 = ((__pyx_v_g >= __pyx_v_gtest) != 0);
-  __pyx_t_2 = __pyx_t_3;
-  __pyx_L30_bool_binop_done:;
-  if (__pyx_t_2) {
+  __pyx_t_4 = ((__pyx_v_g >= __pyx_v_gtest) != 0);
+  __pyx_t_1 = __pyx_t_4;
+  __pyx_L29_bool_binop_done:;
+  if (__pyx_t_1) {
 
-    /* "_strong_wolfe_linesearch.pyx":424
- *         task = 'WARNING: STP = STPMAX'
+    /* "_strong_wolfe_linesearch.pyx":362
+ *         task = WARNING_STPMAX
  *     if stp == stpmin and (f > ftest or g >= gtest):
- *         task = 'WARNING: STP = STPMIN'             # <<<<<<<<<<<<<<
+ *         task = WARNING_STPMIN             # <<<<<<<<<<<<<<
  * 
  *     # Test for convergence.
  */
-    __Pyx_INCREF(__pyx_kp_s_WARNING_STP_STPMIN);
-    __Pyx_DECREF_SET(__pyx_v_task, __pyx_kp_s_WARNING_STP_STPMIN);
-    goto __pyx_L29;
+    __pyx_v_task = __pyx_e_24_strong_wolfe_linesearch_WARNING_STPMIN;
+
+    /* "_strong_wolfe_linesearch.pyx":361
+ *     if stp == stpmax and f <= ftest and g <= gtest:
+ *         task = WARNING_STPMAX
+ *     if stp == stpmin and (f > ftest or g >= gtest):             # <<<<<<<<<<<<<<
+ *         task = WARNING_STPMIN
+ * 
+ */
   }
-  __pyx_L29:;
 
-  /* "_strong_wolfe_linesearch.pyx":427
+  /* "_strong_wolfe_linesearch.pyx":365
  * 
  *     # Test for convergence.
- *     if f <= ftest and abs(g) <= gtol*(-ginit):             # <<<<<<<<<<<<<<
- *         task = 'CONVERGENCE'
+ *     if f <= ftest and fabs(g) <= gtol*(-ginit):             # <<<<<<<<<<<<<<
+ *         task = CONVERGENCE
  * 
  */
-  __pyx_t_3 = ((__pyx_v_f <= __pyx_v_ftest) != 0);
-  if (__pyx_t_3) {
+  __pyx_t_4 = ((__pyx_v_f <= __pyx_v_ftest) != 0);
+  if (__pyx_t_4) {
   } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L34_bool_binop_done;
+    __pyx_t_1 = __pyx_t_4;
+    goto __pyx_L33_bool_binop_done;
   }
-  __pyx_t_3 = ((fabs(__pyx_v_g) <= (__pyx_v_gtol * (-__pyx_v_ginit))) != 0);
-  __pyx_t_2 = __pyx_t_3;
-  __pyx_L34_bool_binop_done:;
-  if (__pyx_t_2) {
+  __pyx_t_4 = ((fabs(__pyx_v_g) <= (__pyx_v_gtol * (-__pyx_v_ginit))) != 0);
+  __pyx_t_1 = __pyx_t_4;
+  __pyx_L33_bool_binop_done:;
+  if (__pyx_t_1) {
 
-    /* "_strong_wolfe_linesearch.pyx":428
+    /* "_strong_wolfe_linesearch.pyx":366
  *     # Test for convergence.
- *     if f <= ftest and abs(g) <= gtol*(-ginit):
- *         task = 'CONVERGENCE'             # <<<<<<<<<<<<<<
+ *     if f <= ftest and fabs(g) <= gtol*(-ginit):
+ *         task = CONVERGENCE             # <<<<<<<<<<<<<<
  * 
  *     # Test for termination.
  */
-    __Pyx_INCREF(__pyx_n_s_CONVERGENCE);
-    __Pyx_DECREF_SET(__pyx_v_task, __pyx_n_s_CONVERGENCE);
-    goto __pyx_L33;
+    __pyx_v_task = __pyx_e_24_strong_wolfe_linesearch_CONVERGENCE;
+
+    /* "_strong_wolfe_linesearch.pyx":365
+ * 
+ *     # Test for convergence.
+ *     if f <= ftest and fabs(g) <= gtol*(-ginit):             # <<<<<<<<<<<<<<
+ *         task = CONVERGENCE
+ * 
+ */
   }
-  __pyx_L33:;
 
-  /* "_strong_wolfe_linesearch.pyx":431
+  /* "_strong_wolfe_linesearch.pyx":369
  * 
  *     # Test for termination.
- *     if task[0:4] == 'WARN' or task[0:4] == 'CONV':             # <<<<<<<<<<<<<<
- *         # Save local variables.
- *         save_local_variables(brackt, <int *> cnp.PyArray_DATA(isave), <double *> cnp.PyArray_DATA(dsave), stage, ginit, gtest, gx, gy,
+ *     if task == CONVERGENCE or WARNING_ROUNDING <= task <= WARNING_STPMIN:             # <<<<<<<<<<<<<<
+ *         st.stage = stage
+ *         return task
  */
-  if (unlikely(__pyx_v_task == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 431; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_t_1 = PySequence_GetSlice(__pyx_v_task, 0, 4); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 431; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = (__Pyx_PyString_Equals(__pyx_t_1, __pyx_n_s_WARN, Py_EQ)); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 431; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_20 = (__pyx_t_3 != 0);
-  if (!__pyx_t_20) {
+  __pyx_t_4 = ((__pyx_v_task == __pyx_e_24_strong_wolfe_linesearch_CONVERGENCE) != 0);
+  if (!__pyx_t_4) {
   } else {
-    __pyx_t_2 = __pyx_t_20;
-    goto __pyx_L37_bool_binop_done;
+    __pyx_t_1 = __pyx_t_4;
+    goto __pyx_L36_bool_binop_done;
   }
-  if (unlikely(__pyx_v_task == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 431; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = (__pyx_e_24_strong_wolfe_linesearch_WARNING_ROUNDING <= __pyx_v_task);
+  if (__pyx_t_4) {
+    __pyx_t_4 = (__pyx_v_task <= __pyx_e_24_strong_wolfe_linesearch_WARNING_STPMIN);
   }
-  __pyx_t_1 = PySequence_GetSlice(__pyx_v_task, 0, 4); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 431; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_20 = (__Pyx_PyString_Equals(__pyx_t_1, __pyx_n_s_CONV, Py_EQ)); if (unlikely(__pyx_t_20 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 431; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = (__pyx_t_20 != 0);
-  __pyx_t_2 = __pyx_t_3;
-  __pyx_L37_bool_binop_done:;
-  if (__pyx_t_2) {
+  __pyx_t_5 = (__pyx_t_4 != 0);
+  __pyx_t_1 = __pyx_t_5;
+  __pyx_L36_bool_binop_done:;
+  if (__pyx_t_1) {
 
-    /* "_strong_wolfe_linesearch.pyx":433
- *     if task[0:4] == 'WARN' or task[0:4] == 'CONV':
- *         # Save local variables.
- *         save_local_variables(brackt, <int *> cnp.PyArray_DATA(isave), <double *> cnp.PyArray_DATA(dsave), stage, ginit, gtest, gx, gy,             # <<<<<<<<<<<<<<
- *                              finit, fx, fy, stx, sty, stmin, stmax, width, width1)
- *         return stp, task, isave, dsave
+    /* "_strong_wolfe_linesearch.pyx":370
+ *     # Test for termination.
+ *     if task == CONVERGENCE or WARNING_ROUNDING <= task <= WARNING_STPMIN:
+ *         st.stage = stage             # <<<<<<<<<<<<<<
+ *         return task
+ * 
  */
-    __pyx_t_1 = __pyx_f_24_strong_wolfe_linesearch_save_local_variables(__pyx_v_brackt, ((int *)PyArray_DATA(((PyArrayObject *)__pyx_v_isave))), ((double *)PyArray_DATA(((PyArrayObject *)__pyx_v_dsave))), __pyx_v_stage, __pyx_v_ginit, __pyx_v_gtest, __pyx_v_gx, __pyx_v_gy, __pyx_v_finit, __pyx_v_fx, __pyx_v_fy, __pyx_v_stx, __pyx_v_sty, __pyx_v_stmin, __pyx_v_stmax, __pyx_v_width, __pyx_v_width1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 433; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_st->stage = __pyx_v_stage;
 
-    /* "_strong_wolfe_linesearch.pyx":435
- *         save_local_variables(brackt, <int *> cnp.PyArray_DATA(isave), <double *> cnp.PyArray_DATA(dsave), stage, ginit, gtest, gx, gy,
- *                              finit, fx, fy, stx, sty, stmin, stmax, width, width1)
- *         return stp, task, isave, dsave             # <<<<<<<<<<<<<<
- *         # return stp, f, g, task, isave, dsave
+    /* "_strong_wolfe_linesearch.pyx":371
+ *     if task == CONVERGENCE or WARNING_ROUNDING <= task <= WARNING_STPMIN:
+ *         st.stage = stage
+ *         return task             # <<<<<<<<<<<<<<
  * 
+ *     # A modified function is used to predict the step during the
  */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_t_1 = PyFloat_FromDouble(__pyx_v_stp); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = PyTuple_New(4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
-    __Pyx_GIVEREF(__pyx_t_1);
-    __Pyx_INCREF(__pyx_v_task);
-    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_task);
-    __Pyx_GIVEREF(__pyx_v_task);
-    __Pyx_INCREF(((PyObject *)__pyx_v_isave));
-    PyTuple_SET_ITEM(__pyx_t_4, 2, ((PyObject *)__pyx_v_isave));
-    __Pyx_GIVEREF(((PyObject *)__pyx_v_isave));
-    __Pyx_INCREF(((PyObject *)__pyx_v_dsave));
-    PyTuple_SET_ITEM(__pyx_t_4, 3, ((PyObject *)__pyx_v_dsave));
-    __Pyx_GIVEREF(((PyObject *)__pyx_v_dsave));
-    __pyx_t_1 = 0;
-    __pyx_r = __pyx_t_4;
-    __pyx_t_4 = 0;
+    __pyx_r = __pyx_v_task;
     goto __pyx_L0;
+
+    /* "_strong_wolfe_linesearch.pyx":369
+ * 
+ *     # Test for termination.
+ *     if task == CONVERGENCE or WARNING_ROUNDING <= task <= WARNING_STPMIN:             # <<<<<<<<<<<<<<
+ *         st.stage = stage
+ *         return task
+ */
   }
 
-  /* "_strong_wolfe_linesearch.pyx":442
+  /* "_strong_wolfe_linesearch.pyx":377
  *     # the decrease is not sufficient.
  * 
  *     if stage == 1 and f <= fx and f > ftest:             # <<<<<<<<<<<<<<
  * 
  *         # Define the modified function and derivative values.
  */
-  __pyx_t_3 = ((__pyx_v_stage == 1) != 0);
-  if (__pyx_t_3) {
+  __pyx_t_5 = ((__pyx_v_stage == 1) != 0);
+  if (__pyx_t_5) {
   } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L40_bool_binop_done;
+    __pyx_t_1 = __pyx_t_5;
+    goto __pyx_L39_bool_binop_done;
   }
-  __pyx_t_3 = ((__pyx_v_f <= __pyx_v_fx) != 0);
-  if (__pyx_t_3) {
+  __pyx_t_5 = ((__pyx_v_f <= __pyx_v_fx) != 0);
+  if (__pyx_t_5) {
   } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L40_bool_binop_done;
+    __pyx_t_1 = __pyx_t_5;
+    goto __pyx_L39_bool_binop_done;
   }
-  __pyx_t_3 = ((__pyx_v_f > __pyx_v_ftest) != 0);
-  __pyx_t_2 = __pyx_t_3;
-  __pyx_L40_bool_binop_done:;
-  if (__pyx_t_2) {
+  __pyx_t_5 = ((__pyx_v_f > __pyx_v_ftest) != 0);
+  __pyx_t_1 = __pyx_t_5;
+  __pyx_L39_bool_binop_done:;
+  if (__pyx_t_1) {
 
-    /* "_strong_wolfe_linesearch.pyx":445
+    /* "_strong_wolfe_linesearch.pyx":380
  * 
  *         # Define the modified function and derivative values.
  *         fm = f - stp*gtest             # <<<<<<<<<<<<<<
@@ -3461,7 +3318,7 @@ static PyObject *__pyx_pf_24_strong_wolfe_linesearch_dcsrch(CYTHON_UNUSED PyObje
  */
     __pyx_v_fm = (__pyx_v_f - (__pyx_v_stp * __pyx_v_gtest));
 
-    /* "_strong_wolfe_linesearch.pyx":446
+    /* "_strong_wolfe_linesearch.pyx":381
  *         # Define the modified function and derivative values.
  *         fm = f - stp*gtest
  *         fxm = fx - stx*gtest             # <<<<<<<<<<<<<<
@@ -3470,7 +3327,7 @@ static PyObject *__pyx_pf_24_strong_wolfe_linesearch_dcsrch(CYTHON_UNUSED PyObje
  */
     __pyx_v_fxm = (__pyx_v_fx - (__pyx_v_stx * __pyx_v_gtest));
 
-    /* "_strong_wolfe_linesearch.pyx":447
+    /* "_strong_wolfe_linesearch.pyx":382
  *         fm = f - stp*gtest
  *         fxm = fx - stx*gtest
  *         fym = fy - sty*gtest             # <<<<<<<<<<<<<<
@@ -3479,7 +3336,7 @@ static PyObject *__pyx_pf_24_strong_wolfe_linesearch_dcsrch(CYTHON_UNUSED PyObje
  */
     __pyx_v_fym = (__pyx_v_fy - (__pyx_v_sty * __pyx_v_gtest));
 
-    /* "_strong_wolfe_linesearch.pyx":448
+    /* "_strong_wolfe_linesearch.pyx":383
  *         fxm = fx - stx*gtest
  *         fym = fy - sty*gtest
  *         gm = g - gtest             # <<<<<<<<<<<<<<
@@ -3488,7 +3345,7 @@ static PyObject *__pyx_pf_24_strong_wolfe_linesearch_dcsrch(CYTHON_UNUSED PyObje
  */
     __pyx_v_gm = (__pyx_v_g - __pyx_v_gtest);
 
-    /* "_strong_wolfe_linesearch.pyx":449
+    /* "_strong_wolfe_linesearch.pyx":384
  *         fym = fy - sty*gtest
  *         gm = g - gtest
  *         gxm = gx - gtest             # <<<<<<<<<<<<<<
@@ -3497,7 +3354,7 @@ static PyObject *__pyx_pf_24_strong_wolfe_linesearch_dcsrch(CYTHON_UNUSED PyObje
  */
     __pyx_v_gxm = (__pyx_v_gx - __pyx_v_gtest);
 
-    /* "_strong_wolfe_linesearch.pyx":450
+    /* "_strong_wolfe_linesearch.pyx":385
  *         gm = g - gtest
  *         gxm = gx - gtest
  *         gym = gy - gtest             # <<<<<<<<<<<<<<
@@ -3506,85 +3363,32 @@ static PyObject *__pyx_pf_24_strong_wolfe_linesearch_dcsrch(CYTHON_UNUSED PyObje
  */
     __pyx_v_gym = (__pyx_v_gy - __pyx_v_gtest);
 
-    /* "_strong_wolfe_linesearch.pyx":453
- * 
+    /* "_strong_wolfe_linesearch.pyx":389
  *         # Call dcstep to update stx, sty, and to compute the new step.
- *         stx, fxm, gxm, sty, fym, gym, stp, brackt = dcstep(stx, fxm, gxm, sty, fym, gym, stp, fm, gm, brackt, stmin, stmax)             # <<<<<<<<<<<<<<
- * 
- *         # Reset the function and derivative values for f.
- */
-    __pyx_t_4 = __pyx_f_24_strong_wolfe_linesearch_dcstep(__pyx_v_stx, __pyx_v_fxm, __pyx_v_gxm, __pyx_v_sty, __pyx_v_fym, __pyx_v_gym, __pyx_v_stp, __pyx_v_fm, __pyx_v_gm, __pyx_v_brackt, __pyx_v_stmin, __pyx_v_stmax); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    if (likely(__pyx_t_4 != Py_None)) {
-      PyObject* sequence = __pyx_t_4;
-      #if CYTHON_COMPILING_IN_CPYTHON
-      Py_ssize_t size = Py_SIZE(sequence);
-      #else
-      Py_ssize_t size = PySequence_Size(sequence);
-      #endif
-      if (unlikely(size != 8)) {
-        if (size > 8) __Pyx_RaiseTooManyValuesError(8);
-        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-      #if CYTHON_COMPILING_IN_CPYTHON
-      __pyx_t_1 = PyTuple_GET_ITEM(sequence, 0); 
-      __pyx_t_21 = PyTuple_GET_ITEM(sequence, 1); 
-      __pyx_t_22 = PyTuple_GET_ITEM(sequence, 2); 
-      __pyx_t_23 = PyTuple_GET_ITEM(sequence, 3); 
-      __pyx_t_24 = PyTuple_GET_ITEM(sequence, 4); 
-      __pyx_t_25 = PyTuple_GET_ITEM(sequence, 5); 
-      __pyx_t_26 = PyTuple_GET_ITEM(sequence, 6); 
-      __pyx_t_27 = PyTuple_GET_ITEM(sequence, 7); 
-      __Pyx_INCREF(__pyx_t_1);
-      __Pyx_INCREF(__pyx_t_21);
-      __Pyx_INCREF(__pyx_t_22);
-      __Pyx_INCREF(__pyx_t_23);
-      __Pyx_INCREF(__pyx_t_24);
-      __Pyx_INCREF(__pyx_t_25);
-      __Pyx_INCREF(__pyx_t_26);
-      __Pyx_INCREF(__pyx_t_27);
-      #else
-      {
-        Py_ssize_t i;
-        PyObject** temps[8] = {&__pyx_t_1,&__pyx_t_21,&__pyx_t_22,&__pyx_t_23,&__pyx_t_24,&__pyx_t_25,&__pyx_t_26,&__pyx_t_27};
-        for (i=0; i < 8; i++) {
-          PyObject* item = PySequence_ITEM(sequence, i); if (unlikely(!item)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(item);
-          *(temps[i]) = item;
-        }
-      }
-      #endif
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    } else {
-      __Pyx_RaiseNoneNotIterableError(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    __pyx_t_28 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_28 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_29 = __pyx_PyFloat_AsDouble(__pyx_t_21); if (unlikely((__pyx_t_29 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
-    __pyx_t_30 = __pyx_PyFloat_AsDouble(__pyx_t_22); if (unlikely((__pyx_t_30 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
-    __pyx_t_31 = __pyx_PyFloat_AsDouble(__pyx_t_23); if (unlikely((__pyx_t_31 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_23); __pyx_t_23 = 0;
-    __pyx_t_32 = __pyx_PyFloat_AsDouble(__pyx_t_24); if (unlikely((__pyx_t_32 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_24); __pyx_t_24 = 0;
-    __pyx_t_33 = __pyx_PyFloat_AsDouble(__pyx_t_25); if (unlikely((__pyx_t_33 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_25); __pyx_t_25 = 0;
-    __pyx_t_34 = __pyx_PyFloat_AsDouble(__pyx_t_26); if (unlikely((__pyx_t_34 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_26); __pyx_t_26 = 0;
-    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_27); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_27); __pyx_t_27 = 0;
-    __pyx_v_stx = __pyx_t_28;
-    __pyx_v_fxm = __pyx_t_29;
-    __pyx_v_gxm = __pyx_t_30;
-    __pyx_v_sty = __pyx_t_31;
-    __pyx_v_fym = __pyx_t_32;
-    __pyx_v_gym = __pyx_t_33;
-    __pyx_v_stp = __pyx_t_34;
-    __pyx_v_brackt = __pyx_t_2;
-
-    /* "_strong_wolfe_linesearch.pyx":456
+ *         stx, fxm, gxm, sty, fym, gym, stp, brackt = \
+ *             dcstep(stx, fxm, gxm, sty, fym, gym, stp, fm, gm, brackt,             # <<<<<<<<<<<<<<
+ *                    stmin, stmax)
+ * 
+ */
+    __pyx_t_6 = __pyx_f_24_strong_wolfe_linesearch_dcstep(__pyx_v_stx, __pyx_v_fxm, __pyx_v_gxm, __pyx_v_sty, __pyx_v_fym, __pyx_v_gym, __pyx_v_stp, __pyx_v_fm, __pyx_v_gm, __pyx_v_brackt, __pyx_v_stmin, __pyx_v_stmax);
+    __pyx_t_3 = __pyx_t_6.f0;
+    __pyx_t_7 = __pyx_t_6.f1;
+    __pyx_t_8 = __pyx_t_6.f2;
+    __pyx_t_9 = __pyx_t_6.f3;
+    __pyx_t_10 = __pyx_t_6.f4;
+    __pyx_t_11 = __pyx_t_6.f5;
+    __pyx_t_12 = __pyx_t_6.f6;
+    __pyx_t_1 = __pyx_t_6.f7;
+    __pyx_v_stx = __pyx_t_3;
+    __pyx_v_fxm = __pyx_t_7;
+    __pyx_v_gxm = __pyx_t_8;
+    __pyx_v_sty = __pyx_t_9;
+    __pyx_v_fym = __pyx_t_10;
+    __pyx_v_gym = __pyx_t_11;
+    __pyx_v_stp = __pyx_t_12;
+    __pyx_v_brackt = __pyx_t_1;
+
+    /* "_strong_wolfe_linesearch.pyx":393
  * 
  *         # Reset the function and derivative values for f.
  *         fx = fxm + stx*gtest             # <<<<<<<<<<<<<<
@@ -3593,7 +3397,7 @@ static PyObject *__pyx_pf_24_strong_wolfe_linesearch_dcsrch(CYTHON_UNUSED PyObje
  */
     __pyx_v_fx = (__pyx_v_fxm + (__pyx_v_stx * __pyx_v_gtest));
 
-    /* "_strong_wolfe_linesearch.pyx":457
+    /* "_strong_wolfe_linesearch.pyx":394
  *         # Reset the function and derivative values for f.
  *         fx = fxm + stx*gtest
  *         fy = fym + sty*gtest             # <<<<<<<<<<<<<<
@@ -3602,7 +3406,7 @@ static PyObject *__pyx_pf_24_strong_wolfe_linesearch_dcsrch(CYTHON_UNUSED PyObje
  */
     __pyx_v_fy = (__pyx_v_fym + (__pyx_v_sty * __pyx_v_gtest));
 
-    /* "_strong_wolfe_linesearch.pyx":458
+    /* "_strong_wolfe_linesearch.pyx":395
  *         fx = fxm + stx*gtest
  *         fy = fym + sty*gtest
  *         gx = gxm + gtest             # <<<<<<<<<<<<<<
@@ -3611,7 +3415,7 @@ static PyObject *__pyx_pf_24_strong_wolfe_linesearch_dcsrch(CYTHON_UNUSED PyObje
  */
     __pyx_v_gx = (__pyx_v_gxm + __pyx_v_gtest);
 
-    /* "_strong_wolfe_linesearch.pyx":459
+    /* "_strong_wolfe_linesearch.pyx":396
  *         fy = fym + sty*gtest
  *         gx = gxm + gtest
  *         gy = gym + gtest             # <<<<<<<<<<<<<<
@@ -3619,198 +3423,173 @@ static PyObject *__pyx_pf_24_strong_wolfe_linesearch_dcsrch(CYTHON_UNUSED PyObje
  *         # Call dcstep to update stx, sty, and to compute the new step.
  */
     __pyx_v_gy = (__pyx_v_gym + __pyx_v_gtest);
-    goto __pyx_L39;
-  }
-  /*else*/ {
 
-    /* "_strong_wolfe_linesearch.pyx":462
- *     else:
- *         # Call dcstep to update stx, sty, and to compute the new step.
- *         stx, fx, gx, sty, fy, gy, stp, brackt = dcstep(stx, fx, gx, sty, fy, gy, stp, f, g, brackt, stmin, stmax)             # <<<<<<<<<<<<<<
+    /* "_strong_wolfe_linesearch.pyx":377
+ *     # the decrease is not sufficient.
+ * 
+ *     if stage == 1 and f <= fx and f > ftest:             # <<<<<<<<<<<<<<
+ * 
+ *         # Define the modified function and derivative values.
+ */
+    goto __pyx_L38;
+  }
+
+  /* "_strong_wolfe_linesearch.pyx":400
+ *         # Call dcstep to update stx, sty, and to compute the new step.
+ *         stx, fx, gx, sty, fy, gy, stp, brackt = \
+ *             dcstep(stx, fx, gx, sty, fy, gy, stp, f, g, brackt, stmin, stmax)             # <<<<<<<<<<<<<<
  * 
  *     # Decide if a bisection step is needed.
  */
-    __pyx_t_4 = __pyx_f_24_strong_wolfe_linesearch_dcstep(__pyx_v_stx, __pyx_v_fx, __pyx_v_gx, __pyx_v_sty, __pyx_v_fy, __pyx_v_gy, __pyx_v_stp, __pyx_v_f, __pyx_v_g, __pyx_v_brackt, __pyx_v_stmin, __pyx_v_stmax); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    if (likely(__pyx_t_4 != Py_None)) {
-      PyObject* sequence = __pyx_t_4;
-      #if CYTHON_COMPILING_IN_CPYTHON
-      Py_ssize_t size = Py_SIZE(sequence);
-      #else
-      Py_ssize_t size = PySequence_Size(sequence);
-      #endif
-      if (unlikely(size != 8)) {
-        if (size > 8) __Pyx_RaiseTooManyValuesError(8);
-        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-      #if CYTHON_COMPILING_IN_CPYTHON
-      __pyx_t_27 = PyTuple_GET_ITEM(sequence, 0); 
-      __pyx_t_26 = PyTuple_GET_ITEM(sequence, 1); 
-      __pyx_t_25 = PyTuple_GET_ITEM(sequence, 2); 
-      __pyx_t_24 = PyTuple_GET_ITEM(sequence, 3); 
-      __pyx_t_23 = PyTuple_GET_ITEM(sequence, 4); 
-      __pyx_t_22 = PyTuple_GET_ITEM(sequence, 5); 
-      __pyx_t_21 = PyTuple_GET_ITEM(sequence, 6); 
-      __pyx_t_1 = PyTuple_GET_ITEM(sequence, 7); 
-      __Pyx_INCREF(__pyx_t_27);
-      __Pyx_INCREF(__pyx_t_26);
-      __Pyx_INCREF(__pyx_t_25);
-      __Pyx_INCREF(__pyx_t_24);
-      __Pyx_INCREF(__pyx_t_23);
-      __Pyx_INCREF(__pyx_t_22);
-      __Pyx_INCREF(__pyx_t_21);
-      __Pyx_INCREF(__pyx_t_1);
-      #else
-      {
-        Py_ssize_t i;
-        PyObject** temps[8] = {&__pyx_t_27,&__pyx_t_26,&__pyx_t_25,&__pyx_t_24,&__pyx_t_23,&__pyx_t_22,&__pyx_t_21,&__pyx_t_1};
-        for (i=0; i < 8; i++) {
-          PyObject* item = PySequence_ITEM(sequence, i); if (unlikely(!item)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(item);
-          *(temps[i]) = item;
-        }
-      }
-      #endif
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    } else {
-      __Pyx_RaiseNoneNotIterableError(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    __pyx_t_34 = __pyx_PyFloat_AsDouble(__pyx_t_27); if (unlikely((__pyx_t_34 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_27); __pyx_t_27 = 0;
-    __pyx_t_33 = __pyx_PyFloat_AsDouble(__pyx_t_26); if (unlikely((__pyx_t_33 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_26); __pyx_t_26 = 0;
-    __pyx_t_32 = __pyx_PyFloat_AsDouble(__pyx_t_25); if (unlikely((__pyx_t_32 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_25); __pyx_t_25 = 0;
-    __pyx_t_31 = __pyx_PyFloat_AsDouble(__pyx_t_24); if (unlikely((__pyx_t_31 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_24); __pyx_t_24 = 0;
-    __pyx_t_30 = __pyx_PyFloat_AsDouble(__pyx_t_23); if (unlikely((__pyx_t_30 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_23); __pyx_t_23 = 0;
-    __pyx_t_29 = __pyx_PyFloat_AsDouble(__pyx_t_22); if (unlikely((__pyx_t_29 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
-    __pyx_t_28 = __pyx_PyFloat_AsDouble(__pyx_t_21); if (unlikely((__pyx_t_28 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
-    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_v_stx = __pyx_t_34;
-    __pyx_v_fx = __pyx_t_33;
-    __pyx_v_gx = __pyx_t_32;
-    __pyx_v_sty = __pyx_t_31;
-    __pyx_v_fy = __pyx_t_30;
-    __pyx_v_gy = __pyx_t_29;
-    __pyx_v_stp = __pyx_t_28;
-    __pyx_v_brackt = __pyx_t_2;
+  /*else*/ {
+    __pyx_t_6 = __pyx_f_24_strong_wolfe_linesearch_dcstep(__pyx_v_stx, __pyx_v_fx, __pyx_v_gx, __pyx_v_sty, __pyx_v_fy, __pyx_v_gy, __pyx_v_stp, __pyx_v_f, __pyx_v_g, __pyx_v_brackt, __pyx_v_stmin, __pyx_v_stmax);
+    __pyx_t_12 = __pyx_t_6.f0;
+    __pyx_t_11 = __pyx_t_6.f1;
+    __pyx_t_10 = __pyx_t_6.f2;
+    __pyx_t_9 = __pyx_t_6.f3;
+    __pyx_t_8 = __pyx_t_6.f4;
+    __pyx_t_7 = __pyx_t_6.f5;
+    __pyx_t_3 = __pyx_t_6.f6;
+    __pyx_t_1 = __pyx_t_6.f7;
+    __pyx_v_stx = __pyx_t_12;
+    __pyx_v_fx = __pyx_t_11;
+    __pyx_v_gx = __pyx_t_10;
+    __pyx_v_sty = __pyx_t_9;
+    __pyx_v_fy = __pyx_t_8;
+    __pyx_v_gy = __pyx_t_7;
+    __pyx_v_stp = __pyx_t_3;
+    __pyx_v_brackt = __pyx_t_1;
   }
-  __pyx_L39:;
+  __pyx_L38:;
 
-  /* "_strong_wolfe_linesearch.pyx":465
+  /* "_strong_wolfe_linesearch.pyx":403
  * 
  *     # Decide if a bisection step is needed.
  *     if brackt:             # <<<<<<<<<<<<<<
- *         if abs(sty-stx) >= 0.66*width1:
+ *         if fabs(sty-stx) >= 0.66*width1:
  *             stp = stx + 0.5*(sty-stx)
  */
-  __pyx_t_2 = (__pyx_v_brackt != 0);
-  if (__pyx_t_2) {
+  __pyx_t_1 = (__pyx_v_brackt != 0);
+  if (__pyx_t_1) {
 
-    /* "_strong_wolfe_linesearch.pyx":466
+    /* "_strong_wolfe_linesearch.pyx":404
  *     # Decide if a bisection step is needed.
  *     if brackt:
- *         if abs(sty-stx) >= 0.66*width1:             # <<<<<<<<<<<<<<
+ *         if fabs(sty-stx) >= 0.66*width1:             # <<<<<<<<<<<<<<
  *             stp = stx + 0.5*(sty-stx)
  *         width1 = width
  */
-    __pyx_t_2 = ((fabs((__pyx_v_sty - __pyx_v_stx)) >= (0.66 * __pyx_v_width1)) != 0);
-    if (__pyx_t_2) {
+    __pyx_t_1 = ((fabs((__pyx_v_sty - __pyx_v_stx)) >= (0.66 * __pyx_v_width1)) != 0);
+    if (__pyx_t_1) {
 
-      /* "_strong_wolfe_linesearch.pyx":467
+      /* "_strong_wolfe_linesearch.pyx":405
  *     if brackt:
- *         if abs(sty-stx) >= 0.66*width1:
+ *         if fabs(sty-stx) >= 0.66*width1:
  *             stp = stx + 0.5*(sty-stx)             # <<<<<<<<<<<<<<
  *         width1 = width
- *         width = abs(sty-stx)
+ *         width = fabs(sty-stx)
  */
       __pyx_v_stp = (__pyx_v_stx + (0.5 * (__pyx_v_sty - __pyx_v_stx)));
-      goto __pyx_L44;
+
+      /* "_strong_wolfe_linesearch.pyx":404
+ *     # Decide if a bisection step is needed.
+ *     if brackt:
+ *         if fabs(sty-stx) >= 0.66*width1:             # <<<<<<<<<<<<<<
+ *             stp = stx + 0.5*(sty-stx)
+ *         width1 = width
+ */
     }
-    __pyx_L44:;
 
-    /* "_strong_wolfe_linesearch.pyx":468
- *         if abs(sty-stx) >= 0.66*width1:
+    /* "_strong_wolfe_linesearch.pyx":406
+ *         if fabs(sty-stx) >= 0.66*width1:
  *             stp = stx + 0.5*(sty-stx)
  *         width1 = width             # <<<<<<<<<<<<<<
- *         width = abs(sty-stx)
+ *         width = fabs(sty-stx)
  * 
  */
     __pyx_v_width1 = __pyx_v_width;
 
-    /* "_strong_wolfe_linesearch.pyx":469
+    /* "_strong_wolfe_linesearch.pyx":407
  *             stp = stx + 0.5*(sty-stx)
  *         width1 = width
- *         width = abs(sty-stx)             # <<<<<<<<<<<<<<
+ *         width = fabs(sty-stx)             # <<<<<<<<<<<<<<
  * 
  *     # Set the minimum and maximum steps allowed for stp.
  */
     __pyx_v_width = fabs((__pyx_v_sty - __pyx_v_stx));
-    goto __pyx_L43;
+
+    /* "_strong_wolfe_linesearch.pyx":403
+ * 
+ *     # Decide if a bisection step is needed.
+ *     if brackt:             # <<<<<<<<<<<<<<
+ *         if fabs(sty-stx) >= 0.66*width1:
+ *             stp = stx + 0.5*(sty-stx)
+ */
   }
-  __pyx_L43:;
 
-  /* "_strong_wolfe_linesearch.pyx":472
+  /* "_strong_wolfe_linesearch.pyx":410
  * 
  *     # Set the minimum and maximum steps allowed for stp.
  *     if brackt:             # <<<<<<<<<<<<<<
  *         stmin = min(stx,sty)
  *         stmax = max(stx,sty)
  */
-  __pyx_t_2 = (__pyx_v_brackt != 0);
-  if (__pyx_t_2) {
+  __pyx_t_1 = (__pyx_v_brackt != 0);
+  if (__pyx_t_1) {
 
-    /* "_strong_wolfe_linesearch.pyx":473
+    /* "_strong_wolfe_linesearch.pyx":411
  *     # Set the minimum and maximum steps allowed for stp.
  *     if brackt:
  *         stmin = min(stx,sty)             # <<<<<<<<<<<<<<
  *         stmax = max(stx,sty)
  *     else:
  */
-    __pyx_t_28 = __pyx_v_sty;
-    __pyx_t_29 = __pyx_v_stx;
-    if (((__pyx_t_28 < __pyx_t_29) != 0)) {
-      __pyx_t_30 = __pyx_t_28;
+    __pyx_t_3 = __pyx_v_sty;
+    __pyx_t_7 = __pyx_v_stx;
+    if (((__pyx_t_3 < __pyx_t_7) != 0)) {
+      __pyx_t_8 = __pyx_t_3;
     } else {
-      __pyx_t_30 = __pyx_t_29;
+      __pyx_t_8 = __pyx_t_7;
     }
-    __pyx_v_stmin = __pyx_t_30;
+    __pyx_v_stmin = __pyx_t_8;
 
-    /* "_strong_wolfe_linesearch.pyx":474
+    /* "_strong_wolfe_linesearch.pyx":412
  *     if brackt:
  *         stmin = min(stx,sty)
  *         stmax = max(stx,sty)             # <<<<<<<<<<<<<<
  *     else:
  *         stmin = stp + xtrapl*(stp-stx)
  */
-    __pyx_t_30 = __pyx_v_sty;
-    __pyx_t_28 = __pyx_v_stx;
-    if (((__pyx_t_30 > __pyx_t_28) != 0)) {
-      __pyx_t_29 = __pyx_t_30;
+    __pyx_t_8 = __pyx_v_sty;
+    __pyx_t_3 = __pyx_v_stx;
+    if (((__pyx_t_8 > __pyx_t_3) != 0)) {
+      __pyx_t_7 = __pyx_t_8;
     } else {
-      __pyx_t_29 = __pyx_t_28;
+      __pyx_t_7 = __pyx_t_3;
     }
-    __pyx_v_stmax = __pyx_t_29;
-    goto __pyx_L45;
+    __pyx_v_stmax = __pyx_t_7;
+
+    /* "_strong_wolfe_linesearch.pyx":410
+ * 
+ *     # Set the minimum and maximum steps allowed for stp.
+ *     if brackt:             # <<<<<<<<<<<<<<
+ *         stmin = min(stx,sty)
+ *         stmax = max(stx,sty)
+ */
+    goto __pyx_L44;
   }
-  /*else*/ {
 
-    /* "_strong_wolfe_linesearch.pyx":476
+  /* "_strong_wolfe_linesearch.pyx":414
  *         stmax = max(stx,sty)
  *     else:
  *         stmin = stp + xtrapl*(stp-stx)             # <<<<<<<<<<<<<<
  *         stmax = stp + xtrapu*(stp-stx)
  * 
  */
+  /*else*/ {
     __pyx_v_stmin = (__pyx_v_stp + (__pyx_v_xtrapl * (__pyx_v_stp - __pyx_v_stx)));
 
-    /* "_strong_wolfe_linesearch.pyx":477
+    /* "_strong_wolfe_linesearch.pyx":415
  *     else:
  *         stmin = stp + xtrapl*(stp-stx)
  *         stmax = stp + xtrapu*(stp-stx)             # <<<<<<<<<<<<<<
@@ -3819,368 +3598,1621 @@ static PyObject *__pyx_pf_24_strong_wolfe_linesearch_dcsrch(CYTHON_UNUSED PyObje
  */
     __pyx_v_stmax = (__pyx_v_stp + (__pyx_v_xtrapu * (__pyx_v_stp - __pyx_v_stx)));
   }
-  __pyx_L45:;
+  __pyx_L44:;
 
-  /* "_strong_wolfe_linesearch.pyx":480
+  /* "_strong_wolfe_linesearch.pyx":418
  * 
  *     # Force the step to be within the bounds stpmax and stpmin.
  *     stp = max(stp,stpmin)             # <<<<<<<<<<<<<<
  *     stp = min(stp,stpmax)
  * 
  */
-  __pyx_t_29 = __pyx_v_stpmin;
-  __pyx_t_30 = __pyx_v_stp;
-  if (((__pyx_t_29 > __pyx_t_30) != 0)) {
-    __pyx_t_28 = __pyx_t_29;
+  __pyx_t_7 = __pyx_v_stpmin;
+  __pyx_t_8 = __pyx_v_stp;
+  if (((__pyx_t_7 > __pyx_t_8) != 0)) {
+    __pyx_t_3 = __pyx_t_7;
   } else {
-    __pyx_t_28 = __pyx_t_30;
+    __pyx_t_3 = __pyx_t_8;
   }
-  __pyx_v_stp = __pyx_t_28;
+  __pyx_v_stp = __pyx_t_3;
 
-  /* "_strong_wolfe_linesearch.pyx":481
+  /* "_strong_wolfe_linesearch.pyx":419
  *     # Force the step to be within the bounds stpmax and stpmin.
  *     stp = max(stp,stpmin)
  *     stp = min(stp,stpmax)             # <<<<<<<<<<<<<<
  * 
  *     # If further progress is not possible, let stp be the best
  */
-  __pyx_t_28 = __pyx_v_stpmax;
-  __pyx_t_29 = __pyx_v_stp;
-  if (((__pyx_t_28 < __pyx_t_29) != 0)) {
-    __pyx_t_30 = __pyx_t_28;
+  __pyx_t_3 = __pyx_v_stpmax;
+  __pyx_t_7 = __pyx_v_stp;
+  if (((__pyx_t_3 < __pyx_t_7) != 0)) {
+    __pyx_t_8 = __pyx_t_3;
+  } else {
+    __pyx_t_8 = __pyx_t_7;
+  }
+  __pyx_v_stp = __pyx_t_8;
+
+  /* "_strong_wolfe_linesearch.pyx":423
+ *     # If further progress is not possible, let stp be the best
+ *     # point obtained during the search.
+ *     if brackt and (stp <= stmin or stp >= stmax) or \             # <<<<<<<<<<<<<<
+ *        (brackt and stmax-stmin <= xtol*stmax):
+ *         stp = stx
+ */
+  __pyx_t_5 = (__pyx_v_brackt != 0);
+  if (!__pyx_t_5) {
+    goto __pyx_L47_next_or;
+  } else {
+  }
+  __pyx_t_5 = ((__pyx_v_stp <= __pyx_v_stmin) != 0);
+  if (!__pyx_t_5) {
+  } else {
+    __pyx_t_1 = __pyx_t_5;
+    goto __pyx_L46_bool_binop_done;
+  }
+  __pyx_t_5 = ((__pyx_v_stp >= __pyx_v_stmax) != 0);
+  if (!__pyx_t_5) {
+  } else {
+    __pyx_t_1 = __pyx_t_5;
+    goto __pyx_L46_bool_binop_done;
+  }
+  __pyx_L47_next_or:;
+
+  /* "_strong_wolfe_linesearch.pyx":424
+ *     # point obtained during the search.
+ *     if brackt and (stp <= stmin or stp >= stmax) or \
+ *        (brackt and stmax-stmin <= xtol*stmax):             # <<<<<<<<<<<<<<
+ *         stp = stx
+ * 
+ */
+  __pyx_t_5 = (__pyx_v_brackt != 0);
+  if (__pyx_t_5) {
+  } else {
+    __pyx_t_1 = __pyx_t_5;
+    goto __pyx_L46_bool_binop_done;
+  }
+  __pyx_t_5 = (((__pyx_v_stmax - __pyx_v_stmin) <= (__pyx_v_xtol * __pyx_v_stmax)) != 0);
+  __pyx_t_1 = __pyx_t_5;
+  __pyx_L46_bool_binop_done:;
+
+  /* "_strong_wolfe_linesearch.pyx":423
+ *     # If further progress is not possible, let stp be the best
+ *     # point obtained during the search.
+ *     if brackt and (stp <= stmin or stp >= stmax) or \             # <<<<<<<<<<<<<<
+ *        (brackt and stmax-stmin <= xtol*stmax):
+ *         stp = stx
+ */
+  if (__pyx_t_1) {
+
+    /* "_strong_wolfe_linesearch.pyx":425
+ *     if brackt and (stp <= stmin or stp >= stmax) or \
+ *        (brackt and stmax-stmin <= xtol*stmax):
+ *         stp = stx             # <<<<<<<<<<<<<<
+ * 
+ *     # Save local variables and obtain another function and derivative.
+ */
+    __pyx_v_stp = __pyx_v_stx;
+
+    /* "_strong_wolfe_linesearch.pyx":423
+ *     # If further progress is not possible, let stp be the best
+ *     # point obtained during the search.
+ *     if brackt and (stp <= stmin or stp >= stmax) or \             # <<<<<<<<<<<<<<
+ *        (brackt and stmax-stmin <= xtol*stmax):
+ *         stp = stx
+ */
+  }
+
+  /* "_strong_wolfe_linesearch.pyx":428
+ * 
+ *     # Save local variables and obtain another function and derivative.
+ *     st.brackt = brackt             # <<<<<<<<<<<<<<
+ *     st.stage = stage
+ *     st.gx = gx
+ */
+  __pyx_v_st->brackt = __pyx_v_brackt;
+
+  /* "_strong_wolfe_linesearch.pyx":429
+ *     # Save local variables and obtain another function and derivative.
+ *     st.brackt = brackt
+ *     st.stage = stage             # <<<<<<<<<<<<<<
+ *     st.gx = gx
+ *     st.gy = gy
+ */
+  __pyx_v_st->stage = __pyx_v_stage;
+
+  /* "_strong_wolfe_linesearch.pyx":430
+ *     st.brackt = brackt
+ *     st.stage = stage
+ *     st.gx = gx             # <<<<<<<<<<<<<<
+ *     st.gy = gy
+ *     st.fx = fx
+ */
+  __pyx_v_st->gx = __pyx_v_gx;
+
+  /* "_strong_wolfe_linesearch.pyx":431
+ *     st.stage = stage
+ *     st.gx = gx
+ *     st.gy = gy             # <<<<<<<<<<<<<<
+ *     st.fx = fx
+ *     st.fy = fy
+ */
+  __pyx_v_st->gy = __pyx_v_gy;
+
+  /* "_strong_wolfe_linesearch.pyx":432
+ *     st.gx = gx
+ *     st.gy = gy
+ *     st.fx = fx             # <<<<<<<<<<<<<<
+ *     st.fy = fy
+ *     st.stx = stx
+ */
+  __pyx_v_st->fx = __pyx_v_fx;
+
+  /* "_strong_wolfe_linesearch.pyx":433
+ *     st.gy = gy
+ *     st.fx = fx
+ *     st.fy = fy             # <<<<<<<<<<<<<<
+ *     st.stx = stx
+ *     st.sty = sty
+ */
+  __pyx_v_st->fy = __pyx_v_fy;
+
+  /* "_strong_wolfe_linesearch.pyx":434
+ *     st.fx = fx
+ *     st.fy = fy
+ *     st.stx = stx             # <<<<<<<<<<<<<<
+ *     st.sty = sty
+ *     st.stmin = stmin
+ */
+  __pyx_v_st->stx = __pyx_v_stx;
+
+  /* "_strong_wolfe_linesearch.pyx":435
+ *     st.fy = fy
+ *     st.stx = stx
+ *     st.sty = sty             # <<<<<<<<<<<<<<
+ *     st.stmin = stmin
+ *     st.stmax = stmax
+ */
+  __pyx_v_st->sty = __pyx_v_sty;
+
+  /* "_strong_wolfe_linesearch.pyx":436
+ *     st.stx = stx
+ *     st.sty = sty
+ *     st.stmin = stmin             # <<<<<<<<<<<<<<
+ *     st.stmax = stmax
+ *     st.width = width
+ */
+  __pyx_v_st->stmin = __pyx_v_stmin;
+
+  /* "_strong_wolfe_linesearch.pyx":437
+ *     st.sty = sty
+ *     st.stmin = stmin
+ *     st.stmax = stmax             # <<<<<<<<<<<<<<
+ *     st.width = width
+ *     st.width1 = width1
+ */
+  __pyx_v_st->stmax = __pyx_v_stmax;
+
+  /* "_strong_wolfe_linesearch.pyx":438
+ *     st.stmin = stmin
+ *     st.stmax = stmax
+ *     st.width = width             # <<<<<<<<<<<<<<
+ *     st.width1 = width1
+ *     pstp[0] = stp
+ */
+  __pyx_v_st->width = __pyx_v_width;
+
+  /* "_strong_wolfe_linesearch.pyx":439
+ *     st.stmax = stmax
+ *     st.width = width
+ *     st.width1 = width1             # <<<<<<<<<<<<<<
+ *     pstp[0] = stp
+ *     return FG
+ */
+  __pyx_v_st->width1 = __pyx_v_width1;
+
+  /* "_strong_wolfe_linesearch.pyx":440
+ *     st.width = width
+ *     st.width1 = width1
+ *     pstp[0] = stp             # <<<<<<<<<<<<<<
+ *     return FG
+ * 
+ */
+  (__pyx_v_pstp[0]) = __pyx_v_stp;
+
+  /* "_strong_wolfe_linesearch.pyx":441
+ *     st.width1 = width1
+ *     pstp[0] = stp
+ *     return FG             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_e_24_strong_wolfe_linesearch_FG;
+  goto __pyx_L0;
+
+  /* "_strong_wolfe_linesearch.pyx":273
+ * 
+ * @cython.cdivision(True)
+ * cdef int dcsrch_core(double *pstp, double f, double g, double ftol,             # <<<<<<<<<<<<<<
+ *                      double gtol, double xtol, int task, double stpmin,
+ *                      double stpmax, dcsrch_state *st) nogil:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "_strong_wolfe_linesearch.pyx":444
+ * 
+ * 
+ * cdef int task_code(str task) except -1:             # <<<<<<<<<<<<<<
+ *     if task[0:5] == 'START':
+ *         return START
+ */
+
+static int __pyx_f_24_strong_wolfe_linesearch_task_code(PyObject *__pyx_v_task) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("task_code", 0);
+
+  /* "_strong_wolfe_linesearch.pyx":445
+ * 
+ * cdef int task_code(str task) except -1:
+ *     if task[0:5] == 'START':             # <<<<<<<<<<<<<<
+ *         return START
+ *     if task[0:2] == 'FG':
+ */
+  if (unlikely(__pyx_v_task == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 445; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_t_1 = PySequence_GetSlice(__pyx_v_task, 0, 5); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 445; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PyString_Equals(__pyx_t_1, __pyx_n_s_START, Py_EQ)); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 445; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "_strong_wolfe_linesearch.pyx":446
+ * cdef int task_code(str task) except -1:
+ *     if task[0:5] == 'START':
+ *         return START             # <<<<<<<<<<<<<<
+ *     if task[0:2] == 'FG':
+ *         return FG
+ */
+    __pyx_r = __pyx_e_24_strong_wolfe_linesearch_START;
+    goto __pyx_L0;
+
+    /* "_strong_wolfe_linesearch.pyx":445
+ * 
+ * cdef int task_code(str task) except -1:
+ *     if task[0:5] == 'START':             # <<<<<<<<<<<<<<
+ *         return START
+ *     if task[0:2] == 'FG':
+ */
+  }
+
+  /* "_strong_wolfe_linesearch.pyx":447
+ *     if task[0:5] == 'START':
+ *         return START
+ *     if task[0:2] == 'FG':             # <<<<<<<<<<<<<<
+ *         return FG
+ *     return task_messages.index(task)
+ */
+  if (unlikely(__pyx_v_task == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 447; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_t_1 = PySequence_GetSlice(__pyx_v_task, 0, 2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 447; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = (__Pyx_PyString_Equals(__pyx_t_1, __pyx_n_s_FG, Py_EQ)); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 447; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
+
+    /* "_strong_wolfe_linesearch.pyx":448
+ *         return START
+ *     if task[0:2] == 'FG':
+ *         return FG             # <<<<<<<<<<<<<<
+ *     return task_messages.index(task)
+ * 
+ */
+    __pyx_r = __pyx_e_24_strong_wolfe_linesearch_FG;
+    goto __pyx_L0;
+
+    /* "_strong_wolfe_linesearch.pyx":447
+ *     if task[0:5] == 'START':
+ *         return START
+ *     if task[0:2] == 'FG':             # <<<<<<<<<<<<<<
+ *         return FG
+ *     return task_messages.index(task)
+ */
+  }
+
+  /* "_strong_wolfe_linesearch.pyx":449
+ *     if task[0:2] == 'FG':
+ *         return FG
+ *     return task_messages.index(task)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_task_messages); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 449; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_index); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 449; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  if (CYTHON_COMPILING_IN_CPYTHON && unlikely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  if (!__pyx_t_4) {
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_v_task); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 449; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
   } else {
-    __pyx_t_30 = __pyx_t_29;
+    __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 449; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    __Pyx_INCREF(__pyx_v_task);
+    __Pyx_GIVEREF(__pyx_v_task);
+    PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_v_task);
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 449; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 449; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_7;
+  goto __pyx_L0;
+
+  /* "_strong_wolfe_linesearch.pyx":444
+ * 
+ * 
+ * cdef int task_code(str task) except -1:             # <<<<<<<<<<<<<<
+ *     if task[0:5] == 'START':
+ *         return START
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("_strong_wolfe_linesearch.task_code", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "_strong_wolfe_linesearch.pyx":453
+ * 
+ * @cython.boundscheck(False)
+ * def dcsrch(double stp, double f, double g, double ftol, double gtol, double xtol,             # <<<<<<<<<<<<<<
+ *            str task, double stpmin, double stpmax,
+ *            cnp.ndarray[cnp.int32_t,ndim=1] isave,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_24_strong_wolfe_linesearch_1dcsrch(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_24_strong_wolfe_linesearch_dcsrch[] = "\n    This subroutine finds a step that satisfies a sufficient\n    decrease condition and a curvature condition.\n\n    Each call of the subroutine updates an interval with\n    endpoints stx and sty. The interval is initially chosen\n    so that it contains a minimizer of the modified function\n\n       psi(stp) = f(stp) - f(0) - ftol*stp*f'(0).\n\n    If psi(stp) <= 0 and f'(stp) >= 0 for some step, then the\n    interval is chosen so that it contains a minimizer of f.\n\n    The algorithm is designed to find a step that satisfies\n    the sufficient decrease condition\n\n       f(stp) <= f(0) + ftol*stp*f'(0),\n\n    and the curvature condition\n\n       abs(f'(stp)) <= gtol*abs(f'(0)).\n\n    If ftol is less than gtol and if, for example, the function\n    is bounded below, then there is always a step which satisfies\n    both conditions.\n\n    If no step can be found that satisfies both conditions, then\n    the algorithm stops with a warning. In this case stp only\n    satisfies the sufficient decrease condition.\n\n    :parameters:\n    stp is a double precision variable.\n     On entry stp is the current estimate of a satisfactory\n        step. On initial entry, a positive initial estimate\n        must be provided.\n     On exit stp is the current estimate of a satisfactory step\n        if task = 'FG'. If task = 'CONV' then stp satisfies\n        the sufficient decrease and curvature condition.\n\n    f is a double precision variable.\n     On initial entry f is the value of the function at 0.\n        On subsequent entries f is the value of the\n        function at stp.\n     On exit f is the value of the function at stp.\n\n    g is a double precision variable.\n     On initial entry g is the derivative of the function at 0.\n        On subsequent entries g is the derivative of the\n        function at stp.\n     On exit g is the derivative of the function at stp.\n\n    ftol is a double precision variable.\n     On entry ftol specifies a nonnegative ""tolerance for the\n        sufficient decrease condition.\n     On exit ftol is unchanged.\n\n    gtol is a double precision variable.\n     On entry gtol specifies a nonnegative tolerance for the\n        curvature condition.\n     On exit gtol is unchanged.\n\n    xtol is a double precision variable.\n     On entry xtol specifies a nonnegative relative tolerance\n        for an acceptable step. The subroutine exits with a\n        warning if the relative difference between sty and stx\n        is less than xtol.\n     On exit xtol is unchanged.\n\n    task is a character variable of length at least 60.\n     On initial entry task must be set to 'START'.\n     On exit task indicates the required action:\n\n        If task(1:2) = 'FG' then evaluate the function and\n        derivative at stp and call dcsrch again.\n\n        If task(1:4) = 'CONV' then the search is successful.\n\n        If task(1:4) = 'WARN' then the subroutine is not able\n        to satisfy the convergence conditions. The exit value of\n        stp contains the best point found during the search.\n\n        If task(1:5) = 'ERROR' then there is an error in the\n        input arguments.\n\n     On exit with convergence, a warning or an error, the\n        variable task contains additional information.\n\n    stpmin is a double precision variable.\n     On entry stpmin is a nonnegative lower bound for the step.\n     On exit stpmin is unchanged.\n\n    stpmax is a double precision variable.\n     On entry stpmax is a nonnegative upper bound for the step.\n     On exit stpmax is unchanged.\n\n    isave is an integer work array of dimension 2.\n\n    dsave is a double precision work array of dimension 13.\n    ";
+static PyMethodDef __pyx_mdef_24_strong_wolfe_linesearch_1dcsrch = {"dcsrch", (PyCFunction)__pyx_pw_24_strong_wolfe_linesearch_1dcsrch, METH_VARARGS|METH_KEYWORDS, __pyx_doc_24_strong_wolfe_linesearch_dcsrch};
+static PyObject *__pyx_pw_24_strong_wolfe_linesearch_1dcsrch(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  double __pyx_v_stp;
+  double __pyx_v_f;
+  double __pyx_v_g;
+  double __pyx_v_ftol;
+  double __pyx_v_gtol;
+  double __pyx_v_xtol;
+  PyObject *__pyx_v_task = 0;
+  double __pyx_v_stpmin;
+  double __pyx_v_stpmax;
+  PyArrayObject *__pyx_v_isave = 0;
+  PyArrayObject *__pyx_v_dsave = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("dcsrch (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_stp,&__pyx_n_s_f,&__pyx_n_s_g,&__pyx_n_s_ftol,&__pyx_n_s_gtol,&__pyx_n_s_xtol,&__pyx_n_s_task,&__pyx_n_s_stpmin,&__pyx_n_s_stpmax,&__pyx_n_s_isave,&__pyx_n_s_dsave,0};
+    PyObject* values[11] = {0,0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 11: values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_stp)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_f)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_g)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_ftol)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_gtol)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_xtol)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  6:
+        if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_task)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        if (likely((values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_stpmin)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  8:
+        if (likely((values[8] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_stpmax)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 8); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  9:
+        if (likely((values[9] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_isave)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 9); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case 10:
+        if (likely((values[10] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_dsave)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, 10); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "dcsrch") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 11) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+      values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+    }
+    __pyx_v_stp = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_stp == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_f = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_f == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_g = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_g == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_ftol = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_ftol == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_gtol = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_gtol == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_xtol = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_xtol == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_task = ((PyObject*)values[6]);
+    __pyx_v_stpmin = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_stpmin == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 454; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_stpmax = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_stpmax == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 454; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_isave = ((PyArrayObject *)values[9]);
+    __pyx_v_dsave = ((PyArrayObject *)values[10]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("dcsrch", 1, 11, 11, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("_strong_wolfe_linesearch.dcsrch", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_task), (&PyString_Type), 1, "task", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 454; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_isave), __pyx_ptype_5numpy_ndarray, 1, "isave", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 455; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_dsave), __pyx_ptype_5numpy_ndarray, 1, "dsave", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 456; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_24_strong_wolfe_linesearch_dcsrch(__pyx_self, __pyx_v_stp, __pyx_v_f, __pyx_v_g, __pyx_v_ftol, __pyx_v_gtol, __pyx_v_xtol, __pyx_v_task, __pyx_v_stpmin, __pyx_v_stpmax, __pyx_v_isave, __pyx_v_dsave);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_24_strong_wolfe_linesearch_dcsrch(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_stp, double __pyx_v_f, double __pyx_v_g, double __pyx_v_ftol, double __pyx_v_gtol, double __pyx_v_xtol, PyObject *__pyx_v_task, double __pyx_v_stpmin, double __pyx_v_stpmax, PyArrayObject *__pyx_v_isave, PyArrayObject *__pyx_v_dsave) {
+  struct __pyx_t_24_strong_wolfe_linesearch_dcsrch_state __pyx_v_st;
+  int __pyx_v_code;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_dsave;
+  __Pyx_Buffer __pyx_pybuffer_dsave;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_isave;
+  __Pyx_Buffer __pyx_pybuffer_isave;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("dcsrch", 0);
+  __pyx_pybuffer_isave.pybuffer.buf = NULL;
+  __pyx_pybuffer_isave.refcount = 0;
+  __pyx_pybuffernd_isave.data = NULL;
+  __pyx_pybuffernd_isave.rcbuffer = &__pyx_pybuffer_isave;
+  __pyx_pybuffer_dsave.pybuffer.buf = NULL;
+  __pyx_pybuffer_dsave.refcount = 0;
+  __pyx_pybuffernd_dsave.data = NULL;
+  __pyx_pybuffernd_dsave.rcbuffer = &__pyx_pybuffer_dsave;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_isave.rcbuffer->pybuffer, (PyObject*)__pyx_v_isave, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_isave.diminfo[0].strides = __pyx_pybuffernd_isave.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_isave.diminfo[0].shape = __pyx_pybuffernd_isave.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_dsave.rcbuffer->pybuffer, (PyObject*)__pyx_v_dsave, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_dsave.diminfo[0].strides = __pyx_pybuffernd_dsave.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_dsave.diminfo[0].shape = __pyx_pybuffernd_dsave.rcbuffer->pybuffer.shape[0];
+
+  /* "_strong_wolfe_linesearch.pyx":558
+ *     cdef:
+ *         dcsrch_state st
+ *         int code = task_code(task)             # <<<<<<<<<<<<<<
+ * 
+ *     if code != START:
+ */
+  __pyx_t_1 = __pyx_f_24_strong_wolfe_linesearch_task_code(__pyx_v_task); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_code = __pyx_t_1;
+
+  /* "_strong_wolfe_linesearch.pyx":560
+ *         int code = task_code(task)
+ * 
+ *     if code != START:             # <<<<<<<<<<<<<<
+ *         load_state(&st, <int *> cnp.PyArray_DATA(isave),
+ *                    <double *> cnp.PyArray_DATA(dsave))
+ */
+  __pyx_t_2 = ((__pyx_v_code != __pyx_e_24_strong_wolfe_linesearch_START) != 0);
+  if (__pyx_t_2) {
+
+    /* "_strong_wolfe_linesearch.pyx":561
+ * 
+ *     if code != START:
+ *         load_state(&st, <int *> cnp.PyArray_DATA(isave),             # <<<<<<<<<<<<<<
+ *                    <double *> cnp.PyArray_DATA(dsave))
+ *     code = dcsrch_core(&stp, f, g, ftol, gtol, xtol, code, stpmin, stpmax,
+ */
+    __pyx_f_24_strong_wolfe_linesearch_load_state((&__pyx_v_st), ((int *)PyArray_DATA(((PyArrayObject *)__pyx_v_isave))), ((double *)PyArray_DATA(((PyArrayObject *)__pyx_v_dsave))));
+
+    /* "_strong_wolfe_linesearch.pyx":560
+ *         int code = task_code(task)
+ * 
+ *     if code != START:             # <<<<<<<<<<<<<<
+ *         load_state(&st, <int *> cnp.PyArray_DATA(isave),
+ *                    <double *> cnp.PyArray_DATA(dsave))
+ */
+  }
+
+  /* "_strong_wolfe_linesearch.pyx":563
+ *         load_state(&st, <int *> cnp.PyArray_DATA(isave),
+ *                    <double *> cnp.PyArray_DATA(dsave))
+ *     code = dcsrch_core(&stp, f, g, ftol, gtol, xtol, code, stpmin, stpmax,             # <<<<<<<<<<<<<<
+ *                        &st)
+ *     if code < ERROR_STP_STPMIN:
+ */
+  __pyx_v_code = __pyx_f_24_strong_wolfe_linesearch_dcsrch_core((&__pyx_v_stp), __pyx_v_f, __pyx_v_g, __pyx_v_ftol, __pyx_v_gtol, __pyx_v_xtol, __pyx_v_code, __pyx_v_stpmin, __pyx_v_stpmax, (&__pyx_v_st));
+
+  /* "_strong_wolfe_linesearch.pyx":565
+ *     code = dcsrch_core(&stp, f, g, ftol, gtol, xtol, code, stpmin, stpmax,
+ *                        &st)
+ *     if code < ERROR_STP_STPMIN:             # <<<<<<<<<<<<<<
+ *         save_state(&st, <int *> cnp.PyArray_DATA(isave),
+ *                    <double *> cnp.PyArray_DATA(dsave))
+ */
+  __pyx_t_2 = ((__pyx_v_code < __pyx_e_24_strong_wolfe_linesearch_ERROR_STP_STPMIN) != 0);
+  if (__pyx_t_2) {
+
+    /* "_strong_wolfe_linesearch.pyx":566
+ *                        &st)
+ *     if code < ERROR_STP_STPMIN:
+ *         save_state(&st, <int *> cnp.PyArray_DATA(isave),             # <<<<<<<<<<<<<<
+ *                    <double *> cnp.PyArray_DATA(dsave))
+ *     return stp, task_messages[code], isave, dsave
+ */
+    __pyx_f_24_strong_wolfe_linesearch_save_state((&__pyx_v_st), ((int *)PyArray_DATA(((PyArrayObject *)__pyx_v_isave))), ((double *)PyArray_DATA(((PyArrayObject *)__pyx_v_dsave))));
+
+    /* "_strong_wolfe_linesearch.pyx":565
+ *     code = dcsrch_core(&stp, f, g, ftol, gtol, xtol, code, stpmin, stpmax,
+ *                        &st)
+ *     if code < ERROR_STP_STPMIN:             # <<<<<<<<<<<<<<
+ *         save_state(&st, <int *> cnp.PyArray_DATA(isave),
+ *                    <double *> cnp.PyArray_DATA(dsave))
+ */
+  }
+
+  /* "_strong_wolfe_linesearch.pyx":568
+ *         save_state(&st, <int *> cnp.PyArray_DATA(isave),
+ *                    <double *> cnp.PyArray_DATA(dsave))
+ *     return stp, task_messages[code], isave, dsave             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_stp); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_task_messages); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_4, __pyx_v_code, int, 1, __Pyx_PyInt_From_int, 0, 1, 0); if (unlikely(__pyx_t_5 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyTuple_New(4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_5);
+  __Pyx_INCREF(((PyObject *)__pyx_v_isave));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_isave));
+  PyTuple_SET_ITEM(__pyx_t_4, 2, ((PyObject *)__pyx_v_isave));
+  __Pyx_INCREF(((PyObject *)__pyx_v_dsave));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_dsave));
+  PyTuple_SET_ITEM(__pyx_t_4, 3, ((PyObject *)__pyx_v_dsave));
+  __pyx_t_3 = 0;
+  __pyx_t_5 = 0;
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "_strong_wolfe_linesearch.pyx":453
+ * 
+ * @cython.boundscheck(False)
+ * def dcsrch(double stp, double f, double g, double ftol, double gtol, double xtol,             # <<<<<<<<<<<<<<
+ *            str task, double stpmin, double stpmax,
+ *            cnp.ndarray[cnp.int32_t,ndim=1] isave,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_dsave.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_isave.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("_strong_wolfe_linesearch.dcsrch", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_dsave.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_isave.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "_strong_wolfe_linesearch.pyx":571
+ * 
+ * 
+ * def dcsrch_search(phi, double stp, double f, double g, double ftol,             # <<<<<<<<<<<<<<
+ *                   double gtol, double xtol, str task, double stpmin,
+ *                   double stpmax,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_24_strong_wolfe_linesearch_3dcsrch_search(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_24_strong_wolfe_linesearch_2dcsrch_search[] = "\n    Run the Mor\303\251-Thuente linesearch to termination.\n\n    The arguments are those of `dcsrch`, with `f` and `g` the value and\n    derivative at `stp`, and `phi` a callable such that `phi(t)` returns\n    the pair (f(t), f'(t)). The calls to `dcsrch` and the requests for new\n    function and derivative values are chained without returning to\n    Python, which only evaluates `phi`.\n\n    Return the final `stp`, `f` and `g`, `task` and the number of\n    evaluations of `phi`. Unless `task` indicates an error, `f` and `g` are\n    the value and derivative at the final `stp`.\n    ";
+static PyMethodDef __pyx_mdef_24_strong_wolfe_linesearch_3dcsrch_search = {"dcsrch_search", (PyCFunction)__pyx_pw_24_strong_wolfe_linesearch_3dcsrch_search, METH_VARARGS|METH_KEYWORDS, __pyx_doc_24_strong_wolfe_linesearch_2dcsrch_search};
+static PyObject *__pyx_pw_24_strong_wolfe_linesearch_3dcsrch_search(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_phi = 0;
+  double __pyx_v_stp;
+  double __pyx_v_f;
+  double __pyx_v_g;
+  double __pyx_v_ftol;
+  double __pyx_v_gtol;
+  double __pyx_v_xtol;
+  PyObject *__pyx_v_task = 0;
+  double __pyx_v_stpmin;
+  double __pyx_v_stpmax;
+  PyArrayObject *__pyx_v_isave = 0;
+  PyArrayObject *__pyx_v_dsave = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("dcsrch_search (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_phi,&__pyx_n_s_stp,&__pyx_n_s_f,&__pyx_n_s_g,&__pyx_n_s_ftol,&__pyx_n_s_gtol,&__pyx_n_s_xtol,&__pyx_n_s_task,&__pyx_n_s_stpmin,&__pyx_n_s_stpmax,&__pyx_n_s_isave,&__pyx_n_s_dsave,0};
+    PyObject* values[12] = {0,0,0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 12: values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
+        case 11: values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_phi)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_stp)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch_search", 1, 12, 12, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_f)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch_search", 1, 12, 12, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_g)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch_search", 1, 12, 12, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_ftol)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch_search", 1, 12, 12, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_gtol)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch_search", 1, 12, 12, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  6:
+        if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_xtol)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch_search", 1, 12, 12, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        if (likely((values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_task)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch_search", 1, 12, 12, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  8:
+        if (likely((values[8] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_stpmin)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch_search", 1, 12, 12, 8); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  9:
+        if (likely((values[9] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_stpmax)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch_search", 1, 12, 12, 9); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case 10:
+        if (likely((values[10] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_isave)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch_search", 1, 12, 12, 10); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case 11:
+        if (likely((values[11] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_dsave)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dcsrch_search", 1, 12, 12, 11); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "dcsrch_search") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 12) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+      values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+      values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
+    }
+    __pyx_v_phi = values[0];
+    __pyx_v_stp = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_stp == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_f = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_f == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_g = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_g == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_ftol = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_ftol == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_gtol = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_gtol == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_xtol = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_xtol == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_task = ((PyObject*)values[7]);
+    __pyx_v_stpmin = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_stpmin == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_stpmax = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_stpmax == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 573; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_isave = ((PyArrayObject *)values[10]);
+    __pyx_v_dsave = ((PyArrayObject *)values[11]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("dcsrch_search", 1, 12, 12, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("_strong_wolfe_linesearch.dcsrch_search", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_task), (&PyString_Type), 1, "task", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_isave), __pyx_ptype_5numpy_ndarray, 1, "isave", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 574; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_dsave), __pyx_ptype_5numpy_ndarray, 1, "dsave", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 575; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_24_strong_wolfe_linesearch_2dcsrch_search(__pyx_self, __pyx_v_phi, __pyx_v_stp, __pyx_v_f, __pyx_v_g, __pyx_v_ftol, __pyx_v_gtol, __pyx_v_xtol, __pyx_v_task, __pyx_v_stpmin, __pyx_v_stpmax, __pyx_v_isave, __pyx_v_dsave);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_24_strong_wolfe_linesearch_2dcsrch_search(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_phi, double __pyx_v_stp, double __pyx_v_f, double __pyx_v_g, double __pyx_v_ftol, double __pyx_v_gtol, double __pyx_v_xtol, PyObject *__pyx_v_task, double __pyx_v_stpmin, double __pyx_v_stpmax, PyArrayObject *__pyx_v_isave, PyArrayObject *__pyx_v_dsave) {
+  struct __pyx_t_24_strong_wolfe_linesearch_dcsrch_state __pyx_v_st;
+  int __pyx_v_code;
+  int __pyx_v_nfev;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_dsave;
+  __Pyx_Buffer __pyx_pybuffer_dsave;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_isave;
+  __Pyx_Buffer __pyx_pybuffer_isave;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *(*__pyx_t_8)(PyObject *);
+  double __pyx_t_9;
+  double __pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("dcsrch_search", 0);
+  __pyx_pybuffer_isave.pybuffer.buf = NULL;
+  __pyx_pybuffer_isave.refcount = 0;
+  __pyx_pybuffernd_isave.data = NULL;
+  __pyx_pybuffernd_isave.rcbuffer = &__pyx_pybuffer_isave;
+  __pyx_pybuffer_dsave.pybuffer.buf = NULL;
+  __pyx_pybuffer_dsave.refcount = 0;
+  __pyx_pybuffernd_dsave.data = NULL;
+  __pyx_pybuffernd_dsave.rcbuffer = &__pyx_pybuffer_dsave;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_isave.rcbuffer->pybuffer, (PyObject*)__pyx_v_isave, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_isave.diminfo[0].strides = __pyx_pybuffernd_isave.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_isave.diminfo[0].shape = __pyx_pybuffernd_isave.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_dsave.rcbuffer->pybuffer, (PyObject*)__pyx_v_dsave, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_dsave.diminfo[0].strides = __pyx_pybuffernd_dsave.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_dsave.diminfo[0].shape = __pyx_pybuffernd_dsave.rcbuffer->pybuffer.shape[0];
+
+  /* "_strong_wolfe_linesearch.pyx":591
+ *     cdef:
+ *         dcsrch_state st
+ *         int code = task_code(task)             # <<<<<<<<<<<<<<
+ *         int nfev = 0
+ * 
+ */
+  __pyx_t_1 = __pyx_f_24_strong_wolfe_linesearch_task_code(__pyx_v_task); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 591; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_code = __pyx_t_1;
+
+  /* "_strong_wolfe_linesearch.pyx":592
+ *         dcsrch_state st
+ *         int code = task_code(task)
+ *         int nfev = 0             # <<<<<<<<<<<<<<
+ * 
+ *     if code != START:
+ */
+  __pyx_v_nfev = 0;
+
+  /* "_strong_wolfe_linesearch.pyx":594
+ *         int nfev = 0
+ * 
+ *     if code != START:             # <<<<<<<<<<<<<<
+ *         load_state(&st, <int *> cnp.PyArray_DATA(isave),
+ *                    <double *> cnp.PyArray_DATA(dsave))
+ */
+  __pyx_t_2 = ((__pyx_v_code != __pyx_e_24_strong_wolfe_linesearch_START) != 0);
+  if (__pyx_t_2) {
+
+    /* "_strong_wolfe_linesearch.pyx":595
+ * 
+ *     if code != START:
+ *         load_state(&st, <int *> cnp.PyArray_DATA(isave),             # <<<<<<<<<<<<<<
+ *                    <double *> cnp.PyArray_DATA(dsave))
+ *     while True:
+ */
+    __pyx_f_24_strong_wolfe_linesearch_load_state((&__pyx_v_st), ((int *)PyArray_DATA(((PyArrayObject *)__pyx_v_isave))), ((double *)PyArray_DATA(((PyArrayObject *)__pyx_v_dsave))));
+
+    /* "_strong_wolfe_linesearch.pyx":594
+ *         int nfev = 0
+ * 
+ *     if code != START:             # <<<<<<<<<<<<<<
+ *         load_state(&st, <int *> cnp.PyArray_DATA(isave),
+ *                    <double *> cnp.PyArray_DATA(dsave))
+ */
+  }
+
+  /* "_strong_wolfe_linesearch.pyx":597
+ *         load_state(&st, <int *> cnp.PyArray_DATA(isave),
+ *                    <double *> cnp.PyArray_DATA(dsave))
+ *     while True:             # <<<<<<<<<<<<<<
+ *         code = dcsrch_core(&stp, f, g, ftol, gtol, xtol, code, stpmin, stpmax,
+ *                            &st)
+ */
+  while (1) {
+
+    /* "_strong_wolfe_linesearch.pyx":598
+ *                    <double *> cnp.PyArray_DATA(dsave))
+ *     while True:
+ *         code = dcsrch_core(&stp, f, g, ftol, gtol, xtol, code, stpmin, stpmax,             # <<<<<<<<<<<<<<
+ *                            &st)
+ *         if code != FG:
+ */
+    __pyx_v_code = __pyx_f_24_strong_wolfe_linesearch_dcsrch_core((&__pyx_v_stp), __pyx_v_f, __pyx_v_g, __pyx_v_ftol, __pyx_v_gtol, __pyx_v_xtol, __pyx_v_code, __pyx_v_stpmin, __pyx_v_stpmax, (&__pyx_v_st));
+
+    /* "_strong_wolfe_linesearch.pyx":600
+ *         code = dcsrch_core(&stp, f, g, ftol, gtol, xtol, code, stpmin, stpmax,
+ *                            &st)
+ *         if code != FG:             # <<<<<<<<<<<<<<
+ *             break
+ *         f, g = phi(stp)
+ */
+    __pyx_t_2 = ((__pyx_v_code != __pyx_e_24_strong_wolfe_linesearch_FG) != 0);
+    if (__pyx_t_2) {
+
+      /* "_strong_wolfe_linesearch.pyx":601
+ *                            &st)
+ *         if code != FG:
+ *             break             # <<<<<<<<<<<<<<
+ *         f, g = phi(stp)
+ *         nfev += 1
+ */
+      goto __pyx_L5_break;
+
+      /* "_strong_wolfe_linesearch.pyx":600
+ *         code = dcsrch_core(&stp, f, g, ftol, gtol, xtol, code, stpmin, stpmax,
+ *                            &st)
+ *         if code != FG:             # <<<<<<<<<<<<<<
+ *             break
+ *         f, g = phi(stp)
+ */
+    }
+
+    /* "_strong_wolfe_linesearch.pyx":602
+ *         if code != FG:
+ *             break
+ *         f, g = phi(stp)             # <<<<<<<<<<<<<<
+ *         nfev += 1
+ *     if code < ERROR_STP_STPMIN:
+ */
+    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_stp); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_v_phi);
+    __pyx_t_5 = __pyx_v_phi; __pyx_t_6 = NULL;
+    if (CYTHON_COMPILING_IN_CPYTHON && unlikely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    if (!__pyx_t_6) {
+      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_3);
+    } else {
+      __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_6); __pyx_t_6 = NULL;
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_7, 0+1, __pyx_t_4);
+      __pyx_t_4 = 0;
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_7, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if ((likely(PyTuple_CheckExact(__pyx_t_3))) || (PyList_CheckExact(__pyx_t_3))) {
+      PyObject* sequence = __pyx_t_3;
+      #if CYTHON_COMPILING_IN_CPYTHON
+      Py_ssize_t size = Py_SIZE(sequence);
+      #else
+      Py_ssize_t size = PySequence_Size(sequence);
+      #endif
+      if (unlikely(size != 2)) {
+        if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      }
+      #if CYTHON_COMPILING_IN_CPYTHON
+      if (likely(PyTuple_CheckExact(sequence))) {
+        __pyx_t_5 = PyTuple_GET_ITEM(sequence, 0); 
+        __pyx_t_7 = PyTuple_GET_ITEM(sequence, 1); 
+      } else {
+        __pyx_t_5 = PyList_GET_ITEM(sequence, 0); 
+        __pyx_t_7 = PyList_GET_ITEM(sequence, 1); 
+      }
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_7);
+      #else
+      __pyx_t_5 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_7 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_7);
+      #endif
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    } else {
+      Py_ssize_t index = -1;
+      __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_8 = Py_TYPE(__pyx_t_4)->tp_iternext;
+      index = 0; __pyx_t_5 = __pyx_t_8(__pyx_t_4); if (unlikely(!__pyx_t_5)) goto __pyx_L7_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_5);
+      index = 1; __pyx_t_7 = __pyx_t_8(__pyx_t_4); if (unlikely(!__pyx_t_7)) goto __pyx_L7_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_7);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_8(__pyx_t_4), 2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_8 = NULL;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      goto __pyx_L8_unpacking_done;
+      __pyx_L7_unpacking_failed:;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_8 = NULL;
+      if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_L8_unpacking_done:;
+    }
+    __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_t_5); if (unlikely((__pyx_t_9 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_10 = __pyx_PyFloat_AsDouble(__pyx_t_7); if (unlikely((__pyx_t_10 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_v_f = __pyx_t_9;
+    __pyx_v_g = __pyx_t_10;
+
+    /* "_strong_wolfe_linesearch.pyx":603
+ *             break
+ *         f, g = phi(stp)
+ *         nfev += 1             # <<<<<<<<<<<<<<
+ *     if code < ERROR_STP_STPMIN:
+ *         save_state(&st, <int *> cnp.PyArray_DATA(isave),
+ */
+    __pyx_v_nfev = (__pyx_v_nfev + 1);
   }
-  __pyx_v_stp = __pyx_t_30;
+  __pyx_L5_break:;
 
-  /* "_strong_wolfe_linesearch.pyx":485
- *     # If further progress is not possible, let stp be the best
- *     # point obtained during the search.
- *     if brackt and (stp <= stmin or stp >= stmax) or \             # <<<<<<<<<<<<<<
- *        (brackt and stmax-stmin <= xtol*stmax):
- *         stp = stx
+  /* "_strong_wolfe_linesearch.pyx":604
+ *         f, g = phi(stp)
+ *         nfev += 1
+ *     if code < ERROR_STP_STPMIN:             # <<<<<<<<<<<<<<
+ *         save_state(&st, <int *> cnp.PyArray_DATA(isave),
+ *                    <double *> cnp.PyArray_DATA(dsave))
  */
-  __pyx_t_3 = (__pyx_v_brackt != 0);
-  if (!__pyx_t_3) {
-    goto __pyx_L48_next_or;
-  } else {
-  }
-  __pyx_t_3 = ((__pyx_v_stp <= __pyx_v_stmin) != 0);
-  if (!__pyx_t_3) {
-  } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L47_bool_binop_done;
-  }
-  __pyx_t_3 = ((__pyx_v_stp >= __pyx_v_stmax) != 0);
-  if (!__pyx_t_3) {
-  } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L47_bool_binop_done;
-  }
-  __pyx_L48_next_or:;
+  __pyx_t_2 = ((__pyx_v_code < __pyx_e_24_strong_wolfe_linesearch_ERROR_STP_STPMIN) != 0);
+  if (__pyx_t_2) {
 
-  /* "_strong_wolfe_linesearch.pyx":486
- *     # point obtained during the search.
- *     if brackt and (stp <= stmin or stp >= stmax) or \
- *        (brackt and stmax-stmin <= xtol*stmax):             # <<<<<<<<<<<<<<
- *         stp = stx
- * 
+    /* "_strong_wolfe_linesearch.pyx":605
+ *         nfev += 1
+ *     if code < ERROR_STP_STPMIN:
+ *         save_state(&st, <int *> cnp.PyArray_DATA(isave),             # <<<<<<<<<<<<<<
+ *                    <double *> cnp.PyArray_DATA(dsave))
+ *     return stp, f, g, task_messages[code], nfev
  */
-  __pyx_t_3 = (__pyx_v_brackt != 0);
-  if (__pyx_t_3) {
-  } else {
-    __pyx_t_2 = __pyx_t_3;
-    goto __pyx_L47_bool_binop_done;
-  }
-  __pyx_t_3 = (((__pyx_v_stmax - __pyx_v_stmin) <= (__pyx_v_xtol * __pyx_v_stmax)) != 0);
-  __pyx_t_2 = __pyx_t_3;
-  __pyx_L47_bool_binop_done:;
-  if (__pyx_t_2) {
+    __pyx_f_24_strong_wolfe_linesearch_save_state((&__pyx_v_st), ((int *)PyArray_DATA(((PyArrayObject *)__pyx_v_isave))), ((double *)PyArray_DATA(((PyArrayObject *)__pyx_v_dsave))));
 
-    /* "_strong_wolfe_linesearch.pyx":487
- *     if brackt and (stp <= stmin or stp >= stmax) or \
- *        (brackt and stmax-stmin <= xtol*stmax):
- *         stp = stx             # <<<<<<<<<<<<<<
- * 
- *     # Obtain another function and derivative.
+    /* "_strong_wolfe_linesearch.pyx":604
+ *         f, g = phi(stp)
+ *         nfev += 1
+ *     if code < ERROR_STP_STPMIN:             # <<<<<<<<<<<<<<
+ *         save_state(&st, <int *> cnp.PyArray_DATA(isave),
+ *                    <double *> cnp.PyArray_DATA(dsave))
  */
-    __pyx_v_stp = __pyx_v_stx;
-    goto __pyx_L46;
   }
-  __pyx_L46:;
 
-  /* "_strong_wolfe_linesearch.pyx":490
+  /* "_strong_wolfe_linesearch.pyx":607
+ *         save_state(&st, <int *> cnp.PyArray_DATA(isave),
+ *                    <double *> cnp.PyArray_DATA(dsave))
+ *     return stp, f, g, task_messages[code], nfev             # <<<<<<<<<<<<<<
  * 
- *     # Obtain another function and derivative.
- *     task = 'FG'             # <<<<<<<<<<<<<<
- * 
- *     # Save local variables.
- */
-  __Pyx_INCREF(__pyx_n_s_FG);
-  __Pyx_DECREF_SET(__pyx_v_task, __pyx_n_s_FG);
-
-  /* "_strong_wolfe_linesearch.pyx":493
  * 
- *     # Save local variables.
- *     save_local_variables(brackt, <int *> cnp.PyArray_DATA(isave), <double *> cnp.PyArray_DATA(dsave), stage, ginit, gtest, gx, gy,             # <<<<<<<<<<<<<<
- *                          finit, fx, fy, stx, sty, stmin, stmax, width, width1)
- *     return stp, task, isave, dsave
  */
-  __pyx_t_4 = __pyx_f_24_strong_wolfe_linesearch_save_local_variables(__pyx_v_brackt, ((int *)PyArray_DATA(((PyArrayObject *)__pyx_v_isave))), ((double *)PyArray_DATA(((PyArrayObject *)__pyx_v_dsave))), __pyx_v_stage, __pyx_v_ginit, __pyx_v_gtest, __pyx_v_gx, __pyx_v_gy, __pyx_v_finit, __pyx_v_fx, __pyx_v_fy, __pyx_v_stx, __pyx_v_sty, __pyx_v_stmin, __pyx_v_stmax, __pyx_v_width, __pyx_v_width1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_stp); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 607; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_7 = PyFloat_FromDouble(__pyx_v_f); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 607; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_g); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 607; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_task_messages); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 607; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_4, __pyx_v_code, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(__pyx_t_6 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 607; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-  /* "_strong_wolfe_linesearch.pyx":495
- *     save_local_variables(brackt, <int *> cnp.PyArray_DATA(isave), <double *> cnp.PyArray_DATA(dsave), stage, ginit, gtest, gx, gy,
- *                          finit, fx, fy, stx, sty, stmin, stmax, width, width1)
- *     return stp, task, isave, dsave             # <<<<<<<<<<<<<<
- *     # return stp, f, g, task, isave, dsave
- * 
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_stp); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 495; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_nfev); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 607; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_1 = PyTuple_New(4); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 495; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_4);
+  __pyx_t_11 = PyTuple_New(5); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 607; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_11, 1, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_11, 2, __pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_11, 3, __pyx_t_6);
   __Pyx_GIVEREF(__pyx_t_4);
-  __Pyx_INCREF(__pyx_v_task);
-  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_task);
-  __Pyx_GIVEREF(__pyx_v_task);
-  __Pyx_INCREF(((PyObject *)__pyx_v_isave));
-  PyTuple_SET_ITEM(__pyx_t_1, 2, ((PyObject *)__pyx_v_isave));
-  __Pyx_GIVEREF(((PyObject *)__pyx_v_isave));
-  __Pyx_INCREF(((PyObject *)__pyx_v_dsave));
-  PyTuple_SET_ITEM(__pyx_t_1, 3, ((PyObject *)__pyx_v_dsave));
-  __Pyx_GIVEREF(((PyObject *)__pyx_v_dsave));
+  PyTuple_SET_ITEM(__pyx_t_11, 4, __pyx_t_4);
+  __pyx_t_3 = 0;
+  __pyx_t_7 = 0;
+  __pyx_t_5 = 0;
+  __pyx_t_6 = 0;
   __pyx_t_4 = 0;
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_11;
+  __pyx_t_11 = 0;
   goto __pyx_L0;
 
-  /* "_strong_wolfe_linesearch.pyx":229
+  /* "_strong_wolfe_linesearch.pyx":571
  * 
- * @cython.boundscheck(False)
- * def dcsrch(double stp, double f, double g, double ftol, double gtol, double xtol,             # <<<<<<<<<<<<<<
- *            str task, double stpmin, double stpmax,
- *            cnp.ndarray[cnp.int32_t,ndim=1] isave,
+ * 
+ * def dcsrch_search(phi, double stp, double f, double g, double ftol,             # <<<<<<<<<<<<<<
+ *                   double gtol, double xtol, str task, double stpmin,
+ *                   double stpmax,
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_21);
-  __Pyx_XDECREF(__pyx_t_22);
-  __Pyx_XDECREF(__pyx_t_23);
-  __Pyx_XDECREF(__pyx_t_24);
-  __Pyx_XDECREF(__pyx_t_25);
-  __Pyx_XDECREF(__pyx_t_26);
-  __Pyx_XDECREF(__pyx_t_27);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_11);
   { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
     __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_dsave.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_isave.rcbuffer->pybuffer);
   __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("_strong_wolfe_linesearch.dcsrch", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("_strong_wolfe_linesearch.dcsrch_search", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   goto __pyx_L2;
   __pyx_L0:;
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_dsave.rcbuffer->pybuffer);
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_isave.rcbuffer->pybuffer);
   __pyx_L2:;
-  __Pyx_XDECREF(__pyx_v_task);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "_strong_wolfe_linesearch.pyx":500
+/* "_strong_wolfe_linesearch.pyx":610
  * 
- * @cython.boundscheck(False)
- * cdef save_local_variables(bint brackt, int * isave,             # <<<<<<<<<<<<<<
- *                           double * dsave, int stage,
- *                           double ginit, double gtest, double gx, double gy,
+ * 
+ * cdef void load_state(dcsrch_state *st, int *isave, double *dsave):             # <<<<<<<<<<<<<<
+ *     st.brackt = isave[0] == 1
+ *     st.stage = isave[1]
  */
 
-static PyObject *__pyx_f_24_strong_wolfe_linesearch_save_local_variables(int __pyx_v_brackt, int *__pyx_v_isave, double *__pyx_v_dsave, int __pyx_v_stage, double __pyx_v_ginit, double __pyx_v_gtest, double __pyx_v_gx, double __pyx_v_gy, double __pyx_v_finit, double __pyx_v_fx, double __pyx_v_fy, double __pyx_v_stx, double __pyx_v_sty, double __pyx_v_stmin, double __pyx_v_stmax, double __pyx_v_width, double __pyx_v_width1) {
-  PyObject *__pyx_r = NULL;
+static void __pyx_f_24_strong_wolfe_linesearch_load_state(struct __pyx_t_24_strong_wolfe_linesearch_dcsrch_state *__pyx_v_st, int *__pyx_v_isave, double *__pyx_v_dsave) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("load_state", 0);
+
+  /* "_strong_wolfe_linesearch.pyx":611
+ * 
+ * cdef void load_state(dcsrch_state *st, int *isave, double *dsave):
+ *     st.brackt = isave[0] == 1             # <<<<<<<<<<<<<<
+ *     st.stage = isave[1]
+ *     st.ginit = dsave[0]
+ */
+  __pyx_v_st->brackt = ((__pyx_v_isave[0]) == 1);
+
+  /* "_strong_wolfe_linesearch.pyx":612
+ * cdef void load_state(dcsrch_state *st, int *isave, double *dsave):
+ *     st.brackt = isave[0] == 1
+ *     st.stage = isave[1]             # <<<<<<<<<<<<<<
+ *     st.ginit = dsave[0]
+ *     st.gtest = dsave[1]
+ */
+  __pyx_v_st->stage = (__pyx_v_isave[1]);
+
+  /* "_strong_wolfe_linesearch.pyx":613
+ *     st.brackt = isave[0] == 1
+ *     st.stage = isave[1]
+ *     st.ginit = dsave[0]             # <<<<<<<<<<<<<<
+ *     st.gtest = dsave[1]
+ *     st.gx = dsave[2]
+ */
+  __pyx_v_st->ginit = (__pyx_v_dsave[0]);
+
+  /* "_strong_wolfe_linesearch.pyx":614
+ *     st.stage = isave[1]
+ *     st.ginit = dsave[0]
+ *     st.gtest = dsave[1]             # <<<<<<<<<<<<<<
+ *     st.gx = dsave[2]
+ *     st.gy = dsave[3]
+ */
+  __pyx_v_st->gtest = (__pyx_v_dsave[1]);
+
+  /* "_strong_wolfe_linesearch.pyx":615
+ *     st.ginit = dsave[0]
+ *     st.gtest = dsave[1]
+ *     st.gx = dsave[2]             # <<<<<<<<<<<<<<
+ *     st.gy = dsave[3]
+ *     st.finit = dsave[4]
+ */
+  __pyx_v_st->gx = (__pyx_v_dsave[2]);
+
+  /* "_strong_wolfe_linesearch.pyx":616
+ *     st.gtest = dsave[1]
+ *     st.gx = dsave[2]
+ *     st.gy = dsave[3]             # <<<<<<<<<<<<<<
+ *     st.finit = dsave[4]
+ *     st.fx = dsave[5]
+ */
+  __pyx_v_st->gy = (__pyx_v_dsave[3]);
+
+  /* "_strong_wolfe_linesearch.pyx":617
+ *     st.gx = dsave[2]
+ *     st.gy = dsave[3]
+ *     st.finit = dsave[4]             # <<<<<<<<<<<<<<
+ *     st.fx = dsave[5]
+ *     st.fy = dsave[6]
+ */
+  __pyx_v_st->finit = (__pyx_v_dsave[4]);
+
+  /* "_strong_wolfe_linesearch.pyx":618
+ *     st.gy = dsave[3]
+ *     st.finit = dsave[4]
+ *     st.fx = dsave[5]             # <<<<<<<<<<<<<<
+ *     st.fy = dsave[6]
+ *     st.stx = dsave[7]
+ */
+  __pyx_v_st->fx = (__pyx_v_dsave[5]);
+
+  /* "_strong_wolfe_linesearch.pyx":619
+ *     st.finit = dsave[4]
+ *     st.fx = dsave[5]
+ *     st.fy = dsave[6]             # <<<<<<<<<<<<<<
+ *     st.stx = dsave[7]
+ *     st.sty = dsave[8]
+ */
+  __pyx_v_st->fy = (__pyx_v_dsave[6]);
+
+  /* "_strong_wolfe_linesearch.pyx":620
+ *     st.fx = dsave[5]
+ *     st.fy = dsave[6]
+ *     st.stx = dsave[7]             # <<<<<<<<<<<<<<
+ *     st.sty = dsave[8]
+ *     st.stmin = dsave[9]
+ */
+  __pyx_v_st->stx = (__pyx_v_dsave[7]);
+
+  /* "_strong_wolfe_linesearch.pyx":621
+ *     st.fy = dsave[6]
+ *     st.stx = dsave[7]
+ *     st.sty = dsave[8]             # <<<<<<<<<<<<<<
+ *     st.stmin = dsave[9]
+ *     st.stmax = dsave[10]
+ */
+  __pyx_v_st->sty = (__pyx_v_dsave[8]);
+
+  /* "_strong_wolfe_linesearch.pyx":622
+ *     st.stx = dsave[7]
+ *     st.sty = dsave[8]
+ *     st.stmin = dsave[9]             # <<<<<<<<<<<<<<
+ *     st.stmax = dsave[10]
+ *     st.width = dsave[11]
+ */
+  __pyx_v_st->stmin = (__pyx_v_dsave[9]);
+
+  /* "_strong_wolfe_linesearch.pyx":623
+ *     st.sty = dsave[8]
+ *     st.stmin = dsave[9]
+ *     st.stmax = dsave[10]             # <<<<<<<<<<<<<<
+ *     st.width = dsave[11]
+ *     st.width1 = dsave[12]
+ */
+  __pyx_v_st->stmax = (__pyx_v_dsave[10]);
+
+  /* "_strong_wolfe_linesearch.pyx":624
+ *     st.stmin = dsave[9]
+ *     st.stmax = dsave[10]
+ *     st.width = dsave[11]             # <<<<<<<<<<<<<<
+ *     st.width1 = dsave[12]
+ * 
+ */
+  __pyx_v_st->width = (__pyx_v_dsave[11]);
+
+  /* "_strong_wolfe_linesearch.pyx":625
+ *     st.stmax = dsave[10]
+ *     st.width = dsave[11]
+ *     st.width1 = dsave[12]             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_v_st->width1 = (__pyx_v_dsave[12]);
+
+  /* "_strong_wolfe_linesearch.pyx":610
+ * 
+ * 
+ * cdef void load_state(dcsrch_state *st, int *isave, double *dsave):             # <<<<<<<<<<<<<<
+ *     st.brackt = isave[0] == 1
+ *     st.stage = isave[1]
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "_strong_wolfe_linesearch.pyx":628
+ * 
+ * 
+ * cdef void save_state(dcsrch_state *st, int *isave, double *dsave):             # <<<<<<<<<<<<<<
+ *     if st.brackt:
+ *         isave[0] = 1
+ */
+
+static void __pyx_f_24_strong_wolfe_linesearch_save_state(struct __pyx_t_24_strong_wolfe_linesearch_dcsrch_state *__pyx_v_st, int *__pyx_v_isave, double *__pyx_v_dsave) {
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
-  __Pyx_RefNannySetupContext("save_local_variables", 0);
+  int __pyx_t_2;
+  double __pyx_t_3;
+  __Pyx_RefNannySetupContext("save_state", 0);
 
-  /* "_strong_wolfe_linesearch.pyx":506
- *                           double stx, double sty, double stmin, double stmax,
- *                           double width, double width1):
- *     if brackt:             # <<<<<<<<<<<<<<
+  /* "_strong_wolfe_linesearch.pyx":629
+ * 
+ * cdef void save_state(dcsrch_state *st, int *isave, double *dsave):
+ *     if st.brackt:             # <<<<<<<<<<<<<<
  *         isave[0] = 1
  *     else:
  */
-  __pyx_t_1 = (__pyx_v_brackt != 0);
+  __pyx_t_1 = (__pyx_v_st->brackt != 0);
   if (__pyx_t_1) {
 
-    /* "_strong_wolfe_linesearch.pyx":507
- *                           double width, double width1):
- *     if brackt:
+    /* "_strong_wolfe_linesearch.pyx":630
+ * cdef void save_state(dcsrch_state *st, int *isave, double *dsave):
+ *     if st.brackt:
  *         isave[0] = 1             # <<<<<<<<<<<<<<
  *     else:
  *         isave[0] = 0
  */
     (__pyx_v_isave[0]) = 1;
+
+    /* "_strong_wolfe_linesearch.pyx":629
+ * 
+ * cdef void save_state(dcsrch_state *st, int *isave, double *dsave):
+ *     if st.brackt:             # <<<<<<<<<<<<<<
+ *         isave[0] = 1
+ *     else:
+ */
     goto __pyx_L3;
   }
-  /*else*/ {
 
-    /* "_strong_wolfe_linesearch.pyx":509
+  /* "_strong_wolfe_linesearch.pyx":632
  *         isave[0] = 1
  *     else:
  *         isave[0] = 0             # <<<<<<<<<<<<<<
- *     isave[1] = stage
- *     dsave[0] = ginit
+ *     isave[1] = st.stage
+ *     dsave[0] = st.ginit
  */
+  /*else*/ {
     (__pyx_v_isave[0]) = 0;
   }
   __pyx_L3:;
 
-  /* "_strong_wolfe_linesearch.pyx":510
+  /* "_strong_wolfe_linesearch.pyx":633
  *     else:
  *         isave[0] = 0
- *     isave[1] = stage             # <<<<<<<<<<<<<<
- *     dsave[0] = ginit
- *     dsave[1] = gtest
+ *     isave[1] = st.stage             # <<<<<<<<<<<<<<
+ *     dsave[0] = st.ginit
+ *     dsave[1] = st.gtest
  */
-  (__pyx_v_isave[1]) = __pyx_v_stage;
+  __pyx_t_2 = __pyx_v_st->stage;
+  (__pyx_v_isave[1]) = __pyx_t_2;
 
-  /* "_strong_wolfe_linesearch.pyx":511
+  /* "_strong_wolfe_linesearch.pyx":634
  *         isave[0] = 0
- *     isave[1] = stage
- *     dsave[0] = ginit             # <<<<<<<<<<<<<<
- *     dsave[1] = gtest
- *     dsave[2] = gx
- */
-  (__pyx_v_dsave[0]) = __pyx_v_ginit;
-
-  /* "_strong_wolfe_linesearch.pyx":512
- *     isave[1] = stage
- *     dsave[0] = ginit
- *     dsave[1] = gtest             # <<<<<<<<<<<<<<
- *     dsave[2] = gx
- *     dsave[3] = gy
- */
-  (__pyx_v_dsave[1]) = __pyx_v_gtest;
-
-  /* "_strong_wolfe_linesearch.pyx":513
- *     dsave[0] = ginit
- *     dsave[1] = gtest
- *     dsave[2] = gx             # <<<<<<<<<<<<<<
- *     dsave[3] = gy
- *     dsave[4] = finit
- */
-  (__pyx_v_dsave[2]) = __pyx_v_gx;
-
-  /* "_strong_wolfe_linesearch.pyx":514
- *     dsave[1] = gtest
- *     dsave[2] = gx
- *     dsave[3] = gy             # <<<<<<<<<<<<<<
- *     dsave[4] = finit
- *     dsave[5] = fx
- */
-  (__pyx_v_dsave[3]) = __pyx_v_gy;
-
-  /* "_strong_wolfe_linesearch.pyx":515
- *     dsave[2] = gx
- *     dsave[3] = gy
- *     dsave[4] = finit             # <<<<<<<<<<<<<<
- *     dsave[5] = fx
- *     dsave[6] = fy
- */
-  (__pyx_v_dsave[4]) = __pyx_v_finit;
-
-  /* "_strong_wolfe_linesearch.pyx":516
- *     dsave[3] = gy
- *     dsave[4] = finit
- *     dsave[5] = fx             # <<<<<<<<<<<<<<
- *     dsave[6] = fy
- *     dsave[7] = stx
- */
-  (__pyx_v_dsave[5]) = __pyx_v_fx;
-
-  /* "_strong_wolfe_linesearch.pyx":517
- *     dsave[4] = finit
- *     dsave[5] = fx
- *     dsave[6] = fy             # <<<<<<<<<<<<<<
- *     dsave[7] = stx
- *     dsave[8] = sty
- */
-  (__pyx_v_dsave[6]) = __pyx_v_fy;
-
-  /* "_strong_wolfe_linesearch.pyx":518
- *     dsave[5] = fx
- *     dsave[6] = fy
- *     dsave[7] = stx             # <<<<<<<<<<<<<<
- *     dsave[8] = sty
- *     dsave[9] = stmin
- */
-  (__pyx_v_dsave[7]) = __pyx_v_stx;
-
-  /* "_strong_wolfe_linesearch.pyx":519
- *     dsave[6] = fy
- *     dsave[7] = stx
- *     dsave[8] = sty             # <<<<<<<<<<<<<<
- *     dsave[9] = stmin
- *     dsave[10] = stmax
- */
-  (__pyx_v_dsave[8]) = __pyx_v_sty;
-
-  /* "_strong_wolfe_linesearch.pyx":520
- *     dsave[7] = stx
- *     dsave[8] = sty
- *     dsave[9] = stmin             # <<<<<<<<<<<<<<
- *     dsave[10] = stmax
- *     dsave[11] = width
- */
-  (__pyx_v_dsave[9]) = __pyx_v_stmin;
-
-  /* "_strong_wolfe_linesearch.pyx":521
- *     dsave[8] = sty
- *     dsave[9] = stmin
- *     dsave[10] = stmax             # <<<<<<<<<<<<<<
- *     dsave[11] = width
- *     dsave[12] = width1
- */
-  (__pyx_v_dsave[10]) = __pyx_v_stmax;
-
-  /* "_strong_wolfe_linesearch.pyx":522
- *     dsave[9] = stmin
- *     dsave[10] = stmax
- *     dsave[11] = width             # <<<<<<<<<<<<<<
- *     dsave[12] = width1
- */
-  (__pyx_v_dsave[11]) = __pyx_v_width;
-
-  /* "_strong_wolfe_linesearch.pyx":523
- *     dsave[10] = stmax
- *     dsave[11] = width
- *     dsave[12] = width1             # <<<<<<<<<<<<<<
- */
-  (__pyx_v_dsave[12]) = __pyx_v_width1;
-
-  /* "_strong_wolfe_linesearch.pyx":500
- * 
- * @cython.boundscheck(False)
- * cdef save_local_variables(bint brackt, int * isave,             # <<<<<<<<<<<<<<
- *                           double * dsave, int stage,
- *                           double ginit, double gtest, double gx, double gy,
+ *     isave[1] = st.stage
+ *     dsave[0] = st.ginit             # <<<<<<<<<<<<<<
+ *     dsave[1] = st.gtest
+ *     dsave[2] = st.gx
+ */
+  __pyx_t_3 = __pyx_v_st->ginit;
+  (__pyx_v_dsave[0]) = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":635
+ *     isave[1] = st.stage
+ *     dsave[0] = st.ginit
+ *     dsave[1] = st.gtest             # <<<<<<<<<<<<<<
+ *     dsave[2] = st.gx
+ *     dsave[3] = st.gy
+ */
+  __pyx_t_3 = __pyx_v_st->gtest;
+  (__pyx_v_dsave[1]) = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":636
+ *     dsave[0] = st.ginit
+ *     dsave[1] = st.gtest
+ *     dsave[2] = st.gx             # <<<<<<<<<<<<<<
+ *     dsave[3] = st.gy
+ *     dsave[4] = st.finit
+ */
+  __pyx_t_3 = __pyx_v_st->gx;
+  (__pyx_v_dsave[2]) = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":637
+ *     dsave[1] = st.gtest
+ *     dsave[2] = st.gx
+ *     dsave[3] = st.gy             # <<<<<<<<<<<<<<
+ *     dsave[4] = st.finit
+ *     dsave[5] = st.fx
+ */
+  __pyx_t_3 = __pyx_v_st->gy;
+  (__pyx_v_dsave[3]) = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":638
+ *     dsave[2] = st.gx
+ *     dsave[3] = st.gy
+ *     dsave[4] = st.finit             # <<<<<<<<<<<<<<
+ *     dsave[5] = st.fx
+ *     dsave[6] = st.fy
+ */
+  __pyx_t_3 = __pyx_v_st->finit;
+  (__pyx_v_dsave[4]) = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":639
+ *     dsave[3] = st.gy
+ *     dsave[4] = st.finit
+ *     dsave[5] = st.fx             # <<<<<<<<<<<<<<
+ *     dsave[6] = st.fy
+ *     dsave[7] = st.stx
+ */
+  __pyx_t_3 = __pyx_v_st->fx;
+  (__pyx_v_dsave[5]) = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":640
+ *     dsave[4] = st.finit
+ *     dsave[5] = st.fx
+ *     dsave[6] = st.fy             # <<<<<<<<<<<<<<
+ *     dsave[7] = st.stx
+ *     dsave[8] = st.sty
+ */
+  __pyx_t_3 = __pyx_v_st->fy;
+  (__pyx_v_dsave[6]) = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":641
+ *     dsave[5] = st.fx
+ *     dsave[6] = st.fy
+ *     dsave[7] = st.stx             # <<<<<<<<<<<<<<
+ *     dsave[8] = st.sty
+ *     dsave[9] = st.stmin
+ */
+  __pyx_t_3 = __pyx_v_st->stx;
+  (__pyx_v_dsave[7]) = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":642
+ *     dsave[6] = st.fy
+ *     dsave[7] = st.stx
+ *     dsave[8] = st.sty             # <<<<<<<<<<<<<<
+ *     dsave[9] = st.stmin
+ *     dsave[10] = st.stmax
+ */
+  __pyx_t_3 = __pyx_v_st->sty;
+  (__pyx_v_dsave[8]) = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":643
+ *     dsave[7] = st.stx
+ *     dsave[8] = st.sty
+ *     dsave[9] = st.stmin             # <<<<<<<<<<<<<<
+ *     dsave[10] = st.stmax
+ *     dsave[11] = st.width
+ */
+  __pyx_t_3 = __pyx_v_st->stmin;
+  (__pyx_v_dsave[9]) = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":644
+ *     dsave[8] = st.sty
+ *     dsave[9] = st.stmin
+ *     dsave[10] = st.stmax             # <<<<<<<<<<<<<<
+ *     dsave[11] = st.width
+ *     dsave[12] = st.width1
+ */
+  __pyx_t_3 = __pyx_v_st->stmax;
+  (__pyx_v_dsave[10]) = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":645
+ *     dsave[9] = st.stmin
+ *     dsave[10] = st.stmax
+ *     dsave[11] = st.width             # <<<<<<<<<<<<<<
+ *     dsave[12] = st.width1
+ */
+  __pyx_t_3 = __pyx_v_st->width;
+  (__pyx_v_dsave[11]) = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":646
+ *     dsave[10] = st.stmax
+ *     dsave[11] = st.width
+ *     dsave[12] = st.width1             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_3 = __pyx_v_st->width1;
+  (__pyx_v_dsave[12]) = __pyx_t_3;
+
+  /* "_strong_wolfe_linesearch.pyx":628
+ * 
+ * 
+ * cdef void save_state(dcsrch_state *st, int *isave, double *dsave):             # <<<<<<<<<<<<<<
+ *     if st.brackt:
+ *         isave[0] = 1
  */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
-  return __pyx_r;
 }
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":197
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":197
  *         # experimental exception made for __getbuffer__ and __releasebuffer__
  *         # -- the details of this may change.
  *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
@@ -4230,7 +5262,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __Pyx_GIVEREF(__pyx_v_info->obj);
   }
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":203
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":203
  *             # of flags
  * 
  *             if info == NULL: return             # <<<<<<<<<<<<<<
@@ -4243,7 +5275,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     goto __pyx_L0;
   }
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":206
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":206
  * 
  *             cdef int copy_shape, i, ndim
  *             cdef int endian_detector = 1             # <<<<<<<<<<<<<<
@@ -4252,7 +5284,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_endian_detector = 1;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":207
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":207
  *             cdef int copy_shape, i, ndim
  *             cdef int endian_detector = 1
  *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
@@ -4261,7 +5293,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":209
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":209
  *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
  * 
  *             ndim = PyArray_NDIM(self)             # <<<<<<<<<<<<<<
@@ -4270,7 +5302,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_ndim = PyArray_NDIM(__pyx_v_self);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":211
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":211
  *             ndim = PyArray_NDIM(self)
  * 
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -4280,7 +5312,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_t_1 = (((sizeof(npy_intp)) != (sizeof(Py_ssize_t))) != 0);
   if (__pyx_t_1) {
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":212
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":212
  * 
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
  *                 copy_shape = 1             # <<<<<<<<<<<<<<
@@ -4288,22 +5320,30 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  *                 copy_shape = 0
  */
     __pyx_v_copy_shape = 1;
+
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":211
+ *             ndim = PyArray_NDIM(self)
+ * 
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
+ *                 copy_shape = 1
+ *             else:
+ */
     goto __pyx_L4;
   }
-  /*else*/ {
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":214
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":214
  *                 copy_shape = 1
  *             else:
  *                 copy_shape = 0             # <<<<<<<<<<<<<<
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  */
+  /*else*/ {
     __pyx_v_copy_shape = 0;
   }
   __pyx_L4:;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":216
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":216
  *                 copy_shape = 0
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -4317,7 +5357,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     goto __pyx_L6_bool_binop_done;
   }
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":217
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":217
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):             # <<<<<<<<<<<<<<
@@ -4327,9 +5367,17 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_t_2 = ((!(PyArray_CHKFLAGS(__pyx_v_self, NPY_C_CONTIGUOUS) != 0)) != 0);
   __pyx_t_1 = __pyx_t_2;
   __pyx_L6_bool_binop_done:;
+
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":216
+ *                 copy_shape = 0
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ */
   if (__pyx_t_1) {
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":218
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":218
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
@@ -4341,9 +5389,17 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     {__pyx_filename = __pyx_f[1]; __pyx_lineno = 218; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":216
+ *                 copy_shape = 0
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ */
   }
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":220
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":220
  *                 raise ValueError(u"ndarray is not C contiguous")
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -4357,7 +5413,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     goto __pyx_L9_bool_binop_done;
   }
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":221
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":221
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):             # <<<<<<<<<<<<<<
@@ -4367,9 +5423,17 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_t_2 = ((!(PyArray_CHKFLAGS(__pyx_v_self, NPY_F_CONTIGUOUS) != 0)) != 0);
   __pyx_t_1 = __pyx_t_2;
   __pyx_L9_bool_binop_done:;
+
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":220
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ */
   if (__pyx_t_1) {
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":222
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":222
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
@@ -4381,9 +5445,17 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     {__pyx_filename = __pyx_f[1]; __pyx_lineno = 222; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":220
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ */
   }
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":224
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":224
  *                 raise ValueError(u"ndarray is not Fortran contiguous")
  * 
  *             info.buf = PyArray_DATA(self)             # <<<<<<<<<<<<<<
@@ -4392,7 +5464,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_info->buf = PyArray_DATA(__pyx_v_self);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":225
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":225
  * 
  *             info.buf = PyArray_DATA(self)
  *             info.ndim = ndim             # <<<<<<<<<<<<<<
@@ -4401,7 +5473,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_info->ndim = __pyx_v_ndim;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":226
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":226
  *             info.buf = PyArray_DATA(self)
  *             info.ndim = ndim
  *             if copy_shape:             # <<<<<<<<<<<<<<
@@ -4411,7 +5483,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_t_1 = (__pyx_v_copy_shape != 0);
   if (__pyx_t_1) {
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":229
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":229
  *                 # Allocate new buffer for strides and shape info.
  *                 # This is allocated as one block, strides first.
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * <size_t>ndim * 2)             # <<<<<<<<<<<<<<
@@ -4420,7 +5492,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     __pyx_v_info->strides = ((Py_ssize_t *)malloc((((sizeof(Py_ssize_t)) * ((size_t)__pyx_v_ndim)) * 2)));
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":230
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":230
  *                 # This is allocated as one block, strides first.
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * <size_t>ndim * 2)
  *                 info.shape = info.strides + ndim             # <<<<<<<<<<<<<<
@@ -4429,7 +5501,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     __pyx_v_info->shape = (__pyx_v_info->strides + __pyx_v_ndim);
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":231
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":231
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * <size_t>ndim * 2)
  *                 info.shape = info.strides + ndim
  *                 for i in range(ndim):             # <<<<<<<<<<<<<<
@@ -4440,7 +5512,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
       __pyx_v_i = __pyx_t_5;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":232
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":232
  *                 info.shape = info.strides + ndim
  *                 for i in range(ndim):
  *                     info.strides[i] = PyArray_STRIDES(self)[i]             # <<<<<<<<<<<<<<
@@ -4449,7 +5521,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
       (__pyx_v_info->strides[__pyx_v_i]) = (PyArray_STRIDES(__pyx_v_self)[__pyx_v_i]);
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":233
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":233
  *                 for i in range(ndim):
  *                     info.strides[i] = PyArray_STRIDES(self)[i]
  *                     info.shape[i] = PyArray_DIMS(self)[i]             # <<<<<<<<<<<<<<
@@ -4458,20 +5530,28 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
       (__pyx_v_info->shape[__pyx_v_i]) = (PyArray_DIMS(__pyx_v_self)[__pyx_v_i]);
     }
+
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":226
+ *             info.buf = PyArray_DATA(self)
+ *             info.ndim = ndim
+ *             if copy_shape:             # <<<<<<<<<<<<<<
+ *                 # Allocate new buffer for strides and shape info.
+ *                 # This is allocated as one block, strides first.
+ */
     goto __pyx_L11;
   }
-  /*else*/ {
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":235
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":235
  *                     info.shape[i] = PyArray_DIMS(self)[i]
  *             else:
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)             # <<<<<<<<<<<<<<
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
  *             info.suboffsets = NULL
  */
+  /*else*/ {
     __pyx_v_info->strides = ((Py_ssize_t *)PyArray_STRIDES(__pyx_v_self));
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":236
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":236
  *             else:
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)             # <<<<<<<<<<<<<<
@@ -4482,7 +5562,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   }
   __pyx_L11:;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":237
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":237
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
  *             info.suboffsets = NULL             # <<<<<<<<<<<<<<
@@ -4491,7 +5571,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_info->suboffsets = NULL;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":238
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":238
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
  *             info.suboffsets = NULL
  *             info.itemsize = PyArray_ITEMSIZE(self)             # <<<<<<<<<<<<<<
@@ -4500,7 +5580,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_info->itemsize = PyArray_ITEMSIZE(__pyx_v_self);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":239
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":239
  *             info.suboffsets = NULL
  *             info.itemsize = PyArray_ITEMSIZE(self)
  *             info.readonly = not PyArray_ISWRITEABLE(self)             # <<<<<<<<<<<<<<
@@ -4509,28 +5589,28 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_info->readonly = (!(PyArray_ISWRITEABLE(__pyx_v_self) != 0));
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":242
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":242
  * 
  *             cdef int t
  *             cdef char* f = NULL             # <<<<<<<<<<<<<<
  *             cdef dtype descr = self.descr
- *             cdef list stack
+ *             cdef int offset
  */
   __pyx_v_f = NULL;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":243
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":243
  *             cdef int t
  *             cdef char* f = NULL
  *             cdef dtype descr = self.descr             # <<<<<<<<<<<<<<
- *             cdef list stack
  *             cdef int offset
+ * 
  */
   __pyx_t_3 = ((PyObject *)__pyx_v_self->descr);
   __Pyx_INCREF(__pyx_t_3);
   __pyx_v_descr = ((PyArray_Descr *)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":247
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":246
  *             cdef int offset
  * 
  *             cdef bint hasfields = PyDataType_HASFIELDS(descr)             # <<<<<<<<<<<<<<
@@ -4539,7 +5619,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_hasfields = PyDataType_HASFIELDS(__pyx_v_descr);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":249
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":248
  *             cdef bint hasfields = PyDataType_HASFIELDS(descr)
  * 
  *             if not hasfields and not copy_shape:             # <<<<<<<<<<<<<<
@@ -4557,7 +5637,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_L15_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":251
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":250
  *             if not hasfields and not copy_shape:
  *                 # do not call releasebuffer
  *                 info.obj = None             # <<<<<<<<<<<<<<
@@ -4569,17 +5649,25 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __Pyx_GOTREF(__pyx_v_info->obj);
     __Pyx_DECREF(__pyx_v_info->obj);
     __pyx_v_info->obj = Py_None;
+
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":248
+ *             cdef bint hasfields = PyDataType_HASFIELDS(descr)
+ * 
+ *             if not hasfields and not copy_shape:             # <<<<<<<<<<<<<<
+ *                 # do not call releasebuffer
+ *                 info.obj = None
+ */
     goto __pyx_L14;
   }
-  /*else*/ {
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":254
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":253
  *             else:
  *                 # need to call releasebuffer
  *                 info.obj = self             # <<<<<<<<<<<<<<
  * 
  *             if not hasfields:
  */
+  /*else*/ {
     __Pyx_INCREF(((PyObject *)__pyx_v_self));
     __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
     __Pyx_GOTREF(__pyx_v_info->obj);
@@ -4588,7 +5676,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   }
   __pyx_L14:;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":256
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":255
  *                 info.obj = self
  * 
  *             if not hasfields:             # <<<<<<<<<<<<<<
@@ -4598,7 +5686,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_t_1 = ((!(__pyx_v_hasfields != 0)) != 0);
   if (__pyx_t_1) {
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":257
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":256
  * 
  *             if not hasfields:
  *                 t = descr.type_num             # <<<<<<<<<<<<<<
@@ -4608,7 +5696,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __pyx_t_4 = __pyx_v_descr->type_num;
     __pyx_v_t = __pyx_t_4;
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":258
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":257
  *             if not hasfields:
  *                 t = descr.type_num
  *                 if ((descr.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -4628,7 +5716,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     }
     __pyx_L20_next_or:;
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":259
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":258
  *                 t = descr.type_num
  *                 if ((descr.byteorder == c'>' and little_endian) or
  *                     (descr.byteorder == c'<' and not little_endian)):             # <<<<<<<<<<<<<<
@@ -4644,43 +5732,51 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __pyx_t_2 = ((!(__pyx_v_little_endian != 0)) != 0);
     __pyx_t_1 = __pyx_t_2;
     __pyx_L19_bool_binop_done:;
+
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":257
+ *             if not hasfields:
+ *                 t = descr.type_num
+ *                 if ((descr.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
+ *                     (descr.byteorder == c'<' and not little_endian)):
+ *                     raise ValueError(u"Non-native byte order not supported")
+ */
     if (__pyx_t_1) {
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":260
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":259
  *                 if ((descr.byteorder == c'>' and little_endian) or
  *                     (descr.byteorder == c'<' and not little_endian)):
  *                     raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 260; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 260; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
+      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":277
- *                 elif t == NPY_CDOUBLE:     f = "Zd"
- *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
- *                 elif t == NPY_OBJECT:      f = "O"             # <<<<<<<<<<<<<<
- *                 else:
- *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":257
+ *             if not hasfields:
+ *                 t = descr.type_num
+ *                 if ((descr.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
+ *                     (descr.byteorder == c'<' and not little_endian)):
+ *                     raise ValueError(u"Non-native byte order not supported")
  */
-    switch (__pyx_v_t) {
+    }
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":261
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":260
  *                     (descr.byteorder == c'<' and not little_endian)):
  *                     raise ValueError(u"Non-native byte order not supported")
  *                 if   t == NPY_BYTE:        f = "b"             # <<<<<<<<<<<<<<
  *                 elif t == NPY_UBYTE:       f = "B"
  *                 elif t == NPY_SHORT:       f = "h"
  */
+    switch (__pyx_v_t) {
       case NPY_BYTE:
       __pyx_v_f = __pyx_k_b;
       break;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":262
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":261
  *                     raise ValueError(u"Non-native byte order not supported")
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"             # <<<<<<<<<<<<<<
@@ -4691,7 +5787,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_B;
       break;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":263
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":262
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  *                 elif t == NPY_SHORT:       f = "h"             # <<<<<<<<<<<<<<
@@ -4702,7 +5798,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_h;
       break;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":264
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":263
  *                 elif t == NPY_UBYTE:       f = "B"
  *                 elif t == NPY_SHORT:       f = "h"
  *                 elif t == NPY_USHORT:      f = "H"             # <<<<<<<<<<<<<<
@@ -4713,7 +5809,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_H;
       break;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":265
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":264
  *                 elif t == NPY_SHORT:       f = "h"
  *                 elif t == NPY_USHORT:      f = "H"
  *                 elif t == NPY_INT:         f = "i"             # <<<<<<<<<<<<<<
@@ -4724,7 +5820,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_i;
       break;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":266
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":265
  *                 elif t == NPY_USHORT:      f = "H"
  *                 elif t == NPY_INT:         f = "i"
  *                 elif t == NPY_UINT:        f = "I"             # <<<<<<<<<<<<<<
@@ -4735,7 +5831,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_I;
       break;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":267
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":266
  *                 elif t == NPY_INT:         f = "i"
  *                 elif t == NPY_UINT:        f = "I"
  *                 elif t == NPY_LONG:        f = "l"             # <<<<<<<<<<<<<<
@@ -4746,7 +5842,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_l;
       break;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":268
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":267
  *                 elif t == NPY_UINT:        f = "I"
  *                 elif t == NPY_LONG:        f = "l"
  *                 elif t == NPY_ULONG:       f = "L"             # <<<<<<<<<<<<<<
@@ -4757,7 +5853,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_L;
       break;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":269
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":268
  *                 elif t == NPY_LONG:        f = "l"
  *                 elif t == NPY_ULONG:       f = "L"
  *                 elif t == NPY_LONGLONG:    f = "q"             # <<<<<<<<<<<<<<
@@ -4768,7 +5864,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_q;
       break;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":270
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":269
  *                 elif t == NPY_ULONG:       f = "L"
  *                 elif t == NPY_LONGLONG:    f = "q"
  *                 elif t == NPY_ULONGLONG:   f = "Q"             # <<<<<<<<<<<<<<
@@ -4779,7 +5875,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_Q;
       break;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":271
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":270
  *                 elif t == NPY_LONGLONG:    f = "q"
  *                 elif t == NPY_ULONGLONG:   f = "Q"
  *                 elif t == NPY_FLOAT:       f = "f"             # <<<<<<<<<<<<<<
@@ -4790,7 +5886,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_f;
       break;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":272
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":271
  *                 elif t == NPY_ULONGLONG:   f = "Q"
  *                 elif t == NPY_FLOAT:       f = "f"
  *                 elif t == NPY_DOUBLE:      f = "d"             # <<<<<<<<<<<<<<
@@ -4801,7 +5897,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_d;
       break;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":273
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":272
  *                 elif t == NPY_FLOAT:       f = "f"
  *                 elif t == NPY_DOUBLE:      f = "d"
  *                 elif t == NPY_LONGDOUBLE:  f = "g"             # <<<<<<<<<<<<<<
@@ -4812,7 +5908,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_g;
       break;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":274
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":273
  *                 elif t == NPY_DOUBLE:      f = "d"
  *                 elif t == NPY_LONGDOUBLE:  f = "g"
  *                 elif t == NPY_CFLOAT:      f = "Zf"             # <<<<<<<<<<<<<<
@@ -4823,7 +5919,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_Zf;
       break;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":275
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":274
  *                 elif t == NPY_LONGDOUBLE:  f = "g"
  *                 elif t == NPY_CFLOAT:      f = "Zf"
  *                 elif t == NPY_CDOUBLE:     f = "Zd"             # <<<<<<<<<<<<<<
@@ -4834,7 +5930,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_Zd;
       break;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":276
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":275
  *                 elif t == NPY_CFLOAT:      f = "Zf"
  *                 elif t == NPY_CDOUBLE:     f = "Zd"
  *                 elif t == NPY_CLONGDOUBLE: f = "Zg"             # <<<<<<<<<<<<<<
@@ -4845,7 +5941,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_Zg;
       break;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":277
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":276
  *                 elif t == NPY_CDOUBLE:     f = "Zd"
  *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
  *                 elif t == NPY_OBJECT:      f = "O"             # <<<<<<<<<<<<<<
@@ -4857,33 +5953,33 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       break;
       default:
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":279
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":278
  *                 elif t == NPY_OBJECT:      f = "O"
  *                 else:
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
  *                 info.format = f
  *                 return
  */
-      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_t); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_t); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 278; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_6 = PyUnicode_Format(__pyx_kp_u_unknown_dtype_code_in_numpy_pxd, __pyx_t_3); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = PyUnicode_Format(__pyx_kp_u_unknown_dtype_code_in_numpy_pxd, __pyx_t_3); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 278; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 278; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
-      PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_6);
       __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_6);
       __pyx_t_6 = 0;
-      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_3, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_3, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 278; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __Pyx_Raise(__pyx_t_6, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 278; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       break;
     }
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":280
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":279
  *                 else:
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *                 info.format = f             # <<<<<<<<<<<<<<
@@ -4892,7 +5988,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     __pyx_v_info->format = __pyx_v_f;
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":281
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":280
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *                 info.format = f
  *                 return             # <<<<<<<<<<<<<<
@@ -4901,19 +5997,27 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     __pyx_r = 0;
     goto __pyx_L0;
+
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":255
+ *                 info.obj = self
+ * 
+ *             if not hasfields:             # <<<<<<<<<<<<<<
+ *                 t = descr.type_num
+ *                 if ((descr.byteorder == c'>' and little_endian) or
+ */
   }
-  /*else*/ {
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":283
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":282
  *                 return
  *             else:
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)             # <<<<<<<<<<<<<<
  *                 info.format[0] = c'^' # Native data types, manual alignment
  *                 offset = 0
  */
-    __pyx_v_info->format = ((char *)malloc(255));
+  /*else*/ {
+    __pyx_v_info->format = ((char *)malloc(0xFF));
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":284
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":283
  *             else:
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
  *                 info.format[0] = c'^' # Native data types, manual alignment             # <<<<<<<<<<<<<<
@@ -4922,7 +6026,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     (__pyx_v_info->format[0]) = '^';
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":285
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":284
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
  *                 info.format[0] = c'^' # Native data types, manual alignment
  *                 offset = 0             # <<<<<<<<<<<<<<
@@ -4931,17 +6035,17 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     __pyx_v_offset = 0;
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":286
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":285
  *                 info.format[0] = c'^' # Native data types, manual alignment
  *                 offset = 0
  *                 f = _util_dtypestring(descr, info.format + 1,             # <<<<<<<<<<<<<<
  *                                       info.format + _buffer_format_string_len,
  *                                       &offset)
  */
-    __pyx_t_7 = __pyx_f_5numpy__util_dtypestring(__pyx_v_descr, (__pyx_v_info->format + 1), (__pyx_v_info->format + 255), (&__pyx_v_offset)); if (unlikely(__pyx_t_7 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 286; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = __pyx_f_5numpy__util_dtypestring(__pyx_v_descr, (__pyx_v_info->format + 1), (__pyx_v_info->format + 0xFF), (&__pyx_v_offset)); if (unlikely(__pyx_t_7 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 285; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_v_f = __pyx_t_7;
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":289
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":288
  *                                       info.format + _buffer_format_string_len,
  *                                       &offset)
  *                 f[0] = c'\0' # Terminate format string             # <<<<<<<<<<<<<<
@@ -4951,7 +6055,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     (__pyx_v_f[0]) = '\x00';
   }
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":197
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":197
  *         # experimental exception made for __getbuffer__ and __releasebuffer__
  *         # -- the details of this may change.
  *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
@@ -4983,7 +6087,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   return __pyx_r;
 }
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":291
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":290
  *                 f[0] = c'\0' # Terminate format string
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
@@ -5007,7 +6111,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("__releasebuffer__", 0);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":292
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":291
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):
  *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
@@ -5017,7 +6121,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
   __pyx_t_1 = (PyArray_HASFIELDS(__pyx_v_self) != 0);
   if (__pyx_t_1) {
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":293
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":292
  *         def __releasebuffer__(ndarray self, Py_buffer* info):
  *             if PyArray_HASFIELDS(self):
  *                 stdlib.free(info.format)             # <<<<<<<<<<<<<<
@@ -5025,11 +6129,17 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
  *                 stdlib.free(info.strides)
  */
     free(__pyx_v_info->format);
-    goto __pyx_L3;
+
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":291
+ * 
+ *         def __releasebuffer__(ndarray self, Py_buffer* info):
+ *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
+ *                 stdlib.free(info.format)
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+ */
   }
-  __pyx_L3:;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":294
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":293
  *             if PyArray_HASFIELDS(self):
  *                 stdlib.free(info.format)
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -5039,7 +6149,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
   __pyx_t_1 = (((sizeof(npy_intp)) != (sizeof(Py_ssize_t))) != 0);
   if (__pyx_t_1) {
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":295
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":294
  *                 stdlib.free(info.format)
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
  *                 stdlib.free(info.strides)             # <<<<<<<<<<<<<<
@@ -5047,11 +6157,17 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
  * 
  */
     free(__pyx_v_info->strides);
-    goto __pyx_L4;
+
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":293
+ *             if PyArray_HASFIELDS(self):
+ *                 stdlib.free(info.format)
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
+ *                 stdlib.free(info.strides)
+ *                 # info.shape was stored after info.strides in the same block
+ */
   }
-  __pyx_L4:;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":291
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":290
  *                 f[0] = c'\0' # Terminate format string
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
@@ -5063,7 +6179,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
   __Pyx_RefNannyFinishContext();
 }
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":771
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":770
  * ctypedef npy_cdouble     complex_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
@@ -5080,7 +6196,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew1", 0);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":772
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":771
  * 
  * cdef inline object PyArray_MultiIterNew1(a):
  *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
@@ -5088,13 +6204,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
  * cdef inline object PyArray_MultiIterNew2(a, b):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 772; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 771; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":771
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":770
  * ctypedef npy_cdouble     complex_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
@@ -5113,7 +6229,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":774
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":773
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -5130,7 +6246,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew2", 0);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":775
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":774
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
@@ -5138,13 +6254,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
  * cdef inline object PyArray_MultiIterNew3(a, b, c):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 774; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":774
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":773
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -5163,7 +6279,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":777
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":776
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -5180,7 +6296,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew3", 0);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":778
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":777
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
@@ -5188,13 +6304,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 778; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 777; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":777
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":776
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -5213,7 +6329,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":780
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":779
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -5230,7 +6346,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew4", 0);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":781
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":780
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
@@ -5238,13 +6354,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 781; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 780; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":780
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":779
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -5263,7 +6379,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":783
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":782
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -5280,7 +6396,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew5", 0);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":784
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":783
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
@@ -5288,13 +6404,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
  * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 784; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 783; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":783
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":782
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -5313,7 +6429,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":786
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":785
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:             # <<<<<<<<<<<<<<
@@ -5345,17 +6461,17 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_util_dtypestring", 0);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":793
- *     cdef int delta_offset
- *     cdef tuple i
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":790
+ * 
+ *     cdef dtype child
  *     cdef int endian_detector = 1             # <<<<<<<<<<<<<<
  *     cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
  *     cdef tuple fields
  */
   __pyx_v_endian_detector = 1;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":794
- *     cdef tuple i
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":791
+ *     cdef dtype child
  *     cdef int endian_detector = 1
  *     cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
  *     cdef tuple fields
@@ -5363,7 +6479,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
   __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":797
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":794
  *     cdef tuple fields
  * 
  *     for childname in descr.names:             # <<<<<<<<<<<<<<
@@ -5372,20 +6488,21 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
   if (unlikely(__pyx_v_descr->names == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-    {__pyx_filename = __pyx_f[1]; __pyx_lineno = 797; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[1]; __pyx_lineno = 794; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_t_1 = __pyx_v_descr->names; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
   for (;;) {
     if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
     #if CYTHON_COMPILING_IN_CPYTHON
-    __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 797; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 794; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     #else
-    __pyx_t_3 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 797; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 794; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
     #endif
     __Pyx_XDECREF_SET(__pyx_v_childname, __pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":798
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":795
  * 
  *     for childname in descr.names:
  *         fields = descr.fields[childname]             # <<<<<<<<<<<<<<
@@ -5394,15 +6511,15 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
     if (unlikely(__pyx_v_descr->fields == Py_None)) {
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 798; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 795; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
-    __pyx_t_3 = __Pyx_PyDict_GetItem(__pyx_v_descr->fields, __pyx_v_childname); if (unlikely(__pyx_t_3 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 798; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+    __pyx_t_3 = __Pyx_PyDict_GetItem(__pyx_v_descr->fields, __pyx_v_childname); if (unlikely(__pyx_t_3 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 795; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
     __Pyx_GOTREF(__pyx_t_3);
-    if (!(likely(PyTuple_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_t_3)->tp_name), 0))) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 798; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (!(likely(PyTuple_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_t_3)->tp_name), 0))) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 795; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_XDECREF_SET(__pyx_v_fields, ((PyObject*)__pyx_t_3));
     __pyx_t_3 = 0;
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":799
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":796
  *     for childname in descr.names:
  *         fields = descr.fields[childname]
  *         child, new_offset = fields             # <<<<<<<<<<<<<<
@@ -5419,7 +6536,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       if (unlikely(size != 2)) {
         if (size > 2) __Pyx_RaiseTooManyValuesError(2);
         else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-        {__pyx_filename = __pyx_f[1]; __pyx_lineno = 799; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        {__pyx_filename = __pyx_f[1]; __pyx_lineno = 796; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       }
       #if CYTHON_COMPILING_IN_CPYTHON
       __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0); 
@@ -5427,52 +6544,60 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __Pyx_INCREF(__pyx_t_3);
       __Pyx_INCREF(__pyx_t_4);
       #else
-      __pyx_t_3 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 799; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 796; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 799; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 796; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
       #endif
     } else {
-      __Pyx_RaiseNoneNotIterableError(); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 799; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_RaiseNoneNotIterableError(); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 796; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
-    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_dtype))))) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 799; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_dtype))))) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 796; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_XDECREF_SET(__pyx_v_child, ((PyArray_Descr *)__pyx_t_3));
     __pyx_t_3 = 0;
     __Pyx_XDECREF_SET(__pyx_v_new_offset, __pyx_t_4);
     __pyx_t_4 = 0;
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":801
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":798
  *         child, new_offset = fields
  * 
  *         if (end - f) - <int>(new_offset - offset[0]) < 15:             # <<<<<<<<<<<<<<
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
  * 
  */
-    __pyx_t_4 = __Pyx_PyInt_From_int((__pyx_v_offset[0])); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 801; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __Pyx_PyInt_From_int((__pyx_v_offset[0])); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 798; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = PyNumber_Subtract(__pyx_v_new_offset, __pyx_t_4); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 801; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyNumber_Subtract(__pyx_v_new_offset, __pyx_t_4); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 798; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 801; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 798; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __pyx_t_6 = ((((__pyx_v_end - __pyx_v_f) - ((int)__pyx_t_5)) < 15) != 0);
     if (__pyx_t_6) {
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":802
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":799
  * 
  *         if (end - f) - <int>(new_offset - offset[0]) < 15:
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
  * 
  *         if ((child.byteorder == c'>' and little_endian) or
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 799; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 799; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":798
+ *         child, new_offset = fields
+ * 
+ *         if (end - f) - <int>(new_offset - offset[0]) < 15:             # <<<<<<<<<<<<<<
+ *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
+ * 
+ */
     }
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":804
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":801
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
  * 
  *         if ((child.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -5492,7 +6617,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     __pyx_L8_next_or:;
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":805
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":802
  * 
  *         if ((child.byteorder == c'>' and little_endian) or
  *             (child.byteorder == c'<' and not little_endian)):             # <<<<<<<<<<<<<<
@@ -5508,23 +6633,39 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_7 = ((!(__pyx_v_little_endian != 0)) != 0);
     __pyx_t_6 = __pyx_t_7;
     __pyx_L7_bool_binop_done:;
+
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":801
+ *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
+ * 
+ *         if ((child.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
+ *             (child.byteorder == c'<' and not little_endian)):
+ *             raise ValueError(u"Non-native byte order not supported")
+ */
     if (__pyx_t_6) {
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":806
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":803
  *         if ((child.byteorder == c'>' and little_endian) or
  *             (child.byteorder == c'<' and not little_endian)):
  *             raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
  *             # One could encode it in the format string and have Cython
  *             # complain instead, BUT: < and > in format strings also imply
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 803; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 803; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":801
+ *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
+ * 
+ *         if ((child.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
+ *             (child.byteorder == c'<' and not little_endian)):
+ *             raise ValueError(u"Non-native byte order not supported")
+ */
     }
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":816
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":813
  * 
  *         # Output padding bytes
  *         while offset[0] < new_offset:             # <<<<<<<<<<<<<<
@@ -5532,24 +6673,24 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  *             f += 1
  */
     while (1) {
-      __pyx_t_3 = __Pyx_PyInt_From_int((__pyx_v_offset[0])); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 816; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = __Pyx_PyInt_From_int((__pyx_v_offset[0])); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 813; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_t_3, __pyx_v_new_offset, Py_LT); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 816; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = PyObject_RichCompare(__pyx_t_3, __pyx_v_new_offset, Py_LT); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 813; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 816; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 813; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (!__pyx_t_6) break;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":817
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":814
  *         # Output padding bytes
  *         while offset[0] < new_offset:
  *             f[0] = 120 # "x"; pad byte             # <<<<<<<<<<<<<<
  *             f += 1
  *             offset[0] += 1
  */
-      (__pyx_v_f[0]) = 120;
+      (__pyx_v_f[0]) = 0x78;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":818
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":815
  *         while offset[0] < new_offset:
  *             f[0] = 120 # "x"; pad byte
  *             f += 1             # <<<<<<<<<<<<<<
@@ -5558,7 +6699,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       __pyx_v_f = (__pyx_v_f + 1);
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":819
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":816
  *             f[0] = 120 # "x"; pad byte
  *             f += 1
  *             offset[0] += 1             # <<<<<<<<<<<<<<
@@ -5569,7 +6710,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       (__pyx_v_offset[__pyx_t_8]) = ((__pyx_v_offset[__pyx_t_8]) + 1);
     }
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":821
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":818
  *             offset[0] += 1
  * 
  *         offset[0] += child.itemsize             # <<<<<<<<<<<<<<
@@ -5579,7 +6720,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_8 = 0;
     (__pyx_v_offset[__pyx_t_8]) = ((__pyx_v_offset[__pyx_t_8]) + __pyx_v_child->elsize);
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":823
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":820
  *         offset[0] += child.itemsize
  * 
  *         if not PyDataType_HASFIELDS(child):             # <<<<<<<<<<<<<<
@@ -5589,19 +6730,19 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_6 = ((!(PyDataType_HASFIELDS(__pyx_v_child) != 0)) != 0);
     if (__pyx_t_6) {
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":824
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":821
  * 
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num             # <<<<<<<<<<<<<<
  *             if end - f < 5:
  *                 raise RuntimeError(u"Format string allocated too short.")
  */
-      __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_child->type_num); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 824; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_child->type_num); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 821; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_XDECREF_SET(__pyx_v_t, __pyx_t_4);
       __pyx_t_4 = 0;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":825
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":822
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num
  *             if end - f < 5:             # <<<<<<<<<<<<<<
@@ -5611,357 +6752,365 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __pyx_t_6 = (((__pyx_v_end - __pyx_v_f) < 5) != 0);
       if (__pyx_t_6) {
 
-        /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":826
+        /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":823
  *             t = child.type_num
  *             if end - f < 5:
  *                 raise RuntimeError(u"Format string allocated too short.")             # <<<<<<<<<<<<<<
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  */
-        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 826; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 823; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_Raise(__pyx_t_4, 0, 0, 0);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        {__pyx_filename = __pyx_f[1]; __pyx_lineno = 826; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        {__pyx_filename = __pyx_f[1]; __pyx_lineno = 823; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+        /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":822
+ *         if not PyDataType_HASFIELDS(child):
+ *             t = child.type_num
+ *             if end - f < 5:             # <<<<<<<<<<<<<<
+ *                 raise RuntimeError(u"Format string allocated too short.")
+ * 
+ */
       }
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":829
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":826
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"             # <<<<<<<<<<<<<<
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  */
-      __pyx_t_4 = PyInt_FromLong(NPY_BYTE); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_BYTE); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 826; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 826; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 826; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 98;
         goto __pyx_L15;
       }
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":830
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":827
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"             # <<<<<<<<<<<<<<
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  */
-      __pyx_t_3 = PyInt_FromLong(NPY_UBYTE); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 830; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_UBYTE); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 827; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 830; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 827; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 830; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 827; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 66;
         goto __pyx_L15;
       }
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":831
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":828
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"             # <<<<<<<<<<<<<<
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  */
-      __pyx_t_4 = PyInt_FromLong(NPY_SHORT); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_SHORT); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 828; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 828; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 828; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 104;
+        (__pyx_v_f[0]) = 0x68;
         goto __pyx_L15;
       }
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":832
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":829
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"             # <<<<<<<<<<<<<<
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  */
-      __pyx_t_3 = PyInt_FromLong(NPY_USHORT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 832; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_USHORT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 832; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 832; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 72;
         goto __pyx_L15;
       }
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":833
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":830
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"             # <<<<<<<<<<<<<<
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  */
-      __pyx_t_4 = PyInt_FromLong(NPY_INT); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_INT); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 830; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 830; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 830; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 105;
+        (__pyx_v_f[0]) = 0x69;
         goto __pyx_L15;
       }
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":834
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":831
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"             # <<<<<<<<<<<<<<
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  */
-      __pyx_t_3 = PyInt_FromLong(NPY_UINT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 834; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_UINT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 834; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 834; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 73;
         goto __pyx_L15;
       }
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":835
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":832
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"             # <<<<<<<<<<<<<<
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  */
-      __pyx_t_4 = PyInt_FromLong(NPY_LONG); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 835; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_LONG); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 832; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 835; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 832; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 835; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 832; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 108;
+        (__pyx_v_f[0]) = 0x6C;
         goto __pyx_L15;
       }
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":836
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":833
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"             # <<<<<<<<<<<<<<
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  */
-      __pyx_t_3 = PyInt_FromLong(NPY_ULONG); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 836; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_ULONG); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 836; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 836; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 76;
         goto __pyx_L15;
       }
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":837
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":834
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"             # <<<<<<<<<<<<<<
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  */
-      __pyx_t_4 = PyInt_FromLong(NPY_LONGLONG); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 837; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_LONGLONG); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 834; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 837; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 834; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 837; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 834; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 113;
+        (__pyx_v_f[0]) = 0x71;
         goto __pyx_L15;
       }
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":838
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":835
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"             # <<<<<<<<<<<<<<
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  */
-      __pyx_t_3 = PyInt_FromLong(NPY_ULONGLONG); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 838; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_ULONGLONG); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 835; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 838; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 835; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 838; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 835; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 81;
         goto __pyx_L15;
       }
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":839
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":836
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"             # <<<<<<<<<<<<<<
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  */
-      __pyx_t_4 = PyInt_FromLong(NPY_FLOAT); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 839; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_FLOAT); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 836; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 839; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 836; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 839; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 836; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 102;
+        (__pyx_v_f[0]) = 0x66;
         goto __pyx_L15;
       }
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":840
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":837
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"             # <<<<<<<<<<<<<<
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  */
-      __pyx_t_3 = PyInt_FromLong(NPY_DOUBLE); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 840; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_DOUBLE); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 837; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 840; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 837; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 840; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 837; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 100;
+        (__pyx_v_f[0]) = 0x64;
         goto __pyx_L15;
       }
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":841
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":838
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"             # <<<<<<<<<<<<<<
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  */
-      __pyx_t_4 = PyInt_FromLong(NPY_LONGDOUBLE); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 841; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_LONGDOUBLE); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 838; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 841; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 838; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 841; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 838; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (__pyx_t_6) {
-        (__pyx_v_f[0]) = 103;
+        (__pyx_v_f[0]) = 0x67;
         goto __pyx_L15;
       }
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":842
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":839
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf             # <<<<<<<<<<<<<<
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg
  */
-      __pyx_t_3 = PyInt_FromLong(NPY_CFLOAT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 842; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_CFLOAT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 839; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 842; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 839; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 842; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 839; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 90;
-        (__pyx_v_f[1]) = 102;
+        (__pyx_v_f[1]) = 0x66;
         __pyx_v_f = (__pyx_v_f + 1);
         goto __pyx_L15;
       }
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":843
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":840
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd             # <<<<<<<<<<<<<<
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"
  */
-      __pyx_t_4 = PyInt_FromLong(NPY_CDOUBLE); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 843; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_CDOUBLE); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 840; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 843; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 840; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 843; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 840; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 90;
-        (__pyx_v_f[1]) = 100;
+        (__pyx_v_f[1]) = 0x64;
         __pyx_v_f = (__pyx_v_f + 1);
         goto __pyx_L15;
       }
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":844
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":841
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg             # <<<<<<<<<<<<<<
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"
  *             else:
  */
-      __pyx_t_3 = PyInt_FromLong(NPY_CLONGDOUBLE); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 844; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_CLONGDOUBLE); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 841; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 844; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 841; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 844; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 841; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 90;
-        (__pyx_v_f[1]) = 103;
+        (__pyx_v_f[1]) = 0x67;
         __pyx_v_f = (__pyx_v_f + 1);
         goto __pyx_L15;
       }
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":845
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":842
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"             # <<<<<<<<<<<<<<
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  */
-      __pyx_t_4 = PyInt_FromLong(NPY_OBJECT); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 845; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_OBJECT); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 842; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 845; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 842; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 845; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 842; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 79;
         goto __pyx_L15;
       }
-      /*else*/ {
 
-        /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":847
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":844
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
  *             f += 1
  *         else:
  */
-        __pyx_t_3 = PyUnicode_Format(__pyx_kp_u_unknown_dtype_code_in_numpy_pxd, __pyx_v_t); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 847; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      /*else*/ {
+        __pyx_t_3 = PyUnicode_Format(__pyx_kp_u_unknown_dtype_code_in_numpy_pxd, __pyx_v_t); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 844; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 847; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 844; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_4);
-        PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
         __Pyx_GIVEREF(__pyx_t_3);
+        PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
         __pyx_t_3 = 0;
-        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 847; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 844; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_3);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
         __Pyx_Raise(__pyx_t_3, 0, 0, 0);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        {__pyx_filename = __pyx_f[1]; __pyx_lineno = 847; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        {__pyx_filename = __pyx_f[1]; __pyx_lineno = 844; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       }
       __pyx_L15:;
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":848
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":845
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *             f += 1             # <<<<<<<<<<<<<<
@@ -5969,23 +7118,31 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  *             # Cython ignores struct boundary information ("T{...}"),
  */
       __pyx_v_f = (__pyx_v_f + 1);
+
+      /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":820
+ *         offset[0] += child.itemsize
+ * 
+ *         if not PyDataType_HASFIELDS(child):             # <<<<<<<<<<<<<<
+ *             t = child.type_num
+ *             if end - f < 5:
+ */
       goto __pyx_L13;
     }
-    /*else*/ {
 
-      /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":852
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":849
  *             # Cython ignores struct boundary information ("T{...}"),
  *             # so don't output it
  *             f = _util_dtypestring(child, f, end, offset)             # <<<<<<<<<<<<<<
  *     return f
  * 
  */
-      __pyx_t_9 = __pyx_f_5numpy__util_dtypestring(__pyx_v_child, __pyx_v_f, __pyx_v_end, __pyx_v_offset); if (unlikely(__pyx_t_9 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 852; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    /*else*/ {
+      __pyx_t_9 = __pyx_f_5numpy__util_dtypestring(__pyx_v_child, __pyx_v_f, __pyx_v_end, __pyx_v_offset); if (unlikely(__pyx_t_9 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 849; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __pyx_v_f = __pyx_t_9;
     }
     __pyx_L13:;
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":797
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":794
  *     cdef tuple fields
  * 
  *     for childname in descr.names:             # <<<<<<<<<<<<<<
@@ -5995,7 +7152,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":853
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":850
  *             # so don't output it
  *             f = _util_dtypestring(child, f, end, offset)
  *     return f             # <<<<<<<<<<<<<<
@@ -6005,7 +7162,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   __pyx_r = __pyx_v_f;
   goto __pyx_L0;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":786
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":785
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:             # <<<<<<<<<<<<<<
@@ -6030,7 +7187,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   return __pyx_r;
 }
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":969
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":966
  * 
  * 
  * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
@@ -6045,7 +7202,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   int __pyx_t_2;
   __Pyx_RefNannySetupContext("set_array_base", 0);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":971
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":968
  * cdef inline void set_array_base(ndarray arr, object base):
  *      cdef PyObject* baseptr
  *      if base is None:             # <<<<<<<<<<<<<<
@@ -6056,7 +7213,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (__pyx_t_2) {
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":972
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":969
  *      cdef PyObject* baseptr
  *      if base is None:
  *          baseptr = NULL             # <<<<<<<<<<<<<<
@@ -6064,20 +7221,28 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  *          Py_INCREF(base) # important to do this before decref below!
  */
     __pyx_v_baseptr = NULL;
+
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":968
+ * cdef inline void set_array_base(ndarray arr, object base):
+ *      cdef PyObject* baseptr
+ *      if base is None:             # <<<<<<<<<<<<<<
+ *          baseptr = NULL
+ *      else:
+ */
     goto __pyx_L3;
   }
-  /*else*/ {
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":974
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":971
  *          baseptr = NULL
  *      else:
  *          Py_INCREF(base) # important to do this before decref below!             # <<<<<<<<<<<<<<
  *          baseptr = <PyObject*>base
  *      Py_XDECREF(arr.base)
  */
+  /*else*/ {
     Py_INCREF(__pyx_v_base);
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":975
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":972
  *      else:
  *          Py_INCREF(base) # important to do this before decref below!
  *          baseptr = <PyObject*>base             # <<<<<<<<<<<<<<
@@ -6088,7 +7253,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   }
   __pyx_L3:;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":976
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":973
  *          Py_INCREF(base) # important to do this before decref below!
  *          baseptr = <PyObject*>base
  *      Py_XDECREF(arr.base)             # <<<<<<<<<<<<<<
@@ -6097,7 +7262,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
   Py_XDECREF(__pyx_v_arr->base);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":977
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":974
  *          baseptr = <PyObject*>base
  *      Py_XDECREF(arr.base)
  *      arr.base = baseptr             # <<<<<<<<<<<<<<
@@ -6106,7 +7271,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
   __pyx_v_arr->base = __pyx_v_baseptr;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":969
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":966
  * 
  * 
  * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
@@ -6118,7 +7283,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __Pyx_RefNannyFinishContext();
 }
 
-/* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":979
+/* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":976
  *      arr.base = baseptr
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -6132,7 +7297,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("get_array_base", 0);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":980
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":977
  * 
  * cdef inline object get_array_base(ndarray arr):
  *     if arr.base is NULL:             # <<<<<<<<<<<<<<
@@ -6142,7 +7307,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __pyx_t_1 = ((__pyx_v_arr->base == NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":981
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":978
  * cdef inline object get_array_base(ndarray arr):
  *     if arr.base is NULL:
  *         return None             # <<<<<<<<<<<<<<
@@ -6153,21 +7318,29 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
     __Pyx_INCREF(Py_None);
     __pyx_r = Py_None;
     goto __pyx_L0;
+
+    /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":977
+ * 
+ * cdef inline object get_array_base(ndarray arr):
+ *     if arr.base is NULL:             # <<<<<<<<<<<<<<
+ *         return None
+ *     else:
+ */
   }
-  /*else*/ {
 
-    /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":983
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":980
  *         return None
  *     else:
  *         return <object>arr.base             # <<<<<<<<<<<<<<
  */
+  /*else*/ {
     __Pyx_XDECREF(__pyx_r);
     __Pyx_INCREF(((PyObject *)__pyx_v_arr->base));
     __pyx_r = ((PyObject *)__pyx_v_arr->base);
     goto __pyx_L0;
   }
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":979
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":976
  *      arr.base = baseptr
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -6205,9 +7378,7 @@ static struct PyModuleDef __pyx_moduledef = {
 #endif
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_n_s_CONV, __pyx_k_CONV, sizeof(__pyx_k_CONV), 0, 0, 1, 1},
   {&__pyx_n_s_CONVERGENCE, __pyx_k_CONVERGENCE, sizeof(__pyx_k_CONVERGENCE), 0, 0, 1, 1},
-  {&__pyx_n_s_ERROR, __pyx_k_ERROR, sizeof(__pyx_k_ERROR), 0, 0, 1, 1},
   {&__pyx_kp_s_ERROR_FTOL_0, __pyx_k_ERROR_FTOL_0, sizeof(__pyx_k_ERROR_FTOL_0), 0, 0, 1, 0},
   {&__pyx_kp_s_ERROR_GTOL_0, __pyx_k_ERROR_GTOL_0, sizeof(__pyx_k_ERROR_GTOL_0), 0, 0, 1, 0},
   {&__pyx_kp_s_ERROR_INITIAL_G_0, __pyx_k_ERROR_INITIAL_G_0, sizeof(__pyx_k_ERROR_INITIAL_G_0), 0, 0, 1, 0},
@@ -6222,62 +7393,44 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_u_Non_native_byte_order_not_suppor, __pyx_k_Non_native_byte_order_not_suppor, sizeof(__pyx_k_Non_native_byte_order_not_suppor), 0, 1, 0, 0},
   {&__pyx_n_s_RuntimeError, __pyx_k_RuntimeError, sizeof(__pyx_k_RuntimeError), 0, 0, 1, 1},
   {&__pyx_n_s_START, __pyx_k_START, sizeof(__pyx_k_START), 0, 0, 1, 1},
-  {&__pyx_kp_s_Users_dpo_virtualenvs_fenics_fr, __pyx_k_Users_dpo_virtualenvs_fenics_fr, sizeof(__pyx_k_Users_dpo_virtualenvs_fenics_fr), 0, 0, 1, 0},
   {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
-  {&__pyx_n_s_WARN, __pyx_k_WARN, sizeof(__pyx_k_WARN), 0, 0, 1, 1},
   {&__pyx_kp_s_WARNING_ROUNDING_ERRORS_PREVENT, __pyx_k_WARNING_ROUNDING_ERRORS_PREVENT, sizeof(__pyx_k_WARNING_ROUNDING_ERRORS_PREVENT), 0, 0, 1, 0},
   {&__pyx_kp_s_WARNING_STP_STPMAX, __pyx_k_WARNING_STP_STPMAX, sizeof(__pyx_k_WARNING_STP_STPMAX), 0, 0, 1, 0},
   {&__pyx_kp_s_WARNING_STP_STPMIN, __pyx_k_WARNING_STP_STPMIN, sizeof(__pyx_k_WARNING_STP_STPMIN), 0, 0, 1, 0},
   {&__pyx_kp_s_WARNING_XTOL_TEST_SATISFIED, __pyx_k_WARNING_XTOL_TEST_SATISFIED, sizeof(__pyx_k_WARNING_XTOL_TEST_SATISFIED), 0, 0, 1, 0},
-  {&__pyx_n_s_brackt, __pyx_k_brackt, sizeof(__pyx_k_brackt), 0, 0, 1, 1},
+  {&__pyx_n_s_code, __pyx_k_code, sizeof(__pyx_k_code), 0, 0, 1, 1},
   {&__pyx_n_s_dcsrch, __pyx_k_dcsrch, sizeof(__pyx_k_dcsrch), 0, 0, 1, 1},
+  {&__pyx_n_s_dcsrch_search, __pyx_k_dcsrch_search, sizeof(__pyx_k_dcsrch_search), 0, 0, 1, 1},
   {&__pyx_n_s_dsave, __pyx_k_dsave, sizeof(__pyx_k_dsave), 0, 0, 1, 1},
   {&__pyx_n_s_f, __pyx_k_f, sizeof(__pyx_k_f), 0, 0, 1, 1},
-  {&__pyx_n_s_finit, __pyx_k_finit, sizeof(__pyx_k_finit), 0, 0, 1, 1},
-  {&__pyx_n_s_fm, __pyx_k_fm, sizeof(__pyx_k_fm), 0, 0, 1, 1},
-  {&__pyx_n_s_ftest, __pyx_k_ftest, sizeof(__pyx_k_ftest), 0, 0, 1, 1},
   {&__pyx_n_s_ftol, __pyx_k_ftol, sizeof(__pyx_k_ftol), 0, 0, 1, 1},
-  {&__pyx_n_s_fx, __pyx_k_fx, sizeof(__pyx_k_fx), 0, 0, 1, 1},
-  {&__pyx_n_s_fxm, __pyx_k_fxm, sizeof(__pyx_k_fxm), 0, 0, 1, 1},
-  {&__pyx_n_s_fy, __pyx_k_fy, sizeof(__pyx_k_fy), 0, 0, 1, 1},
-  {&__pyx_n_s_fym, __pyx_k_fym, sizeof(__pyx_k_fym), 0, 0, 1, 1},
   {&__pyx_n_s_g, __pyx_k_g, sizeof(__pyx_k_g), 0, 0, 1, 1},
-  {&__pyx_n_s_ginit, __pyx_k_ginit, sizeof(__pyx_k_ginit), 0, 0, 1, 1},
-  {&__pyx_n_s_gm, __pyx_k_gm, sizeof(__pyx_k_gm), 0, 0, 1, 1},
-  {&__pyx_n_s_gtest, __pyx_k_gtest, sizeof(__pyx_k_gtest), 0, 0, 1, 1},
   {&__pyx_n_s_gtol, __pyx_k_gtol, sizeof(__pyx_k_gtol), 0, 0, 1, 1},
-  {&__pyx_n_s_gx, __pyx_k_gx, sizeof(__pyx_k_gx), 0, 0, 1, 1},
-  {&__pyx_n_s_gxm, __pyx_k_gxm, sizeof(__pyx_k_gxm), 0, 0, 1, 1},
-  {&__pyx_n_s_gy, __pyx_k_gy, sizeof(__pyx_k_gy), 0, 0, 1, 1},
-  {&__pyx_n_s_gym, __pyx_k_gym, sizeof(__pyx_k_gym), 0, 0, 1, 1},
+  {&__pyx_n_s_index, __pyx_k_index, sizeof(__pyx_k_index), 0, 0, 1, 1},
   {&__pyx_n_s_isave, __pyx_k_isave, sizeof(__pyx_k_isave), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
   {&__pyx_kp_u_ndarray_is_not_C_contiguous, __pyx_k_ndarray_is_not_C_contiguous, sizeof(__pyx_k_ndarray_is_not_C_contiguous), 0, 1, 0, 0},
   {&__pyx_kp_u_ndarray_is_not_Fortran_contiguou, __pyx_k_ndarray_is_not_Fortran_contiguou, sizeof(__pyx_k_ndarray_is_not_Fortran_contiguou), 0, 1, 0, 0},
+  {&__pyx_n_s_nfev, __pyx_k_nfev, sizeof(__pyx_k_nfev), 0, 0, 1, 1},
+  {&__pyx_n_s_phi, __pyx_k_phi, sizeof(__pyx_k_phi), 0, 0, 1, 1},
   {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
-  {&__pyx_n_s_stage, __pyx_k_stage, sizeof(__pyx_k_stage), 0, 0, 1, 1},
-  {&__pyx_n_s_stmax, __pyx_k_stmax, sizeof(__pyx_k_stmax), 0, 0, 1, 1},
-  {&__pyx_n_s_stmin, __pyx_k_stmin, sizeof(__pyx_k_stmin), 0, 0, 1, 1},
+  {&__pyx_kp_s_root_package_nlp_ls_src__strong, __pyx_k_root_package_nlp_ls_src__strong, sizeof(__pyx_k_root_package_nlp_ls_src__strong), 0, 0, 1, 0},
+  {&__pyx_n_s_st, __pyx_k_st, sizeof(__pyx_k_st), 0, 0, 1, 1},
   {&__pyx_n_s_stp, __pyx_k_stp, sizeof(__pyx_k_stp), 0, 0, 1, 1},
   {&__pyx_n_s_stpmax, __pyx_k_stpmax, sizeof(__pyx_k_stpmax), 0, 0, 1, 1},
   {&__pyx_n_s_stpmin, __pyx_k_stpmin, sizeof(__pyx_k_stpmin), 0, 0, 1, 1},
   {&__pyx_n_s_strong_wolfe_linesearch, __pyx_k_strong_wolfe_linesearch, sizeof(__pyx_k_strong_wolfe_linesearch), 0, 0, 1, 1},
-  {&__pyx_n_s_stx, __pyx_k_stx, sizeof(__pyx_k_stx), 0, 0, 1, 1},
-  {&__pyx_n_s_sty, __pyx_k_sty, sizeof(__pyx_k_sty), 0, 0, 1, 1},
   {&__pyx_n_s_task, __pyx_k_task, sizeof(__pyx_k_task), 0, 0, 1, 1},
+  {&__pyx_n_s_task_messages, __pyx_k_task_messages, sizeof(__pyx_k_task_messages), 0, 0, 1, 1},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
   {&__pyx_kp_u_unknown_dtype_code_in_numpy_pxd, __pyx_k_unknown_dtype_code_in_numpy_pxd, sizeof(__pyx_k_unknown_dtype_code_in_numpy_pxd), 0, 1, 0, 0},
-  {&__pyx_n_s_width, __pyx_k_width, sizeof(__pyx_k_width), 0, 0, 1, 1},
-  {&__pyx_n_s_width1, __pyx_k_width1, sizeof(__pyx_k_width1), 0, 0, 1, 1},
   {&__pyx_n_s_xtol, __pyx_k_xtol, sizeof(__pyx_k_xtol), 0, 0, 1, 1},
-  {&__pyx_n_s_xtrapl, __pyx_k_xtrapl, sizeof(__pyx_k_xtrapl), 0, 0, 1, 1},
-  {&__pyx_n_s_xtrapu, __pyx_k_xtrapu, sizeof(__pyx_k_xtrapu), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static int __Pyx_InitCachedBuiltins(void) {
   __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 218; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 231; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 799; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -6287,7 +7440,7 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":218
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":218
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
@@ -6298,7 +7451,7 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":222
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":222
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
@@ -6309,61 +7462,84 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__2);
   __Pyx_GIVEREF(__pyx_tuple__2);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":260
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":259
  *                 if ((descr.byteorder == c'>' and little_endian) or
  *                     (descr.byteorder == c'<' and not little_endian)):
  *                     raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  */
-  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 260; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_tuple__3);
   __Pyx_GIVEREF(__pyx_tuple__3);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":802
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":799
  * 
  *         if (end - f) - <int>(new_offset - offset[0]) < 15:
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
  * 
  *         if ((child.byteorder == c'>' and little_endian) or
  */
-  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor); if (unlikely(!__pyx_tuple__4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 802; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor); if (unlikely(!__pyx_tuple__4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 799; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_tuple__4);
   __Pyx_GIVEREF(__pyx_tuple__4);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":806
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":803
  *         if ((child.byteorder == c'>' and little_endian) or
  *             (child.byteorder == c'<' and not little_endian)):
  *             raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
  *             # One could encode it in the format string and have Cython
  *             # complain instead, BUT: < and > in format strings also imply
  */
-  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 803; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_tuple__5);
   __Pyx_GIVEREF(__pyx_tuple__5);
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":826
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":823
  *             t = child.type_num
  *             if end - f < 5:
  *                 raise RuntimeError(u"Format string allocated too short.")             # <<<<<<<<<<<<<<
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  */
-  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor_2); if (unlikely(!__pyx_tuple__6)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 826; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor_2); if (unlikely(!__pyx_tuple__6)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 823; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_tuple__6);
   __Pyx_GIVEREF(__pyx_tuple__6);
 
-  /* "_strong_wolfe_linesearch.pyx":229
+  /* "_strong_wolfe_linesearch.pyx":29
+ *     ERROR_STPMAX_STPMIN
+ * 
+ * task_messages = ('START', 'FG', 'CONVERGENCE',             # <<<<<<<<<<<<<<
+ *                  'WARNING: ROUNDING ERRORS PREVENT PROGRESS',
+ *                  'WARNING: XTOL TEST SATISFIED',
+ */
+  __pyx_tuple__7 = PyTuple_Pack(15, __pyx_n_s_START, __pyx_n_s_FG, __pyx_n_s_CONVERGENCE, __pyx_kp_s_WARNING_ROUNDING_ERRORS_PREVENT, __pyx_kp_s_WARNING_XTOL_TEST_SATISFIED, __pyx_kp_s_WARNING_STP_STPMAX, __pyx_kp_s_WARNING_STP_STPMIN, __pyx_kp_s_ERROR_STP_STPMIN, __pyx_kp_s_ERROR_STP_STPMAX, __pyx_kp_s_ERROR_INITIAL_G_0, __pyx_kp_s_ERROR_FTOL_0, __pyx_kp_s_ERROR_GTOL_0, __pyx_kp_s_ERROR_XTOL_0, __pyx_kp_s_ERROR_STPMIN_0, __pyx_kp_s_ERROR_STPMAX_STPMIN); if (unlikely(!__pyx_tuple__7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 29; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+
+  /* "_strong_wolfe_linesearch.pyx":453
  * 
  * @cython.boundscheck(False)
  * def dcsrch(double stp, double f, double g, double ftol, double gtol, double xtol,             # <<<<<<<<<<<<<<
  *            str task, double stpmin, double stpmax,
  *            cnp.ndarray[cnp.int32_t,ndim=1] isave,
  */
-  __pyx_tuple__7 = PyTuple_Pack(35, __pyx_n_s_stp, __pyx_n_s_f, __pyx_n_s_g, __pyx_n_s_ftol, __pyx_n_s_gtol, __pyx_n_s_xtol, __pyx_n_s_task, __pyx_n_s_stpmin, __pyx_n_s_stpmax, __pyx_n_s_isave, __pyx_n_s_dsave, __pyx_n_s_xtrapl, __pyx_n_s_xtrapu, __pyx_n_s_brackt, __pyx_n_s_stage, __pyx_n_s_finit, __pyx_n_s_ftest, __pyx_n_s_fm, __pyx_n_s_fx, __pyx_n_s_fxm, __pyx_n_s_fy, __pyx_n_s_fym, __pyx_n_s_ginit, __pyx_n_s_gtest, __pyx_n_s_gm, __pyx_n_s_gx, __pyx_n_s_gxm, __pyx_n_s_gy, __pyx_n_s_gym, __pyx_n_s_stx, __pyx_n_s_sty, __pyx_n_s_stmin, __pyx_n_s_stmax, __pyx_n_s_width, __pyx_n_s_width1); if (unlikely(!__pyx_tuple__7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__7);
-  __Pyx_GIVEREF(__pyx_tuple__7);
-  __pyx_codeobj__8 = (PyObject*)__Pyx_PyCode_New(11, 0, 35, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_Users_dpo_virtualenvs_fenics_fr, __pyx_n_s_dcsrch, 229, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__8 = PyTuple_Pack(13, __pyx_n_s_stp, __pyx_n_s_f, __pyx_n_s_g, __pyx_n_s_ftol, __pyx_n_s_gtol, __pyx_n_s_xtol, __pyx_n_s_task, __pyx_n_s_stpmin, __pyx_n_s_stpmax, __pyx_n_s_isave, __pyx_n_s_dsave, __pyx_n_s_st, __pyx_n_s_code); if (unlikely(!__pyx_tuple__8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(11, 0, 13, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_root_package_nlp_ls_src__strong, __pyx_n_s_dcsrch, 453, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "_strong_wolfe_linesearch.pyx":571
+ * 
+ * 
+ * def dcsrch_search(phi, double stp, double f, double g, double ftol,             # <<<<<<<<<<<<<<
+ *                   double gtol, double xtol, str task, double stpmin,
+ *                   double stpmax,
+ */
+  __pyx_tuple__10 = PyTuple_Pack(15, __pyx_n_s_phi, __pyx_n_s_stp, __pyx_n_s_f, __pyx_n_s_g, __pyx_n_s_ftol, __pyx_n_s_gtol, __pyx_n_s_xtol, __pyx_n_s_task, __pyx_n_s_stpmin, __pyx_n_s_stpmax, __pyx_n_s_isave, __pyx_n_s_dsave, __pyx_n_s_st, __pyx_n_s_code, __pyx_n_s_nfev); if (unlikely(!__pyx_tuple__10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
+  __pyx_codeobj__11 = (PyObject*)__Pyx_PyCode_New(12, 0, 15, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__10, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_root_package_nlp_ls_src__strong, __pyx_n_s_dcsrch_search, 571, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -6401,18 +7577,24 @@ PyMODINIT_FUNC PyInit__strong_wolfe_linesearch(void)
   }
   #endif
   __Pyx_RefNannySetupContext("PyMODINIT_FUNC PyInit__strong_wolfe_linesearch(void)", 0);
-  if ( __Pyx_check_binary_version() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_check_binary_version() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   #ifdef __Pyx_CyFunction_USED
-  if (__Pyx_CyFunction_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_CyFunction_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   #endif
   #ifdef __Pyx_FusedFunction_USED
   if (__pyx_FusedFunction_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  #endif
   #ifdef __Pyx_Generator_USED
   if (__pyx_Generator_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  #endif
   /*--- Library function declarations ---*/
   /*--- Threads initialization code ---*/
   #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
@@ -6435,12 +7617,12 @@ PyMODINIT_FUNC PyInit__strong_wolfe_linesearch(void)
   #endif
   if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
   /*--- Initialize various global constants etc. ---*/
-  if (unlikely(__Pyx_InitGlobals() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_InitGlobals() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
   if (__Pyx_init_sys_getdefaultencoding_params() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   #endif
   if (__pyx_module_is_main__strong_wolfe_linesearch) {
-    if (PyObject_SetAttrString(__pyx_m, "__name__", __pyx_n_s_main) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+    if (PyObject_SetAttrString(__pyx_m, "__name__", __pyx_n_s_main) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   #if PY_MAJOR_VERSION >= 3
   {
@@ -6451,9 +7633,9 @@ PyMODINIT_FUNC PyInit__strong_wolfe_linesearch(void)
   }
   #endif
   /*--- Builtin init code ---*/
-  if (unlikely(__Pyx_InitCachedBuiltins() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_InitCachedBuiltins() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   /*--- Constants init code ---*/
-  if (unlikely(__Pyx_InitCachedConstants() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_InitCachedConstants() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   /*--- Global init code ---*/
   /*--- Variable export code ---*/
   /*--- Function export code ---*/
@@ -6470,21 +7652,45 @@ PyMODINIT_FUNC PyInit__strong_wolfe_linesearch(void)
   __pyx_ptype_5numpy_flatiter = __Pyx_ImportType("numpy", "flatiter", sizeof(PyArrayIterObject), 0); if (unlikely(!__pyx_ptype_5numpy_flatiter)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_ptype_5numpy_broadcast = __Pyx_ImportType("numpy", "broadcast", sizeof(PyArrayMultiIterObject), 0); if (unlikely(!__pyx_ptype_5numpy_broadcast)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 172; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_ptype_5numpy_ndarray = __Pyx_ImportType("numpy", "ndarray", sizeof(PyArrayObject), 0); if (unlikely(!__pyx_ptype_5numpy_ndarray)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_5numpy_ufunc = __Pyx_ImportType("numpy", "ufunc", sizeof(PyUFuncObject), 0); if (unlikely(!__pyx_ptype_5numpy_ufunc)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 864; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_ptype_5numpy_ufunc = __Pyx_ImportType("numpy", "ufunc", sizeof(PyUFuncObject), 0); if (unlikely(!__pyx_ptype_5numpy_ufunc)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 861; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   /*--- Variable import code ---*/
   /*--- Function import code ---*/
   /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  #endif
 
-  /* "_strong_wolfe_linesearch.pyx":229
+  /* "_strong_wolfe_linesearch.pyx":29
+ *     ERROR_STPMAX_STPMIN
+ * 
+ * task_messages = ('START', 'FG', 'CONVERGENCE',             # <<<<<<<<<<<<<<
+ *                  'WARNING: ROUNDING ERRORS PREVENT PROGRESS',
+ *                  'WARNING: XTOL TEST SATISFIED',
+ */
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_task_messages, __pyx_tuple__7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 29; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "_strong_wolfe_linesearch.pyx":453
  * 
  * @cython.boundscheck(False)
  * def dcsrch(double stp, double f, double g, double ftol, double gtol, double xtol,             # <<<<<<<<<<<<<<
  *            str task, double stpmin, double stpmax,
  *            cnp.ndarray[cnp.int32_t,ndim=1] isave,
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_24_strong_wolfe_linesearch_1dcsrch, NULL, __pyx_n_s_strong_wolfe_linesearch); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_24_strong_wolfe_linesearch_1dcsrch, NULL, __pyx_n_s_strong_wolfe_linesearch); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_dcsrch, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "_strong_wolfe_linesearch.pyx":571
+ * 
+ * 
+ * def dcsrch_search(phi, double stp, double f, double g, double ftol,             # <<<<<<<<<<<<<<
+ *                   double gtol, double xtol, str task, double stpmin,
+ *                   double stpmax,
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_24_strong_wolfe_linesearch_3dcsrch_search, NULL, __pyx_n_s_strong_wolfe_linesearch); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_dcsrch, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_dcsrch_search, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "_strong_wolfe_linesearch.pyx":1
@@ -6497,7 +7703,7 @@ PyMODINIT_FUNC PyInit__strong_wolfe_linesearch(void)
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "../../../../../../../../../usr/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":979
+  /* "../../../../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":976
  *      arr.base = baseptr
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -6505,42 +7711,264 @@ PyMODINIT_FUNC PyInit__strong_wolfe_linesearch(void)
  *         return None
  */
 
-  /*--- Wrapped vars code ---*/
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init _strong_wolfe_linesearch", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_DECREF(__pyx_m); __pyx_m = 0;
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init _strong_wolfe_linesearch");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if PY_MAJOR_VERSION < 3
+  return;
+  #else
+  return __pyx_m;
+  #endif
+}
+
+/* --- Runtime support code --- */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule((char *)modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, (char *)"RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+    if (s1 == s2) {
+        return (equals == Py_EQ);
+    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
+        const char *ps1, *ps2;
+        Py_ssize_t length = PyBytes_GET_SIZE(s1);
+        if (length != PyBytes_GET_SIZE(s2))
+            return (equals == Py_NE);
+        ps1 = PyBytes_AS_STRING(s1);
+        ps2 = PyBytes_AS_STRING(s2);
+        if (ps1[0] != ps2[0]) {
+            return (equals == Py_NE);
+        } else if (length == 1) {
+            return (equals == Py_EQ);
+        } else {
+            int result = memcmp(ps1, ps2, (size_t)length);
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
+        return (equals == Py_NE);
+    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
+        return (equals == Py_NE);
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+#endif
+}
+
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+#if PY_MAJOR_VERSION < 3
+    PyObject* owned_ref = NULL;
+#endif
+    int s1_is_unicode, s2_is_unicode;
+    if (s1 == s2) {
+        goto return_eq;
+    }
+    s1_is_unicode = PyUnicode_CheckExact(s1);
+    s2_is_unicode = PyUnicode_CheckExact(s2);
+#if PY_MAJOR_VERSION < 3
+    if ((s1_is_unicode & (!s2_is_unicode)) && PyString_CheckExact(s2)) {
+        owned_ref = PyUnicode_FromObject(s2);
+        if (unlikely(!owned_ref))
+            return -1;
+        s2 = owned_ref;
+        s2_is_unicode = 1;
+    } else if ((s2_is_unicode & (!s1_is_unicode)) && PyString_CheckExact(s1)) {
+        owned_ref = PyUnicode_FromObject(s1);
+        if (unlikely(!owned_ref))
+            return -1;
+        s1 = owned_ref;
+        s1_is_unicode = 1;
+    } else if (((!s2_is_unicode) & (!s1_is_unicode))) {
+        return __Pyx_PyBytes_Equals(s1, s2, equals);
+    }
+#endif
+    if (s1_is_unicode & s2_is_unicode) {
+        Py_ssize_t length;
+        int kind;
+        void *data1, *data2;
+        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
+            return -1;
+        length = __Pyx_PyUnicode_GET_LENGTH(s1);
+        if (length != __Pyx_PyUnicode_GET_LENGTH(s2)) {
+            goto return_ne;
+        }
+        kind = __Pyx_PyUnicode_KIND(s1);
+        if (kind != __Pyx_PyUnicode_KIND(s2)) {
+            goto return_ne;
+        }
+        data1 = __Pyx_PyUnicode_DATA(s1);
+        data2 = __Pyx_PyUnicode_DATA(s2);
+        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
+            goto return_ne;
+        } else if (length == 1) {
+            goto return_eq;
+        } else {
+            int result = memcmp(data1, data2, (size_t)(length * kind));
+            #if PY_MAJOR_VERSION < 3
+            Py_XDECREF(owned_ref);
+            #endif
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & s2_is_unicode) {
+        goto return_ne;
+    } else if ((s2 == Py_None) & s1_is_unicode) {
+        goto return_ne;
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+return_eq:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_EQ);
+return_ne:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_NE);
+#endif
+}
+
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON
+    result = PyDict_GetItem(__pyx_d, name);
+    if (likely(result)) {
+        Py_INCREF(result);
+    } else {
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    if (!result) {
+        PyErr_Clear();
+#endif
+        result = __Pyx_GetBuiltinName(name);
+    }
+    return result;
+}
+
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = func->ob_type->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
 
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  if (__pyx_m) {
-    if (__pyx_d) {
-      __Pyx_AddTraceback("init _strong_wolfe_linesearch", __pyx_clineno, __pyx_lineno, __pyx_filename);
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
     }
-    Py_DECREF(__pyx_m); __pyx_m = 0;
-  } else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_ImportError, "init _strong_wolfe_linesearch");
-  }
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  #if PY_MAJOR_VERSION < 3
-  return;
-  #else
-  return __pyx_m;
-  #endif
+    return result;
 }
+#endif
 
-/* --- Runtime support code --- */
-#if CYTHON_REFNANNY
-static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
-    PyObject *m = NULL, *p = NULL;
-    void *r = NULL;
-    m = PyImport_ImportModule((char *)modname);
-    if (!m) goto end;
-    p = PyObject_GetAttrString(m, (char *)"RefNannyAPI");
-    if (!p) goto end;
-    r = PyLong_AsVoidPtr(p);
-end:
-    Py_XDECREF(p);
-    Py_XDECREF(m);
-    return (__Pyx_RefNannyAPIStruct *)r;
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#ifdef __Pyx_CyFunction_USED
+    if (likely(PyCFunction_Check(func) || PyObject_TypeCheck(func, __pyx_CyFunctionType))) {
+#else
+    if (likely(PyCFunction_Check(func))) {
+#endif
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
 }
 #endif
 
@@ -7258,139 +8686,85 @@ static CYTHON_INLINE void __Pyx_SafeReleaseBuffer(Py_buffer* info) {
   __Pyx_ReleaseBuffer(info);
 }
 
-static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
-#if CYTHON_COMPILING_IN_PYPY
-    return PyObject_RichCompareBool(s1, s2, equals);
-#else
-    if (s1 == s2) {
-        return (equals == Py_EQ);
-    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
-        const char *ps1, *ps2;
-        Py_ssize_t length = PyBytes_GET_SIZE(s1);
-        if (length != PyBytes_GET_SIZE(s2))
-            return (equals == Py_NE);
-        ps1 = PyBytes_AS_STRING(s1);
-        ps2 = PyBytes_AS_STRING(s2);
-        if (ps1[0] != ps2[0]) {
-            return (equals == Py_NE);
-        } else if (length == 1) {
-            return (equals == Py_EQ);
-        } else {
-            int result = memcmp(ps1, ps2, (size_t)length);
-            return (equals == Py_EQ) ? (result == 0) : (result != 0);
-        }
-    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
-        return (equals == Py_NE);
-    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
-        return (equals == Py_NE);
-    } else {
-        int result;
-        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
-        if (!py_result)
-            return -1;
-        result = __Pyx_PyObject_IsTrue(py_result);
-        Py_DECREF(py_result);
-        return result;
-    }
-#endif
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
 }
-
-static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
-#if CYTHON_COMPILING_IN_PYPY
-    return PyObject_RichCompareBool(s1, s2, equals);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (wraparound & unlikely(i < 0)) i += PyList_GET_SIZE(o);
+    if ((!boundscheck) || likely((0 <= i) & (i < PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
 #else
-#if PY_MAJOR_VERSION < 3
-    PyObject* owned_ref = NULL;
+    return PySequence_GetItem(o, i);
 #endif
-    int s1_is_unicode, s2_is_unicode;
-    if (s1 == s2) {
-        goto return_eq;
-    }
-    s1_is_unicode = PyUnicode_CheckExact(s1);
-    s2_is_unicode = PyUnicode_CheckExact(s2);
-#if PY_MAJOR_VERSION < 3
-    if ((s1_is_unicode & (!s2_is_unicode)) && PyString_CheckExact(s2)) {
-        owned_ref = PyUnicode_FromObject(s2);
-        if (unlikely(!owned_ref))
-            return -1;
-        s2 = owned_ref;
-        s2_is_unicode = 1;
-    } else if ((s2_is_unicode & (!s1_is_unicode)) && PyString_CheckExact(s1)) {
-        owned_ref = PyUnicode_FromObject(s1);
-        if (unlikely(!owned_ref))
-            return -1;
-        s1 = owned_ref;
-        s1_is_unicode = 1;
-    } else if (((!s2_is_unicode) & (!s1_is_unicode))) {
-        return __Pyx_PyBytes_Equals(s1, s2, equals);
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (wraparound & unlikely(i < 0)) i += PyTuple_GET_SIZE(o);
+    if ((!boundscheck) || likely((0 <= i) & (i < PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, i);
+        Py_INCREF(r);
+        return r;
     }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
 #endif
-    if (s1_is_unicode & s2_is_unicode) {
-        Py_ssize_t length;
-        int kind;
-        void *data1, *data2;
-        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
-            return -1;
-        length = __Pyx_PyUnicode_GET_LENGTH(s1);
-        if (length != __Pyx_PyUnicode_GET_LENGTH(s2)) {
-            goto return_ne;
-        }
-        kind = __Pyx_PyUnicode_KIND(s1);
-        if (kind != __Pyx_PyUnicode_KIND(s2)) {
-            goto return_ne;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely((n >= 0) & (n < PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
         }
-        data1 = __Pyx_PyUnicode_DATA(s1);
-        data2 = __Pyx_PyUnicode_DATA(s2);
-        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
-            goto return_ne;
-        } else if (length == 1) {
-            goto return_eq;
-        } else {
-            int result = memcmp(data1, data2, (size_t)(length * kind));
-            #if PY_MAJOR_VERSION < 3
-            Py_XDECREF(owned_ref);
-            #endif
-            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely((n >= 0) & (n < PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
         }
-    } else if ((s1 == Py_None) & s2_is_unicode) {
-        goto return_ne;
-    } else if ((s2 == Py_None) & s1_is_unicode) {
-        goto return_ne;
     } else {
-        int result;
-        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
-        if (!py_result)
-            return -1;
-        result = __Pyx_PyObject_IsTrue(py_result);
-        Py_DECREF(py_result);
-        return result;
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (PyErr_ExceptionMatches(PyExc_OverflowError))
+                        PyErr_Clear();
+                    else
+                        return NULL;
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
     }
-return_eq:
-    #if PY_MAJOR_VERSION < 3
-    Py_XDECREF(owned_ref);
-    #endif
-    return (equals == Py_EQ);
-return_ne:
-    #if PY_MAJOR_VERSION < 3
-    Py_XDECREF(owned_ref);
-    #endif
-    return (equals == Py_NE);
 #endif
-}
-
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
-    PyErr_Format(PyExc_ValueError,
-                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
-}
-
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
-    PyErr_Format(PyExc_ValueError,
-                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
-                 index, (index == 1) ? "" : "s");
-}
-
-static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
 }
 
 static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
@@ -7424,37 +8798,61 @@ static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyOb
 #endif
 }
 
-static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
-    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
-    if (unlikely(!result)) {
-        PyErr_Format(PyExc_NameError,
-#if PY_MAJOR_VERSION >= 3
-            "name '%U' is not defined", name);
-#else
-            "name '%.200s' is not defined", PyString_AS_STRING(name));
-#endif
-    }
-    return result;
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+    PyErr_Format(PyExc_ValueError,
+                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
+}
+
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    PyErr_Format(PyExc_ValueError,
+                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
+                 index, (index == 1) ? "" : "s");
 }
 
+static CYTHON_INLINE int __Pyx_IterFinish(void) {
 #if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
-    PyObject *result;
-    ternaryfunc call = func->ob_type->tp_call;
-    if (unlikely(!call))
-        return PyObject_Call(func, arg, kw);
-    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
-        return NULL;
-    result = (*call)(func, arg, kw);
-    Py_LeaveRecursiveCall();
-    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
-        PyErr_SetString(
-            PyExc_SystemError,
-            "NULL result without error in PyObject_Call");
+    PyThreadState *tstate = PyThreadState_GET();
+    PyObject* exc_type = tstate->curexc_type;
+    if (unlikely(exc_type)) {
+        if (likely(exc_type == PyExc_StopIteration) || PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration)) {
+            PyObject *exc_value, *exc_tb;
+            exc_value = tstate->curexc_value;
+            exc_tb = tstate->curexc_traceback;
+            tstate->curexc_type = 0;
+            tstate->curexc_value = 0;
+            tstate->curexc_traceback = 0;
+            Py_DECREF(exc_type);
+            Py_XDECREF(exc_value);
+            Py_XDECREF(exc_tb);
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#else
+    if (unlikely(PyErr_Occurred())) {
+        if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) {
+            PyErr_Clear();
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#endif
+}
+
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+    if (unlikely(retval)) {
+        Py_DECREF(retval);
+        __Pyx_RaiseTooManyValuesError(expected);
+        return -1;
+    } else {
+        return __Pyx_IterFinish();
     }
-    return result;
+    return 0;
 }
-#endif
 
 #if PY_MAJOR_VERSION < 3
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
@@ -7530,10 +8928,13 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
         if (value && PyExceptionInstance_Check(value)) {
             instance_class = (PyObject*) Py_TYPE(value);
             if (instance_class != type) {
-                if (PyObject_IsSubclass(instance_class, type)) {
-                    type = instance_class;
-                } else {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
                     instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
                 }
             }
         }
@@ -7593,7 +8994,7 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
     if (tb) {
 #if CYTHON_COMPILING_IN_PYPY
         PyObject *tmp_type, *tmp_value, *tmp_tb;
-        PyErr_Fetch(tmp_type, tmp_value, tmp_tb);
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
         Py_INCREF(tb);
         PyErr_Restore(tmp_type, tmp_value, tb);
         Py_XDECREF(tmp_tb);
@@ -7613,6 +9014,10 @@ bad:
 }
 #endif
 
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+}
+
 static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
     if (unlikely(!type)) {
         PyErr_SetString(PyExc_SystemError, "Missing type object");
@@ -7631,7 +9036,7 @@ static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int co
         return count;
     }
     while (start < end) {
-        mid = (start + end) / 2;
+        mid = start + (end - start) / 2;
         if (code_line < entries[mid].code_line) {
             end = mid;
         } else if (code_line > entries[mid].code_line) {
@@ -7805,7 +9210,242 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
 #endif
 
 
-    #if CYTHON_CCOMPLEX
+        #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+#if CYTHON_USE_PYLONG_INTERNALS
+  #include "longintrepr.h"
+#endif
+
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+    const int neg_one = (int) -1, const_zero = (int) 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, -(sdigit) digits[0])
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_Int(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_Int(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+    const int neg_one = (int) -1, const_zero = (int) 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+#if CYTHON_CCOMPLEX
   #ifdef __cplusplus
     static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
       return ::std::complex< float >(x, y);
@@ -8045,164 +9685,48 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
     #endif
 #endif
 
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
-    const int neg_one = (int) -1, const_zero = 0;
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_enum__NPY_TYPES(enum NPY_TYPES value) {
+    const enum NPY_TYPES neg_one = (enum NPY_TYPES) -1, const_zero = (enum NPY_TYPES) 0;
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
-        if (sizeof(int) < sizeof(long)) {
+        if (sizeof(enum NPY_TYPES) < sizeof(long)) {
             return PyInt_FromLong((long) value);
-        } else if (sizeof(int) <= sizeof(unsigned long)) {
+        } else if (sizeof(enum NPY_TYPES) <= sizeof(unsigned long)) {
             return PyLong_FromUnsignedLong((unsigned long) value);
-        } else if (sizeof(int) <= sizeof(unsigned long long)) {
-            return PyLong_FromUnsignedLongLong((unsigned long long) value);
+        } else if (sizeof(enum NPY_TYPES) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
         }
     } else {
-        if (sizeof(int) <= sizeof(long)) {
+        if (sizeof(enum NPY_TYPES) <= sizeof(long)) {
             return PyInt_FromLong((long) value);
-        } else if (sizeof(int) <= sizeof(long long)) {
-            return PyLong_FromLongLong((long long) value);
+        } else if (sizeof(enum NPY_TYPES) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
         }
     }
     {
         int one = 1; int little = (int)*(unsigned char *)&one;
         unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(int),
+        return _PyLong_FromByteArray(bytes, sizeof(enum NPY_TYPES),
                                      little, !is_unsigned);
     }
 }
 
-#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)       \
-    {                                                                     \
-        func_type value = func_value;                                     \
-        if (sizeof(target_type) < sizeof(func_type)) {                    \
-            if (unlikely(value != (func_type) (target_type) value)) {     \
-                func_type zero = 0;                                       \
-                if (is_unsigned && unlikely(value < zero))                \
-                    goto raise_neg_overflow;                              \
-                else                                                      \
-                    goto raise_overflow;                                  \
-            }                                                             \
-        }                                                                 \
-        return (target_type) value;                                       \
-    }
-
-#if CYTHON_COMPILING_IN_CPYTHON && PY_MAJOR_VERSION >= 3
- #if CYTHON_USE_PYLONG_INTERNALS
-  #include "longintrepr.h"
- #endif
-#endif
-
-static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
-    const int neg_one = (int) -1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_Check(x))) {
-        if (sizeof(int) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
-        } else {
-            long val = PyInt_AS_LONG(x);
-            if (is_unsigned && unlikely(val < 0)) {
-                goto raise_neg_overflow;
-            }
-            return (int) val;
-        }
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-#if CYTHON_COMPILING_IN_CPYTHON && PY_MAJOR_VERSION >= 3
- #if CYTHON_USE_PYLONG_INTERNALS
-            switch (Py_SIZE(x)) {
-                case  0: return 0;
-                case  1: __PYX_VERIFY_RETURN_INT(int, digit, ((PyLongObject*)x)->ob_digit[0]);
-            }
- #endif
-#endif
-            if (unlikely(Py_SIZE(x) < 0)) {
-                goto raise_neg_overflow;
-            }
-            if (sizeof(int) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT(int, unsigned long, PyLong_AsUnsignedLong(x))
-            } else if (sizeof(int) <= sizeof(unsigned long long)) {
-                __PYX_VERIFY_RETURN_INT(int, unsigned long long, PyLong_AsUnsignedLongLong(x))
-            }
-        } else {
-#if CYTHON_COMPILING_IN_CPYTHON && PY_MAJOR_VERSION >= 3
- #if CYTHON_USE_PYLONG_INTERNALS
-            switch (Py_SIZE(x)) {
-                case  0: return 0;
-                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +(((PyLongObject*)x)->ob_digit[0]));
-                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, -(sdigit) ((PyLongObject*)x)->ob_digit[0]);
-            }
- #endif
-#endif
-            if (sizeof(int) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT(int, long, PyLong_AsLong(x))
-            } else if (sizeof(int) <= sizeof(long long)) {
-                __PYX_VERIFY_RETURN_INT(int, long long, PyLong_AsLongLong(x))
-            }
-        }
-        {
-#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
-            PyErr_SetString(PyExc_RuntimeError,
-                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
-#else
-            int val;
-            PyObject *v = __Pyx_PyNumber_Int(x);
- #if PY_MAJOR_VERSION < 3
-            if (likely(v) && !PyLong_Check(v)) {
-                PyObject *tmp = v;
-                v = PyNumber_Long(tmp);
-                Py_DECREF(tmp);
-            }
- #endif
-            if (likely(v)) {
-                int one = 1; int is_little = (int)*(unsigned char *)&one;
-                unsigned char *bytes = (unsigned char *)&val;
-                int ret = _PyLong_AsByteArray((PyLongObject *)v,
-                                              bytes, sizeof(val),
-                                              is_little, !is_unsigned);
-                Py_DECREF(v);
-                if (likely(!ret))
-                    return val;
-            }
-#endif
-            return (int) -1;
-        }
-    } else {
-        int val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (int) -1;
-        val = __Pyx_PyInt_As_int(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-raise_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to int");
-    return (int) -1;
-raise_neg_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to int");
-    return (int) -1;
-}
-
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
-    const long neg_one = (long) -1, const_zero = 0;
+    const long neg_one = (long) -1, const_zero = (long) 0;
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
         if (sizeof(long) < sizeof(long)) {
             return PyInt_FromLong((long) value);
         } else if (sizeof(long) <= sizeof(unsigned long)) {
             return PyLong_FromUnsignedLong((unsigned long) value);
-        } else if (sizeof(long) <= sizeof(unsigned long long)) {
-            return PyLong_FromUnsignedLongLong((unsigned long long) value);
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
         }
     } else {
         if (sizeof(long) <= sizeof(long)) {
             return PyInt_FromLong((long) value);
-        } else if (sizeof(long) <= sizeof(long long)) {
-            return PyLong_FromLongLong((long long) value);
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
         }
     }
     {
@@ -8214,7 +9738,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
 }
 
 static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
-    const long neg_one = (long) -1, const_zero = 0;
+    const long neg_one = (long) -1, const_zero = (long) 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -8231,36 +9755,125 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
 #endif
     if (likely(PyLong_Check(x))) {
         if (is_unsigned) {
-#if CYTHON_COMPILING_IN_CPYTHON && PY_MAJOR_VERSION >= 3
- #if CYTHON_USE_PYLONG_INTERNALS
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return 0;
-                case  1: __PYX_VERIFY_RETURN_INT(long, digit, ((PyLongObject*)x)->ob_digit[0]);
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
             }
- #endif
 #endif
+#if CYTHON_COMPILING_IN_CPYTHON
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
             if (sizeof(long) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT(long, unsigned long, PyLong_AsUnsignedLong(x))
-            } else if (sizeof(long) <= sizeof(unsigned long long)) {
-                __PYX_VERIFY_RETURN_INT(long, unsigned long long, PyLong_AsUnsignedLongLong(x))
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
             }
         } else {
-#if CYTHON_COMPILING_IN_CPYTHON && PY_MAJOR_VERSION >= 3
- #if CYTHON_USE_PYLONG_INTERNALS
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return 0;
-                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +(((PyLongObject*)x)->ob_digit[0]));
-                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, -(sdigit) ((PyLongObject*)x)->ob_digit[0]);
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, -(sdigit) digits[0])
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
             }
- #endif
 #endif
             if (sizeof(long) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT(long, long, PyLong_AsLong(x))
-            } else if (sizeof(long) <= sizeof(long long)) {
-                __PYX_VERIFY_RETURN_INT(long, long long, PyLong_AsLongLong(x))
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
             }
         }
         {
@@ -8442,7 +10055,7 @@ static CYTHON_INLINE char* __Pyx_PyObject_AsString(PyObject* o) {
     return __Pyx_PyObject_AsStringAndSize(o, &ignore);
 }
 static CYTHON_INLINE char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
-#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if CYTHON_COMPILING_IN_CPYTHON && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
     if (
 #if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
             __Pyx_sys_getdefaultencoding_not_ascii &&
@@ -8483,7 +10096,7 @@ static CYTHON_INLINE char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_
 #endif
     } else
 #endif
-#if !CYTHON_COMPILING_IN_PYPY
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
     if (PyByteArray_Check(o)) {
         *length = PyByteArray_GET_SIZE(o);
         return PyByteArray_AS_STRING(o);
@@ -8513,7 +10126,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
 #else
   if (PyLong_Check(x))
 #endif
-    return Py_INCREF(x), x;
+    return __Pyx_NewRef(x);
   m = Py_TYPE(x)->tp_as_number;
 #if PY_MAJOR_VERSION < 3
   if (m && m->nb_int) {
@@ -8553,18 +10166,55 @@ static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
   Py_ssize_t ival;
   PyObject *x;
 #if PY_MAJOR_VERSION < 3
-  if (likely(PyInt_CheckExact(b)))
-      return PyInt_AS_LONG(b);
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(x);
+  }
 #endif
   if (likely(PyLong_CheckExact(b))) {
-    #if CYTHON_COMPILING_IN_CPYTHON && PY_MAJOR_VERSION >= 3
-     #if CYTHON_USE_PYLONG_INTERNALS
-       switch (Py_SIZE(b)) {
-       case -1: return -(sdigit)((PyLongObject*)b)->ob_digit[0];
-       case  0: return 0;
-       case  1: return ((PyLongObject*)b)->ob_digit[0];
-       }
-     #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
     #endif
     return PyLong_AsSsize_t(b);
   }
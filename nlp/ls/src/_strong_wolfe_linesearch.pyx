@@ -4,11 +4,55 @@ cimport cython
 
 cdef extern from "math.h":
         double sqrt(double x) nogil
+        double fabs(double x) nogil
+
+
+# Values of the task. The corresponding strings, used by the Python
+# interface, are listed in `task_messages`.
+cdef enum:
+    START = 0
+    FG
+    CONVERGENCE
+    WARNING_ROUNDING
+    WARNING_XTOL
+    WARNING_STPMAX
+    WARNING_STPMIN
+    ERROR_STP_STPMIN
+    ERROR_STP_STPMAX
+    ERROR_INITIAL_G
+    ERROR_FTOL
+    ERROR_GTOL
+    ERROR_XTOL
+    ERROR_STPMIN
+    ERROR_STPMAX_STPMIN
+
+task_messages = ('START', 'FG', 'CONVERGENCE',
+                 'WARNING: ROUNDING ERRORS PREVENT PROGRESS',
+                 'WARNING: XTOL TEST SATISFIED',
+                 'WARNING: STP = STPMAX',
+                 'WARNING: STP = STPMIN',
+                 'ERROR: STP < STPMIN',
+                 'ERROR: STP > STPMAX',
+                 'ERROR: INITIAL G >= 0',
+                 'ERROR: FTOL < 0',
+                 'ERROR: GTOL < 0',
+                 'ERROR: XTOL < 0',
+                 'ERROR: STPMIN < 0',
+                 'ERROR: STPMAX < STPMIN')
+
+
+# Local variables of dcsrch preserved between calls.
+cdef struct dcsrch_state:
+    bint brackt
+    int stage
+    double ginit, gtest, gx, gy, finit, fx, fy
+    double stx, sty, stmin, stmax, width, width1
 
 @cython.cdivision(True)
-cdef tuple dcstep(double stx, double fx, double dx, double sty, double fy, double dy,
-                  double stp, double fp, double dp, bint brackt, double stpmin,
-                  double stpmax):
+cdef (double, double, double, double, double, double, double, bint) \
+        dcstep(double stx, double fx, double dx, double sty, double fy,
+               double dy, double stp, double fp, double dp, bint brackt,
+               double stpmin, double stpmax) nogil:
     """
      This subroutine computes a safeguarded step for a search
      procedure and updates an interval that contains a step that
@@ -87,7 +131,7 @@ cdef tuple dcstep(double stx, double fx, double dx, double sty, double fy, doubl
     cdef:
         double gamma, p, q, r, s, sgnd, stpc, stpf, stpq, theta
 
-    sgnd = dp*(dx/abs(dx))
+    sgnd = dp*(dx/fabs(dx))
 
     # First case: A higher function value. The minimum is bracketed.
     # If the cubic step is closer to stx than the quadratic step, the
@@ -95,7 +139,7 @@ cdef tuple dcstep(double stx, double fx, double dx, double sty, double fy, doubl
     # quadratic steps is taken.
     if fp > fx:
         theta = 3*(fx-fp)/(stp-stx) + dx + dp
-        s = max(abs(theta),abs(dx),abs(dp))
+        s = max(fabs(theta),fabs(dx),fabs(dp))
         gamma = s*sqrt((theta/s)**2-(dx/s)*(dp/s))
         if stp < stx:
             gamma = -gamma
@@ -104,7 +148,7 @@ cdef tuple dcstep(double stx, double fx, double dx, double sty, double fy, doubl
         r = p/q
         stpc = stx + r*(stp-stx)
         stpq = stx + ((dx/((fx-fp)/(stp-stx)+dx))/2)*(stp-stx)
-        if abs(stpc-stx) < abs(stpq-stx):
+        if fabs(stpc-stx) < fabs(stpq-stx):
             stpf = stpc
         else:
             stpf = stpc + (stpq-stpc)/2
@@ -116,7 +160,7 @@ cdef tuple dcstep(double stx, double fx, double dx, double sty, double fy, doubl
     # secant step is taken.
     elif sgnd < 0:
         theta = 3*(fx-fp)/(stp-stx) + dx + dp
-        s = max(abs(theta),abs(dx),abs(dp))
+        s = max(fabs(theta),fabs(dx),fabs(dp))
         gamma = s*sqrt((theta/s)**2-(dx/s)*(dp/s))
         if stp > stx:
             gamma = -gamma
@@ -125,7 +169,7 @@ cdef tuple dcstep(double stx, double fx, double dx, double sty, double fy, doubl
         r = p/q
         stpc = stp + r*(stx-stp)
         stpq = stp + (dp/(dp-dx))*(stx-stp)
-        if abs(stpc-stp) > abs(stpq-stp):
+        if fabs(stpc-stp) > fabs(stpq-stp):
             stpf = stpc
         else:
             stpf = stpq
@@ -133,14 +177,14 @@ cdef tuple dcstep(double stx, double fx, double dx, double sty, double fy, doubl
 
     # Third case: A lower function value, derivatives of the same sign,
     # and the magnitude of the derivative decreases.
-    elif abs(dp) < abs(dx):
+    elif fabs(dp) < fabs(dx):
 
         # The cubic step is computed only if the cubic tends to infinity
         # in the direction of the step or if the minimum of the cubic
         # is beyond stp. Otherwise the cubic step is defined to be the
         # secant step.
         theta = 3*(fx-fp)/(stp-stx) + dx + dp
-        s = max(abs(theta),abs(dx),abs(dp))
+        s = max(fabs(theta),fabs(dx),fabs(dp))
 
         # The case gamma = 0 only arises if the cubic does not tend
         # to infinity in the direction of the step.
@@ -163,7 +207,7 @@ cdef tuple dcstep(double stx, double fx, double dx, double sty, double fy, doubl
             # A minimizer has been bracketed. If the cubic step is
             # closer to stp than the secant step, the cubic step is
             # taken, otherwise the secant step is taken.
-            if abs(stpc-stp) < abs(stpq-stp):
+            if fabs(stpc-stp) < fabs(stpq-stp):
                 stpf = stpc
             else:
                 stpf = stpq
@@ -177,7 +221,7 @@ cdef tuple dcstep(double stx, double fx, double dx, double sty, double fy, doubl
             # A minimizer has not been bracketed. If the cubic step is
             # farther from stp than the secant step, the cubic step is
             # taken, otherwise the secant step is taken.
-            if abs(stpc-stp) > abs(stpq-stp):
+            if fabs(stpc-stp) > fabs(stpq-stp):
                 stpf = stpc
             else:
                 stpf = stpq
@@ -192,7 +236,7 @@ cdef tuple dcstep(double stx, double fx, double dx, double sty, double fy, doubl
     else:
         if brackt:
             theta = 3*(fp-fy)/(sty-stp) + dy + dp
-            s = max(abs(theta),abs(dy),abs(dp))
+            s = max(fabs(theta),fabs(dy),fabs(dp))
             gamma = s*sqrt((theta/s)**2-(dy/s)*(dp/s))
             if stp > sty:
                 gamma = -gamma
@@ -225,6 +269,186 @@ cdef tuple dcstep(double stx, double fx, double dx, double sty, double fy, doubl
 
     return stx, fx, dx, sty, fy, dy, stp, brackt
 
+@cython.cdivision(True)
+cdef int dcsrch_core(double *pstp, double f, double g, double ftol,
+                     double gtol, double xtol, int task, double stpmin,
+                     double stpmax, dcsrch_state *st) nogil:
+    """
+    Typed counterpart of `dcsrch`. The task is one of the values of the
+    enumeration above, the current step is read from and written to
+    `pstp` and the local variables are kept in `st`. Return the new task.
+    """
+    cdef:
+        double xtrapl=1.1, xtrapu=4
+        double stp = pstp[0]
+        bint brackt
+        int stage
+        double finit, ftest, fm, fx, fxm, fy, fym
+        double ginit, gtest, gm, gx, gxm, gy, gym, stx, sty, stmin, stmax
+        double width, width1
+
+    # Initialization block.
+    if task == START:
+
+        # Check the input arguments for errors.
+        if stp < stpmin: task = ERROR_STP_STPMIN
+        if stp > stpmax: task = ERROR_STP_STPMAX
+        if g >= 0: task = ERROR_INITIAL_G
+        if ftol < 0: task = ERROR_FTOL
+        if gtol < 0: task = ERROR_GTOL
+        if xtol < 0: task = ERROR_XTOL
+        if stpmin < 0: task = ERROR_STPMIN
+        if stpmax < stpmin: task = ERROR_STPMAX_STPMIN
+
+        # Exit if there are errors on input.
+        if task != START:
+            return task
+
+        # Initialize local variables.
+        # The variables stx, fx, gx contain the values of the step,
+        # function, and derivative at the best step.
+        # The variables sty, fy, gy contain the value of the step,
+        # function, and derivative at sty.
+        # The variables stp, f, g contain the values of the step,
+        # function, and derivative at stp.
+        st.brackt = False
+        st.stage = 1
+        st.finit = f
+        st.ginit = g
+        st.gtest = ftol*g
+        st.width = stpmax - stpmin
+        st.width1 = st.width/0.5
+        st.stx = 0
+        st.fx = f
+        st.gx = g
+        st.sty = 0
+        st.fy = f
+        st.gy = g
+        st.stmin = 0
+        st.stmax = stp + xtrapu*stp
+        return FG
+
+    # Restore local variables.
+    brackt = st.brackt
+    stage = st.stage
+    ginit = st.ginit
+    gtest = st.gtest
+    gx = st.gx
+    gy = st.gy
+    finit = st.finit
+    fx = st.fx
+    fy = st.fy
+    stx = st.stx
+    sty = st.sty
+    stmin = st.stmin
+    stmax = st.stmax
+    width = st.width
+    width1 = st.width1
+
+    # If psi(stp) <= 0 and f'(stp) >= 0 for some step, then the
+    # algorithm enters the second stage.
+
+    ftest = finit + stp*gtest
+    if stage == 1 and f <= ftest and g >= 0: stage = 2
+
+    # Test for warnings.
+    if brackt and (stp <= stmin or stp >= stmax):
+        task = WARNING_ROUNDING
+    if brackt and stmax-stmin <= xtol*stmax:
+        task = WARNING_XTOL
+    if stp == stpmax and f <= ftest and g <= gtest:
+        task = WARNING_STPMAX
+    if stp == stpmin and (f > ftest or g >= gtest):
+        task = WARNING_STPMIN
+
+    # Test for convergence.
+    if f <= ftest and fabs(g) <= gtol*(-ginit):
+        task = CONVERGENCE
+
+    # Test for termination.
+    if task == CONVERGENCE or WARNING_ROUNDING <= task <= WARNING_STPMIN:
+        st.stage = stage
+        return task
+
+    # A modified function is used to predict the step during the
+    # first stage if a lower function value has been obtained but
+    # the decrease is not sufficient.
+
+    if stage == 1 and f <= fx and f > ftest:
+
+        # Define the modified function and derivative values.
+        fm = f - stp*gtest
+        fxm = fx - stx*gtest
+        fym = fy - sty*gtest
+        gm = g - gtest
+        gxm = gx - gtest
+        gym = gy - gtest
+
+        # Call dcstep to update stx, sty, and to compute the new step.
+        stx, fxm, gxm, sty, fym, gym, stp, brackt = \
+            dcstep(stx, fxm, gxm, sty, fym, gym, stp, fm, gm, brackt,
+                   stmin, stmax)
+
+        # Reset the function and derivative values for f.
+        fx = fxm + stx*gtest
+        fy = fym + sty*gtest
+        gx = gxm + gtest
+        gy = gym + gtest
+    else:
+        # Call dcstep to update stx, sty, and to compute the new step.
+        stx, fx, gx, sty, fy, gy, stp, brackt = \
+            dcstep(stx, fx, gx, sty, fy, gy, stp, f, g, brackt, stmin, stmax)
+
+    # Decide if a bisection step is needed.
+    if brackt:
+        if fabs(sty-stx) >= 0.66*width1:
+            stp = stx + 0.5*(sty-stx)
+        width1 = width
+        width = fabs(sty-stx)
+
+    # Set the minimum and maximum steps allowed for stp.
+    if brackt:
+        stmin = min(stx,sty)
+        stmax = max(stx,sty)
+    else:
+        stmin = stp + xtrapl*(stp-stx)
+        stmax = stp + xtrapu*(stp-stx)
+
+    # Force the step to be within the bounds stpmax and stpmin.
+    stp = max(stp,stpmin)
+    stp = min(stp,stpmax)
+
+    # If further progress is not possible, let stp be the best
+    # point obtained during the search.
+    if brackt and (stp <= stmin or stp >= stmax) or \
+       (brackt and stmax-stmin <= xtol*stmax):
+        stp = stx
+
+    # Save local variables and obtain another function and derivative.
+    st.brackt = brackt
+    st.stage = stage
+    st.gx = gx
+    st.gy = gy
+    st.fx = fx
+    st.fy = fy
+    st.stx = stx
+    st.sty = sty
+    st.stmin = stmin
+    st.stmax = stmax
+    st.width = width
+    st.width1 = width1
+    pstp[0] = stp
+    return FG
+
+
+cdef int task_code(str task) except -1:
+    if task[0:5] == 'START':
+        return START
+    if task[0:2] == 'FG':
+        return FG
+    return task_messages.index(task)
+
+
 @cython.boundscheck(False)
 def dcsrch(double stp, double f, double g, double ftol, double gtol, double xtol,
            str task, double stpmin, double stpmax,
@@ -330,194 +554,93 @@ def dcsrch(double stp, double f, double g, double ftol, double gtol, double xtol
     dsave is a double precision work array of dimension 13.
     """
     cdef:
-        double xtrapl=1.1, xtrapu=4
-        bint brackt
-        int stage
-        double finit, ftest, fm, fx, fxm, fy, fym
-        double ginit, gtest, gm, gx, gxm, gy, gym, stx, sty, stmin, stmax
-        double width, width1
-
-    # Initialization block.
-    if task[0:5] == 'START':
-
-        # Check the input arguments for errors.
-        if stp < stpmin: task = 'ERROR: STP < STPMIN'
-        if stp > stpmax: task = 'ERROR: STP > STPMAX'
-        if g >= 0: task = 'ERROR: INITIAL G >= 0'
-        if ftol < 0: task = 'ERROR: FTOL < 0'
-        if gtol < 0: task = 'ERROR: GTOL < 0'
-        if xtol < 0: task = 'ERROR: XTOL < 0'
-        if stpmin < 0: task = 'ERROR: STPMIN < 0'
-        if stpmax < stpmin: task = 'ERROR: STPMAX < STPMIN'
-
-        # Exit if there are errors on input.
-        if task[0:5] == 'ERROR':
-            return stp, task, isave, dsave
-
-        # Initialize local variables.
-        brackt = False
-        stage = 1
-        finit = f
-        ginit = g
-        gtest = ftol*ginit
-        width = stpmax - stpmin
-        width1 = width/0.5
-
-        # The variables stx, fx, gx contain the values of the step,
-        # function, and derivative at the best step.
-        # The variables sty, fy, gy contain the value of the step,
-        # function, and derivative at sty.
-        # The variables stp, f, g contain the values of the step,
-        # function, and derivative at stp.
-        stx = 0
-        fx = finit
-        gx = ginit
-        sty = 0
-        fy = finit
-        gy = ginit
-        stmin = 0
-        stmax = stp + xtrapu*stp
-        task = 'FG'
-
-        # Save local variables.
-        save_local_variables(brackt, <int *> cnp.PyArray_DATA(isave), <double *> cnp.PyArray_DATA(dsave), stage, ginit, gtest, gx, gy,
-                             finit, fx, fy, stx, sty, stmin, stmax, width, width1)
-        return stp, task, isave, dsave
-        # return stp, f, g, task, isave, dsave
-
-    else:
-
-        # Restore local variables.
-        if isave[0] == 1:
-            brackt = True
-        else:
-            brackt = False
-        stage = isave[1]
-        ginit = dsave[0]
-        gtest = dsave[1]
-        gx = dsave[2]
-        gy = dsave[3]
-        finit = dsave[4]
-        fx = dsave[5]
-        fy = dsave[6]
-        stx = dsave[7]
-        sty = dsave[8]
-        stmin = dsave[9]
-        stmax = dsave[10]
-        width = dsave[11]
-        width1 = dsave[12]
-
-    # If psi(stp) <= 0 and f'(stp) >= 0 for some step, then the
-    # algorithm enters the second stage.
-
-    ftest = finit + stp*gtest
-    if stage == 1 and f <= ftest and g >= 0: stage = 2
-
-    # Test for warnings.
-    if brackt and (stp <= stmin or stp >= stmax):
-        task = 'WARNING: ROUNDING ERRORS PREVENT PROGRESS'
-    if brackt and stmax-stmin <= xtol*stmax:
-        task = 'WARNING: XTOL TEST SATISFIED'
-    if stp == stpmax and f <= ftest and g <= gtest:
-        task = 'WARNING: STP = STPMAX'
-    if stp == stpmin and (f > ftest or g >= gtest):
-        task = 'WARNING: STP = STPMIN'
-
-    # Test for convergence.
-    if f <= ftest and abs(g) <= gtol*(-ginit):
-        task = 'CONVERGENCE'
-
-    # Test for termination.
-    if task[0:4] == 'WARN' or task[0:4] == 'CONV':
-        # Save local variables.
-        save_local_variables(brackt, <int *> cnp.PyArray_DATA(isave), <double *> cnp.PyArray_DATA(dsave), stage, ginit, gtest, gx, gy,
-                             finit, fx, fy, stx, sty, stmin, stmax, width, width1)
-        return stp, task, isave, dsave
-        # return stp, f, g, task, isave, dsave
-
-    # A modified function is used to predict the step during the
-    # first stage if a lower function value has been obtained but
-    # the decrease is not sufficient.
-
-    if stage == 1 and f <= fx and f > ftest:
-
-        # Define the modified function and derivative values.
-        fm = f - stp*gtest
-        fxm = fx - stx*gtest
-        fym = fy - sty*gtest
-        gm = g - gtest
-        gxm = gx - gtest
-        gym = gy - gtest
-
-        # Call dcstep to update stx, sty, and to compute the new step.
-        stx, fxm, gxm, sty, fym, gym, stp, brackt = dcstep(stx, fxm, gxm, sty, fym, gym, stp, fm, gm, brackt, stmin, stmax)
-
-        # Reset the function and derivative values for f.
-        fx = fxm + stx*gtest
-        fy = fym + sty*gtest
-        gx = gxm + gtest
-        gy = gym + gtest
-    else:
-        # Call dcstep to update stx, sty, and to compute the new step.
-        stx, fx, gx, sty, fy, gy, stp, brackt = dcstep(stx, fx, gx, sty, fy, gy, stp, f, g, brackt, stmin, stmax)
-
-    # Decide if a bisection step is needed.
-    if brackt:
-        if abs(sty-stx) >= 0.66*width1:
-            stp = stx + 0.5*(sty-stx)
-        width1 = width
-        width = abs(sty-stx)
-
-    # Set the minimum and maximum steps allowed for stp.
-    if brackt:
-        stmin = min(stx,sty)
-        stmax = max(stx,sty)
-    else:
-        stmin = stp + xtrapl*(stp-stx)
-        stmax = stp + xtrapu*(stp-stx)
-
-    # Force the step to be within the bounds stpmax and stpmin.
-    stp = max(stp,stpmin)
-    stp = min(stp,stpmax)
-
-    # If further progress is not possible, let stp be the best
-    # point obtained during the search.
-    if brackt and (stp <= stmin or stp >= stmax) or \
-       (brackt and stmax-stmin <= xtol*stmax):
-        stp = stx
-
-    # Obtain another function and derivative.
-    task = 'FG'
-
-    # Save local variables.
-    save_local_variables(brackt, <int *> cnp.PyArray_DATA(isave), <double *> cnp.PyArray_DATA(dsave), stage, ginit, gtest, gx, gy,
-                         finit, fx, fy, stx, sty, stmin, stmax, width, width1)
-    return stp, task, isave, dsave
-    # return stp, f, g, task, isave, dsave
+        dcsrch_state st
+        int code = task_code(task)
+
+    if code != START:
+        load_state(&st, <int *> cnp.PyArray_DATA(isave),
+                   <double *> cnp.PyArray_DATA(dsave))
+    code = dcsrch_core(&stp, f, g, ftol, gtol, xtol, code, stpmin, stpmax,
+                       &st)
+    if code < ERROR_STP_STPMIN:
+        save_state(&st, <int *> cnp.PyArray_DATA(isave),
+                   <double *> cnp.PyArray_DATA(dsave))
+    return stp, task_messages[code], isave, dsave
+
+
+def dcsrch_search(phi, double stp, double f, double g, double ftol,
+                  double gtol, double xtol, str task, double stpmin,
+                  double stpmax,
+                  cnp.ndarray[cnp.int32_t,ndim=1] isave,
+                  cnp.ndarray[cnp.float64_t,ndim=1] dsave):
+    """
+    Run the Moré-Thuente linesearch to termination.
 
+    The arguments are those of `dcsrch`, with `f` and `g` the value and
+    derivative at `stp`, and `phi` a callable such that `phi(t)` returns
+    the pair (f(t), f'(t)). The calls to `dcsrch` and the requests for new
+    function and derivative values are chained without returning to
+    Python, which only evaluates `phi`.
 
-@cython.boundscheck(False)
-cdef save_local_variables(bint brackt, int * isave,
-                          double * dsave, int stage,
-                          double ginit, double gtest, double gx, double gy,
-                          double finit, double fx, double fy,
-                          double stx, double sty, double stmin, double stmax,
-                          double width, double width1):
-    if brackt:
+    Return the final `stp`, `f` and `g`, `task` and the number of
+    evaluations of `phi`. Unless `task` indicates an error, `f` and `g` are
+    the value and derivative at the final `stp`.
+    """
+    cdef:
+        dcsrch_state st
+        int code = task_code(task)
+        int nfev = 0
+
+    if code != START:
+        load_state(&st, <int *> cnp.PyArray_DATA(isave),
+                   <double *> cnp.PyArray_DATA(dsave))
+    while True:
+        code = dcsrch_core(&stp, f, g, ftol, gtol, xtol, code, stpmin, stpmax,
+                           &st)
+        if code != FG:
+            break
+        f, g = phi(stp)
+        nfev += 1
+    if code < ERROR_STP_STPMIN:
+        save_state(&st, <int *> cnp.PyArray_DATA(isave),
+                   <double *> cnp.PyArray_DATA(dsave))
+    return stp, f, g, task_messages[code], nfev
+
+
+cdef void load_state(dcsrch_state *st, int *isave, double *dsave):
+    st.brackt = isave[0] == 1
+    st.stage = isave[1]
+    st.ginit = dsave[0]
+    st.gtest = dsave[1]
+    st.gx = dsave[2]
+    st.gy = dsave[3]
+    st.finit = dsave[4]
+    st.fx = dsave[5]
+    st.fy = dsave[6]
+    st.stx = dsave[7]
+    st.sty = dsave[8]
+    st.stmin = dsave[9]
+    st.stmax = dsave[10]
+    st.width = dsave[11]
+    st.width1 = dsave[12]
+
+
+cdef void save_state(dcsrch_state *st, int *isave, double *dsave):
+    if st.brackt:
         isave[0] = 1
     else:
         isave[0] = 0
-    isave[1] = stage
-    dsave[0] = ginit
-    dsave[1] = gtest
-    dsave[2] = gx
-    dsave[3] = gy
-    dsave[4] = finit
-    dsave[5] = fx
-    dsave[6] = fy
-    dsave[7] = stx
-    dsave[8] = sty
-    dsave[9] = stmin
-    dsave[10] = stmax
-    dsave[11] = width
-    dsave[12] = width1
+    isave[1] = st.stage
+    dsave[0] = st.ginit
+    dsave[1] = st.gtest
+    dsave[2] = st.gx
+    dsave[3] = st.gy
+    dsave[4] = st.finit
+    dsave[5] = st.fx
+    dsave[6] = st.fy
+    dsave[7] = st.stx
+    dsave[8] = st.sty
+    dsave[9] = st.stmin
+    dsave[10] = st.stmax
+    dsave[11] = st.width
+    dsave[12] = st.width1
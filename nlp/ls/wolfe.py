@@ -16,7 +16,7 @@ DOI http://dx.doi.org/10.1145/192115.192132
 from math import sqrt
 import numpy as np
 from nlp.ls.linesearch import LineSearch, LineSearchFailure
-from nlp.ls._strong_wolfe_linesearch import dcsrch
+from nlp.ls._strong_wolfe_linesearch import dcsrch, dcsrch_search
 
 
 class StrongWolfeLineSearch(LineSearch):
@@ -54,6 +54,7 @@ class StrongWolfeLineSearch(LineSearch):
                                   -0.1 * self.value / self.slope / self.ftol))
 
         self._trial_slope = self.linemodel.grad(self.step, x=self.iterate)
+        self.__evaluated = True  # trial value and slope are at self.step
         self.__task = "START"
         self.__isave = np.empty(2, dtype=np.int32)
         self.__dsave = np.empty(13, dtype=np.double)
@@ -98,9 +99,9 @@ class StrongWolfeLineSearch(LineSearch):
         if self.__task[:2] != "FG":
             raise LineSearchFailure(self.__task)
 
-        self._trial_iterate = self.linemodel.x + self.step * self.linemodel.d
-        self._trial_value = self.linemodel.obj(self.step, x=self.iterate)
-        self._trial_slope = self.linemodel.grad(self.step, x=self.iterate)
+        self._trial_iterate = self.linemodel.trial(self.step)
+        self._trial_value, self._trial_slope = \
+            self.linemodel.obj_grad(self.step, x=self.iterate)
 
         step = self.step
         self._step, self.__task, self.__isave, self.__dsave = \
@@ -108,5 +109,32 @@ class StrongWolfeLineSearch(LineSearch):
                    self.ftol, self.gtol, self.xtol,
                    self.__task, self.lb, self.ub,
                    self.__isave, self.__dsave)
+        self.__evaluated = False
 
         return step
+
+    def search(self):
+        u"""Run the linesearch to termination and return the final step.
+
+        The calls to `dcsrch` are chained in compiled code, which only
+        returns to Python to evaluate ϕ(t) and ϕ'(t) with
+        `linemodel.obj_grad`.
+        """
+        if self.__task[:2] == "FG":
+            linemodel = self.linemodel
+            if self.__evaluated:
+                value, slope = self._trial_value, self._trial_slope
+            else:
+                value, slope = linemodel.obj_grad(self.step)
+            (self._step, self._trial_value, self._trial_slope,
+             self.__task, _) = \
+                dcsrch_search(linemodel.obj_grad, self._step, value, slope,
+                              self.ftol, self.gtol, self.xtol,
+                              self.__task, self.lb, self.ub,
+                              self.__isave, self.__dsave)
+            self._trial_iterate = linemodel.trial(self.step)
+            self.__evaluated = True
+
+        if self.__task[:4] != "CONV":
+            raise LineSearchFailure(self.__task)
+        return self.step
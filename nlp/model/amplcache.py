@@ -0,0 +1,114 @@
+"""Sidecar cache of AMPL problem metadata.
+
+ASL must read the `nl` file every time a model is loaded, but the data that
+:class:`AmplModel` subsequently copies out of ASL (bounds, starting point,
+constraint types, nonzero counts and sparsity patterns) only depends on the
+contents of the `nl` file. :class:`AmplCache` stores those arrays in binary
+form next to the `nl` file, under a key derived from its sha1 digest, and maps
+them back into memory on subsequent loads.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import numpy as np
+
+__docformat__ = 'restructuredtext'
+
+
+def nl_signature(nlfile, blocksize=1 << 20):
+    """Return the sha1 digest of the contents of `nlfile`."""
+    sha1 = hashlib.sha1()
+    with open(nlfile, 'rb') as fp:
+        block = fp.read(blocksize)
+        while block:
+            sha1.update(block)
+            block = fp.read(blocksize)
+    return sha1.hexdigest()
+
+
+class AmplCache(object):
+    """Memory-mapped cache of the metadata of an AMPL model.
+
+    Each cached item is stored as a separate `.npy` file in the directory
+    `<cache_dir>/<name>.nlcache/<sha1>/`. Entries are loaded in copy-on-write
+    mode so that models may modify their bounds or starting point without
+    altering the cache.
+    """
+
+    #: Names of the arrays stored in a cache entry.
+    fields = ('dims',                                # n, m, nnzj, nnzh, ...
+              'x0', 'pi0', 'Lvar', 'Uvar', 'Lcon', 'Ucon',
+              'jrows', 'jcols',                      # Jacobian sparsity
+              'hrows', 'hcols')                      # Hessian sparsity
+
+    #: Layout of the `dims` array.
+    dims = ('n_var', 'n_con', 'nnzj', 'nnzh', 'nlc', 'nlnc', 'objtype')
+
+    def __init__(self, nlfile, cache_dir=None):
+        """Instantiate a cache for the model stored in `nlfile`.
+
+        :parameters:
+            :nlfile: path to the `nl` file.
+
+        :keywords:
+            :cache_dir: directory in which the cache is stored. By default,
+                        the cache is stored alongside `nlfile`.
+        """
+        self.nlfile = nlfile
+        if cache_dir is None:
+            cache_dir = os.path.dirname(os.path.abspath(nlfile))
+        self.root = os.path.join(cache_dir,
+                                 os.path.basename(nlfile) + 'cache')
+        self.key = nl_signature(nlfile)
+        self.path = os.path.join(self.root, self.key)
+
+    def load(self):
+        """Map a cache entry into memory.
+
+        Return a dictionary of arrays indexed by the names in `fields`, or
+        `None` if there is no valid entry for the current `nl` file.
+        """
+        if not os.path.isdir(self.path):
+            return None
+        data = {}
+        try:
+            for field in self.fields:
+                fname = os.path.join(self.path, field + '.npy')
+                data[field] = np.load(fname, mmap_mode='c')
+        except (IOError, OSError, ValueError):
+            return None
+        if data['dims'].shape != (len(self.dims),):
+            return None
+        return data
+
+    def save(self, data):
+        """Store the arrays of the dictionary `data` as a new cache entry.
+
+        Stale entries, i.e., those corresponding to earlier versions of the
+        `nl` file, are removed. Return `True` if the entry could be written
+        and `False` otherwise, e.g., if the cache directory is read only.
+        """
+        tmpdir = None
+        try:
+            if not os.path.isdir(self.root):
+                os.makedirs(self.root)
+            tmpdir = tempfile.mkdtemp(dir=self.root, prefix='.')
+            for field in self.fields:
+                fname = os.path.join(tmpdir, field + '.npy')
+                np.save(fname, np.ascontiguousarray(data[field]))
+            for entry in os.listdir(self.root):
+                if not entry.startswith('.'):
+                    shutil.rmtree(os.path.join(self.root, entry),
+                                  ignore_errors=True)
+            os.rename(tmpdir, self.path)
+        except (IOError, OSError):
+            if tmpdir is not None:
+                shutil.rmtree(tmpdir, ignore_errors=True)
+            return False
+        return True
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        shutil.rmtree(self.root, ignore_errors=True)
@@ -0,0 +1,182 @@
+"""Generation of AMPL `nl` files from model and data files.
+
+Generated `nl` files are reused as long as the model file, the data file and
+the AMPL options they were generated from are unchanged. A sha1 digest of
+those inputs is stored alongside each `nl` file for that purpose.
+"""
+
+import hashlib
+import os
+import subprocess
+import tempfile
+from multiprocessing.pool import ThreadPool
+from nlp.tools.exceptions import AmplError
+
+__docformat__ = 'restructuredtext'
+
+
+def _strip(fname, ext):
+    return fname[:-len(ext)] if fname.endswith(ext) else fname
+
+
+def _option_lines(opts):
+    """Turn AMPL options into a list of statements.
+
+    `opts` may be a dictionary mapping option names to values, e.g.,
+    `{'presolve': 0}`, or a list of AMPL statements, e.g.,
+    `['option presolve 0;']`.
+    """
+    if opts is None:
+        return []
+    if isinstance(opts, dict):
+        return ['option %s %s;' % (k, opts[k]) for k in sorted(opts)]
+    return [opt if opt.rstrip().endswith(';') else opt + ';' for opt in opts]
+
+
+def GenTemplate(model, data=None, opts=None, stub=None):
+    """
+    Write out an Ampl template file,
+    using files model.mod and data.dat (if available).
+    The template will be given a temporary name. The `nl` file is written
+    to `stub.nl`, where `stub` defaults to the model name.
+    """
+    model = _strip(model, '.mod')
+    if stub is None:
+        stub = model
+
+    # Create a temporary template file and write in a header.
+    fd, tmpname = tempfile.mkstemp(suffix='.ampl')
+    template = os.fdopen(fd, 'w')
+    template.write("# Template file for %s.\n" % model)
+    template.write("# Automatically generated by AmplPy.\n")
+
+    # Ampl options, eg, option presolve 0;
+    for line in _option_lines(opts):
+        template.write(line + "\n")
+
+    # Template file body.
+    template.write("model %s.mod;\n" % model)
+
+    if data is not None:
+        data = _strip(data, '.dat')
+        template.write("data  %s.dat;\n" % data)
+    template.write("write g%s;\n" % stub)
+
+    # Finish off the template file.
+    template.close()
+
+    # We'll need to know the template file name.
+    return tmpname
+
+
+def writestub(template, ampl='ampl'):
+    """Run AMPL on `template`.
+
+    Raise :class:`AmplError` with the output of AMPL if it fails.
+    """
+    try:
+        proc = subprocess.Popen([ampl, template],
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT)
+    except OSError as e:
+        raise AmplError('Cannot run %s: %s' % (ampl, e))
+    output = proc.communicate()[0]
+    if proc.returncode != 0:
+        raise AmplError('%s exited with status %d:\n%s' %
+                        (ampl, proc.returncode, output))
+    return output
+
+
+def nl_key(model, data=None, opts=None):
+    """Return the sha1 digest identifying the `nl` file of a model.
+
+    The digest covers the contents of the model and data files, and the
+    AMPL options.
+    """
+    sha1 = hashlib.sha1()
+    for fname in (_strip(model, '.mod') + '.mod',
+                  None if data is None else _strip(data, '.dat') + '.dat'):
+        if fname is None:
+            sha1.update('\0')
+            continue
+        with open(fname, 'rb') as fp:
+            sha1.update(fp.read())
+        sha1.update('\0')
+    for line in _option_lines(opts):
+        sha1.update(line + '\n')
+    return sha1.hexdigest()
+
+
+def generate_nl(model, data=None, opts=None, **kwargs):
+    """Generate the `nl` file of a model unless an up-to-date one exists.
+
+    :parameters:
+        :model: name of the `.mod` file
+        :data:  name of the `.dat` file (default: `None`)
+        :opts:  AMPL options as a dictionary or a list of statements
+                (default: `None`)
+
+    :keywords:
+        :out_dir: directory where the `nl` file is written (default: the
+                  directory of the model file)
+        :force:   regenerate the `nl` file even if it is up to date
+                  (default: `False`)
+        :ampl:    name of the AMPL executable (default: 'ampl')
+
+    The `nl` file is named after the model, and after the data file if one is
+    given. Return the stub of the `nl` file, i.e., its name without the `.nl`
+    extension.
+    """
+    out_dir = kwargs.get('out_dir', None)
+    force = kwargs.get('force', False)
+    ampl = kwargs.get('ampl', 'ampl')
+
+    model = _strip(model, '.mod')
+    name = os.path.basename(model)
+    if data is not None:
+        name += '_' + os.path.basename(_strip(data, '.dat'))
+    if out_dir is None:
+        out_dir = os.path.dirname(model)
+    stub = os.path.join(out_dir, name)
+
+    key = nl_key(model, data, opts)
+    keyfile = stub + '.nl.sha1'
+    if not force and os.path.isfile(stub + '.nl') and os.path.isfile(keyfile):
+        with open(keyfile) as fp:
+            if fp.read().strip() == key:
+                return stub
+
+    template = GenTemplate(model, data, opts, stub=stub)
+    try:
+        output = writestub(template, ampl=ampl)
+    finally:
+        os.remove(template)
+    if not os.path.isfile(stub + '.nl'):
+        raise AmplError('%s did not write %s.nl:\n%s' % (ampl, stub, output))
+
+    with open(keyfile, 'w') as fp:
+        fp.write(key + '\n')
+    return stub
+
+
+def generate_nl_files(models, processes=None, **kwargs):
+    """Generate the `nl` files of several models concurrently.
+
+    :parameters:
+        :models: list of model names, or of tuples `(model, data)` or
+                 `(model, data, opts)`.
+
+    :keywords:
+        :processes: number of concurrent AMPL processes (default: number of
+                    CPUs)
+
+    Other keyword arguments are passed to :func:`generate_nl`. Return the
+    list of stubs in the same order as `models`.
+    """
+    jobs = [(m,) if isinstance(m, basestring) else tuple(m) for m in models]
+    pool = ThreadPool(processes)
+    try:
+        return pool.map(lambda job: generate_nl(*job, **kwargs), jobs)
+    finally:
+        pool.close()
+        pool.join()
@@ -10,54 +10,43 @@ except ImportError:
 
 import numpy as np
 from nlp.model.nlpmodel import NLPModel
+from nlp.model.amplcache import AmplCache
+from nlp.model.amplgen import GenTemplate, writestub, generate_nl
 from nlp.model.qnmodel import QuasiNewtonModel
-from pykrylov.linop import CoordLinearOperator
-from nlp.tools import sparse_vector_class as sv
+from pykrylov.linop import CoordLinearOperator, LinearOperator
+from nlp.tools.decorators import memoize_point
+from nlp.tools.sparse_vector import SparseVector
+from nlp.tools.exceptions import ShapeError
 
-import tempfile
 import os
 
-__docformat__ = 'restructuredtext'
-
-
-def GenTemplate(model, data=None, opts=None):
-    """
-    Write out an Ampl template file,
-    using files model.mod and data.dat (if available).
-    The template will be given a temporary name.
-    """
-    # Create a temporary template file and write in a header.
-    tmpname = tempfile.mktemp()
-    template = open(tmpname, 'w')
-    template.write("# Template file for %s.\n" % model)
-    template.write("# Automatically generated by AmplPy.\n")
-
-    # Later we can use opts to hold a list of Ampl options, eg,
-    #   option presolve 0;
-    # that can be written into the template file.
-    if opts is not None:
-        pass
-
-    # Template file body.
-    if model[-4:] == '.mod':
-        model = model[:-4]
-    template.write("model %s.mod;\n" % model)
+try:
+    from scipy import sparse as sp
+except ImportError:
+    sp = None
 
-    if data is not None:
-        if data[-4:] == '.dat':
-            data = data[:-4]
-        template.write("data  %s.dat;\n" % data)
-    template.write("write g%s;\n" % model)
+__docformat__ = 'restructuredtext'
 
-    # Finish off the template file.
-    template.close()
 
-    # We'll need to know the template file name.
-    return tmpname
+def ampl_metadata(model):
+    """Gather the problem data that :class:`AmplCache` stores.
 
+    :parameters:
+        :model: an instance of the low-level `_amplmodel.ampl` class.
 
-def writestub(template):
-    os.system("ampl %s" % template)
+    Returns a dictionary indexed by the names in `AmplCache.fields`.
+    """
+    nnzh = model.get_nnzh()
+    dims = np.array([model.n_var, model.n_con, model.get_nnzj(), nnzh,
+                     model.nlc, model.nlnc, model.objtype], dtype=np.int64)
+    jrows, jcols = model.get_J_pattern()
+    hrows, hcols = model.get_H_pattern()
+    return {'dims': dims,
+            'x0': model.get_x0(), 'pi0': model.get_pi0(),
+            'Lvar': model.get_Lvar(), 'Uvar': model.get_Uvar(),
+            'Lcon': model.get_Lcon(), 'Ucon': model.get_Ucon(),
+            'jrows': jrows, 'jcols': jcols,
+            'hrows': hrows, 'hcols': hcols}
 
 
 class AmplModel(NLPModel):
@@ -65,25 +54,35 @@ class AmplModel(NLPModel):
 
     If the `nl` file is already available, simply call `AmplModel(stub)` where
     the string `stub` is the name of the model. For instance:
-    `AmplModel('elec')`. If only the `.mod` file is available, set the
-    positional parameter `neednl` to `True` so AMPL generates the `nl` file, as
-    in `AmplModel('elec.mod', data='elec.dat', neednl=True)`.
+    `AmplModel('elec')`. If only the `.mod` file is available, AMPL generates
+    the `nl` file, as in `AmplModel('elec.mod', data='elec.dat')`. The `nl`
+    file is only regenerated when the model, the data or the AMPL options
+    given in `opts` change. It is written to the directory `nl_dir`, which
+    defaults to that of the model. See :func:`nlp.model.amplgen.generate_nl`.
 
     Among important attributes of this class are :attr:`nvar`, the number of
     variables, :attr:`ncon`, the number of constraints, and :attr:`nbounds`,
     the number of variables subject to at least one bound constraint.
+
+    Loading large models repeatedly can be accelerated by passing
+    `cache=True`, in which case bounds, initial point, nonzero counts and
+    sparsity patterns are stored in a binary cache alongside the `nl` file and
+    memory-mapped on subsequent loads. Pass a directory name instead of `True`
+    to store the cache elsewhere. See :class:`AmplCache`.
     """
 
     def __init__(self, stub, **kwargs):
 
         data = kwargs.get('data', None)
         opts = kwargs.get('opts', None)
+        cache = kwargs.get('cache', False)
 
+        name = kwargs.get('name', stub[:-4] if stub[-4:] == '.mod' else stub)
         if stub[-4:] == '.mod':
-            # Create the nl file.
-            template = GenTemplate(stub, data, opts)
-            writestub(template)
-            stub = stub[:-4]
+            # Create the nl file if necessary.
+            stub = generate_nl(stub, data, opts,
+                               out_dir=kwargs.get('nl_dir', None),
+                               ampl=kwargs.get('ampl', 'ampl'))
 
         # Initialize the ampl module
         try:
@@ -91,17 +90,39 @@ class AmplModel(NLPModel):
         except:
             raise ValueError('Cannot initialize model %s' % stub)
 
+        # Obtain problem data from the cache if possible.
+        meta = None
+        if cache:
+            nlfile = stub if os.path.splitext(stub)[1] else stub + '.nl'
+            nlcache = AmplCache(nlfile,
+                                cache_dir=None if cache is True else cache)
+            meta = nlcache.load()
+            if meta is not None:
+                dims = meta['dims']
+                if dims[0] != model.n_var or dims[1] != model.n_con:
+                    meta = None
+            if meta is None:
+                meta = ampl_metadata(model)
+                nlcache.save(meta)
+
+        if meta is None:
+            meta = {'x0': model.get_x0(), 'pi0': model.get_pi0(),
+                    'Lvar': model.get_Lvar(), 'Uvar': model.get_Uvar(),
+                    'Lcon': model.get_Lcon(), 'Ucon': model.get_Ucon()}
+
         super(AmplModel, self).__init__(model.n_var, model.n_con,
-                                        name=kwargs.get('name', stub),
-                                        x0=model.get_x0(),
-                                        pi0=model.get_pi0(),
-                                        Lvar=model.get_Lvar(),
-                                        Uvar=model.get_Uvar(),
-                                        Lcon=model.get_Lcon(),
-                                        Ucon=model.get_Ucon())
+                                        name=name,
+                                        x0=meta['x0'],
+                                        pi0=meta['pi0'],
+                                        Lvar=meta['Lvar'],
+                                        Uvar=meta['Uvar'],
+                                        Lcon=meta['Lcon'],
+                                        Ucon=meta['Ucon'])
 
         # Get basic info on problem
         self.minimize = (model.objtype == 0)
+        # Sign applied to each objective so that all are minimized.
+        self._obj_sign = np.where(model.get_objtypes() == 0, 1., -1.)
         (self._lin, self._nln, self._net) = model.get_CType()  # Constr. types
         # Constraint types
         (self._lin, self._nln, self._net) = model.get_CType()
@@ -113,7 +134,18 @@ class AmplModel(NLPModel):
 
         # Get sparsity info
         self.nnzj = model.get_nnzj()    # number of nonzeros in Jacobian
-        self.nnzh = model.get_nnzh()    # ...                   Hessian
+        if 'dims' in meta:
+            self.nnzh = int(meta['dims'][3])
+            self._jac_pattern = (np.asarray(meta['jrows']),
+                                 np.asarray(meta['jcols']))
+            self._hess_pattern = (np.asarray(meta['hrows']),
+                                  np.asarray(meta['hcols']))
+        else:
+            self.nnzh = model.get_nnzh()    # ...               Hessian
+            self._jac_pattern = None
+            self._hess_pattern = None
+        self._jac_pos_pattern = None
+        self._jac_csr_pattern = None
 
         # Initialize scaling attributes
         self.scale_obj = None   # Objective scaling
@@ -129,49 +161,144 @@ class AmplModel(NLPModel):
     def get_pi0(self):
         return self.model.pi0()
 
+    @property
+    def jac_pattern(self):
+        """Sparsity pattern `(rows, cols)` of the constraint Jacobian.
+
+        The index arrays are shared by all calls to :meth:`jac` and must not
+        be modified in place.
+        """
+        if self._jac_pattern is None:
+            self._jac_pattern = self.model.get_J_pattern()
+        return self._jac_pattern
+
+    @property
+    def jac_pos_pattern(self):
+        """Index arrays used to assemble :meth:`jac_pos` from :meth:`jac`.
+
+        A tuple `(sign, ridx, rows, cols)` where `sign` holds the sign applied
+        to each Jacobian value, `ridx` the positions of Jacobian values
+        belonging to range constraints and `(rows, cols)` the sparsity pattern
+        of the Jacobian of :meth:`cons_pos`.
+        """
+        if self._jac_pos_pattern is None:
+            m = self.m
+            rows, cols = self.jac_pattern
+
+            # Position of each constraint among range constraints.
+            rpos = -np.ones(m, dtype=np.int)
+            rpos[self.rangeC] = np.arange(self.nrangeC)
+            csign = np.ones(m)
+            csign[self.upperC] = -1
+
+            ridx = np.where(rpos[rows] >= 0)[0]
+            prows = np.concatenate((rows, m + rpos[rows[ridx]]))
+            pcols = np.concatenate((cols, cols[ridx]))
+            self._jac_pos_pattern = (csign[rows], ridx, prows, pcols)
+        return self._jac_pos_pattern
+
+    @property
+    def jac_csr_pattern(self):
+        """Index arrays used to assemble the Jacobian in CSR format.
+
+        A tuple `(order, indices, indptr)` where `order` sorts the values
+        returned by :meth:`jac` by rows and `(indices, indptr)` is the CSR
+        structure of the Jacobian.
+        """
+        if self._jac_csr_pattern is None:
+            rows, cols = self.jac_pattern
+            order = np.lexsort((cols, rows))
+            indptr = np.zeros(self.m + 1, dtype=np.int32)
+            np.cumsum(np.bincount(rows, minlength=self.m), out=indptr[1:])
+            self._jac_csr_pattern = (order, cols[order].astype(np.int32),
+                                     indptr)
+        return self._jac_csr_pattern
+
+    @property
+    def hess_pattern(self):
+        """Sparsity pattern `(rows, cols)` of the lower triangle of the
+        Lagrangian Hessian.
+
+        The index arrays are shared by all calls to :meth:`hess` and must not
+        be modified in place.
+        """
+        if self._hess_pattern is None:
+            self._hess_pattern = self.model.get_H_pattern()
+        return self._hess_pattern
+
+    @property
+    def nobj(self):
+        """Number of objectives."""
+        return self.model.n_obj
+
     def obj(self, x, obj_num=0):
         """Evaluate objective function value at x.
 
         Returns a floating-point number. This method changes the sign of the
-        objective value if the problem is a maximization problem.
+        objective value if objective `obj_num` is to be maximized.
         """
 
         # AMPL doesn't exactly exit gracefully if obj_num is out of range.
         if obj_num < 0 or obj_num >= self.model.n_obj:
             raise ValueError('Objective number is out of range.')
 
-        f = self.model.eval_obj(x)
+        f = self.model.eval_obj(x, obj_num)
         if self.scale_obj:
             f *= self.scale_obj
-        if not self.minimize:
+        if self._obj_sign[obj_num] < 0:
             f *= -1
         return f
 
+    def objs(self, x):
+        """Evaluate all objective function values at x.
+
+        Returns a Numpy array of length :attr:`nobj`. The sign of each
+        objective to be maximized is changed.
+        """
+        f = self.model.eval_objs(x)
+        if self.scale_obj:
+            f *= self.scale_obj
+        f *= self._obj_sign
+        return f
+
     def grad(self, x, obj_num=0):
         """Evaluate objective gradient at x.
 
         Returns a Numpy array. This method changes the sign of the objective
-        gradient if the problem is a maximization problem.
+        gradient if objective `obj_num` is to be maximized.
         """
 
         # AMPL doesn't exactly exit gracefully if obj_num is out of range.
         if obj_num < 0 or obj_num >= self.model.n_obj:
             raise ValueError('Objective number is out of range.')
 
-        g = self.model.grad_obj(x)
+        g = self.model.grad_obj(x, obj_num)
         if self.scale_obj:
             g *= self.scale_obj
-        if not self.minimize:
+        if self._obj_sign[obj_num] < 0:
             g *= -1
         return g
 
+    def grads(self, x):
+        """Evaluate the gradients of all objectives at x.
+
+        Returns a Numpy array of shape (:attr:`nobj`, :attr:`nvar`) whose rows
+        are the objective gradients. The sign of the gradient of each
+        objective to be maximized is changed.
+        """
+        G = self.model.grad_objs(x)
+        if self.scale_obj:
+            G *= self.scale_obj
+        G *= self._obj_sign[:, np.newaxis]
+        return G
+
     def sgrad(self, x):
         """Evaluate sparse objective gradient at x.
 
         Returns a sparse vector. This method changes the sign of the objective
         gradient if the problem is a maximization problem.
         """
-        sg = sv.SparseVector(self.n, self.model.eval_sgrad(x))
+        sg = SparseVector(self.n, *self.model.eval_sgrad(x))
         if self.scale_obj:
             sg *= self.scale_obj
         if not self.minimize:
@@ -185,7 +312,7 @@ class AmplModel(NLPModel):
         Return a sparse vector. This method changes the sign of the cost vector
         if the problem is a maximization problem.
         """
-        sc = sv.SparseVector(self.n, self.model.eval_cost())
+        sc = SparseVector(self.n, *self.model.eval_cost())
         if self.scale_obj:
             sc *= self.scale_obj
         if not self.minimize:
@@ -233,10 +360,9 @@ class AmplModel(NLPModel):
     def sigrad(self, i, x):
         """Evaluate sparse gradient of i-th constraint at x.
 
-        Returns a sparse vector representing the sparse gradient
-        in coordinate format.
+        Returns a :class:`SparseVector` representing the sparse gradient.
         """
-        sci = sv.SparseVector(self.n, self.model.eval_sgi(i, x))
+        sci = SparseVector(self.n, *self.model.eval_sgi(i, x))
         if isinstance(self.scale_con, np.ndarray):
             sci *= self.scale_con[i]
         return sci
@@ -247,7 +373,7 @@ class AmplModel(NLPModel):
         Useful to obtain constraint rows when problem
         is a linear programming problem.
         """
-        sri = sv.SparseVector(self.n, self.model.eval_row(i))
+        sri = SparseVector(self.n, *self.model.eval_row(i))
         if isinstance(self.scale_con, np.ndarray):
             sri *= self.scale_con[i]
         return sri
@@ -270,23 +396,20 @@ class AmplModel(NLPModel):
 
         Returns a sparse matrix in coordinate format.
         """
-        store_zeros = kwargs.get('store_zeros', False)
-        store_zeros = 1 if store_zeros else 0
-        vals, rows, cols = self.model.eval_J(x, store_zeros)
+        vals = self.model.eval_J_vals(x)
+        rows, cols = self.jac_pattern
         if isinstance(self.scale_con, np.ndarray):
             vals *= self.scale_con[rows]
         return (vals, rows, cols)
 
     def jac_pos(self, x, **kwargs):
-        """
-        Convenience function to evaluate the Jacobian matrix of the constraints
-        reformulated as
+        """Evaluate the Jacobian of :meth:`cons_pos` at x.
 
-          ci(x) = ai     for i in equalC
-          ci(x) - Li >= 0  for i in lowerC
-          ci(x) - Li >= 0  for i in rangeC
-          Ui - ci(x) >= 0  for i in upperC
-          Ui - ci(x) >= 0  for i in rangeC.
+        The constraints are reformulated as
+
+          ci(x) - ai  = 0  for i in equalC
+          ci(x) - Li >= 0  for i in lowerC + rangeC
+          Ui - ci(x) >= 0  for i in upperC + rangeC.
 
         The gradients of the general constraints appear in 'natural' order,
         i.e., in the order in which they appear in the problem. The gradients
@@ -300,36 +423,49 @@ class AmplModel(NLPModel):
         [-JR]
 
         This is a `(m + nrangeC)`-by-`n` matrix, where `J` is the Jacobian
-        of the general constraints in the order above in which the sign of
-        the 'less than' constraints is flipped, and `JR` is the Jacobian of
-        the 'less than' side of range constraints.
+        of the general constraints in which the sign of the 'less than'
+        constraints is flipped, and `JR` is the Jacobian of the range
+        constraints. It is returned in coordinate format.
         """
-        store_zeros = kwargs.get('store_zeros', False)
-        store_zeros = 1 if store_zeros else 0
-        n = self.n
-        m = self.m
-        nrangeC = self.nrangeC
-        upperC = self.upperC
-        rangeC = self.rangeC
-
-        # BROKEN
-        # Initialize sparse Jacobian
-        # J = BlockLinearOperator([[self.jop(x)],
-        #                         [ReducedLinearOperator(self.jop(x))]])
-        # Insert contribution of general constraints
-        J[:m, :n] = self.jac(x, **kwargs)
-        J[upperC, :n] *= -1        # Flip sign of 'upper' gradients.
-        J[m:, :n] = -J[rangeC, :n]   # Append 'upper' side of range const.
-        return J
+        vals, _, _ = AmplModel.jac(self, x, **kwargs)
+        sign, ridx, rows, cols = self.jac_pos_pattern
+        nnzj = vals.shape[0]
+        pvals = np.empty(nnzj + ridx.shape[0])
+        np.multiply(vals, sign, out=pvals[:nnzj])
+        np.negative(vals[ridx], out=pvals[nnzj:])
+        return (pvals, rows, cols)
+
+    def jop_pos(self, x, **kwargs):
+        """Jacobian of :meth:`cons_pos` at x as a linear operator."""
+        vals, rows, cols = self.jac_pos(x, **kwargs)
+        return CoordLinearOperator(vals, rows, cols,
+                                   nargin=self.nvar,
+                                   nargout=self.ncon + self.nrangeC,
+                                   symmetric=False)
 
     # Implement jop because AMPL models don't define jprod / jtprod.
+    @memoize_point()
     def jop(self, x, *args, **kwargs):
-        """Jacobian at x as a linear operator."""
+        """Jacobian at x as a linear operator.
+
+        If SciPy is available, the operator is backed by a CSR matrix whose
+        structure is computed once, so that products with J and J' run in
+        compiled code. The operators obtained at the two most recent points
+        are memoized. See :meth:`invalidate_jop`.
+        """
         vals, rows, cols = self.jac(x, *args, **kwargs)
-        return CoordLinearOperator(vals, rows, cols,
-                                   nargin=self.nvar,
-                                   nargout=self.ncon,
-                                   symmetric=False)
+        if sp is None:
+            return CoordLinearOperator(vals, rows, cols,
+                                       nargin=self.nvar,
+                                       nargout=self.ncon,
+                                       symmetric=False)
+        order, indices, indptr = self.jac_csr_pattern
+        J = sp.csr_matrix((vals[order], indices, indptr),
+                          shape=(self.ncon, self.nvar), copy=False)
+        JT = J.T
+        return LinearOperator(self.nvar, self.ncon, J.dot,
+                              matvec_transp=JT.dot,
+                              symmetric=False, dtype=np.float)
 
     def jprod(self, x, p, **kwargs):
         """Evaluate Jacobian-vector product at x with p."""
@@ -346,8 +482,6 @@ class AmplModel(NLPModel):
         By convention, the Lagrangian has the form L = f - c'z.
         """
         obj_weight = kwargs.get('obj_weight', 1.0)
-        store_zeros = kwargs.get('store_zeros', False)
-        store_zeros = 1 if store_zeros else 0
         if z is None:
             z = np.zeros(self.m)
 
@@ -357,7 +491,8 @@ class AmplModel(NLPModel):
             z = z.copy()
             z *= self.scale_con
 
-        vals, rows, cols = self.model.eval_H(x, z, obj_weight, store_zeros)
+        vals = self.model.eval_H_vals(x, z, obj_weight)
+        rows, cols = self.hess_pattern
 
         if not self.minimize:
             vals *= -1
@@ -422,6 +557,47 @@ class AmplModel(NLPModel):
             gHi *= self.scale_con  # componentwise product
         return gHi
 
+    def set_bounds(self, **kwargs):
+        """Update bounds on the variables and constraints in place.
+
+        The loaded ASL structure is reused so that parametric studies over
+        right-hand sides or bounds do not need to regenerate or read the `nl`
+        file again. Constraints and bounds are classified afresh. Bounds on
+        the constraints are given in unscaled form.
+
+        :keywords:
+            :Lvar: new vector of lower bounds on the variables
+            :Uvar: new vector of upper bounds on the variables
+            :Lcon: new vector of lower bounds on the constraints
+            :Ucon: new vector of upper bounds on the constraints
+        """
+        model = self.model
+        setters = {'Lvar': (self.n, model.set_Lvar),
+                   'Uvar': (self.n, model.set_Uvar),
+                   'Lcon': (self.m, model.set_Lcon),
+                   'Ucon': (self.m, model.set_Ucon)}
+        for key in kwargs:
+            if key not in setters:
+                raise TypeError('Unexpected keyword argument %s' % key)
+            size, setter = setters[key]
+            val = np.array(kwargs[key], dtype=np.float, ndmin=1)
+            if val.shape != (size,):
+                raise ShapeError('%s must have length %d' % (key, size))
+            setter(val)
+
+        self.Lvar = model.get_Lvar()
+        self.Uvar = model.get_Uvar()
+        self.Lcon = model.get_Lcon()
+        self.Ucon = model.get_Ucon()
+        if isinstance(self.scale_con, np.ndarray):
+            self.Lcon *= self.scale_con
+            self.Ucon *= self.scale_con
+
+        self._classify_constraints()
+        self._classify_bounds()
+        self._jac_pos_pattern = None
+        return
+
     def islp(self):
         """Determine whether problem is a linear programming problem."""
         if self.model.nlo or self.model.nlc or self.model.nlnc:
@@ -37,7 +37,8 @@ class AugmentedLagrangian(BoundConstrainedNLPModel):
             :xk:       initial value of the proximal vector (default: all zero)
         """
         if not isinstance(model, SlackModel):
-            self.model = SlackModel(model, **kwargs)
+            model = SlackModel(model, **kwargs)
+        self.model = model
 
         super(AugmentedLagrangian, self).__init__(self.model.n,
                                                   name='Al-' + self.model.name,
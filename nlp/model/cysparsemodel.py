@@ -7,6 +7,7 @@ except:
 from nlp.model.nlpmodel import NLPModel
 from nlp.model.snlp import SlackModel
 from nlp.model.qnmodel import QuasiNewtonModel
+from nlp.tools.decorators import memoize_point
 from pykrylov.linop import CysparseLinearOperator
 import numpy as np
 
@@ -65,9 +66,13 @@ try:
             A.put_triplet(rows, cols, vals)
             return A
 
-        def jop(self, *args, **kwargs):
-            """Obtain Jacobian at x as a linear operator."""
-            return CysparseLinearOperator(self.jac(*args, **kwargs))
+        @memoize_point()
+        def jop(self, x, *args, **kwargs):
+            """Obtain Jacobian at x as a linear operator.
+
+            The operators obtained at the two most recent points are memoized.
+            """
+            return CysparseLinearOperator(self.jac(x, *args, **kwargs))
 
 except ImportError:
     pass
@@ -102,41 +107,23 @@ class CySparseSlackModel(SlackModel):
         of the constraint matrix is cheaper and the argument `x` is ignored.
         """
         m = self.m
-        model = self.model
         on = self.original_n
 
-        lowerC = np.array(model.lowerC, dtype=np.int64)
-        nlowerC = model.nlowerC
-        upperC = np.array(model.upperC, dtype=np.int64)
-        nupperC = model.nupperC
-        rangeC = np.array(model.rangeC, dtype=np.int64)
-        nrangeC = model.nrangeC
-
         # Initialize sparse Jacobian
-        nnzJ = self.model.nnzj + m
+        nnzJ = self.model.nnzj + self.n_slacks
         J = LLSparseMatrix(nrow=self.ncon, ncol=self.nvar, size_hint=nnzJ,
                            store_symmetric=False, itype=types.INT64_T,
                            dtype=types.FLOAT64_T)
 
         # Insert contribution of general constraints
         if lp:
-            J[:on, :on] = self.model.A()
+            J[:m, :on] = self.model.A()
         else:
-            J[:on, :on] = self.model.jac(x[:on])
-
-        # Create a few index lists
-        rlowerC = np.array(range(nlowerC), dtype=np.int64)
-        rupperC = np.array(range(nupperC), dtype=np.int64)
-        rrangeC = np.array(range(nrangeC), dtype=np.int64)
+            J[:m, :on] = self.model.jac(x[:on])
 
         # Insert contribution of slacks on general constraints
-        J.put_triplet(lowerC, on + rlowerC,
-                      -1.0 * np.ones(nlowerC, dtype=np.float64))
-        J.put_triplet(upperC, on + nlowerC + rupperC,
-                      -1.0 * np.ones(nupperC, dtype=np.float64))
-        J.put_triplet(rangeC, on + nlowerC + nupperC + rrangeC,
-                      -1.0 * np.ones(nrangeC, dtype=np.float64))
-
+        s_vals, s_rows, s_cols = self.slack_jac()
+        J.put_triplet(s_rows, s_cols, s_vals)
         return J
 
     def hess(self, x, z=None, *args, **kwargs):
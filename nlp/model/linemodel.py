@@ -2,7 +2,7 @@
 """Restriction of models to lines."""
 
 from nlp.model.nlpmodel import NLPModel
-from nlp.tools.utils import where, Min, Max
+from nlp.tools.utils import where, Min, Max, axpy
 import numpy as np
 
 
@@ -23,6 +23,10 @@ class C1LineModel(NLPModel):
 
     The functions f and c are only assumed to be C¹, i.e., only values and
     first derivatives of ϕ and γ are defined.
+
+    The point x + td is formed by :meth:`trial` in a buffer that is reused
+    for all values of t, so that successive evaluations at the same t do
+    not form it again.
     """
 
     def __init__(self, model, x, d, **kwargs):
@@ -63,6 +67,8 @@ class C1LineModel(NLPModel):
         self.__g = None  # most recent objective gradient of `model`
         self.__c = None  # most recent constraint values of `model`
         self.__model = model
+        self.__xtd = np.empty(x.shape)  # most recent x + td
+        self.__t = None
 
     @property
     def x(self):
@@ -92,13 +98,28 @@ class C1LineModel(NLPModel):
     def model(self):
         return self.__model
 
+    def trial(self, t):
+        u"""Return the full-space point x + td.
+
+        The point is formed in place with a single axpy, in a buffer that is
+        overwritten by the next call with a different t. Copy it if it must
+        be preserved. For t = 0, x itself is returned.
+        """
+        if t == 0:
+            return self.x
+        if t != self.__t:
+            self.__xtd[:] = self.x
+            axpy(t, self.d, self.__xtd)
+            self.__t = t
+        return self.__xtd
+
     def obj(self, t, x=None):
         u"""Evaluate ϕ(t) = f(x + td).
 
         :keywords:
             :x: full-space x+td if that vector has already been formed.
         """
-        xtd = (self.x + t * self.d) if x is None else x
+        xtd = self.trial(t) if x is None else x
         self.__f = self.model.obj(xtd)
         return self.objval
 
@@ -108,17 +129,27 @@ class C1LineModel(NLPModel):
         :keywords:
             :x: full-space x+td if that vector has already been formed.
         """
-        xtd = (self.x + t * self.d) if x is None else x
+        xtd = self.trial(t) if x is None else x
         self.__g = self.model.grad(xtd)
         return np.dot(self.gradval, self.d)
 
+    def obj_grad(self, t, x=None):
+        u"""Evaluate ϕ(t) and ϕ'(t) with a single call to `model.obj_grad`.
+
+        :keywords:
+            :x: full-space x+td if that vector has already been formed.
+        """
+        xtd = self.trial(t) if x is None else x
+        self.__f, self.__g = self.model.obj_grad(xtd)
+        return (self.objval, np.dot(self.gradval, self.d))
+
     def cons(self, t, x=None):
         u"""Evaluate γ(t) = c(x + td).
 
         :keywords:
             :x: full-space x+td if that vector has already been formed.
         """
-        xtd = (self.x + t * self.d) if x is None else x
+        xtd = self.trial(t) if x is None else x
         self.__c = self.model.cons(xtd)
         return self.conval
 
@@ -128,7 +159,7 @@ class C1LineModel(NLPModel):
         :keywords:
             :x: full-space x+td if that vector has already been formed.
         """
-        xtd = (self.x + t * self.d) if x is None else x
+        xtd = self.trial(t) if x is None else x
         return self.model.jprod(xtd, self.d)
 
     def jprod(self, t, v, x=None):
@@ -167,7 +198,7 @@ class C2LineModel(C1LineModel):
         :keywords:
             :x: full-space x+td if that vector has already been formed.
         """
-        xtd = (self.x + t * self.d) if x is None else x
+        xtd = self.trial(t) if x is None else x
         return np.dot(self.d, self.model.hprod(xtd, z, self.d))
 
     def hprod(self, t, z, v, x=None):
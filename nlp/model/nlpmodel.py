@@ -6,7 +6,8 @@ import os
 import sys
 import numpy as np
 from nlp.model.kkt import KKTresidual
-from nlp.tools.decorators import deprecated, counter
+from nlp.tools.decorators import deprecated, counter, memoize_point, \
+    invalidate_point_cache
 from nlp.tools.utils import where
 from pykrylov.linop.linop import LinearOperator, DiagonalOperator, \
     ReducedLinearOperator
@@ -93,61 +94,10 @@ class NLPModel(object):
         self._nnln = len(self.nln)            # Number of nonlinear constraints
         self._nnet = len(self.net)            # Number of network constraints
 
-        # Maintain lists of indices for each type of constraints:
-        self.rangeC = []    # Range constraints:       cL <= c(x) <= cU
-        self.lowerC = []    # Lower bound constraints: cL <= c(x)
-        self.upperC = []    # Upper bound constraints:       c(x) <= cU
-        self.equalC = []    # Equality constraints:    cL  = c(x)  = cU
-
-        for i in range(self.m):
-            if self.Lcon[i] > -np.inf and self.Ucon[i] < np.inf:
-                if self.Lcon[i] == self.Ucon[i]:
-                    self.equalC.append(i)
-                else:
-                    self.rangeC.append(i)
-            elif self.Lcon[i] > -np.inf:
-                self.lowerC.append(i)
-            elif self.Ucon[i] < np.inf:
-                self.upperC.append(i)
-
-        self.nlowerC = len(self.lowerC)   # Number of lower bound constraints
-        self.nrangeC = len(self.rangeC)   # Number of range constraints
-        self.nupperC = len(self.upperC)   # Number of upper bound constraints
-        self.nequalC = len(self.equalC)   # Number of equality constraints
-
-        # Define permutations to order constraints / multipliers.
-        self.permC = self.equalC + self.lowerC + self.upperC + self.rangeC
-
-        # Proceed similarly with bound constraints
-        self.rangeB = []
-        self.lowerB = []
-        self.upperB = []
-        self.fixedB = []
-        self.freeB = []
-
-        for i in range(self.n):
-            if self.Lvar[i] > -np.inf and self.Uvar[i] < np.inf:
-                if self.Lvar[i] == self.Uvar[i]:
-                    self.fixedB.append(i)
-                else:
-                    self.rangeB.append(i)
-            elif self.Lvar[i] > -np.inf:
-                self.lowerB.append(i)
-            elif self.Uvar[i] < np.inf:
-                self.upperB.append(i)
-            else:
-                self.freeB.append(i)
-
-        self.nlowerB = len(self.lowerB)
-        self.nrangeB = len(self.rangeB)
-        self.nupperB = len(self.upperB)
-        self.nfixedB = len(self.fixedB)
-        self.nfreeB = len(self.freeB)
-        self.nbounds = self.n - self.nfreeB
-
-        # Define permutations to order bound constraints / multipliers.
-        self.permB = self.fixedB + self.lowerB + self.upperB + \
-            self.rangeB + self.freeB
+        # Maintain lists of indices for each type of constraints
+        # and bounds.
+        self._classify_constraints()
+        self._classify_bounds()
 
         # Define default stopping tolerances
         self._stop_d = 1.0e-6    # Dual feasibility
@@ -176,6 +126,56 @@ class NLPModel(object):
         for meth in meths:
             setattr(self, meth, counter(getattr(self, meth)))
 
+    def _classify_constraints(self):
+        """Classify general constraints according to their bounds."""
+        # Range constraints:       cL <= c(x) <= cU
+        # Lower bound constraints: cL <= c(x)
+        # Upper bound constraints:       c(x) <= cU
+        # Equality constraints:    cL  = c(x)  = cU
+        Lcon = self.Lcon[:self.m]
+        Ucon = self.Ucon[:self.m]
+        has_lower = Lcon > -np.inf
+        has_upper = Ucon < np.inf
+        has_both = has_lower & has_upper
+        is_equal = Lcon == Ucon
+        self.rangeC = where(has_both & ~is_equal).tolist()
+        self.lowerC = where(has_lower & ~has_upper).tolist()
+        self.upperC = where(has_upper & ~has_lower).tolist()
+        self.equalC = where(has_both & is_equal).tolist()
+
+        self.nlowerC = len(self.lowerC)   # Number of lower bound constraints
+        self.nrangeC = len(self.rangeC)   # Number of range constraints
+        self.nupperC = len(self.upperC)   # Number of upper bound constraints
+        self.nequalC = len(self.equalC)   # Number of equality constraints
+
+        # Define permutations to order constraints / multipliers.
+        self.permC = self.equalC + self.lowerC + self.upperC + self.rangeC
+
+    def _classify_bounds(self):
+        """Classify bound constraints according to their values."""
+        Lvar = self.Lvar[:self.n]
+        Uvar = self.Uvar[:self.n]
+        has_lower = Lvar > -np.inf
+        has_upper = Uvar < np.inf
+        has_both = has_lower & has_upper
+        is_fixed = Lvar == Uvar
+        self.rangeB = where(has_both & ~is_fixed).tolist()
+        self.lowerB = where(has_lower & ~has_upper).tolist()
+        self.upperB = where(has_upper & ~has_lower).tolist()
+        self.fixedB = where(has_both & is_fixed).tolist()
+        self.freeB = where(~(has_lower | has_upper)).tolist()
+
+        self.nlowerB = len(self.lowerB)
+        self.nrangeB = len(self.rangeB)
+        self.nupperB = len(self.upperB)
+        self.nfixedB = len(self.fixedB)
+        self.nfreeB = len(self.freeB)
+        self.nbounds = self.n - self.nfreeB
+
+        # Define permutations to order bound constraints / multipliers.
+        self.permB = self.fixedB + self.lowerB + self.upperB + \
+            self.rangeB + self.freeB
+
     @property
     def nvar(self):
         """Number of variables."""
@@ -330,6 +330,7 @@ class NLPModel(object):
             self.scale_con = None
             self.Lcon = self.model.get_Lcon()  # lower bounds on constraints
             self.Ucon = self.model.get_Ucon()  # upper bounds on constraints
+            self.invalidate_jop()
             return
 
         # Quick return if the problem is already scaled
@@ -357,6 +358,7 @@ class NLPModel(object):
             gmaxNorm = max(gmaxNorm, giNorm)
 
         self.scale_con = d_c
+        self.invalidate_jop()  # The Jacobian is now scaled.
 
         # Scale constraint bounds: componentwise multiplications
         self.Lcon *= d_c        # lower bounds on constraints
@@ -382,12 +384,10 @@ class NLPModel(object):
 
         pFeas = np.empty(m + nrC + nB + nrB)
         pFeas[:m + nrC] = -self.cons_pos(x) if c is None else -c
-        not_eC = [i for i in range(m + nrC) if i not in eC]
-        pFeas[eC] = np.abs(pFeas[eC])
-        pFeas[not_eC] = np.maximum(0, pFeas[not_eC])
-        pFeas[m:m + nrC] = np.maximum(0, pFeas[m:m + nrC])
-        pFeas[m + nrC:] = -self.get_bounds(x)
-        pFeas[m + nrC:] = np.maximum(0, pFeas[m + nrC:])
+        pFeas[m + nrC:] = -self.bounds(x)
+        eFeas = np.abs(pFeas[eC])
+        np.maximum(0, pFeas, out=pFeas)
+        pFeas[eC] = eFeas
 
         return pFeas
 
@@ -398,7 +398,7 @@ class NLPModel(object):
         the constraints Jacobian. It should conform to either :meth:`jac` or
         :meth:`jac_pos` depending on the value of `all_pos` (see below).
 
-        The multipliers `z` should conform to :meth:`get_bounds`.
+        The multipliers `z` should conform to :meth:`bounds`.
 
         :keywords:
             :obj_weight: weight of the objective gradient in dual feasibility.
@@ -443,26 +443,25 @@ class NLPModel(object):
 
         If `c` is specified, it should conform to :meth:`cons_pos` and the
         multipliers `y` should appear in the same order. The multipliers `z`
-        should conform to :meth:`get_bounds`.
+        should conform to :meth:`bounds`.
 
         :returns:
             :cy:  complementarity residual for general constraints
             :xz:  complementarity residual for bound constraints.
         """
         # Shortcuts.
+        m = self.m
         lC = self.lowerC
         uC = self.upperC
         rC = self.rangeC
-        nlC = self.nlowerC
-        nuC = self.nupperC
         nrC = self.nrangeC
 
-        not_eC = lC + uC + rC + range(nlC + nuC + nrC, nlC + nuC + nrC + nrC)
+        not_eC = lC + uC + rC + range(m, m + nrC)
         if c is None:
             c = self.cons_pos(x)
 
         cy = c[not_eC] * y[not_eC]
-        xz = self.get_bounds(x) * z
+        xz = self.bounds(x) * z
 
         return (cy, xz)
 
@@ -490,8 +489,9 @@ class NLPModel(object):
         check = kwargs.get('check', True)
 
         if check:
-            not_eC = [i for i in range(m + nrC) if i not in eC]
-            if len(where(y[not_eC] < 0)) > 0:
+            not_eC = np.ones(m + nrC, dtype=np.bool)
+            not_eC[eC] = False
+            if np.any(y[:m + nrC][not_eC] < 0):
                 raise ValueError('Multipliers for inequalities must be >= 0.')
             if not np.all(z >= 0):
                 raise ValueError('Multipliers for bounds must be >= 0.')
@@ -543,6 +543,14 @@ class NLPModel(object):
         """Evaluate the objective gradient at x."""
         raise NotImplementedError('This method must be subclassed.')
 
+    def obj_grad(self, x):
+        u"""Evaluate the objective function and its gradient at x.
+
+        Return the pair (f(x), ∇f(x)). Override this method in models whose
+        objective and gradient share computations.
+        """
+        return (self.obj(x), self.grad(x))
+
     def cons(self, x, **kwargs):
         """Evaluate vector of constraints at x."""
         raise NotImplementedError('This method must be subclassed.')
@@ -612,14 +620,26 @@ class NLPModel(object):
         """Evaluate transposed-Jacobian-vector product at x with p."""
         raise NotImplementedError('This method must be subclassed')
 
+    @memoize_point()
     def jop(self, x):
-        """Obtain Jacobian at x as a linear operator."""
+        """Obtain Jacobian at x as a linear operator.
+
+        The operators obtained at the two most recent points are memoized.
+        See :meth:`invalidate_jop`.
+        """
         return LinearOperator(self.n, self.m,
                               lambda v: self.jprod(x, v),
                               matvec_transp=lambda u: self.jtprod(x, u),
                               symmetric=False,
                               dtype=np.float)
 
+    def invalidate_jop(self):
+        """Discard the Jacobian operators memoized by :meth:`jop`.
+
+        This must be called if the constraints change other than through x.
+        """
+        invalidate_point_cache(self, 'jop')
+
     def jop_pos(self, x):
         """Jacobian of :meth:`cons_pos` at x as a linear operator."""
         J = self.jop(x)
@@ -14,7 +14,7 @@ def _random():
 
 def _random_array(n):
     """Return a random array of length n with elements in [-1,1)."""
-    return 2*random_array()-1
+    return 2*random_array(n)-1
 
 
 class NoisyAmplModel(AmplModel):
@@ -48,14 +48,12 @@ class NoisyAmplModel(AmplModel):
 
     def sgrad(self, x):
         sg = AmplModel.sgrad(self, x)
-        for k in sg.keys():
-            sg[k] += self.noise_amplitude * _random()
+        sg.values += self.noise_amplitude * _random_array(sg.nnz)
         return sg
 
     def cost(self):
         c = AmplModel.cost(self)
-        for k in c.keys():
-            c[k] += self.noise_amplitude * _random()
+        c.values += self.noise_amplitude * _random_array(c.nnz)
         return c
 
     def cons(self, x):
@@ -80,14 +78,12 @@ class NoisyAmplModel(AmplModel):
 
     def sigrad(self, i, x):
         sgi = AmplModel.sigrad(self, i, x)
-        for k in sgi.keys():
-            sgi[k] += self.noise_amplitude * _random()
+        sgi.values += self.noise_amplitude * _random_array(sgi.nnz)
         return sgi
 
     def irow(self, i):
         row = AmplModel.irow(self, i)
-        for k in row.keys():
-            row[k] += self.noise_amplitude * _random()
+        row.values += self.noise_amplitude * _random_array(row.nnz)
         return row
 
     def A(self, *args):
@@ -9,6 +9,7 @@ except ImportError:
 from nlp.model.nlpmodel import NLPModel
 from nlp.model.snlp import SlackModel
 from nlp.model.qnmodel import QuasiNewtonModel
+from nlp.tools.decorators import memoize_point
 from pykrylov.linop.linop import PysparseLinearOperator
 
 import numpy as np
@@ -66,9 +67,13 @@ try:
             A.put(vals, rows, cols)
             return A
 
-        def jop(self, *args, **kwargs):
-            """Obtain Jacobian at x as a linear operator."""
-            return PysparseLinearOperator(self.jac(*args, **kwargs))
+        @memoize_point()
+        def jop(self, x, *args, **kwargs):
+            """Obtain Jacobian at x as a linear operator.
+
+            The operators obtained at the two most recent points are memoized.
+            """
+            return PysparseLinearOperator(self.jac(x, *args, **kwargs))
 
     class QnPySparseAmplModel(QuasiNewtonModel, PySparseAmplModel):
         pass
@@ -102,36 +107,21 @@ class PySparseSlackModel(SlackModel):
         """
         n = self.n
         m = self.m
-        model = self.model
         on = self.original_n
 
-        lowerC = np.array(model.lowerC)
-        nlowerC = model.nlowerC
-        upperC = np.array(model.upperC)
-        nupperC = model.nupperC
-        rangeC = np.array(model.rangeC)
-        nrangeC = model.nrangeC
-
         # Initialize sparse Jacobian
-        nnzJ = self.model.nnzj + m
+        nnzJ = self.model.nnzj + self.n_slacks
         J = psp(nrow=m, ncol=n, sizeHint=nnzJ)
 
         # Insert contribution of general constraints
         if lp:
-            J[:on, :on] = self.model.A()
+            J[:m, :on] = self.model.A()
         else:
-            J[:on, :on] = self.model.jac(x[:on])
-
-        # Create a few index lists
-        rlowerC = np.array(range(nlowerC))
-        rupperC = np.array(range(nupperC))
-        rrangeC = np.array(range(nrangeC))
+            J[:m, :on] = self.model.jac(x[:on])
 
         # Insert contribution of slacks on general constraints
-        J.put(-1.0, lowerC, on + rlowerC)
-        J.put(-1.0, upperC, on + nlowerC + rupperC)
-        J.put(-1.0, rangeC, on + nlowerC + nupperC + rrangeC)
-
+        s_vals, s_rows, s_cols = self.slack_jac()
+        J.put(s_vals, s_rows, s_cols)
         return J
 
     def hess(self, x, z=None, obj_num=0, *args, **kwargs):
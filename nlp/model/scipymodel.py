@@ -1,93 +1,185 @@
-"""Models with sparse matrices in SciPy coordinate (COO) format."""
+# -*- coding: utf-8 -*-
+"""Models with sparse matrices in SciPy format."""
 
 from scipy import sparse as sp
 
 from nlp.model.nlpmodel import NLPModel
-from nlp.model.amplmodel import AmplModel
 from nlp.model.snlp import SlackModel
+from nlp.model.augmented_lagrangian import AugmentedLagrangian
 from nlp.model.qnmodel import QuasiNewtonModel
+from nlp.tools.decorators import memoize_point
 from pykrylov.linop.linop import linop_from_ndarray
 import numpy as np
 
 
+class CSRAssembler(object):
+    """Assemble CSR matrices from coordinate triplets with a fixed pattern.
+
+    The first call computes the CSR structure of the pattern `(rows, cols)`
+    and the position of each triplet in the CSR data array. As long as
+    subsequent calls supply the same pattern, assembly reduces to scattering
+    the values into a new data array. Duplicate triplets are summed.
+
+    Matrices returned by successive calls share their `indices` and `indptr`
+    arrays, so their sparsity structure must not be modified in place.
+    """
+
+    def __init__(self, shape, symmetric=False):
+        """Instantiate an assembler for matrices of the given shape.
+
+        If `symmetric` is `True`, the triplets are assumed to represent one
+        triangle of a symmetric matrix and the other triangle is filled in.
+        """
+        self.shape = shape
+        self.symmetric = symmetric
+        self.rows = None
+        self.cols = None
+
+    def _setup(self, rows, cols):
+        nrow, ncol = self.shape
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        if self.symmetric:
+            self.offdiag = np.where(rows != cols)[0]
+            rows, cols = (np.concatenate((rows, cols[self.offdiag])),
+                          np.concatenate((cols, rows[self.offdiag])))
+
+        keys = rows * ncol + cols
+        uniq, self.slots = np.unique(keys, return_inverse=True)
+        self.nslots = uniq.size
+        self.duplicates = uniq.size < keys.size
+
+        self.indices = (uniq % ncol).astype(np.int32)
+        self.indptr = np.zeros(nrow + 1, dtype=np.int32)
+        np.cumsum(np.bincount(uniq // ncol, minlength=nrow),
+                  out=self.indptr[1:])
+
+    def same_pattern(self, rows, cols):
+        """Return `True` if `(rows, cols)` is the current pattern."""
+        if self.rows is None:
+            return False
+        if rows is self.rows and cols is self.cols:
+            return True
+        return np.array_equal(rows, self.rows) and \
+            np.array_equal(cols, self.cols)
+
+    def __call__(self, vals, rows, cols):
+        """Return the CSR matrix represented by `(vals, rows, cols)`."""
+        if not self.same_pattern(rows, cols):
+            self._setup(rows, cols)
+        self.rows = rows
+        self.cols = cols
+
+        if self.symmetric:
+            vals = np.concatenate((vals, vals[self.offdiag]))
+        if self.duplicates:
+            data = np.bincount(self.slots, weights=vals,
+                               minlength=self.nslots)
+        else:
+            data = np.empty(self.nslots, dtype=np.float64)
+            data[self.slots] = vals
+        return sp.csr_matrix((data, self.indices, self.indptr),
+                             shape=self.shape, copy=False)
+
+
+def assemble_csr(model, name, vals, rows, cols, shape, symmetric=False):
+    """Assemble a CSR matrix with the assembler stored in `model.name`.
+
+    The assembler is created at the first call.
+    """
+    assembler = getattr(model, name, None)
+    if assembler is None:
+        assembler = CSRAssembler(shape, symmetric=symmetric)
+        setattr(model, name, assembler)
+    return assembler(vals, rows, cols)
+
+
 class SciPyNLPModel(NLPModel):
-    """`NLPModel` with sparse matrices in SciPy coordinate (COO) format.
+    """`NLPModel` with sparse matrices in SciPy compressed row (CSR) format.
 
     The `NLPModel`'s :meth:`jac` and :meth:`hess` methods
     should return that sparse Jacobian and Hessian in coordinate format:
-    (vals, rows, cols).
+    (vals, rows, cols). The CSR structure is computed at the first evaluation
+    and reused as long as the sparsity pattern does not change.
     """
 
     def hess(self, *args, **kwargs):
         """Evaluate Lagrangian Hessian."""
         vals, rows, cols = super(SciPyNLPModel, self).hess(*args, **kwargs)
-        return sp.coo_matrix((vals, (rows, cols)),
-                             shape=(self.nvar, self.nvar))
+        return assemble_csr(self, '_hess_csr', vals, rows, cols,
+                            (self.nvar, self.nvar))
 
     def jac(self, *args, **kwargs):
         """Evaluate sparse constraints Jacobian."""
         if self.ncon == 0:  # SciPy cannot create sparse matrix of size 0.
             return linop_from_ndarray(np.empty((0, self.nvar), dtype=np.float))
         vals, rows, cols = super(SciPyNLPModel, self).jac(*args, **kwargs)
-        return sp.coo_matrix((vals, (rows, cols)),
-                             shape=(self.ncon, self.nvar))
-
+        return assemble_csr(self, '_jac_csr', vals, rows, cols,
+                            (self.ncon, self.nvar))
 
-class SciPyAmplModel(AmplModel):
-    """`AmplModel` with sparse matrices n SciPy coordinate (COO) format."""
 
-    # MRO: 1. SciPyAmplModel
-    #      2. AmplModel
-    #      3. NLPModel
+try:
+    from nlp.model.amplmodel import AmplModel
 
-    def A(self, *args, **kwargs):
-        """Evaluate sparse Jacobian of the linear part of the constraints.
+    class SciPyAmplModel(AmplModel):
+        """`AmplModel` with sparse matrices in SciPy format.
 
-        Useful to obtain constraint matrix when problem is a linear programming
-        problem.
+        The constraint Jacobian and Lagrangian Hessian are returned in CSR
+        format. Their CSR structure is computed once and reused.
         """
-        vals, rows, cols = super(SciPyAmplModel, self).A(*args, **kwargs)
-        return sp.coo_matrix((vals, (rows, cols)),
-                             shape=(self.ncon, self.nvar))
 
-    def jac(self, *args, **kwargs):
-        """Evaluate sparse constraints Jacobian."""
-        if self.ncon == 0:  # SciPy cannot create sparse matrix of size 0.
-            return linop_from_ndarray(np.empty((0, self.nvar), dtype=np.float))
+        # MRO: 1. SciPyAmplModel
+        #      2. AmplModel
+        #      3. NLPModel
 
-        vals, rows, cols = super(SciPyAmplModel, self).jac(*args, **kwargs)
-        return sp.coo_matrix((vals, (rows, cols)),
-                             shape=(self.ncon, self.nvar))
+        def A(self, *args, **kwargs):
+            """Evaluate sparse Jacobian of the linear part of the constraints.
 
-    def hess(self, *args, **kwargs):
-        """Evaluate Lagrangian Hessian at (x, z)."""
-        l_vals, l_rows, l_cols = super(SciPyAmplModel, self).hess(*args,
-                                                                  **kwargs)
+            Useful to obtain constraint matrix when problem is a linear
+            programming problem.
+            """
+            vals, rows, cols = super(SciPyAmplModel, self).A(*args, **kwargs)
+            return sp.coo_matrix((vals, (rows, cols)),
+                                 shape=(self.ncon, self.nvar))
 
-        # AMPL only returns the upper triangular part of the Hessian and
-        # `scipy.coo_matrix` doesn't have a `symmetric` attribute, so we
-        # need to copy the upper part of the matrix
-        diag_idx = np.where(l_rows == l_cols)
+        def jac(self, *args, **kwargs):
+            """Evaluate sparse constraints Jacobian."""
+            if self.ncon == 0:  # SciPy cannot create sparse matrix of size 0.
+                return linop_from_ndarray(np.empty((0, self.nvar),
+                                                   dtype=np.float))
 
-        # strict upper triangle of H is obtained by switching rows and
-        # cols indices and removing values on the diagonal.
-        u_rows = np.delete(l_cols, diag_idx)  # creates a copy
-        u_cols = np.delete(l_rows, diag_idx)
-        u_vals = np.delete(l_vals, diag_idx)
+            vals, rows, cols = super(SciPyAmplModel, self).jac(*args,
+                                                               **kwargs)
+            return assemble_csr(self, '_jac_csr', vals, rows, cols,
+                                (self.ncon, self.nvar))
 
-        H = sp.coo_matrix((np.concatenate((l_vals, u_vals)),
-                           (np.concatenate((l_rows, u_rows)),
-                            np.concatenate((l_cols, u_cols)))),
-                          shape=(self.nvar, self.nvar))
-        return H
+        def hess(self, *args, **kwargs):
+            """Evaluate Lagrangian Hessian at (x, z)."""
+            l_vals, l_rows, l_cols = super(SciPyAmplModel, self).hess(*args,
+                                                                      **kwargs)
 
-    def jop(self, *args, **kwargs):
-        """Obtain Jacobian at x as a linear operator."""
-        return self.jac(*args, **kwargs)
+            # AMPL only returns one triangle of the Hessian; the assembler
+            # mirrors its strict part into the other triangle.
+            return assemble_csr(self, '_hess_csr', l_vals, l_rows, l_cols,
+                                (self.nvar, self.nvar), symmetric=True)
+
+        @memoize_point()
+        def jop(self, x, *args, **kwargs):
+            """Obtain Jacobian at x as a linear operator.
+
+            The operators obtained at the two most recent points are memoized.
+            """
+            return self.jac(x, *args, **kwargs)
+
+except ImportError:
+    pass
 
 
 class SciPySlackModel(SlackModel):
-    """`SlackModel` with sparse matrices in SciPy coordinate (COO) format.
+    """`SlackModel` with sparse matrices in SciPy format.
+
+    The Jacobian [J  -I] is returned in CSR format and its structure is
+    computed once. Use :meth:`jop` to avoid assembling it.
 
     :keywords:
         :model:  Original model to be transformed into a slack form.
@@ -112,35 +204,17 @@ class SciPySlackModel(SlackModel):
         if self.ncon == 0:  # SciPy cannot create sparse matrix of size 0.
             return linop_from_ndarray(np.empty((0, self.nvar), dtype=np.float))
 
-        model = self.model
-        on = self.original_n
-
         # Get contribution of general constraints
-        J = model.jac(x, lp)
-        c_vals = J.data
-        c_rows = J.row
-        c_cols = J.col
-
-        # Create a few index lists
-        lowerC = np.array(model.lowerC, dtype=np.int64)
-        nlowerC = model.nlowerC
-        upperC = np.array(model.upperC, dtype=np.int64)
-        nupperC = model.nupperC
-        rangeC = np.array(model.rangeC, dtype=np.int64)
-        nrangeC = model.nrangeC
-        rlowerC = np.array(range(nlowerC))
-        rupperC = np.array(range(nupperC))
-        rrangeC = np.array(range(nrangeC))
-
-        # Insert contribution of slacks on general constraints
-        rows = np.concatenate((c_rows, lowerC, upperC, rangeC))
-        cols = np.concatenate((c_cols, on + rlowerC, on + nlowerC + rupperC,
-                               on + nlowerC + nupperC + rrangeC))
-        vals = np.concatenate((c_vals,
-                               -1.0 * np.ones(nlowerC + nupperC + nrangeC)))
+        J = self.model.A() if lp else self.model.jac(x[:self.original_n])
+        J = J.tocoo()
 
-        return sp.coo_matrix((vals, (rows, cols)),
-                             shape=(self.ncon, self.nvar))
+        # Append the -I block, whose coordinates are computed once.
+        s_vals, s_rows, s_cols = self.slack_jac()
+        vals = np.concatenate((J.data, s_vals))
+        rows = np.concatenate((J.row, s_rows))
+        cols = np.concatenate((J.col, s_cols))
+        return assemble_csr(self, '_jac_csr', vals, rows, cols,
+                            (self.ncon, self.nvar))
 
     def hess(self, x, z=None, *args, **kwargs):
         """Evaluate Lagrangian Hessian at (x, z)."""
@@ -151,9 +225,85 @@ class SciPySlackModel(SlackModel):
         if z is None:
             z = np.zeros(self.m)
 
-        H = model.hess(x, z, **kwargs)
+        H = model.hess(x[:self.original_n], z, **kwargs).tocoo()
         vals = H.data
         rows = H.row
         cols = H.col
         return sp.coo_matrix((vals, (rows, cols)),
                              shape=(self.nvar, self.nvar))
+
+
+def gram_pattern(indptr, indices):
+    u"""Coordinates of the products that make up JᵀJ for a CSR matrix J.
+
+    Each pair of nonzeros `(k, l)` of J on the same row contributes
+    `J.data[k] * J.data[l]` to the element `(indices[k], indices[l])` of
+    JᵀJ. Return the index arrays `(pk, pl)` of all such pairs.
+    """
+    nnz_row = np.diff(indptr)
+    row_of = np.repeat(np.arange(nnz_row.size), nnz_row)
+    reps = nnz_row[row_of]
+    pk = np.repeat(np.arange(row_of.size), reps)
+    first = np.repeat(np.cumsum(reps) - reps, reps)
+    pl = np.repeat(indptr[row_of], reps) + (np.arange(pk.size) - first)
+    return (pk, pl)
+
+
+class SciPyAugmentedLagrangian(AugmentedLagrangian):
+    u"""`AugmentedLagrangian` with an explicit Hessian in SciPy CSR format.
+
+    The Hessian
+
+        ∇²L(x, π - δ c(x)) + δ JᵀJ + ρ I
+
+    is assembled from the sparse Hessian and Jacobian of the slack model so
+    that solvers may factorize it. The products that form JᵀJ and the CSR
+    structure of the sum are determined once and reused as long as the
+    sparsity patterns of the Hessian and Jacobian do not change.
+    """
+
+    def __init__(self, model, **kwargs):
+        if not isinstance(model, SlackModel):
+            model = SciPySlackModel(model, **kwargs)
+        super(SciPyAugmentedLagrangian, self).__init__(model, **kwargs)
+        self._gram = None
+
+    def _gram_pattern(self, J):
+        gram = self._gram
+        if gram is None or not (np.array_equal(gram[0], J.indptr) and
+                                np.array_equal(gram[1], J.indices)):
+            pk, pl = gram_pattern(J.indptr, J.indices)
+            gram = (J.indptr, J.indices, pk, pl, J.indices[pk], J.indices[pl])
+            self._gram = gram
+        return gram[2:]
+
+    def hess(self, x, z=None, **kwargs):
+        """Assemble the Hessian of the augmented Lagrangian at x.
+
+        If the slack model does not supply its Hessian as a sparse matrix,
+        e.g., with a quasi-Newton approximation, return a linear operator.
+        """
+        model = self.model
+        cons = model.cons(x)
+        H = model.hess(x, self.pi - self.penalty * cons)
+        if not sp.issparse(H):
+            return self.hop(x, z, **kwargs)
+        H = H.tocoo()
+
+        vals = [H.data]
+        rows = [H.row]
+        cols = [H.col]
+        if model.m > 0:
+            J = model.jac(x)
+            pk, pl, g_rows, g_cols = self._gram_pattern(J)
+            vals.append(self.penalty * J.data[pk] * J.data[pl])
+            rows.append(g_rows)
+            cols.append(g_cols)
+        if self.prox > 0:
+            diag = np.arange(self.n)
+            vals.append(self.prox * np.ones(self.n))
+            rows.append(diag)
+            cols.append(diag)
+        return assemble_csr(self, '_hess_csr', np.concatenate(vals),
+                            np.concatenate(rows), np.concatenate(cols),
+                            (self.n, self.n))
@@ -4,6 +4,8 @@
 
 import numpy as np
 from nlp.model.nlpmodel import NLPModel
+from nlp.tools.decorators import memoize_point, invalidate_point_cache
+from pykrylov.linop import LinearOperator
 
 __docformat__ = 'restructuredtext'
 
@@ -87,20 +89,30 @@ class SlackModel(NLPModel):
 
         # Add bounds corresponding to lower constraints
         bot = self.original_n
-        self.sL = range(bot, bot + model.nlowerC)
+        self.sL = np.arange(bot, bot + model.nlowerC)
         Lvar[bot:bot + model.nlowerC] = model.Lcon[model.lowerC]
 
         # Add bounds corresponding to upper constraints
         bot += model.nlowerC
-        self.sU = range(bot, bot + model.nupperC)
+        self.sU = np.arange(bot, bot + model.nupperC)
         Uvar[bot:bot + model.nupperC] = model.Ucon[model.upperC]
 
         # Add bounds corresponding to range constraints
         bot += model.nupperC
-        self.sR = range(bot, bot + model.nrangeC)
+        self.sR = np.arange(bot, bot + model.nrangeC)
         Lvar[bot:bot + model.nrangeC] = model.Lcon[model.rangeC]
         Uvar[bot:bot + model.nrangeC] = model.Ucon[model.rangeC]
 
+        # Index sets of the original constraints, stored once as arrays.
+        self._equalC = np.array(model.equalC, dtype=np.int64)
+
+        # Coordinates of the -I block of the Jacobian. Slack k appears in
+        # column original_n + k and row slack_rows[k].
+        self._slack_rows = np.array(list(model.lowerC) + list(model.upperC) +
+                                    list(model.rangeC), dtype=np.int64)
+        self._slack_cols = np.arange(self.original_n, n, dtype=np.int64)
+        self._slack_vals = -np.ones(n_slacks)
+
         # No more inequalities. All constraints are now equal to 0
         Lcon = Ucon = np.zeros(m)
 
@@ -136,15 +148,17 @@ class SlackModel(NLPModel):
 
         return f
 
-    def grad(self, x):
+    def grad(self, x, out=None):
         """Evaluate the objective gradient at x.
 
         This function is specialized since the original objective function only
-        depends on a subvector of `x`.
+        depends on a subvector of `x`. If `out` is given, the gradient is
+        stored in it and `out` is returned.
         """
-        g = np.zeros(self.n)
-        g[:self.original_n] = self.model.grad(x[:self.original_n])
-
+        on = self.original_n
+        g = np.empty(self.n) if out is None else out
+        g[:on] = self.model.grad(x[:on])
+        g[on:] = 0.0
         return g
 
     def cons(self, x):
@@ -155,19 +169,11 @@ class SlackModel(NLPModel):
         """
         on = self.original_n
         model = self.model
-
-        equalC = model.equalC
-        lowerC = model.lowerC
-        upperC = model.upperC
-        rangeC = model.rangeC
+        equalC = self._equalC
 
         c = model.cons(x[:on])
-
         c[equalC] -= model.Lcon[equalC]
-        c[lowerC] -= x[self.sL]
-        c[upperC] -= x[self.sU]
-        c[rangeC] -= x[self.sR]
-
+        c[self._slack_rows] -= x[on:]
         return c
 
     def jprod(self, x, v, **kwargs):
@@ -176,44 +182,38 @@ class SlackModel(NLPModel):
         See the documentation of :meth:`jac` for more details on how the
         constraints are ordered.
         """
-        # Create some shortcuts for convenience
-        model = self.model
         on = self.original_n
-        lowerC = model.lowerC
-        upperC = model.upperC
-        rangeC = model.rangeC
-
-        p = model.jprod(x[:on], v[:on])
+        p = self.model.jprod(x[:on], v[:on])
 
         # Insert contribution of slacks on general constraints
-        p[lowerC] -= v[self.sL]
-        p[upperC] -= v[self.sU]
-        p[rangeC] -= v[self.sR]
+        p[self._slack_rows] -= v[on:]
         return p
 
-    def jtprod(self, x, v, **kwargs):
+    def jtprod(self, x, v, out=None, **kwargs):
         """Evaluate transposed-Jacobian-vector product at x with p.
 
         See the documentation of :meth:`jac` for more details on how the
-        constraints are ordered.
+        constraints are ordered. If `out` is given, the product is stored in
+        it and `out` is returned.
         """
-        # Create some shortcuts for convenience
-        model = self.model
         on = self.original_n
-        n = self.n
-        lowerC = model.lowerC
-        upperC = model.upperC
-        rangeC = model.rangeC
-
-        p = np.zeros(n)
-        p[:on] = model.jtprod(x[:on], v)
+        p = np.empty(self.n) if out is None else out
+        p[:on] = self.model.jtprod(x[:on], v)
 
         # Insert contribution of slacks on general constraints
-        p[self.sL] = -v[lowerC]
-        p[self.sU] = -v[upperC]
-        p[self.sR] = -v[rangeC]
+        p[on:] = -v[self._slack_rows]
         return p
 
+    def slack_jac(self):
+        """Return the -I block of the Jacobian in coordinate format.
+
+        The triplets `(vals, rows, cols)` are expressed in the numbering of
+        the slack problem. They are computed once, shared between calls and
+        should not be modified. Subclasses use them to assemble [J  -I]
+        explicitly.
+        """
+        return (self._slack_vals, self._slack_rows, self._slack_cols)
+
     def _jac(self, x, lp=False):
         """Helper method to assemble the Jacobian matrix of the constraints.
 
@@ -241,6 +241,42 @@ class SlackModel(NLPModel):
         """
         return self._jac(x, lp=False)
 
+    @memoize_point()
+    def jop(self, x):
+        """Obtain the Jacobian at x as a linear operator.
+
+        The Jacobian of the original model is obtained once as an operator
+        and the block -I is applied structurally, so that [J  -I] is never
+        assembled. The operators obtained at the two most recent points are
+        memoized.
+        """
+        on = self.original_n
+        J = self.model.jop(x[:on])
+        slack_rows = self._slack_rows
+
+        def matvec(v):
+            p = J * v[:on]
+            p[slack_rows] -= v[on:]
+            return p
+
+        def matvec_transp(u):
+            p = np.empty(self.n)
+            p[:on] = J.T * u
+            p[on:] = -u[slack_rows]
+            return p
+
+        return LinearOperator(self.n, self.m, matvec,
+                              matvec_transp=matvec_transp,
+                              symmetric=False, dtype=np.float)
+
+    def invalidate_jop(self):
+        """Discard the Jacobian operators memoized by :meth:`jop`.
+
+        The operators memoized by the original model are discarded as well.
+        """
+        invalidate_point_cache(self, 'jop')
+        self.model.invalidate_jop()
+
     def A(self):
         """Return the constraint matrix if the problem is a linear program.
 
@@ -248,21 +284,20 @@ class SlackModel(NLPModel):
         """
         return self._jac(0, lp=True)
 
-    def hprod(self, x, y, v, **kwargs):
+    def hprod(self, x, y, v, out=None, **kwargs):
         """Hessian-vector product.
 
         Evaluate matrix-vector product between the Hessian of the Lagrangian at
-        (x, z) and p.
+        (x, z) and p. If `out` is given, the product is stored in it and `out`
+        is returned.
         """
         if y is None:
             y = np.zeros(self.m)
 
-        # Create some shortcuts for convenience
-        model = self.model
         on = self.original_n
-
-        Hv = np.zeros(self.n)
-        Hv[:on] = model.hprod(x[:on], y, v[:on], **kwargs)
+        Hv = np.empty(self.n) if out is None else out
+        Hv[:on] = self.model.hprod(x[:on], y, v[:on], **kwargs)
+        Hv[on:] = 0.0
         return Hv
 
     def hess(self, x, z=None, *args, **kwargs):
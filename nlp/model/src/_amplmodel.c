@@ -514,7 +514,7 @@ typedef struct {
 } __Pyx_BufFmt_Context;
 
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":725
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":725
  * # in Cython to enable them only on the right systems.
  * 
  * ctypedef npy_int8       int8_t             # <<<<<<<<<<<<<<
@@ -523,7 +523,7 @@ typedef struct {
  */
 typedef npy_int8 __pyx_t_5numpy_int8_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":726
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":726
  * 
  * ctypedef npy_int8       int8_t
  * ctypedef npy_int16      int16_t             # <<<<<<<<<<<<<<
@@ -532,7 +532,7 @@ typedef npy_int8 __pyx_t_5numpy_int8_t;
  */
 typedef npy_int16 __pyx_t_5numpy_int16_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":727
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":727
  * ctypedef npy_int8       int8_t
  * ctypedef npy_int16      int16_t
  * ctypedef npy_int32      int32_t             # <<<<<<<<<<<<<<
@@ -541,7 +541,7 @@ typedef npy_int16 __pyx_t_5numpy_int16_t;
  */
 typedef npy_int32 __pyx_t_5numpy_int32_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":728
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":728
  * ctypedef npy_int16      int16_t
  * ctypedef npy_int32      int32_t
  * ctypedef npy_int64      int64_t             # <<<<<<<<<<<<<<
@@ -550,7 +550,7 @@ typedef npy_int32 __pyx_t_5numpy_int32_t;
  */
 typedef npy_int64 __pyx_t_5numpy_int64_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":732
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":732
  * #ctypedef npy_int128     int128_t
  * 
  * ctypedef npy_uint8      uint8_t             # <<<<<<<<<<<<<<
@@ -559,7 +559,7 @@ typedef npy_int64 __pyx_t_5numpy_int64_t;
  */
 typedef npy_uint8 __pyx_t_5numpy_uint8_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":733
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":733
  * 
  * ctypedef npy_uint8      uint8_t
  * ctypedef npy_uint16     uint16_t             # <<<<<<<<<<<<<<
@@ -568,7 +568,7 @@ typedef npy_uint8 __pyx_t_5numpy_uint8_t;
  */
 typedef npy_uint16 __pyx_t_5numpy_uint16_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":734
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":734
  * ctypedef npy_uint8      uint8_t
  * ctypedef npy_uint16     uint16_t
  * ctypedef npy_uint32     uint32_t             # <<<<<<<<<<<<<<
@@ -577,7 +577,7 @@ typedef npy_uint16 __pyx_t_5numpy_uint16_t;
  */
 typedef npy_uint32 __pyx_t_5numpy_uint32_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":735
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":735
  * ctypedef npy_uint16     uint16_t
  * ctypedef npy_uint32     uint32_t
  * ctypedef npy_uint64     uint64_t             # <<<<<<<<<<<<<<
@@ -586,7 +586,7 @@ typedef npy_uint32 __pyx_t_5numpy_uint32_t;
  */
 typedef npy_uint64 __pyx_t_5numpy_uint64_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":739
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":739
  * #ctypedef npy_uint128    uint128_t
  * 
  * ctypedef npy_float32    float32_t             # <<<<<<<<<<<<<<
@@ -595,7 +595,7 @@ typedef npy_uint64 __pyx_t_5numpy_uint64_t;
  */
 typedef npy_float32 __pyx_t_5numpy_float32_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":740
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":740
  * 
  * ctypedef npy_float32    float32_t
  * ctypedef npy_float64    float64_t             # <<<<<<<<<<<<<<
@@ -604,7 +604,7 @@ typedef npy_float32 __pyx_t_5numpy_float32_t;
  */
 typedef npy_float64 __pyx_t_5numpy_float64_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":749
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":749
  * # The int types are mapped a bit surprising --
  * # numpy.int corresponds to 'l' and numpy.long to 'q'
  * ctypedef npy_long       int_t             # <<<<<<<<<<<<<<
@@ -613,7 +613,7 @@ typedef npy_float64 __pyx_t_5numpy_float64_t;
  */
 typedef npy_long __pyx_t_5numpy_int_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":750
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":750
  * # numpy.int corresponds to 'l' and numpy.long to 'q'
  * ctypedef npy_long       int_t
  * ctypedef npy_longlong   long_t             # <<<<<<<<<<<<<<
@@ -622,7 +622,7 @@ typedef npy_long __pyx_t_5numpy_int_t;
  */
 typedef npy_longlong __pyx_t_5numpy_long_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":751
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":751
  * ctypedef npy_long       int_t
  * ctypedef npy_longlong   long_t
  * ctypedef npy_longlong   longlong_t             # <<<<<<<<<<<<<<
@@ -631,7 +631,7 @@ typedef npy_longlong __pyx_t_5numpy_long_t;
  */
 typedef npy_longlong __pyx_t_5numpy_longlong_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":753
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":753
  * ctypedef npy_longlong   longlong_t
  * 
  * ctypedef npy_ulong      uint_t             # <<<<<<<<<<<<<<
@@ -640,7 +640,7 @@ typedef npy_longlong __pyx_t_5numpy_longlong_t;
  */
 typedef npy_ulong __pyx_t_5numpy_uint_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":754
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":754
  * 
  * ctypedef npy_ulong      uint_t
  * ctypedef npy_ulonglong  ulong_t             # <<<<<<<<<<<<<<
@@ -649,7 +649,7 @@ typedef npy_ulong __pyx_t_5numpy_uint_t;
  */
 typedef npy_ulonglong __pyx_t_5numpy_ulong_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":755
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":755
  * ctypedef npy_ulong      uint_t
  * ctypedef npy_ulonglong  ulong_t
  * ctypedef npy_ulonglong  ulonglong_t             # <<<<<<<<<<<<<<
@@ -658,7 +658,7 @@ typedef npy_ulonglong __pyx_t_5numpy_ulong_t;
  */
 typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":757
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":757
  * ctypedef npy_ulonglong  ulonglong_t
  * 
  * ctypedef npy_intp       intp_t             # <<<<<<<<<<<<<<
@@ -667,7 +667,7 @@ typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
  */
 typedef npy_intp __pyx_t_5numpy_intp_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":758
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":758
  * 
  * ctypedef npy_intp       intp_t
  * ctypedef npy_uintp      uintp_t             # <<<<<<<<<<<<<<
@@ -676,7 +676,7 @@ typedef npy_intp __pyx_t_5numpy_intp_t;
  */
 typedef npy_uintp __pyx_t_5numpy_uintp_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":760
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":760
  * ctypedef npy_uintp      uintp_t
  * 
  * ctypedef npy_double     float_t             # <<<<<<<<<<<<<<
@@ -685,7 +685,7 @@ typedef npy_uintp __pyx_t_5numpy_uintp_t;
  */
 typedef npy_double __pyx_t_5numpy_float_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":761
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":761
  * 
  * ctypedef npy_double     float_t
  * ctypedef npy_double     double_t             # <<<<<<<<<<<<<<
@@ -694,7 +694,7 @@ typedef npy_double __pyx_t_5numpy_float_t;
  */
 typedef npy_double __pyx_t_5numpy_double_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":762
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":762
  * ctypedef npy_double     float_t
  * ctypedef npy_double     double_t
  * ctypedef npy_longdouble longdouble_t             # <<<<<<<<<<<<<<
@@ -726,7 +726,7 @@ typedef npy_longdouble __pyx_t_5numpy_longdouble_t;
 /*--- Type declarations ---*/
 struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":764
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":764
  * ctypedef npy_longdouble longdouble_t
  * 
  * ctypedef npy_cfloat      cfloat_t             # <<<<<<<<<<<<<<
@@ -735,7 +735,7 @@ struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl;
  */
 typedef npy_cfloat __pyx_t_5numpy_cfloat_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":765
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":765
  * 
  * ctypedef npy_cfloat      cfloat_t
  * ctypedef npy_cdouble     cdouble_t             # <<<<<<<<<<<<<<
@@ -744,7 +744,7 @@ typedef npy_cfloat __pyx_t_5numpy_cfloat_t;
  */
 typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":766
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":766
  * ctypedef npy_cfloat      cfloat_t
  * ctypedef npy_cdouble     cdouble_t
  * ctypedef npy_clongdouble clongdouble_t             # <<<<<<<<<<<<<<
@@ -753,7 +753,7 @@ typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
  */
 typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":768
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":768
  * ctypedef npy_clongdouble clongdouble_t
  * 
  * ctypedef npy_cdouble     complex_t             # <<<<<<<<<<<<<<
@@ -761,6 +761,7 @@ typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
  * cdef inline object PyArray_MultiIterNew1(a):
  */
 typedef npy_cdouble __pyx_t_5numpy_complex_t;
+struct __pyx_opt_args_3nlp_5model_3src_10_amplmodel_4ampl_grad_obj;
 
 /* "nlp/model/src/_amplmodel.pyx":14
  * # AMPL headers
@@ -789,7 +790,19 @@ enum  {
   __pyx_e_3nlp_5model_3src_10_amplmodel_GENERAL = 0
 };
 
-/* "nlp/model/src/_amplmodel.pyx":154
+/* "nlp/model/src/_amplmodel.pyx":345
+ *         return f
+ * 
+ *     cpdef grad_obj(self, ndarray[np.double_t] x, int obj_num=0):             # <<<<<<<<<<<<<<
+ *         """Evaluate the gradient of the objective at x."""
+ *         # Ensure contiguous input.
+ */
+struct __pyx_opt_args_3nlp_5model_3src_10_amplmodel_4ampl_grad_obj {
+  int __pyx_n;
+  int obj_num;
+};
+
+/* "nlp/model/src/_amplmodel.pyx":178
  * # AMPL interface class
  * ########################################################################
  * cdef class ampl:             # <<<<<<<<<<<<<<
@@ -831,7 +844,7 @@ struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl {
 struct __pyx_vtabstruct_3nlp_5model_3src_10_amplmodel_ampl {
   PyObject *(*get_nnzj)(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *, int __pyx_skip_dispatch);
   PyObject *(*get_nnzh)(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *, int __pyx_skip_dispatch);
-  PyObject *(*grad_obj)(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *, PyArrayObject *, int __pyx_skip_dispatch);
+  PyObject *(*grad_obj)(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *, PyArrayObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_3nlp_5model_3src_10_amplmodel_4ampl_grad_obj *__pyx_optional_args);
 };
 static struct __pyx_vtabstruct_3nlp_5model_3src_10_amplmodel_ampl *__pyx_vtabptr_3nlp_5model_3src_10_amplmodel_ampl;
 
@@ -923,6 +936,10 @@ static CYTHON_INLINE void __Pyx_SafeReleaseBuffer(Py_buffer* info);
 static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb);
 static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb);
 
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
+
 static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
     Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
 
@@ -965,19 +982,28 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
 static CYTHON_INLINE int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
     const char *name, int exact);
 
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        Py_SIZE(list) = len+1;
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#endif
+
 static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
 
 static void __Pyx_RaiseBufferFallbackError(void);
 
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
 
-#if CYTHON_COMPILING_IN_CPYTHON
-static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace);
-#else
-#define __Pyx_PyInt_AddObjC(op1, op2, intval, inplace)\
-    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
-#endif
-
 static void __Pyx_RaiseBufferIndexError(int axis);
 
 #define __Pyx_SetItemInt(o, i, v, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
@@ -1061,6 +1087,8 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
 
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_char(char value);
+
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 
 #if CYTHON_CCOMPLEX
@@ -1183,7 +1211,7 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
 static PyObject *__pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_get_nnzj(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
 static PyObject *__pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_get_nnzh(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
-static PyObject *__pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_grad_obj(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_grad_obj(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, int __pyx_skip_dispatch, struct __pyx_opt_args_3nlp_5model_3src_10_amplmodel_4ampl_grad_obj *__pyx_optional_args); /* proto*/
 
 /* Module declarations from 'cpython.version' */
 
@@ -1287,7 +1315,11 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *, cha
 /* Module declarations from 'nlp.model.src._amplmodel' */
 static PyTypeObject *__pyx_ptype_3nlp_5model_3src_10_amplmodel_ampl = 0;
 static PyArrayObject *__pyx_f_3nlp_5model_3src_10_amplmodel_copy_c_to_numpy(double *, int); /*proto*/
+static int __pyx_f_3nlp_5model_3src_10_amplmodel_ograd_len(ograd *); /*proto*/
+static int __pyx_f_3nlp_5model_3src_10_amplmodel_cgrad_len(cgrad *); /*proto*/
+static void __pyx_f_3nlp_5model_3src_10_amplmodel_copy_numpy_to_c(PyArrayObject *, double *, int); /*proto*/
 static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_double_t = { "double_t", NULL, sizeof(__pyx_t_5numpy_double_t), { 0 }, 0, 'R', 0, 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t = { "int32_t", NULL, sizeof(__pyx_t_5numpy_int32_t), { 0 }, 0, IS_UNSIGNED(__pyx_t_5numpy_int32_t) ? 'U' : 'I', IS_UNSIGNED(__pyx_t_5numpy_int32_t), 0 };
 #define __Pyx_MODULE_NAME "nlp.model.src._amplmodel"
 int __pyx_module_is_main_nlp__model__src___amplmodel = 0;
 
@@ -1330,9 +1362,11 @@ static char __pyx_k_open[] = "open";
 static char __pyx_k_path[] = "path";
 static char __pyx_k_stub[] = "stub";
 static char __pyx_k_test[] = "__test__";
+static char __pyx_k_array[] = "array";
 static char __pyx_k_close[] = "close";
 static char __pyx_k_dtype[] = "dtype";
 static char __pyx_k_empty[] = "empty";
+static char __pyx_k_int32[] = "int32";
 static char __pyx_k_numpy[] = "numpy";
 static char __pyx_k_range[] = "range";
 static char __pyx_k_zeros[] = "zeros";
@@ -1364,6 +1398,7 @@ static PyObject *__pyx_kp_s_Got_i_d_exected_0_i_d;
 static PyObject *__pyx_kp_u_Non_native_byte_order_not_suppor;
 static PyObject *__pyx_n_s_RuntimeError;
 static PyObject *__pyx_n_s_ValueError;
+static PyObject *__pyx_n_s_array;
 static PyObject *__pyx_n_s_close;
 static PyObject *__pyx_kp_s_congrd_failed;
 static PyObject *__pyx_n_s_copy;
@@ -1378,6 +1413,7 @@ static PyObject *__pyx_n_s_grad_obj;
 static PyObject *__pyx_n_s_i;
 static PyObject *__pyx_n_s_import;
 static PyObject *__pyx_n_s_int;
+static PyObject *__pyx_n_s_int32;
 static PyObject *__pyx_n_s_main;
 static PyObject *__pyx_n_s_msg;
 static PyObject *__pyx_kp_u_ndarray_is_not_C_contiguous;
@@ -1413,26 +1449,37 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_10get_Uvar(struct
 static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_12get_pi0(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_14get_Lcon(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_16get_Ucon(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_18get_nnzj(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_20get_nnzh(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_22get_CType(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_24eval_obj(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, int __pyx_v_obj_num); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_26grad_obj(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_28eval_cons(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_30eval_sgrad(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_32eval_cost(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_34eval_ci(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_v_i, PyArrayObject *__pyx_v_x); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_36eval_gi(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_v_i, PyArrayObject *__pyx_v_x); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_38eval_sgi(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_v_i, PyArrayObject *__pyx_v_x); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_40eval_row(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_v_i); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_42eval_A(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, CYTHON_UNUSED int __pyx_v_store_zeros); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_44eval_J(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, CYTHON_UNUSED int __pyx_v_store_zeros); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_46eval_H(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, PyArrayObject *__pyx_v_y, double __pyx_v_obj_weight, CYTHON_UNUSED int __pyx_v_store_zeros); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, PyArrayObject *__pyx_v_y, PyArrayObject *__pyx_v_v, double __pyx_v_obj_weight); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, PyArrayObject *__pyx_v_g, PyArrayObject *__pyx_v_v); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_52set_x(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_54unset_x(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_56ampl_sol(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, PyArrayObject *__pyx_v_y, PyObject *__pyx_v_msg); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_18set_Lvar(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_v); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_20set_Uvar(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_v); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_22set_Lcon(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_v); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_24set_Ucon(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_v); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_26get_objtypes(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_28get_nnzj(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_30get_nnzh(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_32get_CType(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_34eval_obj(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, int __pyx_v_obj_num); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_36eval_objs(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_38grad_obj(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, int __pyx_v_obj_num); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_40grad_objs(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_42eval_cons(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_44eval_sgrad(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_46eval_cost(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48eval_ci(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_v_i, PyArrayObject *__pyx_v_x); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50eval_gi(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_v_i, PyArrayObject *__pyx_v_x); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_52eval_sgi(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_v_i, PyArrayObject *__pyx_v_x); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_54eval_row(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_v_i); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_56eval_A(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, CYTHON_UNUSED int __pyx_v_store_zeros); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_58eval_J(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, CYTHON_UNUSED int __pyx_v_store_zeros); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_60get_J_pattern(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_62eval_J_vals(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_64eval_H(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, PyArrayObject *__pyx_v_y, double __pyx_v_obj_weight, CYTHON_UNUSED int __pyx_v_store_zeros); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_66get_H_pattern(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_68eval_H_vals(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, PyArrayObject *__pyx_v_y, double __pyx_v_obj_weight); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_70H_prod(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, PyArrayObject *__pyx_v_y, PyArrayObject *__pyx_v_v, double __pyx_v_obj_weight); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_72gHi_prod(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, PyArrayObject *__pyx_v_g, PyArrayObject *__pyx_v_v); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_74set_x(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_76unset_x(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_78ampl_sol(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, PyArrayObject *__pyx_v_y, PyObject *__pyx_v_msg); /* proto */
 static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5n_var___get__(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self); /* proto */
 static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5n_var_2__set__(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
 static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3nbv___get__(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self); /* proto */
@@ -1480,8 +1527,6 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_16ampl_written_sol_2__se
 static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /* proto */
 static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info); /* proto */
 static PyObject *__pyx_tp_new_3nlp_5model_3src_10_amplmodel_ampl(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_int_0;
-static PyObject *__pyx_int_1;
 static PyObject *__pyx_tuple_;
 static PyObject *__pyx_tuple__2;
 static PyObject *__pyx_tuple__3;
@@ -1577,7 +1622,7 @@ static PyArrayObject *__pyx_f_3nlp_5model_3src_10_amplmodel_copy_c_to_numpy(doub
  *         v[i] = x[i]
  *     return v             # <<<<<<<<<<<<<<
  * 
- * ########################################################################
+ * cdef int ograd_len(ograd* og):
  */
   __Pyx_XDECREF(((PyObject *)__pyx_r));
   __Pyx_INCREF(((PyObject *)__pyx_v_v));
@@ -1611,7 +1656,242 @@ static PyArrayObject *__pyx_f_3nlp_5model_3src_10_amplmodel_copy_c_to_numpy(doub
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":187
+/* "nlp/model/src/_amplmodel.pyx":151
+ *     return v
+ * 
+ * cdef int ograd_len(ograd* og):             # <<<<<<<<<<<<<<
+ *     """Utility to count the elements of an ograd linked list."""
+ *     cdef int n = 0
+ */
+
+static int __pyx_f_3nlp_5model_3src_10_amplmodel_ograd_len(ograd *__pyx_v_og) {
+  int __pyx_v_n;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  ograd *__pyx_t_2;
+  __Pyx_RefNannySetupContext("ograd_len", 0);
+
+  /* "nlp/model/src/_amplmodel.pyx":153
+ * cdef int ograd_len(ograd* og):
+ *     """Utility to count the elements of an ograd linked list."""
+ *     cdef int n = 0             # <<<<<<<<<<<<<<
+ *     while og is not NULL:
+ *         n += 1
+ */
+  __pyx_v_n = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":154
+ *     """Utility to count the elements of an ograd linked list."""
+ *     cdef int n = 0
+ *     while og is not NULL:             # <<<<<<<<<<<<<<
+ *         n += 1
+ *         og = og.next
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_og != NULL) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "nlp/model/src/_amplmodel.pyx":155
+ *     cdef int n = 0
+ *     while og is not NULL:
+ *         n += 1             # <<<<<<<<<<<<<<
+ *         og = og.next
+ *     return n
+ */
+    __pyx_v_n = (__pyx_v_n + 1);
+
+    /* "nlp/model/src/_amplmodel.pyx":156
+ *     while og is not NULL:
+ *         n += 1
+ *         og = og.next             # <<<<<<<<<<<<<<
+ *     return n
+ * 
+ */
+    __pyx_t_2 = __pyx_v_og->next;
+    __pyx_v_og = __pyx_t_2;
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":157
+ *         n += 1
+ *         og = og.next
+ *     return n             # <<<<<<<<<<<<<<
+ * 
+ * cdef int cgrad_len(cgrad* cg):
+ */
+  __pyx_r = __pyx_v_n;
+  goto __pyx_L0;
+
+  /* "nlp/model/src/_amplmodel.pyx":151
+ *     return v
+ * 
+ * cdef int ograd_len(ograd* og):             # <<<<<<<<<<<<<<
+ *     """Utility to count the elements of an ograd linked list."""
+ *     cdef int n = 0
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nlp/model/src/_amplmodel.pyx":159
+ *     return n
+ * 
+ * cdef int cgrad_len(cgrad* cg):             # <<<<<<<<<<<<<<
+ *     """Utility to count the elements of a cgrad linked list."""
+ *     cdef int n = 0
+ */
+
+static int __pyx_f_3nlp_5model_3src_10_amplmodel_cgrad_len(cgrad *__pyx_v_cg) {
+  int __pyx_v_n;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  cgrad *__pyx_t_2;
+  __Pyx_RefNannySetupContext("cgrad_len", 0);
+
+  /* "nlp/model/src/_amplmodel.pyx":161
+ * cdef int cgrad_len(cgrad* cg):
+ *     """Utility to count the elements of a cgrad linked list."""
+ *     cdef int n = 0             # <<<<<<<<<<<<<<
+ *     while cg is not NULL:
+ *         n += 1
+ */
+  __pyx_v_n = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":162
+ *     """Utility to count the elements of a cgrad linked list."""
+ *     cdef int n = 0
+ *     while cg is not NULL:             # <<<<<<<<<<<<<<
+ *         n += 1
+ *         cg = cg.next
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_cg != NULL) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "nlp/model/src/_amplmodel.pyx":163
+ *     cdef int n = 0
+ *     while cg is not NULL:
+ *         n += 1             # <<<<<<<<<<<<<<
+ *         cg = cg.next
+ *     return n
+ */
+    __pyx_v_n = (__pyx_v_n + 1);
+
+    /* "nlp/model/src/_amplmodel.pyx":164
+ *     while cg is not NULL:
+ *         n += 1
+ *         cg = cg.next             # <<<<<<<<<<<<<<
+ *     return n
+ * 
+ */
+    __pyx_t_2 = __pyx_v_cg->next;
+    __pyx_v_cg = __pyx_t_2;
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":165
+ *         n += 1
+ *         cg = cg.next
+ *     return n             # <<<<<<<<<<<<<<
+ * 
+ * @cython.boundscheck(False)
+ */
+  __pyx_r = __pyx_v_n;
+  goto __pyx_L0;
+
+  /* "nlp/model/src/_amplmodel.pyx":159
+ *     return n
+ * 
+ * cdef int cgrad_len(cgrad* cg):             # <<<<<<<<<<<<<<
+ *     """Utility to count the elements of a cgrad linked list."""
+ *     cdef int n = 0
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nlp/model/src/_amplmodel.pyx":169
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef void copy_numpy_to_c(ndarray[np.double_t] v, double *x, int lenx):             # <<<<<<<<<<<<<<
+ *     """Utility to copy a numpy array of doubles to a C array."""
+ *     cdef int i
+ */
+
+static void __pyx_f_3nlp_5model_3src_10_amplmodel_copy_numpy_to_c(PyArrayObject *__pyx_v_v, double *__pyx_v_x, int __pyx_v_lenx) {
+  int __pyx_v_i;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_v;
+  __Pyx_Buffer __pyx_pybuffer_v;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("copy_numpy_to_c", 0);
+  __pyx_pybuffer_v.pybuffer.buf = NULL;
+  __pyx_pybuffer_v.refcount = 0;
+  __pyx_pybuffernd_v.data = NULL;
+  __pyx_pybuffernd_v.rcbuffer = &__pyx_pybuffer_v;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_v.rcbuffer->pybuffer, (PyObject*)__pyx_v_v, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 169; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_v.diminfo[0].strides = __pyx_pybuffernd_v.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_v.diminfo[0].shape = __pyx_pybuffernd_v.rcbuffer->pybuffer.shape[0];
+
+  /* "nlp/model/src/_amplmodel.pyx":172
+ *     """Utility to copy a numpy array of doubles to a C array."""
+ *     cdef int i
+ *     for i in range(lenx):             # <<<<<<<<<<<<<<
+ *         x[i] = v[i]
+ * 
+ */
+  __pyx_t_1 = __pyx_v_lenx;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_i = __pyx_t_2;
+
+    /* "nlp/model/src/_amplmodel.pyx":173
+ *     cdef int i
+ *     for i in range(lenx):
+ *         x[i] = v[i]             # <<<<<<<<<<<<<<
+ * 
+ * ########################################################################
+ */
+    __pyx_t_3 = __pyx_v_i;
+    (__pyx_v_x[__pyx_v_i]) = (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_v.rcbuffer->pybuffer.buf, __pyx_t_3, __pyx_pybuffernd_v.diminfo[0].strides));
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":169
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef void copy_numpy_to_c(ndarray[np.double_t] v, double *x, int lenx):             # <<<<<<<<<<<<<<
+ *     """Utility to copy a numpy array of doubles to a C array."""
+ *     cdef int i
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_v.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_WriteUnraisable("nlp.model.src._amplmodel.copy_numpy_to_c", __pyx_clineno, __pyx_lineno, __pyx_filename, 0, 0);
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_v.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "nlp/model/src/_amplmodel.pyx":211
  *         public bint ampl_written_sol
  * 
  *     def __cinit__(self):             # <<<<<<<<<<<<<<
@@ -1645,7 +1925,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl___cinit__(struct __pyx_o
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "nlp/model/src/_amplmodel.pyx":191
+  /* "nlp/model/src/_amplmodel.pyx":215
  * 
  *         # Allocate the ASL object.
  *         self.asl = ASL_alloc(ASL_read_pfgh)             # <<<<<<<<<<<<<<
@@ -1654,7 +1934,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl___cinit__(struct __pyx_o
  */
   __pyx_v_self->asl = ASL_alloc(__pyx_e_3nlp_5model_3src_10_amplmodel_ASL_read_pfgh);
 
-  /* "nlp/model/src/_amplmodel.pyx":192
+  /* "nlp/model/src/_amplmodel.pyx":216
  *         # Allocate the ASL object.
  *         self.asl = ASL_alloc(ASL_read_pfgh)
  *         if self.asl is NULL:             # <<<<<<<<<<<<<<
@@ -1664,16 +1944,16 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl___cinit__(struct __pyx_o
   __pyx_t_1 = ((__pyx_v_self->asl == NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "nlp/model/src/_amplmodel.pyx":193
+    /* "nlp/model/src/_amplmodel.pyx":217
  *         self.asl = ASL_alloc(ASL_read_pfgh)
  *         if self.asl is NULL:
  *             cpython.PyErr_NoMemory()             # <<<<<<<<<<<<<<
  * 
  *     def _dealloc(self):
  */
-    __pyx_t_2 = PyErr_NoMemory(); if (unlikely(__pyx_t_2 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyErr_NoMemory(); if (unlikely(__pyx_t_2 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-    /* "nlp/model/src/_amplmodel.pyx":192
+    /* "nlp/model/src/_amplmodel.pyx":216
  *         # Allocate the ASL object.
  *         self.asl = ASL_alloc(ASL_read_pfgh)
  *         if self.asl is NULL:             # <<<<<<<<<<<<<<
@@ -1682,7 +1962,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl___cinit__(struct __pyx_o
  */
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":187
+  /* "nlp/model/src/_amplmodel.pyx":211
  *         public bint ampl_written_sol
  * 
  *     def __cinit__(self):             # <<<<<<<<<<<<<<
@@ -1701,7 +1981,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl___cinit__(struct __pyx_o
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":195
+/* "nlp/model/src/_amplmodel.pyx":219
  *             cpython.PyErr_NoMemory()
  * 
  *     def _dealloc(self):             # <<<<<<<<<<<<<<
@@ -1729,7 +2009,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_2_dealloc(struct _
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("_dealloc", 0);
 
-  /* "nlp/model/src/_amplmodel.pyx":197
+  /* "nlp/model/src/_amplmodel.pyx":221
  *     def _dealloc(self):
  *         """Free the allocated memory and ASL structure."""
  *         free(self.asl.i.X0_)             # <<<<<<<<<<<<<<
@@ -1738,7 +2018,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_2_dealloc(struct _
  */
   free(__pyx_v_self->asl->i.X0_);
 
-  /* "nlp/model/src/_amplmodel.pyx":198
+  /* "nlp/model/src/_amplmodel.pyx":222
  *         """Free the allocated memory and ASL structure."""
  *         free(self.asl.i.X0_)
  *         free(self.asl.i.LUv_)             # <<<<<<<<<<<<<<
@@ -1747,7 +2027,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_2_dealloc(struct _
  */
   free(__pyx_v_self->asl->i.LUv_);
 
-  /* "nlp/model/src/_amplmodel.pyx":199
+  /* "nlp/model/src/_amplmodel.pyx":223
  *         free(self.asl.i.X0_)
  *         free(self.asl.i.LUv_)
  *         free(self.asl.i.Uvx_)             # <<<<<<<<<<<<<<
@@ -1756,7 +2036,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_2_dealloc(struct _
  */
   free(__pyx_v_self->asl->i.Uvx_);
 
-  /* "nlp/model/src/_amplmodel.pyx":200
+  /* "nlp/model/src/_amplmodel.pyx":224
  *         free(self.asl.i.LUv_)
  *         free(self.asl.i.Uvx_)
  *         free(self.asl.i.pi0_)             # <<<<<<<<<<<<<<
@@ -1765,7 +2045,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_2_dealloc(struct _
  */
   free(__pyx_v_self->asl->i.pi0_);
 
-  /* "nlp/model/src/_amplmodel.pyx":201
+  /* "nlp/model/src/_amplmodel.pyx":225
  *         free(self.asl.i.Uvx_)
  *         free(self.asl.i.pi0_)
  *         free(self.asl.i.LUrhs_)             # <<<<<<<<<<<<<<
@@ -1774,7 +2054,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_2_dealloc(struct _
  */
   free(__pyx_v_self->asl->i.LUrhs_);
 
-  /* "nlp/model/src/_amplmodel.pyx":202
+  /* "nlp/model/src/_amplmodel.pyx":226
  *         free(self.asl.i.pi0_)
  *         free(self.asl.i.LUrhs_)
  *         free(self.asl.i.Urhsx_)             # <<<<<<<<<<<<<<
@@ -1783,7 +2063,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_2_dealloc(struct _
  */
   free(__pyx_v_self->asl->i.Urhsx_);
 
-  /* "nlp/model/src/_amplmodel.pyx":203
+  /* "nlp/model/src/_amplmodel.pyx":227
  *         free(self.asl.i.LUrhs_)
  *         free(self.asl.i.Urhsx_)
  *         if self.asl is not NULL:             # <<<<<<<<<<<<<<
@@ -1793,7 +2073,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_2_dealloc(struct _
   __pyx_t_1 = ((__pyx_v_self->asl != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "nlp/model/src/_amplmodel.pyx":204
+    /* "nlp/model/src/_amplmodel.pyx":228
  *         free(self.asl.i.Urhsx_)
  *         if self.asl is not NULL:
  *             ASL_free(&self.asl)             # <<<<<<<<<<<<<<
@@ -1802,7 +2082,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_2_dealloc(struct _
  */
     ASL_free((&__pyx_v_self->asl));
 
-    /* "nlp/model/src/_amplmodel.pyx":203
+    /* "nlp/model/src/_amplmodel.pyx":227
  *         free(self.asl.i.LUrhs_)
  *         free(self.asl.i.Urhsx_)
  *         if self.asl is not NULL:             # <<<<<<<<<<<<<<
@@ -1811,7 +2091,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_2_dealloc(struct _
  */
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":195
+  /* "nlp/model/src/_amplmodel.pyx":219
  *             cpython.PyErr_NoMemory()
  * 
  *     def _dealloc(self):             # <<<<<<<<<<<<<<
@@ -1826,7 +2106,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_2_dealloc(struct _
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":206
+/* "nlp/model/src/_amplmodel.pyx":230
  *             ASL_free(&self.asl)
  * 
  *     def __init__(self, stub):             # <<<<<<<<<<<<<<
@@ -1866,7 +2146,7 @@ static int __pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_5__init__(PyObject *__py
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
       goto __pyx_L5_argtuple_error;
@@ -1877,7 +2157,7 @@ static int __pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_5__init__(PyObject *__py
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -1911,19 +2191,19 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __Pyx_RefNannySetupContext("__init__", 0);
   __Pyx_INCREF(__pyx_v_stub);
 
-  /* "nlp/model/src/_amplmodel.pyx":211
+  /* "nlp/model/src/_amplmodel.pyx":235
  *         # Let Python try to open the file before giving it to
  *         # Ampl. Any exception should be caught by the caller.
  *         basename, extension = os.path.splitext(stub)             # <<<<<<<<<<<<<<
  *         if len(extension) == 0:
  *             stub += '.nl' # add the nl extension
  */
-  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_os); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_os); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 235; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_path); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_path); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 235; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_splitext); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_splitext); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 235; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_3 = NULL;
@@ -1937,16 +2217,16 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
     }
   }
   if (!__pyx_t_3) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_stub); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_stub); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 235; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
   } else {
-    __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 235; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3); __pyx_t_3 = NULL;
     __Pyx_INCREF(__pyx_v_stub);
     __Pyx_GIVEREF(__pyx_v_stub);
     PyTuple_SET_ITEM(__pyx_t_4, 0+1, __pyx_v_stub);
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 235; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   }
@@ -1961,7 +2241,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
     if (unlikely(size != 2)) {
       if (size > 2) __Pyx_RaiseTooManyValuesError(2);
       else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 235; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     #if CYTHON_COMPILING_IN_CPYTHON
     if (likely(PyTuple_CheckExact(sequence))) {
@@ -1974,15 +2254,15 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
     __Pyx_INCREF(__pyx_t_2);
     __Pyx_INCREF(__pyx_t_4);
     #else
-    __pyx_t_2 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 235; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 235; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     #endif
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   } else {
     Py_ssize_t index = -1;
-    __pyx_t_3 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 235; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_t_5 = Py_TYPE(__pyx_t_3)->tp_iternext;
@@ -1990,7 +2270,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
     __Pyx_GOTREF(__pyx_t_2);
     index = 1; __pyx_t_4 = __pyx_t_5(__pyx_t_3); if (unlikely(!__pyx_t_4)) goto __pyx_L3_unpacking_failed;
     __Pyx_GOTREF(__pyx_t_4);
-    if (__Pyx_IternextUnpackEndCheck(__pyx_t_5(__pyx_t_3), 2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_5(__pyx_t_3), 2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 235; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_5 = NULL;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     goto __pyx_L4_unpacking_done;
@@ -1998,7 +2278,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __pyx_t_5 = NULL;
     if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 235; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_L4_unpacking_done:;
   }
   __pyx_v_basename = __pyx_t_2;
@@ -2006,30 +2286,30 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_v_extension = __pyx_t_4;
   __pyx_t_4 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":212
+  /* "nlp/model/src/_amplmodel.pyx":236
  *         # Ampl. Any exception should be caught by the caller.
  *         basename, extension = os.path.splitext(stub)
  *         if len(extension) == 0:             # <<<<<<<<<<<<<<
  *             stub += '.nl' # add the nl extension
  *         f = open(stub,'r'); f.close()
  */
-  __pyx_t_6 = PyObject_Length(__pyx_v_extension); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = PyObject_Length(__pyx_v_extension); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 236; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_7 = ((__pyx_t_6 == 0) != 0);
   if (__pyx_t_7) {
 
-    /* "nlp/model/src/_amplmodel.pyx":213
+    /* "nlp/model/src/_amplmodel.pyx":237
  *         basename, extension = os.path.splitext(stub)
  *         if len(extension) == 0:
  *             stub += '.nl' # add the nl extension             # <<<<<<<<<<<<<<
  *         f = open(stub,'r'); f.close()
  * 
  */
-    __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_stub, __pyx_kp_s_nl); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 213; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_stub, __pyx_kp_s_nl); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF_SET(__pyx_v_stub, __pyx_t_1);
     __pyx_t_1 = 0;
 
-    /* "nlp/model/src/_amplmodel.pyx":212
+    /* "nlp/model/src/_amplmodel.pyx":236
  *         # Ampl. Any exception should be caught by the caller.
  *         basename, extension = os.path.splitext(stub)
  *         if len(extension) == 0:             # <<<<<<<<<<<<<<
@@ -2038,14 +2318,14 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
  */
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":214
+  /* "nlp/model/src/_amplmodel.pyx":238
  *         if len(extension) == 0:
  *             stub += '.nl' # add the nl extension
  *         f = open(stub,'r'); f.close()             # <<<<<<<<<<<<<<
  * 
  *         # Open stub and get problem dimensions (Table 1 of "Hooking...").
  */
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 214; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 238; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_v_stub);
   __Pyx_GIVEREF(__pyx_v_stub);
@@ -2053,12 +2333,12 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __Pyx_INCREF(__pyx_n_s_r);
   __Pyx_GIVEREF(__pyx_n_s_r);
   PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_n_s_r);
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_open, __pyx_t_1, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 214; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_open, __pyx_t_1, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 238; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_f = __pyx_t_4;
   __pyx_t_4 = 0;
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_f, __pyx_n_s_close); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 214; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_f, __pyx_n_s_close); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 238; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_2 = NULL;
   if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
@@ -2071,27 +2351,27 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
     }
   }
   if (__pyx_t_2) {
-    __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 214; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 238; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   } else {
-    __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 214; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 238; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":217
+  /* "nlp/model/src/_amplmodel.pyx":241
  * 
  *         # Open stub and get problem dimensions (Table 1 of "Hooking...").
  *         self.ampl_file = jac0dim_ASL(self.asl, stub, len(stub))             # <<<<<<<<<<<<<<
  * 
  *         self.n_var = self.asl.i.n_var_
  */
-  __pyx_t_8 = __Pyx_PyObject_AsString(__pyx_v_stub); if (unlikely((!__pyx_t_8) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_6 = PyObject_Length(__pyx_v_stub); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_8 = __Pyx_PyObject_AsString(__pyx_v_stub); if (unlikely((!__pyx_t_8) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 241; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = PyObject_Length(__pyx_v_stub); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 241; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->ampl_file = jac0dim_ASL(__pyx_v_self->asl, __pyx_t_8, __pyx_t_6);
 
-  /* "nlp/model/src/_amplmodel.pyx":219
+  /* "nlp/model/src/_amplmodel.pyx":243
  *         self.ampl_file = jac0dim_ASL(self.asl, stub, len(stub))
  * 
  *         self.n_var = self.asl.i.n_var_             # <<<<<<<<<<<<<<
@@ -2101,7 +2381,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.n_var_;
   __pyx_v_self->n_var = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":220
+  /* "nlp/model/src/_amplmodel.pyx":244
  * 
  *         self.n_var = self.asl.i.n_var_
  *         self.nbv = self.asl.i.nbv_             # <<<<<<<<<<<<<<
@@ -2111,7 +2391,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.nbv_;
   __pyx_v_self->nbv = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":221
+  /* "nlp/model/src/_amplmodel.pyx":245
  *         self.n_var = self.asl.i.n_var_
  *         self.nbv = self.asl.i.nbv_
  *         self.niv = self.asl.i.niv_             # <<<<<<<<<<<<<<
@@ -2121,7 +2401,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.niv_;
   __pyx_v_self->niv = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":222
+  /* "nlp/model/src/_amplmodel.pyx":246
  *         self.nbv = self.asl.i.nbv_
  *         self.niv = self.asl.i.niv_
  *         self.n_con = self.asl.i.n_con_             # <<<<<<<<<<<<<<
@@ -2131,7 +2411,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.n_con_;
   __pyx_v_self->n_con = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":223
+  /* "nlp/model/src/_amplmodel.pyx":247
  *         self.niv = self.asl.i.niv_
  *         self.n_con = self.asl.i.n_con_
  *         self.n_obj = self.asl.i.n_obj_             # <<<<<<<<<<<<<<
@@ -2141,7 +2421,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.n_obj_;
   __pyx_v_self->n_obj = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":224
+  /* "nlp/model/src/_amplmodel.pyx":248
  *         self.n_con = self.asl.i.n_con_
  *         self.n_obj = self.asl.i.n_obj_
  *         self.nlo = self.asl.i.nlo_             # <<<<<<<<<<<<<<
@@ -2151,7 +2431,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.nlo_;
   __pyx_v_self->nlo = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":225
+  /* "nlp/model/src/_amplmodel.pyx":249
  *         self.n_obj = self.asl.i.n_obj_
  *         self.nlo = self.asl.i.nlo_
  *         self.nranges = self.asl.i.nranges_             # <<<<<<<<<<<<<<
@@ -2161,7 +2441,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.nranges_;
   __pyx_v_self->nranges = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":226
+  /* "nlp/model/src/_amplmodel.pyx":250
  *         self.nlo = self.asl.i.nlo_
  *         self.nranges = self.asl.i.nranges_
  *         self.nlc = self.asl.i.nlc_             # <<<<<<<<<<<<<<
@@ -2171,7 +2451,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.nlc_;
   __pyx_v_self->nlc = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":227
+  /* "nlp/model/src/_amplmodel.pyx":251
  *         self.nranges = self.asl.i.nranges_
  *         self.nlc = self.asl.i.nlc_
  *         self.nlnc = self.asl.i.nlnc_             # <<<<<<<<<<<<<<
@@ -2181,7 +2461,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.nlnc_;
   __pyx_v_self->nlnc = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":228
+  /* "nlp/model/src/_amplmodel.pyx":252
  *         self.nlc = self.asl.i.nlc_
  *         self.nlnc = self.asl.i.nlnc_
  *         self.nlvb = self.asl.i.nlvb_             # <<<<<<<<<<<<<<
@@ -2191,7 +2471,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.nlvb_;
   __pyx_v_self->nlvb = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":229
+  /* "nlp/model/src/_amplmodel.pyx":253
  *         self.nlnc = self.asl.i.nlnc_
  *         self.nlvb = self.asl.i.nlvb_
  *         self.nlvbi = self.asl.i.nlvbi_             # <<<<<<<<<<<<<<
@@ -2201,7 +2481,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.nlvbi_;
   __pyx_v_self->nlvbi = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":230
+  /* "nlp/model/src/_amplmodel.pyx":254
  *         self.nlvb = self.asl.i.nlvb_
  *         self.nlvbi = self.asl.i.nlvbi_
  *         self.nlvc = self.asl.i.nlvc_             # <<<<<<<<<<<<<<
@@ -2211,7 +2491,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.nlvc_;
   __pyx_v_self->nlvc = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":231
+  /* "nlp/model/src/_amplmodel.pyx":255
  *         self.nlvbi = self.asl.i.nlvbi_
  *         self.nlvc = self.asl.i.nlvc_
  *         self.nlvci = self.asl.i.nlvci_             # <<<<<<<<<<<<<<
@@ -2221,7 +2501,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.nlvci_;
   __pyx_v_self->nlvci = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":232
+  /* "nlp/model/src/_amplmodel.pyx":256
  *         self.nlvc = self.asl.i.nlvc_
  *         self.nlvci = self.asl.i.nlvci_
  *         self.nlvo = self.asl.i.nlvo_             # <<<<<<<<<<<<<<
@@ -2231,7 +2511,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.nlvo_;
   __pyx_v_self->nlvo = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":233
+  /* "nlp/model/src/_amplmodel.pyx":257
  *         self.nlvci = self.asl.i.nlvci_
  *         self.nlvo = self.asl.i.nlvo_
  *         self.nlvoi = self.asl.i.nlvoi_             # <<<<<<<<<<<<<<
@@ -2241,7 +2521,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.nlvoi_;
   __pyx_v_self->nlvoi = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":234
+  /* "nlp/model/src/_amplmodel.pyx":258
  *         self.nlvo = self.asl.i.nlvo_
  *         self.nlvoi = self.asl.i.nlvoi_
  *         self.lnc = self.asl.i.lnc_             # <<<<<<<<<<<<<<
@@ -2251,7 +2531,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.lnc_;
   __pyx_v_self->lnc = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":235
+  /* "nlp/model/src/_amplmodel.pyx":259
  *         self.nlvoi = self.asl.i.nlvoi_
  *         self.lnc = self.asl.i.lnc_
  *         self.nzc = self.asl.i.nzc_             # <<<<<<<<<<<<<<
@@ -2261,7 +2541,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.nzc_;
   __pyx_v_self->nzc = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":236
+  /* "nlp/model/src/_amplmodel.pyx":260
  *         self.lnc = self.asl.i.lnc_
  *         self.nzc = self.asl.i.nzc_
  *         self.nzo = self.asl.i.nzo_             # <<<<<<<<<<<<<<
@@ -2271,7 +2551,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.nzo_;
   __pyx_v_self->nzo = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":237
+  /* "nlp/model/src/_amplmodel.pyx":261
  *         self.nzc = self.asl.i.nzc_
  *         self.nzo = self.asl.i.nzo_
  *         self.maxrownamelen = self.asl.i.maxrownamelen_             # <<<<<<<<<<<<<<
@@ -2281,7 +2561,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.maxrownamelen_;
   __pyx_v_self->maxrownamelen = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":238
+  /* "nlp/model/src/_amplmodel.pyx":262
  *         self.nzo = self.asl.i.nzo_
  *         self.maxrownamelen = self.asl.i.maxrownamelen_
  *         self.maxcolnamelen = self.asl.i.maxcolnamelen_             # <<<<<<<<<<<<<<
@@ -2291,7 +2571,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   __pyx_t_9 = __pyx_v_self->asl->i.maxcolnamelen_;
   __pyx_v_self->maxcolnamelen = __pyx_t_9;
 
-  /* "nlp/model/src/_amplmodel.pyx":241
+  /* "nlp/model/src/_amplmodel.pyx":265
  * 
  *         # Ask for initial x and pi, and allocate storage for problem data.
  *         self.asl.i.want_xpi0_ = 3             # <<<<<<<<<<<<<<
@@ -2300,7 +2580,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
  */
   __pyx_v_self->asl->i.want_xpi0_ = 3;
 
-  /* "nlp/model/src/_amplmodel.pyx":242
+  /* "nlp/model/src/_amplmodel.pyx":266
  *         # Ask for initial x and pi, and allocate storage for problem data.
  *         self.asl.i.want_xpi0_ = 3
  *         self.asl.i.X0_    = <double *>malloc(self.n_var * sizeof(double))             # <<<<<<<<<<<<<<
@@ -2309,7 +2589,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
  */
   __pyx_v_self->asl->i.X0_ = ((double *)malloc((__pyx_v_self->n_var * (sizeof(double)))));
 
-  /* "nlp/model/src/_amplmodel.pyx":243
+  /* "nlp/model/src/_amplmodel.pyx":267
  *         self.asl.i.want_xpi0_ = 3
  *         self.asl.i.X0_    = <double *>malloc(self.n_var * sizeof(double))
  *         self.asl.i.LUv_   = <double *>malloc(self.n_var * sizeof(double))             # <<<<<<<<<<<<<<
@@ -2318,7 +2598,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
  */
   __pyx_v_self->asl->i.LUv_ = ((double *)malloc((__pyx_v_self->n_var * (sizeof(double)))));
 
-  /* "nlp/model/src/_amplmodel.pyx":244
+  /* "nlp/model/src/_amplmodel.pyx":268
  *         self.asl.i.X0_    = <double *>malloc(self.n_var * sizeof(double))
  *         self.asl.i.LUv_   = <double *>malloc(self.n_var * sizeof(double))
  *         self.asl.i.Uvx_   = <double *>malloc(self.n_var * sizeof(double))             # <<<<<<<<<<<<<<
@@ -2327,7 +2607,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
  */
   __pyx_v_self->asl->i.Uvx_ = ((double *)malloc((__pyx_v_self->n_var * (sizeof(double)))));
 
-  /* "nlp/model/src/_amplmodel.pyx":245
+  /* "nlp/model/src/_amplmodel.pyx":269
  *         self.asl.i.LUv_   = <double *>malloc(self.n_var * sizeof(double))
  *         self.asl.i.Uvx_   = <double *>malloc(self.n_var * sizeof(double))
  *         self.asl.i.pi0_   = <double *>malloc(self.n_con * sizeof(double))             # <<<<<<<<<<<<<<
@@ -2336,7 +2616,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
  */
   __pyx_v_self->asl->i.pi0_ = ((double *)malloc((__pyx_v_self->n_con * (sizeof(double)))));
 
-  /* "nlp/model/src/_amplmodel.pyx":246
+  /* "nlp/model/src/_amplmodel.pyx":270
  *         self.asl.i.Uvx_   = <double *>malloc(self.n_var * sizeof(double))
  *         self.asl.i.pi0_   = <double *>malloc(self.n_con * sizeof(double))
  *         self.asl.i.LUrhs_ = <double *>malloc(self.n_con * sizeof(double))             # <<<<<<<<<<<<<<
@@ -2345,7 +2625,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
  */
   __pyx_v_self->asl->i.LUrhs_ = ((double *)malloc((__pyx_v_self->n_con * (sizeof(double)))));
 
-  /* "nlp/model/src/_amplmodel.pyx":247
+  /* "nlp/model/src/_amplmodel.pyx":271
  *         self.asl.i.pi0_   = <double *>malloc(self.n_con * sizeof(double))
  *         self.asl.i.LUrhs_ = <double *>malloc(self.n_con * sizeof(double))
  *         self.asl.i.Urhsx_ = <double *>malloc(self.n_con * sizeof(double))             # <<<<<<<<<<<<<<
@@ -2354,7 +2634,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
  */
   __pyx_v_self->asl->i.Urhsx_ = ((double *)malloc((__pyx_v_self->n_con * (sizeof(double)))));
 
-  /* "nlp/model/src/_amplmodel.pyx":250
+  /* "nlp/model/src/_amplmodel.pyx":274
  * 
  *         # Read in the problem.
  *         pfgh_read_ASL(self.asl, self.ampl_file, 0)             # <<<<<<<<<<<<<<
@@ -2363,7 +2643,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
  */
   pfgh_read_ASL(__pyx_v_self->asl, __pyx_v_self->ampl_file, 0);
 
-  /* "nlp/model/src/_amplmodel.pyx":253
+  /* "nlp/model/src/_amplmodel.pyx":277
  * 
  *         # Maximization or minimization.
  *         self.objtype = self.asl.i.objtype_[0] # 0 = minimization             # <<<<<<<<<<<<<<
@@ -2372,7 +2652,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
  */
   __pyx_v_self->objtype = (__pyx_v_self->asl->i.objtype_[0]);
 
-  /* "nlp/model/src/_amplmodel.pyx":256
+  /* "nlp/model/src/_amplmodel.pyx":280
  * 
  *         # Convention: the Lagrangian is L := f - c'y.
  *         ampl_lagscale(self.asl, -1.)             # <<<<<<<<<<<<<<
@@ -2381,7 +2661,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
  */
   ampl_lagscale(__pyx_v_self->asl, -1.);
 
-  /* "nlp/model/src/_amplmodel.pyx":206
+  /* "nlp/model/src/_amplmodel.pyx":230
  *             ASL_free(&self.asl)
  * 
  *     def __init__(self, stub):             # <<<<<<<<<<<<<<
@@ -2408,7 +2688,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4__init__(struct __pyx_o
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":260
+/* "nlp/model/src/_amplmodel.pyx":284
  * 
  *     # Routines to get initial values.
  *     def get_x0(self): return copy_c_to_numpy(self.asl.i.X0_, self.n_var)             # <<<<<<<<<<<<<<
@@ -2438,7 +2718,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_6get_x0(struct __p
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_x0", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)__pyx_f_3nlp_5model_3src_10_amplmodel_copy_c_to_numpy(__pyx_v_self->asl->i.X0_, __pyx_v_self->n_var)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 260; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyObject *)__pyx_f_3nlp_5model_3src_10_amplmodel_copy_c_to_numpy(__pyx_v_self->asl->i.X0_, __pyx_v_self->n_var)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -2455,7 +2735,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_6get_x0(struct __p
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":261
+/* "nlp/model/src/_amplmodel.pyx":285
  *     # Routines to get initial values.
  *     def get_x0(self): return copy_c_to_numpy(self.asl.i.X0_, self.n_var)
  *     def get_Lvar(self): return copy_c_to_numpy(self.asl.i.LUv_, self.n_var)             # <<<<<<<<<<<<<<
@@ -2485,7 +2765,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_8get_Lvar(struct _
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_Lvar", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)__pyx_f_3nlp_5model_3src_10_amplmodel_copy_c_to_numpy(__pyx_v_self->asl->i.LUv_, __pyx_v_self->n_var)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 261; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyObject *)__pyx_f_3nlp_5model_3src_10_amplmodel_copy_c_to_numpy(__pyx_v_self->asl->i.LUv_, __pyx_v_self->n_var)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 285; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -2502,7 +2782,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_8get_Lvar(struct _
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":262
+/* "nlp/model/src/_amplmodel.pyx":286
  *     def get_x0(self): return copy_c_to_numpy(self.asl.i.X0_, self.n_var)
  *     def get_Lvar(self): return copy_c_to_numpy(self.asl.i.LUv_, self.n_var)
  *     def get_Uvar(self): return copy_c_to_numpy(self.asl.i.Uvx_, self.n_var)             # <<<<<<<<<<<<<<
@@ -2532,7 +2812,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_10get_Uvar(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_Uvar", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)__pyx_f_3nlp_5model_3src_10_amplmodel_copy_c_to_numpy(__pyx_v_self->asl->i.Uvx_, __pyx_v_self->n_var)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 262; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyObject *)__pyx_f_3nlp_5model_3src_10_amplmodel_copy_c_to_numpy(__pyx_v_self->asl->i.Uvx_, __pyx_v_self->n_var)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 286; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -2549,7 +2829,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_10get_Uvar(struct
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":263
+/* "nlp/model/src/_amplmodel.pyx":287
  *     def get_Lvar(self): return copy_c_to_numpy(self.asl.i.LUv_, self.n_var)
  *     def get_Uvar(self): return copy_c_to_numpy(self.asl.i.Uvx_, self.n_var)
  *     def get_pi0(self): return copy_c_to_numpy(self.asl.i.pi0_, self.n_con)             # <<<<<<<<<<<<<<
@@ -2579,7 +2859,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_12get_pi0(struct _
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_pi0", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)__pyx_f_3nlp_5model_3src_10_amplmodel_copy_c_to_numpy(__pyx_v_self->asl->i.pi0_, __pyx_v_self->n_con)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 263; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyObject *)__pyx_f_3nlp_5model_3src_10_amplmodel_copy_c_to_numpy(__pyx_v_self->asl->i.pi0_, __pyx_v_self->n_con)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -2596,7 +2876,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_12get_pi0(struct _
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":264
+/* "nlp/model/src/_amplmodel.pyx":288
  *     def get_Uvar(self): return copy_c_to_numpy(self.asl.i.Uvx_, self.n_var)
  *     def get_pi0(self): return copy_c_to_numpy(self.asl.i.pi0_, self.n_con)
  *     def get_Lcon(self): return copy_c_to_numpy(self.asl.i.LUrhs_, self.n_con)             # <<<<<<<<<<<<<<
@@ -2626,7 +2906,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_14get_Lcon(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_Lcon", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)__pyx_f_3nlp_5model_3src_10_amplmodel_copy_c_to_numpy(__pyx_v_self->asl->i.LUrhs_, __pyx_v_self->n_con)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 264; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyObject *)__pyx_f_3nlp_5model_3src_10_amplmodel_copy_c_to_numpy(__pyx_v_self->asl->i.LUrhs_, __pyx_v_self->n_con)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 288; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -2643,12 +2923,12 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_14get_Lcon(struct
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":265
+/* "nlp/model/src/_amplmodel.pyx":289
  *     def get_pi0(self): return copy_c_to_numpy(self.asl.i.pi0_, self.n_con)
  *     def get_Lcon(self): return copy_c_to_numpy(self.asl.i.LUrhs_, self.n_con)
  *     def get_Ucon(self): return copy_c_to_numpy(self.asl.i.Urhsx_, self.n_con)             # <<<<<<<<<<<<<<
  * 
- *     # Sparsity of Jacobian and Hessian.
+ *     # Routines to update problem data in place.
  */
 
 /* Python wrapper */
@@ -2673,7 +2953,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_16get_Ucon(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_Ucon", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)__pyx_f_3nlp_5model_3src_10_amplmodel_copy_c_to_numpy(__pyx_v_self->asl->i.Urhsx_, __pyx_v_self->n_con)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyObject *)__pyx_f_3nlp_5model_3src_10_amplmodel_copy_c_to_numpy(__pyx_v_self->asl->i.Urhsx_, __pyx_v_self->n_con)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 289; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -2690,868 +2970,827 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_16get_Ucon(struct
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":268
- * 
- *     # Sparsity of Jacobian and Hessian.
- *     cpdef get_nnzj(self): return self.nzc             # <<<<<<<<<<<<<<
- *     cpdef get_nnzh(self): return ampl_sphsetup(self.asl, -1, 1, 1, 1)
+/* "nlp/model/src/_amplmodel.pyx":292
  * 
+ *     # Routines to update problem data in place.
+ *     def set_Lvar(self, ndarray[np.double_t] v):             # <<<<<<<<<<<<<<
+ *         copy_numpy_to_c(v, self.asl.i.LUv_, self.n_var)
+ *     def set_Uvar(self, ndarray[np.double_t] v):
  */
 
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_19get_nnzj(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_get_nnzj(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_skip_dispatch) {
-  PyObject *__pyx_r = NULL;
+/* Python wrapper */
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_19set_Lvar(PyObject *__pyx_v_self, PyObject *__pyx_v_v); /*proto*/
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_19set_Lvar(PyObject *__pyx_v_self, PyObject *__pyx_v_v) {
+  CYTHON_UNUSED int __pyx_lineno = 0;
+  CYTHON_UNUSED const char *__pyx_filename = NULL;
+  CYTHON_UNUSED int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("get_nnzj", 0);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_nnzj); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 268; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_19get_nnzj)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_COMPILING_IN_CPYTHON && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
-        }
-      }
-      if (__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 268; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else {
-        __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 268; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nzc); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 268; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+  __Pyx_RefNannySetupContext("set_Lvar (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_v), __pyx_ptype_5numpy_ndarray, 1, "v", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 292; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_18set_Lvar(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), ((PyArrayObject *)__pyx_v_v));
 
   /* function exit code */
+  goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.get_nnzj", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
+  __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_19get_nnzj(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_19get_nnzj(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("get_nnzj (wrapper)", 0);
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_18get_nnzj(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self));
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_18set_Lvar(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_v) {
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_v;
+  __Pyx_Buffer __pyx_pybuffer_v;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("set_Lvar", 0);
+  __pyx_pybuffer_v.pybuffer.buf = NULL;
+  __pyx_pybuffer_v.refcount = 0;
+  __pyx_pybuffernd_v.data = NULL;
+  __pyx_pybuffernd_v.rcbuffer = &__pyx_pybuffer_v;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_v.rcbuffer->pybuffer, (PyObject*)__pyx_v_v, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 292; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_v.diminfo[0].strides = __pyx_pybuffernd_v.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_v.diminfo[0].shape = __pyx_pybuffernd_v.rcbuffer->pybuffer.shape[0];
+
+  /* "nlp/model/src/_amplmodel.pyx":293
+ *     # Routines to update problem data in place.
+ *     def set_Lvar(self, ndarray[np.double_t] v):
+ *         copy_numpy_to_c(v, self.asl.i.LUv_, self.n_var)             # <<<<<<<<<<<<<<
+ *     def set_Uvar(self, ndarray[np.double_t] v):
+ *         copy_numpy_to_c(v, self.asl.i.Uvx_, self.n_var)
+ */
+  __pyx_f_3nlp_5model_3src_10_amplmodel_copy_numpy_to_c(((PyArrayObject *)__pyx_v_v), __pyx_v_self->asl->i.LUv_, __pyx_v_self->n_var);
+
+  /* "nlp/model/src/_amplmodel.pyx":292
+ * 
+ *     # Routines to update problem data in place.
+ *     def set_Lvar(self, ndarray[np.double_t] v):             # <<<<<<<<<<<<<<
+ *         copy_numpy_to_c(v, self.asl.i.LUv_, self.n_var)
+ *     def set_Uvar(self, ndarray[np.double_t] v):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_v.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.set_Lvar", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_v.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nlp/model/src/_amplmodel.pyx":294
+ *     def set_Lvar(self, ndarray[np.double_t] v):
+ *         copy_numpy_to_c(v, self.asl.i.LUv_, self.n_var)
+ *     def set_Uvar(self, ndarray[np.double_t] v):             # <<<<<<<<<<<<<<
+ *         copy_numpy_to_c(v, self.asl.i.Uvx_, self.n_var)
+ *     def set_Lcon(self, ndarray[np.double_t] v):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_21set_Uvar(PyObject *__pyx_v_self, PyObject *__pyx_v_v); /*proto*/
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_21set_Uvar(PyObject *__pyx_v_self, PyObject *__pyx_v_v) {
+  CYTHON_UNUSED int __pyx_lineno = 0;
+  CYTHON_UNUSED const char *__pyx_filename = NULL;
+  CYTHON_UNUSED int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("set_Uvar (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_v), __pyx_ptype_5numpy_ndarray, 1, "v", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 294; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_20set_Uvar(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), ((PyArrayObject *)__pyx_v_v));
 
   /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_18get_nnzj(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self) {
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_20set_Uvar(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_v) {
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_v;
+  __Pyx_Buffer __pyx_pybuffer_v;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("get_nnzj", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_get_nnzj(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 268; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+  __Pyx_RefNannySetupContext("set_Uvar", 0);
+  __pyx_pybuffer_v.pybuffer.buf = NULL;
+  __pyx_pybuffer_v.refcount = 0;
+  __pyx_pybuffernd_v.data = NULL;
+  __pyx_pybuffernd_v.rcbuffer = &__pyx_pybuffer_v;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_v.rcbuffer->pybuffer, (PyObject*)__pyx_v_v, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 294; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_v.diminfo[0].strides = __pyx_pybuffernd_v.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_v.diminfo[0].shape = __pyx_pybuffernd_v.rcbuffer->pybuffer.shape[0];
+
+  /* "nlp/model/src/_amplmodel.pyx":295
+ *         copy_numpy_to_c(v, self.asl.i.LUv_, self.n_var)
+ *     def set_Uvar(self, ndarray[np.double_t] v):
+ *         copy_numpy_to_c(v, self.asl.i.Uvx_, self.n_var)             # <<<<<<<<<<<<<<
+ *     def set_Lcon(self, ndarray[np.double_t] v):
+ *         copy_numpy_to_c(v, self.asl.i.LUrhs_, self.n_con)
+ */
+  __pyx_f_3nlp_5model_3src_10_amplmodel_copy_numpy_to_c(((PyArrayObject *)__pyx_v_v), __pyx_v_self->asl->i.Uvx_, __pyx_v_self->n_var);
+
+  /* "nlp/model/src/_amplmodel.pyx":294
+ *     def set_Lvar(self, ndarray[np.double_t] v):
+ *         copy_numpy_to_c(v, self.asl.i.LUv_, self.n_var)
+ *     def set_Uvar(self, ndarray[np.double_t] v):             # <<<<<<<<<<<<<<
+ *         copy_numpy_to_c(v, self.asl.i.Uvx_, self.n_var)
+ *     def set_Lcon(self, ndarray[np.double_t] v):
+ */
 
   /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.get_nnzj", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_v.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.set_Uvar", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
+  goto __pyx_L2;
   __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_v.rcbuffer->pybuffer);
+  __pyx_L2:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":269
- *     # Sparsity of Jacobian and Hessian.
- *     cpdef get_nnzj(self): return self.nzc
- *     cpdef get_nnzh(self): return ampl_sphsetup(self.asl, -1, 1, 1, 1)             # <<<<<<<<<<<<<<
- * 
- *     def get_CType(self):
+/* "nlp/model/src/_amplmodel.pyx":296
+ *     def set_Uvar(self, ndarray[np.double_t] v):
+ *         copy_numpy_to_c(v, self.asl.i.Uvx_, self.n_var)
+ *     def set_Lcon(self, ndarray[np.double_t] v):             # <<<<<<<<<<<<<<
+ *         copy_numpy_to_c(v, self.asl.i.LUrhs_, self.n_con)
+ *     def set_Ucon(self, ndarray[np.double_t] v):
  */
 
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_21get_nnzh(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_get_nnzh(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_skip_dispatch) {
+/* Python wrapper */
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_23set_Lcon(PyObject *__pyx_v_self, PyObject *__pyx_v_v); /*proto*/
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_23set_Lcon(PyObject *__pyx_v_self, PyObject *__pyx_v_v) {
+  CYTHON_UNUSED int __pyx_lineno = 0;
+  CYTHON_UNUSED const char *__pyx_filename = NULL;
+  CYTHON_UNUSED int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("set_Lcon (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_v), __pyx_ptype_5numpy_ndarray, 1, "v", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 296; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_22set_Lcon(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), ((PyArrayObject *)__pyx_v_v));
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_22set_Lcon(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_v) {
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_v;
+  __Pyx_Buffer __pyx_pybuffer_v;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("get_nnzh", 0);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_nnzh); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 269; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_21get_nnzh)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_COMPILING_IN_CPYTHON && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
-        }
-      }
-      if (__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 269; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else {
-        __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 269; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannySetupContext("set_Lcon", 0);
+  __pyx_pybuffer_v.pybuffer.buf = NULL;
+  __pyx_pybuffer_v.refcount = 0;
+  __pyx_pybuffernd_v.data = NULL;
+  __pyx_pybuffernd_v.rcbuffer = &__pyx_pybuffer_v;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_v.rcbuffer->pybuffer, (PyObject*)__pyx_v_v, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 296; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(ampl_sphsetup(__pyx_v_self->asl, -1, 1, 1, 1)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 269; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+  __pyx_pybuffernd_v.diminfo[0].strides = __pyx_pybuffernd_v.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_v.diminfo[0].shape = __pyx_pybuffernd_v.rcbuffer->pybuffer.shape[0];
+
+  /* "nlp/model/src/_amplmodel.pyx":297
+ *         copy_numpy_to_c(v, self.asl.i.Uvx_, self.n_var)
+ *     def set_Lcon(self, ndarray[np.double_t] v):
+ *         copy_numpy_to_c(v, self.asl.i.LUrhs_, self.n_con)             # <<<<<<<<<<<<<<
+ *     def set_Ucon(self, ndarray[np.double_t] v):
+ *         copy_numpy_to_c(v, self.asl.i.Urhsx_, self.n_con)
+ */
+  __pyx_f_3nlp_5model_3src_10_amplmodel_copy_numpy_to_c(((PyArrayObject *)__pyx_v_v), __pyx_v_self->asl->i.LUrhs_, __pyx_v_self->n_con);
+
+  /* "nlp/model/src/_amplmodel.pyx":296
+ *     def set_Uvar(self, ndarray[np.double_t] v):
+ *         copy_numpy_to_c(v, self.asl.i.Uvx_, self.n_var)
+ *     def set_Lcon(self, ndarray[np.double_t] v):             # <<<<<<<<<<<<<<
+ *         copy_numpy_to_c(v, self.asl.i.LUrhs_, self.n_con)
+ *     def set_Ucon(self, ndarray[np.double_t] v):
+ */
 
   /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.get_nnzh", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_v.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.set_Lcon", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
   __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_v.rcbuffer->pybuffer);
+  __pyx_L2:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
+/* "nlp/model/src/_amplmodel.pyx":298
+ *     def set_Lcon(self, ndarray[np.double_t] v):
+ *         copy_numpy_to_c(v, self.asl.i.LUrhs_, self.n_con)
+ *     def set_Ucon(self, ndarray[np.double_t] v):             # <<<<<<<<<<<<<<
+ *         copy_numpy_to_c(v, self.asl.i.Urhsx_, self.n_con)
+ * 
+ */
+
 /* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_21get_nnzh(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_21get_nnzh(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_25set_Ucon(PyObject *__pyx_v_self, PyObject *__pyx_v_v); /*proto*/
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_25set_Ucon(PyObject *__pyx_v_self, PyObject *__pyx_v_v) {
+  CYTHON_UNUSED int __pyx_lineno = 0;
+  CYTHON_UNUSED const char *__pyx_filename = NULL;
+  CYTHON_UNUSED int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("get_nnzh (wrapper)", 0);
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_20get_nnzh(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("set_Ucon (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_v), __pyx_ptype_5numpy_ndarray, 1, "v", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 298; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_24set_Ucon(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), ((PyArrayObject *)__pyx_v_v));
 
   /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_20get_nnzh(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self) {
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_24set_Ucon(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_v) {
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_v;
+  __Pyx_Buffer __pyx_pybuffer_v;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("get_nnzh", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_get_nnzh(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 269; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+  __Pyx_RefNannySetupContext("set_Ucon", 0);
+  __pyx_pybuffer_v.pybuffer.buf = NULL;
+  __pyx_pybuffer_v.refcount = 0;
+  __pyx_pybuffernd_v.data = NULL;
+  __pyx_pybuffernd_v.rcbuffer = &__pyx_pybuffer_v;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_v.rcbuffer->pybuffer, (PyObject*)__pyx_v_v, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 298; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_v.diminfo[0].strides = __pyx_pybuffernd_v.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_v.diminfo[0].shape = __pyx_pybuffernd_v.rcbuffer->pybuffer.shape[0];
+
+  /* "nlp/model/src/_amplmodel.pyx":299
+ *         copy_numpy_to_c(v, self.asl.i.LUrhs_, self.n_con)
+ *     def set_Ucon(self, ndarray[np.double_t] v):
+ *         copy_numpy_to_c(v, self.asl.i.Urhsx_, self.n_con)             # <<<<<<<<<<<<<<
+ * 
+ *     def get_objtypes(self):
+ */
+  __pyx_f_3nlp_5model_3src_10_amplmodel_copy_numpy_to_c(((PyArrayObject *)__pyx_v_v), __pyx_v_self->asl->i.Urhsx_, __pyx_v_self->n_con);
+
+  /* "nlp/model/src/_amplmodel.pyx":298
+ *     def set_Lcon(self, ndarray[np.double_t] v):
+ *         copy_numpy_to_c(v, self.asl.i.LUrhs_, self.n_con)
+ *     def set_Ucon(self, ndarray[np.double_t] v):             # <<<<<<<<<<<<<<
+ *         copy_numpy_to_c(v, self.asl.i.Urhsx_, self.n_con)
+ * 
+ */
 
   /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.get_nnzh", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_v.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.set_Ucon", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
+  goto __pyx_L2;
   __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_v.rcbuffer->pybuffer);
+  __pyx_L2:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":271
- *     cpdef get_nnzh(self): return ampl_sphsetup(self.asl, -1, 1, 1, 1)
+/* "nlp/model/src/_amplmodel.pyx":301
+ *         copy_numpy_to_c(v, self.asl.i.Urhsx_, self.n_con)
  * 
- *     def get_CType(self):             # <<<<<<<<<<<<<<
- *         nln = range(self.nlc)
- *         net = range(self.nlc,  self.nlnc)
+ *     def get_objtypes(self):             # <<<<<<<<<<<<<<
+ *         """Return the sense of each objective (0 = minimization)."""
+ *         cdef int i
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_23get_CType(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_23get_CType(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_27get_objtypes(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_26get_objtypes[] = "Return the sense of each objective (0 = minimization).";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_27get_objtypes(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("get_CType (wrapper)", 0);
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_22get_CType(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("get_objtypes (wrapper)", 0);
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_26get_objtypes(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_22get_CType(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self) {
-  PyObject *__pyx_v_nln = NULL;
-  PyObject *__pyx_v_net = NULL;
-  PyObject *__pyx_v_lin = NULL;
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_26get_objtypes(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self) {
+  int __pyx_v_i;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("get_CType", 0);
+  __Pyx_RefNannySetupContext("get_objtypes", 0);
 
-  /* "nlp/model/src/_amplmodel.pyx":272
+  /* "nlp/model/src/_amplmodel.pyx":304
+ *         """Return the sense of each objective (0 = minimization)."""
+ *         cdef int i
+ *         return np.array([self.asl.i.objtype_[i] for i in range(self.n_obj)],             # <<<<<<<<<<<<<<
+ *                         dtype=np.int)
  * 
- *     def get_CType(self):
- *         nln = range(self.nlc)             # <<<<<<<<<<<<<<
- *         net = range(self.nlc,  self.nlnc)
- *         lin = range(self.nlc + self.nlnc, self.n_con)
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlc); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 304; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_array); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 304; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 304; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __pyx_v_self->n_obj;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_i = __pyx_t_4;
+    __pyx_t_5 = __Pyx_PyInt_From_char((__pyx_v_self->asl->i.objtype_[__pyx_v_i])); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 304; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_5))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 304; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 304; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_1);
   __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_nln = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "nlp/model/src/_amplmodel.pyx":273
- *     def get_CType(self):
- *         nln = range(self.nlc)
- *         net = range(self.nlc,  self.nlnc)             # <<<<<<<<<<<<<<
- *         lin = range(self.nlc + self.nlnc, self.n_con)
- *         return (lin, nln, net)
- */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlc); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->nlnc); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
-  __pyx_t_1 = 0;
-  __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_v_net = __pyx_t_2;
-  __pyx_t_2 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":274
- *         nln = range(self.nlc)
- *         net = range(self.nlc,  self.nlnc)
- *         lin = range(self.nlc + self.nlnc, self.n_con)             # <<<<<<<<<<<<<<
- *         return (lin, nln, net)
+  /* "nlp/model/src/_amplmodel.pyx":305
+ *         cdef int i
+ *         return np.array([self.asl.i.objtype_[i] for i in range(self.n_obj)],
+ *                         dtype=np.int)             # <<<<<<<<<<<<<<
  * 
+ *     # Sparsity of Jacobian and Hessian.
  */
-  __pyx_t_2 = __Pyx_PyInt_From_int((__pyx_v_self->nlc + __pyx_v_self->nlnc)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_self->n_con); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_3);
-  __pyx_t_2 = 0;
-  __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_lin = __pyx_t_3;
-  __pyx_t_3 = 0;
+  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_int); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":275
- *         net = range(self.nlc,  self.nlnc)
- *         lin = range(self.nlc + self.nlnc, self.n_con)
- *         return (lin, nln, net)             # <<<<<<<<<<<<<<
+  /* "nlp/model/src/_amplmodel.pyx":304
+ *         """Return the sense of each objective (0 = minimization)."""
+ *         cdef int i
+ *         return np.array([self.asl.i.objtype_[i] for i in range(self.n_obj)],             # <<<<<<<<<<<<<<
+ *                         dtype=np.int)
  * 
- *     def eval_obj(self, ndarray[np.double_t] x, int obj_num=0):
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 275; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_INCREF(__pyx_v_lin);
-  __Pyx_GIVEREF(__pyx_v_lin);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_lin);
-  __Pyx_INCREF(__pyx_v_nln);
-  __Pyx_GIVEREF(__pyx_v_nln);
-  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_nln);
-  __Pyx_INCREF(__pyx_v_net);
-  __Pyx_GIVEREF(__pyx_v_net);
-  PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_net);
-  __pyx_r = __pyx_t_3;
-  __pyx_t_3 = 0;
+  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 304; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_7;
+  __pyx_t_7 = 0;
   goto __pyx_L0;
 
-  /* "nlp/model/src/_amplmodel.pyx":271
- *     cpdef get_nnzh(self): return ampl_sphsetup(self.asl, -1, 1, 1, 1)
+  /* "nlp/model/src/_amplmodel.pyx":301
+ *         copy_numpy_to_c(v, self.asl.i.Urhsx_, self.n_con)
  * 
- *     def get_CType(self):             # <<<<<<<<<<<<<<
- *         nln = range(self.nlc)
- *         net = range(self.nlc,  self.nlnc)
+ *     def get_objtypes(self):             # <<<<<<<<<<<<<<
+ *         """Return the sense of each objective (0 = minimization)."""
+ *         cdef int i
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.get_CType", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.get_objtypes", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_nln);
-  __Pyx_XDECREF(__pyx_v_net);
-  __Pyx_XDECREF(__pyx_v_lin);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":277
- *         return (lin, nln, net)
+/* "nlp/model/src/_amplmodel.pyx":308
+ * 
+ *     # Sparsity of Jacobian and Hessian.
+ *     cpdef get_nnzj(self): return self.nzc             # <<<<<<<<<<<<<<
+ *     cpdef get_nnzh(self): return ampl_sphsetup(self.asl, -1, 1, 1, 1)
  * 
- *     def eval_obj(self, ndarray[np.double_t] x, int obj_num=0):             # <<<<<<<<<<<<<<
- *         cdef:
- *             int nerror = 0
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_25eval_obj(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_25eval_obj(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyArrayObject *__pyx_v_x = 0;
-  int __pyx_v_obj_num;
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_29get_nnzj(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_get_nnzj(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_skip_dispatch) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("eval_obj (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_x,&__pyx_n_s_obj_num,0};
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_obj_num);
-          if (value) { values[1] = value; kw_args--; }
+  __Pyx_RefNannySetupContext("get_nnzj", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_nnzj); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 308; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_29get_nnzj)) {
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(__pyx_t_1);
+      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+      if (CYTHON_COMPILING_IN_CPYTHON && unlikely(PyMethod_Check(__pyx_t_3))) {
+        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+        if (likely(__pyx_t_4)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+          __Pyx_INCREF(__pyx_t_4);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_3, function);
         }
       }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "eval_obj") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 277; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        break;
-        default: goto __pyx_L5_argtuple_error;
+      if (__pyx_t_4) {
+        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 308; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      } else {
+        __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 308; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       }
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_r = __pyx_t_2;
+      __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      goto __pyx_L0;
     }
-    __pyx_v_x = ((PyArrayObject *)values[0]);
-    if (values[1]) {
-      __pyx_v_obj_num = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_obj_num == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 277; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    } else {
-      __pyx_v_obj_num = ((int)0);
-    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("eval_obj", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 277; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_obj", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nzc); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 308; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.get_nnzj", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 277; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_24eval_obj(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_x, __pyx_v_obj_num);
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_29get_nnzj(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_29get_nnzj(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_nnzj (wrapper)", 0);
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_28get_nnzj(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self));
 
   /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_28get_nnzj(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_nnzj", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_get_nnzj(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 308; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
   goto __pyx_L0;
+
+  /* function exit code */
   __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.get_nnzj", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_24eval_obj(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, int __pyx_v_obj_num) {
-  int __pyx_v_nerror;
-  double __pyx_v_val;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_x;
-  __Pyx_Buffer __pyx_pybuffer_x;
+/* "nlp/model/src/_amplmodel.pyx":309
+ *     # Sparsity of Jacobian and Hessian.
+ *     cpdef get_nnzj(self): return self.nzc
+ *     cpdef get_nnzh(self): return ampl_sphsetup(self.asl, -1, 1, 1, 1)             # <<<<<<<<<<<<<<
+ * 
+ *     def get_CType(self):
+ */
+
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_31get_nnzh(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_get_nnzh(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_skip_dispatch) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
+  PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  PyArrayObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("eval_obj", 0);
-  __Pyx_INCREF((PyObject *)__pyx_v_x);
-  __pyx_pybuffer_x.pybuffer.buf = NULL;
-  __pyx_pybuffer_x.refcount = 0;
-  __pyx_pybuffernd_x.data = NULL;
-  __pyx_pybuffernd_x.rcbuffer = &__pyx_pybuffer_x;
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 277; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
-
-  /* "nlp/model/src/_amplmodel.pyx":279
- *     def eval_obj(self, ndarray[np.double_t] x, int obj_num=0):
- *         cdef:
- *             int nerror = 0             # <<<<<<<<<<<<<<
- *             double val
- * 
- */
-  __pyx_v_nerror = 0;
-
-  /* "nlp/model/src/_amplmodel.pyx":283
- * 
- *         # Ensure contiguous input.
- *         if not PyArray_ISCARRAY(x): x = x.copy()             # <<<<<<<<<<<<<<
- * 
- *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
- */
-  __pyx_t_1 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
-  if (__pyx_t_1) {
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = NULL;
-    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-      }
-    }
-    if (__pyx_t_4) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    } else {
-      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_5 = ((PyArrayObject *)__pyx_t_2);
-    {
-      __Pyx_BufFmt_StackElem __pyx_stack[1];
-      __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
-      __pyx_t_6 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_t_5, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
-      if (unlikely(__pyx_t_6 < 0)) {
-        PyErr_Fetch(&__pyx_t_7, &__pyx_t_8, &__pyx_t_9);
-        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
-          Py_XDECREF(__pyx_t_7); Py_XDECREF(__pyx_t_8); Py_XDECREF(__pyx_t_9);
-          __Pyx_RaiseBufferFallbackError();
-        } else {
-          PyErr_Restore(__pyx_t_7, __pyx_t_8, __pyx_t_9);
+  __Pyx_RefNannySetupContext("get_nnzh", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_nnzh); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_31get_nnzh)) {
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(__pyx_t_1);
+      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+      if (CYTHON_COMPILING_IN_CPYTHON && unlikely(PyMethod_Check(__pyx_t_3))) {
+        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+        if (likely(__pyx_t_4)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+          __Pyx_INCREF(__pyx_t_4);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_3, function);
         }
       }
-      __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (__pyx_t_4) {
+        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      } else {
+        __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      }
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_r = __pyx_t_2;
+      __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      goto __pyx_L0;
     }
-    __pyx_t_5 = 0;
-    __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_2));
-    __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   }
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int(ampl_sphsetup(__pyx_v_self->asl, -1, 1, 1, 1)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
 
-  /* "nlp/model/src/_amplmodel.pyx":285
- *         if not PyArray_ISCARRAY(x): x = x.copy()
- * 
- *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)             # <<<<<<<<<<<<<<
- *         if nerror:
- *             raise ValueError
- */
-  __pyx_v_val = ampl_objval(__pyx_v_self->asl, __pyx_v_obj_num, ((double *)__pyx_v_x->data), (&__pyx_v_nerror));
-
-  /* "nlp/model/src/_amplmodel.pyx":286
- * 
- *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
- *         if nerror:             # <<<<<<<<<<<<<<
- *             raise ValueError
- *         return val
- */
-  __pyx_t_1 = (__pyx_v_nerror != 0);
-  if (__pyx_t_1) {
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.get_nnzh", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-    /* "nlp/model/src/_amplmodel.pyx":287
- *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
- *         if nerror:
- *             raise ValueError             # <<<<<<<<<<<<<<
- *         return val
- * 
- */
-    __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+/* Python wrapper */
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_31get_nnzh(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_31get_nnzh(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_nnzh (wrapper)", 0);
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_30get_nnzh(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self));
 
-    /* "nlp/model/src/_amplmodel.pyx":286
- * 
- *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
- *         if nerror:             # <<<<<<<<<<<<<<
- *             raise ValueError
- *         return val
- */
-  }
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-  /* "nlp/model/src/_amplmodel.pyx":288
- *         if nerror:
- *             raise ValueError
- *         return val             # <<<<<<<<<<<<<<
- * 
- *     cpdef grad_obj(self, ndarray[np.double_t] x):
- */
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_30get_nnzh(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_nnzh", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_val); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 288; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
+  __pyx_t_1 = __pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_get_nnzh(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "nlp/model/src/_amplmodel.pyx":277
- *         return (lin, nln, net)
- * 
- *     def eval_obj(self, ndarray[np.double_t] x, int obj_num=0):             # <<<<<<<<<<<<<<
- *         cdef:
- *             int nerror = 0
- */
-
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_obj", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.get_nnzh", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
-  goto __pyx_L2;
   __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
-  __pyx_L2:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_x);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":290
- *         return val
+/* "nlp/model/src/_amplmodel.pyx":311
+ *     cpdef get_nnzh(self): return ampl_sphsetup(self.asl, -1, 1, 1, 1)
  * 
- *     cpdef grad_obj(self, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
- *         """Evaluate the gradient of the objective at x."""
- *         # Ensure contiguous input.
+ *     def get_CType(self):             # <<<<<<<<<<<<<<
+ *         nln = range(self.nlc)
+ *         net = range(self.nlc,  self.nlnc)
  */
 
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_27grad_obj(PyObject *__pyx_v_self, PyObject *__pyx_v_x); /*proto*/
-static PyObject *__pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_grad_obj(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, int __pyx_skip_dispatch) {
-  PyArrayObject *__pyx_v_g = 0;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_g;
-  __Pyx_Buffer __pyx_pybuffer_g;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_x;
-  __Pyx_Buffer __pyx_pybuffer_x;
+/* Python wrapper */
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_33get_CType(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_33get_CType(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_CType (wrapper)", 0);
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_32get_CType(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_32get_CType(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self) {
+  PyObject *__pyx_v_nln = NULL;
+  PyObject *__pyx_v_net = NULL;
+  PyObject *__pyx_v_lin = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
-  PyArrayObject *__pyx_t_7 = NULL;
-  int __pyx_t_8;
-  PyObject *__pyx_t_9 = NULL;
-  PyObject *__pyx_t_10 = NULL;
-  PyObject *__pyx_t_11 = NULL;
-  PyArrayObject *__pyx_t_12 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("grad_obj", 0);
-  __Pyx_INCREF((PyObject *)__pyx_v_x);
-  __pyx_pybuffer_g.pybuffer.buf = NULL;
-  __pyx_pybuffer_g.refcount = 0;
-  __pyx_pybuffernd_g.data = NULL;
-  __pyx_pybuffernd_g.rcbuffer = &__pyx_pybuffer_g;
-  __pyx_pybuffer_x.pybuffer.buf = NULL;
-  __pyx_pybuffer_x.refcount = 0;
-  __pyx_pybuffernd_x.data = NULL;
-  __pyx_pybuffernd_x.rcbuffer = &__pyx_pybuffer_x;
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_grad_obj); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_27grad_obj)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_COMPILING_IN_CPYTHON && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
-        }
-      }
-      if (!__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, ((PyObject *)__pyx_v_x)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_2);
-      } else {
-        __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
-        __Pyx_INCREF(((PyObject *)__pyx_v_x));
-        __Pyx_GIVEREF(((PyObject *)__pyx_v_x));
-        PyTuple_SET_ITEM(__pyx_t_5, 0+1, ((PyObject *)__pyx_v_x));
-        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      }
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
+  __Pyx_RefNannySetupContext("get_CType", 0);
 
-  /* "nlp/model/src/_amplmodel.pyx":293
- *         """Evaluate the gradient of the objective at x."""
- *         # Ensure contiguous input.
- *         if not PyArray_ISCARRAY(x): x = x.copy()             # <<<<<<<<<<<<<<
- *         cdef ndarray[np.double_t] g = x.copy()
- *         if ampl_objgrd(self.asl, 0, <double*>x.data, <double*>g.data):
+  /* "nlp/model/src/_amplmodel.pyx":312
+ * 
+ *     def get_CType(self):
+ *         nln = range(self.nlc)             # <<<<<<<<<<<<<<
+ *         net = range(self.nlc,  self.nlnc)
+ *         lin = range(self.nlc + self.nlnc, self.n_con)
  */
-  __pyx_t_6 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
-  if (__pyx_t_6) {
-    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 293; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = NULL;
-    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-      if (likely(__pyx_t_3)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-        __Pyx_INCREF(__pyx_t_3);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_2, function);
-      }
-    }
-    if (__pyx_t_3) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 293; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    } else {
-      __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 293; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 293; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_7 = ((PyArrayObject *)__pyx_t_1);
-    {
-      __Pyx_BufFmt_StackElem __pyx_stack[1];
-      __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
-      __pyx_t_8 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
-      if (unlikely(__pyx_t_8 < 0)) {
-        PyErr_Fetch(&__pyx_t_9, &__pyx_t_10, &__pyx_t_11);
-        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
-          Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_10); Py_XDECREF(__pyx_t_11);
-          __Pyx_RaiseBufferFallbackError();
-        } else {
-          PyErr_Restore(__pyx_t_9, __pyx_t_10, __pyx_t_11);
-        }
-      }
-      __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_8 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 293; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    __pyx_t_7 = 0;
-    __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_1));
-    __pyx_t_1 = 0;
-  }
-
-  /* "nlp/model/src/_amplmodel.pyx":294
- *         # Ensure contiguous input.
- *         if not PyArray_ISCARRAY(x): x = x.copy()
- *         cdef ndarray[np.double_t] g = x.copy()             # <<<<<<<<<<<<<<
- *         if ampl_objgrd(self.asl, 0, <double*>x.data, <double*>g.data):
- *             raise ValueError
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 294; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlc); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 312; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 312; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = NULL;
-  if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-    }
-  }
-  if (__pyx_t_3) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 294; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  } else {
-    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 294; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 312; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 294; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_12 = ((PyArrayObject *)__pyx_t_1);
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_g.rcbuffer->pybuffer, (PyObject*)__pyx_t_12, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
-      __pyx_v_g = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_g.rcbuffer->pybuffer.buf = NULL;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 294; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    } else {__pyx_pybuffernd_g.diminfo[0].strides = __pyx_pybuffernd_g.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_g.diminfo[0].shape = __pyx_pybuffernd_g.rcbuffer->pybuffer.shape[0];
-    }
-  }
-  __pyx_t_12 = 0;
-  __pyx_v_g = ((PyArrayObject *)__pyx_t_1);
+  __pyx_v_nln = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":295
- *         if not PyArray_ISCARRAY(x): x = x.copy()
- *         cdef ndarray[np.double_t] g = x.copy()
- *         if ampl_objgrd(self.asl, 0, <double*>x.data, <double*>g.data):             # <<<<<<<<<<<<<<
- *             raise ValueError
- *         return g
+  /* "nlp/model/src/_amplmodel.pyx":313
+ *     def get_CType(self):
+ *         nln = range(self.nlc)
+ *         net = range(self.nlc,  self.nlnc)             # <<<<<<<<<<<<<<
+ *         lin = range(self.nlc + self.nlnc, self.n_con)
+ *         return (lin, nln, net)
  */
-  __pyx_t_6 = (ampl_objgrd(__pyx_v_self->asl, 0, ((double *)__pyx_v_x->data), ((double *)__pyx_v_g->data)) != 0);
-  if (__pyx_t_6) {
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlc); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 313; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->nlnc); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 313; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 313; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 313; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_net = __pyx_t_2;
+  __pyx_t_2 = 0;
 
-    /* "nlp/model/src/_amplmodel.pyx":296
- *         cdef ndarray[np.double_t] g = x.copy()
- *         if ampl_objgrd(self.asl, 0, <double*>x.data, <double*>g.data):
- *             raise ValueError             # <<<<<<<<<<<<<<
- *         return g
+  /* "nlp/model/src/_amplmodel.pyx":314
+ *         nln = range(self.nlc)
+ *         net = range(self.nlc,  self.nlnc)
+ *         lin = range(self.nlc + self.nlnc, self.n_con)             # <<<<<<<<<<<<<<
+ *         return (lin, nln, net)
  * 
  */
-    __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 296; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-    /* "nlp/model/src/_amplmodel.pyx":295
- *         if not PyArray_ISCARRAY(x): x = x.copy()
- *         cdef ndarray[np.double_t] g = x.copy()
- *         if ampl_objgrd(self.asl, 0, <double*>x.data, <double*>g.data):             # <<<<<<<<<<<<<<
- *             raise ValueError
- *         return g
- */
-  }
+  __pyx_t_2 = __Pyx_PyInt_From_int((__pyx_v_self->nlc + __pyx_v_self->nlnc)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_self->n_con); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_3);
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_lin = __pyx_t_3;
+  __pyx_t_3 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":297
- *         if ampl_objgrd(self.asl, 0, <double*>x.data, <double*>g.data):
- *             raise ValueError
- *         return g             # <<<<<<<<<<<<<<
+  /* "nlp/model/src/_amplmodel.pyx":315
+ *         net = range(self.nlc,  self.nlnc)
+ *         lin = range(self.nlc + self.nlnc, self.n_con)
+ *         return (lin, nln, net)             # <<<<<<<<<<<<<<
  * 
- *     def eval_cons(self, ndarray[np.double_t] x):
+ *     def eval_obj(self, ndarray[np.double_t] x, int obj_num=0):
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((PyObject *)__pyx_v_g));
-  __pyx_r = ((PyObject *)__pyx_v_g);
+  __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_v_lin);
+  __Pyx_GIVEREF(__pyx_v_lin);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_lin);
+  __Pyx_INCREF(__pyx_v_nln);
+  __Pyx_GIVEREF(__pyx_v_nln);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_nln);
+  __Pyx_INCREF(__pyx_v_net);
+  __Pyx_GIVEREF(__pyx_v_net);
+  PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_net);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "nlp/model/src/_amplmodel.pyx":290
- *         return val
+  /* "nlp/model/src/_amplmodel.pyx":311
+ *     cpdef get_nnzh(self): return ampl_sphsetup(self.asl, -1, 1, 1, 1)
  * 
- *     cpdef grad_obj(self, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
- *         """Evaluate the gradient of the objective at x."""
- *         # Ensure contiguous input.
+ *     def get_CType(self):             # <<<<<<<<<<<<<<
+ *         nln = range(self.nlc)
+ *         net = range(self.nlc,  self.nlnc)
  */
 
   /* function exit code */
@@ -3559,39 +3798,87 @@ static PyObject *__pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_grad_obj(struct __p
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_g.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.grad_obj", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  goto __pyx_L2;
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.get_CType", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_g.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
-  __pyx_L2:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_g);
-  __Pyx_XDECREF((PyObject *)__pyx_v_x);
+  __Pyx_XDECREF(__pyx_v_nln);
+  __Pyx_XDECREF(__pyx_v_net);
+  __Pyx_XDECREF(__pyx_v_lin);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
+/* "nlp/model/src/_amplmodel.pyx":317
+ *         return (lin, nln, net)
+ * 
+ *     def eval_obj(self, ndarray[np.double_t] x, int obj_num=0):             # <<<<<<<<<<<<<<
+ *         cdef:
+ *             int nerror = 0
+ */
+
 /* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_27grad_obj(PyObject *__pyx_v_self, PyObject *__pyx_v_x); /*proto*/
-static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_26grad_obj[] = "Evaluate the gradient of the objective at x.";
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_27grad_obj(PyObject *__pyx_v_self, PyObject *__pyx_v_x) {
-  CYTHON_UNUSED int __pyx_lineno = 0;
-  CYTHON_UNUSED const char *__pyx_filename = NULL;
-  CYTHON_UNUSED int __pyx_clineno = 0;
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_35eval_obj(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_35eval_obj(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_x = 0;
+  int __pyx_v_obj_num;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("grad_obj (wrapper)", 0);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_26grad_obj(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), ((PyArrayObject *)__pyx_v_x));
+  __Pyx_RefNannySetupContext("eval_obj (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_x,&__pyx_n_s_obj_num,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_obj_num);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "eval_obj") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 317; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_x = ((PyArrayObject *)values[0]);
+    if (values[1]) {
+      __pyx_v_obj_num = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_obj_num == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 317; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_obj_num = ((int)0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("eval_obj", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 317; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_obj", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 317; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_34eval_obj(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_x, __pyx_v_obj_num);
 
   /* function exit code */
   goto __pyx_L0;
@@ -3602,70 +3889,199 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_27grad_obj(PyObjec
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_26grad_obj(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x) {
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_34eval_obj(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, int __pyx_v_obj_num) {
+  int __pyx_v_nerror;
+  double __pyx_v_val;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_x;
   __Pyx_Buffer __pyx_pybuffer_x;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyArrayObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("grad_obj", 0);
+  __Pyx_RefNannySetupContext("eval_obj", 0);
+  __Pyx_INCREF((PyObject *)__pyx_v_x);
   __pyx_pybuffer_x.pybuffer.buf = NULL;
   __pyx_pybuffer_x.refcount = 0;
   __pyx_pybuffernd_x.data = NULL;
   __pyx_pybuffernd_x.rcbuffer = &__pyx_pybuffer_x;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 317; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_grad_obj(__pyx_v_self, __pyx_v_x, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.grad_obj", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  goto __pyx_L2;
-  __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
-  __pyx_L2:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
 
-/* "nlp/model/src/_amplmodel.pyx":299
- *         return g
- * 
- *     def eval_cons(self, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
- *         """Evaluate the constraints at x."""
- *         cdef ndarray[np.double_t] \
+  /* "nlp/model/src/_amplmodel.pyx":319
+ *     def eval_obj(self, ndarray[np.double_t] x, int obj_num=0):
+ *         cdef:
+ *             int nerror = 0             # <<<<<<<<<<<<<<
+ *             double val
+ * 
+ */
+  __pyx_v_nerror = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":323
+ * 
+ *         # Ensure contiguous input.
+ *         if not PyArray_ISCARRAY(x): x = x.copy()             # <<<<<<<<<<<<<<
+ * 
+ *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
+ */
+  __pyx_t_1 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
+  if (__pyx_t_1) {
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    if (__pyx_t_4) {
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    } else {
+      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = ((PyArrayObject *)__pyx_t_2);
+    {
+      __Pyx_BufFmt_StackElem __pyx_stack[1];
+      __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+      __pyx_t_6 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_t_5, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
+      if (unlikely(__pyx_t_6 < 0)) {
+        PyErr_Fetch(&__pyx_t_7, &__pyx_t_8, &__pyx_t_9);
+        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
+          Py_XDECREF(__pyx_t_7); Py_XDECREF(__pyx_t_8); Py_XDECREF(__pyx_t_9);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_7, __pyx_t_8, __pyx_t_9);
+        }
+      }
+      __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
+      if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __pyx_t_5 = 0;
+    __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_2));
+    __pyx_t_2 = 0;
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":325
+ *         if not PyArray_ISCARRAY(x): x = x.copy()
+ * 
+ *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)             # <<<<<<<<<<<<<<
+ *         if nerror:
+ *             raise ValueError
+ */
+  __pyx_v_val = ampl_objval(__pyx_v_self->asl, __pyx_v_obj_num, ((double *)__pyx_v_x->data), (&__pyx_v_nerror));
+
+  /* "nlp/model/src/_amplmodel.pyx":326
+ * 
+ *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
+ *         if nerror:             # <<<<<<<<<<<<<<
+ *             raise ValueError
+ *         return val
+ */
+  __pyx_t_1 = (__pyx_v_nerror != 0);
+  if (__pyx_t_1) {
+
+    /* "nlp/model/src/_amplmodel.pyx":327
+ *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
+ *         if nerror:
+ *             raise ValueError             # <<<<<<<<<<<<<<
+ *         return val
+ * 
+ */
+    __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 327; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "nlp/model/src/_amplmodel.pyx":326
+ * 
+ *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
+ *         if nerror:             # <<<<<<<<<<<<<<
+ *             raise ValueError
+ *         return val
+ */
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":328
+ *         if nerror:
+ *             raise ValueError
+ *         return val             # <<<<<<<<<<<<<<
+ * 
+ *     def eval_objs(self, ndarray[np.double_t] x):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_val); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 328; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "nlp/model/src/_amplmodel.pyx":317
+ *         return (lin, nln, net)
+ * 
+ *     def eval_obj(self, ndarray[np.double_t] x, int obj_num=0):             # <<<<<<<<<<<<<<
+ *         cdef:
+ *             int nerror = 0
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_obj", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_x);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nlp/model/src/_amplmodel.pyx":330
+ *         return val
+ * 
+ *     def eval_objs(self, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
+ *         """Evaluate all objectives at x."""
+ *         cdef:
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_29eval_cons(PyObject *__pyx_v_self, PyObject *__pyx_v_x); /*proto*/
-static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_28eval_cons[] = "Evaluate the constraints at x.";
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_29eval_cons(PyObject *__pyx_v_self, PyObject *__pyx_v_x) {
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_37eval_objs(PyObject *__pyx_v_self, PyObject *__pyx_v_x); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_36eval_objs[] = "Evaluate all objectives at x.";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_37eval_objs(PyObject *__pyx_v_self, PyObject *__pyx_v_x) {
   CYTHON_UNUSED int __pyx_lineno = 0;
   CYTHON_UNUSED const char *__pyx_filename = NULL;
   CYTHON_UNUSED int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("eval_cons (wrapper)", 0);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_28eval_cons(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), ((PyArrayObject *)__pyx_v_x));
+  __Pyx_RefNannySetupContext("eval_objs (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_36eval_objs(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), ((PyArrayObject *)__pyx_v_x));
 
   /* function exit code */
   goto __pyx_L0;
@@ -3676,10 +4092,12 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_29eval_cons(PyObje
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_28eval_cons(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x) {
-  PyArrayObject *__pyx_v_c = 0;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_c;
-  __Pyx_Buffer __pyx_pybuffer_c;
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_36eval_objs(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x) {
+  int __pyx_v_i;
+  int __pyx_v_nerror;
+  PyArrayObject *__pyx_v_f = 0;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_f;
+  __Pyx_Buffer __pyx_pybuffer_f;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_x;
   __Pyx_Buffer __pyx_pybuffer_x;
   PyObject *__pyx_r = NULL;
@@ -3696,82 +4114,94 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_28eval_cons(struct
   PyObject *__pyx_t_10 = NULL;
   PyObject *__pyx_t_11 = NULL;
   PyObject *__pyx_t_12 = NULL;
+  int __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  int __pyx_t_15;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("eval_cons", 0);
+  __Pyx_RefNannySetupContext("eval_objs", 0);
   __Pyx_INCREF((PyObject *)__pyx_v_x);
-  __pyx_pybuffer_c.pybuffer.buf = NULL;
-  __pyx_pybuffer_c.refcount = 0;
-  __pyx_pybuffernd_c.data = NULL;
-  __pyx_pybuffernd_c.rcbuffer = &__pyx_pybuffer_c;
+  __pyx_pybuffer_f.pybuffer.buf = NULL;
+  __pyx_pybuffer_f.refcount = 0;
+  __pyx_pybuffernd_f.data = NULL;
+  __pyx_pybuffernd_f.rcbuffer = &__pyx_pybuffer_f;
   __pyx_pybuffer_x.pybuffer.buf = NULL;
   __pyx_pybuffer_x.refcount = 0;
   __pyx_pybuffernd_x.data = NULL;
   __pyx_pybuffernd_x.rcbuffer = &__pyx_pybuffer_x;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
 
-  /* "nlp/model/src/_amplmodel.pyx":302
- *         """Evaluate the constraints at x."""
- *         cdef ndarray[np.double_t] \
- *              c = np.empty(self.n_con, dtype=np.double)             # <<<<<<<<<<<<<<
+  /* "nlp/model/src/_amplmodel.pyx":333
+ *         """Evaluate all objectives at x."""
+ *         cdef:
+ *             int i, nerror = 0             # <<<<<<<<<<<<<<
+ *             ndarray[np.double_t] f = np.empty(self.n_obj, dtype=np.double)
+ * 
+ */
+  __pyx_v_nerror = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":334
+ *         cdef:
+ *             int i, nerror = 0
+ *             ndarray[np.double_t] f = np.empty(self.n_obj, dtype=np.double)             # <<<<<<<<<<<<<<
  * 
  *         # Ensure contiguous input.
  */
-  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->n_con); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->n_obj); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_1);
   PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
   __pyx_t_1 = 0;
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_double); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_double); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_6 = ((PyArrayObject *)__pyx_t_5);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_c.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
-      __pyx_v_c = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_c.rcbuffer->pybuffer.buf = NULL;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    } else {__pyx_pybuffernd_c.diminfo[0].strides = __pyx_pybuffernd_c.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_c.diminfo[0].shape = __pyx_pybuffernd_c.rcbuffer->pybuffer.shape[0];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_f.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_f = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_f.rcbuffer->pybuffer.buf = NULL;
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    } else {__pyx_pybuffernd_f.diminfo[0].strides = __pyx_pybuffernd_f.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_f.diminfo[0].shape = __pyx_pybuffernd_f.rcbuffer->pybuffer.shape[0];
     }
   }
   __pyx_t_6 = 0;
-  __pyx_v_c = ((PyArrayObject *)__pyx_t_5);
+  __pyx_v_f = ((PyArrayObject *)__pyx_t_5);
   __pyx_t_5 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":305
+  /* "nlp/model/src/_amplmodel.pyx":337
  * 
  *         # Ensure contiguous input.
  *         if not PyArray_ISCARRAY(x): x = x.copy()             # <<<<<<<<<<<<<<
  * 
- *         if ampl_conval(self.asl, <double*>x.data, <double*>c.data):
+ *         for i in range(self.n_obj):
  */
   __pyx_t_7 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
   if (__pyx_t_7) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     __pyx_t_3 = NULL;
     if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
@@ -3784,14 +4214,14 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_28eval_cons(struct
       }
     }
     if (__pyx_t_3) {
-      __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     } else {
-      __pyx_t_5 = __Pyx_PyObject_CallNoArg(__pyx_t_1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_5 = __Pyx_PyObject_CallNoArg(__pyx_t_1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_8 = ((PyArrayObject *)__pyx_t_5);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
@@ -3807,60 +4237,91 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_28eval_cons(struct
         }
       }
       __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_9 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (unlikely(__pyx_t_9 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __pyx_t_8 = 0;
     __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_5));
     __pyx_t_5 = 0;
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":307
+  /* "nlp/model/src/_amplmodel.pyx":339
  *         if not PyArray_ISCARRAY(x): x = x.copy()
  * 
- *         if ampl_conval(self.asl, <double*>x.data, <double*>c.data):             # <<<<<<<<<<<<<<
- *             raise ValueError
- *         return c
+ *         for i in range(self.n_obj):             # <<<<<<<<<<<<<<
+ *             f[i] = ampl_objval(self.asl, i, <double*>x.data, &nerror)
+ *             if nerror:
  */
-  __pyx_t_7 = (ampl_conval(__pyx_v_self->asl, ((double *)__pyx_v_x->data), ((double *)__pyx_v_c->data)) != 0);
-  if (__pyx_t_7) {
+  __pyx_t_9 = __pyx_v_self->n_obj;
+  for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_9; __pyx_t_13+=1) {
+    __pyx_v_i = __pyx_t_13;
 
-    /* "nlp/model/src/_amplmodel.pyx":308
- * 
- *         if ampl_conval(self.asl, <double*>x.data, <double*>c.data):
- *             raise ValueError             # <<<<<<<<<<<<<<
- *         return c
+    /* "nlp/model/src/_amplmodel.pyx":340
  * 
+ *         for i in range(self.n_obj):
+ *             f[i] = ampl_objval(self.asl, i, <double*>x.data, &nerror)             # <<<<<<<<<<<<<<
+ *             if nerror:
+ *                 raise ValueError
+ */
+    __pyx_t_14 = __pyx_v_i;
+    __pyx_t_15 = -1;
+    if (__pyx_t_14 < 0) {
+      __pyx_t_14 += __pyx_pybuffernd_f.diminfo[0].shape;
+      if (unlikely(__pyx_t_14 < 0)) __pyx_t_15 = 0;
+    } else if (unlikely(__pyx_t_14 >= __pyx_pybuffernd_f.diminfo[0].shape)) __pyx_t_15 = 0;
+    if (unlikely(__pyx_t_15 != -1)) {
+      __Pyx_RaiseBufferIndexError(__pyx_t_15);
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_f.rcbuffer->pybuffer.buf, __pyx_t_14, __pyx_pybuffernd_f.diminfo[0].strides) = ampl_objval(__pyx_v_self->asl, __pyx_v_i, ((double *)__pyx_v_x->data), (&__pyx_v_nerror));
+
+    /* "nlp/model/src/_amplmodel.pyx":341
+ *         for i in range(self.n_obj):
+ *             f[i] = ampl_objval(self.asl, i, <double*>x.data, &nerror)
+ *             if nerror:             # <<<<<<<<<<<<<<
+ *                 raise ValueError
+ *         return f
  */
-    __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 308; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = (__pyx_v_nerror != 0);
+    if (__pyx_t_7) {
 
-    /* "nlp/model/src/_amplmodel.pyx":307
- *         if not PyArray_ISCARRAY(x): x = x.copy()
+      /* "nlp/model/src/_amplmodel.pyx":342
+ *             f[i] = ampl_objval(self.asl, i, <double*>x.data, &nerror)
+ *             if nerror:
+ *                 raise ValueError             # <<<<<<<<<<<<<<
+ *         return f
  * 
- *         if ampl_conval(self.asl, <double*>x.data, <double*>c.data):             # <<<<<<<<<<<<<<
- *             raise ValueError
- *         return c
  */
+      __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 342; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+      /* "nlp/model/src/_amplmodel.pyx":341
+ *         for i in range(self.n_obj):
+ *             f[i] = ampl_objval(self.asl, i, <double*>x.data, &nerror)
+ *             if nerror:             # <<<<<<<<<<<<<<
+ *                 raise ValueError
+ *         return f
+ */
+    }
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":309
- *         if ampl_conval(self.asl, <double*>x.data, <double*>c.data):
- *             raise ValueError
- *         return c             # <<<<<<<<<<<<<<
+  /* "nlp/model/src/_amplmodel.pyx":343
+ *             if nerror:
+ *                 raise ValueError
+ *         return f             # <<<<<<<<<<<<<<
  * 
- *     def eval_sgrad(self, ndarray[np.double_t] x):
+ *     cpdef grad_obj(self, ndarray[np.double_t] x, int obj_num=0):
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((PyObject *)__pyx_v_c));
-  __pyx_r = ((PyObject *)__pyx_v_c);
+  __Pyx_INCREF(((PyObject *)__pyx_v_f));
+  __pyx_r = ((PyObject *)__pyx_v_f);
   goto __pyx_L0;
 
-  /* "nlp/model/src/_amplmodel.pyx":299
- *         return g
+  /* "nlp/model/src/_amplmodel.pyx":330
+ *         return val
  * 
- *     def eval_cons(self, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
- *         """Evaluate the constraints at x."""
- *         cdef ndarray[np.double_t] \
+ *     def eval_objs(self, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
+ *         """Evaluate all objectives at x."""
+ *         cdef:
  */
 
   /* function exit code */
@@ -3872,400 +4333,307 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_28eval_cons(struct
   __Pyx_XDECREF(__pyx_t_5);
   { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
     __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_c.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_f.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
   __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_cons", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_objs", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   goto __pyx_L2;
   __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_c.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_f.rcbuffer->pybuffer);
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
   __pyx_L2:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_c);
+  __Pyx_XDECREF((PyObject *)__pyx_v_f);
   __Pyx_XDECREF((PyObject *)__pyx_v_x);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":311
- *         return c
+/* "nlp/model/src/_amplmodel.pyx":345
+ *         return f
  * 
- *     def eval_sgrad(self, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
- *         """Evaluate linear-part of the objective gradient at x.  A
- *         sparse gradient is returned as a dictionary."""
+ *     cpdef grad_obj(self, ndarray[np.double_t] x, int obj_num=0):             # <<<<<<<<<<<<<<
+ *         """Evaluate the gradient of the objective at x."""
+ *         # Ensure contiguous input.
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_31eval_sgrad(PyObject *__pyx_v_self, PyObject *__pyx_v_x); /*proto*/
-static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_30eval_sgrad[] = "Evaluate linear-part of the objective gradient at x.  A\n        sparse gradient is returned as a dictionary.";
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_31eval_sgrad(PyObject *__pyx_v_self, PyObject *__pyx_v_x) {
-  CYTHON_UNUSED int __pyx_lineno = 0;
-  CYTHON_UNUSED const char *__pyx_filename = NULL;
-  CYTHON_UNUSED int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("eval_sgrad (wrapper)", 0);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 311; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_30eval_sgrad(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), ((PyArrayObject *)__pyx_v_x));
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_30eval_sgrad(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x) {
-  PyObject *__pyx_v_grad_f = NULL;
-  PyObject *__pyx_v_sg = NULL;
-  PyObject *__pyx_v_j = NULL;
-  ograd *__pyx_v_og;
-  int __pyx_v_key;
-  PyObject *__pyx_v_val = NULL;
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_39grad_obj(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_grad_obj(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, int __pyx_skip_dispatch, struct __pyx_opt_args_3nlp_5model_3src_10_amplmodel_4ampl_grad_obj *__pyx_optional_args) {
+  int __pyx_v_obj_num = ((int)0);
+  PyArrayObject *__pyx_v_g = 0;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_g;
+  __Pyx_Buffer __pyx_pybuffer_g;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_x;
   __Pyx_Buffer __pyx_pybuffer_x;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  ograd *__pyx_t_4;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  Py_ssize_t __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  PyArrayObject *__pyx_t_9 = NULL;
+  int __pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyArrayObject *__pyx_t_14 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("eval_sgrad", 0);
+  __Pyx_RefNannySetupContext("grad_obj", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_obj_num = __pyx_optional_args->obj_num;
+    }
+  }
+  __Pyx_INCREF((PyObject *)__pyx_v_x);
+  __pyx_pybuffer_g.pybuffer.buf = NULL;
+  __pyx_pybuffer_g.refcount = 0;
+  __pyx_pybuffernd_g.data = NULL;
+  __pyx_pybuffernd_g.rcbuffer = &__pyx_pybuffer_g;
   __pyx_pybuffer_x.pybuffer.buf = NULL;
   __pyx_pybuffer_x.refcount = 0;
   __pyx_pybuffernd_x.data = NULL;
   __pyx_pybuffernd_x.rcbuffer = &__pyx_pybuffer_x;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 311; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 345; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
-
-  /* "nlp/model/src/_amplmodel.pyx":314
- *         """Evaluate linear-part of the objective gradient at x.  A
- *         sparse gradient is returned as a dictionary."""
- *         grad_f = self.grad_obj(x)             # <<<<<<<<<<<<<<
- *         sg = {} ; j = 0
- *         cdef ograd* og = self.asl.i.Ograd_[0]
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self->__pyx_vtab)->grad_obj(__pyx_v_self, ((PyArrayObject *)__pyx_v_x), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_grad_f = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "nlp/model/src/_amplmodel.pyx":315
- *         sparse gradient is returned as a dictionary."""
- *         grad_f = self.grad_obj(x)
- *         sg = {} ; j = 0             # <<<<<<<<<<<<<<
- *         cdef ograd* og = self.asl.i.Ograd_[0]
- *         while og is not NULL:
- */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_sg = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
-  __Pyx_INCREF(__pyx_int_0);
-  __pyx_v_j = __pyx_int_0;
-
-  /* "nlp/model/src/_amplmodel.pyx":316
- *         grad_f = self.grad_obj(x)
- *         sg = {} ; j = 0
- *         cdef ograd* og = self.asl.i.Ograd_[0]             # <<<<<<<<<<<<<<
- *         while og is not NULL:
- *             key = og.varno
- */
-  __pyx_v_og = (__pyx_v_self->asl->i.Ograd_[0]);
-
-  /* "nlp/model/src/_amplmodel.pyx":317
- *         sg = {} ; j = 0
- *         cdef ograd* og = self.asl.i.Ograd_[0]
- *         while og is not NULL:             # <<<<<<<<<<<<<<
- *             key = og.varno
- *             val = grad_f[j]
- */
-  while (1) {
-    __pyx_t_2 = ((__pyx_v_og != NULL) != 0);
-    if (!__pyx_t_2) break;
-
-    /* "nlp/model/src/_amplmodel.pyx":318
- *         cdef ograd* og = self.asl.i.Ograd_[0]
- *         while og is not NULL:
- *             key = og.varno             # <<<<<<<<<<<<<<
- *             val = grad_f[j]
- *             sg[key] = val
- */
-    __pyx_t_3 = __pyx_v_og->varno;
-    __pyx_v_key = __pyx_t_3;
-
-    /* "nlp/model/src/_amplmodel.pyx":319
- *         while og is not NULL:
- *             key = og.varno
- *             val = grad_f[j]             # <<<<<<<<<<<<<<
- *             sg[key] = val
- *             og = og.next
- */
-    __pyx_t_1 = PyObject_GetItem(__pyx_v_grad_f, __pyx_v_j); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_XDECREF_SET(__pyx_v_val, __pyx_t_1);
-    __pyx_t_1 = 0;
-
-    /* "nlp/model/src/_amplmodel.pyx":320
- *             key = og.varno
- *             val = grad_f[j]
- *             sg[key] = val             # <<<<<<<<<<<<<<
- *             og = og.next
- *             j += 1
- */
-    __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_key); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_grad_obj); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 345; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    if (unlikely(PyDict_SetItem(__pyx_v_sg, __pyx_t_1, __pyx_v_val) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_39grad_obj)) {
+      __Pyx_XDECREF(__pyx_r);
+      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_obj_num); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 345; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_1);
+      __pyx_t_4 = __pyx_t_1; __pyx_t_5 = NULL;
+      __pyx_t_6 = 0;
+      if (CYTHON_COMPILING_IN_CPYTHON && unlikely(PyMethod_Check(__pyx_t_4))) {
+        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+        if (likely(__pyx_t_5)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+          __Pyx_INCREF(__pyx_t_5);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_4, function);
+          __pyx_t_6 = 1;
+        }
+      }
+      __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 345; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_7);
+      if (__pyx_t_5) {
+        __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
+      }
+      __Pyx_INCREF(((PyObject *)__pyx_v_x));
+      __Pyx_GIVEREF(((PyObject *)__pyx_v_x));
+      PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, ((PyObject *)__pyx_v_x));
+      __Pyx_GIVEREF(__pyx_t_3);
+      PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_3);
+      __pyx_t_3 = 0;
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 345; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_r = __pyx_t_2;
+      __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      goto __pyx_L0;
+    }
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
 
-    /* "nlp/model/src/_amplmodel.pyx":321
- *             val = grad_f[j]
- *             sg[key] = val
- *             og = og.next             # <<<<<<<<<<<<<<
- *             j += 1
- *         return sg
- */
-    __pyx_t_4 = __pyx_v_og->next;
-    __pyx_v_og = __pyx_t_4;
-
-    /* "nlp/model/src/_amplmodel.pyx":322
- *             sg[key] = val
- *             og = og.next
- *             j += 1             # <<<<<<<<<<<<<<
- *         return sg
- * 
+  /* "nlp/model/src/_amplmodel.pyx":348
+ *         """Evaluate the gradient of the objective at x."""
+ *         # Ensure contiguous input.
+ *         if not PyArray_ISCARRAY(x): x = x.copy()             # <<<<<<<<<<<<<<
+ *         cdef ndarray[np.double_t] g = x.copy()
+ *         if ampl_objgrd(self.asl, obj_num, <double*>x.data, <double*>g.data):
  */
-    __pyx_t_1 = __Pyx_PyInt_AddObjC(__pyx_v_j, __pyx_int_1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_8 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
+  if (__pyx_t_8) {
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = NULL;
+    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    if (__pyx_t_4) {
+      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    } else {
+      __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
     __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF_SET(__pyx_v_j, __pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_9 = ((PyArrayObject *)__pyx_t_1);
+    {
+      __Pyx_BufFmt_StackElem __pyx_stack[1];
+      __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+      __pyx_t_10 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_t_9, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
+      if (unlikely(__pyx_t_10 < 0)) {
+        PyErr_Fetch(&__pyx_t_11, &__pyx_t_12, &__pyx_t_13);
+        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
+          Py_XDECREF(__pyx_t_11); Py_XDECREF(__pyx_t_12); Py_XDECREF(__pyx_t_13);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_11, __pyx_t_12, __pyx_t_13);
+        }
+      }
+      __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
+      if (unlikely(__pyx_t_10 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __pyx_t_9 = 0;
+    __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_1));
     __pyx_t_1 = 0;
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":323
- *             og = og.next
- *             j += 1
- *         return sg             # <<<<<<<<<<<<<<
- * 
- *     def eval_cost(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_sg);
-  __pyx_r = __pyx_v_sg;
-  goto __pyx_L0;
-
-  /* "nlp/model/src/_amplmodel.pyx":311
- *         return c
- * 
- *     def eval_sgrad(self, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
- *         """Evaluate linear-part of the objective gradient at x.  A
- *         sparse gradient is returned as a dictionary."""
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_sgrad", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  goto __pyx_L2;
-  __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
-  __pyx_L2:;
-  __Pyx_XDECREF(__pyx_v_grad_f);
-  __Pyx_XDECREF(__pyx_v_sg);
-  __Pyx_XDECREF(__pyx_v_j);
-  __Pyx_XDECREF(__pyx_v_val);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "nlp/model/src/_amplmodel.pyx":325
- *         return sg
- * 
- *     def eval_cost(self):             # <<<<<<<<<<<<<<
- *         """Evaluate sparse linear-cost vector."""
- *         sg = {}
- */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_33eval_cost(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_32eval_cost[] = "Evaluate sparse linear-cost vector.";
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_33eval_cost(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("eval_cost (wrapper)", 0);
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_32eval_cost(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_32eval_cost(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self) {
-  PyObject *__pyx_v_sg = NULL;
-  ograd *__pyx_v_og;
-  int __pyx_v_key;
-  double __pyx_v_val;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  double __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  ograd *__pyx_t_6;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("eval_cost", 0);
-
-  /* "nlp/model/src/_amplmodel.pyx":327
- *     def eval_cost(self):
- *         """Evaluate sparse linear-cost vector."""
- *         sg = {}             # <<<<<<<<<<<<<<
- *         cdef ograd* og = self.asl.i.Ograd_[0]
- *         while og is not NULL:
+  /* "nlp/model/src/_amplmodel.pyx":349
+ *         # Ensure contiguous input.
+ *         if not PyArray_ISCARRAY(x): x = x.copy()
+ *         cdef ndarray[np.double_t] g = x.copy()             # <<<<<<<<<<<<<<
+ *         if ampl_objgrd(self.asl, obj_num, <double*>x.data, <double*>g.data):
+ *             raise ValueError
  */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 327; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 349; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = NULL;
+  if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  if (__pyx_t_4) {
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 349; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  } else {
+    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 349; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_sg = ((PyObject*)__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 349; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_14 = ((PyArrayObject *)__pyx_t_1);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_g.rcbuffer->pybuffer, (PyObject*)__pyx_t_14, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_g = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_g.rcbuffer->pybuffer.buf = NULL;
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 349; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    } else {__pyx_pybuffernd_g.diminfo[0].strides = __pyx_pybuffernd_g.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_g.diminfo[0].shape = __pyx_pybuffernd_g.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_14 = 0;
+  __pyx_v_g = ((PyArrayObject *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":328
- *         """Evaluate sparse linear-cost vector."""
- *         sg = {}
- *         cdef ograd* og = self.asl.i.Ograd_[0]             # <<<<<<<<<<<<<<
- *         while og is not NULL:
- *             key = og.varno
- */
-  __pyx_v_og = (__pyx_v_self->asl->i.Ograd_[0]);
-
-  /* "nlp/model/src/_amplmodel.pyx":329
- *         sg = {}
- *         cdef ograd* og = self.asl.i.Ograd_[0]
- *         while og is not NULL:             # <<<<<<<<<<<<<<
- *             key = og.varno
- *             val = og.coef
- */
-  while (1) {
-    __pyx_t_2 = ((__pyx_v_og != NULL) != 0);
-    if (!__pyx_t_2) break;
-
-    /* "nlp/model/src/_amplmodel.pyx":330
- *         cdef ograd* og = self.asl.i.Ograd_[0]
- *         while og is not NULL:
- *             key = og.varno             # <<<<<<<<<<<<<<
- *             val = og.coef
- *             sg[key] = val
- */
-    __pyx_t_3 = __pyx_v_og->varno;
-    __pyx_v_key = __pyx_t_3;
-
-    /* "nlp/model/src/_amplmodel.pyx":331
- *         while og is not NULL:
- *             key = og.varno
- *             val = og.coef             # <<<<<<<<<<<<<<
- *             sg[key] = val
- *             og = og.next
+  /* "nlp/model/src/_amplmodel.pyx":350
+ *         if not PyArray_ISCARRAY(x): x = x.copy()
+ *         cdef ndarray[np.double_t] g = x.copy()
+ *         if ampl_objgrd(self.asl, obj_num, <double*>x.data, <double*>g.data):             # <<<<<<<<<<<<<<
+ *             raise ValueError
+ *         return g
  */
-    __pyx_t_4 = __pyx_v_og->coef;
-    __pyx_v_val = __pyx_t_4;
+  __pyx_t_8 = (ampl_objgrd(__pyx_v_self->asl, __pyx_v_obj_num, ((double *)__pyx_v_x->data), ((double *)__pyx_v_g->data)) != 0);
+  if (__pyx_t_8) {
 
-    /* "nlp/model/src/_amplmodel.pyx":332
- *             key = og.varno
- *             val = og.coef
- *             sg[key] = val             # <<<<<<<<<<<<<<
- *             og = og.next
- *         return sg
+    /* "nlp/model/src/_amplmodel.pyx":351
+ *         cdef ndarray[np.double_t] g = x.copy()
+ *         if ampl_objgrd(self.asl, obj_num, <double*>x.data, <double*>g.data):
+ *             raise ValueError             # <<<<<<<<<<<<<<
+ *         return g
+ * 
  */
-    __pyx_t_1 = PyFloat_FromDouble(__pyx_v_val); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_key); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    if (unlikely(PyDict_SetItem(__pyx_v_sg, __pyx_t_5, __pyx_t_1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 351; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-    /* "nlp/model/src/_amplmodel.pyx":333
- *             val = og.coef
- *             sg[key] = val
- *             og = og.next             # <<<<<<<<<<<<<<
- *         return sg
- * 
+    /* "nlp/model/src/_amplmodel.pyx":350
+ *         if not PyArray_ISCARRAY(x): x = x.copy()
+ *         cdef ndarray[np.double_t] g = x.copy()
+ *         if ampl_objgrd(self.asl, obj_num, <double*>x.data, <double*>g.data):             # <<<<<<<<<<<<<<
+ *             raise ValueError
+ *         return g
  */
-    __pyx_t_6 = __pyx_v_og->next;
-    __pyx_v_og = __pyx_t_6;
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":334
- *             sg[key] = val
- *             og = og.next
- *         return sg             # <<<<<<<<<<<<<<
+  /* "nlp/model/src/_amplmodel.pyx":352
+ *         if ampl_objgrd(self.asl, obj_num, <double*>x.data, <double*>g.data):
+ *             raise ValueError
+ *         return g             # <<<<<<<<<<<<<<
  * 
- *     def eval_ci(self, int i, ndarray[np.double_t] x):
+ *     def grad_objs(self, ndarray[np.double_t] x):
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_sg);
-  __pyx_r = __pyx_v_sg;
+  __Pyx_INCREF(((PyObject *)__pyx_v_g));
+  __pyx_r = ((PyObject *)__pyx_v_g);
   goto __pyx_L0;
 
-  /* "nlp/model/src/_amplmodel.pyx":325
- *         return sg
+  /* "nlp/model/src/_amplmodel.pyx":345
+ *         return f
  * 
- *     def eval_cost(self):             # <<<<<<<<<<<<<<
- *         """Evaluate sparse linear-cost vector."""
- *         sg = {}
+ *     cpdef grad_obj(self, ndarray[np.double_t] x, int obj_num=0):             # <<<<<<<<<<<<<<
+ *         """Evaluate the gradient of the objective at x."""
+ *         # Ensure contiguous input.
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_cost", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
+  __Pyx_XDECREF(__pyx_t_7);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_g.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.grad_obj", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  goto __pyx_L2;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_sg);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_g.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_g);
+  __Pyx_XDECREF((PyObject *)__pyx_v_x);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":336
- *         return sg
- * 
- *     def eval_ci(self, int i, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
- *         """Evaluate ith constraint."""
- *         cdef double ci = 0.0
- */
-
 /* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_35eval_ci(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_34eval_ci[] = "Evaluate ith constraint.";
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_35eval_ci(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_v_i;
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_39grad_obj(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_38grad_obj[] = "Evaluate the gradient of the objective at x.";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_39grad_obj(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyArrayObject *__pyx_v_x = 0;
+  int __pyx_v_obj_num;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("eval_ci (wrapper)", 0);
+  __Pyx_RefNannySetupContext("grad_obj (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_i,&__pyx_n_s_x,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_x,&__pyx_n_s_obj_num,0};
     PyObject* values[2] = {0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
@@ -4279,36 +4647,42 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_35eval_ci(PyObject
       kw_args = PyDict_Size(__pyx_kwds);
       switch (pos_args) {
         case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_i)) != 0)) kw_args--;
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
         else goto __pyx_L5_argtuple_error;
         case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("eval_ci", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_obj_num);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "eval_ci") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "grad_obj") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 345; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-      goto __pyx_L5_argtuple_error;
     } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_x = ((PyArrayObject *)values[0]);
+    if (values[1]) {
+      __pyx_v_obj_num = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_obj_num == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 345; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_obj_num = ((int)0);
     }
-    __pyx_v_i = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_i == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_x = ((PyArrayObject *)values[1]);
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("eval_ci", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("grad_obj", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 345; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_ci", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.grad_obj", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_34eval_ci(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_i, __pyx_v_x);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 345; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_38grad_obj(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_x, __pyx_v_obj_num);
 
   /* function exit code */
   goto __pyx_L0;
@@ -4319,304 +4693,340 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_35eval_ci(PyObject
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_34eval_ci(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_v_i, PyArrayObject *__pyx_v_x) {
-  double __pyx_v_ci;
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_38grad_obj(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, int __pyx_v_obj_num) {
   __Pyx_LocalBuf_ND __pyx_pybuffernd_x;
   __Pyx_Buffer __pyx_pybuffer_x;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  int __pyx_t_2;
+  PyObject *__pyx_t_1 = NULL;
+  struct __pyx_opt_args_3nlp_5model_3src_10_amplmodel_4ampl_grad_obj __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("grad_obj", 0);
+  __pyx_pybuffer_x.pybuffer.buf = NULL;
+  __pyx_pybuffer_x.refcount = 0;
+  __pyx_pybuffernd_x.data = NULL;
+  __pyx_pybuffernd_x.rcbuffer = &__pyx_pybuffer_x;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 345; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2.__pyx_n = 1;
+  __pyx_t_2.obj_num = __pyx_v_obj_num;
+  __pyx_t_1 = __pyx_vtabptr_3nlp_5model_3src_10_amplmodel_ampl->grad_obj(__pyx_v_self, __pyx_v_x, 1, &__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 345; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.grad_obj", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nlp/model/src/_amplmodel.pyx":354
+ *         return g
+ * 
+ *     def grad_objs(self, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
+ *         """Evaluate the gradients of all objectives at x.
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_41grad_objs(PyObject *__pyx_v_self, PyObject *__pyx_v_x); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_40grad_objs[] = "Evaluate the gradients of all objectives at x.\n\n        Gradients are stored in the rows of the returned array.";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_41grad_objs(PyObject *__pyx_v_self, PyObject *__pyx_v_x) {
+  CYTHON_UNUSED int __pyx_lineno = 0;
+  CYTHON_UNUSED const char *__pyx_filename = NULL;
+  CYTHON_UNUSED int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("grad_objs (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_40grad_objs(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), ((PyArrayObject *)__pyx_v_x));
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_40grad_objs(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x) {
+  int __pyx_v_i;
+  PyArrayObject *__pyx_v_G = 0;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_G;
+  __Pyx_Buffer __pyx_pybuffer_G;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_x;
+  __Pyx_Buffer __pyx_pybuffer_x;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
   PyArrayObject *__pyx_t_6 = NULL;
   int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
   PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  int __pyx_t_13;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("eval_ci", 0);
+  __Pyx_RefNannySetupContext("grad_objs", 0);
   __Pyx_INCREF((PyObject *)__pyx_v_x);
+  __pyx_pybuffer_G.pybuffer.buf = NULL;
+  __pyx_pybuffer_G.refcount = 0;
+  __pyx_pybuffernd_G.data = NULL;
+  __pyx_pybuffernd_G.rcbuffer = &__pyx_pybuffer_G;
   __pyx_pybuffer_x.pybuffer.buf = NULL;
   __pyx_pybuffer_x.refcount = 0;
   __pyx_pybuffernd_x.data = NULL;
   __pyx_pybuffernd_x.rcbuffer = &__pyx_pybuffer_x;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
 
-  /* "nlp/model/src/_amplmodel.pyx":338
- *     def eval_ci(self, int i, ndarray[np.double_t] x):
- *         """Evaluate ith constraint."""
- *         cdef double ci = 0.0             # <<<<<<<<<<<<<<
- *         if i < 0 or i >= self.n_con:
- *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
- */
-  __pyx_v_ci = 0.0;
-
-  /* "nlp/model/src/_amplmodel.pyx":339
- *         """Evaluate ith constraint."""
- *         cdef double ci = 0.0
- *         if i < 0 or i >= self.n_con:             # <<<<<<<<<<<<<<
- *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
- *                              (i, self.n_con))
- */
-  __pyx_t_2 = ((__pyx_v_i < 0) != 0);
-  if (!__pyx_t_2) {
-  } else {
-    __pyx_t_1 = __pyx_t_2;
-    goto __pyx_L4_bool_binop_done;
-  }
-  __pyx_t_2 = ((__pyx_v_i >= __pyx_v_self->n_con) != 0);
-  __pyx_t_1 = __pyx_t_2;
-  __pyx_L4_bool_binop_done:;
-  if (__pyx_t_1) {
-
-    /* "nlp/model/src/_amplmodel.pyx":341
- *         if i < 0 or i >= self.n_con:
- *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
- *                              (i, self.n_con))             # <<<<<<<<<<<<<<
+  /* "nlp/model/src/_amplmodel.pyx":361
+ *             int i
+ *             ndarray[np.double_t, ndim=2] G = \
+ *                 np.empty((self.n_obj, self.n_var), dtype=np.double)             # <<<<<<<<<<<<<<
  * 
  *         # Ensure contiguous input.
  */
-    __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->n_con); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_GIVEREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
-    __Pyx_GIVEREF(__pyx_t_4);
-    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_4);
-    __pyx_t_3 = 0;
-    __pyx_t_4 = 0;
-
-    /* "nlp/model/src/_amplmodel.pyx":340
- *         cdef double ci = 0.0
- *         if i < 0 or i >= self.n_con:
- *             raise ValueError('Got i = %d; exected 0 <= i < %d' %             # <<<<<<<<<<<<<<
- *                              (i, self.n_con))
- * 
- */
-    __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_Got_i_d_exected_0_i_d, __pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_GIVEREF(__pyx_t_4);
-    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
-    __pyx_t_4 = 0;
-    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-    /* "nlp/model/src/_amplmodel.pyx":339
- *         """Evaluate ith constraint."""
- *         cdef double ci = 0.0
- *         if i < 0 or i >= self.n_con:             # <<<<<<<<<<<<<<
- *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
- *                              (i, self.n_con))
- */
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->n_obj); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_self->n_var); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_3);
+  __pyx_t_1 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_double); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = ((PyArrayObject *)__pyx_t_5);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_G.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {
+      __pyx_v_G = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_G.rcbuffer->pybuffer.buf = NULL;
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    } else {__pyx_pybuffernd_G.diminfo[0].strides = __pyx_pybuffernd_G.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_G.diminfo[0].shape = __pyx_pybuffernd_G.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_G.diminfo[1].strides = __pyx_pybuffernd_G.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_G.diminfo[1].shape = __pyx_pybuffernd_G.rcbuffer->pybuffer.shape[1];
+    }
   }
+  __pyx_t_6 = 0;
+  __pyx_v_G = ((PyArrayObject *)__pyx_t_5);
+  __pyx_t_5 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":344
+  /* "nlp/model/src/_amplmodel.pyx":364
  * 
  *         # Ensure contiguous input.
  *         if not PyArray_ISCARRAY(x): x = x.copy()             # <<<<<<<<<<<<<<
  * 
- *         if ampl_conival(self.asl, i, <double*>x.data, &ci):
+ *         for i in range(self.n_obj):
  */
-  __pyx_t_1 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
-  if (__pyx_t_1) {
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_7 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
+  if (__pyx_t_7) {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 364; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_3 = NULL;
-    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_5))) {
-      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_5);
+    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
       if (likely(__pyx_t_3)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
         __Pyx_INCREF(__pyx_t_3);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_5, function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
       }
     }
     if (__pyx_t_3) {
-      __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 364; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     } else {
-      __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_5 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 364; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_6 = ((PyArrayObject *)__pyx_t_4);
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 364; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_8 = ((PyArrayObject *)__pyx_t_5);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
       __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
-      __pyx_t_7 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
-      if (unlikely(__pyx_t_7 < 0)) {
-        PyErr_Fetch(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
+      __pyx_t_9 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
+      if (unlikely(__pyx_t_9 < 0)) {
+        PyErr_Fetch(&__pyx_t_10, &__pyx_t_11, &__pyx_t_12);
         if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
-          Py_XDECREF(__pyx_t_8); Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_10);
+          Py_XDECREF(__pyx_t_10); Py_XDECREF(__pyx_t_11); Py_XDECREF(__pyx_t_12);
           __Pyx_RaiseBufferFallbackError();
         } else {
-          PyErr_Restore(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+          PyErr_Restore(__pyx_t_10, __pyx_t_11, __pyx_t_12);
         }
       }
       __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (unlikely(__pyx_t_9 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 364; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
-    __pyx_t_6 = 0;
-    __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_4));
-    __pyx_t_4 = 0;
+    __pyx_t_8 = 0;
+    __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_5));
+    __pyx_t_5 = 0;
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":346
+  /* "nlp/model/src/_amplmodel.pyx":366
  *         if not PyArray_ISCARRAY(x): x = x.copy()
  * 
- *         if ampl_conival(self.asl, i, <double*>x.data, &ci):             # <<<<<<<<<<<<<<
- *             raise ValueError
- *         return ci
+ *         for i in range(self.n_obj):             # <<<<<<<<<<<<<<
+ *             if ampl_objgrd(self.asl, i, <double*>x.data,
+ *                            <double*>G.data + i * self.n_var):
  */
-  __pyx_t_1 = (ampl_conival(__pyx_v_self->asl, __pyx_v_i, ((double *)__pyx_v_x->data), (&__pyx_v_ci)) != 0);
-  if (__pyx_t_1) {
+  __pyx_t_9 = __pyx_v_self->n_obj;
+  for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_9; __pyx_t_13+=1) {
+    __pyx_v_i = __pyx_t_13;
 
-    /* "nlp/model/src/_amplmodel.pyx":347
+    /* "nlp/model/src/_amplmodel.pyx":367
  * 
- *         if ampl_conival(self.asl, i, <double*>x.data, &ci):
- *             raise ValueError             # <<<<<<<<<<<<<<
- *         return ci
+ *         for i in range(self.n_obj):
+ *             if ampl_objgrd(self.asl, i, <double*>x.data,             # <<<<<<<<<<<<<<
+ *                            <double*>G.data + i * self.n_var):
+ *                 raise ValueError
+ */
+    __pyx_t_7 = (ampl_objgrd(__pyx_v_self->asl, __pyx_v_i, ((double *)__pyx_v_x->data), (((double *)__pyx_v_G->data) + (__pyx_v_i * __pyx_v_self->n_var))) != 0);
+    if (__pyx_t_7) {
+
+      /* "nlp/model/src/_amplmodel.pyx":369
+ *             if ampl_objgrd(self.asl, i, <double*>x.data,
+ *                            <double*>G.data + i * self.n_var):
+ *                 raise ValueError             # <<<<<<<<<<<<<<
+ *         return G
  * 
  */
-    __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 347; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-    /* "nlp/model/src/_amplmodel.pyx":346
- *         if not PyArray_ISCARRAY(x): x = x.copy()
+      /* "nlp/model/src/_amplmodel.pyx":367
  * 
- *         if ampl_conival(self.asl, i, <double*>x.data, &ci):             # <<<<<<<<<<<<<<
- *             raise ValueError
- *         return ci
+ *         for i in range(self.n_obj):
+ *             if ampl_objgrd(self.asl, i, <double*>x.data,             # <<<<<<<<<<<<<<
+ *                            <double*>G.data + i * self.n_var):
+ *                 raise ValueError
  */
+    }
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":348
- *         if ampl_conival(self.asl, i, <double*>x.data, &ci):
- *             raise ValueError
- *         return ci             # <<<<<<<<<<<<<<
+  /* "nlp/model/src/_amplmodel.pyx":370
+ *                            <double*>G.data + i * self.n_var):
+ *                 raise ValueError
+ *         return G             # <<<<<<<<<<<<<<
  * 
- *     def eval_gi(self, int i, ndarray[np.double_t] x):
+ *     def eval_cons(self, ndarray[np.double_t] x):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_ci); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_r = __pyx_t_4;
-  __pyx_t_4 = 0;
+  __Pyx_INCREF(((PyObject *)__pyx_v_G));
+  __pyx_r = ((PyObject *)__pyx_v_G);
   goto __pyx_L0;
 
-  /* "nlp/model/src/_amplmodel.pyx":336
- *         return sg
+  /* "nlp/model/src/_amplmodel.pyx":354
+ *         return g
+ * 
+ *     def grad_objs(self, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
+ *         """Evaluate the gradients of all objectives at x.
  * 
- *     def eval_ci(self, int i, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
- *         """Evaluate ith constraint."""
- *         cdef double ci = 0.0
  */
 
   /* function exit code */
   __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
   { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
     __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_G.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
   __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_ci", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.grad_objs", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   goto __pyx_L2;
   __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_G.rcbuffer->pybuffer);
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
   __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_G);
   __Pyx_XDECREF((PyObject *)__pyx_v_x);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":350
- *         return ci
+/* "nlp/model/src/_amplmodel.pyx":372
+ *         return G
  * 
- *     def eval_gi(self, int i, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
- *         """Evaluate the ith constraint gradient at x."""
- *         if i < 0 or i >= self.n_con:
+ *     def eval_cons(self, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
+ *         """Evaluate the constraints at x."""
+ *         cdef ndarray[np.double_t] \
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_37eval_gi(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_36eval_gi[] = "Evaluate the ith constraint gradient at x.";
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_37eval_gi(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_v_i;
-  PyArrayObject *__pyx_v_x = 0;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_43eval_cons(PyObject *__pyx_v_self, PyObject *__pyx_v_x); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_42eval_cons[] = "Evaluate the constraints at x.";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_43eval_cons(PyObject *__pyx_v_self, PyObject *__pyx_v_x) {
+  CYTHON_UNUSED int __pyx_lineno = 0;
+  CYTHON_UNUSED const char *__pyx_filename = NULL;
+  CYTHON_UNUSED int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("eval_gi (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_i,&__pyx_n_s_x,0};
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_i)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("eval_gi", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 350; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "eval_gi") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 350; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-    }
-    __pyx_v_i = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_i == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 350; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_x = ((PyArrayObject *)values[1]);
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("eval_gi", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 350; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_gi", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 350; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_36eval_gi(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_i, __pyx_v_x);
+  __Pyx_RefNannySetupContext("eval_cons (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 372; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_42eval_cons(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), ((PyArrayObject *)__pyx_v_x));
 
   /* function exit code */
   goto __pyx_L0;
@@ -4627,354 +5037,239 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_37eval_gi(PyObject
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_36eval_gi(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_v_i, PyArrayObject *__pyx_v_x) {
-  PyArrayObject *__pyx_v_gi = 0;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_gi;
-  __Pyx_Buffer __pyx_pybuffer_gi;
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_42eval_cons(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x) {
+  PyArrayObject *__pyx_v_c = 0;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_c;
+  __Pyx_Buffer __pyx_pybuffer_c;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_x;
   __Pyx_Buffer __pyx_pybuffer_x;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  int __pyx_t_2;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
   PyArrayObject *__pyx_t_6 = NULL;
   int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
   PyObject *__pyx_t_10 = NULL;
   PyObject *__pyx_t_11 = NULL;
   PyObject *__pyx_t_12 = NULL;
-  PyArrayObject *__pyx_t_13 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("eval_gi", 0);
+  __Pyx_RefNannySetupContext("eval_cons", 0);
   __Pyx_INCREF((PyObject *)__pyx_v_x);
-  __pyx_pybuffer_gi.pybuffer.buf = NULL;
-  __pyx_pybuffer_gi.refcount = 0;
-  __pyx_pybuffernd_gi.data = NULL;
-  __pyx_pybuffernd_gi.rcbuffer = &__pyx_pybuffer_gi;
+  __pyx_pybuffer_c.pybuffer.buf = NULL;
+  __pyx_pybuffer_c.refcount = 0;
+  __pyx_pybuffernd_c.data = NULL;
+  __pyx_pybuffernd_c.rcbuffer = &__pyx_pybuffer_c;
   __pyx_pybuffer_x.pybuffer.buf = NULL;
   __pyx_pybuffer_x.refcount = 0;
   __pyx_pybuffernd_x.data = NULL;
   __pyx_pybuffernd_x.rcbuffer = &__pyx_pybuffer_x;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 350; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 372; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
 
-  /* "nlp/model/src/_amplmodel.pyx":352
- *     def eval_gi(self, int i, ndarray[np.double_t] x):
- *         """Evaluate the ith constraint gradient at x."""
- *         if i < 0 or i >= self.n_con:             # <<<<<<<<<<<<<<
- *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
- *                              (i, self.n_con))
- */
-  __pyx_t_2 = ((__pyx_v_i < 0) != 0);
-  if (!__pyx_t_2) {
-  } else {
-    __pyx_t_1 = __pyx_t_2;
-    goto __pyx_L4_bool_binop_done;
-  }
-  __pyx_t_2 = ((__pyx_v_i >= __pyx_v_self->n_con) != 0);
-  __pyx_t_1 = __pyx_t_2;
-  __pyx_L4_bool_binop_done:;
-  if (__pyx_t_1) {
-
-    /* "nlp/model/src/_amplmodel.pyx":354
- *         if i < 0 or i >= self.n_con:
- *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
- *                              (i, self.n_con))             # <<<<<<<<<<<<<<
+  /* "nlp/model/src/_amplmodel.pyx":375
+ *         """Evaluate the constraints at x."""
+ *         cdef ndarray[np.double_t] \
+ *              c = np.empty(self.n_con, dtype=np.double)             # <<<<<<<<<<<<<<
  * 
  *         # Ensure contiguous input.
  */
-    __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->n_con); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_GIVEREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
-    __Pyx_GIVEREF(__pyx_t_4);
-    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_4);
-    __pyx_t_3 = 0;
-    __pyx_t_4 = 0;
-
-    /* "nlp/model/src/_amplmodel.pyx":353
- *         """Evaluate the ith constraint gradient at x."""
- *         if i < 0 or i >= self.n_con:
- *             raise ValueError('Got i = %d; exected 0 <= i < %d' %             # <<<<<<<<<<<<<<
- *                              (i, self.n_con))
- * 
- */
-    __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_Got_i_d_exected_0_i_d, __pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 353; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 353; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_GIVEREF(__pyx_t_4);
-    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
-    __pyx_t_4 = 0;
-    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 353; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 353; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-    /* "nlp/model/src/_amplmodel.pyx":352
- *     def eval_gi(self, int i, ndarray[np.double_t] x):
- *         """Evaluate the ith constraint gradient at x."""
- *         if i < 0 or i >= self.n_con:             # <<<<<<<<<<<<<<
- *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
- *                              (i, self.n_con))
- */
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->n_con); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_double); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = ((PyArrayObject *)__pyx_t_5);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_c.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_c = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_c.rcbuffer->pybuffer.buf = NULL;
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    } else {__pyx_pybuffernd_c.diminfo[0].strides = __pyx_pybuffernd_c.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_c.diminfo[0].shape = __pyx_pybuffernd_c.rcbuffer->pybuffer.shape[0];
+    }
   }
+  __pyx_t_6 = 0;
+  __pyx_v_c = ((PyArrayObject *)__pyx_t_5);
+  __pyx_t_5 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":357
+  /* "nlp/model/src/_amplmodel.pyx":378
  * 
  *         # Ensure contiguous input.
  *         if not PyArray_ISCARRAY(x): x = x.copy()             # <<<<<<<<<<<<<<
  * 
- *         cdef ndarray[np.double_t] \
+ *         if ampl_conval(self.asl, <double*>x.data, <double*>c.data):
  */
-  __pyx_t_1 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
-  if (__pyx_t_1) {
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_7 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
+  if (__pyx_t_7) {
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 378; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
     __pyx_t_3 = NULL;
-    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_5))) {
-      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_5);
+    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_1);
       if (likely(__pyx_t_3)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
         __Pyx_INCREF(__pyx_t_3);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_5, function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
       }
     }
     if (__pyx_t_3) {
-      __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 378; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     } else {
-      __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_5 = __Pyx_PyObject_CallNoArg(__pyx_t_1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 378; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_6 = ((PyArrayObject *)__pyx_t_4);
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 378; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_8 = ((PyArrayObject *)__pyx_t_5);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
       __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
-      __pyx_t_7 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
-      if (unlikely(__pyx_t_7 < 0)) {
-        PyErr_Fetch(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
+      __pyx_t_9 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
+      if (unlikely(__pyx_t_9 < 0)) {
+        PyErr_Fetch(&__pyx_t_10, &__pyx_t_11, &__pyx_t_12);
         if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
-          Py_XDECREF(__pyx_t_8); Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_10);
+          Py_XDECREF(__pyx_t_10); Py_XDECREF(__pyx_t_11); Py_XDECREF(__pyx_t_12);
           __Pyx_RaiseBufferFallbackError();
         } else {
-          PyErr_Restore(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+          PyErr_Restore(__pyx_t_10, __pyx_t_11, __pyx_t_12);
         }
       }
       __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (unlikely(__pyx_t_9 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 378; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
-    __pyx_t_6 = 0;
-    __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_4));
-    __pyx_t_4 = 0;
+    __pyx_t_8 = 0;
+    __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_5));
+    __pyx_t_5 = 0;
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":360
+  /* "nlp/model/src/_amplmodel.pyx":380
+ *         if not PyArray_ISCARRAY(x): x = x.copy()
  * 
- *         cdef ndarray[np.double_t] \
- *              gi = np.empty(self.n_var, dtype=np.double)             # <<<<<<<<<<<<<<
- *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>gi.data):
+ *         if ampl_conval(self.asl, <double*>x.data, <double*>c.data):             # <<<<<<<<<<<<<<
  *             raise ValueError
+ *         return c
  */
-  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_empty); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->n_var); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
-  __pyx_t_4 = 0;
-  __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_11 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_11);
-  __pyx_t_12 = __Pyx_PyObject_GetAttrStr(__pyx_t_11, __pyx_n_s_double); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_12);
-  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_12) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-  __pyx_t_12 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_12);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (!(likely(((__pyx_t_12) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_12, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_13 = ((PyArrayObject *)__pyx_t_12);
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_gi.rcbuffer->pybuffer, (PyObject*)__pyx_t_13, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
-      __pyx_v_gi = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_gi.rcbuffer->pybuffer.buf = NULL;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 359; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    } else {__pyx_pybuffernd_gi.diminfo[0].strides = __pyx_pybuffernd_gi.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_gi.diminfo[0].shape = __pyx_pybuffernd_gi.rcbuffer->pybuffer.shape[0];
-    }
-  }
-  __pyx_t_13 = 0;
-  __pyx_v_gi = ((PyArrayObject *)__pyx_t_12);
-  __pyx_t_12 = 0;
+  __pyx_t_7 = (ampl_conval(__pyx_v_self->asl, ((double *)__pyx_v_x->data), ((double *)__pyx_v_c->data)) != 0);
+  if (__pyx_t_7) {
 
-  /* "nlp/model/src/_amplmodel.pyx":361
- *         cdef ndarray[np.double_t] \
- *              gi = np.empty(self.n_var, dtype=np.double)
- *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>gi.data):             # <<<<<<<<<<<<<<
- *             raise ValueError
- *         return gi
- */
-  __pyx_t_1 = (ampl_congrd(__pyx_v_self->asl, __pyx_v_i, ((double *)__pyx_v_x->data), ((double *)__pyx_v_gi->data)) != 0);
-  if (__pyx_t_1) {
-
-    /* "nlp/model/src/_amplmodel.pyx":362
- *              gi = np.empty(self.n_var, dtype=np.double)
- *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>gi.data):
+    /* "nlp/model/src/_amplmodel.pyx":381
+ * 
+ *         if ampl_conval(self.asl, <double*>x.data, <double*>c.data):
  *             raise ValueError             # <<<<<<<<<<<<<<
- *         return gi
+ *         return c
  * 
  */
     __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 362; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 381; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-    /* "nlp/model/src/_amplmodel.pyx":361
- *         cdef ndarray[np.double_t] \
- *              gi = np.empty(self.n_var, dtype=np.double)
- *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>gi.data):             # <<<<<<<<<<<<<<
+    /* "nlp/model/src/_amplmodel.pyx":380
+ *         if not PyArray_ISCARRAY(x): x = x.copy()
+ * 
+ *         if ampl_conval(self.asl, <double*>x.data, <double*>c.data):             # <<<<<<<<<<<<<<
  *             raise ValueError
- *         return gi
+ *         return c
  */
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":363
- *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>gi.data):
+  /* "nlp/model/src/_amplmodel.pyx":382
+ *         if ampl_conval(self.asl, <double*>x.data, <double*>c.data):
  *             raise ValueError
- *         return gi             # <<<<<<<<<<<<<<
+ *         return c             # <<<<<<<<<<<<<<
  * 
- *     def eval_sgi(self, int i, ndarray[np.double_t] x):
+ *     def eval_sgrad(self, ndarray[np.double_t] x):
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((PyObject *)__pyx_v_gi));
-  __pyx_r = ((PyObject *)__pyx_v_gi);
+  __Pyx_INCREF(((PyObject *)__pyx_v_c));
+  __pyx_r = ((PyObject *)__pyx_v_c);
   goto __pyx_L0;
 
-  /* "nlp/model/src/_amplmodel.pyx":350
- *         return ci
+  /* "nlp/model/src/_amplmodel.pyx":372
+ *         return G
  * 
- *     def eval_gi(self, int i, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
- *         """Evaluate the ith constraint gradient at x."""
- *         if i < 0 or i >= self.n_con:
+ *     def eval_cons(self, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
+ *         """Evaluate the constraints at x."""
+ *         cdef ndarray[np.double_t] \
  */
 
   /* function exit code */
   __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_11);
-  __Pyx_XDECREF(__pyx_t_12);
   { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
     __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_gi.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_c.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
   __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_gi", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_cons", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   goto __pyx_L2;
   __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_gi.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_c.rcbuffer->pybuffer);
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
   __pyx_L2:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_gi);
+  __Pyx_XDECREF((PyObject *)__pyx_v_c);
   __Pyx_XDECREF((PyObject *)__pyx_v_x);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":365
- *         return gi
- * 
- *     def eval_sgi(self, int i, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
- *         """Evalute the ith constraint sparse gradient at x."""
+/* "nlp/model/src/_amplmodel.pyx":384
+ *         return c
  * 
+ *     def eval_sgrad(self, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
+ *         """Evaluate linear-part of the objective gradient at x.  A
+ *         sparse gradient is returned as a tuple (indices, values)."""
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_39eval_sgi(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_38eval_sgi[] = "Evalute the ith constraint sparse gradient at x.";
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_39eval_sgi(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_v_i;
-  PyArrayObject *__pyx_v_x = 0;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_45eval_sgrad(PyObject *__pyx_v_self, PyObject *__pyx_v_x); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_44eval_sgrad[] = "Evaluate linear-part of the objective gradient at x.  A\n        sparse gradient is returned as a tuple (indices, values).";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_45eval_sgrad(PyObject *__pyx_v_self, PyObject *__pyx_v_x) {
+  CYTHON_UNUSED int __pyx_lineno = 0;
+  CYTHON_UNUSED const char *__pyx_filename = NULL;
+  CYTHON_UNUSED int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("eval_sgi (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_i,&__pyx_n_s_x,0};
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_i)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("eval_sgi", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 365; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "eval_sgi") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 365; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-    }
-    __pyx_v_i = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_i == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 365; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_x = ((PyArrayObject *)values[1]);
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("eval_sgi", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 365; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_sgi", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 365; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_38eval_sgi(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_i, __pyx_v_x);
+  __Pyx_RefNannySetupContext("eval_sgrad (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 384; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_44eval_sgrad(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), ((PyArrayObject *)__pyx_v_x));
 
   /* function exit code */
   goto __pyx_L0;
@@ -4985,701 +5280,720 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_39eval_sgi(PyObjec
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_38eval_sgi(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_v_i, PyArrayObject *__pyx_v_x) {
-  int __pyx_v_nzgi;
-  int __pyx_v_j;
-  cgrad *__pyx_v_cg;
-  int __pyx_v_congrd_mode_save;
-  PyArrayObject *__pyx_v_grad_ci = 0;
-  PyObject *__pyx_v_sgi = NULL;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_grad_ci;
-  __Pyx_Buffer __pyx_pybuffer_grad_ci;
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_44eval_sgrad(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x) {
+  ograd *__pyx_v_og;
+  int __pyx_v_k;
+  int __pyx_v_nzo;
+  PyArrayObject *__pyx_v_grad_f = 0;
+  PyArrayObject *__pyx_v_idx = 0;
+  PyArrayObject *__pyx_v_val = 0;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_grad_f;
+  __Pyx_Buffer __pyx_pybuffer_grad_f;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_idx;
+  __Pyx_Buffer __pyx_pybuffer_idx;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_val;
+  __Pyx_Buffer __pyx_pybuffer_val;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_x;
   __Pyx_Buffer __pyx_pybuffer_x;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  int __pyx_t_2;
+  PyObject *__pyx_t_1 = NULL;
+  PyArrayObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
-  PyArrayObject *__pyx_t_6 = NULL;
-  int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyArrayObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
   PyObject *__pyx_t_9 = NULL;
   PyObject *__pyx_t_10 = NULL;
-  cgrad *__pyx_t_11;
-  PyObject *__pyx_t_12 = NULL;
-  PyObject *__pyx_t_13 = NULL;
-  PyArrayObject *__pyx_t_14 = NULL;
-  Py_ssize_t __pyx_t_15;
+  PyObject *__pyx_t_11 = NULL;
+  PyArrayObject *__pyx_t_12 = NULL;
+  int __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  int __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  Py_ssize_t __pyx_t_17;
+  ograd *__pyx_t_18;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("eval_sgi", 0);
-  __Pyx_INCREF((PyObject *)__pyx_v_x);
-  __pyx_pybuffer_grad_ci.pybuffer.buf = NULL;
-  __pyx_pybuffer_grad_ci.refcount = 0;
-  __pyx_pybuffernd_grad_ci.data = NULL;
-  __pyx_pybuffernd_grad_ci.rcbuffer = &__pyx_pybuffer_grad_ci;
+  __Pyx_RefNannySetupContext("eval_sgrad", 0);
+  __pyx_pybuffer_grad_f.pybuffer.buf = NULL;
+  __pyx_pybuffer_grad_f.refcount = 0;
+  __pyx_pybuffernd_grad_f.data = NULL;
+  __pyx_pybuffernd_grad_f.rcbuffer = &__pyx_pybuffer_grad_f;
+  __pyx_pybuffer_idx.pybuffer.buf = NULL;
+  __pyx_pybuffer_idx.refcount = 0;
+  __pyx_pybuffernd_idx.data = NULL;
+  __pyx_pybuffernd_idx.rcbuffer = &__pyx_pybuffer_idx;
+  __pyx_pybuffer_val.pybuffer.buf = NULL;
+  __pyx_pybuffer_val.refcount = 0;
+  __pyx_pybuffernd_val.data = NULL;
+  __pyx_pybuffernd_val.rcbuffer = &__pyx_pybuffer_val;
   __pyx_pybuffer_x.pybuffer.buf = NULL;
   __pyx_pybuffer_x.refcount = 0;
   __pyx_pybuffernd_x.data = NULL;
   __pyx_pybuffernd_x.rcbuffer = &__pyx_pybuffer_x;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 365; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 384; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
 
-  /* "nlp/model/src/_amplmodel.pyx":372
- *             cgrad* cg
- * 
- *         if i < 0 or i >= self.n_con:             # <<<<<<<<<<<<<<
- *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
- *                              (i, self.n_con))
+  /* "nlp/model/src/_amplmodel.pyx":390
+ *             ograd* og
+ *             int k, nzo
+ *             ndarray[np.double_t] grad_f = self.grad_obj(x)             # <<<<<<<<<<<<<<
+ *             ndarray[np.int32_t] idx
+ *             ndarray[np.double_t] val
  */
-  __pyx_t_2 = ((__pyx_v_i < 0) != 0);
-  if (!__pyx_t_2) {
-  } else {
-    __pyx_t_1 = __pyx_t_2;
-    goto __pyx_L4_bool_binop_done;
+  __pyx_t_1 = ((struct __pyx_vtabstruct_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self->__pyx_vtab)->grad_obj(__pyx_v_self, ((PyArrayObject *)__pyx_v_x), 0, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 390; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 390; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = ((PyArrayObject *)__pyx_t_1);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_grad_f.rcbuffer->pybuffer, (PyObject*)__pyx_t_2, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_grad_f = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_grad_f.rcbuffer->pybuffer.buf = NULL;
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 390; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    } else {__pyx_pybuffernd_grad_f.diminfo[0].strides = __pyx_pybuffernd_grad_f.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_grad_f.diminfo[0].shape = __pyx_pybuffernd_grad_f.rcbuffer->pybuffer.shape[0];
+    }
   }
-  __pyx_t_2 = ((__pyx_v_i >= __pyx_v_self->n_con) != 0);
-  __pyx_t_1 = __pyx_t_2;
-  __pyx_L4_bool_binop_done:;
-  if (__pyx_t_1) {
-
-    /* "nlp/model/src/_amplmodel.pyx":374
- *         if i < 0 or i >= self.n_con:
- *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
- *                              (i, self.n_con))             # <<<<<<<<<<<<<<
- * 
- *         # Ensure contiguous input.
- */
-    __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->n_con); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 374; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_GIVEREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
-    __Pyx_GIVEREF(__pyx_t_4);
-    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_4);
-    __pyx_t_3 = 0;
-    __pyx_t_4 = 0;
+  __pyx_t_2 = 0;
+  __pyx_v_grad_f = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
 
-    /* "nlp/model/src/_amplmodel.pyx":373
- * 
- *         if i < 0 or i >= self.n_con:
- *             raise ValueError('Got i = %d; exected 0 <= i < %d' %             # <<<<<<<<<<<<<<
- *                              (i, self.n_con))
+  /* "nlp/model/src/_amplmodel.pyx":394
+ *             ndarray[np.double_t] val
  * 
+ *         nzo = ograd_len(self.asl.i.Ograd_[0])             # <<<<<<<<<<<<<<
+ *         idx = np.empty(nzo, dtype=np.int32)
+ *         val = np.empty(nzo, dtype=np.double)
  */
-    __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_Got_i_d_exected_0_i_d, __pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_GIVEREF(__pyx_t_4);
-    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
-    __pyx_t_4 = 0;
-    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_nzo = __pyx_f_3nlp_5model_3src_10_amplmodel_ograd_len((__pyx_v_self->asl->i.Ograd_[0]));
 
-    /* "nlp/model/src/_amplmodel.pyx":372
- *             cgrad* cg
+  /* "nlp/model/src/_amplmodel.pyx":395
  * 
- *         if i < 0 or i >= self.n_con:             # <<<<<<<<<<<<<<
- *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
- *                              (i, self.n_con))
+ *         nzo = ograd_len(self.asl.i.Ograd_[0])
+ *         idx = np.empty(nzo, dtype=np.int32)             # <<<<<<<<<<<<<<
+ *         val = np.empty(nzo, dtype=np.double)
+ *         og = self.asl.i.Ograd_[0]
  */
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 395; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 395; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_nzo); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 395; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 395; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 395; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 395; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 395; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 395; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, __pyx_t_1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 395; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 395; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = ((PyArrayObject *)__pyx_t_6);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_idx.rcbuffer->pybuffer);
+    __pyx_t_8 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_idx.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack);
+    if (unlikely(__pyx_t_8 < 0)) {
+      PyErr_Fetch(&__pyx_t_9, &__pyx_t_10, &__pyx_t_11);
+      if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_idx.rcbuffer->pybuffer, (PyObject*)__pyx_v_idx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+        Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_10); Py_XDECREF(__pyx_t_11);
+        __Pyx_RaiseBufferFallbackError();
+      } else {
+        PyErr_Restore(__pyx_t_9, __pyx_t_10, __pyx_t_11);
+      }
+    }
+    __pyx_pybuffernd_idx.diminfo[0].strides = __pyx_pybuffernd_idx.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_idx.diminfo[0].shape = __pyx_pybuffernd_idx.rcbuffer->pybuffer.shape[0];
+    if (unlikely(__pyx_t_8 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 395; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
+  __pyx_t_7 = 0;
+  __pyx_v_idx = ((PyArrayObject *)__pyx_t_6);
+  __pyx_t_6 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":377
- * 
- *         # Ensure contiguous input.
- *         if not PyArray_ISCARRAY(x): x = x.copy()             # <<<<<<<<<<<<<<
- * 
- *         # Set sparse format for gradient. (Restore saved val later.)
+  /* "nlp/model/src/_amplmodel.pyx":396
+ *         nzo = ograd_len(self.asl.i.Ograd_[0])
+ *         idx = np.empty(nzo, dtype=np.int32)
+ *         val = np.empty(nzo, dtype=np.double)             # <<<<<<<<<<<<<<
+ *         og = self.asl.i.Ograd_[0]
+ *         k = 0
  */
-  __pyx_t_1 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
-  if (__pyx_t_1) {
-    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 377; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_3 = NULL;
-    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_5))) {
-      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_5);
-      if (likely(__pyx_t_3)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-        __Pyx_INCREF(__pyx_t_3);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_5, function);
+  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_empty); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_nzo); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_6);
+  __pyx_t_6 = 0;
+  __pyx_t_6 = PyDict_New(); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_double); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_4, __pyx_t_6); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_12 = ((PyArrayObject *)__pyx_t_5);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_val.rcbuffer->pybuffer);
+    __pyx_t_8 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_val.rcbuffer->pybuffer, (PyObject*)__pyx_t_12, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack);
+    if (unlikely(__pyx_t_8 < 0)) {
+      PyErr_Fetch(&__pyx_t_11, &__pyx_t_10, &__pyx_t_9);
+      if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_val.rcbuffer->pybuffer, (PyObject*)__pyx_v_val, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+        Py_XDECREF(__pyx_t_11); Py_XDECREF(__pyx_t_10); Py_XDECREF(__pyx_t_9);
+        __Pyx_RaiseBufferFallbackError();
+      } else {
+        PyErr_Restore(__pyx_t_11, __pyx_t_10, __pyx_t_9);
       }
     }
-    if (__pyx_t_3) {
-      __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 377; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    } else {
-      __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 377; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 377; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_6 = ((PyArrayObject *)__pyx_t_4);
-    {
-      __Pyx_BufFmt_StackElem __pyx_stack[1];
-      __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
-      __pyx_t_7 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
-      if (unlikely(__pyx_t_7 < 0)) {
-        PyErr_Fetch(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
-        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
-          Py_XDECREF(__pyx_t_8); Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_10);
-          __Pyx_RaiseBufferFallbackError();
-        } else {
-          PyErr_Restore(__pyx_t_8, __pyx_t_9, __pyx_t_10);
-        }
-      }
-      __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 377; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    __pyx_t_6 = 0;
-    __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_4));
-    __pyx_t_4 = 0;
-  }
-
-  /* "nlp/model/src/_amplmodel.pyx":380
- * 
- *         # Set sparse format for gradient. (Restore saved val later.)
- *         congrd_mode_save = self.asl.i.congrd_mode             # <<<<<<<<<<<<<<
- *         self.asl.i.congrd_mode = 1
- * 
- */
-  __pyx_t_7 = __pyx_v_self->asl->i.congrd_mode;
-  __pyx_v_congrd_mode_save = __pyx_t_7;
-
-  /* "nlp/model/src/_amplmodel.pyx":381
- *         # Set sparse format for gradient. (Restore saved val later.)
- *         congrd_mode_save = self.asl.i.congrd_mode
- *         self.asl.i.congrd_mode = 1             # <<<<<<<<<<<<<<
- * 
- *         # Count number of nonzeros in gi.
- */
-  __pyx_v_self->asl->i.congrd_mode = 1;
-
-  /* "nlp/model/src/_amplmodel.pyx":384
- * 
- *         # Count number of nonzeros in gi.
- *         nzgi = 0             # <<<<<<<<<<<<<<
- *         cg = self.asl.i.Cgrad_[i]
- *         while cg is not NULL:
- */
-  __pyx_v_nzgi = 0;
-
-  /* "nlp/model/src/_amplmodel.pyx":385
- *         # Count number of nonzeros in gi.
- *         nzgi = 0
- *         cg = self.asl.i.Cgrad_[i]             # <<<<<<<<<<<<<<
- *         while cg is not NULL:
- *             nzgi += 1
- */
-  __pyx_v_cg = (__pyx_v_self->asl->i.Cgrad_[__pyx_v_i]);
-
-  /* "nlp/model/src/_amplmodel.pyx":386
- *         nzgi = 0
- *         cg = self.asl.i.Cgrad_[i]
- *         while cg is not NULL:             # <<<<<<<<<<<<<<
- *             nzgi += 1
- *             cg = cg.next
- */
-  while (1) {
-    __pyx_t_1 = ((__pyx_v_cg != NULL) != 0);
-    if (!__pyx_t_1) break;
-
-    /* "nlp/model/src/_amplmodel.pyx":387
- *         cg = self.asl.i.Cgrad_[i]
- *         while cg is not NULL:
- *             nzgi += 1             # <<<<<<<<<<<<<<
- *             cg = cg.next
- * 
- */
-    __pyx_v_nzgi = (__pyx_v_nzgi + 1);
-
-    /* "nlp/model/src/_amplmodel.pyx":388
- *         while cg is not NULL:
- *             nzgi += 1
- *             cg = cg.next             # <<<<<<<<<<<<<<
- * 
- *         # Allocate storage and evaluate ith constraint at x.
- */
-    __pyx_t_11 = __pyx_v_cg->next;
-    __pyx_v_cg = __pyx_t_11;
-  }
-
-  /* "nlp/model/src/_amplmodel.pyx":392
- *         # Allocate storage and evaluate ith constraint at x.
- *         cdef ndarray[np.double_t] \
- *              grad_ci = np.empty(nzgi, dtype=np.double)             # <<<<<<<<<<<<<<
- *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>grad_ci.data):
- *             raise ValueError('congrd failed')
- */
-  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_empty); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_nzgi); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
-  __pyx_t_4 = 0;
-  __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_12 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_12);
-  __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_t_12, __pyx_n_s_double); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_13);
-  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_13) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-  __pyx_t_13 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_13);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (!(likely(((__pyx_t_13) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_13, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_14 = ((PyArrayObject *)__pyx_t_13);
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_grad_ci.rcbuffer->pybuffer, (PyObject*)__pyx_t_14, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
-      __pyx_v_grad_ci = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_grad_ci.rcbuffer->pybuffer.buf = NULL;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 391; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    } else {__pyx_pybuffernd_grad_ci.diminfo[0].strides = __pyx_pybuffernd_grad_ci.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_grad_ci.diminfo[0].shape = __pyx_pybuffernd_grad_ci.rcbuffer->pybuffer.shape[0];
-    }
-  }
-  __pyx_t_14 = 0;
-  __pyx_v_grad_ci = ((PyArrayObject *)__pyx_t_13);
-  __pyx_t_13 = 0;
-
-  /* "nlp/model/src/_amplmodel.pyx":393
- *         cdef ndarray[np.double_t] \
- *              grad_ci = np.empty(nzgi, dtype=np.double)
- *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>grad_ci.data):             # <<<<<<<<<<<<<<
- *             raise ValueError('congrd failed')
- * 
- */
-  __pyx_t_1 = (ampl_congrd(__pyx_v_self->asl, __pyx_v_i, ((double *)__pyx_v_x->data), ((double *)__pyx_v_grad_ci->data)) != 0);
-  if (__pyx_t_1) {
-
-    /* "nlp/model/src/_amplmodel.pyx":394
- *              grad_ci = np.empty(nzgi, dtype=np.double)
- *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>grad_ci.data):
- *             raise ValueError('congrd failed')             # <<<<<<<<<<<<<<
- * 
- *         # Generate dictionary.
- */
-    __pyx_t_13 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_13);
-    __Pyx_Raise(__pyx_t_13, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-    /* "nlp/model/src/_amplmodel.pyx":393
- *         cdef ndarray[np.double_t] \
- *              grad_ci = np.empty(nzgi, dtype=np.double)
- *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>grad_ci.data):             # <<<<<<<<<<<<<<
- *             raise ValueError('congrd failed')
- * 
- */
+    __pyx_pybuffernd_val.diminfo[0].strides = __pyx_pybuffernd_val.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_val.diminfo[0].shape = __pyx_pybuffernd_val.rcbuffer->pybuffer.shape[0];
+    if (unlikely(__pyx_t_8 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
+  __pyx_t_12 = 0;
+  __pyx_v_val = ((PyArrayObject *)__pyx_t_5);
+  __pyx_t_5 = 0;
 
   /* "nlp/model/src/_amplmodel.pyx":397
- * 
- *         # Generate dictionary.
- *         j = 0             # <<<<<<<<<<<<<<
- *         sgi = {}
- *         cg = self.asl.i.Cgrad_[i]
+ *         idx = np.empty(nzo, dtype=np.int32)
+ *         val = np.empty(nzo, dtype=np.double)
+ *         og = self.asl.i.Ograd_[0]             # <<<<<<<<<<<<<<
+ *         k = 0
+ *         while og is not NULL:
  */
-  __pyx_v_j = 0;
+  __pyx_v_og = (__pyx_v_self->asl->i.Ograd_[0]);
 
   /* "nlp/model/src/_amplmodel.pyx":398
- *         # Generate dictionary.
- *         j = 0
- *         sgi = {}             # <<<<<<<<<<<<<<
- *         cg = self.asl.i.Cgrad_[i]
- *         while cg is not NULL:
+ *         val = np.empty(nzo, dtype=np.double)
+ *         og = self.asl.i.Ograd_[0]
+ *         k = 0             # <<<<<<<<<<<<<<
+ *         while og is not NULL:
+ *             idx[k] = og.varno
  */
-  __pyx_t_13 = PyDict_New(); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_13);
-  __pyx_v_sgi = ((PyObject*)__pyx_t_13);
-  __pyx_t_13 = 0;
+  __pyx_v_k = 0;
 
   /* "nlp/model/src/_amplmodel.pyx":399
- *         j = 0
- *         sgi = {}
- *         cg = self.asl.i.Cgrad_[i]             # <<<<<<<<<<<<<<
- *         while cg is not NULL:
- *             sgi[cg.varno] = grad_ci[j]
+ *         og = self.asl.i.Ograd_[0]
+ *         k = 0
+ *         while og is not NULL:             # <<<<<<<<<<<<<<
+ *             idx[k] = og.varno
+ *             val[k] = grad_f[og.varno]
  */
-  __pyx_v_cg = (__pyx_v_self->asl->i.Cgrad_[__pyx_v_i]);
+  while (1) {
+    __pyx_t_13 = ((__pyx_v_og != NULL) != 0);
+    if (!__pyx_t_13) break;
 
-  /* "nlp/model/src/_amplmodel.pyx":400
- *         sgi = {}
- *         cg = self.asl.i.Cgrad_[i]
- *         while cg is not NULL:             # <<<<<<<<<<<<<<
- *             sgi[cg.varno] = grad_ci[j]
- *             cg = cg.next
+    /* "nlp/model/src/_amplmodel.pyx":400
+ *         k = 0
+ *         while og is not NULL:
+ *             idx[k] = og.varno             # <<<<<<<<<<<<<<
+ *             val[k] = grad_f[og.varno]
+ *             og = og.next
  */
-  while (1) {
-    __pyx_t_1 = ((__pyx_v_cg != NULL) != 0);
-    if (!__pyx_t_1) break;
+    __pyx_t_8 = __pyx_v_og->varno;
+    __pyx_t_14 = __pyx_v_k;
+    __pyx_t_15 = -1;
+    if (__pyx_t_14 < 0) {
+      __pyx_t_14 += __pyx_pybuffernd_idx.diminfo[0].shape;
+      if (unlikely(__pyx_t_14 < 0)) __pyx_t_15 = 0;
+    } else if (unlikely(__pyx_t_14 >= __pyx_pybuffernd_idx.diminfo[0].shape)) __pyx_t_15 = 0;
+    if (unlikely(__pyx_t_15 != -1)) {
+      __Pyx_RaiseBufferIndexError(__pyx_t_15);
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_int32_t *, __pyx_pybuffernd_idx.rcbuffer->pybuffer.buf, __pyx_t_14, __pyx_pybuffernd_idx.diminfo[0].strides) = __pyx_t_8;
 
     /* "nlp/model/src/_amplmodel.pyx":401
- *         cg = self.asl.i.Cgrad_[i]
- *         while cg is not NULL:
- *             sgi[cg.varno] = grad_ci[j]             # <<<<<<<<<<<<<<
- *             cg = cg.next
- *             j += 1
- */
-    __pyx_t_15 = __pyx_v_j;
-    __pyx_t_7 = -1;
-    if (__pyx_t_15 < 0) {
-      __pyx_t_15 += __pyx_pybuffernd_grad_ci.diminfo[0].shape;
-      if (unlikely(__pyx_t_15 < 0)) __pyx_t_7 = 0;
-    } else if (unlikely(__pyx_t_15 >= __pyx_pybuffernd_grad_ci.diminfo[0].shape)) __pyx_t_7 = 0;
-    if (unlikely(__pyx_t_7 != -1)) {
-      __Pyx_RaiseBufferIndexError(__pyx_t_7);
+ *         while og is not NULL:
+ *             idx[k] = og.varno
+ *             val[k] = grad_f[og.varno]             # <<<<<<<<<<<<<<
+ *             og = og.next
+ *             k += 1
+ */
+    __pyx_t_16 = __pyx_v_og->varno;
+    __pyx_t_8 = -1;
+    if (__pyx_t_16 < 0) {
+      __pyx_t_16 += __pyx_pybuffernd_grad_f.diminfo[0].shape;
+      if (unlikely(__pyx_t_16 < 0)) __pyx_t_8 = 0;
+    } else if (unlikely(__pyx_t_16 >= __pyx_pybuffernd_grad_f.diminfo[0].shape)) __pyx_t_8 = 0;
+    if (unlikely(__pyx_t_8 != -1)) {
+      __Pyx_RaiseBufferIndexError(__pyx_t_8);
       {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
-    __pyx_t_13 = PyFloat_FromDouble((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_grad_ci.rcbuffer->pybuffer.buf, __pyx_t_15, __pyx_pybuffernd_grad_ci.diminfo[0].strides))); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_13);
-    __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_cg->varno); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    if (unlikely(PyDict_SetItem(__pyx_v_sgi, __pyx_t_4, __pyx_t_13) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __pyx_t_17 = __pyx_v_k;
+    __pyx_t_8 = -1;
+    if (__pyx_t_17 < 0) {
+      __pyx_t_17 += __pyx_pybuffernd_val.diminfo[0].shape;
+      if (unlikely(__pyx_t_17 < 0)) __pyx_t_8 = 0;
+    } else if (unlikely(__pyx_t_17 >= __pyx_pybuffernd_val.diminfo[0].shape)) __pyx_t_8 = 0;
+    if (unlikely(__pyx_t_8 != -1)) {
+      __Pyx_RaiseBufferIndexError(__pyx_t_8);
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_val.rcbuffer->pybuffer.buf, __pyx_t_17, __pyx_pybuffernd_val.diminfo[0].strides) = (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_grad_f.rcbuffer->pybuffer.buf, __pyx_t_16, __pyx_pybuffernd_grad_f.diminfo[0].strides));
 
     /* "nlp/model/src/_amplmodel.pyx":402
- *         while cg is not NULL:
- *             sgi[cg.varno] = grad_ci[j]
- *             cg = cg.next             # <<<<<<<<<<<<<<
- *             j += 1
- * 
+ *             idx[k] = og.varno
+ *             val[k] = grad_f[og.varno]
+ *             og = og.next             # <<<<<<<<<<<<<<
+ *             k += 1
+ *         return (idx, val)
  */
-    __pyx_t_11 = __pyx_v_cg->next;
-    __pyx_v_cg = __pyx_t_11;
+    __pyx_t_18 = __pyx_v_og->next;
+    __pyx_v_og = __pyx_t_18;
 
     /* "nlp/model/src/_amplmodel.pyx":403
- *             sgi[cg.varno] = grad_ci[j]
- *             cg = cg.next
- *             j += 1             # <<<<<<<<<<<<<<
+ *             val[k] = grad_f[og.varno]
+ *             og = og.next
+ *             k += 1             # <<<<<<<<<<<<<<
+ *         return (idx, val)
  * 
- *         # Restore gradient mode
  */
-    __pyx_v_j = (__pyx_v_j + 1);
+    __pyx_v_k = (__pyx_v_k + 1);
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":406
- * 
- *         # Restore gradient mode
- *         self.asl.i.congrd_mode = congrd_mode_save             # <<<<<<<<<<<<<<
- * 
- *         return sgi
- */
-  __pyx_v_self->asl->i.congrd_mode = __pyx_v_congrd_mode_save;
-
-  /* "nlp/model/src/_amplmodel.pyx":408
- *         self.asl.i.congrd_mode = congrd_mode_save
- * 
- *         return sgi             # <<<<<<<<<<<<<<
+  /* "nlp/model/src/_amplmodel.pyx":404
+ *             og = og.next
+ *             k += 1
+ *         return (idx, val)             # <<<<<<<<<<<<<<
  * 
- *     def eval_row(self, int i):
+ *     def eval_cost(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_sgi);
-  __pyx_r = __pyx_v_sgi;
+  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 404; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_INCREF(((PyObject *)__pyx_v_idx));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_idx));
+  PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_v_idx));
+  __Pyx_INCREF(((PyObject *)__pyx_v_val));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_val));
+  PyTuple_SET_ITEM(__pyx_t_5, 1, ((PyObject *)__pyx_v_val));
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
   goto __pyx_L0;
 
-  /* "nlp/model/src/_amplmodel.pyx":365
- *         return gi
- * 
- *     def eval_sgi(self, int i, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
- *         """Evalute the ith constraint sparse gradient at x."""
+  /* "nlp/model/src/_amplmodel.pyx":384
+ *         return c
  * 
+ *     def eval_sgrad(self, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
+ *         """Evaluate linear-part of the objective gradient at x.  A
+ *         sparse gradient is returned as a tuple (indices, values)."""
  */
 
   /* function exit code */
   __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_12);
-  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_6);
   { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
     __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_grad_ci.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_grad_f.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_idx.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_val.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
   __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_sgi", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_sgrad", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   goto __pyx_L2;
   __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_grad_ci.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_grad_f.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_idx.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_val.rcbuffer->pybuffer);
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
   __pyx_L2:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_grad_ci);
-  __Pyx_XDECREF(__pyx_v_sgi);
-  __Pyx_XDECREF((PyObject *)__pyx_v_x);
+  __Pyx_XDECREF((PyObject *)__pyx_v_grad_f);
+  __Pyx_XDECREF((PyObject *)__pyx_v_idx);
+  __Pyx_XDECREF((PyObject *)__pyx_v_val);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":410
- *         return sgi
+/* "nlp/model/src/_amplmodel.pyx":406
+ *         return (idx, val)
  * 
- *     def eval_row(self, int i):             # <<<<<<<<<<<<<<
- *         """Evaluate the ith constraint gradient as a sparse vector. To
- *         be used when the problem is a linear program."""
+ *     def eval_cost(self):             # <<<<<<<<<<<<<<
+ *         """Evaluate sparse linear-cost vector as a tuple (indices, values)."""
+ *         cdef:
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_41eval_row(PyObject *__pyx_v_self, PyObject *__pyx_arg_i); /*proto*/
-static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_40eval_row[] = "Evaluate the ith constraint gradient as a sparse vector. To\n        be used when the problem is a linear program.";
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_41eval_row(PyObject *__pyx_v_self, PyObject *__pyx_arg_i) {
-  int __pyx_v_i;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_47eval_cost(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_46eval_cost[] = "Evaluate sparse linear-cost vector as a tuple (indices, values).";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_47eval_cost(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("eval_row (wrapper)", 0);
-  assert(__pyx_arg_i); {
-    __pyx_v_i = __Pyx_PyInt_As_int(__pyx_arg_i); if (unlikely((__pyx_v_i == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 410; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_row", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_40eval_row(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), ((int)__pyx_v_i));
+  __Pyx_RefNannySetupContext("eval_cost (wrapper)", 0);
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_46eval_cost(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_40eval_row(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_v_i) {
-  PyObject *__pyx_v_row = NULL;
-  cgrad *__pyx_v_cg;
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_46eval_cost(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self) {
+  ograd *__pyx_v_og;
+  int __pyx_v_k;
+  int __pyx_v_nzo;
+  PyArrayObject *__pyx_v_idx = 0;
+  PyArrayObject *__pyx_v_val = 0;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_idx;
+  __Pyx_Buffer __pyx_pybuffer_idx;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_val;
+  __Pyx_Buffer __pyx_pybuffer_val;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  int __pyx_t_2;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
-  cgrad *__pyx_t_6;
+  PyArrayObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyArrayObject *__pyx_t_11 = NULL;
+  int __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  int __pyx_t_14;
+  double __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  ograd *__pyx_t_17;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("eval_row", 0);
+  __Pyx_RefNannySetupContext("eval_cost", 0);
+  __pyx_pybuffer_idx.pybuffer.buf = NULL;
+  __pyx_pybuffer_idx.refcount = 0;
+  __pyx_pybuffernd_idx.data = NULL;
+  __pyx_pybuffernd_idx.rcbuffer = &__pyx_pybuffer_idx;
+  __pyx_pybuffer_val.pybuffer.buf = NULL;
+  __pyx_pybuffer_val.refcount = 0;
+  __pyx_pybuffernd_val.data = NULL;
+  __pyx_pybuffernd_val.rcbuffer = &__pyx_pybuffer_val;
 
-  /* "nlp/model/src/_amplmodel.pyx":413
- *         """Evaluate the ith constraint gradient as a sparse vector. To
- *         be used when the problem is a linear program."""
- *         if i < 0 or i >= self.n_con:             # <<<<<<<<<<<<<<
- *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
- *                              (i, self.n_con))
+  /* "nlp/model/src/_amplmodel.pyx":414
+ *             ndarray[np.double_t] val
+ * 
+ *         nzo = ograd_len(self.asl.i.Ograd_[0])             # <<<<<<<<<<<<<<
+ *         idx = np.empty(nzo, dtype=np.int32)
+ *         val = np.empty(nzo, dtype=np.double)
  */
-  __pyx_t_2 = ((__pyx_v_i < 0) != 0);
-  if (!__pyx_t_2) {
-  } else {
-    __pyx_t_1 = __pyx_t_2;
-    goto __pyx_L4_bool_binop_done;
-  }
-  __pyx_t_2 = ((__pyx_v_i >= __pyx_v_self->n_con) != 0);
-  __pyx_t_1 = __pyx_t_2;
-  __pyx_L4_bool_binop_done:;
-  if (__pyx_t_1) {
+  __pyx_v_nzo = __pyx_f_3nlp_5model_3src_10_amplmodel_ograd_len((__pyx_v_self->asl->i.Ograd_[0]));
 
-    /* "nlp/model/src/_amplmodel.pyx":415
- *         if i < 0 or i >= self.n_con:
- *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
- *                              (i, self.n_con))             # <<<<<<<<<<<<<<
- *         row = {}
- *         cdef cgrad* cg = self.asl.i.Cgrad_[i]
- */
-    __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 415; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->n_con); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 415; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 415; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_GIVEREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
-    __Pyx_GIVEREF(__pyx_t_4);
-    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_4);
-    __pyx_t_3 = 0;
-    __pyx_t_4 = 0;
-
-    /* "nlp/model/src/_amplmodel.pyx":414
- *         be used when the problem is a linear program."""
- *         if i < 0 or i >= self.n_con:
- *             raise ValueError('Got i = %d; exected 0 <= i < %d' %             # <<<<<<<<<<<<<<
- *                              (i, self.n_con))
- *         row = {}
- */
-    __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_Got_i_d_exected_0_i_d, __pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_GIVEREF(__pyx_t_4);
-    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
-    __pyx_t_4 = 0;
-    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-    /* "nlp/model/src/_amplmodel.pyx":413
- *         """Evaluate the ith constraint gradient as a sparse vector. To
- *         be used when the problem is a linear program."""
- *         if i < 0 or i >= self.n_con:             # <<<<<<<<<<<<<<
- *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
- *                              (i, self.n_con))
+  /* "nlp/model/src/_amplmodel.pyx":415
+ * 
+ *         nzo = ograd_len(self.asl.i.Ograd_[0])
+ *         idx = np.empty(nzo, dtype=np.int32)             # <<<<<<<<<<<<<<
+ *         val = np.empty(nzo, dtype=np.double)
+ *         og = self.asl.i.Ograd_[0]
  */
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 415; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 415; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_nzo); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 415; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 415; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 415; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 415; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int32); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 415; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 415; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 415; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 415; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = ((PyArrayObject *)__pyx_t_5);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_idx.rcbuffer->pybuffer);
+    __pyx_t_7 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_idx.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack);
+    if (unlikely(__pyx_t_7 < 0)) {
+      PyErr_Fetch(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
+      if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_idx.rcbuffer->pybuffer, (PyObject*)__pyx_v_idx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+        Py_XDECREF(__pyx_t_8); Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_10);
+        __Pyx_RaiseBufferFallbackError();
+      } else {
+        PyErr_Restore(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+      }
+    }
+    __pyx_pybuffernd_idx.diminfo[0].strides = __pyx_pybuffernd_idx.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_idx.diminfo[0].shape = __pyx_pybuffernd_idx.rcbuffer->pybuffer.shape[0];
+    if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 415; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
+  __pyx_t_6 = 0;
+  __pyx_v_idx = ((PyArrayObject *)__pyx_t_5);
+  __pyx_t_5 = 0;
 
   /* "nlp/model/src/_amplmodel.pyx":416
- *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
- *                              (i, self.n_con))
- *         row = {}             # <<<<<<<<<<<<<<
- *         cdef cgrad* cg = self.asl.i.Cgrad_[i]
- *         while cg is not NULL:
+ *         nzo = ograd_len(self.asl.i.Ograd_[0])
+ *         idx = np.empty(nzo, dtype=np.int32)
+ *         val = np.empty(nzo, dtype=np.double)             # <<<<<<<<<<<<<<
+ *         og = self.asl.i.Ograd_[0]
+ *         k = 0
  */
-  __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_nzo); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = PyDict_New(); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_double); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_v_row = ((PyObject*)__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_dtype, __pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_11 = ((PyArrayObject *)__pyx_t_4);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_val.rcbuffer->pybuffer);
+    __pyx_t_7 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_val.rcbuffer->pybuffer, (PyObject*)__pyx_t_11, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack);
+    if (unlikely(__pyx_t_7 < 0)) {
+      PyErr_Fetch(&__pyx_t_10, &__pyx_t_9, &__pyx_t_8);
+      if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_val.rcbuffer->pybuffer, (PyObject*)__pyx_v_val, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+        Py_XDECREF(__pyx_t_10); Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_8);
+        __Pyx_RaiseBufferFallbackError();
+      } else {
+        PyErr_Restore(__pyx_t_10, __pyx_t_9, __pyx_t_8);
+      }
+    }
+    __pyx_pybuffernd_val.diminfo[0].strides = __pyx_pybuffernd_val.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_val.diminfo[0].shape = __pyx_pybuffernd_val.rcbuffer->pybuffer.shape[0];
+    if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_t_11 = 0;
+  __pyx_v_val = ((PyArrayObject *)__pyx_t_4);
   __pyx_t_4 = 0;
 
   /* "nlp/model/src/_amplmodel.pyx":417
- *                              (i, self.n_con))
- *         row = {}
- *         cdef cgrad* cg = self.asl.i.Cgrad_[i]             # <<<<<<<<<<<<<<
- *         while cg is not NULL:
- *             row[cg.varno] = cg.coef
+ *         idx = np.empty(nzo, dtype=np.int32)
+ *         val = np.empty(nzo, dtype=np.double)
+ *         og = self.asl.i.Ograd_[0]             # <<<<<<<<<<<<<<
+ *         k = 0
+ *         while og is not NULL:
  */
-  __pyx_v_cg = (__pyx_v_self->asl->i.Cgrad_[__pyx_v_i]);
+  __pyx_v_og = (__pyx_v_self->asl->i.Ograd_[0]);
 
   /* "nlp/model/src/_amplmodel.pyx":418
- *         row = {}
- *         cdef cgrad* cg = self.asl.i.Cgrad_[i]
- *         while cg is not NULL:             # <<<<<<<<<<<<<<
- *             row[cg.varno] = cg.coef
- *             cg = cg.next
+ *         val = np.empty(nzo, dtype=np.double)
+ *         og = self.asl.i.Ograd_[0]
+ *         k = 0             # <<<<<<<<<<<<<<
+ *         while og is not NULL:
+ *             idx[k] = og.varno
  */
-  while (1) {
-    __pyx_t_1 = ((__pyx_v_cg != NULL) != 0);
-    if (!__pyx_t_1) break;
+  __pyx_v_k = 0;
 
-    /* "nlp/model/src/_amplmodel.pyx":419
- *         cdef cgrad* cg = self.asl.i.Cgrad_[i]
- *         while cg is not NULL:
- *             row[cg.varno] = cg.coef             # <<<<<<<<<<<<<<
- *             cg = cg.next
- *         return row
+  /* "nlp/model/src/_amplmodel.pyx":419
+ *         og = self.asl.i.Ograd_[0]
+ *         k = 0
+ *         while og is not NULL:             # <<<<<<<<<<<<<<
+ *             idx[k] = og.varno
+ *             val[k] = og.coef
  */
-    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_cg->coef); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 419; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_cg->varno); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 419; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    if (unlikely(PyDict_SetItem(__pyx_v_row, __pyx_t_5, __pyx_t_4) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 419; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  while (1) {
+    __pyx_t_12 = ((__pyx_v_og != NULL) != 0);
+    if (!__pyx_t_12) break;
 
     /* "nlp/model/src/_amplmodel.pyx":420
- *         while cg is not NULL:
- *             row[cg.varno] = cg.coef
- *             cg = cg.next             # <<<<<<<<<<<<<<
- *         return row
+ *         k = 0
+ *         while og is not NULL:
+ *             idx[k] = og.varno             # <<<<<<<<<<<<<<
+ *             val[k] = og.coef
+ *             og = og.next
+ */
+    __pyx_t_7 = __pyx_v_og->varno;
+    __pyx_t_13 = __pyx_v_k;
+    __pyx_t_14 = -1;
+    if (__pyx_t_13 < 0) {
+      __pyx_t_13 += __pyx_pybuffernd_idx.diminfo[0].shape;
+      if (unlikely(__pyx_t_13 < 0)) __pyx_t_14 = 0;
+    } else if (unlikely(__pyx_t_13 >= __pyx_pybuffernd_idx.diminfo[0].shape)) __pyx_t_14 = 0;
+    if (unlikely(__pyx_t_14 != -1)) {
+      __Pyx_RaiseBufferIndexError(__pyx_t_14);
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 420; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_int32_t *, __pyx_pybuffernd_idx.rcbuffer->pybuffer.buf, __pyx_t_13, __pyx_pybuffernd_idx.diminfo[0].strides) = __pyx_t_7;
+
+    /* "nlp/model/src/_amplmodel.pyx":421
+ *         while og is not NULL:
+ *             idx[k] = og.varno
+ *             val[k] = og.coef             # <<<<<<<<<<<<<<
+ *             og = og.next
+ *             k += 1
+ */
+    __pyx_t_15 = __pyx_v_og->coef;
+    __pyx_t_16 = __pyx_v_k;
+    __pyx_t_7 = -1;
+    if (__pyx_t_16 < 0) {
+      __pyx_t_16 += __pyx_pybuffernd_val.diminfo[0].shape;
+      if (unlikely(__pyx_t_16 < 0)) __pyx_t_7 = 0;
+    } else if (unlikely(__pyx_t_16 >= __pyx_pybuffernd_val.diminfo[0].shape)) __pyx_t_7 = 0;
+    if (unlikely(__pyx_t_7 != -1)) {
+      __Pyx_RaiseBufferIndexError(__pyx_t_7);
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 421; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_val.rcbuffer->pybuffer.buf, __pyx_t_16, __pyx_pybuffernd_val.diminfo[0].strides) = __pyx_t_15;
+
+    /* "nlp/model/src/_amplmodel.pyx":422
+ *             idx[k] = og.varno
+ *             val[k] = og.coef
+ *             og = og.next             # <<<<<<<<<<<<<<
+ *             k += 1
+ *         return (idx, val)
+ */
+    __pyx_t_17 = __pyx_v_og->next;
+    __pyx_v_og = __pyx_t_17;
+
+    /* "nlp/model/src/_amplmodel.pyx":423
+ *             val[k] = og.coef
+ *             og = og.next
+ *             k += 1             # <<<<<<<<<<<<<<
+ *         return (idx, val)
  * 
  */
-    __pyx_t_6 = __pyx_v_cg->next;
-    __pyx_v_cg = __pyx_t_6;
+    __pyx_v_k = (__pyx_v_k + 1);
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":421
- *             row[cg.varno] = cg.coef
- *             cg = cg.next
- *         return row             # <<<<<<<<<<<<<<
+  /* "nlp/model/src/_amplmodel.pyx":424
+ *             og = og.next
+ *             k += 1
+ *         return (idx, val)             # <<<<<<<<<<<<<<
  * 
- *     def eval_A(self, int store_zeros=0):
+ *     def eval_ci(self, int i, ndarray[np.double_t] x):
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_row);
-  __pyx_r = __pyx_v_row;
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 424; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(((PyObject *)__pyx_v_idx));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_idx));
+  PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_v_idx));
+  __Pyx_INCREF(((PyObject *)__pyx_v_val));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_val));
+  PyTuple_SET_ITEM(__pyx_t_4, 1, ((PyObject *)__pyx_v_val));
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
   goto __pyx_L0;
 
-  /* "nlp/model/src/_amplmodel.pyx":410
- *         return sgi
+  /* "nlp/model/src/_amplmodel.pyx":406
+ *         return (idx, val)
  * 
- *     def eval_row(self, int i):             # <<<<<<<<<<<<<<
- *         """Evaluate the ith constraint gradient as a sparse vector. To
- *         be used when the problem is a linear program."""
+ *     def eval_cost(self):             # <<<<<<<<<<<<<<
+ *         """Evaluate sparse linear-cost vector as a tuple (indices, values)."""
+ *         cdef:
  */
 
   /* function exit code */
   __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_row", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_idx.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_val.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_cost", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
+  goto __pyx_L2;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_row);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_idx.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_val.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_idx);
+  __Pyx_XDECREF((PyObject *)__pyx_v_val);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":423
- *         return row
+/* "nlp/model/src/_amplmodel.pyx":426
+ *         return (idx, val)
  * 
- *     def eval_A(self, int store_zeros=0):             # <<<<<<<<<<<<<<
- *         """
- *         Evaluate Jacobian of LP.
+ *     def eval_ci(self, int i, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
+ *         """Evaluate ith constraint."""
+ *         cdef double ci = 0.0
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_43eval_A(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_42eval_A[] = "\n        Evaluate Jacobian of LP.\n        returns Jacobian in coordinate format.\n        ";
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_43eval_A(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  CYTHON_UNUSED int __pyx_v_store_zeros;
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_49eval_ci(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_48eval_ci[] = "Evaluate ith constraint.";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_49eval_ci(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_v_i;
+  PyArrayObject *__pyx_v_x = 0;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("eval_A (wrapper)", 0);
+  __Pyx_RefNannySetupContext("eval_ci (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_store_zeros,0};
-    PyObject* values[1] = {0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_i,&__pyx_n_s_x,0};
+    PyObject* values[2] = {0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
@@ -5687,309 +6001,256 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_43eval_A(PyObject
       kw_args = PyDict_Size(__pyx_kwds);
       switch (pos_args) {
         case  0:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_store_zeros);
-          if (value) { values[0] = value; kw_args--; }
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_i)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("eval_ci", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "eval_A") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 423; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "eval_ci") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
-    }
-    if (values[0]) {
-      __pyx_v_store_zeros = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_store_zeros == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 423; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
     } else {
-      __pyx_v_store_zeros = ((int)0);
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
     }
+    __pyx_v_i = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_i == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_x = ((PyArrayObject *)values[1]);
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("eval_A", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 423; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("eval_ci", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_A", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_ci", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_42eval_A(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_store_zeros);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48eval_ci(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_i, __pyx_v_x);
 
   /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_42eval_A(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, CYTHON_UNUSED int __pyx_v_store_zeros) {
-  cgrad *__pyx_v_cg;
-  CYTHON_UNUSED int *__pyx_v_dims;
-  int __pyx_v_i;
-  long __pyx_v_nnzj;
-  PyObject *__pyx_v_A = NULL;
-  PyObject *__pyx_v_a_icol = NULL;
-  PyObject *__pyx_v_a_irow = NULL;
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48eval_ci(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_v_i, PyArrayObject *__pyx_v_x) {
+  double __pyx_v_ci;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_x;
+  __Pyx_Buffer __pyx_pybuffer_x;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1[2];
-  long __pyx_t_2;
+  int __pyx_t_1;
+  int __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  int __pyx_t_8;
-  int __pyx_t_9;
-  int __pyx_t_10;
-  cgrad *__pyx_t_11;
+  PyArrayObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("eval_A", 0);
+  __Pyx_RefNannySetupContext("eval_ci", 0);
+  __Pyx_INCREF((PyObject *)__pyx_v_x);
+  __pyx_pybuffer_x.pybuffer.buf = NULL;
+  __pyx_pybuffer_x.refcount = 0;
+  __pyx_pybuffernd_x.data = NULL;
+  __pyx_pybuffernd_x.rcbuffer = &__pyx_pybuffer_x;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
 
-  /* "nlp/model/src/_amplmodel.pyx":430
- *         cdef:
- *             cgrad* cg
- *             int *dims = [self.n_con, self.n_var]             # <<<<<<<<<<<<<<
- *             int i, irow, jcol
- *         nnzj = self.nzc if self.n_con else 1
+  /* "nlp/model/src/_amplmodel.pyx":428
+ *     def eval_ci(self, int i, ndarray[np.double_t] x):
+ *         """Evaluate ith constraint."""
+ *         cdef double ci = 0.0             # <<<<<<<<<<<<<<
+ *         if i < 0 or i >= self.n_con:
+ *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
  */
-  __pyx_t_1[0] = __pyx_v_self->n_con;
-  __pyx_t_1[1] = __pyx_v_self->n_var;
-  __pyx_v_dims = __pyx_t_1;
+  __pyx_v_ci = 0.0;
 
-  /* "nlp/model/src/_amplmodel.pyx":432
- *             int *dims = [self.n_con, self.n_var]
- *             int i, irow, jcol
- *         nnzj = self.nzc if self.n_con else 1             # <<<<<<<<<<<<<<
- * 
- *         A = np.empty(nnzj, dtype=np.double)
+  /* "nlp/model/src/_amplmodel.pyx":429
+ *         """Evaluate ith constraint."""
+ *         cdef double ci = 0.0
+ *         if i < 0 or i >= self.n_con:             # <<<<<<<<<<<<<<
+ *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
+ *                              (i, self.n_con))
  */
-  if ((__pyx_v_self->n_con != 0)) {
-    __pyx_t_2 = __pyx_v_self->nzc;
+  __pyx_t_2 = ((__pyx_v_i < 0) != 0);
+  if (!__pyx_t_2) {
   } else {
-    __pyx_t_2 = 1;
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
   }
-  __pyx_v_nnzj = __pyx_t_2;
+  __pyx_t_2 = ((__pyx_v_i >= __pyx_v_self->n_con) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
 
-  /* "nlp/model/src/_amplmodel.pyx":434
- *         nnzj = self.nzc if self.n_con else 1
+    /* "nlp/model/src/_amplmodel.pyx":431
+ *         if i < 0 or i >= self.n_con:
+ *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
+ *                              (i, self.n_con))             # <<<<<<<<<<<<<<
  * 
- *         A = np.empty(nnzj, dtype=np.double)             # <<<<<<<<<<<<<<
- *         a_icol = np.empty(nnzj, dtype=np.int)
- *         a_irow = np.empty(nnzj, dtype=np.int)
+ *         # Ensure contiguous input.
  */
-  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyInt_From_long(__pyx_v_nnzj); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
-  __pyx_t_3 = 0;
-  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_double); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_v_A = __pyx_t_7;
-  __pyx_t_7 = 0;
+    __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 431; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->n_con); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 431; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 431; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_4);
+    __pyx_t_3 = 0;
+    __pyx_t_4 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":435
- * 
- *         A = np.empty(nnzj, dtype=np.double)
- *         a_icol = np.empty(nnzj, dtype=np.int)             # <<<<<<<<<<<<<<
- *         a_irow = np.empty(nnzj, dtype=np.int)
+    /* "nlp/model/src/_amplmodel.pyx":430
+ *         cdef double ci = 0.0
+ *         if i < 0 or i >= self.n_con:
+ *             raise ValueError('Got i = %d; exected 0 <= i < %d' %             # <<<<<<<<<<<<<<
+ *                              (i, self.n_con))
  * 
  */
-  __pyx_t_7 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_7 = __Pyx_PyInt_From_long(__pyx_v_nnzj); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GIVEREF(__pyx_t_7);
-  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_7);
-  __pyx_t_7 = 0;
-  __pyx_t_7 = PyDict_New(); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_dtype, __pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, __pyx_t_7); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_v_a_icol = __pyx_t_6;
-  __pyx_t_6 = 0;
+    __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_Got_i_d_exected_0_i_d, __pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 430; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 430; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
+    __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 430; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 430; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "nlp/model/src/_amplmodel.pyx":436
- *         A = np.empty(nnzj, dtype=np.double)
- *         a_icol = np.empty(nnzj, dtype=np.int)
- *         a_irow = np.empty(nnzj, dtype=np.int)             # <<<<<<<<<<<<<<
- * 
- *         for i in range(self.n_con):
+    /* "nlp/model/src/_amplmodel.pyx":429
+ *         """Evaluate ith constraint."""
+ *         cdef double ci = 0.0
+ *         if i < 0 or i >= self.n_con:             # <<<<<<<<<<<<<<
+ *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
+ *                              (i, self.n_con))
  */
-  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 436; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_empty); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 436; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyInt_From_long(__pyx_v_nnzj); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 436; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 436; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GIVEREF(__pyx_t_6);
-  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6);
-  __pyx_t_6 = 0;
-  __pyx_t_6 = PyDict_New(); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 436; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 436; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 436; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 436; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 436; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_v_a_irow = __pyx_t_4;
-  __pyx_t_4 = 0;
+  }
 
-  /* "nlp/model/src/_amplmodel.pyx":438
- *         a_irow = np.empty(nnzj, dtype=np.int)
+  /* "nlp/model/src/_amplmodel.pyx":434
  * 
- *         for i in range(self.n_con):             # <<<<<<<<<<<<<<
- *             cg = self.asl.i.Cgrad_[i]
- *             while cg is not NULL:
- */
-  __pyx_t_8 = __pyx_v_self->n_con;
-  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
-    __pyx_v_i = __pyx_t_9;
-
-    /* "nlp/model/src/_amplmodel.pyx":439
+ *         # Ensure contiguous input.
+ *         if not PyArray_ISCARRAY(x): x = x.copy()             # <<<<<<<<<<<<<<
  * 
- *         for i in range(self.n_con):
- *             cg = self.asl.i.Cgrad_[i]             # <<<<<<<<<<<<<<
- *             while cg is not NULL:
- *                 # a_irow.data[cg.goff] = i
- */
-    __pyx_v_cg = (__pyx_v_self->asl->i.Cgrad_[__pyx_v_i]);
-
-    /* "nlp/model/src/_amplmodel.pyx":440
- *         for i in range(self.n_con):
- *             cg = self.asl.i.Cgrad_[i]
- *             while cg is not NULL:             # <<<<<<<<<<<<<<
- *                 # a_irow.data[cg.goff] = i
- *                 # a_icol.data[cg.goff] = cg.varno  # broken.
- */
-    while (1) {
-      __pyx_t_10 = ((__pyx_v_cg != NULL) != 0);
-      if (!__pyx_t_10) break;
-
-      /* "nlp/model/src/_amplmodel.pyx":443
- *                 # a_irow.data[cg.goff] = i
- *                 # a_icol.data[cg.goff] = cg.varno  # broken.
- *                 a_irow[cg.goff] = i             # <<<<<<<<<<<<<<
- *                 a_icol[cg.goff] = cg.varno
- *                 A[cg.goff] = cg.coef
+ *         if ampl_conival(self.asl, i, <double*>x.data, &ci):
  */
-      __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      if (unlikely(__Pyx_SetItemInt(__pyx_v_a_irow, __pyx_v_cg->goff, __pyx_t_4, size_t, 0, __Pyx_PyInt_FromSize_t, 0, 0, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
+  if (__pyx_t_1) {
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = NULL;
+    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    if (__pyx_t_3) {
+      __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    } else {
+      __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = ((PyArrayObject *)__pyx_t_4);
+    {
+      __Pyx_BufFmt_StackElem __pyx_stack[1];
+      __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+      __pyx_t_7 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
+      if (unlikely(__pyx_t_7 < 0)) {
+        PyErr_Fetch(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
+        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
+          Py_XDECREF(__pyx_t_8); Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_10);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+        }
+      }
+      __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
+      if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_4));
+    __pyx_t_4 = 0;
+  }
 
-      /* "nlp/model/src/_amplmodel.pyx":444
- *                 # a_icol.data[cg.goff] = cg.varno  # broken.
- *                 a_irow[cg.goff] = i
- *                 a_icol[cg.goff] = cg.varno             # <<<<<<<<<<<<<<
- *                 A[cg.goff] = cg.coef
- *                 cg = cg.next
+  /* "nlp/model/src/_amplmodel.pyx":436
+ *         if not PyArray_ISCARRAY(x): x = x.copy()
+ * 
+ *         if ampl_conival(self.asl, i, <double*>x.data, &ci):             # <<<<<<<<<<<<<<
+ *             raise ValueError
+ *         return ci
  */
-      __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_cg->varno); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 444; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      if (unlikely(__Pyx_SetItemInt(__pyx_v_a_icol, __pyx_v_cg->goff, __pyx_t_4, size_t, 0, __Pyx_PyInt_FromSize_t, 0, 0, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 444; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = (ampl_conival(__pyx_v_self->asl, __pyx_v_i, ((double *)__pyx_v_x->data), (&__pyx_v_ci)) != 0);
+  if (__pyx_t_1) {
 
-      /* "nlp/model/src/_amplmodel.pyx":445
- *                 a_irow[cg.goff] = i
- *                 a_icol[cg.goff] = cg.varno
- *                 A[cg.goff] = cg.coef             # <<<<<<<<<<<<<<
- *                 cg = cg.next
+    /* "nlp/model/src/_amplmodel.pyx":437
+ * 
+ *         if ampl_conival(self.asl, i, <double*>x.data, &ci):
+ *             raise ValueError             # <<<<<<<<<<<<<<
+ *         return ci
  * 
  */
-      __pyx_t_4 = PyFloat_FromDouble(__pyx_v_cg->coef); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 445; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      if (unlikely(__Pyx_SetItemInt(__pyx_v_A, __pyx_v_cg->goff, __pyx_t_4, size_t, 0, __Pyx_PyInt_FromSize_t, 0, 0, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 445; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 437; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-      /* "nlp/model/src/_amplmodel.pyx":446
- *                 a_icol[cg.goff] = cg.varno
- *                 A[cg.goff] = cg.coef
- *                 cg = cg.next             # <<<<<<<<<<<<<<
+    /* "nlp/model/src/_amplmodel.pyx":436
+ *         if not PyArray_ISCARRAY(x): x = x.copy()
  * 
- *         return (A, a_irow, a_icol)
+ *         if ampl_conival(self.asl, i, <double*>x.data, &ci):             # <<<<<<<<<<<<<<
+ *             raise ValueError
+ *         return ci
  */
-      __pyx_t_11 = __pyx_v_cg->next;
-      __pyx_v_cg = __pyx_t_11;
-    }
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":448
- *                 cg = cg.next
- * 
- *         return (A, a_irow, a_icol)             # <<<<<<<<<<<<<<
+  /* "nlp/model/src/_amplmodel.pyx":438
+ *         if ampl_conival(self.asl, i, <double*>x.data, &ci):
+ *             raise ValueError
+ *         return ci             # <<<<<<<<<<<<<<
  * 
- *     def eval_J(self, ndarray[np.double_t] x, int store_zeros=0):
+ *     def eval_gi(self, int i, ndarray[np.double_t] x):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 448; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_ci); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 438; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_INCREF(__pyx_v_A);
-  __Pyx_GIVEREF(__pyx_v_A);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_A);
-  __Pyx_INCREF(__pyx_v_a_irow);
-  __Pyx_GIVEREF(__pyx_v_a_irow);
-  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_a_irow);
-  __Pyx_INCREF(__pyx_v_a_icol);
-  __Pyx_GIVEREF(__pyx_v_a_icol);
-  PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_v_a_icol);
   __pyx_r = __pyx_t_4;
   __pyx_t_4 = 0;
   goto __pyx_L0;
 
-  /* "nlp/model/src/_amplmodel.pyx":423
- *         return row
+  /* "nlp/model/src/_amplmodel.pyx":426
+ *         return (idx, val)
  * 
- *     def eval_A(self, int store_zeros=0):             # <<<<<<<<<<<<<<
- *         """
- *         Evaluate Jacobian of LP.
+ *     def eval_ci(self, int i, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
+ *         """Evaluate ith constraint."""
+ *         cdef double ci = 0.0
  */
 
   /* function exit code */
@@ -5997,41 +6258,44 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_42eval_A(struct __
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_A", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_A);
-  __Pyx_XDECREF(__pyx_v_a_icol);
-  __Pyx_XDECREF(__pyx_v_a_irow);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_ci", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_x);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":450
- *         return (A, a_irow, a_icol)
+/* "nlp/model/src/_amplmodel.pyx":440
+ *         return ci
  * 
- *     def eval_J(self, ndarray[np.double_t] x, int store_zeros=0):             # <<<<<<<<<<<<<<
- *         """Evaluate sparse Jacobian."""
- *         cdef:
+ *     def eval_gi(self, int i, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
+ *         """Evaluate the ith constraint gradient at x."""
+ *         if i < 0 or i >= self.n_con:
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_45eval_J(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_44eval_J[] = "Evaluate sparse Jacobian.";
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_45eval_J(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_51eval_gi(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_50eval_gi[] = "Evaluate the ith constraint gradient at x.";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_51eval_gi(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_v_i;
   PyArrayObject *__pyx_v_x = 0;
-  CYTHON_UNUSED int __pyx_v_store_zeros;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("eval_J (wrapper)", 0);
+  __Pyx_RefNannySetupContext("eval_gi (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_x,&__pyx_n_s_store_zeros,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_i,&__pyx_n_s_x,0};
     PyObject* values[2] = {0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
@@ -6045,42 +6309,36 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_45eval_J(PyObject
       kw_args = PyDict_Size(__pyx_kwds);
       switch (pos_args) {
         case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_i)) != 0)) kw_args--;
         else goto __pyx_L5_argtuple_error;
         case  1:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_store_zeros);
-          if (value) { values[1] = value; kw_args--; }
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("eval_gi", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 440; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "eval_J") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        break;
-        default: goto __pyx_L5_argtuple_error;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "eval_gi") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 440; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
-    }
-    __pyx_v_x = ((PyArrayObject *)values[0]);
-    if (values[1]) {
-      __pyx_v_store_zeros = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_store_zeros == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
     } else {
-      __pyx_v_store_zeros = ((int)0);
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
     }
+    __pyx_v_i = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_i == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 440; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_x = ((PyArrayObject *)values[1]);
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("eval_J", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("eval_gi", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 440; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_J", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_gi", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_44eval_J(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_x, __pyx_v_store_zeros);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 440; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50eval_gi(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_i, __pyx_v_x);
 
   /* function exit code */
   goto __pyx_L0;
@@ -6091,21 +6349,15 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_45eval_J(PyObject
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_44eval_J(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, CYTHON_UNUSED int __pyx_v_store_zeros) {
-  PyArrayObject *__pyx_v_J = 0;
-  cgrad *__pyx_v_cg;
-  CYTHON_UNUSED int *__pyx_v_dims;
-  long __pyx_v_nnzj;
-  PyObject *__pyx_v_a_icol = NULL;
-  PyObject *__pyx_v_a_irow = NULL;
-  int __pyx_v_i;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_J;
-  __Pyx_Buffer __pyx_pybuffer_J;
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50eval_gi(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_v_i, PyArrayObject *__pyx_v_x) {
+  PyArrayObject *__pyx_v_gi = 0;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_gi;
+  __Pyx_Buffer __pyx_pybuffer_gi;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_x;
   __Pyx_Buffer __pyx_pybuffer_x;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1[2];
+  int __pyx_t_1;
   int __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
@@ -6115,73 +6367,128 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_44eval_J(struct __
   PyObject *__pyx_t_8 = NULL;
   PyObject *__pyx_t_9 = NULL;
   PyObject *__pyx_t_10 = NULL;
-  long __pyx_t_11;
+  PyObject *__pyx_t_11 = NULL;
   PyObject *__pyx_t_12 = NULL;
-  PyObject *__pyx_t_13 = NULL;
-  PyArrayObject *__pyx_t_14 = NULL;
-  int __pyx_t_15;
-  cgrad *__pyx_t_16;
+  PyArrayObject *__pyx_t_13 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("eval_J", 0);
+  __Pyx_RefNannySetupContext("eval_gi", 0);
   __Pyx_INCREF((PyObject *)__pyx_v_x);
-  __pyx_pybuffer_J.pybuffer.buf = NULL;
-  __pyx_pybuffer_J.refcount = 0;
-  __pyx_pybuffernd_J.data = NULL;
-  __pyx_pybuffernd_J.rcbuffer = &__pyx_pybuffer_J;
+  __pyx_pybuffer_gi.pybuffer.buf = NULL;
+  __pyx_pybuffer_gi.refcount = 0;
+  __pyx_pybuffernd_gi.data = NULL;
+  __pyx_pybuffernd_gi.rcbuffer = &__pyx_pybuffer_gi;
   __pyx_pybuffer_x.pybuffer.buf = NULL;
   __pyx_pybuffer_x.refcount = 0;
   __pyx_pybuffernd_x.data = NULL;
   __pyx_pybuffernd_x.rcbuffer = &__pyx_pybuffer_x;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 440; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
 
-  /* "nlp/model/src/_amplmodel.pyx":460
- *             # Variables needed for LL format.
- *             cgrad* cg
- *             int* dims = [self.n_con, self.n_var]             # <<<<<<<<<<<<<<
+  /* "nlp/model/src/_amplmodel.pyx":442
+ *     def eval_gi(self, int i, ndarray[np.double_t] x):
+ *         """Evaluate the ith constraint gradient at x."""
+ *         if i < 0 or i >= self.n_con:             # <<<<<<<<<<<<<<
+ *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
+ *                              (i, self.n_con))
+ */
+  __pyx_t_2 = ((__pyx_v_i < 0) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_i >= __pyx_v_self->n_con) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "nlp/model/src/_amplmodel.pyx":444
+ *         if i < 0 or i >= self.n_con:
+ *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
+ *                              (i, self.n_con))             # <<<<<<<<<<<<<<
  * 
  *         # Ensure contiguous input.
  */
-  __pyx_t_1[0] = __pyx_v_self->n_con;
-  __pyx_t_1[1] = __pyx_v_self->n_var;
-  __pyx_v_dims = __pyx_t_1;
+    __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 444; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->n_con); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 444; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 444; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_4);
+    __pyx_t_3 = 0;
+    __pyx_t_4 = 0;
+
+    /* "nlp/model/src/_amplmodel.pyx":443
+ *         """Evaluate the ith constraint gradient at x."""
+ *         if i < 0 or i >= self.n_con:
+ *             raise ValueError('Got i = %d; exected 0 <= i < %d' %             # <<<<<<<<<<<<<<
+ *                              (i, self.n_con))
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_Got_i_d_exected_0_i_d, __pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
+    __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "nlp/model/src/_amplmodel.pyx":442
+ *     def eval_gi(self, int i, ndarray[np.double_t] x):
+ *         """Evaluate the ith constraint gradient at x."""
+ *         if i < 0 or i >= self.n_con:             # <<<<<<<<<<<<<<
+ *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
+ *                              (i, self.n_con))
+ */
+  }
 
-  /* "nlp/model/src/_amplmodel.pyx":463
+  /* "nlp/model/src/_amplmodel.pyx":447
  * 
  *         # Ensure contiguous input.
  *         if not PyArray_ISCARRAY(x): x = x.copy()             # <<<<<<<<<<<<<<
  * 
- *         nnzj = self.nzc if self.n_con else 0
+ *         cdef ndarray[np.double_t] \
  */
-  __pyx_t_2 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
-  if (__pyx_t_2) {
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = NULL;
-    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_4))) {
-      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
-      if (likely(__pyx_t_5)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
-        __Pyx_INCREF(__pyx_t_5);
+  __pyx_t_1 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
+  if (__pyx_t_1) {
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 447; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = NULL;
+    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_3);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_4, function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
       }
     }
-    if (__pyx_t_5) {
-      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__pyx_t_3) {
+      __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 447; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     } else {
-      __pyx_t_3 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 447; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_6 = ((PyArrayObject *)__pyx_t_3);
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 447; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = ((PyArrayObject *)__pyx_t_4);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
       __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
@@ -6196,339 +6503,3396 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_44eval_J(struct __
         }
       }
       __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 447; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __pyx_t_6 = 0;
-    __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_3));
-    __pyx_t_3 = 0;
-  }
-
-  /* "nlp/model/src/_amplmodel.pyx":465
- *         if not PyArray_ISCARRAY(x): x = x.copy()
- * 
- *         nnzj = self.nzc if self.n_con else 0             # <<<<<<<<<<<<<<
- * 
- *         # Allocate storage and evaluate Jacobian at x.
- */
-  if ((__pyx_v_self->n_con != 0)) {
-    __pyx_t_11 = __pyx_v_self->nzc;
-  } else {
-    __pyx_t_11 = 0;
+    __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_4));
+    __pyx_t_4 = 0;
   }
-  __pyx_v_nnzj = __pyx_t_11;
 
-  /* "nlp/model/src/_amplmodel.pyx":468
+  /* "nlp/model/src/_amplmodel.pyx":450
  * 
- *         # Allocate storage and evaluate Jacobian at x.
- *         J = np.empty(nnzj, dtype=np.double)             # <<<<<<<<<<<<<<
- *         if ampl_jacval(self.asl, <double*>x.data, <double*>J.data):
+ *         cdef ndarray[np.double_t] \
+ *              gi = np.empty(self.n_var, dtype=np.double)             # <<<<<<<<<<<<<<
+ *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>gi.data):
  *             raise ValueError
  */
-  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyInt_From_long(__pyx_v_nnzj); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_empty); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
-  __pyx_t_3 = 0;
-  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->n_var); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_12 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_11 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_12 = __Pyx_PyObject_GetAttrStr(__pyx_t_11, __pyx_n_s_double); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_12);
-  __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_t_12, __pyx_n_s_double); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_12) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_13) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-  __pyx_t_13 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_13);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_12 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_12);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (!(likely(((__pyx_t_13) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_13, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_14 = ((PyArrayObject *)__pyx_t_13);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (!(likely(((__pyx_t_12) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_12, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 450; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_13 = ((PyArrayObject *)__pyx_t_12);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_J.rcbuffer->pybuffer);
-    __pyx_t_7 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_J.rcbuffer->pybuffer, (PyObject*)__pyx_t_14, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
-    if (unlikely(__pyx_t_7 < 0)) {
-      PyErr_Fetch(&__pyx_t_10, &__pyx_t_9, &__pyx_t_8);
-      if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_J.rcbuffer->pybuffer, (PyObject*)__pyx_v_J, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
-        Py_XDECREF(__pyx_t_10); Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_8);
-        __Pyx_RaiseBufferFallbackError();
-      } else {
-        PyErr_Restore(__pyx_t_10, __pyx_t_9, __pyx_t_8);
-      }
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_gi.rcbuffer->pybuffer, (PyObject*)__pyx_t_13, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_gi = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_gi.rcbuffer->pybuffer.buf = NULL;
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 449; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    } else {__pyx_pybuffernd_gi.diminfo[0].strides = __pyx_pybuffernd_gi.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_gi.diminfo[0].shape = __pyx_pybuffernd_gi.rcbuffer->pybuffer.shape[0];
     }
-    __pyx_pybuffernd_J.diminfo[0].strides = __pyx_pybuffernd_J.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_J.diminfo[0].shape = __pyx_pybuffernd_J.rcbuffer->pybuffer.shape[0];
-    if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
-  __pyx_t_14 = 0;
-  __pyx_v_J = ((PyArrayObject *)__pyx_t_13);
   __pyx_t_13 = 0;
+  __pyx_v_gi = ((PyArrayObject *)__pyx_t_12);
+  __pyx_t_12 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":469
- *         # Allocate storage and evaluate Jacobian at x.
- *         J = np.empty(nnzj, dtype=np.double)
- *         if ampl_jacval(self.asl, <double*>x.data, <double*>J.data):             # <<<<<<<<<<<<<<
+  /* "nlp/model/src/_amplmodel.pyx":451
+ *         cdef ndarray[np.double_t] \
+ *              gi = np.empty(self.n_var, dtype=np.double)
+ *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>gi.data):             # <<<<<<<<<<<<<<
  *             raise ValueError
- * 
+ *         return gi
  */
-  __pyx_t_2 = (ampl_jacval(__pyx_v_self->asl, ((double *)__pyx_v_x->data), ((double *)__pyx_v_J->data)) != 0);
-  if (__pyx_t_2) {
+  __pyx_t_1 = (ampl_congrd(__pyx_v_self->asl, __pyx_v_i, ((double *)__pyx_v_x->data), ((double *)__pyx_v_gi->data)) != 0);
+  if (__pyx_t_1) {
 
-    /* "nlp/model/src/_amplmodel.pyx":470
- *         J = np.empty(nnzj, dtype=np.double)
- *         if ampl_jacval(self.asl, <double*>x.data, <double*>J.data):
+    /* "nlp/model/src/_amplmodel.pyx":452
+ *              gi = np.empty(self.n_var, dtype=np.double)
+ *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>gi.data):
  *             raise ValueError             # <<<<<<<<<<<<<<
+ *         return gi
  * 
- *         a_icol = np.empty(nnzj, dtype=np.int)
  */
     __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 470; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 452; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "nlp/model/src/_amplmodel.pyx":451
+ *         cdef ndarray[np.double_t] \
+ *              gi = np.empty(self.n_var, dtype=np.double)
+ *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>gi.data):             # <<<<<<<<<<<<<<
+ *             raise ValueError
+ *         return gi
+ */
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":453
+ *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>gi.data):
+ *             raise ValueError
+ *         return gi             # <<<<<<<<<<<<<<
+ * 
+ *     def eval_sgi(self, int i, ndarray[np.double_t] x):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_gi));
+  __pyx_r = ((PyObject *)__pyx_v_gi);
+  goto __pyx_L0;
+
+  /* "nlp/model/src/_amplmodel.pyx":440
+ *         return ci
+ * 
+ *     def eval_gi(self, int i, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
+ *         """Evaluate the ith constraint gradient at x."""
+ *         if i < 0 or i >= self.n_con:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_gi.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_gi", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_gi.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_gi);
+  __Pyx_XDECREF((PyObject *)__pyx_v_x);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nlp/model/src/_amplmodel.pyx":455
+ *         return gi
+ * 
+ *     def eval_sgi(self, int i, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
+ *         """Evalute the ith constraint sparse gradient at x.
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_53eval_sgi(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_52eval_sgi[] = "Evalute the ith constraint sparse gradient at x.\n\n        The sparse gradient is returned as a tuple (indices, values).";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_53eval_sgi(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_v_i;
+  PyArrayObject *__pyx_v_x = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("eval_sgi (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_i,&__pyx_n_s_x,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_i)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("eval_sgi", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 455; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "eval_sgi") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 455; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_i = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_i == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 455; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_x = ((PyArrayObject *)values[1]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("eval_sgi", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 455; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_sgi", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 455; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_52eval_sgi(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_i, __pyx_v_x);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_52eval_sgi(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_v_i, PyArrayObject *__pyx_v_x) {
+  int __pyx_v_nzgi;
+  int __pyx_v_k;
+  cgrad *__pyx_v_cg;
+  PyArrayObject *__pyx_v_idx = 0;
+  PyArrayObject *__pyx_v_grad_ci = 0;
+  int __pyx_v_congrd_mode_save;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_grad_ci;
+  __Pyx_Buffer __pyx_pybuffer_grad_ci;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_idx;
+  __Pyx_Buffer __pyx_pybuffer_idx;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_x;
+  __Pyx_Buffer __pyx_pybuffer_x;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyArrayObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyArrayObject *__pyx_t_13 = NULL;
+  PyArrayObject *__pyx_t_14 = NULL;
+  Py_ssize_t __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  cgrad *__pyx_t_17;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("eval_sgi", 0);
+  __Pyx_INCREF((PyObject *)__pyx_v_x);
+  __pyx_pybuffer_idx.pybuffer.buf = NULL;
+  __pyx_pybuffer_idx.refcount = 0;
+  __pyx_pybuffernd_idx.data = NULL;
+  __pyx_pybuffernd_idx.rcbuffer = &__pyx_pybuffer_idx;
+  __pyx_pybuffer_grad_ci.pybuffer.buf = NULL;
+  __pyx_pybuffer_grad_ci.refcount = 0;
+  __pyx_pybuffernd_grad_ci.data = NULL;
+  __pyx_pybuffernd_grad_ci.rcbuffer = &__pyx_pybuffer_grad_ci;
+  __pyx_pybuffer_x.pybuffer.buf = NULL;
+  __pyx_pybuffer_x.refcount = 0;
+  __pyx_pybuffernd_x.data = NULL;
+  __pyx_pybuffernd_x.rcbuffer = &__pyx_pybuffer_x;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 455; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
+
+  /* "nlp/model/src/_amplmodel.pyx":466
+ *             ndarray[np.double_t] grad_ci
+ * 
+ *         if i < 0 or i >= self.n_con:             # <<<<<<<<<<<<<<
+ *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
+ *                              (i, self.n_con))
+ */
+  __pyx_t_2 = ((__pyx_v_i < 0) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_i >= __pyx_v_self->n_con) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "nlp/model/src/_amplmodel.pyx":468
+ *         if i < 0 or i >= self.n_con:
+ *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
+ *                              (i, self.n_con))             # <<<<<<<<<<<<<<
+ * 
+ *         # Ensure contiguous input.
+ */
+    __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->n_con); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_4);
+    __pyx_t_3 = 0;
+    __pyx_t_4 = 0;
+
+    /* "nlp/model/src/_amplmodel.pyx":467
+ * 
+ *         if i < 0 or i >= self.n_con:
+ *             raise ValueError('Got i = %d; exected 0 <= i < %d' %             # <<<<<<<<<<<<<<
+ *                              (i, self.n_con))
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_Got_i_d_exected_0_i_d, __pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 467; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 467; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
+    __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 467; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 467; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "nlp/model/src/_amplmodel.pyx":466
+ *             ndarray[np.double_t] grad_ci
+ * 
+ *         if i < 0 or i >= self.n_con:             # <<<<<<<<<<<<<<
+ *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
+ *                              (i, self.n_con))
+ */
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":471
+ * 
+ *         # Ensure contiguous input.
+ *         if not PyArray_ISCARRAY(x): x = x.copy()             # <<<<<<<<<<<<<<
+ * 
+ *         # Set sparse format for gradient. (Restore saved val later.)
+ */
+  __pyx_t_1 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
+  if (__pyx_t_1) {
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = NULL;
+    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    if (__pyx_t_3) {
+      __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    } else {
+      __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = ((PyArrayObject *)__pyx_t_4);
+    {
+      __Pyx_BufFmt_StackElem __pyx_stack[1];
+      __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+      __pyx_t_7 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
+      if (unlikely(__pyx_t_7 < 0)) {
+        PyErr_Fetch(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
+        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
+          Py_XDECREF(__pyx_t_8); Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_10);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+        }
+      }
+      __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
+      if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_4));
+    __pyx_t_4 = 0;
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":474
+ * 
+ *         # Set sparse format for gradient. (Restore saved val later.)
+ *         congrd_mode_save = self.asl.i.congrd_mode             # <<<<<<<<<<<<<<
+ *         self.asl.i.congrd_mode = 1
+ * 
+ */
+  __pyx_t_7 = __pyx_v_self->asl->i.congrd_mode;
+  __pyx_v_congrd_mode_save = __pyx_t_7;
+
+  /* "nlp/model/src/_amplmodel.pyx":475
+ *         # Set sparse format for gradient. (Restore saved val later.)
+ *         congrd_mode_save = self.asl.i.congrd_mode
+ *         self.asl.i.congrd_mode = 1             # <<<<<<<<<<<<<<
+ * 
+ *         # Allocate storage and evaluate ith constraint at x.
+ */
+  __pyx_v_self->asl->i.congrd_mode = 1;
+
+  /* "nlp/model/src/_amplmodel.pyx":478
+ * 
+ *         # Allocate storage and evaluate ith constraint at x.
+ *         nzgi = cgrad_len(self.asl.i.Cgrad_[i])             # <<<<<<<<<<<<<<
+ *         grad_ci = np.empty(nzgi, dtype=np.double)
+ *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>grad_ci.data):
+ */
+  __pyx_v_nzgi = __pyx_f_3nlp_5model_3src_10_amplmodel_cgrad_len((__pyx_v_self->asl->i.Cgrad_[__pyx_v_i]));
+
+  /* "nlp/model/src/_amplmodel.pyx":479
+ *         # Allocate storage and evaluate ith constraint at x.
+ *         nzgi = cgrad_len(self.asl.i.Cgrad_[i])
+ *         grad_ci = np.empty(nzgi, dtype=np.double)             # <<<<<<<<<<<<<<
+ *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>grad_ci.data):
+ *             self.asl.i.congrd_mode = congrd_mode_save
+ */
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_empty); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_nzgi); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_11 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_12 = __Pyx_PyObject_GetAttrStr(__pyx_t_11, __pyx_n_s_double); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_12) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __pyx_t_12 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (!(likely(((__pyx_t_12) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_12, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_13 = ((PyArrayObject *)__pyx_t_12);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_grad_ci.rcbuffer->pybuffer);
+    __pyx_t_7 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_grad_ci.rcbuffer->pybuffer, (PyObject*)__pyx_t_13, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
+    if (unlikely(__pyx_t_7 < 0)) {
+      PyErr_Fetch(&__pyx_t_10, &__pyx_t_9, &__pyx_t_8);
+      if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_grad_ci.rcbuffer->pybuffer, (PyObject*)__pyx_v_grad_ci, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
+        Py_XDECREF(__pyx_t_10); Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_8);
+        __Pyx_RaiseBufferFallbackError();
+      } else {
+        PyErr_Restore(__pyx_t_10, __pyx_t_9, __pyx_t_8);
+      }
+    }
+    __pyx_pybuffernd_grad_ci.diminfo[0].strides = __pyx_pybuffernd_grad_ci.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_grad_ci.diminfo[0].shape = __pyx_pybuffernd_grad_ci.rcbuffer->pybuffer.shape[0];
+    if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_t_13 = 0;
+  __pyx_v_grad_ci = ((PyArrayObject *)__pyx_t_12);
+  __pyx_t_12 = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":480
+ *         nzgi = cgrad_len(self.asl.i.Cgrad_[i])
+ *         grad_ci = np.empty(nzgi, dtype=np.double)
+ *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>grad_ci.data):             # <<<<<<<<<<<<<<
+ *             self.asl.i.congrd_mode = congrd_mode_save
+ *             raise ValueError('congrd failed')
+ */
+  __pyx_t_1 = (ampl_congrd(__pyx_v_self->asl, __pyx_v_i, ((double *)__pyx_v_x->data), ((double *)__pyx_v_grad_ci->data)) != 0);
+  if (__pyx_t_1) {
+
+    /* "nlp/model/src/_amplmodel.pyx":481
+ *         grad_ci = np.empty(nzgi, dtype=np.double)
+ *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>grad_ci.data):
+ *             self.asl.i.congrd_mode = congrd_mode_save             # <<<<<<<<<<<<<<
+ *             raise ValueError('congrd failed')
+ * 
+ */
+    __pyx_v_self->asl->i.congrd_mode = __pyx_v_congrd_mode_save;
+
+    /* "nlp/model/src/_amplmodel.pyx":482
+ *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>grad_ci.data):
+ *             self.asl.i.congrd_mode = congrd_mode_save
+ *             raise ValueError('congrd failed')             # <<<<<<<<<<<<<<
+ * 
+ *         # Restore gradient mode
+ */
+    __pyx_t_12 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 482; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_12);
+    __Pyx_Raise(__pyx_t_12, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 482; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "nlp/model/src/_amplmodel.pyx":480
+ *         nzgi = cgrad_len(self.asl.i.Cgrad_[i])
+ *         grad_ci = np.empty(nzgi, dtype=np.double)
+ *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>grad_ci.data):             # <<<<<<<<<<<<<<
+ *             self.asl.i.congrd_mode = congrd_mode_save
+ *             raise ValueError('congrd failed')
+ */
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":485
+ * 
+ *         # Restore gradient mode
+ *         self.asl.i.congrd_mode = congrd_mode_save             # <<<<<<<<<<<<<<
+ * 
+ *         # Collect indices in the order in which values were stored.
+ */
+  __pyx_v_self->asl->i.congrd_mode = __pyx_v_congrd_mode_save;
+
+  /* "nlp/model/src/_amplmodel.pyx":488
+ * 
+ *         # Collect indices in the order in which values were stored.
+ *         idx = np.empty(nzgi, dtype=np.int32)             # <<<<<<<<<<<<<<
+ *         k = 0
+ *         cg = self.asl.i.Cgrad_[i]
+ */
+  __pyx_t_12 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 488; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_12, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 488; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __pyx_t_12 = __Pyx_PyInt_From_int(__pyx_v_nzgi); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 488; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 488; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_12);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_12);
+  __pyx_t_12 = 0;
+  __pyx_t_12 = PyDict_New(); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 488; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 488; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int32); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 488; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_12, __pyx_n_s_dtype, __pyx_t_11) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 488; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  __pyx_t_11 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_3, __pyx_t_12); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 488; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  if (!(likely(((__pyx_t_11) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_11, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 488; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_14 = ((PyArrayObject *)__pyx_t_11);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_idx.rcbuffer->pybuffer);
+    __pyx_t_7 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_idx.rcbuffer->pybuffer, (PyObject*)__pyx_t_14, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack);
+    if (unlikely(__pyx_t_7 < 0)) {
+      PyErr_Fetch(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
+      if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_idx.rcbuffer->pybuffer, (PyObject*)__pyx_v_idx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+        Py_XDECREF(__pyx_t_8); Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_10);
+        __Pyx_RaiseBufferFallbackError();
+      } else {
+        PyErr_Restore(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+      }
+    }
+    __pyx_pybuffernd_idx.diminfo[0].strides = __pyx_pybuffernd_idx.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_idx.diminfo[0].shape = __pyx_pybuffernd_idx.rcbuffer->pybuffer.shape[0];
+    if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 488; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_t_14 = 0;
+  __pyx_v_idx = ((PyArrayObject *)__pyx_t_11);
+  __pyx_t_11 = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":489
+ *         # Collect indices in the order in which values were stored.
+ *         idx = np.empty(nzgi, dtype=np.int32)
+ *         k = 0             # <<<<<<<<<<<<<<
+ *         cg = self.asl.i.Cgrad_[i]
+ *         while cg is not NULL:
+ */
+  __pyx_v_k = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":490
+ *         idx = np.empty(nzgi, dtype=np.int32)
+ *         k = 0
+ *         cg = self.asl.i.Cgrad_[i]             # <<<<<<<<<<<<<<
+ *         while cg is not NULL:
+ *             idx[k] = cg.varno
+ */
+  __pyx_v_cg = (__pyx_v_self->asl->i.Cgrad_[__pyx_v_i]);
+
+  /* "nlp/model/src/_amplmodel.pyx":491
+ *         k = 0
+ *         cg = self.asl.i.Cgrad_[i]
+ *         while cg is not NULL:             # <<<<<<<<<<<<<<
+ *             idx[k] = cg.varno
+ *             cg = cg.next
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_cg != NULL) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "nlp/model/src/_amplmodel.pyx":492
+ *         cg = self.asl.i.Cgrad_[i]
+ *         while cg is not NULL:
+ *             idx[k] = cg.varno             # <<<<<<<<<<<<<<
+ *             cg = cg.next
+ *             k += 1
+ */
+    __pyx_t_15 = __pyx_v_cg->varno;
+    __pyx_t_16 = __pyx_v_k;
+    __pyx_t_7 = -1;
+    if (__pyx_t_16 < 0) {
+      __pyx_t_16 += __pyx_pybuffernd_idx.diminfo[0].shape;
+      if (unlikely(__pyx_t_16 < 0)) __pyx_t_7 = 0;
+    } else if (unlikely(__pyx_t_16 >= __pyx_pybuffernd_idx.diminfo[0].shape)) __pyx_t_7 = 0;
+    if (unlikely(__pyx_t_7 != -1)) {
+      __Pyx_RaiseBufferIndexError(__pyx_t_7);
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 492; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_int32_t *, __pyx_pybuffernd_idx.rcbuffer->pybuffer.buf, __pyx_t_16, __pyx_pybuffernd_idx.diminfo[0].strides) = __pyx_t_15;
+
+    /* "nlp/model/src/_amplmodel.pyx":493
+ *         while cg is not NULL:
+ *             idx[k] = cg.varno
+ *             cg = cg.next             # <<<<<<<<<<<<<<
+ *             k += 1
+ * 
+ */
+    __pyx_t_17 = __pyx_v_cg->next;
+    __pyx_v_cg = __pyx_t_17;
+
+    /* "nlp/model/src/_amplmodel.pyx":494
+ *             idx[k] = cg.varno
+ *             cg = cg.next
+ *             k += 1             # <<<<<<<<<<<<<<
+ * 
+ *         return (idx, grad_ci)
+ */
+    __pyx_v_k = (__pyx_v_k + 1);
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":496
+ *             k += 1
+ * 
+ *         return (idx, grad_ci)             # <<<<<<<<<<<<<<
+ * 
+ *     def eval_row(self, int i):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_11 = PyTuple_New(2); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 496; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_INCREF(((PyObject *)__pyx_v_idx));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_idx));
+  PyTuple_SET_ITEM(__pyx_t_11, 0, ((PyObject *)__pyx_v_idx));
+  __Pyx_INCREF(((PyObject *)__pyx_v_grad_ci));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_grad_ci));
+  PyTuple_SET_ITEM(__pyx_t_11, 1, ((PyObject *)__pyx_v_grad_ci));
+  __pyx_r = __pyx_t_11;
+  __pyx_t_11 = 0;
+  goto __pyx_L0;
+
+  /* "nlp/model/src/_amplmodel.pyx":455
+ *         return gi
+ * 
+ *     def eval_sgi(self, int i, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
+ *         """Evalute the ith constraint sparse gradient at x.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_grad_ci.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_idx.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_sgi", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_grad_ci.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_idx.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_idx);
+  __Pyx_XDECREF((PyObject *)__pyx_v_grad_ci);
+  __Pyx_XDECREF((PyObject *)__pyx_v_x);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nlp/model/src/_amplmodel.pyx":498
+ *         return (idx, grad_ci)
+ * 
+ *     def eval_row(self, int i):             # <<<<<<<<<<<<<<
+ *         """Evaluate the ith constraint gradient as a tuple (indices, values).
+ *         To be used when the problem is a linear program."""
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_55eval_row(PyObject *__pyx_v_self, PyObject *__pyx_arg_i); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_54eval_row[] = "Evaluate the ith constraint gradient as a tuple (indices, values).\n        To be used when the problem is a linear program.";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_55eval_row(PyObject *__pyx_v_self, PyObject *__pyx_arg_i) {
+  int __pyx_v_i;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("eval_row (wrapper)", 0);
+  assert(__pyx_arg_i); {
+    __pyx_v_i = __Pyx_PyInt_As_int(__pyx_arg_i); if (unlikely((__pyx_v_i == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 498; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_row", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_54eval_row(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), ((int)__pyx_v_i));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_54eval_row(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, int __pyx_v_i) {
+  int __pyx_v_nzgi;
+  int __pyx_v_k;
+  cgrad *__pyx_v_cg;
+  PyArrayObject *__pyx_v_idx = 0;
+  PyArrayObject *__pyx_v_val = 0;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_idx;
+  __Pyx_Buffer __pyx_pybuffer_idx;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_val;
+  __Pyx_Buffer __pyx_pybuffer_val;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyArrayObject *__pyx_t_13 = NULL;
+  Py_ssize_t __pyx_t_14;
+  Py_ssize_t __pyx_t_15;
+  double __pyx_t_16;
+  cgrad *__pyx_t_17;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("eval_row", 0);
+  __pyx_pybuffer_idx.pybuffer.buf = NULL;
+  __pyx_pybuffer_idx.refcount = 0;
+  __pyx_pybuffernd_idx.data = NULL;
+  __pyx_pybuffernd_idx.rcbuffer = &__pyx_pybuffer_idx;
+  __pyx_pybuffer_val.pybuffer.buf = NULL;
+  __pyx_pybuffer_val.refcount = 0;
+  __pyx_pybuffernd_val.data = NULL;
+  __pyx_pybuffernd_val.rcbuffer = &__pyx_pybuffer_val;
+
+  /* "nlp/model/src/_amplmodel.pyx":507
+ *             ndarray[np.double_t] val
+ * 
+ *         if i < 0 or i >= self.n_con:             # <<<<<<<<<<<<<<
+ *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
+ *                              (i, self.n_con))
+ */
+  __pyx_t_2 = ((__pyx_v_i < 0) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_i >= __pyx_v_self->n_con) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "nlp/model/src/_amplmodel.pyx":509
+ *         if i < 0 or i >= self.n_con:
+ *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
+ *                              (i, self.n_con))             # <<<<<<<<<<<<<<
+ * 
+ *         nzgi = cgrad_len(self.asl.i.Cgrad_[i])
+ */
+    __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 509; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->n_con); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 509; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 509; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_4);
+    __pyx_t_3 = 0;
+    __pyx_t_4 = 0;
+
+    /* "nlp/model/src/_amplmodel.pyx":508
+ * 
+ *         if i < 0 or i >= self.n_con:
+ *             raise ValueError('Got i = %d; exected 0 <= i < %d' %             # <<<<<<<<<<<<<<
+ *                              (i, self.n_con))
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_Got_i_d_exected_0_i_d, __pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 508; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 508; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
+    __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 508; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 508; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "nlp/model/src/_amplmodel.pyx":507
+ *             ndarray[np.double_t] val
+ * 
+ *         if i < 0 or i >= self.n_con:             # <<<<<<<<<<<<<<
+ *             raise ValueError('Got i = %d; exected 0 <= i < %d' %
+ *                              (i, self.n_con))
+ */
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":511
+ *                              (i, self.n_con))
+ * 
+ *         nzgi = cgrad_len(self.asl.i.Cgrad_[i])             # <<<<<<<<<<<<<<
+ *         idx = np.empty(nzgi, dtype=np.int32)
+ *         val = np.empty(nzgi, dtype=np.double)
+ */
+  __pyx_v_nzgi = __pyx_f_3nlp_5model_3src_10_amplmodel_cgrad_len((__pyx_v_self->asl->i.Cgrad_[__pyx_v_i]));
+
+  /* "nlp/model/src/_amplmodel.pyx":512
+ * 
+ *         nzgi = cgrad_len(self.asl.i.Cgrad_[i])
+ *         idx = np.empty(nzgi, dtype=np.int32)             # <<<<<<<<<<<<<<
+ *         val = np.empty(nzgi, dtype=np.double)
+ *         k = 0
+ */
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 512; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_empty); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 512; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_nzgi); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 512; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 512; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 512; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 512; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_int32); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 512; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 512; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 512; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (!(likely(((__pyx_t_7) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_7, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 512; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_7);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_idx.rcbuffer->pybuffer);
+    __pyx_t_9 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_idx.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack);
+    if (unlikely(__pyx_t_9 < 0)) {
+      PyErr_Fetch(&__pyx_t_10, &__pyx_t_11, &__pyx_t_12);
+      if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_idx.rcbuffer->pybuffer, (PyObject*)__pyx_v_idx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int32_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+        Py_XDECREF(__pyx_t_10); Py_XDECREF(__pyx_t_11); Py_XDECREF(__pyx_t_12);
+        __Pyx_RaiseBufferFallbackError();
+      } else {
+        PyErr_Restore(__pyx_t_10, __pyx_t_11, __pyx_t_12);
+      }
+    }
+    __pyx_pybuffernd_idx.diminfo[0].strides = __pyx_pybuffernd_idx.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_idx.diminfo[0].shape = __pyx_pybuffernd_idx.rcbuffer->pybuffer.shape[0];
+    if (unlikely(__pyx_t_9 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 512; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_idx = ((PyArrayObject *)__pyx_t_7);
+  __pyx_t_7 = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":513
+ *         nzgi = cgrad_len(self.asl.i.Cgrad_[i])
+ *         idx = np.empty(nzgi, dtype=np.int32)
+ *         val = np.empty(nzgi, dtype=np.double)             # <<<<<<<<<<<<<<
+ *         k = 0
+ *         cg = self.asl.i.Cgrad_[i]
+ */
+  __pyx_t_7 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 513; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 513; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_nzgi); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 513; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 513; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_7);
+  __pyx_t_7 = 0;
+  __pyx_t_7 = PyDict_New(); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 513; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 513; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_double); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 513; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_dtype, __pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 513; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_3, __pyx_t_7); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 513; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 513; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_13 = ((PyArrayObject *)__pyx_t_6);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_val.rcbuffer->pybuffer);
+    __pyx_t_9 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_val.rcbuffer->pybuffer, (PyObject*)__pyx_t_13, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack);
+    if (unlikely(__pyx_t_9 < 0)) {
+      PyErr_Fetch(&__pyx_t_12, &__pyx_t_11, &__pyx_t_10);
+      if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_val.rcbuffer->pybuffer, (PyObject*)__pyx_v_val, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+        Py_XDECREF(__pyx_t_12); Py_XDECREF(__pyx_t_11); Py_XDECREF(__pyx_t_10);
+        __Pyx_RaiseBufferFallbackError();
+      } else {
+        PyErr_Restore(__pyx_t_12, __pyx_t_11, __pyx_t_10);
+      }
+    }
+    __pyx_pybuffernd_val.diminfo[0].strides = __pyx_pybuffernd_val.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_val.diminfo[0].shape = __pyx_pybuffernd_val.rcbuffer->pybuffer.shape[0];
+    if (unlikely(__pyx_t_9 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 513; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_t_13 = 0;
+  __pyx_v_val = ((PyArrayObject *)__pyx_t_6);
+  __pyx_t_6 = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":514
+ *         idx = np.empty(nzgi, dtype=np.int32)
+ *         val = np.empty(nzgi, dtype=np.double)
+ *         k = 0             # <<<<<<<<<<<<<<
+ *         cg = self.asl.i.Cgrad_[i]
+ *         while cg is not NULL:
+ */
+  __pyx_v_k = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":515
+ *         val = np.empty(nzgi, dtype=np.double)
+ *         k = 0
+ *         cg = self.asl.i.Cgrad_[i]             # <<<<<<<<<<<<<<
+ *         while cg is not NULL:
+ *             idx[k] = cg.varno
+ */
+  __pyx_v_cg = (__pyx_v_self->asl->i.Cgrad_[__pyx_v_i]);
+
+  /* "nlp/model/src/_amplmodel.pyx":516
+ *         k = 0
+ *         cg = self.asl.i.Cgrad_[i]
+ *         while cg is not NULL:             # <<<<<<<<<<<<<<
+ *             idx[k] = cg.varno
+ *             val[k] = cg.coef
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_cg != NULL) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "nlp/model/src/_amplmodel.pyx":517
+ *         cg = self.asl.i.Cgrad_[i]
+ *         while cg is not NULL:
+ *             idx[k] = cg.varno             # <<<<<<<<<<<<<<
+ *             val[k] = cg.coef
+ *             cg = cg.next
+ */
+    __pyx_t_14 = __pyx_v_cg->varno;
+    __pyx_t_15 = __pyx_v_k;
+    __pyx_t_9 = -1;
+    if (__pyx_t_15 < 0) {
+      __pyx_t_15 += __pyx_pybuffernd_idx.diminfo[0].shape;
+      if (unlikely(__pyx_t_15 < 0)) __pyx_t_9 = 0;
+    } else if (unlikely(__pyx_t_15 >= __pyx_pybuffernd_idx.diminfo[0].shape)) __pyx_t_9 = 0;
+    if (unlikely(__pyx_t_9 != -1)) {
+      __Pyx_RaiseBufferIndexError(__pyx_t_9);
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 517; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_int32_t *, __pyx_pybuffernd_idx.rcbuffer->pybuffer.buf, __pyx_t_15, __pyx_pybuffernd_idx.diminfo[0].strides) = __pyx_t_14;
+
+    /* "nlp/model/src/_amplmodel.pyx":518
+ *         while cg is not NULL:
+ *             idx[k] = cg.varno
+ *             val[k] = cg.coef             # <<<<<<<<<<<<<<
+ *             cg = cg.next
+ *             k += 1
+ */
+    __pyx_t_16 = __pyx_v_cg->coef;
+    __pyx_t_14 = __pyx_v_k;
+    __pyx_t_9 = -1;
+    if (__pyx_t_14 < 0) {
+      __pyx_t_14 += __pyx_pybuffernd_val.diminfo[0].shape;
+      if (unlikely(__pyx_t_14 < 0)) __pyx_t_9 = 0;
+    } else if (unlikely(__pyx_t_14 >= __pyx_pybuffernd_val.diminfo[0].shape)) __pyx_t_9 = 0;
+    if (unlikely(__pyx_t_9 != -1)) {
+      __Pyx_RaiseBufferIndexError(__pyx_t_9);
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 518; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_val.rcbuffer->pybuffer.buf, __pyx_t_14, __pyx_pybuffernd_val.diminfo[0].strides) = __pyx_t_16;
+
+    /* "nlp/model/src/_amplmodel.pyx":519
+ *             idx[k] = cg.varno
+ *             val[k] = cg.coef
+ *             cg = cg.next             # <<<<<<<<<<<<<<
+ *             k += 1
+ *         return (idx, val)
+ */
+    __pyx_t_17 = __pyx_v_cg->next;
+    __pyx_v_cg = __pyx_t_17;
+
+    /* "nlp/model/src/_amplmodel.pyx":520
+ *             val[k] = cg.coef
+ *             cg = cg.next
+ *             k += 1             # <<<<<<<<<<<<<<
+ *         return (idx, val)
+ * 
+ */
+    __pyx_v_k = (__pyx_v_k + 1);
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":521
+ *             cg = cg.next
+ *             k += 1
+ *         return (idx, val)             # <<<<<<<<<<<<<<
+ * 
+ *     def eval_A(self, int store_zeros=0):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 521; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_INCREF(((PyObject *)__pyx_v_idx));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_idx));
+  PyTuple_SET_ITEM(__pyx_t_6, 0, ((PyObject *)__pyx_v_idx));
+  __Pyx_INCREF(((PyObject *)__pyx_v_val));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_val));
+  PyTuple_SET_ITEM(__pyx_t_6, 1, ((PyObject *)__pyx_v_val));
+  __pyx_r = __pyx_t_6;
+  __pyx_t_6 = 0;
+  goto __pyx_L0;
+
+  /* "nlp/model/src/_amplmodel.pyx":498
+ *         return (idx, grad_ci)
+ * 
+ *     def eval_row(self, int i):             # <<<<<<<<<<<<<<
+ *         """Evaluate the ith constraint gradient as a tuple (indices, values).
+ *         To be used when the problem is a linear program."""
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_idx.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_val.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_row", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_idx.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_val.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_idx);
+  __Pyx_XDECREF((PyObject *)__pyx_v_val);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nlp/model/src/_amplmodel.pyx":523
+ *         return (idx, val)
+ * 
+ *     def eval_A(self, int store_zeros=0):             # <<<<<<<<<<<<<<
+ *         """
+ *         Evaluate Jacobian of LP.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_57eval_A(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_56eval_A[] = "\n        Evaluate Jacobian of LP.\n        returns Jacobian in coordinate format.\n        ";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_57eval_A(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  CYTHON_UNUSED int __pyx_v_store_zeros;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("eval_A (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_store_zeros,0};
+    PyObject* values[1] = {0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_store_zeros);
+          if (value) { values[0] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "eval_A") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 523; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    if (values[0]) {
+      __pyx_v_store_zeros = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_store_zeros == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 523; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_store_zeros = ((int)0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("eval_A", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 523; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_A", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_56eval_A(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_store_zeros);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_56eval_A(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, CYTHON_UNUSED int __pyx_v_store_zeros) {
+  cgrad *__pyx_v_cg;
+  CYTHON_UNUSED int *__pyx_v_dims;
+  int __pyx_v_i;
+  long __pyx_v_nnzj;
+  PyObject *__pyx_v_A = NULL;
+  PyObject *__pyx_v_a_icol = NULL;
+  PyObject *__pyx_v_a_irow = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1[2];
+  long __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  cgrad *__pyx_t_11;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("eval_A", 0);
+
+  /* "nlp/model/src/_amplmodel.pyx":530
+ *         cdef:
+ *             cgrad* cg
+ *             int *dims = [self.n_con, self.n_var]             # <<<<<<<<<<<<<<
+ *             int i, irow, jcol
+ *         nnzj = self.nzc if self.n_con else 1
+ */
+  __pyx_t_1[0] = __pyx_v_self->n_con;
+  __pyx_t_1[1] = __pyx_v_self->n_var;
+  __pyx_v_dims = __pyx_t_1;
+
+  /* "nlp/model/src/_amplmodel.pyx":532
+ *             int *dims = [self.n_con, self.n_var]
+ *             int i, irow, jcol
+ *         nnzj = self.nzc if self.n_con else 1             # <<<<<<<<<<<<<<
+ * 
+ *         A = np.empty(nnzj, dtype=np.double)
+ */
+  if ((__pyx_v_self->n_con != 0)) {
+    __pyx_t_2 = __pyx_v_self->nzc;
+  } else {
+    __pyx_t_2 = 1;
+  }
+  __pyx_v_nnzj = __pyx_t_2;
+
+  /* "nlp/model/src/_amplmodel.pyx":534
+ *         nnzj = self.nzc if self.n_con else 1
+ * 
+ *         A = np.empty(nnzj, dtype=np.double)             # <<<<<<<<<<<<<<
+ *         a_icol = np.empty(nnzj, dtype=np.int)
+ *         a_irow = np.empty(nnzj, dtype=np.int)
+ */
+  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyInt_From_long(__pyx_v_nnzj); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_double); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_A = __pyx_t_7;
+  __pyx_t_7 = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":535
+ * 
+ *         A = np.empty(nnzj, dtype=np.double)
+ *         a_icol = np.empty(nnzj, dtype=np.int)             # <<<<<<<<<<<<<<
+ *         a_irow = np.empty(nnzj, dtype=np.int)
+ * 
+ */
+  __pyx_t_7 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_PyInt_From_long(__pyx_v_nnzj); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_7);
+  __pyx_t_7 = 0;
+  __pyx_t_7 = PyDict_New(); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_dtype, __pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, __pyx_t_7); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_v_a_icol = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":536
+ *         A = np.empty(nnzj, dtype=np.double)
+ *         a_icol = np.empty(nnzj, dtype=np.int)
+ *         a_irow = np.empty(nnzj, dtype=np.int)             # <<<<<<<<<<<<<<
+ * 
+ *         for i in range(self.n_con):
+ */
+  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_empty); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyInt_From_long(__pyx_v_nnzj); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6);
+  __pyx_t_6 = 0;
+  __pyx_t_6 = PyDict_New(); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_v_a_irow = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":538
+ *         a_irow = np.empty(nnzj, dtype=np.int)
+ * 
+ *         for i in range(self.n_con):             # <<<<<<<<<<<<<<
+ *             cg = self.asl.i.Cgrad_[i]
+ *             while cg is not NULL:
+ */
+  __pyx_t_8 = __pyx_v_self->n_con;
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_i = __pyx_t_9;
+
+    /* "nlp/model/src/_amplmodel.pyx":539
+ * 
+ *         for i in range(self.n_con):
+ *             cg = self.asl.i.Cgrad_[i]             # <<<<<<<<<<<<<<
+ *             while cg is not NULL:
+ *                 # a_irow.data[cg.goff] = i
+ */
+    __pyx_v_cg = (__pyx_v_self->asl->i.Cgrad_[__pyx_v_i]);
+
+    /* "nlp/model/src/_amplmodel.pyx":540
+ *         for i in range(self.n_con):
+ *             cg = self.asl.i.Cgrad_[i]
+ *             while cg is not NULL:             # <<<<<<<<<<<<<<
+ *                 # a_irow.data[cg.goff] = i
+ *                 # a_icol.data[cg.goff] = cg.varno  # broken.
+ */
+    while (1) {
+      __pyx_t_10 = ((__pyx_v_cg != NULL) != 0);
+      if (!__pyx_t_10) break;
+
+      /* "nlp/model/src/_amplmodel.pyx":543
+ *                 # a_irow.data[cg.goff] = i
+ *                 # a_icol.data[cg.goff] = cg.varno  # broken.
+ *                 a_irow[cg.goff] = i             # <<<<<<<<<<<<<<
+ *                 a_icol[cg.goff] = cg.varno
+ *                 A[cg.goff] = cg.coef
+ */
+      __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 543; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      if (unlikely(__Pyx_SetItemInt(__pyx_v_a_irow, __pyx_v_cg->goff, __pyx_t_4, size_t, 0, __Pyx_PyInt_FromSize_t, 0, 0, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 543; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "nlp/model/src/_amplmodel.pyx":544
+ *                 # a_icol.data[cg.goff] = cg.varno  # broken.
+ *                 a_irow[cg.goff] = i
+ *                 a_icol[cg.goff] = cg.varno             # <<<<<<<<<<<<<<
+ *                 A[cg.goff] = cg.coef
+ *                 cg = cg.next
+ */
+      __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_cg->varno); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 544; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      if (unlikely(__Pyx_SetItemInt(__pyx_v_a_icol, __pyx_v_cg->goff, __pyx_t_4, size_t, 0, __Pyx_PyInt_FromSize_t, 0, 0, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 544; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "nlp/model/src/_amplmodel.pyx":545
+ *                 a_irow[cg.goff] = i
+ *                 a_icol[cg.goff] = cg.varno
+ *                 A[cg.goff] = cg.coef             # <<<<<<<<<<<<<<
+ *                 cg = cg.next
+ * 
+ */
+      __pyx_t_4 = PyFloat_FromDouble(__pyx_v_cg->coef); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 545; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      if (unlikely(__Pyx_SetItemInt(__pyx_v_A, __pyx_v_cg->goff, __pyx_t_4, size_t, 0, __Pyx_PyInt_FromSize_t, 0, 0, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 545; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "nlp/model/src/_amplmodel.pyx":546
+ *                 a_icol[cg.goff] = cg.varno
+ *                 A[cg.goff] = cg.coef
+ *                 cg = cg.next             # <<<<<<<<<<<<<<
+ * 
+ *         return (A, a_irow, a_icol)
+ */
+      __pyx_t_11 = __pyx_v_cg->next;
+      __pyx_v_cg = __pyx_t_11;
+    }
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":548
+ *                 cg = cg.next
+ * 
+ *         return (A, a_irow, a_icol)             # <<<<<<<<<<<<<<
+ * 
+ *     def eval_J(self, ndarray[np.double_t] x, int store_zeros=0):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 548; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_A);
+  __Pyx_GIVEREF(__pyx_v_A);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_A);
+  __Pyx_INCREF(__pyx_v_a_irow);
+  __Pyx_GIVEREF(__pyx_v_a_irow);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_a_irow);
+  __Pyx_INCREF(__pyx_v_a_icol);
+  __Pyx_GIVEREF(__pyx_v_a_icol);
+  PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_v_a_icol);
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "nlp/model/src/_amplmodel.pyx":523
+ *         return (idx, val)
+ * 
+ *     def eval_A(self, int store_zeros=0):             # <<<<<<<<<<<<<<
+ *         """
+ *         Evaluate Jacobian of LP.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_A", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_A);
+  __Pyx_XDECREF(__pyx_v_a_icol);
+  __Pyx_XDECREF(__pyx_v_a_irow);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nlp/model/src/_amplmodel.pyx":550
+ *         return (A, a_irow, a_icol)
+ * 
+ *     def eval_J(self, ndarray[np.double_t] x, int store_zeros=0):             # <<<<<<<<<<<<<<
+ *         """Evaluate sparse Jacobian."""
+ *         cdef:
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_59eval_J(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_58eval_J[] = "Evaluate sparse Jacobian.";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_59eval_J(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_x = 0;
+  CYTHON_UNUSED int __pyx_v_store_zeros;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("eval_J (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_x,&__pyx_n_s_store_zeros,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_store_zeros);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "eval_J") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 550; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_x = ((PyArrayObject *)values[0]);
+    if (values[1]) {
+      __pyx_v_store_zeros = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_store_zeros == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 550; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_store_zeros = ((int)0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("eval_J", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 550; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_J", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 550; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_58eval_J(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_x, __pyx_v_store_zeros);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_58eval_J(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, CYTHON_UNUSED int __pyx_v_store_zeros) {
+  PyArrayObject *__pyx_v_J = 0;
+  cgrad *__pyx_v_cg;
+  CYTHON_UNUSED int *__pyx_v_dims;
+  long __pyx_v_nnzj;
+  PyObject *__pyx_v_a_icol = NULL;
+  PyObject *__pyx_v_a_irow = NULL;
+  int __pyx_v_i;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_J;
+  __Pyx_Buffer __pyx_pybuffer_J;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_x;
+  __Pyx_Buffer __pyx_pybuffer_x;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1[2];
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyArrayObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  long __pyx_t_11;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyArrayObject *__pyx_t_14 = NULL;
+  int __pyx_t_15;
+  cgrad *__pyx_t_16;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("eval_J", 0);
+  __Pyx_INCREF((PyObject *)__pyx_v_x);
+  __pyx_pybuffer_J.pybuffer.buf = NULL;
+  __pyx_pybuffer_J.refcount = 0;
+  __pyx_pybuffernd_J.data = NULL;
+  __pyx_pybuffernd_J.rcbuffer = &__pyx_pybuffer_J;
+  __pyx_pybuffer_x.pybuffer.buf = NULL;
+  __pyx_pybuffer_x.refcount = 0;
+  __pyx_pybuffernd_x.data = NULL;
+  __pyx_pybuffernd_x.rcbuffer = &__pyx_pybuffer_x;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 550; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
+
+  /* "nlp/model/src/_amplmodel.pyx":560
+ *             # Variables needed for LL format.
+ *             cgrad* cg
+ *             int* dims = [self.n_con, self.n_var]             # <<<<<<<<<<<<<<
+ * 
+ *         # Ensure contiguous input.
+ */
+  __pyx_t_1[0] = __pyx_v_self->n_con;
+  __pyx_t_1[1] = __pyx_v_self->n_var;
+  __pyx_v_dims = __pyx_t_1;
+
+  /* "nlp/model/src/_amplmodel.pyx":563
+ * 
+ *         # Ensure contiguous input.
+ *         if not PyArray_ISCARRAY(x): x = x.copy()             # <<<<<<<<<<<<<<
+ * 
+ *         nnzj = self.nzc if self.n_con else 0
+ */
+  __pyx_t_2 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
+  if (__pyx_t_2) {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    if (__pyx_t_5) {
+      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else {
+      __pyx_t_3 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = ((PyArrayObject *)__pyx_t_3);
+    {
+      __Pyx_BufFmt_StackElem __pyx_stack[1];
+      __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+      __pyx_t_7 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
+      if (unlikely(__pyx_t_7 < 0)) {
+        PyErr_Fetch(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
+        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
+          Py_XDECREF(__pyx_t_8); Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_10);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+        }
+      }
+      __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
+      if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_3));
+    __pyx_t_3 = 0;
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":565
+ *         if not PyArray_ISCARRAY(x): x = x.copy()
+ * 
+ *         nnzj = self.nzc if self.n_con else 0             # <<<<<<<<<<<<<<
+ * 
+ *         # Allocate storage and evaluate Jacobian at x.
+ */
+  if ((__pyx_v_self->n_con != 0)) {
+    __pyx_t_11 = __pyx_v_self->nzc;
+  } else {
+    __pyx_t_11 = 0;
+  }
+  __pyx_v_nnzj = __pyx_t_11;
+
+  /* "nlp/model/src/_amplmodel.pyx":568
+ * 
+ *         # Allocate storage and evaluate Jacobian at x.
+ *         J = np.empty(nnzj, dtype=np.double)             # <<<<<<<<<<<<<<
+ *         if ampl_jacval(self.asl, <double*>x.data, <double*>J.data):
+ *             raise ValueError
+ */
+  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyInt_From_long(__pyx_v_nnzj); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_12 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_t_12, __pyx_n_s_double); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_13) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __pyx_t_13 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_13) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_13, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_14 = ((PyArrayObject *)__pyx_t_13);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_J.rcbuffer->pybuffer);
+    __pyx_t_7 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_J.rcbuffer->pybuffer, (PyObject*)__pyx_t_14, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
+    if (unlikely(__pyx_t_7 < 0)) {
+      PyErr_Fetch(&__pyx_t_10, &__pyx_t_9, &__pyx_t_8);
+      if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_J.rcbuffer->pybuffer, (PyObject*)__pyx_v_J, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
+        Py_XDECREF(__pyx_t_10); Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_8);
+        __Pyx_RaiseBufferFallbackError();
+      } else {
+        PyErr_Restore(__pyx_t_10, __pyx_t_9, __pyx_t_8);
+      }
+    }
+    __pyx_pybuffernd_J.diminfo[0].strides = __pyx_pybuffernd_J.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_J.diminfo[0].shape = __pyx_pybuffernd_J.rcbuffer->pybuffer.shape[0];
+    if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_t_14 = 0;
+  __pyx_v_J = ((PyArrayObject *)__pyx_t_13);
+  __pyx_t_13 = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":569
+ *         # Allocate storage and evaluate Jacobian at x.
+ *         J = np.empty(nnzj, dtype=np.double)
+ *         if ampl_jacval(self.asl, <double*>x.data, <double*>J.data):             # <<<<<<<<<<<<<<
+ *             raise ValueError
+ * 
+ */
+  __pyx_t_2 = (ampl_jacval(__pyx_v_self->asl, ((double *)__pyx_v_x->data), ((double *)__pyx_v_J->data)) != 0);
+  if (__pyx_t_2) {
+
+    /* "nlp/model/src/_amplmodel.pyx":570
+ *         J = np.empty(nnzj, dtype=np.double)
+ *         if ampl_jacval(self.asl, <double*>x.data, <double*>J.data):
+ *             raise ValueError             # <<<<<<<<<<<<<<
+ * 
+ *         a_icol = np.empty(nnzj, dtype=np.int)
+ */
+    __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 570; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "nlp/model/src/_amplmodel.pyx":569
+ *         # Allocate storage and evaluate Jacobian at x.
+ *         J = np.empty(nnzj, dtype=np.double)
+ *         if ampl_jacval(self.asl, <double*>x.data, <double*>J.data):             # <<<<<<<<<<<<<<
+ *             raise ValueError
+ * 
+ */
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":572
+ *             raise ValueError
+ * 
+ *         a_icol = np.empty(nnzj, dtype=np.int)             # <<<<<<<<<<<<<<
+ *         a_irow = np.empty(nnzj, dtype=np.int)
+ * 
+ */
+  __pyx_t_13 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_13);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_13, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __pyx_t_13 = __Pyx_PyInt_From_long(__pyx_v_nnzj); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_13);
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_13);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_13);
+  __pyx_t_13 = 0;
+  __pyx_t_13 = PyDict_New(); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_13);
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_12 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_t_13, __pyx_n_s_dtype, __pyx_t_12) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __pyx_t_12 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, __pyx_t_13); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __pyx_v_a_icol = __pyx_t_12;
+  __pyx_t_12 = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":573
+ * 
+ *         a_icol = np.empty(nnzj, dtype=np.int)
+ *         a_irow = np.empty(nnzj, dtype=np.int)             # <<<<<<<<<<<<<<
+ * 
+ *         for i in xrange(self.n_con):
+ */
+  __pyx_t_12 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 573; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_t_12, __pyx_n_s_empty); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 573; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __pyx_t_12 = __Pyx_PyInt_From_long(__pyx_v_nnzj); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 573; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 573; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_12);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_12);
+  __pyx_t_12 = 0;
+  __pyx_t_12 = PyDict_New(); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 573; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 573; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 573; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_12, __pyx_n_s_dtype, __pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 573; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_13, __pyx_t_5, __pyx_t_12); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 573; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __pyx_v_a_irow = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":575
+ *         a_irow = np.empty(nnzj, dtype=np.int)
+ * 
+ *         for i in xrange(self.n_con):             # <<<<<<<<<<<<<<
+ *             cg = self.asl.i.Cgrad_[i]
+ *             while cg is not NULL:
+ */
+  __pyx_t_7 = __pyx_v_self->n_con;
+  for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_7; __pyx_t_15+=1) {
+    __pyx_v_i = __pyx_t_15;
+
+    /* "nlp/model/src/_amplmodel.pyx":576
+ * 
+ *         for i in xrange(self.n_con):
+ *             cg = self.asl.i.Cgrad_[i]             # <<<<<<<<<<<<<<
+ *             while cg is not NULL:
+ *                 # a_irow.data[cg.goff] = i         # broken.
+ */
+    __pyx_v_cg = (__pyx_v_self->asl->i.Cgrad_[__pyx_v_i]);
+
+    /* "nlp/model/src/_amplmodel.pyx":577
+ *         for i in xrange(self.n_con):
+ *             cg = self.asl.i.Cgrad_[i]
+ *             while cg is not NULL:             # <<<<<<<<<<<<<<
+ *                 # a_irow.data[cg.goff] = i         # broken.
+ *                 # a_icol.data[cg.goff] = cg.varno
+ */
+    while (1) {
+      __pyx_t_2 = ((__pyx_v_cg != NULL) != 0);
+      if (!__pyx_t_2) break;
+
+      /* "nlp/model/src/_amplmodel.pyx":580
+ *                 # a_irow.data[cg.goff] = i         # broken.
+ *                 # a_icol.data[cg.goff] = cg.varno
+ *                 a_irow[cg.goff] = i             # <<<<<<<<<<<<<<
+ *                 a_icol[cg.goff] = cg.varno
+ *                 cg = cg.next
+ */
+      __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 580; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      if (unlikely(__Pyx_SetItemInt(__pyx_v_a_irow, __pyx_v_cg->goff, __pyx_t_4, size_t, 0, __Pyx_PyInt_FromSize_t, 0, 0, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 580; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "nlp/model/src/_amplmodel.pyx":581
+ *                 # a_icol.data[cg.goff] = cg.varno
+ *                 a_irow[cg.goff] = i
+ *                 a_icol[cg.goff] = cg.varno             # <<<<<<<<<<<<<<
+ *                 cg = cg.next
+ * 
+ */
+      __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_cg->varno); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 581; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      if (unlikely(__Pyx_SetItemInt(__pyx_v_a_icol, __pyx_v_cg->goff, __pyx_t_4, size_t, 0, __Pyx_PyInt_FromSize_t, 0, 0, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 581; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "nlp/model/src/_amplmodel.pyx":582
+ *                 a_irow[cg.goff] = i
+ *                 a_icol[cg.goff] = cg.varno
+ *                 cg = cg.next             # <<<<<<<<<<<<<<
+ * 
+ *         return (J, a_irow, a_icol)
+ */
+      __pyx_t_16 = __pyx_v_cg->next;
+      __pyx_v_cg = __pyx_t_16;
+    }
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":584
+ *                 cg = cg.next
+ * 
+ *         return (J, a_irow, a_icol)             # <<<<<<<<<<<<<<
+ * 
+ *     def get_J_pattern(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 584; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(((PyObject *)__pyx_v_J));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_J));
+  PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_v_J));
+  __Pyx_INCREF(__pyx_v_a_irow);
+  __Pyx_GIVEREF(__pyx_v_a_irow);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_a_irow);
+  __Pyx_INCREF(__pyx_v_a_icol);
+  __Pyx_GIVEREF(__pyx_v_a_icol);
+  PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_v_a_icol);
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "nlp/model/src/_amplmodel.pyx":550
+ *         return (A, a_irow, a_icol)
+ * 
+ *     def eval_J(self, ndarray[np.double_t] x, int store_zeros=0):             # <<<<<<<<<<<<<<
+ *         """Evaluate sparse Jacobian."""
+ *         cdef:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_J.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_J", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_J.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_J);
+  __Pyx_XDECREF(__pyx_v_a_icol);
+  __Pyx_XDECREF(__pyx_v_a_irow);
+  __Pyx_XDECREF((PyObject *)__pyx_v_x);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nlp/model/src/_amplmodel.pyx":586
+ *         return (J, a_irow, a_icol)
+ * 
+ *     def get_J_pattern(self):             # <<<<<<<<<<<<<<
+ *         """Return the sparsity pattern of the Jacobian in coordinate format.
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_61get_J_pattern(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_60get_J_pattern[] = "Return the sparsity pattern of the Jacobian in coordinate format.\n\n        The pattern does not depend on x and is ordered consistently with\n        the values returned by `eval_J_vals()`.";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_61get_J_pattern(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_J_pattern (wrapper)", 0);
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_60get_J_pattern(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_60get_J_pattern(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self) {
+  cgrad *__pyx_v_cg;
+  int __pyx_v_i;
+  long __pyx_v_nnzj;
+  PyObject *__pyx_v_a_icol = NULL;
+  PyObject *__pyx_v_a_irow = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  long __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  cgrad *__pyx_t_10;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_J_pattern", 0);
+
+  /* "nlp/model/src/_amplmodel.pyx":595
+ *             int i
+ * 
+ *         nnzj = self.nzc if self.n_con else 0             # <<<<<<<<<<<<<<
+ *         a_icol = np.empty(nnzj, dtype=np.int)
+ *         a_irow = np.empty(nnzj, dtype=np.int)
+ */
+  if ((__pyx_v_self->n_con != 0)) {
+    __pyx_t_1 = __pyx_v_self->nzc;
+  } else {
+    __pyx_t_1 = 0;
+  }
+  __pyx_v_nnzj = __pyx_t_1;
+
+  /* "nlp/model/src/_amplmodel.pyx":596
+ * 
+ *         nnzj = self.nzc if self.n_con else 0
+ *         a_icol = np.empty(nnzj, dtype=np.int)             # <<<<<<<<<<<<<<
+ *         a_irow = np.empty(nnzj, dtype=np.int)
+ * 
+ */
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 596; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 596; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_long(__pyx_v_nnzj); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 596; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 596; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 596; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 596; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 596; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 596; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, __pyx_t_2); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 596; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_a_icol = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":597
+ *         nnzj = self.nzc if self.n_con else 0
+ *         a_icol = np.empty(nnzj, dtype=np.int)
+ *         a_irow = np.empty(nnzj, dtype=np.int)             # <<<<<<<<<<<<<<
+ * 
+ *         for i in xrange(self.n_con):
+ */
+  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 597; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 597; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyInt_From_long(__pyx_v_nnzj); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 597; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 597; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_6);
+  __pyx_t_6 = 0;
+  __pyx_t_6 = PyDict_New(); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 597; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 597; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 597; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 597; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_4, __pyx_t_6); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 597; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_v_a_irow = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":599
+ *         a_irow = np.empty(nnzj, dtype=np.int)
+ * 
+ *         for i in xrange(self.n_con):             # <<<<<<<<<<<<<<
+ *             cg = self.asl.i.Cgrad_[i]
+ *             while cg is not NULL:
+ */
+  __pyx_t_7 = __pyx_v_self->n_con;
+  for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+    __pyx_v_i = __pyx_t_8;
+
+    /* "nlp/model/src/_amplmodel.pyx":600
+ * 
+ *         for i in xrange(self.n_con):
+ *             cg = self.asl.i.Cgrad_[i]             # <<<<<<<<<<<<<<
+ *             while cg is not NULL:
+ *                 a_irow[cg.goff] = i
+ */
+    __pyx_v_cg = (__pyx_v_self->asl->i.Cgrad_[__pyx_v_i]);
+
+    /* "nlp/model/src/_amplmodel.pyx":601
+ *         for i in xrange(self.n_con):
+ *             cg = self.asl.i.Cgrad_[i]
+ *             while cg is not NULL:             # <<<<<<<<<<<<<<
+ *                 a_irow[cg.goff] = i
+ *                 a_icol[cg.goff] = cg.varno
+ */
+    while (1) {
+      __pyx_t_9 = ((__pyx_v_cg != NULL) != 0);
+      if (!__pyx_t_9) break;
+
+      /* "nlp/model/src/_amplmodel.pyx":602
+ *             cg = self.asl.i.Cgrad_[i]
+ *             while cg is not NULL:
+ *                 a_irow[cg.goff] = i             # <<<<<<<<<<<<<<
+ *                 a_icol[cg.goff] = cg.varno
+ *                 cg = cg.next
+ */
+      __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      if (unlikely(__Pyx_SetItemInt(__pyx_v_a_irow, __pyx_v_cg->goff, __pyx_t_5, size_t, 0, __Pyx_PyInt_FromSize_t, 0, 0, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+      /* "nlp/model/src/_amplmodel.pyx":603
+ *             while cg is not NULL:
+ *                 a_irow[cg.goff] = i
+ *                 a_icol[cg.goff] = cg.varno             # <<<<<<<<<<<<<<
+ *                 cg = cg.next
+ * 
+ */
+      __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_cg->varno); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 603; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      if (unlikely(__Pyx_SetItemInt(__pyx_v_a_icol, __pyx_v_cg->goff, __pyx_t_5, size_t, 0, __Pyx_PyInt_FromSize_t, 0, 0, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 603; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+      /* "nlp/model/src/_amplmodel.pyx":604
+ *                 a_irow[cg.goff] = i
+ *                 a_icol[cg.goff] = cg.varno
+ *                 cg = cg.next             # <<<<<<<<<<<<<<
+ * 
+ *         return (a_irow, a_icol)
+ */
+      __pyx_t_10 = __pyx_v_cg->next;
+      __pyx_v_cg = __pyx_t_10;
+    }
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":606
+ *                 cg = cg.next
+ * 
+ *         return (a_irow, a_icol)             # <<<<<<<<<<<<<<
+ * 
+ *     def eval_J_vals(self, ndarray[np.double_t] x):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 606; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_INCREF(__pyx_v_a_irow);
+  __Pyx_GIVEREF(__pyx_v_a_irow);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_a_irow);
+  __Pyx_INCREF(__pyx_v_a_icol);
+  __Pyx_GIVEREF(__pyx_v_a_icol);
+  PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_v_a_icol);
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
+  goto __pyx_L0;
+
+  /* "nlp/model/src/_amplmodel.pyx":586
+ *         return (J, a_irow, a_icol)
+ * 
+ *     def get_J_pattern(self):             # <<<<<<<<<<<<<<
+ *         """Return the sparsity pattern of the Jacobian in coordinate format.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.get_J_pattern", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_a_icol);
+  __Pyx_XDECREF(__pyx_v_a_irow);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nlp/model/src/_amplmodel.pyx":608
+ *         return (a_irow, a_icol)
+ * 
+ *     def eval_J_vals(self, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
+ *         """Evaluate the nonzero values of the sparse Jacobian at x."""
+ *         cdef ndarray[np.double_t] J
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_63eval_J_vals(PyObject *__pyx_v_self, PyObject *__pyx_v_x); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_62eval_J_vals[] = "Evaluate the nonzero values of the sparse Jacobian at x.";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_63eval_J_vals(PyObject *__pyx_v_self, PyObject *__pyx_v_x) {
+  CYTHON_UNUSED int __pyx_lineno = 0;
+  CYTHON_UNUSED const char *__pyx_filename = NULL;
+  CYTHON_UNUSED int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("eval_J_vals (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 608; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_62eval_J_vals(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), ((PyArrayObject *)__pyx_v_x));
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_62eval_J_vals(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x) {
+  PyArrayObject *__pyx_v_J = 0;
+  long __pyx_v_nnzj;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_J;
+  __Pyx_Buffer __pyx_pybuffer_J;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_x;
+  __Pyx_Buffer __pyx_pybuffer_x;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyArrayObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  long __pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyArrayObject *__pyx_t_13 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("eval_J_vals", 0);
+  __Pyx_INCREF((PyObject *)__pyx_v_x);
+  __pyx_pybuffer_J.pybuffer.buf = NULL;
+  __pyx_pybuffer_J.refcount = 0;
+  __pyx_pybuffernd_J.data = NULL;
+  __pyx_pybuffernd_J.rcbuffer = &__pyx_pybuffer_J;
+  __pyx_pybuffer_x.pybuffer.buf = NULL;
+  __pyx_pybuffer_x.refcount = 0;
+  __pyx_pybuffernd_x.data = NULL;
+  __pyx_pybuffernd_x.rcbuffer = &__pyx_pybuffer_x;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 608; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
+
+  /* "nlp/model/src/_amplmodel.pyx":613
+ * 
+ *         # Ensure contiguous input.
+ *         if not PyArray_ISCARRAY(x): x = x.copy()             # <<<<<<<<<<<<<<
+ * 
+ *         nnzj = self.nzc if self.n_con else 0
+ */
+  __pyx_t_1 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
+  if (__pyx_t_1) {
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 613; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    if (__pyx_t_4) {
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 613; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    } else {
+      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 613; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 613; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = ((PyArrayObject *)__pyx_t_2);
+    {
+      __Pyx_BufFmt_StackElem __pyx_stack[1];
+      __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+      __pyx_t_6 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_t_5, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
+      if (unlikely(__pyx_t_6 < 0)) {
+        PyErr_Fetch(&__pyx_t_7, &__pyx_t_8, &__pyx_t_9);
+        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
+          Py_XDECREF(__pyx_t_7); Py_XDECREF(__pyx_t_8); Py_XDECREF(__pyx_t_9);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_7, __pyx_t_8, __pyx_t_9);
+        }
+      }
+      __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
+      if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 613; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __pyx_t_5 = 0;
+    __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_2));
+    __pyx_t_2 = 0;
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":615
+ *         if not PyArray_ISCARRAY(x): x = x.copy()
+ * 
+ *         nnzj = self.nzc if self.n_con else 0             # <<<<<<<<<<<<<<
+ *         J = np.empty(nnzj, dtype=np.double)
+ *         if ampl_jacval(self.asl, <double*>x.data, <double*>J.data):
+ */
+  if ((__pyx_v_self->n_con != 0)) {
+    __pyx_t_10 = __pyx_v_self->nzc;
+  } else {
+    __pyx_t_10 = 0;
+  }
+  __pyx_v_nnzj = __pyx_t_10;
+
+  /* "nlp/model/src/_amplmodel.pyx":616
+ * 
+ *         nnzj = self.nzc if self.n_con else 0
+ *         J = np.empty(nnzj, dtype=np.double)             # <<<<<<<<<<<<<<
+ *         if ampl_jacval(self.asl, <double*>x.data, <double*>J.data):
+ *             raise ValueError
+ */
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 616; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 616; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_long(__pyx_v_nnzj); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 616; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 616; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 616; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_11 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 616; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_12 = __Pyx_PyObject_GetAttrStr(__pyx_t_11, __pyx_n_s_double); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 616; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_12) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 616; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __pyx_t_12 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, __pyx_t_2); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 616; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (!(likely(((__pyx_t_12) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_12, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 616; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_13 = ((PyArrayObject *)__pyx_t_12);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_J.rcbuffer->pybuffer);
+    __pyx_t_6 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_J.rcbuffer->pybuffer, (PyObject*)__pyx_t_13, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
+    if (unlikely(__pyx_t_6 < 0)) {
+      PyErr_Fetch(&__pyx_t_9, &__pyx_t_8, &__pyx_t_7);
+      if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_J.rcbuffer->pybuffer, (PyObject*)__pyx_v_J, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
+        Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_8); Py_XDECREF(__pyx_t_7);
+        __Pyx_RaiseBufferFallbackError();
+      } else {
+        PyErr_Restore(__pyx_t_9, __pyx_t_8, __pyx_t_7);
+      }
+    }
+    __pyx_pybuffernd_J.diminfo[0].strides = __pyx_pybuffernd_J.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_J.diminfo[0].shape = __pyx_pybuffernd_J.rcbuffer->pybuffer.shape[0];
+    if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 616; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_t_13 = 0;
+  __pyx_v_J = ((PyArrayObject *)__pyx_t_12);
+  __pyx_t_12 = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":617
+ *         nnzj = self.nzc if self.n_con else 0
+ *         J = np.empty(nnzj, dtype=np.double)
+ *         if ampl_jacval(self.asl, <double*>x.data, <double*>J.data):             # <<<<<<<<<<<<<<
+ *             raise ValueError
+ *         return J
+ */
+  __pyx_t_1 = (ampl_jacval(__pyx_v_self->asl, ((double *)__pyx_v_x->data), ((double *)__pyx_v_J->data)) != 0);
+  if (__pyx_t_1) {
+
+    /* "nlp/model/src/_amplmodel.pyx":618
+ *         J = np.empty(nnzj, dtype=np.double)
+ *         if ampl_jacval(self.asl, <double*>x.data, <double*>J.data):
+ *             raise ValueError             # <<<<<<<<<<<<<<
+ *         return J
+ * 
+ */
+    __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 618; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "nlp/model/src/_amplmodel.pyx":617
+ *         nnzj = self.nzc if self.n_con else 0
+ *         J = np.empty(nnzj, dtype=np.double)
+ *         if ampl_jacval(self.asl, <double*>x.data, <double*>J.data):             # <<<<<<<<<<<<<<
+ *             raise ValueError
+ *         return J
+ */
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":619
+ *         if ampl_jacval(self.asl, <double*>x.data, <double*>J.data):
+ *             raise ValueError
+ *         return J             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_J));
+  __pyx_r = ((PyObject *)__pyx_v_J);
+  goto __pyx_L0;
+
+  /* "nlp/model/src/_amplmodel.pyx":608
+ *         return (a_irow, a_icol)
+ * 
+ *     def eval_J_vals(self, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
+ *         """Evaluate the nonzero values of the sparse Jacobian at x."""
+ *         cdef ndarray[np.double_t] J
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_J.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_J_vals", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_J.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_J);
+  __Pyx_XDECREF((PyObject *)__pyx_v_x);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nlp/model/src/_amplmodel.pyx":622
+ * 
+ * 
+ *     def eval_H(self, ndarray[np.double_t] x, ndarray[np.double_t] y,             # <<<<<<<<<<<<<<
+ *                double obj_weight=1.0, int store_zeros=0):
+ *         """Evaluate sparse upper triangle of Lagrangian Hessian.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_65eval_H(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_64eval_H[] = "Evaluate sparse upper triangle of Lagrangian Hessian.\n\n        In the future, we will want to be careful here, in case x has\n        changed but f(x), c(x) or J(x) have not yet been recomputed. In\n        such a case, Ampl has NOT updated the data structure for the\n        Hessian, and it will still hold the Hessian at the last point at\n        which, f, c or J were evaluated !";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_65eval_H(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_x = 0;
+  PyArrayObject *__pyx_v_y = 0;
+  double __pyx_v_obj_weight;
+  CYTHON_UNUSED int __pyx_v_store_zeros;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("eval_H (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_x,&__pyx_n_s_y,&__pyx_n_s_obj_weight,&__pyx_n_s_store_zeros,0};
+    PyObject* values[4] = {0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_y)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("eval_H", 0, 2, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_obj_weight);
+          if (value) { values[2] = value; kw_args--; }
+        }
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_store_zeros);
+          if (value) { values[3] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "eval_H") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_x = ((PyArrayObject *)values[0]);
+    __pyx_v_y = ((PyArrayObject *)values[1]);
+    if (values[2]) {
+      __pyx_v_obj_weight = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_obj_weight == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 623; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_obj_weight = ((double)1.0);
+    }
+    if (values[3]) {
+      __pyx_v_store_zeros = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_store_zeros == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 623; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_store_zeros = ((int)0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("eval_H", 0, 2, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_H", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_y), __pyx_ptype_5numpy_ndarray, 1, "y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_64eval_H(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_x, __pyx_v_y, __pyx_v_obj_weight, __pyx_v_store_zeros);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_64eval_H(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, PyArrayObject *__pyx_v_y, double __pyx_v_obj_weight, CYTHON_UNUSED int __pyx_v_store_zeros) {
+  PyArrayObject *__pyx_v_H = 0;
+  CYTHON_UNUSED int *__pyx_v_dims;
+  double __pyx_v_OW[1];
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_j0;
+  int __pyx_v_j1;
+  int __pyx_v_k;
+  int __pyx_v_nerror;
+  int __pyx_v_obj_num;
+  CYTHON_UNUSED double __pyx_v_val;
+  PyObject *__pyx_v_nnzh = NULL;
+  PyObject *__pyx_v_a_icol = NULL;
+  PyObject *__pyx_v_a_irow = NULL;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_H;
+  __Pyx_Buffer __pyx_pybuffer_H;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_x;
+  __Pyx_Buffer __pyx_pybuffer_x;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_y;
+  __Pyx_Buffer __pyx_pybuffer_y;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1[2];
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyArrayObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyArrayObject *__pyx_t_11 = NULL;
+  double __pyx_t_12;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyArrayObject *__pyx_t_15 = NULL;
+  int __pyx_t_16;
+  int __pyx_t_17;
+  int __pyx_t_18;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("eval_H", 0);
+  __Pyx_INCREF((PyObject *)__pyx_v_x);
+  __Pyx_INCREF((PyObject *)__pyx_v_y);
+  __pyx_pybuffer_H.pybuffer.buf = NULL;
+  __pyx_pybuffer_H.refcount = 0;
+  __pyx_pybuffernd_H.data = NULL;
+  __pyx_pybuffernd_H.rcbuffer = &__pyx_pybuffer_H;
+  __pyx_pybuffer_x.pybuffer.buf = NULL;
+  __pyx_pybuffer_x.refcount = 0;
+  __pyx_pybuffernd_x.data = NULL;
+  __pyx_pybuffernd_x.rcbuffer = &__pyx_pybuffer_x;
+  __pyx_pybuffer_y.pybuffer.buf = NULL;
+  __pyx_pybuffer_y.refcount = 0;
+  __pyx_pybuffernd_y.data = NULL;
+  __pyx_pybuffernd_y.rcbuffer = &__pyx_pybuffer_y;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_y.rcbuffer->pybuffer, (PyObject*)__pyx_v_y, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 622; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_y.diminfo[0].strides = __pyx_pybuffernd_y.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_y.diminfo[0].shape = __pyx_pybuffernd_y.rcbuffer->pybuffer.shape[0];
+
+  /* "nlp/model/src/_amplmodel.pyx":636
+ *             # Variables needed for LL format.
+ *             cgrad* cg
+ *             int* dims = [self.n_var, self.n_var]             # <<<<<<<<<<<<<<
+ * 
+ *             # Misc.
+ */
+  __pyx_t_1[0] = __pyx_v_self->n_var;
+  __pyx_t_1[1] = __pyx_v_self->n_var;
+  __pyx_v_dims = __pyx_t_1;
+
+  /* "nlp/model/src/_amplmodel.pyx":643
+ * 
+ *             # variables to compute extra objective function
+ *             int nerror = 0             # <<<<<<<<<<<<<<
+ *             int obj_num = 0
+ *             double val
+ */
+  __pyx_v_nerror = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":644
+ *             # variables to compute extra objective function
+ *             int nerror = 0
+ *             int obj_num = 0             # <<<<<<<<<<<<<<
+ *             double val
+ * 
+ */
+  __pyx_v_obj_num = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":648
+ * 
+ *         # Ensure contiguous input.
+ *         if not PyArray_ISCARRAY(x): x = x.copy()             # <<<<<<<<<<<<<<
+ *         if not PyArray_ISCARRAY(y): y = y.copy()
+ * 
+ */
+  __pyx_t_2 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
+  if (__pyx_t_2) {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 648; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    if (__pyx_t_5) {
+      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 648; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else {
+      __pyx_t_3 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 648; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 648; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = ((PyArrayObject *)__pyx_t_3);
+    {
+      __Pyx_BufFmt_StackElem __pyx_stack[1];
+      __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+      __pyx_t_7 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
+      if (unlikely(__pyx_t_7 < 0)) {
+        PyErr_Fetch(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
+        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
+          Py_XDECREF(__pyx_t_8); Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_10);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+        }
+      }
+      __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
+      if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 648; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_3));
+    __pyx_t_3 = 0;
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":649
+ *         # Ensure contiguous input.
+ *         if not PyArray_ISCARRAY(x): x = x.copy()
+ *         if not PyArray_ISCARRAY(y): y = y.copy()             # <<<<<<<<<<<<<<
+ * 
+ *         # extra objective evaluation.
+ */
+  __pyx_t_2 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_y)) != 0)) != 0);
+  if (__pyx_t_2) {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_y), __pyx_n_s_copy); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 649; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    if (__pyx_t_5) {
+      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 649; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else {
+      __pyx_t_3 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 649; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 649; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_11 = ((PyArrayObject *)__pyx_t_3);
+    {
+      __Pyx_BufFmt_StackElem __pyx_stack[1];
+      __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_y.rcbuffer->pybuffer);
+      __pyx_t_7 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_y.rcbuffer->pybuffer, (PyObject*)__pyx_t_11, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
+      if (unlikely(__pyx_t_7 < 0)) {
+        PyErr_Fetch(&__pyx_t_10, &__pyx_t_9, &__pyx_t_8);
+        if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_y.rcbuffer->pybuffer, (PyObject*)__pyx_v_y, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
+          Py_XDECREF(__pyx_t_10); Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_8);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_10, __pyx_t_9, __pyx_t_8);
+        }
+      }
+      __pyx_pybuffernd_y.diminfo[0].strides = __pyx_pybuffernd_y.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_y.diminfo[0].shape = __pyx_pybuffernd_y.rcbuffer->pybuffer.shape[0];
+      if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 649; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __pyx_t_11 = 0;
+    __Pyx_DECREF_SET(__pyx_v_y, ((PyArrayObject *)__pyx_t_3));
+    __pyx_t_3 = 0;
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":652
+ * 
+ *         # extra objective evaluation.
+ *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)             # <<<<<<<<<<<<<<
+ *         if nerror:
+ *             raise ValueError
+ */
+  __pyx_v_val = ampl_objval(__pyx_v_self->asl, __pyx_v_obj_num, ((double *)__pyx_v_x->data), (&__pyx_v_nerror));
+
+  /* "nlp/model/src/_amplmodel.pyx":653
+ *         # extra objective evaluation.
+ *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
+ *         if nerror:             # <<<<<<<<<<<<<<
+ *             raise ValueError
+ * 
+ */
+  __pyx_t_2 = (__pyx_v_nerror != 0);
+  if (__pyx_t_2) {
+
+    /* "nlp/model/src/_amplmodel.pyx":654
+ *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
+ *         if nerror:
+ *             raise ValueError             # <<<<<<<<<<<<<<
+ * 
+ *         # Determine room for Hessian and objective sign if maximizing.
+ */
+    __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 654; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "nlp/model/src/_amplmodel.pyx":653
+ *         # extra objective evaluation.
+ *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
+ *         if nerror:             # <<<<<<<<<<<<<<
+ *             raise ValueError
+ * 
+ */
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":657
+ * 
+ *         # Determine room for Hessian and objective sign if maximizing.
+ *         nnzh = self.get_nnzh()             # <<<<<<<<<<<<<<
+ *         OW[0] = obj_weight if self.objtype == 0 else -obj_weight
+ * 
+ */
+  __pyx_t_3 = ((struct __pyx_vtabstruct_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self->__pyx_vtab)->get_nnzh(__pyx_v_self, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 657; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_nnzh = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":658
+ *         # Determine room for Hessian and objective sign if maximizing.
+ *         nnzh = self.get_nnzh()
+ *         OW[0] = obj_weight if self.objtype == 0 else -obj_weight             # <<<<<<<<<<<<<<
+ * 
+ *         # Allocate storage and evaluate Hessian.
+ */
+  if (((__pyx_v_self->objtype == 0) != 0)) {
+    __pyx_t_12 = __pyx_v_obj_weight;
+  } else {
+    __pyx_t_12 = (-__pyx_v_obj_weight);
+  }
+  (__pyx_v_OW[0]) = __pyx_t_12;
+
+  /* "nlp/model/src/_amplmodel.pyx":661
+ * 
+ *         # Allocate storage and evaluate Hessian.
+ *         H = np.empty(nnzh, dtype=np.double)             # <<<<<<<<<<<<<<
+ *         # Note that AMPL is evaluating a UPPER triangular Hessian.
+ *         ampl_sphes(self.asl, <double*>H.data, -1, OW, <double*>y.data)
+ */
+  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_v_nnzh);
+  __Pyx_GIVEREF(__pyx_v_nnzh);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_nnzh);
+  __pyx_t_5 = PyDict_New(); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_13 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_13);
+  __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_t_13, __pyx_n_s_double); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_14);
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_dtype, __pyx_t_14) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __pyx_t_14 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_14);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (!(likely(((__pyx_t_14) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_14, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_15 = ((PyArrayObject *)__pyx_t_14);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_H.rcbuffer->pybuffer);
+    __pyx_t_7 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_H.rcbuffer->pybuffer, (PyObject*)__pyx_t_15, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
+    if (unlikely(__pyx_t_7 < 0)) {
+      PyErr_Fetch(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
+      if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_H.rcbuffer->pybuffer, (PyObject*)__pyx_v_H, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
+        Py_XDECREF(__pyx_t_8); Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_10);
+        __Pyx_RaiseBufferFallbackError();
+      } else {
+        PyErr_Restore(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+      }
+    }
+    __pyx_pybuffernd_H.diminfo[0].strides = __pyx_pybuffernd_H.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_H.diminfo[0].shape = __pyx_pybuffernd_H.rcbuffer->pybuffer.shape[0];
+    if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_t_15 = 0;
+  __pyx_v_H = ((PyArrayObject *)__pyx_t_14);
+  __pyx_t_14 = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":663
+ *         H = np.empty(nnzh, dtype=np.double)
+ *         # Note that AMPL is evaluating a UPPER triangular Hessian.
+ *         ampl_sphes(self.asl, <double*>H.data, -1, OW, <double*>y.data)             # <<<<<<<<<<<<<<
+ * 
+ *         a_icol = np.empty(nnzh, dtype=np.int)
+ */
+  ampl_sphes(__pyx_v_self->asl, ((double *)__pyx_v_H->data), -1, __pyx_v_OW, ((double *)__pyx_v_y->data));
+
+  /* "nlp/model/src/_amplmodel.pyx":665
+ *         ampl_sphes(self.asl, <double*>H.data, -1, OW, <double*>y.data)
+ * 
+ *         a_icol = np.empty(nnzh, dtype=np.int)             # <<<<<<<<<<<<<<
+ *         a_irow = np.empty(nnzh, dtype=np.int)
+ * 
+ */
+  __pyx_t_14 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 665; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_14);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_14, __pyx_n_s_empty); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 665; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __pyx_t_14 = PyTuple_New(1); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 665; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_14);
+  __Pyx_INCREF(__pyx_v_nnzh);
+  __Pyx_GIVEREF(__pyx_v_nnzh);
+  PyTuple_SET_ITEM(__pyx_t_14, 0, __pyx_v_nnzh);
+  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 665; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 665; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 665; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_13) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 665; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __pyx_t_13 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_14, __pyx_t_3); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 665; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_a_icol = __pyx_t_13;
+  __pyx_t_13 = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":666
+ * 
+ *         a_icol = np.empty(nnzh, dtype=np.int)
+ *         a_irow = np.empty(nnzh, dtype=np.int)             # <<<<<<<<<<<<<<
+ * 
+ *         k = 0
+ */
+  __pyx_t_13 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 666; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_13);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_13, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 666; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __pyx_t_13 = PyTuple_New(1); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 666; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_INCREF(__pyx_v_nnzh);
+  __Pyx_GIVEREF(__pyx_v_nnzh);
+  PyTuple_SET_ITEM(__pyx_t_13, 0, __pyx_v_nnzh);
+  __pyx_t_14 = PyDict_New(); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 666; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_14);
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 666; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 666; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_14, __pyx_n_s_dtype, __pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 666; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_13, __pyx_t_14); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 666; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __pyx_v_a_irow = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":668
+ *         a_irow = np.empty(nnzh, dtype=np.int)
+ * 
+ *         k = 0             # <<<<<<<<<<<<<<
+ *         for i in xrange(self.n_var):
+ *             j0 = self.asl.i.sputinfo_.hcolstarts[i  ]
+ */
+  __pyx_v_k = 0;
+
+  /* "nlp/model/src/_amplmodel.pyx":669
+ * 
+ *         k = 0
+ *         for i in xrange(self.n_var):             # <<<<<<<<<<<<<<
+ *             j0 = self.asl.i.sputinfo_.hcolstarts[i  ]
+ *             j1 = self.asl.i.sputinfo_.hcolstarts[i+1]
+ */
+  __pyx_t_7 = __pyx_v_self->n_var;
+  for (__pyx_t_16 = 0; __pyx_t_16 < __pyx_t_7; __pyx_t_16+=1) {
+    __pyx_v_i = __pyx_t_16;
+
+    /* "nlp/model/src/_amplmodel.pyx":670
+ *         k = 0
+ *         for i in xrange(self.n_var):
+ *             j0 = self.asl.i.sputinfo_.hcolstarts[i  ]             # <<<<<<<<<<<<<<
+ *             j1 = self.asl.i.sputinfo_.hcolstarts[i+1]
+ *             for j in xrange(j0,j1):
+ */
+    __pyx_v_j0 = (__pyx_v_self->asl->i.sputinfo_->hcolstarts[__pyx_v_i]);
+
+    /* "nlp/model/src/_amplmodel.pyx":671
+ *         for i in xrange(self.n_var):
+ *             j0 = self.asl.i.sputinfo_.hcolstarts[i  ]
+ *             j1 = self.asl.i.sputinfo_.hcolstarts[i+1]             # <<<<<<<<<<<<<<
+ *             for j in xrange(j0,j1):
+ *                 # a_irow.data[k] = self.asl.i.sputinfo_.hrownos[j]
+ */
+    __pyx_v_j1 = (__pyx_v_self->asl->i.sputinfo_->hcolstarts[(__pyx_v_i + 1)]);
+
+    /* "nlp/model/src/_amplmodel.pyx":672
+ *             j0 = self.asl.i.sputinfo_.hcolstarts[i  ]
+ *             j1 = self.asl.i.sputinfo_.hcolstarts[i+1]
+ *             for j in xrange(j0,j1):             # <<<<<<<<<<<<<<
+ *                 # a_irow.data[k] = self.asl.i.sputinfo_.hrownos[j]
+ *                 # a_icol.data[k] = i  # broken.
+ */
+    __pyx_t_17 = __pyx_v_j1;
+    for (__pyx_t_18 = __pyx_v_j0; __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
+      __pyx_v_j = __pyx_t_18;
+
+      /* "nlp/model/src/_amplmodel.pyx":675
+ *                 # a_irow.data[k] = self.asl.i.sputinfo_.hrownos[j]
+ *                 # a_icol.data[k] = i  # broken.
+ *                 a_icol[k] = self.asl.i.sputinfo_.hrownos[j]             # <<<<<<<<<<<<<<
+ *                 a_irow[k] = i
+ *                 k += 1
+ */
+      __pyx_t_4 = __Pyx_PyInt_From_int((__pyx_v_self->asl->i.sputinfo_->hrownos[__pyx_v_j])); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 675; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      if (unlikely(__Pyx_SetItemInt(__pyx_v_a_icol, __pyx_v_k, __pyx_t_4, int, 1, __Pyx_PyInt_From_int, 0, 1, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 675; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "nlp/model/src/_amplmodel.pyx":676
+ *                 # a_icol.data[k] = i  # broken.
+ *                 a_icol[k] = self.asl.i.sputinfo_.hrownos[j]
+ *                 a_irow[k] = i             # <<<<<<<<<<<<<<
+ *                 k += 1
+ * 
+ */
+      __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 676; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      if (unlikely(__Pyx_SetItemInt(__pyx_v_a_irow, __pyx_v_k, __pyx_t_4, int, 1, __Pyx_PyInt_From_int, 0, 1, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 676; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "nlp/model/src/_amplmodel.pyx":677
+ *                 a_icol[k] = self.asl.i.sputinfo_.hrownos[j]
+ *                 a_irow[k] = i
+ *                 k += 1             # <<<<<<<<<<<<<<
+ * 
+ *         return (H, a_irow, a_icol)
+ */
+      __pyx_v_k = (__pyx_v_k + 1);
+    }
+  }
+
+  /* "nlp/model/src/_amplmodel.pyx":679
+ *                 k += 1
+ * 
+ *         return (H, a_irow, a_icol)             # <<<<<<<<<<<<<<
+ * 
+ *     def get_H_pattern(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 679; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(((PyObject *)__pyx_v_H));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_H));
+  PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_v_H));
+  __Pyx_INCREF(__pyx_v_a_irow);
+  __Pyx_GIVEREF(__pyx_v_a_irow);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_a_irow);
+  __Pyx_INCREF(__pyx_v_a_icol);
+  __Pyx_GIVEREF(__pyx_v_a_icol);
+  PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_v_a_icol);
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "nlp/model/src/_amplmodel.pyx":622
+ * 
+ * 
+ *     def eval_H(self, ndarray[np.double_t] x, ndarray[np.double_t] y,             # <<<<<<<<<<<<<<
+ *                double obj_weight=1.0, int store_zeros=0):
+ *         """Evaluate sparse upper triangle of Lagrangian Hessian.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_H.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_y.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_H", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_H.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_y.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_H);
+  __Pyx_XDECREF(__pyx_v_nnzh);
+  __Pyx_XDECREF(__pyx_v_a_icol);
+  __Pyx_XDECREF(__pyx_v_a_irow);
+  __Pyx_XDECREF((PyObject *)__pyx_v_x);
+  __Pyx_XDECREF((PyObject *)__pyx_v_y);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nlp/model/src/_amplmodel.pyx":681
+ *         return (H, a_irow, a_icol)
+ * 
+ *     def get_H_pattern(self):             # <<<<<<<<<<<<<<
+ *         """Return the sparsity pattern of the lower triangle of the Lagrangian
+ *         Hessian in coordinate format.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_67get_H_pattern(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_66get_H_pattern[] = "Return the sparsity pattern of the lower triangle of the Lagrangian\n        Hessian in coordinate format.\n\n        The pattern does not depend on (x, y) and is ordered consistently with\n        the values returned by `eval_H_vals()`.";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_67get_H_pattern(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_H_pattern (wrapper)", 0);
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_66get_H_pattern(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_66get_H_pattern(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self) {
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_k;
+  PyObject *__pyx_v_nnzh = NULL;
+  PyObject *__pyx_v_a_icol = NULL;
+  PyObject *__pyx_v_a_irow = NULL;
+  int __pyx_v_j0;
+  int __pyx_v_j1;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_H_pattern", 0);
 
-    /* "nlp/model/src/_amplmodel.pyx":469
- *         # Allocate storage and evaluate Jacobian at x.
- *         J = np.empty(nnzj, dtype=np.double)
- *         if ampl_jacval(self.asl, <double*>x.data, <double*>J.data):             # <<<<<<<<<<<<<<
- *             raise ValueError
+  /* "nlp/model/src/_amplmodel.pyx":689
+ *         cdef int i, j, k
  * 
+ *         nnzh = self.get_nnzh()             # <<<<<<<<<<<<<<
+ *         a_icol = np.empty(nnzh, dtype=np.int)
+ *         a_irow = np.empty(nnzh, dtype=np.int)
  */
-  }
+  __pyx_t_1 = ((struct __pyx_vtabstruct_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self->__pyx_vtab)->get_nnzh(__pyx_v_self, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 689; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_nnzh = __pyx_t_1;
+  __pyx_t_1 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":472
- *             raise ValueError
+  /* "nlp/model/src/_amplmodel.pyx":690
  * 
- *         a_icol = np.empty(nnzj, dtype=np.int)             # <<<<<<<<<<<<<<
- *         a_irow = np.empty(nnzj, dtype=np.int)
+ *         nnzh = self.get_nnzh()
+ *         a_icol = np.empty(nnzh, dtype=np.int)             # <<<<<<<<<<<<<<
+ *         a_irow = np.empty(nnzh, dtype=np.int)
  * 
  */
-  __pyx_t_13 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 472; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_13);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_13, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 472; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 690; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 690; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 690; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_nnzh);
+  __Pyx_GIVEREF(__pyx_v_nnzh);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_nnzh);
+  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 690; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-  __pyx_t_13 = __Pyx_PyInt_From_long(__pyx_v_nnzj); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 472; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_13);
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 472; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GIVEREF(__pyx_t_13);
-  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_13);
-  __pyx_t_13 = 0;
-  __pyx_t_13 = PyDict_New(); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 472; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_13);
-  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 472; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 690; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_12 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 472; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 690; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_t_13, __pyx_n_s_dtype, __pyx_t_12) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 472; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-  __pyx_t_12 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, __pyx_t_13); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 472; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_12);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 690; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-  __pyx_v_a_icol = __pyx_t_12;
-  __pyx_t_12 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 690; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_a_icol = __pyx_t_5;
+  __pyx_t_5 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":473
- * 
- *         a_icol = np.empty(nnzj, dtype=np.int)
- *         a_irow = np.empty(nnzj, dtype=np.int)             # <<<<<<<<<<<<<<
+  /* "nlp/model/src/_amplmodel.pyx":691
+ *         nnzh = self.get_nnzh()
+ *         a_icol = np.empty(nnzh, dtype=np.int)
+ *         a_irow = np.empty(nnzh, dtype=np.int)             # <<<<<<<<<<<<<<
  * 
- *         for i in xrange(self.n_con):
+ *         k = 0
  */
-  __pyx_t_12 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_12);
-  __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_t_12, __pyx_n_s_empty); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_13);
-  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-  __pyx_t_12 = __Pyx_PyInt_From_long(__pyx_v_nnzj); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_12);
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 691; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GIVEREF(__pyx_t_12);
-  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_12);
-  __pyx_t_12 = 0;
-  __pyx_t_12 = PyDict_New(); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_12);
-  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 691; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 691; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_INCREF(__pyx_v_nnzh);
+  __Pyx_GIVEREF(__pyx_v_nnzh);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_nnzh);
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 691; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 691; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_int); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 691; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_12, __pyx_n_s_dtype, __pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 691; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_13, __pyx_t_5, __pyx_t_12); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, __pyx_t_1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 691; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_a_irow = __pyx_t_4;
   __pyx_t_4 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":475
- *         a_irow = np.empty(nnzj, dtype=np.int)
+  /* "nlp/model/src/_amplmodel.pyx":693
+ *         a_irow = np.empty(nnzh, dtype=np.int)
  * 
- *         for i in xrange(self.n_con):             # <<<<<<<<<<<<<<
- *             cg = self.asl.i.Cgrad_[i]
- *             while cg is not NULL:
+ *         k = 0             # <<<<<<<<<<<<<<
+ *         for i in xrange(self.n_var):
+ *             j0 = self.asl.i.sputinfo_.hcolstarts[i  ]
  */
-  __pyx_t_7 = __pyx_v_self->n_con;
-  for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_7; __pyx_t_15+=1) {
-    __pyx_v_i = __pyx_t_15;
+  __pyx_v_k = 0;
 
-    /* "nlp/model/src/_amplmodel.pyx":476
+  /* "nlp/model/src/_amplmodel.pyx":694
  * 
- *         for i in xrange(self.n_con):
- *             cg = self.asl.i.Cgrad_[i]             # <<<<<<<<<<<<<<
- *             while cg is not NULL:
- *                 # a_irow.data[cg.goff] = i         # broken.
+ *         k = 0
+ *         for i in xrange(self.n_var):             # <<<<<<<<<<<<<<
+ *             j0 = self.asl.i.sputinfo_.hcolstarts[i  ]
+ *             j1 = self.asl.i.sputinfo_.hcolstarts[i+1]
  */
-    __pyx_v_cg = (__pyx_v_self->asl->i.Cgrad_[__pyx_v_i]);
+  __pyx_t_6 = __pyx_v_self->n_var;
+  for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+    __pyx_v_i = __pyx_t_7;
 
-    /* "nlp/model/src/_amplmodel.pyx":477
- *         for i in xrange(self.n_con):
- *             cg = self.asl.i.Cgrad_[i]
- *             while cg is not NULL:             # <<<<<<<<<<<<<<
- *                 # a_irow.data[cg.goff] = i         # broken.
- *                 # a_icol.data[cg.goff] = cg.varno
+    /* "nlp/model/src/_amplmodel.pyx":695
+ *         k = 0
+ *         for i in xrange(self.n_var):
+ *             j0 = self.asl.i.sputinfo_.hcolstarts[i  ]             # <<<<<<<<<<<<<<
+ *             j1 = self.asl.i.sputinfo_.hcolstarts[i+1]
+ *             for j in xrange(j0,j1):
  */
-    while (1) {
-      __pyx_t_2 = ((__pyx_v_cg != NULL) != 0);
-      if (!__pyx_t_2) break;
+    __pyx_v_j0 = (__pyx_v_self->asl->i.sputinfo_->hcolstarts[__pyx_v_i]);
 
-      /* "nlp/model/src/_amplmodel.pyx":480
- *                 # a_irow.data[cg.goff] = i         # broken.
- *                 # a_icol.data[cg.goff] = cg.varno
- *                 a_irow[cg.goff] = i             # <<<<<<<<<<<<<<
- *                 a_icol[cg.goff] = cg.varno
- *                 cg = cg.next
+    /* "nlp/model/src/_amplmodel.pyx":696
+ *         for i in xrange(self.n_var):
+ *             j0 = self.asl.i.sputinfo_.hcolstarts[i  ]
+ *             j1 = self.asl.i.sputinfo_.hcolstarts[i+1]             # <<<<<<<<<<<<<<
+ *             for j in xrange(j0,j1):
+ *                 a_icol[k] = self.asl.i.sputinfo_.hrownos[j]
+ */
+    __pyx_v_j1 = (__pyx_v_self->asl->i.sputinfo_->hcolstarts[(__pyx_v_i + 1)]);
+
+    /* "nlp/model/src/_amplmodel.pyx":697
+ *             j0 = self.asl.i.sputinfo_.hcolstarts[i  ]
+ *             j1 = self.asl.i.sputinfo_.hcolstarts[i+1]
+ *             for j in xrange(j0,j1):             # <<<<<<<<<<<<<<
+ *                 a_icol[k] = self.asl.i.sputinfo_.hrownos[j]
+ *                 a_irow[k] = i
+ */
+    __pyx_t_8 = __pyx_v_j1;
+    for (__pyx_t_9 = __pyx_v_j0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+      __pyx_v_j = __pyx_t_9;
+
+      /* "nlp/model/src/_amplmodel.pyx":698
+ *             j1 = self.asl.i.sputinfo_.hcolstarts[i+1]
+ *             for j in xrange(j0,j1):
+ *                 a_icol[k] = self.asl.i.sputinfo_.hrownos[j]             # <<<<<<<<<<<<<<
+ *                 a_irow[k] = i
+ *                 k += 1
  */
-      __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 480; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = __Pyx_PyInt_From_int((__pyx_v_self->asl->i.sputinfo_->hrownos[__pyx_v_j])); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 698; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
-      if (unlikely(__Pyx_SetItemInt(__pyx_v_a_irow, __pyx_v_cg->goff, __pyx_t_4, size_t, 0, __Pyx_PyInt_FromSize_t, 0, 0, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 480; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (unlikely(__Pyx_SetItemInt(__pyx_v_a_icol, __pyx_v_k, __pyx_t_4, int, 1, __Pyx_PyInt_From_int, 0, 1, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 698; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-      /* "nlp/model/src/_amplmodel.pyx":481
- *                 # a_icol.data[cg.goff] = cg.varno
- *                 a_irow[cg.goff] = i
- *                 a_icol[cg.goff] = cg.varno             # <<<<<<<<<<<<<<
- *                 cg = cg.next
+      /* "nlp/model/src/_amplmodel.pyx":699
+ *             for j in xrange(j0,j1):
+ *                 a_icol[k] = self.asl.i.sputinfo_.hrownos[j]
+ *                 a_irow[k] = i             # <<<<<<<<<<<<<<
+ *                 k += 1
  * 
  */
-      __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_cg->varno); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 481; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 699; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
-      if (unlikely(__Pyx_SetItemInt(__pyx_v_a_icol, __pyx_v_cg->goff, __pyx_t_4, size_t, 0, __Pyx_PyInt_FromSize_t, 0, 0, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 481; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (unlikely(__Pyx_SetItemInt(__pyx_v_a_irow, __pyx_v_k, __pyx_t_4, int, 1, __Pyx_PyInt_From_int, 0, 1, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 699; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-      /* "nlp/model/src/_amplmodel.pyx":482
- *                 a_irow[cg.goff] = i
- *                 a_icol[cg.goff] = cg.varno
- *                 cg = cg.next             # <<<<<<<<<<<<<<
+      /* "nlp/model/src/_amplmodel.pyx":700
+ *                 a_icol[k] = self.asl.i.sputinfo_.hrownos[j]
+ *                 a_irow[k] = i
+ *                 k += 1             # <<<<<<<<<<<<<<
  * 
- *         return (J, a_irow, a_icol)
+ *         return (a_irow, a_icol)
  */
-      __pyx_t_16 = __pyx_v_cg->next;
-      __pyx_v_cg = __pyx_t_16;
+      __pyx_v_k = (__pyx_v_k + 1);
     }
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":484
- *                 cg = cg.next
- * 
- *         return (J, a_irow, a_icol)             # <<<<<<<<<<<<<<
+  /* "nlp/model/src/_amplmodel.pyx":702
+ *                 k += 1
  * 
+ *         return (a_irow, a_icol)             # <<<<<<<<<<<<<<
  * 
+ *     def eval_H_vals(self, ndarray[np.double_t] x, ndarray[np.double_t] y,
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 484; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 702; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_INCREF(((PyObject *)__pyx_v_J));
-  __Pyx_GIVEREF(((PyObject *)__pyx_v_J));
-  PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_v_J));
   __Pyx_INCREF(__pyx_v_a_irow);
   __Pyx_GIVEREF(__pyx_v_a_irow);
-  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_a_irow);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_a_irow);
   __Pyx_INCREF(__pyx_v_a_icol);
   __Pyx_GIVEREF(__pyx_v_a_icol);
-  PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_v_a_icol);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_a_icol);
   __pyx_r = __pyx_t_4;
   __pyx_t_4 = 0;
   goto __pyx_L0;
 
-  /* "nlp/model/src/_amplmodel.pyx":450
- *         return (A, a_irow, a_icol)
+  /* "nlp/model/src/_amplmodel.pyx":681
+ *         return (H, a_irow, a_icol)
  * 
- *     def eval_J(self, ndarray[np.double_t] x, int store_zeros=0):             # <<<<<<<<<<<<<<
- *         """Evaluate sparse Jacobian."""
- *         cdef:
+ *     def get_H_pattern(self):             # <<<<<<<<<<<<<<
+ *         """Return the sparsity pattern of the lower triangle of the Lagrangian
+ *         Hessian in coordinate format.
  */
 
   /* function exit code */
   __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_12);
-  __Pyx_XDECREF(__pyx_t_13);
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_J.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_J", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.get_H_pattern", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
-  goto __pyx_L2;
   __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_J.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
-  __pyx_L2:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_J);
+  __Pyx_XDECREF(__pyx_v_nnzh);
   __Pyx_XDECREF(__pyx_v_a_icol);
   __Pyx_XDECREF(__pyx_v_a_irow);
-  __Pyx_XDECREF((PyObject *)__pyx_v_x);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":487
- * 
+/* "nlp/model/src/_amplmodel.pyx":704
+ *         return (a_irow, a_icol)
  * 
- *     def eval_H(self, ndarray[np.double_t] x, ndarray[np.double_t] y,             # <<<<<<<<<<<<<<
- *                double obj_weight=1.0, int store_zeros=0):
- *         """Evaluate sparse upper triangle of Lagrangian Hessian.
+ *     def eval_H_vals(self, ndarray[np.double_t] x, ndarray[np.double_t] y,             # <<<<<<<<<<<<<<
+ *                     double obj_weight=1.0):
+ *         """Evaluate the nonzero values of the sparse Lagrangian Hessian.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_47eval_H(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_46eval_H[] = "Evaluate sparse upper triangle of Lagrangian Hessian.\n\n        In the future, we will want to be careful here, in case x has\n        changed but f(x), c(x) or J(x) have not yet been recomputed. In\n        such a case, Ampl has NOT updated the data structure for the\n        Hessian, and it will still hold the Hessian at the last point at\n        which, f, c or J were evaluated !";
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_47eval_H(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_69eval_H_vals(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_68eval_H_vals[] = "Evaluate the nonzero values of the sparse Lagrangian Hessian.\n\n        See `eval_H()` for caveats regarding the point at which the Hessian\n        is evaluated.";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_69eval_H_vals(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyArrayObject *__pyx_v_x = 0;
   PyArrayObject *__pyx_v_y = 0;
   double __pyx_v_obj_weight;
-  CYTHON_UNUSED int __pyx_v_store_zeros;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("eval_H (wrapper)", 0);
+  __Pyx_RefNannySetupContext("eval_H_vals (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_x,&__pyx_n_s_y,&__pyx_n_s_obj_weight,&__pyx_n_s_store_zeros,0};
-    PyObject* values[4] = {0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_x,&__pyx_n_s_y,&__pyx_n_s_obj_weight,0};
+    PyObject* values[3] = {0,0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
@@ -6543,25 +9907,19 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_47eval_H(PyObject
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_y)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("eval_H", 0, 2, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 487; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("eval_H_vals", 0, 2, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 704; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (kw_args > 0) {
           PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_obj_weight);
           if (value) { values[2] = value; kw_args--; }
         }
-        case  3:
-        if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_store_zeros);
-          if (value) { values[3] = value; kw_args--; }
-        }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "eval_H") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 487; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "eval_H_vals") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 704; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
         values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
@@ -6572,27 +9930,22 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_47eval_H(PyObject
     __pyx_v_x = ((PyArrayObject *)values[0]);
     __pyx_v_y = ((PyArrayObject *)values[1]);
     if (values[2]) {
-      __pyx_v_obj_weight = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_obj_weight == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 488; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_obj_weight = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_obj_weight == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 705; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
       __pyx_v_obj_weight = ((double)1.0);
     }
-    if (values[3]) {
-      __pyx_v_store_zeros = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_store_zeros == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 488; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    } else {
-      __pyx_v_store_zeros = ((int)0);
-    }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("eval_H", 0, 2, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 487; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("eval_H_vals", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 704; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_H", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_H_vals", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 487; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_y), __pyx_ptype_5numpy_ndarray, 1, "y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 487; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_46eval_H(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_x, __pyx_v_y, __pyx_v_obj_weight, __pyx_v_store_zeros);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 704; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_y), __pyx_ptype_5numpy_ndarray, 1, "y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 704; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_68eval_H_vals(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_x, __pyx_v_y, __pyx_v_obj_weight);
 
   /* function exit code */
   goto __pyx_L0;
@@ -6603,21 +9956,13 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_47eval_H(PyObject
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_46eval_H(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, PyArrayObject *__pyx_v_y, double __pyx_v_obj_weight, CYTHON_UNUSED int __pyx_v_store_zeros) {
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_68eval_H_vals(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, PyArrayObject *__pyx_v_y, double __pyx_v_obj_weight) {
   PyArrayObject *__pyx_v_H = 0;
-  CYTHON_UNUSED int *__pyx_v_dims;
   double __pyx_v_OW[1];
-  int __pyx_v_i;
-  int __pyx_v_j;
-  int __pyx_v_j0;
-  int __pyx_v_j1;
-  int __pyx_v_k;
   int __pyx_v_nerror;
   int __pyx_v_obj_num;
-  CYTHON_UNUSED double __pyx_v_obj;
+  CYTHON_UNUSED double __pyx_v_val;
   PyObject *__pyx_v_nnzh = NULL;
-  PyObject *__pyx_v_a_icol = NULL;
-  PyObject *__pyx_v_a_irow = NULL;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_H;
   __Pyx_Buffer __pyx_pybuffer_H;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_x;
@@ -6626,28 +9971,24 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_46eval_H(struct __
   __Pyx_Buffer __pyx_pybuffer_y;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1[2];
-  int __pyx_t_2;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyArrayObject *__pyx_t_6 = NULL;
-  int __pyx_t_7;
+  PyArrayObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
   PyObject *__pyx_t_8 = NULL;
   PyObject *__pyx_t_9 = NULL;
-  PyObject *__pyx_t_10 = NULL;
-  PyArrayObject *__pyx_t_11 = NULL;
-  double __pyx_t_12;
+  PyArrayObject *__pyx_t_10 = NULL;
+  double __pyx_t_11;
+  PyObject *__pyx_t_12 = NULL;
   PyObject *__pyx_t_13 = NULL;
-  PyObject *__pyx_t_14 = NULL;
-  PyArrayObject *__pyx_t_15 = NULL;
-  int __pyx_t_16;
-  int __pyx_t_17;
-  int __pyx_t_18;
+  PyArrayObject *__pyx_t_14 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("eval_H", 0);
+  __Pyx_RefNannySetupContext("eval_H_vals", 0);
   __Pyx_INCREF((PyObject *)__pyx_v_x);
   __Pyx_INCREF((PyObject *)__pyx_v_y);
   __pyx_pybuffer_H.pybuffer.buf = NULL;
@@ -6664,37 +10005,26 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_46eval_H(struct __
   __pyx_pybuffernd_y.rcbuffer = &__pyx_pybuffer_y;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 487; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 704; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_y.rcbuffer->pybuffer, (PyObject*)__pyx_v_y, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 487; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_y.rcbuffer->pybuffer, (PyObject*)__pyx_v_y, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 704; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_y.diminfo[0].strides = __pyx_pybuffernd_y.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_y.diminfo[0].shape = __pyx_pybuffernd_y.rcbuffer->pybuffer.shape[0];
-
-  /* "nlp/model/src/_amplmodel.pyx":501
- *             # Variables needed for LL format.
- *             cgrad* cg
- *             int* dims = [self.n_var, self.n_var]             # <<<<<<<<<<<<<<
- * 
- *             # Misc.
- */
-  __pyx_t_1[0] = __pyx_v_self->n_var;
-  __pyx_t_1[1] = __pyx_v_self->n_var;
-  __pyx_v_dims = __pyx_t_1;
-
-  /* "nlp/model/src/_amplmodel.pyx":508
- * 
- *             # variables to compute extra objective function
+
+  /* "nlp/model/src/_amplmodel.pyx":713
+ *             ndarray[np.double_t] H
+ *             double OW[1]
  *             int nerror = 0             # <<<<<<<<<<<<<<
  *             int obj_num = 0
  *             double val
  */
   __pyx_v_nerror = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":509
- *             # variables to compute extra objective function
+  /* "nlp/model/src/_amplmodel.pyx":714
+ *             double OW[1]
  *             int nerror = 0
  *             int obj_num = 0             # <<<<<<<<<<<<<<
  *             double val
@@ -6702,433 +10032,270 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_46eval_H(struct __
  */
   __pyx_v_obj_num = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":513
+  /* "nlp/model/src/_amplmodel.pyx":718
  * 
  *         # Ensure contiguous input.
  *         if not PyArray_ISCARRAY(x): x = x.copy()             # <<<<<<<<<<<<<<
  *         if not PyArray_ISCARRAY(y): y = y.copy()
  * 
  */
-  __pyx_t_2 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
-  if (__pyx_t_2) {
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 513; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = NULL;
-    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_4))) {
-      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
-      if (likely(__pyx_t_5)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
-        __Pyx_INCREF(__pyx_t_5);
+  __pyx_t_1 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
+  if (__pyx_t_1) {
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 718; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_4, function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
       }
     }
-    if (__pyx_t_5) {
-      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 513; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__pyx_t_4) {
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 718; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else {
-      __pyx_t_3 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 513; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 718; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 513; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_6 = ((PyArrayObject *)__pyx_t_3);
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 718; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = ((PyArrayObject *)__pyx_t_2);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
       __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
-      __pyx_t_7 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
-      if (unlikely(__pyx_t_7 < 0)) {
-        PyErr_Fetch(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
+      __pyx_t_6 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_t_5, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
+      if (unlikely(__pyx_t_6 < 0)) {
+        PyErr_Fetch(&__pyx_t_7, &__pyx_t_8, &__pyx_t_9);
         if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
-          Py_XDECREF(__pyx_t_8); Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_10);
+          Py_XDECREF(__pyx_t_7); Py_XDECREF(__pyx_t_8); Py_XDECREF(__pyx_t_9);
           __Pyx_RaiseBufferFallbackError();
         } else {
-          PyErr_Restore(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+          PyErr_Restore(__pyx_t_7, __pyx_t_8, __pyx_t_9);
         }
       }
       __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 513; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 718; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
-    __pyx_t_6 = 0;
-    __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_3));
-    __pyx_t_3 = 0;
+    __pyx_t_5 = 0;
+    __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_2));
+    __pyx_t_2 = 0;
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":514
+  /* "nlp/model/src/_amplmodel.pyx":719
  *         # Ensure contiguous input.
  *         if not PyArray_ISCARRAY(x): x = x.copy()
  *         if not PyArray_ISCARRAY(y): y = y.copy()             # <<<<<<<<<<<<<<
  * 
  *         # extra objective evaluation.
  */
-  __pyx_t_2 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_y)) != 0)) != 0);
-  if (__pyx_t_2) {
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_y), __pyx_n_s_copy); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 514; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = NULL;
-    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_4))) {
-      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
-      if (likely(__pyx_t_5)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
-        __Pyx_INCREF(__pyx_t_5);
+  __pyx_t_1 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_y)) != 0)) != 0);
+  if (__pyx_t_1) {
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_y), __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 719; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_4, function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
       }
     }
-    if (__pyx_t_5) {
-      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 514; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__pyx_t_4) {
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 719; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else {
-      __pyx_t_3 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 514; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 719; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 514; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_11 = ((PyArrayObject *)__pyx_t_3);
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 719; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_10 = ((PyArrayObject *)__pyx_t_2);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
       __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_y.rcbuffer->pybuffer);
-      __pyx_t_7 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_y.rcbuffer->pybuffer, (PyObject*)__pyx_t_11, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
-      if (unlikely(__pyx_t_7 < 0)) {
-        PyErr_Fetch(&__pyx_t_10, &__pyx_t_9, &__pyx_t_8);
+      __pyx_t_6 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_y.rcbuffer->pybuffer, (PyObject*)__pyx_t_10, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
+      if (unlikely(__pyx_t_6 < 0)) {
+        PyErr_Fetch(&__pyx_t_9, &__pyx_t_8, &__pyx_t_7);
         if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_y.rcbuffer->pybuffer, (PyObject*)__pyx_v_y, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
-          Py_XDECREF(__pyx_t_10); Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_8);
+          Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_8); Py_XDECREF(__pyx_t_7);
           __Pyx_RaiseBufferFallbackError();
         } else {
-          PyErr_Restore(__pyx_t_10, __pyx_t_9, __pyx_t_8);
+          PyErr_Restore(__pyx_t_9, __pyx_t_8, __pyx_t_7);
         }
       }
-      __pyx_pybuffernd_y.diminfo[0].strides = __pyx_pybuffernd_y.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_y.diminfo[0].shape = __pyx_pybuffernd_y.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 514; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    __pyx_t_11 = 0;
-    __Pyx_DECREF_SET(__pyx_v_y, ((PyArrayObject *)__pyx_t_3));
-    __pyx_t_3 = 0;
-  }
-
-  /* "nlp/model/src/_amplmodel.pyx":517
- * 
- *         # extra objective evaluation.
- *         obj = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)             # <<<<<<<<<<<<<<
- *         if nerror:
- *             raise ValueError
- */
-  __pyx_v_obj = ampl_objval(__pyx_v_self->asl, __pyx_v_obj_num, ((double *)__pyx_v_x->data), (&__pyx_v_nerror));
-
-  /* "nlp/model/src/_amplmodel.pyx":518
- *         # extra objective evaluation.
- *         obj = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
- *         if nerror:             # <<<<<<<<<<<<<<
- *             raise ValueError
- * 
- */
-  __pyx_t_2 = (__pyx_v_nerror != 0);
-  if (__pyx_t_2) {
-
-    /* "nlp/model/src/_amplmodel.pyx":519
- *         obj = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
- *         if nerror:
- *             raise ValueError             # <<<<<<<<<<<<<<
- * 
- *         # Determine room for Hessian and objective sign if maximizing.
- */
-    __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 519; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-    /* "nlp/model/src/_amplmodel.pyx":518
- *         # extra objective evaluation.
- *         obj = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
- *         if nerror:             # <<<<<<<<<<<<<<
- *             raise ValueError
- * 
- */
-  }
-
-  /* "nlp/model/src/_amplmodel.pyx":522
- * 
- *         # Determine room for Hessian and objective sign if maximizing.
- *         nnzh = self.get_nnzh()             # <<<<<<<<<<<<<<
- *         OW[0] = obj_weight if self.objtype == 0 else -obj_weight
- * 
- */
-  __pyx_t_3 = ((struct __pyx_vtabstruct_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self->__pyx_vtab)->get_nnzh(__pyx_v_self, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 522; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_v_nnzh = __pyx_t_3;
-  __pyx_t_3 = 0;
-
-  /* "nlp/model/src/_amplmodel.pyx":523
- *         # Determine room for Hessian and objective sign if maximizing.
- *         nnzh = self.get_nnzh()
- *         OW[0] = obj_weight if self.objtype == 0 else -obj_weight             # <<<<<<<<<<<<<<
- * 
- *         # Allocate storage and evaluate Hessian.
- */
-  if (((__pyx_v_self->objtype == 0) != 0)) {
-    __pyx_t_12 = __pyx_v_obj_weight;
-  } else {
-    __pyx_t_12 = (-__pyx_v_obj_weight);
-  }
-  (__pyx_v_OW[0]) = __pyx_t_12;
-
-  /* "nlp/model/src/_amplmodel.pyx":526
- * 
- *         # Allocate storage and evaluate Hessian.
- *         H = np.empty(nnzh, dtype=np.double)             # <<<<<<<<<<<<<<
- *         # Note that AMPL is evaluating a UPPER triangular Hessian.
- *         ampl_sphes(self.asl, <double*>H.data, -1, OW, <double*>y.data)
- */
-  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_INCREF(__pyx_v_nnzh);
-  __Pyx_GIVEREF(__pyx_v_nnzh);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_nnzh);
-  __pyx_t_5 = PyDict_New(); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_13 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_13);
-  __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_t_13, __pyx_n_s_double); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_14);
-  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_dtype, __pyx_t_14) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-  __pyx_t_14 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_14);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (!(likely(((__pyx_t_14) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_14, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_15 = ((PyArrayObject *)__pyx_t_14);
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_H.rcbuffer->pybuffer);
-    __pyx_t_7 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_H.rcbuffer->pybuffer, (PyObject*)__pyx_t_15, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
-    if (unlikely(__pyx_t_7 < 0)) {
-      PyErr_Fetch(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
-      if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_H.rcbuffer->pybuffer, (PyObject*)__pyx_v_H, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
-        Py_XDECREF(__pyx_t_8); Py_XDECREF(__pyx_t_9); Py_XDECREF(__pyx_t_10);
-        __Pyx_RaiseBufferFallbackError();
-      } else {
-        PyErr_Restore(__pyx_t_8, __pyx_t_9, __pyx_t_10);
-      }
-    }
-    __pyx_pybuffernd_H.diminfo[0].strides = __pyx_pybuffernd_H.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_H.diminfo[0].shape = __pyx_pybuffernd_H.rcbuffer->pybuffer.shape[0];
-    if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_t_15 = 0;
-  __pyx_v_H = ((PyArrayObject *)__pyx_t_14);
-  __pyx_t_14 = 0;
-
-  /* "nlp/model/src/_amplmodel.pyx":528
- *         H = np.empty(nnzh, dtype=np.double)
- *         # Note that AMPL is evaluating a UPPER triangular Hessian.
- *         ampl_sphes(self.asl, <double*>H.data, -1, OW, <double*>y.data)             # <<<<<<<<<<<<<<
- * 
- *         a_icol = np.empty(nnzh, dtype=np.int)
- */
-  ampl_sphes(__pyx_v_self->asl, ((double *)__pyx_v_H->data), -1, __pyx_v_OW, ((double *)__pyx_v_y->data));
-
-  /* "nlp/model/src/_amplmodel.pyx":530
- *         ampl_sphes(self.asl, <double*>H.data, -1, OW, <double*>y.data)
- * 
- *         a_icol = np.empty(nnzh, dtype=np.int)             # <<<<<<<<<<<<<<
- *         a_irow = np.empty(nnzh, dtype=np.int)
- * 
- */
-  __pyx_t_14 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_14);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_14, __pyx_n_s_empty); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-  __pyx_t_14 = PyTuple_New(1); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_14);
-  __Pyx_INCREF(__pyx_v_nnzh);
-  __Pyx_GIVEREF(__pyx_v_nnzh);
-  PyTuple_SET_ITEM(__pyx_t_14, 0, __pyx_v_nnzh);
-  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_int); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_13);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_13) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-  __pyx_t_13 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_14, __pyx_t_3); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_13);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_v_a_icol = __pyx_t_13;
-  __pyx_t_13 = 0;
-
-  /* "nlp/model/src/_amplmodel.pyx":531
- * 
- *         a_icol = np.empty(nnzh, dtype=np.int)
- *         a_irow = np.empty(nnzh, dtype=np.int)             # <<<<<<<<<<<<<<
- * 
- *         k = 0
- */
-  __pyx_t_13 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 531; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_13);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_13, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 531; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-  __pyx_t_13 = PyTuple_New(1); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 531; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_13);
-  __Pyx_INCREF(__pyx_v_nnzh);
-  __Pyx_GIVEREF(__pyx_v_nnzh);
-  PyTuple_SET_ITEM(__pyx_t_13, 0, __pyx_v_nnzh);
-  __pyx_t_14 = PyDict_New(); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 531; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_14);
-  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 531; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_int); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 531; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (PyDict_SetItem(__pyx_t_14, __pyx_n_s_dtype, __pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 531; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_13, __pyx_t_14); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 531; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-  __pyx_v_a_irow = __pyx_t_4;
-  __pyx_t_4 = 0;
+      __pyx_pybuffernd_y.diminfo[0].strides = __pyx_pybuffernd_y.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_y.diminfo[0].shape = __pyx_pybuffernd_y.rcbuffer->pybuffer.shape[0];
+      if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 719; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __pyx_t_10 = 0;
+    __Pyx_DECREF_SET(__pyx_v_y, ((PyArrayObject *)__pyx_t_2));
+    __pyx_t_2 = 0;
+  }
 
-  /* "nlp/model/src/_amplmodel.pyx":533
- *         a_irow = np.empty(nnzh, dtype=np.int)
+  /* "nlp/model/src/_amplmodel.pyx":722
  * 
- *         k = 0             # <<<<<<<<<<<<<<
- *         for i in xrange(self.n_var):
- *             j0 = self.asl.i.sputinfo_.hcolstarts[i  ]
+ *         # extra objective evaluation.
+ *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)             # <<<<<<<<<<<<<<
+ *         if nerror:
+ *             raise ValueError
  */
-  __pyx_v_k = 0;
+  __pyx_v_val = ampl_objval(__pyx_v_self->asl, __pyx_v_obj_num, ((double *)__pyx_v_x->data), (&__pyx_v_nerror));
 
-  /* "nlp/model/src/_amplmodel.pyx":534
+  /* "nlp/model/src/_amplmodel.pyx":723
+ *         # extra objective evaluation.
+ *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
+ *         if nerror:             # <<<<<<<<<<<<<<
+ *             raise ValueError
  * 
- *         k = 0
- *         for i in xrange(self.n_var):             # <<<<<<<<<<<<<<
- *             j0 = self.asl.i.sputinfo_.hcolstarts[i  ]
- *             j1 = self.asl.i.sputinfo_.hcolstarts[i+1]
- */
-  __pyx_t_7 = __pyx_v_self->n_var;
-  for (__pyx_t_16 = 0; __pyx_t_16 < __pyx_t_7; __pyx_t_16+=1) {
-    __pyx_v_i = __pyx_t_16;
-
-    /* "nlp/model/src/_amplmodel.pyx":535
- *         k = 0
- *         for i in xrange(self.n_var):
- *             j0 = self.asl.i.sputinfo_.hcolstarts[i  ]             # <<<<<<<<<<<<<<
- *             j1 = self.asl.i.sputinfo_.hcolstarts[i+1]
- *             for j in xrange(j0,j1):
  */
-    __pyx_v_j0 = (__pyx_v_self->asl->i.sputinfo_->hcolstarts[__pyx_v_i]);
+  __pyx_t_1 = (__pyx_v_nerror != 0);
+  if (__pyx_t_1) {
 
-    /* "nlp/model/src/_amplmodel.pyx":536
- *         for i in xrange(self.n_var):
- *             j0 = self.asl.i.sputinfo_.hcolstarts[i  ]
- *             j1 = self.asl.i.sputinfo_.hcolstarts[i+1]             # <<<<<<<<<<<<<<
- *             for j in xrange(j0,j1):
- *                 # a_irow.data[k] = self.asl.i.sputinfo_.hrownos[j]
+    /* "nlp/model/src/_amplmodel.pyx":724
+ *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
+ *         if nerror:
+ *             raise ValueError             # <<<<<<<<<<<<<<
+ * 
+ *         nnzh = self.get_nnzh()
  */
-    __pyx_v_j1 = (__pyx_v_self->asl->i.sputinfo_->hcolstarts[(__pyx_v_i + 1)]);
+    __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 724; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-    /* "nlp/model/src/_amplmodel.pyx":537
- *             j0 = self.asl.i.sputinfo_.hcolstarts[i  ]
- *             j1 = self.asl.i.sputinfo_.hcolstarts[i+1]
- *             for j in xrange(j0,j1):             # <<<<<<<<<<<<<<
- *                 # a_irow.data[k] = self.asl.i.sputinfo_.hrownos[j]
- *                 # a_icol.data[k] = i  # broken.
+    /* "nlp/model/src/_amplmodel.pyx":723
+ *         # extra objective evaluation.
+ *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
+ *         if nerror:             # <<<<<<<<<<<<<<
+ *             raise ValueError
+ * 
  */
-    __pyx_t_17 = __pyx_v_j1;
-    for (__pyx_t_18 = __pyx_v_j0; __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
-      __pyx_v_j = __pyx_t_18;
+  }
 
-      /* "nlp/model/src/_amplmodel.pyx":540
- *                 # a_irow.data[k] = self.asl.i.sputinfo_.hrownos[j]
- *                 # a_icol.data[k] = i  # broken.
- *                 a_icol[k] = self.asl.i.sputinfo_.hrownos[j]             # <<<<<<<<<<<<<<
- *                 a_irow[k] = i
- *                 k += 1
+  /* "nlp/model/src/_amplmodel.pyx":726
+ *             raise ValueError
+ * 
+ *         nnzh = self.get_nnzh()             # <<<<<<<<<<<<<<
+ *         OW[0] = obj_weight if self.objtype == 0 else -obj_weight
+ * 
  */
-      __pyx_t_4 = __Pyx_PyInt_From_int((__pyx_v_self->asl->i.sputinfo_->hrownos[__pyx_v_j])); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 540; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      if (unlikely(__Pyx_SetItemInt(__pyx_v_a_icol, __pyx_v_k, __pyx_t_4, int, 1, __Pyx_PyInt_From_int, 0, 1, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 540; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_2 = ((struct __pyx_vtabstruct_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self->__pyx_vtab)->get_nnzh(__pyx_v_self, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 726; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_nnzh = __pyx_t_2;
+  __pyx_t_2 = 0;
 
-      /* "nlp/model/src/_amplmodel.pyx":541
- *                 # a_icol.data[k] = i  # broken.
- *                 a_icol[k] = self.asl.i.sputinfo_.hrownos[j]
- *                 a_irow[k] = i             # <<<<<<<<<<<<<<
- *                 k += 1
+  /* "nlp/model/src/_amplmodel.pyx":727
+ * 
+ *         nnzh = self.get_nnzh()
+ *         OW[0] = obj_weight if self.objtype == 0 else -obj_weight             # <<<<<<<<<<<<<<
  * 
+ *         H = np.empty(nnzh, dtype=np.double)
  */
-      __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 541; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      if (unlikely(__Pyx_SetItemInt(__pyx_v_a_irow, __pyx_v_k, __pyx_t_4, int, 1, __Pyx_PyInt_From_int, 0, 1, 1) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 541; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (((__pyx_v_self->objtype == 0) != 0)) {
+    __pyx_t_11 = __pyx_v_obj_weight;
+  } else {
+    __pyx_t_11 = (-__pyx_v_obj_weight);
+  }
+  (__pyx_v_OW[0]) = __pyx_t_11;
 
-      /* "nlp/model/src/_amplmodel.pyx":542
- *                 a_icol[k] = self.asl.i.sputinfo_.hrownos[j]
- *                 a_irow[k] = i
- *                 k += 1             # <<<<<<<<<<<<<<
+  /* "nlp/model/src/_amplmodel.pyx":729
+ *         OW[0] = obj_weight if self.objtype == 0 else -obj_weight
  * 
- *         return (H, a_irow, a_icol)
+ *         H = np.empty(nnzh, dtype=np.double)             # <<<<<<<<<<<<<<
+ *         ampl_sphes(self.asl, <double*>H.data, -1, OW, <double*>y.data)
+ *         return H
  */
-      __pyx_v_k = (__pyx_v_k + 1);
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 729; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 729; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 729; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_nnzh);
+  __Pyx_GIVEREF(__pyx_v_nnzh);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_nnzh);
+  __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 729; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_12 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 729; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_t_12, __pyx_n_s_double); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 729; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_13) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 729; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __pyx_t_13 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 729; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (!(likely(((__pyx_t_13) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_13, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 729; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_14 = ((PyArrayObject *)__pyx_t_13);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_H.rcbuffer->pybuffer);
+    __pyx_t_6 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_H.rcbuffer->pybuffer, (PyObject*)__pyx_t_14, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack);
+    if (unlikely(__pyx_t_6 < 0)) {
+      PyErr_Fetch(&__pyx_t_7, &__pyx_t_8, &__pyx_t_9);
+      if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_H.rcbuffer->pybuffer, (PyObject*)__pyx_v_H, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
+        Py_XDECREF(__pyx_t_7); Py_XDECREF(__pyx_t_8); Py_XDECREF(__pyx_t_9);
+        __Pyx_RaiseBufferFallbackError();
+      } else {
+        PyErr_Restore(__pyx_t_7, __pyx_t_8, __pyx_t_9);
+      }
     }
+    __pyx_pybuffernd_H.diminfo[0].strides = __pyx_pybuffernd_H.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_H.diminfo[0].shape = __pyx_pybuffernd_H.rcbuffer->pybuffer.shape[0];
+    if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 729; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
+  __pyx_t_14 = 0;
+  __pyx_v_H = ((PyArrayObject *)__pyx_t_13);
+  __pyx_t_13 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":544
- *                 k += 1
+  /* "nlp/model/src/_amplmodel.pyx":730
  * 
- *         return (H, a_irow, a_icol)             # <<<<<<<<<<<<<<
+ *         H = np.empty(nnzh, dtype=np.double)
+ *         ampl_sphes(self.asl, <double*>H.data, -1, OW, <double*>y.data)             # <<<<<<<<<<<<<<
+ *         return H
+ * 
+ */
+  ampl_sphes(__pyx_v_self->asl, ((double *)__pyx_v_H->data), -1, __pyx_v_OW, ((double *)__pyx_v_y->data));
+
+  /* "nlp/model/src/_amplmodel.pyx":731
+ *         H = np.empty(nnzh, dtype=np.double)
+ *         ampl_sphes(self.asl, <double*>H.data, -1, OW, <double*>y.data)
+ *         return H             # <<<<<<<<<<<<<<
  * 
  *     def H_prod(self, ndarray[np.double_t] x, ndarray[np.double_t] y,
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 544; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
   __Pyx_INCREF(((PyObject *)__pyx_v_H));
-  __Pyx_GIVEREF(((PyObject *)__pyx_v_H));
-  PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_v_H));
-  __Pyx_INCREF(__pyx_v_a_irow);
-  __Pyx_GIVEREF(__pyx_v_a_irow);
-  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_a_irow);
-  __Pyx_INCREF(__pyx_v_a_icol);
-  __Pyx_GIVEREF(__pyx_v_a_icol);
-  PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_v_a_icol);
-  __pyx_r = __pyx_t_4;
-  __pyx_t_4 = 0;
+  __pyx_r = ((PyObject *)__pyx_v_H);
   goto __pyx_L0;
 
-  /* "nlp/model/src/_amplmodel.pyx":487
- * 
+  /* "nlp/model/src/_amplmodel.pyx":704
+ *         return (a_irow, a_icol)
  * 
- *     def eval_H(self, ndarray[np.double_t] x, ndarray[np.double_t] y,             # <<<<<<<<<<<<<<
- *                double obj_weight=1.0, int store_zeros=0):
- *         """Evaluate sparse upper triangle of Lagrangian Hessian.
+ *     def eval_H_vals(self, ndarray[np.double_t] x, ndarray[np.double_t] y,             # <<<<<<<<<<<<<<
+ *                     double obj_weight=1.0):
+ *         """Evaluate the nonzero values of the sparse Lagrangian Hessian.
  */
 
   /* function exit code */
   __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_12);
   __Pyx_XDECREF(__pyx_t_13);
-  __Pyx_XDECREF(__pyx_t_14);
   { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
     __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_H.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_x.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_y.rcbuffer->pybuffer);
   __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_H", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.eval_H_vals", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   goto __pyx_L2;
   __pyx_L0:;
@@ -7138,8 +10305,6 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_46eval_H(struct __
   __pyx_L2:;
   __Pyx_XDECREF((PyObject *)__pyx_v_H);
   __Pyx_XDECREF(__pyx_v_nnzh);
-  __Pyx_XDECREF(__pyx_v_a_icol);
-  __Pyx_XDECREF(__pyx_v_a_irow);
   __Pyx_XDECREF((PyObject *)__pyx_v_x);
   __Pyx_XDECREF((PyObject *)__pyx_v_y);
   __Pyx_XGIVEREF(__pyx_r);
@@ -7147,8 +10312,8 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_46eval_H(struct __
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":546
- *         return (H, a_irow, a_icol)
+/* "nlp/model/src/_amplmodel.pyx":733
+ *         return H
  * 
  *     def H_prod(self, ndarray[np.double_t] x, ndarray[np.double_t] y,             # <<<<<<<<<<<<<<
  *                ndarray[np.double_t] v, double obj_weight=1.0):
@@ -7156,9 +10321,9 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_46eval_H(struct __
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_49H_prod(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod[] = "Compute matrix-vector product Hv of Lagrangian Hessian\n        times a vector.\n        ";
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_49H_prod(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_71H_prod(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_70H_prod[] = "Compute matrix-vector product Hv of Lagrangian Hessian\n        times a vector.\n        ";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_71H_prod(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyArrayObject *__pyx_v_x = 0;
   PyArrayObject *__pyx_v_y = 0;
   PyArrayObject *__pyx_v_v = 0;
@@ -7191,12 +10356,12 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_49H_prod(PyObject
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_y)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("H_prod", 0, 3, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 546; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("H_prod", 0, 3, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 733; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_v)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("H_prod", 0, 3, 4, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 546; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("H_prod", 0, 3, 4, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 733; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (kw_args > 0) {
@@ -7205,7 +10370,7 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_49H_prod(PyObject
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "H_prod") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 546; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "H_prod") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 733; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -7221,23 +10386,23 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_49H_prod(PyObject
     __pyx_v_y = ((PyArrayObject *)values[1]);
     __pyx_v_v = ((PyArrayObject *)values[2]);
     if (values[3]) {
-      __pyx_v_obj_weight = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_obj_weight == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 547; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_obj_weight = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_obj_weight == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 734; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
       __pyx_v_obj_weight = ((double)1.0);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("H_prod", 0, 3, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 546; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("H_prod", 0, 3, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 733; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.H_prod", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 546; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_y), __pyx_ptype_5numpy_ndarray, 1, "y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 546; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_v), __pyx_ptype_5numpy_ndarray, 1, "v", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 547; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_x, __pyx_v_y, __pyx_v_v, __pyx_v_obj_weight);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 733; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_y), __pyx_ptype_5numpy_ndarray, 1, "y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 733; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_v), __pyx_ptype_5numpy_ndarray, 1, "v", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 734; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_70H_prod(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_x, __pyx_v_y, __pyx_v_v, __pyx_v_obj_weight);
 
   /* function exit code */
   goto __pyx_L0;
@@ -7248,12 +10413,12 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_49H_prod(PyObject
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, PyArrayObject *__pyx_v_y, PyArrayObject *__pyx_v_v, double __pyx_v_obj_weight) {
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_70H_prod(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, PyArrayObject *__pyx_v_y, PyArrayObject *__pyx_v_v, double __pyx_v_obj_weight) {
   double __pyx_v_OW[1];
   PyArrayObject *__pyx_v_Hv = 0;
   int __pyx_v_nerror;
   int __pyx_v_obj_num;
-  CYTHON_UNUSED double __pyx_v_obj;
+  CYTHON_UNUSED double __pyx_v_val;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_Hv;
   __Pyx_Buffer __pyx_pybuffer_Hv;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_v;
@@ -7304,21 +10469,21 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __
   __pyx_pybuffernd_v.rcbuffer = &__pyx_pybuffer_v;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 546; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 733; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_y.rcbuffer->pybuffer, (PyObject*)__pyx_v_y, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 546; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_y.rcbuffer->pybuffer, (PyObject*)__pyx_v_y, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 733; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_y.diminfo[0].strides = __pyx_pybuffernd_y.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_y.diminfo[0].shape = __pyx_pybuffernd_y.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_v.rcbuffer->pybuffer, (PyObject*)__pyx_v_v, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 546; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_v.rcbuffer->pybuffer, (PyObject*)__pyx_v_v, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 733; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_v.diminfo[0].strides = __pyx_pybuffernd_v.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_v.diminfo[0].shape = __pyx_pybuffernd_v.rcbuffer->pybuffer.shape[0];
 
-  /* "nlp/model/src/_amplmodel.pyx":557
+  /* "nlp/model/src/_amplmodel.pyx":744
  * 
  *             # variables to compute extra objective function
  *             int nerror = 0             # <<<<<<<<<<<<<<
@@ -7327,7 +10492,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __
  */
   __pyx_v_nerror = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":558
+  /* "nlp/model/src/_amplmodel.pyx":745
  *             # variables to compute extra objective function
  *             int nerror = 0
  *             int obj_num = 0             # <<<<<<<<<<<<<<
@@ -7336,7 +10501,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __
  */
   __pyx_v_obj_num = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":562
+  /* "nlp/model/src/_amplmodel.pyx":749
  * 
  *         # Ensure contiguous input.
  *         if not PyArray_ISCARRAY(x): x = x.copy()             # <<<<<<<<<<<<<<
@@ -7345,7 +10510,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __
  */
   __pyx_t_1 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
   if (__pyx_t_1) {
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 562; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 749; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_4 = NULL;
     if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_3))) {
@@ -7358,14 +10523,14 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __
       }
     }
     if (__pyx_t_4) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 562; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 749; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else {
-      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 562; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 749; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 562; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 749; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_5 = ((PyArrayObject *)__pyx_t_2);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
@@ -7381,14 +10546,14 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __
         }
       }
       __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 562; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 749; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __pyx_t_5 = 0;
     __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_2));
     __pyx_t_2 = 0;
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":563
+  /* "nlp/model/src/_amplmodel.pyx":750
  *         # Ensure contiguous input.
  *         if not PyArray_ISCARRAY(x): x = x.copy()
  *         if not PyArray_ISCARRAY(y): y = y.copy()             # <<<<<<<<<<<<<<
@@ -7397,7 +10562,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __
  */
   __pyx_t_1 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_y)) != 0)) != 0);
   if (__pyx_t_1) {
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_y), __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_y), __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 750; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_4 = NULL;
     if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_3))) {
@@ -7410,14 +10575,14 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __
       }
     }
     if (__pyx_t_4) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 750; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else {
-      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 750; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 750; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_10 = ((PyArrayObject *)__pyx_t_2);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
@@ -7433,14 +10598,14 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __
         }
       }
       __pyx_pybuffernd_y.diminfo[0].strides = __pyx_pybuffernd_y.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_y.diminfo[0].shape = __pyx_pybuffernd_y.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 750; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __pyx_t_10 = 0;
     __Pyx_DECREF_SET(__pyx_v_y, ((PyArrayObject *)__pyx_t_2));
     __pyx_t_2 = 0;
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":564
+  /* "nlp/model/src/_amplmodel.pyx":751
  *         if not PyArray_ISCARRAY(x): x = x.copy()
  *         if not PyArray_ISCARRAY(y): y = y.copy()
  *         if not PyArray_ISCARRAY(v): v = v.copy()             # <<<<<<<<<<<<<<
@@ -7449,7 +10614,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __
  */
   __pyx_t_1 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_v)) != 0)) != 0);
   if (__pyx_t_1) {
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_v), __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 564; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_v), __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 751; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_4 = NULL;
     if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_3))) {
@@ -7462,14 +10627,14 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __
       }
     }
     if (__pyx_t_4) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 564; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 751; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else {
-      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 564; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 751; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 564; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 751; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_11 = ((PyArrayObject *)__pyx_t_2);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
@@ -7485,25 +10650,25 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __
         }
       }
       __pyx_pybuffernd_v.diminfo[0].strides = __pyx_pybuffernd_v.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_v.diminfo[0].shape = __pyx_pybuffernd_v.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 564; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 751; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __pyx_t_11 = 0;
     __Pyx_DECREF_SET(__pyx_v_v, ((PyArrayObject *)__pyx_t_2));
     __pyx_t_2 = 0;
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":567
+  /* "nlp/model/src/_amplmodel.pyx":754
  * 
  *         # extra objective evaluation.
- *         obj = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)             # <<<<<<<<<<<<<<
+ *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)             # <<<<<<<<<<<<<<
  *         if nerror:
  *             raise ValueError
  */
-  __pyx_v_obj = ampl_objval(__pyx_v_self->asl, __pyx_v_obj_num, ((double *)__pyx_v_x->data), (&__pyx_v_nerror));
+  __pyx_v_val = ampl_objval(__pyx_v_self->asl, __pyx_v_obj_num, ((double *)__pyx_v_x->data), (&__pyx_v_nerror));
 
-  /* "nlp/model/src/_amplmodel.pyx":568
+  /* "nlp/model/src/_amplmodel.pyx":755
  *         # extra objective evaluation.
- *         obj = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
+ *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
  *         if nerror:             # <<<<<<<<<<<<<<
  *             raise ValueError
  * 
@@ -7511,26 +10676,26 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __
   __pyx_t_1 = (__pyx_v_nerror != 0);
   if (__pyx_t_1) {
 
-    /* "nlp/model/src/_amplmodel.pyx":569
- *         obj = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
+    /* "nlp/model/src/_amplmodel.pyx":756
+ *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
  *         if nerror:
  *             raise ValueError             # <<<<<<<<<<<<<<
  * 
  *         OW[0] = obj_weight if self.objtype == 0 else -obj_weight
  */
     __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 569; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 756; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-    /* "nlp/model/src/_amplmodel.pyx":568
+    /* "nlp/model/src/_amplmodel.pyx":755
  *         # extra objective evaluation.
- *         obj = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
+ *         val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
  *         if nerror:             # <<<<<<<<<<<<<<
  *             raise ValueError
  * 
  */
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":571
+  /* "nlp/model/src/_amplmodel.pyx":758
  *             raise ValueError
  * 
  *         OW[0] = obj_weight if self.objtype == 0 else -obj_weight             # <<<<<<<<<<<<<<
@@ -7544,40 +10709,40 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __
   }
   (__pyx_v_OW[0]) = __pyx_t_12;
 
-  /* "nlp/model/src/_amplmodel.pyx":572
+  /* "nlp/model/src/_amplmodel.pyx":759
  * 
  *         OW[0] = obj_weight if self.objtype == 0 else -obj_weight
  *         Hv = np.empty(self.n_var, dtype=np.double)             # <<<<<<<<<<<<<<
  * 
  *         # Evaluate matrix-vector product Hv
  */
-  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 759; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 759; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->n_var); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->n_var); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 759; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 759; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_GIVEREF(__pyx_t_2);
   PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
   __pyx_t_2 = 0;
-  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 759; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_13 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_13 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 759; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_13);
-  __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_t_13, __pyx_n_s_double); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_t_13, __pyx_n_s_double); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 759; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_14);
   __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_14) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_14) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 759; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-  __pyx_t_14 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, __pyx_t_2); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_14 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, __pyx_t_2); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 759; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_14);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (!(likely(((__pyx_t_14) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_14, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (!(likely(((__pyx_t_14) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_14, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 759; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_15 = ((PyArrayObject *)__pyx_t_14);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
@@ -7593,13 +10758,13 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __
       }
     }
     __pyx_pybuffernd_Hv.diminfo[0].strides = __pyx_pybuffernd_Hv.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_Hv.diminfo[0].shape = __pyx_pybuffernd_Hv.rcbuffer->pybuffer.shape[0];
-    if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 759; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_t_15 = 0;
   __pyx_v_Hv = ((PyArrayObject *)__pyx_t_14);
   __pyx_t_14 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":575
+  /* "nlp/model/src/_amplmodel.pyx":762
  * 
  *         # Evaluate matrix-vector product Hv
  *         ampl_hvcomp(self.asl, <double*>Hv.data, <double*>v.data,             # <<<<<<<<<<<<<<
@@ -7608,7 +10773,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __
  */
   ampl_hvcomp(__pyx_v_self->asl, ((double *)__pyx_v_Hv->data), ((double *)__pyx_v_v->data), -1, __pyx_v_OW, ((double *)__pyx_v_y->data));
 
-  /* "nlp/model/src/_amplmodel.pyx":578
+  /* "nlp/model/src/_amplmodel.pyx":765
  *                     -1, OW, <double*>y.data)
  * 
  *         return Hv             # <<<<<<<<<<<<<<
@@ -7620,8 +10785,8 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __
   __pyx_r = ((PyObject *)__pyx_v_Hv);
   goto __pyx_L0;
 
-  /* "nlp/model/src/_amplmodel.pyx":546
- *         return (H, a_irow, a_icol)
+  /* "nlp/model/src/_amplmodel.pyx":733
+ *         return H
  * 
  *     def H_prod(self, ndarray[np.double_t] x, ndarray[np.double_t] y,             # <<<<<<<<<<<<<<
  *                ndarray[np.double_t] v, double obj_weight=1.0):
@@ -7660,7 +10825,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":582
+/* "nlp/model/src/_amplmodel.pyx":769
  *     @cython.boundscheck(False)
  *     @cython.wraparound(False)
  *     def gHi_prod(self, ndarray[np.double_t] x, ndarray[np.double_t] g,             # <<<<<<<<<<<<<<
@@ -7669,9 +10834,9 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod(struct __
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_51gHi_prod(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod[] = "Compute the vector of dot products (g, Hi(x)*v) with the\n        constraint Hessians.";
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_51gHi_prod(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_73gHi_prod(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_72gHi_prod[] = "Compute the vector of dot products (g, Hi(x)*v) with the\n        constraint Hessians.";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_73gHi_prod(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyArrayObject *__pyx_v_x = 0;
   PyArrayObject *__pyx_v_g = 0;
   PyArrayObject *__pyx_v_v = 0;
@@ -7702,16 +10867,16 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_51gHi_prod(PyObjec
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_g)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("gHi_prod", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 582; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("gHi_prod", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 769; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_v)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("gHi_prod", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 582; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("gHi_prod", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 769; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "gHi_prod") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 582; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "gHi_prod") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 769; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -7726,16 +10891,16 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_51gHi_prod(PyObjec
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("gHi_prod", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 582; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("gHi_prod", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 769; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.gHi_prod", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 582; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_g), __pyx_ptype_5numpy_ndarray, 1, "g", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 582; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_v), __pyx_ptype_5numpy_ndarray, 1, "v", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 583; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_x, __pyx_v_g, __pyx_v_v);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 769; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_g), __pyx_ptype_5numpy_ndarray, 1, "g", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 769; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_v), __pyx_ptype_5numpy_ndarray, 1, "v", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 770; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_72gHi_prod(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_x, __pyx_v_g, __pyx_v_v);
 
   /* function exit code */
   goto __pyx_L0;
@@ -7746,7 +10911,7 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_51gHi_prod(PyObjec
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, PyArrayObject *__pyx_v_g, PyArrayObject *__pyx_v_v) {
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_72gHi_prod(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, PyArrayObject *__pyx_v_g, PyArrayObject *__pyx_v_v) {
   PyArrayObject *__pyx_v_gHiv = 0;
   PyArrayObject *__pyx_v_hv = 0;
   PyArrayObject *__pyx_v_y = 0;
@@ -7823,60 +10988,60 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
   __pyx_pybuffernd_v.rcbuffer = &__pyx_pybuffer_v;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 582; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 769; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_g.rcbuffer->pybuffer, (PyObject*)__pyx_v_g, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 582; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_g.rcbuffer->pybuffer, (PyObject*)__pyx_v_g, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 769; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_g.diminfo[0].strides = __pyx_pybuffernd_g.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_g.diminfo[0].shape = __pyx_pybuffernd_g.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_v.rcbuffer->pybuffer, (PyObject*)__pyx_v_v, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 582; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_v.rcbuffer->pybuffer, (PyObject*)__pyx_v_v, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 769; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_v.diminfo[0].strides = __pyx_pybuffernd_v.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_v.diminfo[0].shape = __pyx_pybuffernd_v.rcbuffer->pybuffer.shape[0];
 
-  /* "nlp/model/src/_amplmodel.pyx":588
+  /* "nlp/model/src/_amplmodel.pyx":775
  * 
  *         cdef:
  *             ndarray[np.double_t] gHiv = np.zeros(self.n_con, dtype=np.double)             # <<<<<<<<<<<<<<
  *             ndarray[np.double_t] hv = np.empty(self.n_var, dtype=np.double)
  *             ndarray[np.double_t] y = np.zeros(self.n_con, dtype=np.double)
  */
-  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 588; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_zeros); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 588; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_zeros); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->n_con); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 588; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->n_con); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 588; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_1);
   PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
   __pyx_t_1 = 0;
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 588; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 588; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_double); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 588; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_double); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 588; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 588; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 588; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_6 = ((PyArrayObject *)__pyx_t_5);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_gHiv.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_gHiv = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_gHiv.rcbuffer->pybuffer.buf = NULL;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 588; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     } else {__pyx_pybuffernd_gHiv.diminfo[0].strides = __pyx_pybuffernd_gHiv.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_gHiv.diminfo[0].shape = __pyx_pybuffernd_gHiv.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -7884,46 +11049,46 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
   __pyx_v_gHiv = ((PyArrayObject *)__pyx_t_5);
   __pyx_t_5 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":589
+  /* "nlp/model/src/_amplmodel.pyx":776
  *         cdef:
  *             ndarray[np.double_t] gHiv = np.zeros(self.n_con, dtype=np.double)
  *             ndarray[np.double_t] hv = np.empty(self.n_var, dtype=np.double)             # <<<<<<<<<<<<<<
  *             ndarray[np.double_t] y = np.zeros(self.n_con, dtype=np.double)
  * 
  */
-  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 776; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 776; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_self->n_var); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_self->n_var); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 776; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 776; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_5);
   PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_5);
   __pyx_t_5 = 0;
-  __pyx_t_5 = PyDict_New(); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = PyDict_New(); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 776; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 776; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_double); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_double); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 776; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_dtype, __pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_dtype, __pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 776; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 776; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 776; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_7 = ((PyArrayObject *)__pyx_t_4);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_hv.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_hv = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_hv.rcbuffer->pybuffer.buf = NULL;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 776; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     } else {__pyx_pybuffernd_hv.diminfo[0].strides = __pyx_pybuffernd_hv.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_hv.diminfo[0].shape = __pyx_pybuffernd_hv.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -7931,46 +11096,46 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
   __pyx_v_hv = ((PyArrayObject *)__pyx_t_4);
   __pyx_t_4 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":590
+  /* "nlp/model/src/_amplmodel.pyx":777
  *             ndarray[np.double_t] gHiv = np.zeros(self.n_con, dtype=np.double)
  *             ndarray[np.double_t] hv = np.empty(self.n_var, dtype=np.double)
  *             ndarray[np.double_t] y = np.zeros(self.n_con, dtype=np.double)             # <<<<<<<<<<<<<<
  * 
  *             # variables to compute extra objective function
  */
-  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 590; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 777; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_zeros); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 590; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_zeros); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 777; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->n_con); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 590; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->n_con); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 777; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 590; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 777; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_4);
   PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
   __pyx_t_4 = 0;
-  __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 590; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 777; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 590; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 777; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_double); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 590; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_double); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 777; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 590; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 777; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 590; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 777; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 590; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 777; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_t_8 = ((PyArrayObject *)__pyx_t_2);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_y.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_y = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_y.rcbuffer->pybuffer.buf = NULL;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 590; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 777; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     } else {__pyx_pybuffernd_y.diminfo[0].strides = __pyx_pybuffernd_y.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_y.diminfo[0].shape = __pyx_pybuffernd_y.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -7978,7 +11143,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
   __pyx_v_y = ((PyArrayObject *)__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":593
+  /* "nlp/model/src/_amplmodel.pyx":780
  * 
  *             # variables to compute extra objective function
  *             int nerror = 0             # <<<<<<<<<<<<<<
@@ -7987,7 +11152,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
  */
   __pyx_v_nerror = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":594
+  /* "nlp/model/src/_amplmodel.pyx":781
  *             # variables to compute extra objective function
  *             int nerror = 0
  *             int obj_num = 0             # <<<<<<<<<<<<<<
@@ -7996,7 +11161,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
  */
   __pyx_v_obj_num = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":598
+  /* "nlp/model/src/_amplmodel.pyx":785
  * 
  *         # Ensure contiguous input.
  *         if not PyArray_ISCARRAY(x): x = x.copy()             # <<<<<<<<<<<<<<
@@ -8005,7 +11170,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
  */
   __pyx_t_9 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
   if (__pyx_t_9) {
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 598; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 785; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_3 = NULL;
     if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_4))) {
@@ -8018,14 +11183,14 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
       }
     }
     if (__pyx_t_3) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 598; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 785; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     } else {
-      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 598; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 785; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 598; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 785; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_10 = ((PyArrayObject *)__pyx_t_2);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
@@ -8041,14 +11206,14 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
         }
       }
       __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_11 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 598; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (unlikely(__pyx_t_11 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 785; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __pyx_t_10 = 0;
     __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_2));
     __pyx_t_2 = 0;
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":599
+  /* "nlp/model/src/_amplmodel.pyx":786
  *         # Ensure contiguous input.
  *         if not PyArray_ISCARRAY(x): x = x.copy()
  *         if not PyArray_ISCARRAY(g): g = g.copy()             # <<<<<<<<<<<<<<
@@ -8057,7 +11222,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
  */
   __pyx_t_9 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_g)) != 0)) != 0);
   if (__pyx_t_9) {
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_g), __pyx_n_s_copy); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 599; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_g), __pyx_n_s_copy); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 786; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_3 = NULL;
     if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_4))) {
@@ -8070,14 +11235,14 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
       }
     }
     if (__pyx_t_3) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 599; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 786; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     } else {
-      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 599; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 786; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 599; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 786; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_15 = ((PyArrayObject *)__pyx_t_2);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
@@ -8093,14 +11258,14 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
         }
       }
       __pyx_pybuffernd_g.diminfo[0].strides = __pyx_pybuffernd_g.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_g.diminfo[0].shape = __pyx_pybuffernd_g.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_11 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 599; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (unlikely(__pyx_t_11 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 786; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __pyx_t_15 = 0;
     __Pyx_DECREF_SET(__pyx_v_g, ((PyArrayObject *)__pyx_t_2));
     __pyx_t_2 = 0;
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":600
+  /* "nlp/model/src/_amplmodel.pyx":787
  *         if not PyArray_ISCARRAY(x): x = x.copy()
  *         if not PyArray_ISCARRAY(g): g = g.copy()
  *         if not PyArray_ISCARRAY(v): v = v.copy()             # <<<<<<<<<<<<<<
@@ -8109,7 +11274,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
  */
   __pyx_t_9 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_v)) != 0)) != 0);
   if (__pyx_t_9) {
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_v), __pyx_n_s_copy); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 600; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_v), __pyx_n_s_copy); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 787; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_3 = NULL;
     if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_4))) {
@@ -8122,14 +11287,14 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
       }
     }
     if (__pyx_t_3) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 600; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 787; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     } else {
-      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 600; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 787; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 600; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 787; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_16 = ((PyArrayObject *)__pyx_t_2);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
@@ -8145,14 +11310,14 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
         }
       }
       __pyx_pybuffernd_v.diminfo[0].strides = __pyx_pybuffernd_v.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_v.diminfo[0].shape = __pyx_pybuffernd_v.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_11 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 600; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (unlikely(__pyx_t_11 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 787; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __pyx_t_16 = 0;
     __Pyx_DECREF_SET(__pyx_v_v, ((PyArrayObject *)__pyx_t_2));
     __pyx_t_2 = 0;
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":603
+  /* "nlp/model/src/_amplmodel.pyx":790
  * 
  *         # extra objective evaluation.
  *         obj = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)             # <<<<<<<<<<<<<<
@@ -8161,7 +11326,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
  */
   __pyx_v_obj = ampl_objval(__pyx_v_self->asl, __pyx_v_obj_num, ((double *)__pyx_v_x->data), (&__pyx_v_nerror));
 
-  /* "nlp/model/src/_amplmodel.pyx":604
+  /* "nlp/model/src/_amplmodel.pyx":791
  *         # extra objective evaluation.
  *         obj = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
  *         if nerror:             # <<<<<<<<<<<<<<
@@ -8171,7 +11336,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
   __pyx_t_9 = (__pyx_v_nerror != 0);
   if (__pyx_t_9) {
 
-    /* "nlp/model/src/_amplmodel.pyx":605
+    /* "nlp/model/src/_amplmodel.pyx":792
  *         obj = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
  *         if nerror:
  *             raise ValueError             # <<<<<<<<<<<<<<
@@ -8179,9 +11344,9 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
  *         # Process nonlinear constraints. The rest are already zero.
  */
     __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 605; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 792; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-    /* "nlp/model/src/_amplmodel.pyx":604
+    /* "nlp/model/src/_amplmodel.pyx":791
  *         # extra objective evaluation.
  *         obj = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
  *         if nerror:             # <<<<<<<<<<<<<<
@@ -8190,7 +11355,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
  */
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":608
+  /* "nlp/model/src/_amplmodel.pyx":795
  * 
  *         # Process nonlinear constraints. The rest are already zero.
  *         for i in range(self.nlc):             # <<<<<<<<<<<<<<
@@ -8201,7 +11366,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
   for (__pyx_t_17 = 0; __pyx_t_17 < __pyx_t_11; __pyx_t_17+=1) {
     __pyx_v_i = __pyx_t_17;
 
-    /* "nlp/model/src/_amplmodel.pyx":610
+    /* "nlp/model/src/_amplmodel.pyx":797
  *         for i in range(self.nlc):
  *             # Set vector of multipliers to (0, 0, ..., -1, ..., 0).
  *             y[i] = -1.0   # Must be -1 because of lagscale().             # <<<<<<<<<<<<<<
@@ -8211,7 +11376,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
     __pyx_t_18 = __pyx_v_i;
     *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_y.rcbuffer->pybuffer.buf, __pyx_t_18, __pyx_pybuffernd_y.diminfo[0].strides) = -1.0;
 
-    /* "nlp/model/src/_amplmodel.pyx":613
+    /* "nlp/model/src/_amplmodel.pyx":800
  * 
  *             # Compute Hi * v by setting OW to NULL.
  *             ampl_hvcomp(self.asl, <double*>hv.data, <double*>v.data,             # <<<<<<<<<<<<<<
@@ -8220,16 +11385,16 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
  */
     ampl_hvcomp(__pyx_v_self->asl, ((double *)__pyx_v_hv->data), ((double *)__pyx_v_v->data), -1, NULL, ((double *)__pyx_v_y->data));
 
-    /* "nlp/model/src/_amplmodel.pyx":617
+    /* "nlp/model/src/_amplmodel.pyx":804
  * 
  *             # Compute dot product (g, Hi*v). Should use BLAS.
  *             gHiv[i] = np.dot(hv, g)             # <<<<<<<<<<<<<<
  * 
  *             # Reset i-th multiplier.
  */
-    __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 617; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 804; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_dot); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 617; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_dot); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 804; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __pyx_t_4 = NULL;
@@ -8244,7 +11409,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
         __pyx_t_19 = 1;
       }
     }
-    __pyx_t_5 = PyTuple_New(2+__pyx_t_19); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 617; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = PyTuple_New(2+__pyx_t_19); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 804; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_5);
     if (__pyx_t_4) {
       __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
@@ -8255,16 +11420,16 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
     __Pyx_INCREF(((PyObject *)__pyx_v_g));
     __Pyx_GIVEREF(((PyObject *)__pyx_v_g));
     PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_19, ((PyObject *)__pyx_v_g));
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 617; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 804; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_20 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_20 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 617; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_20 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_20 == (npy_double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 804; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_t_21 = __pyx_v_i;
     *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_gHiv.rcbuffer->pybuffer.buf, __pyx_t_21, __pyx_pybuffernd_gHiv.diminfo[0].strides) = __pyx_t_20;
 
-    /* "nlp/model/src/_amplmodel.pyx":620
+    /* "nlp/model/src/_amplmodel.pyx":807
  * 
  *             # Reset i-th multiplier.
  *             y[i] = 0             # <<<<<<<<<<<<<<
@@ -8275,7 +11440,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
     *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_double_t *, __pyx_pybuffernd_y.rcbuffer->pybuffer.buf, __pyx_t_22, __pyx_pybuffernd_y.diminfo[0].strides) = 0.0;
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":622
+  /* "nlp/model/src/_amplmodel.pyx":809
  *             y[i] = 0
  * 
  *         return gHiv             # <<<<<<<<<<<<<<
@@ -8287,7 +11452,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
   __pyx_r = ((PyObject *)__pyx_v_gHiv);
   goto __pyx_L0;
 
-  /* "nlp/model/src/_amplmodel.pyx":582
+  /* "nlp/model/src/_amplmodel.pyx":769
  *     @cython.boundscheck(False)
  *     @cython.wraparound(False)
  *     def gHi_prod(self, ndarray[np.double_t] x, ndarray[np.double_t] g,             # <<<<<<<<<<<<<<
@@ -8333,7 +11498,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":624
+/* "nlp/model/src/_amplmodel.pyx":811
  *         return gHiv
  * 
  *     def set_x(self, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
@@ -8342,17 +11507,17 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod(struct
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_53set_x(PyObject *__pyx_v_self, PyObject *__pyx_v_x); /*proto*/
-static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_52set_x[] = "Declare x as current primal value.";
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_53set_x(PyObject *__pyx_v_self, PyObject *__pyx_v_x) {
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_75set_x(PyObject *__pyx_v_self, PyObject *__pyx_v_x); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_74set_x[] = "Declare x as current primal value.";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_75set_x(PyObject *__pyx_v_self, PyObject *__pyx_v_x) {
   CYTHON_UNUSED int __pyx_lineno = 0;
   CYTHON_UNUSED const char *__pyx_filename = NULL;
   CYTHON_UNUSED int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("set_x (wrapper)", 0);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 624; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_52set_x(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), ((PyArrayObject *)__pyx_v_x));
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 811; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_74set_x(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), ((PyArrayObject *)__pyx_v_x));
 
   /* function exit code */
   goto __pyx_L0;
@@ -8363,7 +11528,7 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_53set_x(PyObject *
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_52set_x(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x) {
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_74set_x(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x) {
   __Pyx_LocalBuf_ND __pyx_pybuffernd_x;
   __Pyx_Buffer __pyx_pybuffer_x;
   PyObject *__pyx_r = NULL;
@@ -8388,11 +11553,11 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_52set_x(struct __p
   __pyx_pybuffernd_x.rcbuffer = &__pyx_pybuffer_x;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 624; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 811; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
 
-  /* "nlp/model/src/_amplmodel.pyx":634
+  /* "nlp/model/src/_amplmodel.pyx":821
  * 
  *         # Ensure contiguous input.
  *         if not PyArray_ISCARRAY(x): x = x.copy()             # <<<<<<<<<<<<<<
@@ -8401,7 +11566,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_52set_x(struct __p
  */
   __pyx_t_1 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
   if (__pyx_t_1) {
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 634; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 821; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_4 = NULL;
     if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_3))) {
@@ -8414,14 +11579,14 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_52set_x(struct __p
       }
     }
     if (__pyx_t_4) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 634; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 821; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else {
-      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 634; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 821; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 634; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 821; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_5 = ((PyArrayObject *)__pyx_t_2);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
@@ -8437,14 +11602,14 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_52set_x(struct __p
         }
       }
       __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 634; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 821; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __pyx_t_5 = 0;
     __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_2));
     __pyx_t_2 = 0;
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":636
+  /* "nlp/model/src/_amplmodel.pyx":823
  *         if not PyArray_ISCARRAY(x): x = x.copy()
  * 
  *         ampl_xknown(self.asl, <double*>x.data)             # <<<<<<<<<<<<<<
@@ -8453,7 +11618,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_52set_x(struct __p
  */
   ampl_xknown(__pyx_v_self->asl, ((double *)__pyx_v_x->data));
 
-  /* "nlp/model/src/_amplmodel.pyx":624
+  /* "nlp/model/src/_amplmodel.pyx":811
  *         return gHiv
  * 
  *     def set_x(self, ndarray[np.double_t] x):             # <<<<<<<<<<<<<<
@@ -8484,7 +11649,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_52set_x(struct __p
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":638
+/* "nlp/model/src/_amplmodel.pyx":825
  *         ampl_xknown(self.asl, <double*>x.data)
  * 
  *     def unset_x(self):             # <<<<<<<<<<<<<<
@@ -8493,25 +11658,25 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_52set_x(struct __p
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_55unset_x(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_54unset_x[] = "Release current primal value.";
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_55unset_x(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_77unset_x(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_76unset_x[] = "Release current primal value.";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_77unset_x(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("unset_x (wrapper)", 0);
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_54unset_x(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self));
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_76unset_x(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_54unset_x(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self) {
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_76unset_x(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("unset_x", 0);
 
-  /* "nlp/model/src/_amplmodel.pyx":640
+  /* "nlp/model/src/_amplmodel.pyx":827
  *     def unset_x(self):
  *         """Release current primal value."""
  *         self.asl.i.x_known = 0             # <<<<<<<<<<<<<<
@@ -8520,7 +11685,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_54unset_x(struct _
  */
   __pyx_v_self->asl->i.x_known = 0;
 
-  /* "nlp/model/src/_amplmodel.pyx":638
+  /* "nlp/model/src/_amplmodel.pyx":825
  *         ampl_xknown(self.asl, <double*>x.data)
  * 
  *     def unset_x(self):             # <<<<<<<<<<<<<<
@@ -8535,7 +11700,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_54unset_x(struct _
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":642
+/* "nlp/model/src/_amplmodel.pyx":829
  *         self.asl.i.x_known = 0
  * 
  *     def ampl_sol(self, ndarray[np.double_t] x, ndarray[np.double_t] y, msg):             # <<<<<<<<<<<<<<
@@ -8544,9 +11709,9 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_54unset_x(struct _
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_57ampl_sol(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_56ampl_sol[] = "Write primal and dual solution.";
-static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_57ampl_sol(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_79ampl_sol(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_78ampl_sol[] = "Write primal and dual solution.";
+static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_79ampl_sol(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyArrayObject *__pyx_v_x = 0;
   PyArrayObject *__pyx_v_y = 0;
   PyObject *__pyx_v_msg = 0;
@@ -8577,16 +11742,16 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_57ampl_sol(PyObjec
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_y)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("ampl_sol", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 642; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("ampl_sol", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_msg)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("ampl_sol", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 642; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("ampl_sol", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "ampl_sol") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 642; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "ampl_sol") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -8601,15 +11766,15 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_57ampl_sol(PyObjec
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("ampl_sol", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 642; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("ampl_sol", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("nlp.model.src._amplmodel.ampl.ampl_sol", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 642; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_y), __pyx_ptype_5numpy_ndarray, 1, "y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 642; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_56ampl_sol(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_x, __pyx_v_y, __pyx_v_msg);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_x), __pyx_ptype_5numpy_ndarray, 1, "x", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_y), __pyx_ptype_5numpy_ndarray, 1, "y", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_78ampl_sol(((struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *)__pyx_v_self), __pyx_v_x, __pyx_v_y, __pyx_v_msg);
 
   /* function exit code */
   goto __pyx_L0;
@@ -8620,7 +11785,7 @@ static PyObject *__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_57ampl_sol(PyObjec
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_56ampl_sol(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, PyArrayObject *__pyx_v_y, PyObject *__pyx_v_msg) {
+static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_78ampl_sol(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *__pyx_v_self, PyArrayObject *__pyx_v_x, PyArrayObject *__pyx_v_y, PyObject *__pyx_v_msg) {
   __Pyx_LocalBuf_ND __pyx_pybuffernd_x;
   __Pyx_Buffer __pyx_pybuffer_x;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_y;
@@ -8654,16 +11819,16 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_56ampl_sol(struct
   __pyx_pybuffernd_y.rcbuffer = &__pyx_pybuffer_y;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 642; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_x.rcbuffer->pybuffer, (PyObject*)__pyx_v_x, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_y.rcbuffer->pybuffer, (PyObject*)__pyx_v_y, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 642; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_y.rcbuffer->pybuffer, (PyObject*)__pyx_v_y, &__Pyx_TypeInfo_nn___pyx_t_5numpy_double_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_y.diminfo[0].strides = __pyx_pybuffernd_y.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_y.diminfo[0].shape = __pyx_pybuffernd_y.rcbuffer->pybuffer.shape[0];
 
-  /* "nlp/model/src/_amplmodel.pyx":646
+  /* "nlp/model/src/_amplmodel.pyx":833
  * 
  *         # Ensure contiguous input.
  *         if not PyArray_ISCARRAY(x): x = x.copy()             # <<<<<<<<<<<<<<
@@ -8672,7 +11837,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_56ampl_sol(struct
  */
   __pyx_t_1 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_x)) != 0)) != 0);
   if (__pyx_t_1) {
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 646; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_x), __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_4 = NULL;
     if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_3))) {
@@ -8685,14 +11850,14 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_56ampl_sol(struct
       }
     }
     if (__pyx_t_4) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 646; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else {
-      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 646; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 646; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_5 = ((PyArrayObject *)__pyx_t_2);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
@@ -8708,14 +11873,14 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_56ampl_sol(struct
         }
       }
       __pyx_pybuffernd_x.diminfo[0].strides = __pyx_pybuffernd_x.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_x.diminfo[0].shape = __pyx_pybuffernd_x.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 646; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __pyx_t_5 = 0;
     __Pyx_DECREF_SET(__pyx_v_x, ((PyArrayObject *)__pyx_t_2));
     __pyx_t_2 = 0;
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":647
+  /* "nlp/model/src/_amplmodel.pyx":834
  *         # Ensure contiguous input.
  *         if not PyArray_ISCARRAY(x): x = x.copy()
  *         if not PyArray_ISCARRAY(y): y = y.copy()             # <<<<<<<<<<<<<<
@@ -8724,7 +11889,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_56ampl_sol(struct
  */
   __pyx_t_1 = ((!(PyArray_ISCARRAY(((PyArrayObject *)__pyx_v_y)) != 0)) != 0);
   if (__pyx_t_1) {
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_y), __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 647; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_y), __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 834; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_4 = NULL;
     if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_3))) {
@@ -8737,14 +11902,14 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_56ampl_sol(struct
       }
     }
     if (__pyx_t_4) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 647; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 834; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else {
-      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 647; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 834; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 647; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 834; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_10 = ((PyArrayObject *)__pyx_t_2);
     {
       __Pyx_BufFmt_StackElem __pyx_stack[1];
@@ -8760,14 +11925,14 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_56ampl_sol(struct
         }
       }
       __pyx_pybuffernd_y.diminfo[0].strides = __pyx_pybuffernd_y.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_y.diminfo[0].shape = __pyx_pybuffernd_y.rcbuffer->pybuffer.shape[0];
-      if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 647; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 834; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     __pyx_t_10 = 0;
     __Pyx_DECREF_SET(__pyx_v_y, ((PyArrayObject *)__pyx_t_2));
     __pyx_t_2 = 0;
   }
 
-  /* "nlp/model/src/_amplmodel.pyx":650
+  /* "nlp/model/src/_amplmodel.pyx":837
  * 
  *         # Suppress message echo, force .sol writing.
  *         self.Oinfo.wantsol = 9             # <<<<<<<<<<<<<<
@@ -8776,24 +11941,24 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_56ampl_sol(struct
  */
   __pyx_v_self->Oinfo.wantsol = 9;
 
-  /* "nlp/model/src/_amplmodel.pyx":653
+  /* "nlp/model/src/_amplmodel.pyx":840
  * 
  *         # Output solution.
  *         write_sol_ASL(self.asl, msg, <double*>x.data, <double*>y.data, &self.Oinfo)             # <<<<<<<<<<<<<<
  * 
  *         # Flag that a solution has been written.
  */
-  __pyx_t_11 = __Pyx_PyObject_AsString(__pyx_v_msg); if (unlikely((!__pyx_t_11) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 653; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_11 = __Pyx_PyObject_AsString(__pyx_v_msg); if (unlikely((!__pyx_t_11) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 840; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   write_sol_ASL(__pyx_v_self->asl, __pyx_t_11, ((double *)__pyx_v_x->data), ((double *)__pyx_v_y->data), (&__pyx_v_self->Oinfo));
 
-  /* "nlp/model/src/_amplmodel.pyx":656
+  /* "nlp/model/src/_amplmodel.pyx":843
  * 
  *         # Flag that a solution has been written.
  *         self.ampl_written_sol = True             # <<<<<<<<<<<<<<
  */
   __pyx_v_self->ampl_written_sol = 1;
 
-  /* "nlp/model/src/_amplmodel.pyx":642
+  /* "nlp/model/src/_amplmodel.pyx":829
  *         self.asl.i.x_known = 0
  * 
  *     def ampl_sol(self, ndarray[np.double_t] x, ndarray[np.double_t] y, msg):             # <<<<<<<<<<<<<<
@@ -8827,7 +11992,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_56ampl_sol(struct
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":162
+/* "nlp/model/src/_amplmodel.pyx":186
  * 
  *         # Components from Table 1.
  *         public int n_var             # <<<<<<<<<<<<<<
@@ -8857,7 +12022,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5n_var___get__(str
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->n_var); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->n_var); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -8895,7 +12060,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5n_var_2__set__(struct _
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->n_var = __pyx_t_1;
 
   /* function exit code */
@@ -8909,7 +12074,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5n_var_2__set__(struct _
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":163
+/* "nlp/model/src/_amplmodel.pyx":187
  *         # Components from Table 1.
  *         public int n_var
  *         public int nbv             # <<<<<<<<<<<<<<
@@ -8939,7 +12104,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3nbv___get__(struc
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nbv); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 163; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nbv); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 187; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -8977,7 +12142,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3nbv_2__set__(struct __p
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 163; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 187; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->nbv = __pyx_t_1;
 
   /* function exit code */
@@ -8991,7 +12156,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3nbv_2__set__(struct __p
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":164
+/* "nlp/model/src/_amplmodel.pyx":188
  *         public int n_var
  *         public int nbv
  *         public int niv             # <<<<<<<<<<<<<<
@@ -9021,7 +12186,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3niv___get__(struc
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->niv); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 164; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->niv); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -9059,7 +12224,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3niv_2__set__(struct __p
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 164; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->niv = __pyx_t_1;
 
   /* function exit code */
@@ -9073,7 +12238,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3niv_2__set__(struct __p
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":165
+/* "nlp/model/src/_amplmodel.pyx":189
  *         public int nbv
  *         public int niv
  *         public int n_con             # <<<<<<<<<<<<<<
@@ -9103,7 +12268,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5n_con___get__(str
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->n_con); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->n_con); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -9141,7 +12306,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5n_con_2__set__(struct _
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->n_con = __pyx_t_1;
 
   /* function exit code */
@@ -9155,7 +12320,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5n_con_2__set__(struct _
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":166
+/* "nlp/model/src/_amplmodel.pyx":190
  *         public int niv
  *         public int n_con
  *         public int n_obj             # <<<<<<<<<<<<<<
@@ -9185,7 +12350,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5n_obj___get__(str
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->n_obj); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 166; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->n_obj); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -9223,7 +12388,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5n_obj_2__set__(struct _
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 166; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->n_obj = __pyx_t_1;
 
   /* function exit code */
@@ -9237,7 +12402,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5n_obj_2__set__(struct _
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":167
+/* "nlp/model/src/_amplmodel.pyx":191
  *         public int n_con
  *         public int n_obj
  *         public int nlo             # <<<<<<<<<<<<<<
@@ -9267,7 +12432,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3nlo___get__(struc
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlo); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlo); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -9305,7 +12470,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3nlo_2__set__(struct __p
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->nlo = __pyx_t_1;
 
   /* function exit code */
@@ -9319,7 +12484,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3nlo_2__set__(struct __p
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":168
+/* "nlp/model/src/_amplmodel.pyx":192
  *         public int n_obj
  *         public int nlo
  *         public int nranges             # <<<<<<<<<<<<<<
@@ -9349,7 +12514,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_7nranges___get__(s
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nranges); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nranges); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -9387,7 +12552,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_7nranges_2__set__(struct
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->nranges = __pyx_t_1;
 
   /* function exit code */
@@ -9401,7 +12566,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_7nranges_2__set__(struct
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":169
+/* "nlp/model/src/_amplmodel.pyx":193
  *         public int nlo
  *         public int nranges
  *         public int nlc             # <<<<<<<<<<<<<<
@@ -9431,7 +12596,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3nlc___get__(struc
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlc); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 169; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlc); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -9469,7 +12634,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3nlc_2__set__(struct __p
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 169; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->nlc = __pyx_t_1;
 
   /* function exit code */
@@ -9483,7 +12648,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3nlc_2__set__(struct __p
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":170
+/* "nlp/model/src/_amplmodel.pyx":194
  *         public int nranges
  *         public int nlc
  *         public int nlnc             # <<<<<<<<<<<<<<
@@ -9513,7 +12678,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4nlnc___get__(stru
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlnc); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 170; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlnc); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -9551,7 +12716,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4nlnc_2__set__(struct __
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 170; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->nlnc = __pyx_t_1;
 
   /* function exit code */
@@ -9565,7 +12730,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4nlnc_2__set__(struct __
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":171
+/* "nlp/model/src/_amplmodel.pyx":195
  *         public int nlc
  *         public int nlnc
  *         public int nlvb             # <<<<<<<<<<<<<<
@@ -9595,7 +12760,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4nlvb___get__(stru
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlvb); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlvb); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 195; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -9633,7 +12798,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4nlvb_2__set__(struct __
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 195; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->nlvb = __pyx_t_1;
 
   /* function exit code */
@@ -9647,7 +12812,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4nlvb_2__set__(struct __
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":172
+/* "nlp/model/src/_amplmodel.pyx":196
  *         public int nlnc
  *         public int nlvb
  *         public int nlvbi             # <<<<<<<<<<<<<<
@@ -9677,7 +12842,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5nlvbi___get__(str
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlvbi); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 172; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlvbi); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 196; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -9715,7 +12880,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5nlvbi_2__set__(struct _
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 172; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 196; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->nlvbi = __pyx_t_1;
 
   /* function exit code */
@@ -9729,7 +12894,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5nlvbi_2__set__(struct _
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":173
+/* "nlp/model/src/_amplmodel.pyx":197
  *         public int nlvb
  *         public int nlvbi
  *         public int nlvc             # <<<<<<<<<<<<<<
@@ -9759,7 +12924,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4nlvc___get__(stru
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlvc); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 173; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlvc); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 197; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -9797,7 +12962,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4nlvc_2__set__(struct __
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 173; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 197; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->nlvc = __pyx_t_1;
 
   /* function exit code */
@@ -9811,7 +12976,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4nlvc_2__set__(struct __
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":174
+/* "nlp/model/src/_amplmodel.pyx":198
  *         public int nlvbi
  *         public int nlvc
  *         public int nlvci             # <<<<<<<<<<<<<<
@@ -9841,7 +13006,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5nlvci___get__(str
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlvci); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlvci); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -9879,7 +13044,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5nlvci_2__set__(struct _
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->nlvci = __pyx_t_1;
 
   /* function exit code */
@@ -9893,7 +13058,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5nlvci_2__set__(struct _
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":175
+/* "nlp/model/src/_amplmodel.pyx":199
  *         public int nlvc
  *         public int nlvci
  *         public int nlvo             # <<<<<<<<<<<<<<
@@ -9923,7 +13088,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4nlvo___get__(stru
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlvo); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlvo); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 199; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -9961,7 +13126,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4nlvo_2__set__(struct __
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 199; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->nlvo = __pyx_t_1;
 
   /* function exit code */
@@ -9975,7 +13140,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_4nlvo_2__set__(struct __
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":176
+/* "nlp/model/src/_amplmodel.pyx":200
  *         public int nlvci
  *         public int nlvo
  *         public int nlvoi             # <<<<<<<<<<<<<<
@@ -10005,7 +13170,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5nlvoi___get__(str
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlvoi); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nlvoi); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 200; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -10043,7 +13208,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5nlvoi_2__set__(struct _
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 200; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->nlvoi = __pyx_t_1;
 
   /* function exit code */
@@ -10057,7 +13222,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_5nlvoi_2__set__(struct _
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":177
+/* "nlp/model/src/_amplmodel.pyx":201
  *         public int nlvo
  *         public int nlvoi
  *         public int lnc             # <<<<<<<<<<<<<<
@@ -10087,7 +13252,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3lnc___get__(struc
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->lnc); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->lnc); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 201; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -10125,7 +13290,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3lnc_2__set__(struct __p
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 201; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->lnc = __pyx_t_1;
 
   /* function exit code */
@@ -10139,7 +13304,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3lnc_2__set__(struct __p
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":178
+/* "nlp/model/src/_amplmodel.pyx":202
  *         public int nlvoi
  *         public int lnc
  *         public int nzc             # <<<<<<<<<<<<<<
@@ -10169,7 +13334,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3nzc___get__(struc
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nzc); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nzc); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -10207,7 +13372,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3nzc_2__set__(struct __p
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->nzc = __pyx_t_1;
 
   /* function exit code */
@@ -10221,7 +13386,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3nzc_2__set__(struct __p
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":179
+/* "nlp/model/src/_amplmodel.pyx":203
  *         public int lnc
  *         public int nzc
  *         public int nzo             # <<<<<<<<<<<<<<
@@ -10251,7 +13416,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3nzo___get__(struc
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nzo); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 179; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nzo); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -10289,7 +13454,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3nzo_2__set__(struct __p
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 179; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->nzo = __pyx_t_1;
 
   /* function exit code */
@@ -10303,7 +13468,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_3nzo_2__set__(struct __p
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":180
+/* "nlp/model/src/_amplmodel.pyx":204
  *         public int nzc
  *         public int nzo
  *         public int maxrownamelen             # <<<<<<<<<<<<<<
@@ -10333,7 +13498,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_13maxrownamelen___
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->maxrownamelen); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->maxrownamelen); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 204; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -10371,7 +13536,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_13maxrownamelen_2__set__
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 204; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->maxrownamelen = __pyx_t_1;
 
   /* function exit code */
@@ -10385,7 +13550,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_13maxrownamelen_2__set__
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":181
+/* "nlp/model/src/_amplmodel.pyx":205
  *         public int nzo
  *         public int maxrownamelen
  *         public int maxcolnamelen             # <<<<<<<<<<<<<<
@@ -10415,7 +13580,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_13maxcolnamelen___
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->maxcolnamelen); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->maxcolnamelen); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -10453,7 +13618,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_13maxcolnamelen_2__set__
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->maxcolnamelen = __pyx_t_1;
 
   /* function exit code */
@@ -10467,7 +13632,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_13maxcolnamelen_2__set__
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":184
+/* "nlp/model/src/_amplmodel.pyx":208
  * 
  *         # Other odds and ends.
  *         public int objtype             # <<<<<<<<<<<<<<
@@ -10497,7 +13662,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_7objtype___get__(s
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->objtype); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->objtype); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 208; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -10535,7 +13700,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_7objtype_2__set__(struct
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 208; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->objtype = __pyx_t_1;
 
   /* function exit code */
@@ -10549,7 +13714,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_7objtype_2__set__(struct
   return __pyx_r;
 }
 
-/* "nlp/model/src/_amplmodel.pyx":185
+/* "nlp/model/src/_amplmodel.pyx":209
  *         # Other odds and ends.
  *         public int objtype
  *         public bint ampl_written_sol             # <<<<<<<<<<<<<<
@@ -10579,7 +13744,7 @@ static PyObject *__pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_16ampl_written_sol
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_self->ampl_written_sol); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_self->ampl_written_sol); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -10617,7 +13782,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_16ampl_written_sol_2__se
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->ampl_written_sol = __pyx_t_1;
 
   /* function exit code */
@@ -10631,7 +13796,7 @@ static int __pyx_pf_3nlp_5model_3src_10_amplmodel_4ampl_16ampl_written_sol_2__se
   return __pyx_r;
 }
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":197
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":197
  *         # experimental exception made for __getbuffer__ and __releasebuffer__
  *         # -- the details of this may change.
  *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
@@ -10681,7 +13846,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __Pyx_GIVEREF(__pyx_v_info->obj);
   }
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":203
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":203
  *             # of flags
  * 
  *             if info == NULL: return             # <<<<<<<<<<<<<<
@@ -10694,7 +13859,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     goto __pyx_L0;
   }
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":206
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":206
  * 
  *             cdef int copy_shape, i, ndim
  *             cdef int endian_detector = 1             # <<<<<<<<<<<<<<
@@ -10703,7 +13868,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_endian_detector = 1;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":207
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":207
  *             cdef int copy_shape, i, ndim
  *             cdef int endian_detector = 1
  *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
@@ -10712,7 +13877,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":209
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":209
  *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
  * 
  *             ndim = PyArray_NDIM(self)             # <<<<<<<<<<<<<<
@@ -10721,7 +13886,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_ndim = PyArray_NDIM(__pyx_v_self);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":211
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":211
  *             ndim = PyArray_NDIM(self)
  * 
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -10731,7 +13896,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_t_1 = (((sizeof(npy_intp)) != (sizeof(Py_ssize_t))) != 0);
   if (__pyx_t_1) {
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":212
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":212
  * 
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
  *                 copy_shape = 1             # <<<<<<<<<<<<<<
@@ -10740,7 +13905,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     __pyx_v_copy_shape = 1;
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":211
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":211
  *             ndim = PyArray_NDIM(self)
  * 
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -10750,7 +13915,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     goto __pyx_L4;
   }
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":214
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":214
  *                 copy_shape = 1
  *             else:
  *                 copy_shape = 0             # <<<<<<<<<<<<<<
@@ -10762,7 +13927,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   }
   __pyx_L4:;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":216
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":216
  *                 copy_shape = 0
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -10776,7 +13941,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     goto __pyx_L6_bool_binop_done;
   }
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":217
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":217
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):             # <<<<<<<<<<<<<<
@@ -10787,7 +13952,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_t_1 = __pyx_t_2;
   __pyx_L6_bool_binop_done:;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":216
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":216
  *                 copy_shape = 0
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -10796,7 +13961,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   if (__pyx_t_1) {
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":218
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":218
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
@@ -10809,7 +13974,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     {__pyx_filename = __pyx_f[1]; __pyx_lineno = 218; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":216
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":216
  *                 copy_shape = 0
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -10818,7 +13983,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   }
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":220
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":220
  *                 raise ValueError(u"ndarray is not C contiguous")
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -10832,7 +13997,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     goto __pyx_L9_bool_binop_done;
   }
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":221
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":221
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):             # <<<<<<<<<<<<<<
@@ -10843,7 +14008,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_t_1 = __pyx_t_2;
   __pyx_L9_bool_binop_done:;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":220
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":220
  *                 raise ValueError(u"ndarray is not C contiguous")
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -10852,7 +14017,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   if (__pyx_t_1) {
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":222
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":222
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
@@ -10865,7 +14030,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     {__pyx_filename = __pyx_f[1]; __pyx_lineno = 222; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":220
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":220
  *                 raise ValueError(u"ndarray is not C contiguous")
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -10874,7 +14039,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   }
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":224
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":224
  *                 raise ValueError(u"ndarray is not Fortran contiguous")
  * 
  *             info.buf = PyArray_DATA(self)             # <<<<<<<<<<<<<<
@@ -10883,7 +14048,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_info->buf = PyArray_DATA(__pyx_v_self);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":225
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":225
  * 
  *             info.buf = PyArray_DATA(self)
  *             info.ndim = ndim             # <<<<<<<<<<<<<<
@@ -10892,7 +14057,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_info->ndim = __pyx_v_ndim;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":226
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":226
  *             info.buf = PyArray_DATA(self)
  *             info.ndim = ndim
  *             if copy_shape:             # <<<<<<<<<<<<<<
@@ -10902,7 +14067,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_t_1 = (__pyx_v_copy_shape != 0);
   if (__pyx_t_1) {
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":229
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":229
  *                 # Allocate new buffer for strides and shape info.
  *                 # This is allocated as one block, strides first.
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * <size_t>ndim * 2)             # <<<<<<<<<<<<<<
@@ -10911,7 +14076,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     __pyx_v_info->strides = ((Py_ssize_t *)malloc((((sizeof(Py_ssize_t)) * ((size_t)__pyx_v_ndim)) * 2)));
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":230
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":230
  *                 # This is allocated as one block, strides first.
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * <size_t>ndim * 2)
  *                 info.shape = info.strides + ndim             # <<<<<<<<<<<<<<
@@ -10920,7 +14085,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     __pyx_v_info->shape = (__pyx_v_info->strides + __pyx_v_ndim);
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":231
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":231
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * <size_t>ndim * 2)
  *                 info.shape = info.strides + ndim
  *                 for i in range(ndim):             # <<<<<<<<<<<<<<
@@ -10931,7 +14096,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
       __pyx_v_i = __pyx_t_5;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":232
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":232
  *                 info.shape = info.strides + ndim
  *                 for i in range(ndim):
  *                     info.strides[i] = PyArray_STRIDES(self)[i]             # <<<<<<<<<<<<<<
@@ -10940,7 +14105,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
       (__pyx_v_info->strides[__pyx_v_i]) = (PyArray_STRIDES(__pyx_v_self)[__pyx_v_i]);
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":233
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":233
  *                 for i in range(ndim):
  *                     info.strides[i] = PyArray_STRIDES(self)[i]
  *                     info.shape[i] = PyArray_DIMS(self)[i]             # <<<<<<<<<<<<<<
@@ -10950,7 +14115,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       (__pyx_v_info->shape[__pyx_v_i]) = (PyArray_DIMS(__pyx_v_self)[__pyx_v_i]);
     }
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":226
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":226
  *             info.buf = PyArray_DATA(self)
  *             info.ndim = ndim
  *             if copy_shape:             # <<<<<<<<<<<<<<
@@ -10960,7 +14125,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     goto __pyx_L11;
   }
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":235
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":235
  *                     info.shape[i] = PyArray_DIMS(self)[i]
  *             else:
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)             # <<<<<<<<<<<<<<
@@ -10970,7 +14135,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   /*else*/ {
     __pyx_v_info->strides = ((Py_ssize_t *)PyArray_STRIDES(__pyx_v_self));
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":236
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":236
  *             else:
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)             # <<<<<<<<<<<<<<
@@ -10981,7 +14146,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   }
   __pyx_L11:;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":237
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":237
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
  *             info.suboffsets = NULL             # <<<<<<<<<<<<<<
@@ -10990,7 +14155,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_info->suboffsets = NULL;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":238
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":238
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
  *             info.suboffsets = NULL
  *             info.itemsize = PyArray_ITEMSIZE(self)             # <<<<<<<<<<<<<<
@@ -10999,7 +14164,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_info->itemsize = PyArray_ITEMSIZE(__pyx_v_self);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":239
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":239
  *             info.suboffsets = NULL
  *             info.itemsize = PyArray_ITEMSIZE(self)
  *             info.readonly = not PyArray_ISWRITEABLE(self)             # <<<<<<<<<<<<<<
@@ -11008,7 +14173,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_info->readonly = (!(PyArray_ISWRITEABLE(__pyx_v_self) != 0));
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":242
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":242
  * 
  *             cdef int t
  *             cdef char* f = NULL             # <<<<<<<<<<<<<<
@@ -11017,7 +14182,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_f = NULL;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":243
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":243
  *             cdef int t
  *             cdef char* f = NULL
  *             cdef dtype descr = self.descr             # <<<<<<<<<<<<<<
@@ -11029,7 +14194,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_v_descr = ((PyArray_Descr *)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":246
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":246
  *             cdef int offset
  * 
  *             cdef bint hasfields = PyDataType_HASFIELDS(descr)             # <<<<<<<<<<<<<<
@@ -11038,7 +14203,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   __pyx_v_hasfields = PyDataType_HASFIELDS(__pyx_v_descr);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":248
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":248
  *             cdef bint hasfields = PyDataType_HASFIELDS(descr)
  * 
  *             if not hasfields and not copy_shape:             # <<<<<<<<<<<<<<
@@ -11056,7 +14221,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_L15_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":250
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":250
  *             if not hasfields and not copy_shape:
  *                 # do not call releasebuffer
  *                 info.obj = None             # <<<<<<<<<<<<<<
@@ -11069,7 +14234,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __Pyx_DECREF(__pyx_v_info->obj);
     __pyx_v_info->obj = Py_None;
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":248
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":248
  *             cdef bint hasfields = PyDataType_HASFIELDS(descr)
  * 
  *             if not hasfields and not copy_shape:             # <<<<<<<<<<<<<<
@@ -11079,7 +14244,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     goto __pyx_L14;
   }
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":253
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":253
  *             else:
  *                 # need to call releasebuffer
  *                 info.obj = self             # <<<<<<<<<<<<<<
@@ -11095,7 +14260,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   }
   __pyx_L14:;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":255
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":255
  *                 info.obj = self
  * 
  *             if not hasfields:             # <<<<<<<<<<<<<<
@@ -11105,7 +14270,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   __pyx_t_1 = ((!(__pyx_v_hasfields != 0)) != 0);
   if (__pyx_t_1) {
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":256
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":256
  * 
  *             if not hasfields:
  *                 t = descr.type_num             # <<<<<<<<<<<<<<
@@ -11115,7 +14280,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __pyx_t_4 = __pyx_v_descr->type_num;
     __pyx_v_t = __pyx_t_4;
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":257
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":257
  *             if not hasfields:
  *                 t = descr.type_num
  *                 if ((descr.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -11135,7 +14300,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     }
     __pyx_L20_next_or:;
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":258
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":258
  *                 t = descr.type_num
  *                 if ((descr.byteorder == c'>' and little_endian) or
  *                     (descr.byteorder == c'<' and not little_endian)):             # <<<<<<<<<<<<<<
@@ -11152,7 +14317,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __pyx_t_1 = __pyx_t_2;
     __pyx_L19_bool_binop_done:;
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":257
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":257
  *             if not hasfields:
  *                 t = descr.type_num
  *                 if ((descr.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -11161,7 +14326,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     if (__pyx_t_1) {
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":259
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":259
  *                 if ((descr.byteorder == c'>' and little_endian) or
  *                     (descr.byteorder == c'<' and not little_endian)):
  *                     raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
@@ -11174,7 +14339,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       {__pyx_filename = __pyx_f[1]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":257
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":257
  *             if not hasfields:
  *                 t = descr.type_num
  *                 if ((descr.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -11183,7 +14348,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     }
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":260
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":260
  *                     (descr.byteorder == c'<' and not little_endian)):
  *                     raise ValueError(u"Non-native byte order not supported")
  *                 if   t == NPY_BYTE:        f = "b"             # <<<<<<<<<<<<<<
@@ -11195,7 +14360,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_b;
       break;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":261
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":261
  *                     raise ValueError(u"Non-native byte order not supported")
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"             # <<<<<<<<<<<<<<
@@ -11206,7 +14371,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_B;
       break;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":262
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":262
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  *                 elif t == NPY_SHORT:       f = "h"             # <<<<<<<<<<<<<<
@@ -11217,7 +14382,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_h;
       break;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":263
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":263
  *                 elif t == NPY_UBYTE:       f = "B"
  *                 elif t == NPY_SHORT:       f = "h"
  *                 elif t == NPY_USHORT:      f = "H"             # <<<<<<<<<<<<<<
@@ -11228,7 +14393,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_H;
       break;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":264
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":264
  *                 elif t == NPY_SHORT:       f = "h"
  *                 elif t == NPY_USHORT:      f = "H"
  *                 elif t == NPY_INT:         f = "i"             # <<<<<<<<<<<<<<
@@ -11239,7 +14404,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_i;
       break;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":265
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":265
  *                 elif t == NPY_USHORT:      f = "H"
  *                 elif t == NPY_INT:         f = "i"
  *                 elif t == NPY_UINT:        f = "I"             # <<<<<<<<<<<<<<
@@ -11250,7 +14415,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_I;
       break;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":266
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":266
  *                 elif t == NPY_INT:         f = "i"
  *                 elif t == NPY_UINT:        f = "I"
  *                 elif t == NPY_LONG:        f = "l"             # <<<<<<<<<<<<<<
@@ -11261,7 +14426,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_l;
       break;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":267
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":267
  *                 elif t == NPY_UINT:        f = "I"
  *                 elif t == NPY_LONG:        f = "l"
  *                 elif t == NPY_ULONG:       f = "L"             # <<<<<<<<<<<<<<
@@ -11272,7 +14437,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_L;
       break;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":268
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":268
  *                 elif t == NPY_LONG:        f = "l"
  *                 elif t == NPY_ULONG:       f = "L"
  *                 elif t == NPY_LONGLONG:    f = "q"             # <<<<<<<<<<<<<<
@@ -11283,7 +14448,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_q;
       break;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":269
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":269
  *                 elif t == NPY_ULONG:       f = "L"
  *                 elif t == NPY_LONGLONG:    f = "q"
  *                 elif t == NPY_ULONGLONG:   f = "Q"             # <<<<<<<<<<<<<<
@@ -11294,7 +14459,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_Q;
       break;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":270
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":270
  *                 elif t == NPY_LONGLONG:    f = "q"
  *                 elif t == NPY_ULONGLONG:   f = "Q"
  *                 elif t == NPY_FLOAT:       f = "f"             # <<<<<<<<<<<<<<
@@ -11305,7 +14470,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_f;
       break;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":271
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":271
  *                 elif t == NPY_ULONGLONG:   f = "Q"
  *                 elif t == NPY_FLOAT:       f = "f"
  *                 elif t == NPY_DOUBLE:      f = "d"             # <<<<<<<<<<<<<<
@@ -11316,7 +14481,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_d;
       break;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":272
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":272
  *                 elif t == NPY_FLOAT:       f = "f"
  *                 elif t == NPY_DOUBLE:      f = "d"
  *                 elif t == NPY_LONGDOUBLE:  f = "g"             # <<<<<<<<<<<<<<
@@ -11327,7 +14492,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_g;
       break;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":273
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":273
  *                 elif t == NPY_DOUBLE:      f = "d"
  *                 elif t == NPY_LONGDOUBLE:  f = "g"
  *                 elif t == NPY_CFLOAT:      f = "Zf"             # <<<<<<<<<<<<<<
@@ -11338,7 +14503,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_Zf;
       break;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":274
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":274
  *                 elif t == NPY_LONGDOUBLE:  f = "g"
  *                 elif t == NPY_CFLOAT:      f = "Zf"
  *                 elif t == NPY_CDOUBLE:     f = "Zd"             # <<<<<<<<<<<<<<
@@ -11349,7 +14514,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_Zd;
       break;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":275
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":275
  *                 elif t == NPY_CFLOAT:      f = "Zf"
  *                 elif t == NPY_CDOUBLE:     f = "Zd"
  *                 elif t == NPY_CLONGDOUBLE: f = "Zg"             # <<<<<<<<<<<<<<
@@ -11360,7 +14525,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       __pyx_v_f = __pyx_k_Zg;
       break;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":276
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":276
  *                 elif t == NPY_CDOUBLE:     f = "Zd"
  *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
  *                 elif t == NPY_OBJECT:      f = "O"             # <<<<<<<<<<<<<<
@@ -11372,7 +14537,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       break;
       default:
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":278
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":278
  *                 elif t == NPY_OBJECT:      f = "O"
  *                 else:
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
@@ -11398,7 +14563,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
       break;
     }
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":279
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":279
  *                 else:
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *                 info.format = f             # <<<<<<<<<<<<<<
@@ -11407,7 +14572,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     __pyx_v_info->format = __pyx_v_f;
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":280
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":280
  *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *                 info.format = f
  *                 return             # <<<<<<<<<<<<<<
@@ -11417,7 +14582,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __pyx_r = 0;
     goto __pyx_L0;
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":255
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":255
  *                 info.obj = self
  * 
  *             if not hasfields:             # <<<<<<<<<<<<<<
@@ -11426,7 +14591,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
   }
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":282
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":282
  *                 return
  *             else:
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)             # <<<<<<<<<<<<<<
@@ -11436,7 +14601,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   /*else*/ {
     __pyx_v_info->format = ((char *)malloc(0xFF));
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":283
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":283
  *             else:
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
  *                 info.format[0] = c'^' # Native data types, manual alignment             # <<<<<<<<<<<<<<
@@ -11445,7 +14610,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     (__pyx_v_info->format[0]) = '^';
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":284
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":284
  *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
  *                 info.format[0] = c'^' # Native data types, manual alignment
  *                 offset = 0             # <<<<<<<<<<<<<<
@@ -11454,7 +14619,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  */
     __pyx_v_offset = 0;
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":285
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":285
  *                 info.format[0] = c'^' # Native data types, manual alignment
  *                 offset = 0
  *                 f = _util_dtypestring(descr, info.format + 1,             # <<<<<<<<<<<<<<
@@ -11464,7 +14629,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     __pyx_t_7 = __pyx_f_5numpy__util_dtypestring(__pyx_v_descr, (__pyx_v_info->format + 1), (__pyx_v_info->format + 0xFF), (&__pyx_v_offset)); if (unlikely(__pyx_t_7 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 285; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_v_f = __pyx_t_7;
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":288
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":288
  *                                       info.format + _buffer_format_string_len,
  *                                       &offset)
  *                 f[0] = c'\0' # Terminate format string             # <<<<<<<<<<<<<<
@@ -11474,7 +14639,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
     (__pyx_v_f[0]) = '\x00';
   }
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":197
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":197
  *         # experimental exception made for __getbuffer__ and __releasebuffer__
  *         # -- the details of this may change.
  *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
@@ -11506,7 +14671,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
   return __pyx_r;
 }
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":290
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":290
  *                 f[0] = c'\0' # Terminate format string
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
@@ -11530,7 +14695,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("__releasebuffer__", 0);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":291
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":291
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):
  *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
@@ -11540,7 +14705,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
   __pyx_t_1 = (PyArray_HASFIELDS(__pyx_v_self) != 0);
   if (__pyx_t_1) {
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":292
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":292
  *         def __releasebuffer__(ndarray self, Py_buffer* info):
  *             if PyArray_HASFIELDS(self):
  *                 stdlib.free(info.format)             # <<<<<<<<<<<<<<
@@ -11549,7 +14714,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
  */
     free(__pyx_v_info->format);
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":291
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":291
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):
  *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
@@ -11558,7 +14723,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
  */
   }
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":293
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":293
  *             if PyArray_HASFIELDS(self):
  *                 stdlib.free(info.format)
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -11568,7 +14733,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
   __pyx_t_1 = (((sizeof(npy_intp)) != (sizeof(Py_ssize_t))) != 0);
   if (__pyx_t_1) {
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":294
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":294
  *                 stdlib.free(info.format)
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
  *                 stdlib.free(info.strides)             # <<<<<<<<<<<<<<
@@ -11577,7 +14742,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
  */
     free(__pyx_v_info->strides);
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":293
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":293
  *             if PyArray_HASFIELDS(self):
  *                 stdlib.free(info.format)
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -11586,7 +14751,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
  */
   }
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":290
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":290
  *                 f[0] = c'\0' # Terminate format string
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
@@ -11598,7 +14763,7 @@ static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_s
   __Pyx_RefNannyFinishContext();
 }
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":770
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":770
  * ctypedef npy_cdouble     complex_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
@@ -11615,7 +14780,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew1", 0);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":771
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":771
  * 
  * cdef inline object PyArray_MultiIterNew1(a):
  *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
@@ -11629,7 +14794,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":770
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":770
  * ctypedef npy_cdouble     complex_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
@@ -11648,7 +14813,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   return __pyx_r;
 }
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":773
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":773
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -11665,7 +14830,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew2", 0);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":774
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":774
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
@@ -11679,7 +14844,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":773
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":773
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -11698,7 +14863,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   return __pyx_r;
 }
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":776
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":776
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -11715,7 +14880,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew3", 0);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":777
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":777
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
@@ -11729,7 +14894,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":776
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":776
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -11748,7 +14913,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   return __pyx_r;
 }
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":779
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":779
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -11765,7 +14930,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew4", 0);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":780
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":780
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
@@ -11779,7 +14944,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":779
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":779
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -11798,7 +14963,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   return __pyx_r;
 }
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":782
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":782
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -11815,7 +14980,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew5", 0);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":783
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":783
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
@@ -11829,7 +14994,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":782
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":782
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -11848,7 +15013,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   return __pyx_r;
 }
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":785
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":785
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:             # <<<<<<<<<<<<<<
@@ -11880,7 +15045,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_util_dtypestring", 0);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":790
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":790
  * 
  *     cdef dtype child
  *     cdef int endian_detector = 1             # <<<<<<<<<<<<<<
@@ -11889,7 +15054,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
   __pyx_v_endian_detector = 1;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":791
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":791
  *     cdef dtype child
  *     cdef int endian_detector = 1
  *     cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
@@ -11898,7 +15063,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
   __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":794
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":794
  *     cdef tuple fields
  * 
  *     for childname in descr.names:             # <<<<<<<<<<<<<<
@@ -11921,7 +15086,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __Pyx_XDECREF_SET(__pyx_v_childname, __pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":795
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":795
  * 
  *     for childname in descr.names:
  *         fields = descr.fields[childname]             # <<<<<<<<<<<<<<
@@ -11938,7 +15103,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __Pyx_XDECREF_SET(__pyx_v_fields, ((PyObject*)__pyx_t_3));
     __pyx_t_3 = 0;
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":796
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":796
  *     for childname in descr.names:
  *         fields = descr.fields[childname]
  *         child, new_offset = fields             # <<<<<<<<<<<<<<
@@ -11977,7 +15142,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __Pyx_XDECREF_SET(__pyx_v_new_offset, __pyx_t_4);
     __pyx_t_4 = 0;
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":798
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":798
  *         child, new_offset = fields
  * 
  *         if (end - f) - <int>(new_offset - offset[0]) < 15:             # <<<<<<<<<<<<<<
@@ -11994,7 +15159,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_6 = ((((__pyx_v_end - __pyx_v_f) - ((int)__pyx_t_5)) < 15) != 0);
     if (__pyx_t_6) {
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":799
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":799
  * 
  *         if (end - f) - <int>(new_offset - offset[0]) < 15:
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
@@ -12007,7 +15172,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       {__pyx_filename = __pyx_f[1]; __pyx_lineno = 799; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":798
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":798
  *         child, new_offset = fields
  * 
  *         if (end - f) - <int>(new_offset - offset[0]) < 15:             # <<<<<<<<<<<<<<
@@ -12016,7 +15181,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
     }
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":801
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":801
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
  * 
  *         if ((child.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -12036,7 +15201,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     __pyx_L8_next_or:;
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":802
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":802
  * 
  *         if ((child.byteorder == c'>' and little_endian) or
  *             (child.byteorder == c'<' and not little_endian)):             # <<<<<<<<<<<<<<
@@ -12053,7 +15218,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_6 = __pyx_t_7;
     __pyx_L7_bool_binop_done:;
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":801
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":801
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
  * 
  *         if ((child.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -12062,7 +15227,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
     if (__pyx_t_6) {
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":803
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":803
  *         if ((child.byteorder == c'>' and little_endian) or
  *             (child.byteorder == c'<' and not little_endian)):
  *             raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
@@ -12075,7 +15240,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       {__pyx_filename = __pyx_f[1]; __pyx_lineno = 803; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":801
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":801
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
  * 
  *         if ((child.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -12084,7 +15249,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
     }
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":813
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":813
  * 
  *         # Output padding bytes
  *         while offset[0] < new_offset:             # <<<<<<<<<<<<<<
@@ -12100,7 +15265,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (!__pyx_t_6) break;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":814
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":814
  *         # Output padding bytes
  *         while offset[0] < new_offset:
  *             f[0] = 120 # "x"; pad byte             # <<<<<<<<<<<<<<
@@ -12109,7 +15274,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       (__pyx_v_f[0]) = 0x78;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":815
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":815
  *         while offset[0] < new_offset:
  *             f[0] = 120 # "x"; pad byte
  *             f += 1             # <<<<<<<<<<<<<<
@@ -12118,7 +15283,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       __pyx_v_f = (__pyx_v_f + 1);
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":816
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":816
  *             f[0] = 120 # "x"; pad byte
  *             f += 1
  *             offset[0] += 1             # <<<<<<<<<<<<<<
@@ -12129,7 +15294,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       (__pyx_v_offset[__pyx_t_8]) = ((__pyx_v_offset[__pyx_t_8]) + 1);
     }
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":818
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":818
  *             offset[0] += 1
  * 
  *         offset[0] += child.itemsize             # <<<<<<<<<<<<<<
@@ -12139,7 +15304,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_8 = 0;
     (__pyx_v_offset[__pyx_t_8]) = ((__pyx_v_offset[__pyx_t_8]) + __pyx_v_child->elsize);
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":820
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":820
  *         offset[0] += child.itemsize
  * 
  *         if not PyDataType_HASFIELDS(child):             # <<<<<<<<<<<<<<
@@ -12149,7 +15314,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_6 = ((!(PyDataType_HASFIELDS(__pyx_v_child) != 0)) != 0);
     if (__pyx_t_6) {
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":821
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":821
  * 
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num             # <<<<<<<<<<<<<<
@@ -12161,7 +15326,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __Pyx_XDECREF_SET(__pyx_v_t, __pyx_t_4);
       __pyx_t_4 = 0;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":822
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":822
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num
  *             if end - f < 5:             # <<<<<<<<<<<<<<
@@ -12171,7 +15336,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __pyx_t_6 = (((__pyx_v_end - __pyx_v_f) < 5) != 0);
       if (__pyx_t_6) {
 
-        /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":823
+        /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":823
  *             t = child.type_num
  *             if end - f < 5:
  *                 raise RuntimeError(u"Format string allocated too short.")             # <<<<<<<<<<<<<<
@@ -12184,7 +15349,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
         {__pyx_filename = __pyx_f[1]; __pyx_lineno = 823; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-        /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":822
+        /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":822
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num
  *             if end - f < 5:             # <<<<<<<<<<<<<<
@@ -12193,7 +15358,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       }
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":826
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":826
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"             # <<<<<<<<<<<<<<
@@ -12211,7 +15376,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":827
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":827
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"             # <<<<<<<<<<<<<<
@@ -12229,7 +15394,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":828
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":828
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"             # <<<<<<<<<<<<<<
@@ -12247,7 +15412,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":829
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":829
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"             # <<<<<<<<<<<<<<
@@ -12265,7 +15430,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":830
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":830
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"             # <<<<<<<<<<<<<<
@@ -12283,7 +15448,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":831
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":831
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"             # <<<<<<<<<<<<<<
@@ -12301,7 +15466,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":832
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":832
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"             # <<<<<<<<<<<<<<
@@ -12319,7 +15484,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":833
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":833
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"             # <<<<<<<<<<<<<<
@@ -12337,7 +15502,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":834
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":834
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"             # <<<<<<<<<<<<<<
@@ -12355,7 +15520,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":835
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":835
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"             # <<<<<<<<<<<<<<
@@ -12373,7 +15538,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":836
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":836
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"             # <<<<<<<<<<<<<<
@@ -12391,7 +15556,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":837
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":837
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"             # <<<<<<<<<<<<<<
@@ -12409,7 +15574,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":838
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":838
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"             # <<<<<<<<<<<<<<
@@ -12427,7 +15592,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":839
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":839
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf             # <<<<<<<<<<<<<<
@@ -12447,7 +15612,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":840
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":840
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd             # <<<<<<<<<<<<<<
@@ -12467,7 +15632,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":841
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":841
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg             # <<<<<<<<<<<<<<
@@ -12487,7 +15652,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":842
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":842
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"             # <<<<<<<<<<<<<<
@@ -12505,7 +15670,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":844
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":844
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
@@ -12529,7 +15694,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       }
       __pyx_L15:;
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":845
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":845
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *             f += 1             # <<<<<<<<<<<<<<
@@ -12538,7 +15703,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       __pyx_v_f = (__pyx_v_f + 1);
 
-      /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":820
+      /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":820
  *         offset[0] += child.itemsize
  * 
  *         if not PyDataType_HASFIELDS(child):             # <<<<<<<<<<<<<<
@@ -12548,7 +15713,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       goto __pyx_L13;
     }
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":849
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":849
  *             # Cython ignores struct boundary information ("T{...}"),
  *             # so don't output it
  *             f = _util_dtypestring(child, f, end, offset)             # <<<<<<<<<<<<<<
@@ -12561,7 +15726,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     __pyx_L13:;
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":794
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":794
  *     cdef tuple fields
  * 
  *     for childname in descr.names:             # <<<<<<<<<<<<<<
@@ -12571,7 +15736,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":850
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":850
  *             # so don't output it
  *             f = _util_dtypestring(child, f, end, offset)
  *     return f             # <<<<<<<<<<<<<<
@@ -12581,7 +15746,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   __pyx_r = __pyx_v_f;
   goto __pyx_L0;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":785
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":785
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:             # <<<<<<<<<<<<<<
@@ -12606,7 +15771,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   return __pyx_r;
 }
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":966
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":966
  * 
  * 
  * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
@@ -12621,7 +15786,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   int __pyx_t_2;
   __Pyx_RefNannySetupContext("set_array_base", 0);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":968
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":968
  * cdef inline void set_array_base(ndarray arr, object base):
  *      cdef PyObject* baseptr
  *      if base is None:             # <<<<<<<<<<<<<<
@@ -12632,7 +15797,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (__pyx_t_2) {
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":969
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":969
  *      cdef PyObject* baseptr
  *      if base is None:
  *          baseptr = NULL             # <<<<<<<<<<<<<<
@@ -12641,7 +15806,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
     __pyx_v_baseptr = NULL;
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":968
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":968
  * cdef inline void set_array_base(ndarray arr, object base):
  *      cdef PyObject* baseptr
  *      if base is None:             # <<<<<<<<<<<<<<
@@ -12651,7 +15816,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
     goto __pyx_L3;
   }
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":971
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":971
  *          baseptr = NULL
  *      else:
  *          Py_INCREF(base) # important to do this before decref below!             # <<<<<<<<<<<<<<
@@ -12661,7 +15826,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   /*else*/ {
     Py_INCREF(__pyx_v_base);
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":972
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":972
  *      else:
  *          Py_INCREF(base) # important to do this before decref below!
  *          baseptr = <PyObject*>base             # <<<<<<<<<<<<<<
@@ -12672,7 +15837,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   }
   __pyx_L3:;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":973
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":973
  *          Py_INCREF(base) # important to do this before decref below!
  *          baseptr = <PyObject*>base
  *      Py_XDECREF(arr.base)             # <<<<<<<<<<<<<<
@@ -12681,7 +15846,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
   Py_XDECREF(__pyx_v_arr->base);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":974
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":974
  *          baseptr = <PyObject*>base
  *      Py_XDECREF(arr.base)
  *      arr.base = baseptr             # <<<<<<<<<<<<<<
@@ -12690,7 +15855,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
   __pyx_v_arr->base = __pyx_v_baseptr;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":966
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":966
  * 
  * 
  * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
@@ -12702,7 +15867,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __Pyx_RefNannyFinishContext();
 }
 
-/* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":976
+/* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":976
  *      arr.base = baseptr
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -12716,7 +15881,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("get_array_base", 0);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":977
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":977
  * 
  * cdef inline object get_array_base(ndarray arr):
  *     if arr.base is NULL:             # <<<<<<<<<<<<<<
@@ -12726,7 +15891,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __pyx_t_1 = ((__pyx_v_arr->base == NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":978
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":978
  * cdef inline object get_array_base(ndarray arr):
  *     if arr.base is NULL:
  *         return None             # <<<<<<<<<<<<<<
@@ -12738,7 +15903,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
     __pyx_r = Py_None;
     goto __pyx_L0;
 
-    /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":977
+    /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":977
  * 
  * cdef inline object get_array_base(ndarray arr):
  *     if arr.base is NULL:             # <<<<<<<<<<<<<<
@@ -12747,7 +15912,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
  */
   }
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":980
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":980
  *         return None
  *     else:
  *         return <object>arr.base             # <<<<<<<<<<<<<<
@@ -12759,7 +15924,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
     goto __pyx_L0;
   }
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":976
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":976
  *      arr.base = baseptr
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -13117,26 +16282,37 @@ static PyMethodDef __pyx_methods_3nlp_5model_3src_10_amplmodel_ampl[] = {
   {"get_pi0", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_13get_pi0, METH_NOARGS, 0},
   {"get_Lcon", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_15get_Lcon, METH_NOARGS, 0},
   {"get_Ucon", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_17get_Ucon, METH_NOARGS, 0},
-  {"get_nnzj", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_19get_nnzj, METH_NOARGS, 0},
-  {"get_nnzh", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_21get_nnzh, METH_NOARGS, 0},
-  {"get_CType", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_23get_CType, METH_NOARGS, 0},
-  {"eval_obj", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_25eval_obj, METH_VARARGS|METH_KEYWORDS, 0},
-  {"grad_obj", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_27grad_obj, METH_O, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_26grad_obj},
-  {"eval_cons", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_29eval_cons, METH_O, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_28eval_cons},
-  {"eval_sgrad", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_31eval_sgrad, METH_O, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_30eval_sgrad},
-  {"eval_cost", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_33eval_cost, METH_NOARGS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_32eval_cost},
-  {"eval_ci", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_35eval_ci, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_34eval_ci},
-  {"eval_gi", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_37eval_gi, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_36eval_gi},
-  {"eval_sgi", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_39eval_sgi, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_38eval_sgi},
-  {"eval_row", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_41eval_row, METH_O, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_40eval_row},
-  {"eval_A", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_43eval_A, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_42eval_A},
-  {"eval_J", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_45eval_J, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_44eval_J},
-  {"eval_H", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_47eval_H, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_46eval_H},
-  {"H_prod", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_49H_prod, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_48H_prod},
-  {"gHi_prod", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_51gHi_prod, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_50gHi_prod},
-  {"set_x", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_53set_x, METH_O, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_52set_x},
-  {"unset_x", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_55unset_x, METH_NOARGS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_54unset_x},
-  {"ampl_sol", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_57ampl_sol, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_56ampl_sol},
+  {"set_Lvar", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_19set_Lvar, METH_O, 0},
+  {"set_Uvar", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_21set_Uvar, METH_O, 0},
+  {"set_Lcon", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_23set_Lcon, METH_O, 0},
+  {"set_Ucon", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_25set_Ucon, METH_O, 0},
+  {"get_objtypes", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_27get_objtypes, METH_NOARGS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_26get_objtypes},
+  {"get_nnzj", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_29get_nnzj, METH_NOARGS, 0},
+  {"get_nnzh", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_31get_nnzh, METH_NOARGS, 0},
+  {"get_CType", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_33get_CType, METH_NOARGS, 0},
+  {"eval_obj", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_35eval_obj, METH_VARARGS|METH_KEYWORDS, 0},
+  {"eval_objs", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_37eval_objs, METH_O, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_36eval_objs},
+  {"grad_obj", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_39grad_obj, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_38grad_obj},
+  {"grad_objs", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_41grad_objs, METH_O, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_40grad_objs},
+  {"eval_cons", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_43eval_cons, METH_O, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_42eval_cons},
+  {"eval_sgrad", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_45eval_sgrad, METH_O, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_44eval_sgrad},
+  {"eval_cost", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_47eval_cost, METH_NOARGS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_46eval_cost},
+  {"eval_ci", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_49eval_ci, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_48eval_ci},
+  {"eval_gi", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_51eval_gi, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_50eval_gi},
+  {"eval_sgi", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_53eval_sgi, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_52eval_sgi},
+  {"eval_row", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_55eval_row, METH_O, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_54eval_row},
+  {"eval_A", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_57eval_A, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_56eval_A},
+  {"eval_J", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_59eval_J, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_58eval_J},
+  {"get_J_pattern", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_61get_J_pattern, METH_NOARGS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_60get_J_pattern},
+  {"eval_J_vals", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_63eval_J_vals, METH_O, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_62eval_J_vals},
+  {"eval_H", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_65eval_H, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_64eval_H},
+  {"get_H_pattern", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_67get_H_pattern, METH_NOARGS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_66get_H_pattern},
+  {"eval_H_vals", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_69eval_H_vals, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_68eval_H_vals},
+  {"H_prod", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_71H_prod, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_70H_prod},
+  {"gHi_prod", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_73gHi_prod, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_72gHi_prod},
+  {"set_x", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_75set_x, METH_O, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_74set_x},
+  {"unset_x", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_77unset_x, METH_NOARGS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_76unset_x},
+  {"ampl_sol", (PyCFunction)__pyx_pw_3nlp_5model_3src_10_amplmodel_4ampl_79ampl_sol, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_78ampl_sol},
   {0, 0, 0, 0}
 };
 
@@ -13253,6 +16429,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_u_Non_native_byte_order_not_suppor, __pyx_k_Non_native_byte_order_not_suppor, sizeof(__pyx_k_Non_native_byte_order_not_suppor), 0, 1, 0, 0},
   {&__pyx_n_s_RuntimeError, __pyx_k_RuntimeError, sizeof(__pyx_k_RuntimeError), 0, 0, 1, 1},
   {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
+  {&__pyx_n_s_array, __pyx_k_array, sizeof(__pyx_k_array), 0, 0, 1, 1},
   {&__pyx_n_s_close, __pyx_k_close, sizeof(__pyx_k_close), 0, 0, 1, 1},
   {&__pyx_kp_s_congrd_failed, __pyx_k_congrd_failed, sizeof(__pyx_k_congrd_failed), 0, 0, 1, 0},
   {&__pyx_n_s_copy, __pyx_k_copy, sizeof(__pyx_k_copy), 0, 0, 1, 1},
@@ -13267,6 +16444,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
   {&__pyx_n_s_int, __pyx_k_int, sizeof(__pyx_k_int), 0, 0, 1, 1},
+  {&__pyx_n_s_int32, __pyx_k_int32, sizeof(__pyx_k_int32), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
   {&__pyx_n_s_msg, __pyx_k_msg, sizeof(__pyx_k_msg), 0, 0, 1, 1},
   {&__pyx_kp_u_ndarray_is_not_C_contiguous, __pyx_k_ndarray_is_not_C_contiguous, sizeof(__pyx_k_ndarray_is_not_C_contiguous), 0, 1, 0, 0},
@@ -13297,12 +16475,12 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
 };
 static int __Pyx_InitCachedBuiltins(void) {
   __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 147; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_open = __Pyx_GetBuiltinName(__pyx_n_s_open); if (!__pyx_builtin_open) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 214; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_open = __Pyx_GetBuiltinName(__pyx_n_s_open); if (!__pyx_builtin_open) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 238; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 327; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   #if PY_MAJOR_VERSION >= 3
-  __pyx_builtin_xrange = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_xrange) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 475; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_xrange = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_xrange) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 575; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   #else
-  __pyx_builtin_xrange = __Pyx_GetBuiltinName(__pyx_n_s_xrange); if (!__pyx_builtin_xrange) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 475; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_xrange = __Pyx_GetBuiltinName(__pyx_n_s_xrange); if (!__pyx_builtin_xrange) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 575; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   #endif
   __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 799; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   return 0;
@@ -13314,18 +16492,18 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "nlp/model/src/_amplmodel.pyx":394
- *              grad_ci = np.empty(nzgi, dtype=np.double)
+  /* "nlp/model/src/_amplmodel.pyx":482
  *         if ampl_congrd(self.asl, i, <double*>x.data, <double*>grad_ci.data):
+ *             self.asl.i.congrd_mode = congrd_mode_save
  *             raise ValueError('congrd failed')             # <<<<<<<<<<<<<<
  * 
- *         # Generate dictionary.
+ *         # Restore gradient mode
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_congrd_failed); if (unlikely(!__pyx_tuple_)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_congrd_failed); if (unlikely(!__pyx_tuple_)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 482; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":218
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":218
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
@@ -13336,7 +16514,7 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__2);
   __Pyx_GIVEREF(__pyx_tuple__2);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":222
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":222
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
  *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
@@ -13347,7 +16525,7 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__3);
   __Pyx_GIVEREF(__pyx_tuple__3);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":259
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":259
  *                 if ((descr.byteorder == c'>' and little_endian) or
  *                     (descr.byteorder == c'<' and not little_endian)):
  *                     raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
@@ -13358,7 +16536,7 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__4);
   __Pyx_GIVEREF(__pyx_tuple__4);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":799
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":799
  * 
  *         if (end - f) - <int>(new_offset - offset[0]) < 15:
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
@@ -13369,7 +16547,7 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__5);
   __Pyx_GIVEREF(__pyx_tuple__5);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":803
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":803
  *         if ((child.byteorder == c'>' and little_endian) or
  *             (child.byteorder == c'<' and not little_endian)):
  *             raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
@@ -13380,7 +16558,7 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__6);
   __Pyx_GIVEREF(__pyx_tuple__6);
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":823
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":823
  *             t = child.type_num
  *             if end - f < 5:
  *                 raise RuntimeError(u"Format string allocated too short.")             # <<<<<<<<<<<<<<
@@ -13399,8 +16577,6 @@ static int __Pyx_InitCachedConstants(void) {
 
 static int __Pyx_InitGlobals(void) {
   if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -13495,12 +16671,12 @@ PyMODINIT_FUNC PyInit__amplmodel(void)
   __pyx_vtabptr_3nlp_5model_3src_10_amplmodel_ampl = &__pyx_vtable_3nlp_5model_3src_10_amplmodel_ampl;
   __pyx_vtable_3nlp_5model_3src_10_amplmodel_ampl.get_nnzj = (PyObject *(*)(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *, int __pyx_skip_dispatch))__pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_get_nnzj;
   __pyx_vtable_3nlp_5model_3src_10_amplmodel_ampl.get_nnzh = (PyObject *(*)(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *, int __pyx_skip_dispatch))__pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_get_nnzh;
-  __pyx_vtable_3nlp_5model_3src_10_amplmodel_ampl.grad_obj = (PyObject *(*)(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *, PyArrayObject *, int __pyx_skip_dispatch))__pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_grad_obj;
-  if (PyType_Ready(&__pyx_type_3nlp_5model_3src_10_amplmodel_ampl) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_vtable_3nlp_5model_3src_10_amplmodel_ampl.grad_obj = (PyObject *(*)(struct __pyx_obj_3nlp_5model_3src_10_amplmodel_ampl *, PyArrayObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_3nlp_5model_3src_10_amplmodel_4ampl_grad_obj *__pyx_optional_args))__pyx_f_3nlp_5model_3src_10_amplmodel_4ampl_grad_obj;
+  if (PyType_Ready(&__pyx_type_3nlp_5model_3src_10_amplmodel_ampl) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_type_3nlp_5model_3src_10_amplmodel_ampl.tp_print = 0;
   #if CYTHON_COMPILING_IN_CPYTHON
   {
-    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_3nlp_5model_3src_10_amplmodel_ampl, "__init__"); if (unlikely(!wrapper)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_3nlp_5model_3src_10_amplmodel_ampl, "__init__"); if (unlikely(!wrapper)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
       __pyx_wrapperbase_3nlp_5model_3src_10_amplmodel_4ampl_4__init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
       __pyx_wrapperbase_3nlp_5model_3src_10_amplmodel_4ampl_4__init__.doc = __pyx_doc_3nlp_5model_3src_10_amplmodel_4ampl_4__init__;
@@ -13508,8 +16684,8 @@ PyMODINIT_FUNC PyInit__amplmodel(void)
     }
   }
   #endif
-  if (__Pyx_SetVtable(__pyx_type_3nlp_5model_3src_10_amplmodel_ampl.tp_dict, __pyx_vtabptr_3nlp_5model_3src_10_amplmodel_ampl) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (PyObject_SetAttrString(__pyx_m, "ampl", (PyObject *)&__pyx_type_3nlp_5model_3src_10_amplmodel_ampl) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetVtable(__pyx_type_3nlp_5model_3src_10_amplmodel_ampl.tp_dict, __pyx_vtabptr_3nlp_5model_3src_10_amplmodel_ampl) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttrString(__pyx_m, "ampl", (PyObject *)&__pyx_type_3nlp_5model_3src_10_amplmodel_ampl) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_ptype_3nlp_5model_3src_10_amplmodel_ampl = &__pyx_type_3nlp_5model_3src_10_amplmodel_ampl;
   /*--- Type import code ---*/
   __pyx_ptype_7cpython_4type_type = __Pyx_ImportType(__Pyx_BUILTIN_MODULE_NAME, "type", 
@@ -13576,7 +16752,7 @@ PyMODINIT_FUNC PyInit__amplmodel(void)
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "../../lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":976
+  /* "../.pyenv/versions/2.7.18/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":976
  *      arr.base = baseptr
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -14216,6 +17392,42 @@ static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyOb
 #endif
 }
 
+static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+#endif
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
 static void __Pyx_RaiseArgtupleInvalid(
     const char* func_name,
     int exact,
@@ -14757,107 +17969,6 @@ bad:
 }
 #endif
 
-#if CYTHON_USE_PYLONG_INTERNALS
-  #include "longintrepr.h"
-#endif
-
-#if CYTHON_COMPILING_IN_CPYTHON
-static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, CYTHON_UNUSED int inplace) {
-    #if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_CheckExact(op1))) {
-        const long b = intval;
-        long x;
-        long a = PyInt_AS_LONG(op1);
-            x = (long)((unsigned long)a + b);
-            if (likely((x^a) >= 0 || (x^b) >= 0))
-                return PyInt_FromLong(x);
-            return PyLong_Type.tp_as_number->nb_add(op1, op2);
-    }
-    #endif
-    #if CYTHON_USE_PYLONG_INTERNALS && PY_MAJOR_VERSION >= 3
-    if (likely(PyLong_CheckExact(op1))) {
-        const long b = intval;
-        long a, x;
-        const PY_LONG_LONG llb = intval;
-        PY_LONG_LONG lla, llx;
-        const digit* digits = ((PyLongObject*)op1)->ob_digit;
-        const Py_ssize_t size = Py_SIZE(op1);
-        if (likely(__Pyx_sst_abs(size) <= 1)) {
-            a = likely(size) ? digits[0] : 0;
-            if (size == -1) a = -a;
-        } else {
-            switch (size) {
-                case -2:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
-                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    }
-                case 2:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
-                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    }
-                case -3:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
-                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    }
-                case 3:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
-                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    }
-                case -4:
-                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
-                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    }
-                case 4:
-                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
-                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    }
-                default: return PyLong_Type.tp_as_number->nb_add(op1, op2);
-            }
-        }
-                x = a + b;
-            return PyLong_FromLong(x);
-        long_long:
-                llx = lla + llb;
-            return PyLong_FromLongLong(llx);
-    }
-    #endif
-    if (PyFloat_CheckExact(op1)) {
-        const long b = intval;
-        double a = PyFloat_AS_DOUBLE(op1);
-            double result;
-            PyFPE_START_PROTECT("add", return NULL)
-            result = ((double)a) + (double)b;
-            PyFPE_END_PROTECT(result)
-            return PyFloat_FromDouble(result);
-    }
-    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
-}
-#endif
-
 static void __Pyx_RaiseBufferIndexError(int axis) {
   PyErr_Format(PyExc_IndexError,
      "Out of bounds on buffer access (axis %d)", axis);
@@ -15206,6 +18317,10 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
         return (target_type) value;\
     }
 
+#if CYTHON_USE_PYLONG_INTERNALS
+  #include "longintrepr.h"
+#endif
+
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
     const int neg_one = (int) -1, const_zero = (int) 0;
     const int is_unsigned = neg_one > const_zero;
@@ -15416,6 +18531,32 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
     }
 }
 
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_char(char value) {
+    const char neg_one = (char) -1, const_zero = (char) 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(char) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(char) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+        } else if (sizeof(char) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+        }
+    } else {
+        if (sizeof(char) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(char) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(char),
+                                     little, !is_unsigned);
+    }
+}
+
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
     const long neg_one = (long) -1, const_zero = (long) 0;
     const int is_unsigned = neg_one > const_zero;
@@ -148,6 +148,30 @@ cdef ndarray copy_c_to_numpy(double *x, int lenx):
         v[i] = x[i]
     return v
 
+cdef int ograd_len(ograd* og):
+    """Utility to count the elements of an ograd linked list."""
+    cdef int n = 0
+    while og is not NULL:
+        n += 1
+        og = og.next
+    return n
+
+cdef int cgrad_len(cgrad* cg):
+    """Utility to count the elements of a cgrad linked list."""
+    cdef int n = 0
+    while cg is not NULL:
+        n += 1
+        cg = cg.next
+    return n
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void copy_numpy_to_c(ndarray[np.double_t] v, double *x, int lenx):
+    """Utility to copy a numpy array of doubles to a C array."""
+    cdef int i
+    for i in range(lenx):
+        x[i] = v[i]
+
 ########################################################################
 # AMPL interface class
 ########################################################################
@@ -264,6 +288,22 @@ cdef class ampl:
     def get_Lcon(self): return copy_c_to_numpy(self.asl.i.LUrhs_, self.n_con)
     def get_Ucon(self): return copy_c_to_numpy(self.asl.i.Urhsx_, self.n_con)
 
+    # Routines to update problem data in place.
+    def set_Lvar(self, ndarray[np.double_t] v):
+        copy_numpy_to_c(v, self.asl.i.LUv_, self.n_var)
+    def set_Uvar(self, ndarray[np.double_t] v):
+        copy_numpy_to_c(v, self.asl.i.Uvx_, self.n_var)
+    def set_Lcon(self, ndarray[np.double_t] v):
+        copy_numpy_to_c(v, self.asl.i.LUrhs_, self.n_con)
+    def set_Ucon(self, ndarray[np.double_t] v):
+        copy_numpy_to_c(v, self.asl.i.Urhsx_, self.n_con)
+
+    def get_objtypes(self):
+        """Return the sense of each objective (0 = minimization)."""
+        cdef int i
+        return np.array([self.asl.i.objtype_[i] for i in range(self.n_obj)],
+                        dtype=np.int)
+
     # Sparsity of Jacobian and Hessian.
     cpdef get_nnzj(self): return self.nzc
     cpdef get_nnzh(self): return ampl_sphsetup(self.asl, -1, 1, 1, 1)
@@ -287,15 +327,48 @@ cdef class ampl:
             raise ValueError
         return val
 
-    cpdef grad_obj(self, ndarray[np.double_t] x):
+    def eval_objs(self, ndarray[np.double_t] x):
+        """Evaluate all objectives at x."""
+        cdef:
+            int i, nerror = 0
+            ndarray[np.double_t] f = np.empty(self.n_obj, dtype=np.double)
+
+        # Ensure contiguous input.
+        if not PyArray_ISCARRAY(x): x = x.copy()
+
+        for i in range(self.n_obj):
+            f[i] = ampl_objval(self.asl, i, <double*>x.data, &nerror)
+            if nerror:
+                raise ValueError
+        return f
+
+    cpdef grad_obj(self, ndarray[np.double_t] x, int obj_num=0):
         """Evaluate the gradient of the objective at x."""
         # Ensure contiguous input.
         if not PyArray_ISCARRAY(x): x = x.copy()
         cdef ndarray[np.double_t] g = x.copy()
-        if ampl_objgrd(self.asl, 0, <double*>x.data, <double*>g.data):
+        if ampl_objgrd(self.asl, obj_num, <double*>x.data, <double*>g.data):
             raise ValueError
         return g
 
+    def grad_objs(self, ndarray[np.double_t] x):
+        """Evaluate the gradients of all objectives at x.
+
+        Gradients are stored in the rows of the returned array."""
+        cdef:
+            int i
+            ndarray[np.double_t, ndim=2] G = \
+                np.empty((self.n_obj, self.n_var), dtype=np.double)
+
+        # Ensure contiguous input.
+        if not PyArray_ISCARRAY(x): x = x.copy()
+
+        for i in range(self.n_obj):
+            if ampl_objgrd(self.asl, i, <double*>x.data,
+                           <double*>G.data + i * self.n_var):
+                raise ValueError
+        return G
+
     def eval_cons(self, ndarray[np.double_t] x):
         """Evaluate the constraints at x."""
         cdef ndarray[np.double_t] \
@@ -310,28 +383,45 @@ cdef class ampl:
 
     def eval_sgrad(self, ndarray[np.double_t] x):
         """Evaluate linear-part of the objective gradient at x.  A
-        sparse gradient is returned as a dictionary."""
-        grad_f = self.grad_obj(x)
-        sg = {} ; j = 0
-        cdef ograd* og = self.asl.i.Ograd_[0]
+        sparse gradient is returned as a tuple (indices, values)."""
+        cdef:
+            ograd* og
+            int k, nzo
+            ndarray[np.double_t] grad_f = self.grad_obj(x)
+            ndarray[np.int32_t] idx
+            ndarray[np.double_t] val
+
+        nzo = ograd_len(self.asl.i.Ograd_[0])
+        idx = np.empty(nzo, dtype=np.int32)
+        val = np.empty(nzo, dtype=np.double)
+        og = self.asl.i.Ograd_[0]
+        k = 0
         while og is not NULL:
-            key = og.varno
-            val = grad_f[j]
-            sg[key] = val
+            idx[k] = og.varno
+            val[k] = grad_f[og.varno]
             og = og.next
-            j += 1
-        return sg
+            k += 1
+        return (idx, val)
 
     def eval_cost(self):
-        """Evaluate sparse linear-cost vector."""
-        sg = {}
-        cdef ograd* og = self.asl.i.Ograd_[0]
+        """Evaluate sparse linear-cost vector as a tuple (indices, values)."""
+        cdef:
+            ograd* og
+            int k, nzo
+            ndarray[np.int32_t] idx
+            ndarray[np.double_t] val
+
+        nzo = ograd_len(self.asl.i.Ograd_[0])
+        idx = np.empty(nzo, dtype=np.int32)
+        val = np.empty(nzo, dtype=np.double)
+        og = self.asl.i.Ograd_[0]
+        k = 0
         while og is not NULL:
-            key = og.varno
-            val = og.coef
-            sg[key] = val
+            idx[k] = og.varno
+            val[k] = og.coef
             og = og.next
-        return sg
+            k += 1
+        return (idx, val)
 
     def eval_ci(self, int i, ndarray[np.double_t] x):
         """Evaluate ith constraint."""
@@ -363,11 +453,15 @@ cdef class ampl:
         return gi
 
     def eval_sgi(self, int i, ndarray[np.double_t] x):
-        """Evalute the ith constraint sparse gradient at x."""
+        """Evalute the ith constraint sparse gradient at x.
+
+        The sparse gradient is returned as a tuple (indices, values)."""
 
         cdef:
-            int nzgi, j
+            int nzgi, k
             cgrad* cg
+            ndarray[np.int32_t] idx
+            ndarray[np.double_t] grad_ci
 
         if i < 0 or i >= self.n_con:
             raise ValueError('Got i = %d; exected 0 <= i < %d' %
@@ -380,45 +474,51 @@ cdef class ampl:
         congrd_mode_save = self.asl.i.congrd_mode
         self.asl.i.congrd_mode = 1
 
-        # Count number of nonzeros in gi.
-        nzgi = 0
-        cg = self.asl.i.Cgrad_[i]
-        while cg is not NULL:
-            nzgi += 1
-            cg = cg.next
-
         # Allocate storage and evaluate ith constraint at x.
-        cdef ndarray[np.double_t] \
-             grad_ci = np.empty(nzgi, dtype=np.double)
+        nzgi = cgrad_len(self.asl.i.Cgrad_[i])
+        grad_ci = np.empty(nzgi, dtype=np.double)
         if ampl_congrd(self.asl, i, <double*>x.data, <double*>grad_ci.data):
+            self.asl.i.congrd_mode = congrd_mode_save
             raise ValueError('congrd failed')
 
-        # Generate dictionary.
-        j = 0
-        sgi = {}
+        # Restore gradient mode
+        self.asl.i.congrd_mode = congrd_mode_save
+
+        # Collect indices in the order in which values were stored.
+        idx = np.empty(nzgi, dtype=np.int32)
+        k = 0
         cg = self.asl.i.Cgrad_[i]
         while cg is not NULL:
-            sgi[cg.varno] = grad_ci[j]
+            idx[k] = cg.varno
             cg = cg.next
-            j += 1
+            k += 1
 
-        # Restore gradient mode
-        self.asl.i.congrd_mode = congrd_mode_save
-
-        return sgi
+        return (idx, grad_ci)
 
     def eval_row(self, int i):
-        """Evaluate the ith constraint gradient as a sparse vector. To
-        be used when the problem is a linear program."""
+        """Evaluate the ith constraint gradient as a tuple (indices, values).
+        To be used when the problem is a linear program."""
+        cdef:
+            int nzgi, k
+            cgrad* cg
+            ndarray[np.int32_t] idx
+            ndarray[np.double_t] val
+
         if i < 0 or i >= self.n_con:
             raise ValueError('Got i = %d; exected 0 <= i < %d' %
                              (i, self.n_con))
-        row = {}
-        cdef cgrad* cg = self.asl.i.Cgrad_[i]
+
+        nzgi = cgrad_len(self.asl.i.Cgrad_[i])
+        idx = np.empty(nzgi, dtype=np.int32)
+        val = np.empty(nzgi, dtype=np.double)
+        k = 0
+        cg = self.asl.i.Cgrad_[i]
         while cg is not NULL:
-            row[cg.varno] = cg.coef
+            idx[k] = cg.varno
+            val[k] = cg.coef
             cg = cg.next
-        return row
+            k += 1
+        return (idx, val)
 
     def eval_A(self, int store_zeros=0):
         """
@@ -483,6 +583,41 @@ cdef class ampl:
 
         return (J, a_irow, a_icol)
 
+    def get_J_pattern(self):
+        """Return the sparsity pattern of the Jacobian in coordinate format.
+
+        The pattern does not depend on x and is ordered consistently with
+        the values returned by `eval_J_vals()`."""
+        cdef:
+            cgrad* cg
+            int i
+
+        nnzj = self.nzc if self.n_con else 0
+        a_icol = np.empty(nnzj, dtype=np.int)
+        a_irow = np.empty(nnzj, dtype=np.int)
+
+        for i in xrange(self.n_con):
+            cg = self.asl.i.Cgrad_[i]
+            while cg is not NULL:
+                a_irow[cg.goff] = i
+                a_icol[cg.goff] = cg.varno
+                cg = cg.next
+
+        return (a_irow, a_icol)
+
+    def eval_J_vals(self, ndarray[np.double_t] x):
+        """Evaluate the nonzero values of the sparse Jacobian at x."""
+        cdef ndarray[np.double_t] J
+
+        # Ensure contiguous input.
+        if not PyArray_ISCARRAY(x): x = x.copy()
+
+        nnzj = self.nzc if self.n_con else 0
+        J = np.empty(nnzj, dtype=np.double)
+        if ampl_jacval(self.asl, <double*>x.data, <double*>J.data):
+            raise ValueError
+        return J
+
 
     def eval_H(self, ndarray[np.double_t] x, ndarray[np.double_t] y,
                double obj_weight=1.0, int store_zeros=0):
@@ -543,6 +678,58 @@ cdef class ampl:
 
         return (H, a_irow, a_icol)
 
+    def get_H_pattern(self):
+        """Return the sparsity pattern of the lower triangle of the Lagrangian
+        Hessian in coordinate format.
+
+        The pattern does not depend on (x, y) and is ordered consistently with
+        the values returned by `eval_H_vals()`."""
+        cdef int i, j, k
+
+        nnzh = self.get_nnzh()
+        a_icol = np.empty(nnzh, dtype=np.int)
+        a_irow = np.empty(nnzh, dtype=np.int)
+
+        k = 0
+        for i in xrange(self.n_var):
+            j0 = self.asl.i.sputinfo_.hcolstarts[i  ]
+            j1 = self.asl.i.sputinfo_.hcolstarts[i+1]
+            for j in xrange(j0,j1):
+                a_icol[k] = self.asl.i.sputinfo_.hrownos[j]
+                a_irow[k] = i
+                k += 1
+
+        return (a_irow, a_icol)
+
+    def eval_H_vals(self, ndarray[np.double_t] x, ndarray[np.double_t] y,
+                    double obj_weight=1.0):
+        """Evaluate the nonzero values of the sparse Lagrangian Hessian.
+
+        See `eval_H()` for caveats regarding the point at which the Hessian
+        is evaluated."""
+        cdef:
+            ndarray[np.double_t] H
+            double OW[1]
+            int nerror = 0
+            int obj_num = 0
+            double val
+
+        # Ensure contiguous input.
+        if not PyArray_ISCARRAY(x): x = x.copy()
+        if not PyArray_ISCARRAY(y): y = y.copy()
+
+        # extra objective evaluation.
+        val = ampl_objval(self.asl, obj_num, <double*>x.data, &nerror)
+        if nerror:
+            raise ValueError
+
+        nnzh = self.get_nnzh()
+        OW[0] = obj_weight if self.objtype == 0 else -obj_weight
+
+        H = np.empty(nnzh, dtype=np.double)
+        ampl_sphes(self.asl, <double*>H.data, -1, OW, <double*>y.data)
+        return H
+
     def H_prod(self, ndarray[np.double_t] x, ndarray[np.double_t] y,
                ndarray[np.double_t] v, double obj_weight=1.0):
         """Compute matrix-vector product Hv of Lagrangian Hessian
@@ -0,0 +1,539 @@
+# -*- coding: utf-8 -*-
+u"""ARC: Adaptive Regularization with Cubics for unconstrained problems.
+
+An implementation of the method of
+
+  C. Cartis, N. I. M. Gould and Ph. L. Toint, *Adaptive cubic
+  regularisation methods for unconstrained optimization. Part I:
+  motivation, convergence and numerical results*, Mathematical
+  Programming **127** (2), pp. 245-295, 2011.
+
+At each iteration, the step approximately minimizes the cubic model
+
+    m(s) = gᵀs + ½ sᵀHs + ⅓ σ ‖s‖³
+
+where σ > 0 plays the role of the inverse of a trust-region radius and is
+updated according to the agreement between the model and the objective. The
+model is minimized over Krylov subspaces generated by the Lanczos method, as
+in the generalized Lanczos trust-region method.
+"""
+
+import logging
+from math import sqrt
+import numpy as np
+
+from scipy.linalg import eigh_tridiagonal
+
+from nlp.model.nlpmodel import QPModel
+from nlp.optimize.gltr import GLTR, lanczos_tridiagonal
+from nlp.tools import norms
+from nlp.tools.utils import matvec
+from nlp.tools.timing import cputime
+from nlp.tools.exceptions import UserExitRequest
+
+try:
+    from scipy import sparse as sp
+except ImportError:
+    sp = None
+
+__docformat__ = 'restructuredtext'
+
+
+def tridiagonal_cubic_subproblem(diag, off, gamma0, sigma, tol=1.0e-12,
+                                 maxiter=100):
+    u"""Minimize a cubic model with a tridiagonal Hessian.
+
+    Minimize γ₀ hᵀe₁ + ½ hᵀTh + ⅓ σ ‖h‖³, where T has diagonal `diag` and
+    off-diagonal `off`. The global minimizer solves (T + λI) h = -γ₀ e₁
+    with λ = σ‖h‖ and T + λI positive semi-definite. The secular equation
+    is solved in the eigenbasis of T, which also exposes the hard case.
+    Return the solution `h`, the multiplier λ and the value of the model.
+    """
+    evals, evecs = eigh_tridiagonal(diag, off)
+    c = gamma0 * evecs[0]
+    e0 = evals[0]
+    cnorm = np.linalg.norm(c)
+
+    def coords(lam):
+        return -c / (evals + lam)
+
+    scale = max(1.0, np.max(np.abs(evals)))
+    near = evals - e0 <= tol * scale
+    y = np.zeros_like(c)
+    far = ~near
+    lam_lo = max(0.0, -e0)
+    y[far] = -c[far] / (evals[far] + lam_lo)
+    if np.all(np.abs(c[near]) <= tol * max(gamma0, 1.0)) and \
+            np.linalg.norm(y) <= lam_lo / sigma:
+        # Hard case, or g = 0: complete with an eigenvector of the smallest
+        # eigenvalue.
+        lam = lam_lo
+        y[np.argmax(near)] = sqrt((lam / sigma)**2 - np.dot(y, y))
+    else:
+        # Newton's method on 1/‖y(λ)‖ - σ/λ = 0, which is increasing in λ,
+        # safeguarded by bisection. The root does not exceed the positive
+        # root of λ(λ + e₀) = σ‖c‖.
+        lo = lam_lo
+        hi = 0.5 * (-e0 + sqrt(e0**2 + 4 * sigma * cnorm))
+        lam = hi
+        for _ in range(maxiter):
+            y = coords(lam)
+            ynorm = np.linalg.norm(y)
+            if abs(ynorm - lam / sigma) <= tol * ynorm:
+                break
+            phi = 1 / ynorm - sigma / lam
+            if phi < 0:
+                lo = lam
+            else:
+                hi = lam
+            dphi = np.sum(y**2 / (evals + lam)) / ynorm**3 + sigma / lam**2
+            lam -= phi / dphi
+            if not lo < lam < hi:
+                lam = 0.5 * (lo + hi)
+    h = np.dot(evecs, y)
+    hnorm = np.linalg.norm(y)
+    mval = np.dot(c, y) + 0.5 * np.dot(evals * y, y) + sigma * hnorm**3 / 3
+    return (h, lam, mval)
+
+
+class GLRT(GLTR):
+    """Generalized Lanczos solver for the cubic regularization subproblem."""
+
+    def __init__(self, qp, **kwargs):
+        u"""Solve the cubic regularization subproblem
+
+          minimize    gᵀs + ½ sᵀHs + ⅓ σ ‖s‖³
+
+        by means of the generalized Lanczos method. When a preconditioner
+        approximating M⁻¹ is given, the regularization is defined in the
+        norm ‖s‖_M = sqrt(sᵀMs).
+
+        The Lanczos process is retained from one call to :meth:`solve` to
+        the next, so that the subproblem may be solved again for a different
+        σ without repeating Hessian-vector products, except those needed to
+        assemble the step. The preconditioner must therefore remain the same
+        in successive calls.
+
+        :parameters:
+            :qp:           an instance of the :class:`QPModel` class.
+                           The Hessian H must be a symmetric linear
+                           operator of appropriate size, but not necessarily
+                           positive definite.
+
+        :keywords:
+            :logger_name:  name of a logger object (``'nlp.glrt'``)
+
+        :returns:
+
+          Upon return, the following attributes are set:
+
+          :step:       final step,
+          :niter:      number of iterations,
+          :nprod:      number of Hessian-vector products performed in the
+                       last call, including those needed to assemble the
+                       step,
+          :step_norm:  norm of the step,
+          :multiplier: λ = σ‖s‖,
+          :mval:       value of the cubic model at the step,
+          :qval:       value of the quadratic part of the model at the step.
+        """
+        kwargs.setdefault('logger_name', 'nlp.glrt')
+        super(GLRT, self).__init__(qp, **kwargs)
+        self.prefix = 'Glrt: '
+        self.name = 'GLRT'
+        self.mval = None
+        self.header = self.hd_fmt % ('Iter', '<r,g>', 'curv', 'lam')
+        self.fmt = ' %-5d  %9.2e  %8.2e  %5.0e'
+
+        # State of the Lanczos process.
+        self.alphas = []
+        self.betas = []
+        self.curvatures = []
+        self.gamma0 = None
+        self.breakdown = False
+        self._vectors = None
+
+    def solve(self, **kwargs):
+        """Solve the cubic regularization subproblem.
+
+        :keywords:
+
+          :sigma:      the regularization parameter (default: 1.0),
+          :abstol:     absolute stopping tolerance (default: 1.0e-8),
+          :reltol:     relative stopping tolerance (default: 1.0e-6),
+          :maxiter:    maximum number of iterations (default: 2n),
+          :prec:       a user-defined preconditioner,
+          :hprod:      a callable such that `hprod(p, out)` stores the
+                       product of H with p into the array `out`,
+          :store:      a callable that receives the pair (alpha*p, alpha*Hp)
+                       of each new iteration along which the curvature is
+                       positive.
+
+        The algorithm stops as soon as the norm of the gradient of the cubic
+        model restricted to the Krylov space falls below
+
+            max(abstol, reltol * min(1, ‖s‖) * g0)
+
+        where g0 is the preconditioned norm of the initial gradient.
+        """
+        sigma = kwargs.get('sigma', 1.0)
+        abstol = kwargs.get('abstol', 1.0e-8)
+        reltol = kwargs.get('reltol', 1.0e-6)
+        maxiter = kwargs.get('maxiter', 2 * self.n)
+        prec = kwargs.get('prec', None)
+        store = kwargs.get('store', None)
+        n = self.n
+        H = self.qp.H
+        hprod = kwargs.get('hprod', lambda v, out: matvec(H, v, out))
+        self.prec = prec
+        self.hprod = hprod
+
+        if self._vectors is None:
+            r = self.qp.c.copy()
+            y = r if prec is None else prec(r)
+            self._vectors = (r, y, -y, np.empty(n))
+            self.gamma0 = sqrt(np.dot(r, y))
+        r, y, p, Hp = self._vectors
+        gamma0 = self.gamma0
+        alphas = self.alphas
+        betas = self.betas
+        if store is not None:
+            ds = np.empty(n)
+            dr = np.empty(n)
+
+        converged = gamma0 <= abstol
+        sub = None
+        k = 0
+        nprod = 0
+
+        self.log.info(self.header)
+        self.log.info('-' * len(self.header))
+
+        while not converged and k < maxiter:
+            k += 1
+            if k > len(alphas):
+                if self.breakdown:
+                    converged = True
+                    break
+
+                # Continue the Lanczos recurrences.
+                ry = np.dot(r, y)
+                hprod(p, Hp)
+                nprod += 1
+                pHp = np.dot(p, Hp)
+                if pHp == 0:
+                    self.breakdown = True
+                    converged = True
+                    break
+                alpha = ry / pHp
+                if store is not None and pHp > 0:
+                    np.multiply(p, alpha, out=ds)
+                    np.multiply(Hp, alpha, out=dr)
+                    store(ds, dr)
+                r += alpha * Hp
+                if prec is not None:
+                    y = prec(r)
+                beta = np.dot(r, y) / ry
+                p *= beta
+                p -= y
+                self._vectors = (r, y, p, Hp)
+                alphas.append(alpha)
+                betas.append(beta)
+                self.curvatures.append(pHp)
+
+            # Minimize the cubic model in the Krylov space.
+            alpha = alphas[k - 1]
+            beta = betas[k - 1]
+            diag, off = lanczos_tridiagonal(alphas[:k], betas[:k])
+            sub = tridiagonal_cubic_subproblem(diag, off, gamma0, sigma)
+            self.log.info(self.fmt, k, beta, self.curvatures[k - 1], sub[1])
+            resid = sqrt(beta) / abs(alpha) * abs(sub[0][-1])
+            converged = beta == 0 or \
+                resid <= max(abstol, reltol * min(1.0, sub[1] / sigma) *
+                             gamma0)
+
+        self.nprod = nprod
+        self.multiplier = 0.0
+        self.mval = 0.0
+        if sub is not None:
+            h, self.multiplier, self.mval = sub
+            self.step = self._assemble(h)
+            self.step_norm = np.linalg.norm(h)
+        elif gamma0 > 0:
+            # Zero curvature along the gradient: minimize along -M⁻¹g.
+            t = 1 / sqrt(sigma * gamma0)
+            self.step = t * p
+            self.step_norm = t * gamma0
+            self.multiplier = sigma * self.step_norm
+            self.mval = -t * gamma0**2 + sigma * self.step_norm**3 / 3
+        else:
+            self.step = np.zeros(n)
+            self.step_norm = 0.0
+        self.qval = self.mval - sigma * self.step_norm**3 / 3
+        self.status = 'residual small' if converged else 'max iter'
+        self.niter = k
+        self.log.info(self.status)
+        return
+
+
+class ARC(object):
+    u"""Adaptive regularization with cubics for unconstrained optimization.
+
+    A stationary point of the unconstrained problem
+
+        minimize f(x)
+
+    is identified by approximately minimizing a sequence of cubic models
+
+        min  gᵀs + ½ sᵀHs + ⅓ σ ‖s‖³.
+    """
+
+    def __init__(self, nlp, arc_solver, **kwargs):
+        """Instantiate a cubic regularization solver for ``nlp``.
+
+        :parameters:
+            :nlp:        a :class:`NLPModel` instance.
+            :arc_solver: a solver for the cubic subproblems that accepts
+                         the regularization parameter as the `sigma` keyword
+                         of its `solve` method, e.g., :class:`GLRT`.
+
+        :keywords:
+            :x0:           starting point                     (``nlp.x0``)
+            :reltol:       relative stopping tolerance        (``nlp.stop_d``)
+            :abstol:       absolute stopping tolerance        (1.0e-6)
+            :maxiter:      maximum number of iterations       (max(1000,10n))
+            :sigma:        initial regularization parameter   (1.0)
+            :sigma_min:    smallest regularization parameter  (1.0e-8)
+            :eta1:         step acceptance threshold          (0.1)
+            :eta2:         regularization decrease threshold  (0.9)
+            :gamma1:       regularization decrease factor     (0.5)
+            :gamma2:       regularization increase factor     (2.0)
+            :subtol:       relative stopping tolerance of the subproblem
+                           solver                             (0.1)
+            :logger_name:  name of a logger object that can be used in the post
+                           iteration                          (``None``)
+            :preconditioner: a :class:`Preconditioner` instance, updated
+                           with the Hessian at each iteration (``None``)
+
+        Once an ``ARC`` object has been instantiated and the problem is set
+        up, solve problem by issuing a call to ``arc.solve()``. The algorithm
+        stops as soon as the Euclidian norm of the gradient falls below
+
+            ``max(abstol, reltol * g0)``
+
+        where ``g0`` is the Euclidian norm of the initial gradient.
+
+        The Hessian is only evaluated after successful iterations.
+        """
+        self.nlp = nlp
+        self.arc_solver = arc_solver
+        self.solver = None  # Will point to subproblem solver data in Solve()
+        self.iter = 0  # Iteration counter
+        self.total_cgiter = 0
+        self.x = kwargs.get("x0", self.nlp.x0.copy())
+        self.f = None
+        self.f0 = None
+        self.g = None
+        self.g_old = None
+        self.save_g = False
+        self.gNorm = None
+        self.g0 = None
+        self.tsolve = 0.0
+
+        self.step_accepted = False
+        self.step_status = ""
+        self.dvars = None
+        self.dgrad = None
+        self.status = ""
+
+        self.reltol = kwargs.get("reltol", self.nlp.stop_d)
+        self.abstol = kwargs.get("abstol", 1.0e-6)
+        self.maxiter = kwargs.get("maxiter", max(1000, 10 * self.nlp.n))
+
+        self.sigma = kwargs.get("sigma", 1.0)
+        self.sigma_min = kwargs.get("sigma_min", 1.0e-8)
+        self.eta1 = kwargs.get("eta1", 0.1)
+        self.eta2 = kwargs.get("eta2", 0.9)
+        self.gamma1 = kwargs.get("gamma1", 0.5)
+        self.gamma2 = kwargs.get("gamma2", 2.0)
+        self.subtol = kwargs.get("subtol", 0.1)
+        self.preconditioner = kwargs.get("preconditioner", None)
+        self.eps = np.finfo(np.double).eps
+
+        self.hformat = "%-5s %8s %7s %5s %8s %7s %7s %4s"
+        self.header = self.hformat % ("iter", "f", u"‖∇f‖", "inner", u"ρ",
+                                      u"‖step‖", "sigma", "stat")
+        self.hlen = len(self.header)
+        self.format = "%-5d %8.1e %7.1e %5d %8.1e %7.1e %7.1e %4s"
+        self.format0 = "%-5d %8.1e %7.1e %5s %8s %7s %7.1e %4s"
+        self.sigmas = [self.sigma]
+
+        # Setup the logger. Install a NullHandler if no output needed.
+        logger_name = kwargs.get("logger_name", "nlp.arc")
+        self.log = logging.getLogger(logger_name)
+        self.log.addHandler(logging.NullHandler())
+        self.log.propagate = False
+
+    def precon(self, v, **kwargs):
+        """Apply the preconditioner to v.
+
+        The identity is used unless a preconditioner was supplied.
+        """
+        if self.preconditioner is None:
+            return v
+        return self.preconditioner(v)
+
+    def post_iteration(self, **kwargs):
+        """Perform work at the end of an iteration.
+
+        Use this method for preconditioners that need updating,
+        e.g., a limited-memory BFGS preconditioner.
+        """
+        return None
+
+    def ratio(self, f, f_trial, m):
+        """Compute the ratio of actual versus predicted reduction.
+
+        `m` is the value of the cubic model at the step, so that the
+        predicted reduction is -m.
+        """
+        pred = -m + max(1.0, abs(f)) * 10.0 * self.eps
+        ared = f - f_trial + max(1.0, abs(f)) * 10.0 * self.eps
+        return ared / pred
+
+    def update_sigma(self, ratio):
+        """Update the regularization parameter.
+
+        The rule implemented by this method is:
+
+        sigma = gamma2 * sigma                     if ratio <  eta1
+        sigma = max(gamma1 * sigma, sigma_min)     if ratio >= eta2
+        sigma unchanged otherwise.
+        """
+        if ratio < self.eta1:
+            self.sigma *= self.gamma2
+        elif ratio >= self.eta2:
+            self.sigma = max(self.gamma1 * self.sigma, self.sigma_min)
+
+    def solve(self, **kwargs):
+        """Solve.
+
+        :keywords:
+          :maxiter:  maximum number of iterations.
+        """
+        nlp = self.nlp
+        self.maxiter = kwargs.get("maxiter", self.maxiter)
+
+        # Gather initial information.
+        self.f = self.nlp.obj(self.x)
+        self.f0 = self.f
+        self.g = self.nlp.grad(self.x)
+        self.g_old = self.g
+        self.gNorm = norms.norm2(self.g)
+        self.g0 = self.gNorm
+
+        stoptol = max(self.abstol, self.reltol * self.g0)
+        exitUser = False
+        exitOptimal = self.gNorm <= stoptol
+        exitIter = self.iter >= self.maxiter
+        status = ""
+        H = None
+        store = None
+
+        t = cputime()
+
+        # Print out header and initial log.
+        if self.iter % 20 == 0:
+            self.log.info(self.header)
+            self.log.info(self.format0,
+                          self.iter, self.f, self.gNorm, "",
+                          "", "", self.sigma, "")
+
+        while not (exitUser or exitOptimal or exitIter):
+
+            self.iter += 1
+
+            if self.save_g:
+                self.g_old = self.g.copy()
+
+            # Approximately minimize the cubic model
+            # m(s) := g's + ½ s'Hs + ⅓ σ ‖s‖³.
+            # Note that m(s) does not include f(x): m(0) = 0.
+
+            # The Hessian is unchanged after an unsuccessful iteration. Use
+            # the explicit Hessian if the subproblem solver or the
+            # preconditioner requires it.
+            if H is None:
+                precon = self.preconditioner
+                if getattr(self.arc_solver, 'needs_matrix', False) or \
+                        getattr(precon, 'needs_matrix', False):
+                    H = nlp.hess(self.x, nlp.pi0)
+                if precon is not None:
+                    precon.update(H)
+                    store = getattr(precon, 'store', None)
+                if not isinstance(H, np.ndarray) and \
+                        (sp is None or not sp.issparse(H)):
+                    H = nlp.hop(self.x, nlp.pi0)
+                qp = QPModel(self.g, H)
+                self.solver = self.arc_solver(qp)
+
+            self.solver.solve(prec=self.precon, sigma=self.sigma,
+                              reltol=self.subtol, store=store)
+
+            step = self.solver.step
+            snorm = self.solver.step_norm
+            cgiter = self.solver.niter
+            m = self.solver.mval
+
+            self.total_cgiter += cgiter
+            x_trial = self.x + step
+            f_trial = nlp.obj(x_trial)
+
+            rho = self.ratio(self.f, f_trial, m)
+            self.update_sigma(rho)
+
+            if rho >= self.eta1:
+                self.x = x_trial
+                self.f = f_trial
+                self.g = nlp.grad(self.x)
+                self.gNorm = norms.norm2(self.g)
+                self.dvars = step
+                if self.save_g:
+                    self.dgrad = self.g - self.g_old
+                step_status = "Acc"
+                self.step_accepted = True
+                H = None
+            else:
+                step_status = "Rej"
+                self.step_accepted = False
+
+            self.step_status = step_status
+            self.sigmas.append(self.sigma)
+            status = ""
+            try:
+                self.post_iteration()
+            except UserExitRequest:
+                status = "usr"
+
+            # Print out header, say, every 20 iterations
+            if self.iter % 20 == 0:
+                self.log.info(self.header)
+
+            pstatus = step_status if step_status != "Acc" else ""
+            self.log.info(self.format % (self.iter, self.f, self.gNorm, cgiter,
+                                         rho, snorm, self.sigma, pstatus))
+
+            exitOptimal = self.gNorm <= stoptol
+            exitIter = self.iter > self.maxiter
+            exitUser = status == "usr"
+
+        self.tsolve = cputime() - t  # Solve time
+
+        # Set final solver status.
+        if status == "usr":
+            pass
+        elif self.gNorm <= stoptol:
+            status = "opt"
+        else:  # self.iter > self.maxiter:
+            status = "itr"
+        self.status = status
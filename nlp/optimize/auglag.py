@@ -66,6 +66,16 @@ class Auglag(object):
                                descent can be tolerated if monotone = False
                                                                (25)
             :least_squares_pi: initialize with least squares multipliers (True)
+            :preconditioner:   preconditioner passed to every inner solver so
+                               that it may carry information across inner
+                               iterations, e.g., an
+                               :class:`LBFGSPreconditioner`    (None)
+            :tr:               trust-region management object passed to
+                               every inner solver, e.g., a
+                               :class:`GeneralizedTrustRegion` created with
+                               `warm_start=True` so that each inner solve
+                               starts from the last successful radius
+                                                               (None)
             :logger_name:      name of a logger object that can be used in the
                                post-iteration                  (nlp.auglag)
 
@@ -89,6 +99,8 @@ class Auglag(object):
         self.x = kwargs.get("x0", self.model.x0.copy())
 
         self.least_squares_pi = kwargs.get("least_squares_pi", True)
+        self.preconditioner = kwargs.get("preconditioner", None)
+        self.tr = kwargs.get("tr", None)
 
         self.bc_solver = bc_solver
 
@@ -240,7 +252,8 @@ class Auglag(object):
     def setup_bc_solver(self):
         """Setup bound-constrained solver."""
         return self.bc_solver(self.model, TruncatedCG, greltol=self.omega,
-                              x0=self.x)
+                              x0=self.x, preconditioner=self.preconditioner,
+                              tr=self.tr)
 
     def solve(self, **kwargs):
         """Solve method.
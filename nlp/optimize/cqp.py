@@ -4,24 +4,27 @@
 From Algorithm IPF on p.110 of Stephen J. Wright's book
 "Primal-Dual Interior-Point Methods", SIAM ed., 1997.
 The method uses the augmented system formulation. These systems are solved
-using MA27 or MA57.
+using MA27 or MA57 if HSL is available, and SciPy's SuperLU otherwise.
 
 D. Orban, Montreal 2009-2011.
 """
-try:                            # To solve augmented systems
-    from hsl.solvers.pyma57 import PyMa57Solver as LBLContext
+try:                            # To scale constraint matrices
+    from hsl.scaling.mc29 import mc29ad
 except ImportError:
-    from hsl.solvers.pyma27 import PyMa27Solver as LBLContext
-from hsl.scaling.mc29 import mc29ad
-from pykrylov.linop import PysparseLinearOperator
+    mc29ad = None
+try:
+    from pysparse.sparse.pysparseMatrix import PysparseMatrix
+except ImportError:
+    pass
+from pykrylov.linop import LinearOperator
 from nlp.tools.norms import norm2, norm_infty, normest
+from nlp.tools.sparse_matrix import SparseMatrix, coord, factorize_symmetric
 from nlp.tools.timing import cputime
 import logging
 
 # for slack model
 from nlp.model.nlpmodel import NLPModel
 from nlp.model.qnmodel import QuasiNewtonModel
-from pysparse.sparse.pysparseMatrix import PysparseMatrix
 import numpy as np
 
 
@@ -77,6 +80,10 @@ class SlackModel(NLPModel):
         self.model = model
         self.keep_variable_bounds = keep_variable_bounds
 
+        # Save number of variables and constraints prior to transformation
+        self.original_n = model.n
+        self.original_m = model.m
+
         n_con_low = model.nlowerC + model.nrangeC  # ineqs with lower bound.
         n_con_upp = model.nupperC + model.nrangeC  # ineqs with upper bound.
         n_var_low = model.nlowerB + model.nrangeB  # vars  with lower bound.
@@ -166,7 +173,25 @@ class SlackModel(NLPModel):
         c[lowerC] -= x[self.sLL]
         c[upperC] -= x[self.sUU]
         c[rangeC] -= x[self.sLR]
-        c[om:] -= x[self.sUR]
+        c[om:om + nrangeC] -= x[self.sUR]
+
+        if self.keep_variable_bounds:
+            return c
+
+        # Bound constraints, in the order described in :meth:`jac`.
+        lowerB = model.lowerB
+        upperB = model.upperB
+        rangeB = model.rangeB
+        Lvar = model.Lvar
+        Uvar = model.Uvar
+        bot = om + nrangeC
+        c[bot:bot + model.nlowerB] = x[lowerB] - Lvar[lowerB] - x[self.tLL]
+        bot += model.nlowerB
+        c[bot:bot + model.nrangeB] = x[rangeB] - Lvar[rangeB] - x[self.tLR]
+        bot += model.nrangeB
+        c[bot:bot + model.nupperB] = Uvar[upperB] - x[upperB] - x[self.tUU]
+        bot += model.nupperB
+        c[bot:] = Uvar[rangeB] - x[rangeB] - x[self.tUR]
         return c
 
     def cons_pos(self, x):
@@ -351,7 +376,89 @@ class SlackModel(NLPModel):
         return self._jac(0, lp=True)
 
     def _jac(self, x, lp=False):
-        raise NotImplementedError("Please subclass")
+        """Helper method to assemble the Jacobian matrix of the constraints.
+
+        See the documentation of :meth:`jac` for more information.
+
+        The positional argument `lp` should be set to `True` only if the
+        problem is known to be a linear program. In this case, the evaluation
+        of the constraint matrix is cheaper and the argument `x` is ignored.
+
+        The Jacobian of the original problem may be returned in any format
+        understood by :func:`nlp.tools.sparse_matrix.coord` and the result is
+        a :class:`SparseMatrix`.
+        """
+        model = self.model
+        on = model.n
+        om = model.m
+
+        lowerC = np.array(model.lowerC, dtype=np.int64)
+        nlowerC = model.nlowerC
+        upperC = np.array(model.upperC, dtype=np.int64)
+        nupperC = model.nupperC
+        rangeC = np.array(model.rangeC, dtype=np.int64)
+        nrangeC = model.nrangeC
+        lowerB = np.array(model.lowerB, dtype=np.int64)
+        nlowerB = model.nlowerB
+        upperB = np.array(model.upperB, dtype=np.int64)
+        nupperB = model.nupperB
+        rangeB = np.array(model.rangeB, dtype=np.int64)
+        nrangeB = model.nrangeB
+        nSlacks = nlowerC + nupperC + 2 * nrangeC
+
+        J = SparseMatrix((self.m, self.n))
+
+        # Insert contribution of general constraints.
+        vals, rows, cols = coord(model.A() if lp else model.jac(x[:on]))
+        sign = np.ones(om)
+        sign[upperC] = -1.0
+        J.put(sign[rows] * vals, rows, cols)
+
+        # Upper side of range constraints.
+        range_pos = -np.ones(om, dtype=np.int64)
+        range_pos[rangeC] = np.arange(nrangeC)
+        in_range = range_pos[rows] >= 0
+        J.put(-vals[in_range], om + range_pos[rows[in_range]],
+              cols[in_range])
+
+        # Create a few index lists
+        rlowerC = np.arange(nlowerC)
+        rlowerB = np.arange(nlowerB)
+        rupperC = np.arange(nupperC)
+        rupperB = np.arange(nupperB)
+        rrangeC = np.arange(nrangeC)
+        rrangeB = np.arange(nrangeB)
+
+        # Insert contribution of slacks on general constraints
+        J.put(-1.0, lowerC, on + rlowerC)
+        J.put(-1.0, upperC, on + nlowerC + rupperC)
+        J.put(-1.0, rangeC, on + nlowerC + nupperC + rrangeC)
+        J.put(-1.0, om + rrangeC, on + nlowerC + nupperC + nrangeC + rrangeC)
+
+        if self.keep_variable_bounds:
+            return J
+
+        # Insert contribution of bound constraints on the original problem
+        bot = om + nrangeC
+        J.put(1.0, bot + rlowerB, lowerB)
+        bot += nlowerB
+        J.put(1.0, bot + rrangeB, rangeB)
+        bot += nrangeB
+        J.put(-1.0, bot + rupperB, upperB)
+        bot += nupperB
+        J.put(-1.0, bot + rrangeB, rangeB)
+
+        # Insert contribution of slacks on the bound constraints
+        bot = om + nrangeC
+        J.put(-1.0, bot + rlowerB, on + nSlacks + rlowerB)
+        bot += nlowerB
+        J.put(-1.0, bot + rrangeB, on + nSlacks + nlowerB + rrangeB)
+        bot += nrangeB
+        J.put(-1.0, bot + rupperB, on + nSlacks + nlowerB + nrangeB + rupperB)
+        bot += nupperB
+        J.put(-1.0, bot + rrangeB, on + nSlacks + nlowerB + nrangeB +
+              nupperB + rrangeB)
+        return J
 
     def convert_multipliers(self, z):
         """Convert multipliers from slack problem to orginal NLP."""
@@ -381,8 +488,21 @@ class SlackModel(NLPModel):
         return Hv
 
     def hess(self, x, z=None, *args, **kwargs):
-        """Evaluate Lagrangian Hessian at (x, z)."""
-        raise NotImplementedError("Please subclass")
+        """Evaluate Lagrangian Hessian at (x, z).
+
+        The Hessian of the original problem may be returned in any format
+        understood by :func:`nlp.tools.sparse_matrix.coord` and the result is
+        a symmetric :class:`SparseMatrix`.
+        """
+        model = self.model
+        if isinstance(model, QuasiNewtonModel):
+            return self.hop(x, z, *args, **kwargs)
+
+        on = model.n
+        pi = self.convert_multipliers(z)
+        H = model.hess(x[:on], pi, *args, **kwargs)
+        return SparseMatrix.from_matrix(H, symmetric=True,
+                                        shape=(self.n, self.n))
 
 
 class PySparseSlackModel(SlackModel):
@@ -557,9 +677,7 @@ class RegQPInteriorPointSolver(object):
         scale = kwargs.get('scale', True)
 
         self.qp = qp
-        self.A = qp.A()               # Constraint matrix
-        if not isinstance(self.A, PysparseMatrix):
-            self.A = PysparseMatrix(matrix=self.A)
+        self.A = SparseMatrix.from_matrix(qp.A())  # Constraint matrix
 
         _, n = self.A.shape
         on = qp.original_n
@@ -571,9 +689,9 @@ class RegQPInteriorPointSolver(object):
 
         self.b = -qp.cons(zero)                  # Right-hand side
         self.c0 = qp.obj(zero)                   # Constant term in objective
-        self.c = qp.grad(zero[:on])              # Cost vector
-        self.Q = PysparseMatrix(matrix=qp.hess(zero[:on],
-                                               np.zeros(qp.original_m)))
+        self.c = qp.grad(zero)[:on]              # Cost vector
+        self.Q = SparseMatrix.from_matrix(qp.hess(zero, np.zeros(qp.m)),
+                                          symmetric=True, shape=(on, on))
 
         # Apply in-place problem scaling if requested.
         self.prob_scaled = False
@@ -585,8 +703,8 @@ class RegQPInteriorPointSolver(object):
             # self.scale() sets self.normQ to the Frobenius norm of Q
             # and self.normA to the Frobenius norm of A as a by-product.
             # If we're not scaling, set normQ and normA manually.
-            self.normQ = self.Q.matrix.norm('fro')
-            self.normA = self.A.matrix.norm('fro')
+            self.normQ = self.Q.norm('fro')
+            self.normA = self.A.norm('fro')
 
         self.normb = norm_infty(self.b)
         self.normc = norm_infty(self.c)
@@ -653,17 +771,14 @@ class RegQPInteriorPointSolver(object):
         [  A1          A2            δI  ] [∆y]   [b - A1 x - A2 s     ]
         """
         m, n = self.A.shape
-        on = self.qp.original_n
-        H = PysparseMatrix(size=n + m,
-                           sizeHint=n + m + self.A.nnz + self.Q.nnz,
-                           symmetric=True)
+        H = SparseMatrix((n + m, n + m), symmetric=True)
 
         # The (1,1) block will always be Q (save for its diagonal).
-        H[:on, :on] = -self.Q
+        H.put_block(self.Q, scale=-1.0)
 
         # The (3,1) and (3,2) blocks will always be A.
         # We store it now once and for all.
-        H[n:, :n] = self.A
+        H.put_block(self.A, row_offset=n)
         return H
 
     def initialize_rhs(self):
@@ -1241,7 +1356,7 @@ class RegQPInteriorPointSolver(object):
 
         # Set up augmented system matrix and factorize it.
         self.set_initial_guess_system()
-        self.LBL = LBLContext(self.H, sqd=self.regdu > 0)  # Analyze+factorize
+        self.LBL = factorize_symmetric(self.H, sqd=self.regdu > 0)
 
         # Assemble first right-hand side and solve.
         rhs = self.set_initial_guess_rhs()
@@ -1383,7 +1498,8 @@ class RegQPInteriorPointSolver(object):
         if self.condest:
             rhsNorm = norm2(rhs)
             solnNorm = norm2(self.LBL.x)
-            Hop = PysparseLinearOperator(self.H, symmetric=True)
+            Hop = LinearOperator(self.H.shape[1], self.H.shape[0],
+                                 self.H.matvec, symmetric=True)
             normH, _ = normest(Hop, tol=1.0e-3)
             if rhsNorm > 0 and solnNorm > 0:
                 self.condest_history.append(solnNorm * normH / rhsNorm)
@@ -1474,6 +1590,9 @@ class RegQPInteriorPointSolver29(RegQPInteriorPointSolver):
         variables. Normally, the :meth:`solve` method takes care of unscaling
         the problem upon termination.
         """
+        if mc29ad is None:
+            raise ImportError("Scaling requires MC29 from HSL " +
+                              "(hsl.scaling.mc29)")
         (values, irow, jcol) = self.A.find()
         m, n = self.A.shape
 
@@ -1578,15 +1697,13 @@ class RegQPInteriorPointSolver3x3(RegQPInteriorPointSolver):
         """
         m, n = self.A.shape
         on = self.qp.original_n
-        H = PysparseMatrix(size=2 * n + m - on,
-                           sizeHint=4 * on + m + self.A.nnz + self.Q.nnz,
-                           symmetric=True)
+        H = SparseMatrix((2 * n + m - on, 2 * n + m - on), symmetric=True)
 
         # The (1,1) block will always be Q (save for its diagonal).
-        H[:on, :on] = -self.Q
+        H.put_block(self.Q, scale=-1.0)
 
         # The (2,1) block will always be A. We store it now once and for all.
-        H[n:n + m, :n] = self.A
+        H.put_block(self.A, row_offset=n)
         return H
 
     def set_initial_guess_system(self):
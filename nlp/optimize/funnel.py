@@ -398,10 +398,8 @@ class Funnel(object):
 
                     Hop = model.hop(x, -y_new)
 
-                    qp = QPModel(g_n, Hop, A=J.matrix)
-                    # PPCG = ProjectedCG(g_n, Hop,
-                    #                    A=J.matrix if m > 0 else None,
-                    #                    radius=radius_within, dreg=reg)
+                    # PySparse matrices are passed as ll_mat.
+                    qp = QPModel(g_n, Hop, A=getattr(J, 'matrix', J))
                     PPCG = ProjectedCG(qp, radius=radius_within, dreg=reg)
                     PPCG.solve()
                     step_t = PPCG.step
@@ -0,0 +1,356 @@
+# -*- coding: utf-8 -*-
+u"""The generalized Lanczos trust-region method.
+
+A pure Python/Numpy implementation of GLTR as described in
+
+  N. I. M. Gould, S. Lucidi, M. Roma and Ph. L. Toint, *Solving the
+  Trust-Region Subproblem using the Lanczos Method*, SIAM Journal on
+  Optimization **9** (2), pp. 504-525, 1999.
+
+The conjugate gradient iterations are identical to those of the truncated
+conjugate gradient method until the trust-region boundary is encountered or a
+direction of negative curvature is found. The iterations then continue on the
+boundary: the CG coefficients define a tridiagonal Lanczos matrix T, and the
+trust-region subproblem restricted to the Krylov space is solved with T by
+the Moré-Sorensen method.
+"""
+
+import logging
+from math import sqrt
+import numpy as np
+
+from scipy.linalg import eigh_tridiagonal
+
+from nlp.tools.utils import axpy, matvec
+
+__docformat__ = 'restructuredtext'
+
+
+def to_boundary_m(sMs, sMp, pMp, radius):
+    u"""Return the largest σ such that ‖s + σp‖_M = Δ.
+
+    The arguments are the inner products sᵀMs, sᵀMp and pᵀMp.
+    """
+    return (-sMp + sqrt(max(sMp**2 + pMp * (radius**2 - sMs), 0.0))) / pMp
+
+
+def lanczos_tridiagonal(alphas, betas):
+    """Return the diagonal and off-diagonal of the Lanczos matrix T.
+
+    The entries of T are obtained from the first k CG steplengths `alphas`
+    and the first k-1 coefficients `betas`.
+    """
+    k = len(alphas)
+    a = np.asarray(alphas)
+    b = np.asarray(betas[:k - 1])
+    diag = 1 / a
+    diag[1:] += b / a[:-1]
+    return (diag, -np.sqrt(b) / a[:-1])
+
+
+def tridiagonal_subproblem(diag, off, gamma0, radius, tol=1.0e-12,
+                           maxiter=100):
+    u"""Solve the trust-region subproblem with a tridiagonal Hessian.
+
+    Minimize γ₀ hᵀe₁ + ½ hᵀTh subject to ‖h‖ ≤ Δ, where T has diagonal
+    `diag` and off-diagonal `off`. The secular equation is solved in the
+    eigenbasis of T, which also exposes the hard case. Return the solution
+    `h`, the multiplier and the value of the objective.
+    """
+    evals, evecs = eigh_tridiagonal(diag, off)
+    c = gamma0 * evecs[0]
+    e0 = evals[0]
+
+    def coords(lam):
+        return -c / (evals + lam)
+
+    lam = max(0.0, -e0)
+    if e0 > 0 and np.linalg.norm(coords(0.0)) <= radius:
+        y = coords(0.0)  # Interior solution.
+    else:
+        scale = max(1.0, np.max(np.abs(evals)))
+        near = evals - e0 <= tol * scale
+        y = np.zeros_like(c)
+        far = ~near
+        y[far] = -c[far] / (evals[far] + lam)
+        if e0 < 0 and np.all(np.abs(c[near]) <= tol * gamma0) and \
+                np.linalg.norm(y) <= radius:
+            # Hard case: complete with an eigenvector of the smallest
+            # eigenvalue.
+            y[np.argmax(near)] = sqrt(radius**2 - np.dot(y, y))
+        else:
+            # Newton's method on 1/‖y(λ)‖ = 1/Δ from the left of the root.
+            if e0 + lam <= 0:
+                lam = -e0 + max(np.max(np.abs(c[near])) / (2 * radius),
+                                tol * scale)
+            for _ in range(maxiter):
+                y = coords(lam)
+                ynorm = np.linalg.norm(y)
+                if abs(ynorm - radius) <= tol * radius:
+                    break
+                w2 = np.sum(y**2 / (evals + lam))
+                lam += (ynorm / radius - 1) * ynorm**2 / w2
+            y *= radius / np.linalg.norm(y)
+    h = np.dot(evecs, y)
+    qval = np.dot(c, y) + 0.5 * np.dot(evals * y, y)
+    return (h, lam, qval)
+
+
+class GLTR(object):
+    """Generalized Lanczos trust-region solver."""
+
+    def __init__(self, qp, **kwargs):
+        u"""Solve the quadratic trust-region subproblem
+
+          minimize    gᵀs + ½ sᵀHs
+          subject to  ‖s‖ ≤ Δ
+
+        by means of the generalized Lanczos method. When a preconditioner
+        approximating M⁻¹ is given, the trust region is defined in the norm
+        ‖s‖_M = sqrt(sᵀMs).
+
+        :parameters:
+            :qp:           an instance of the :class:`QPModel` class.
+                           The Hessian H must be a symmetric linear
+                           operator of appropriate size, but not necessarily
+                           positive definite.
+
+        :keywords:
+            :logger_name:  name of a logger object (``'nlp.gltr'``)
+
+        :returns:
+
+          Upon return, the following attributes are set:
+
+          :step:       final step,
+          :niter:      number of iterations,
+          :nprod:      number of Hessian-vector products, including those
+                       needed to assemble the step on the boundary,
+          :step_norm:  norm of the step,
+          :multiplier: multiplier of the trust-region constraint,
+          :dir:        direction of infinite descent (if radius=None and
+                       H is not positive definite),
+          :onBoundary: set to True if trust-region boundary was hit,
+          :infDescent: set to True if a direction of infinite descent was
+                       found.
+        """
+        self.qp = qp
+        self.n = qp.c.shape[0]
+
+        self.prefix = 'Gltr: '
+        self.name = 'GLTR'
+
+        self.status = '?'
+        self.onBoundary = False
+        self.infDescent = False
+        self.step = None
+        self.step_norm = 0.0
+        self.multiplier = 0.0
+        self.niter = 0
+        self.nprod = 0
+        self.dir = None
+        self.qval = None
+
+        # Setup the logger. Install a NullHandler if no output needed.
+        logger_name = kwargs.get('logger_name', 'nlp.gltr')
+        self.log = logging.getLogger(logger_name)
+        self.log.addHandler(logging.NullHandler())
+        self.log.propagate = False
+
+        # Formats for display
+        self.hd_fmt = ' %-5s  %9s  %8s  %5s'
+        self.header = self.hd_fmt % ('Iter', '<r,g>', 'curv', 'phase')
+        self.fmt = ' %-5d  %9.2e  %8.2e  %5s'
+
+    def solve(self, **kwargs):
+        """Solve the trust-region subproblem.
+
+        :keywords:
+
+          :radius:     the trust-region radius (default: None),
+          :abstol:     absolute stopping tolerance (default: 1.0e-8),
+          :reltol:     relative stopping tolerance (default: 1.0e-6),
+          :maxiter:    maximum number of iterations (default: 2n),
+          :prec:       a user-defined preconditioner,
+          :hprod:      a callable such that `hprod(p, out)` stores the
+                       product of H with p into the array `out`,
+          :store:      a callable that receives the pair (alpha*p, alpha*Hp)
+                       of each iteration inside the trust region,
+          :boundary_reltol: relative stopping tolerance on the boundary
+                       (default: 1.0e-2).
+
+        Inside the trust region, the algorithm stops as soon as the
+        preconditioned norm of the gradient falls below
+
+            max(abstol, reltol * g0)
+
+        where g0 is the preconditioned norm of the initial gradient. On the
+        boundary, it stops when the norm of the gradient of the Lagrangian
+        of the subproblem restricted to the Krylov space falls below
+
+            max(abstol, reltol * g0, boundary_reltol * g0).
+        """
+        radius = kwargs.get('radius', None)
+        abstol = kwargs.get('abstol', 1.0e-8)
+        reltol = kwargs.get('reltol', 1.0e-6)
+        maxiter = kwargs.get('maxiter', 2 * self.n)
+        prec = kwargs.get('prec', None)
+        store = kwargs.get('store', None)
+        boundary_reltol = kwargs.get('boundary_reltol', 1.0e-2)
+        qp = self.qp
+        n = self.n
+        H = qp.H
+        hprod = kwargs.get('hprod', lambda v, out: matvec(H, v, out))
+        self.prec = prec
+        self.hprod = hprod
+
+        g = qp.c
+        s = np.zeros(n)
+        r = g.copy()
+        y = r if prec is None else prec(r)
+        ry = np.dot(r, y)
+        gamma0 = sqrt(ry)
+        stop_tol = max(abstol, reltol * gamma0)
+        p = -y
+        Hp = np.empty(n)
+        if store is not None:
+            ds = np.empty(n)
+            dr = np.empty(n)
+
+        # Inner products in the metric M defined by the preconditioner.
+        sMs = sMp = 0.0
+        pMp = ry
+
+        alphas = []
+        betas = []
+        interior = True
+        on_boundary = False
+        infDescent = False
+        converged = gamma0 <= stop_tol
+        sub = None
+        k = 0
+        self.qval = 0.0
+        self.multiplier = 0.0
+
+        self.log.info(self.header)
+        self.log.info('-' * len(self.header))
+
+        while not converged and not infDescent and k < maxiter:
+            k += 1
+            hprod(p, Hp)
+            pHp = np.dot(p, Hp)
+            self.log.info(self.fmt, k, ry, pHp,
+                          'int' if interior else 'bdry')
+
+            if pHp == 0:
+                # Zero curvature along p. Move to the boundary if possible.
+                if interior and radius is not None:
+                    axpy(to_boundary_m(sMs, sMp, pMp, radius), p, s)
+                    sMs = radius**2
+                    on_boundary = True
+                converged = True
+                break
+
+            alpha = ry / pHp
+            alphas.append(alpha)
+
+            if interior:
+                if pHp <= 0 and radius is None:
+                    # p is direction of singularity or negative curvature.
+                    self.dir = p
+                    infDescent = True
+                    continue
+                if radius is not None and \
+                        (pHp <= 0 or
+                         sMs + alpha * (2 * sMp + alpha * pMp) > radius**2):
+                    interior = False
+                else:
+                    self.qval += alpha * np.dot(r, p) + 0.5 * alpha**2 * pHp
+                    if store is not None:
+                        np.multiply(p, alpha, out=ds)
+                        np.multiply(Hp, alpha, out=dr)
+                        store(ds, dr)
+                    axpy(alpha, p, s)
+                    sMs += alpha * (2 * sMp + alpha * pMp)
+                    sMp += alpha * pMp
+
+            # Continue the CG (Lanczos) recurrences.
+            axpy(alpha, Hp, r)
+            if prec is not None:
+                y = prec(r)
+            ry_next = np.dot(r, y)
+            beta = ry_next / ry
+            betas.append(beta)
+            p *= beta
+            p -= y  # p = -y + beta * p
+            ry = ry_next
+            sMp *= beta
+            pMp = ry + beta**2 * pMp
+
+            if interior:
+                converged = sqrt(ry) <= stop_tol
+                continue
+
+            # Solve the subproblem on the boundary in the Krylov space.
+            diag, off = lanczos_tridiagonal(alphas, betas)
+            sub = tridiagonal_subproblem(diag, off, gamma0, radius)
+            # Norm of the gradient of the model restricted to the boundary.
+            resid = sqrt(beta) / abs(alpha) * abs(sub[0][-1])
+            converged = resid <= max(stop_tol, boundary_reltol * gamma0) \
+                or ry_next == 0
+
+        self.nprod = k
+        if interior:
+            self.onBoundary = on_boundary
+            self.infDescent = infDescent
+            self.step = s
+            self.step_norm = sqrt(sMs)
+            if infDescent:
+                self.status = 'infinite descent'
+            elif on_boundary:
+                self.status = 'trust-region boundary active'
+            elif converged:
+                self.status = 'residual small'
+        else:
+            if sub is None:
+                diag, off = lanczos_tridiagonal(alphas, betas)
+                sub = tridiagonal_subproblem(diag, off, gamma0, radius)
+            h, self.multiplier, self.qval = sub
+            self.step = self._assemble(h)
+            self.step_norm = np.linalg.norm(h)
+            self.onBoundary = self.multiplier > 0
+            self.infDescent = False
+            self.status = 'trust-region boundary active'
+        if not converged and not infDescent and k >= maxiter:
+            self.status = 'max iter'
+        self.niter = k
+        self.log.info(self.status)
+        return
+
+    def _assemble(self, h):
+        """Assemble the step Q h by regenerating the Lanczos vectors."""
+        prec = self.prec
+        hprod = self.hprod
+        n = self.n
+        k = h.shape[0]
+        s = np.zeros(n)
+        r = self.qp.c.copy()
+        y = r if prec is None else prec(r)
+        ry = np.dot(r, y)
+        p = -y
+        Hp = np.empty(n)
+        for i in range(k):
+            axpy(h[i] / sqrt(ry), y, s)
+            if i == k - 1:
+                break
+            hprod(p, Hp)
+            self.nprod += 1
+            alpha = ry / np.dot(p, Hp)
+            axpy(alpha, Hp, r)
+            if prec is not None:
+                y = prec(r)
+            ry_next = np.dot(r, y)
+            p *= ry_next / ry
+            p -= y
+            ry = ry_next
+        return s
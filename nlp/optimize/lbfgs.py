@@ -25,12 +25,22 @@ class LBFGS(object):
             :maxiter: maximum number of iterations (default: max(10n, 1000))
             :atol: absolute stopping tolerance (default: 1.0e-8)
             :rtol: relative stopping tolerance (default: 1.0e-6)
+            :monotone: use a monotone linesearch (default: True)
+            :n_non_monotone: if ``monotone=False``, number of most recent
+                             objective values whose maximum serves as
+                             reference in the Armijo condition (default: 10)
             :logger_name: name of a logger (default: 'nlp.lbfgs')
+
+        The non-monotone linesearch is that of Grippo, Lampariello and
+        Lucidi, *A Nonmonotone Line Search Technique for Newton's Method*,
+        SIAM J. Numer. Anal., 23(4), 707–716, 1986.
         """
         self.model = model
         self.maxiter = kwargs.get("maxiter", max(10 * model.nvar, 1000))
         self.abstol = kwargs.get("atol", 1.0e-8)
         self.reltol = kwargs.get("rtol", 1.0e-6)
+        self.monotone = kwargs.get("monotone", True)
+        self.n_non_monotone = kwargs.get("n_non_monotone", 10)
 
         logger_name = kwargs.get("logger_name", "nlp.lbfgs")
         self.logger = logging.getLogger(logger_name)
@@ -60,13 +70,16 @@ class LBFGS(object):
         """Bookkeeping at the end of a general iteration."""
         self.model.H.store(self.s, self.y)
 
-    def setup_linesearch(self, line_model, step0):
+    def setup_linesearch(self, line_model, step0, ref_value=None):
         """Set up linesearch for the line model with the given initial step.
 
-        By default, use an ``ArmijoWolfeLineSearch``.
+        By default, use an ``ArmijoWolfeLineSearch``. `ref_value` is the
+        reference value of the Armijo condition, or `None` for the objective
+        value at the current iterate.
         Override this method to use a different line search.
         """
-        return ArmijoWolfeLineSearch(line_model, step=step0)
+        return ArmijoWolfeLineSearch(line_model, step=step0,
+                                     ref_value=ref_value)
 
     def solve(self):
         """Solve model with the L-BFGS method."""
@@ -86,6 +99,7 @@ class LBFGS(object):
         exitOptimal = g_norm <= stoptol
         exitIter = self.iter >= self.maxiter
         status = ""
+        f_history = [f]   # Most recent objective values.
 
         while not (exitUser or exitOptimal or exitIter or exitLS):
 
@@ -96,10 +110,14 @@ class LBFGS(object):
             # Prepare for modified linesearch
             step0 = max(1.0e-3, 1.0 / g_norm) if self.iter == 0 else 1.0
             line_model = C1LineModel(self.model, x, d)
-            ls = self.setup_linesearch(line_model, step0)
+            ref_value = None if self.monotone else max(f_history)
+            ls = self.setup_linesearch(line_model, step0, ref_value=ref_value)
             try:
-                for step in ls:
-                    self.logger.debug(self.ls_fmt, step, ls.trial_value)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    for step in ls:
+                        self.logger.debug(self.ls_fmt, step, ls.trial_value)
+                else:
+                    ls.search()
             except LineSearchFailure:
                 exitLS = True
                 continue
@@ -122,6 +140,9 @@ class LBFGS(object):
             g_norm = norms.norm2(g)
             f = ls.trial_value
             self.iter += 1
+            if not self.monotone:
+                f_history.append(f)
+                del f_history[:-self.n_non_monotone]
 
             exitOptimal = g_norm <= stoptol
             exitIter = self.iter >= self.maxiter
@@ -150,9 +171,10 @@ class LBFGS(object):
 class WolfeLBFGS(LBFGS):
     """L-BFGS with a strong Wolfe linesearch."""
 
-    def setup_linesearch(self, line_model, step0):
+    def setup_linesearch(self, line_model, step0, ref_value=None):
         u"""Set up linesearch for the line model with the given initial step.
 
-        This variant uses the strong Wolfe linesearch of Moré and Thuente.
+        This variant uses the strong Wolfe linesearch of Moré and Thuente,
+        which is monotone: `ref_value` is ignored.
         """
         return StrongWolfeLineSearch(line_model, ftol=1.0e-4, gtol=0.1)
@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+u"""Exact solution of the trust-region subproblem.
+
+An implementation of the method of
+
+  J. J. Moré and D. C. Sorensen, *Computing a Trust Region Step*,
+  SIAM Journal on Scientific and Statistical Computing **4** (3),
+  pp. 553-572, 1983.
+
+The step s(λ) solves (H + λI) s = -g for a multiplier λ ≥ 0 such that
+H + λI is positive semi-definite and λ (‖s(λ)‖ - Δ) = 0. Each iteration
+requires a dense Cholesky factorization, so that the method is appropriate
+for subproblems with up to a few hundred variables.
+"""
+
+import logging
+from math import sqrt
+import numpy as np
+from scipy import sparse as sp
+from scipy.linalg import cholesky, cho_solve, solve_triangular, eigh, \
+    LinAlgError
+
+from nlp.optimize.pcg import TruncatedCG
+from nlp.tools.utils import to_boundary
+
+__docformat__ = 'restructuredtext'
+
+
+def dense_hessian(H, n):
+    """Return the symmetric matrix H as a dense Numpy array.
+
+    Linear operators are applied to the columns of the identity.
+    """
+    if isinstance(H, np.ndarray):
+        return H
+    if sp.issparse(H):
+        return H.toarray()
+    Hd = np.empty((n, n))
+    e = np.zeros(n)
+    for j in range(n):
+        e[j] = 1.0
+        Hd[:, j] = H * e
+        e[j] = 0.0
+    return Hd
+
+
+class MoreSorensen(object):
+    """Moré-Sorensen solver for the trust-region subproblem."""
+
+    #: The Hessian is best supplied as an explicit matrix.
+    needs_matrix = True
+
+    def __init__(self, qp, **kwargs):
+        u"""Solve the quadratic trust-region subproblem
+
+          minimize    gᵀs + ½ sᵀHs
+          subject to  ‖s‖ ≤ Δ
+
+        to near global optimality, where H is symmetric but not necessarily
+        positive definite.
+
+        :parameters:
+            :qp:  an instance of the :class:`QPModel` class. The Hessian may
+                  be a Numpy array, a SciPy sparse matrix or a linear
+                  operator, in which case it is assembled column by column.
+
+        :keywords:
+            :boundary_tol: relative tolerance on ‖s‖ - Δ when the solution
+                           lies on the boundary                   (1.0e-2)
+            :hard_tol:     tolerance in the termination test of the hard
+                           case                                   (1.0e-2)
+            :maxiter:      maximum number of factorizations       (50)
+            :logger_name:  name of a logger object (``'nlp.ms'``)
+
+        :returns:
+
+          Upon return, the following attributes are set:
+
+          :step:       final step,
+          :niter:      number of factorizations,
+          :step_norm:  Euclidian norm of the step,
+          :multiplier: final value of λ,
+          :dir:        direction of infinite descent (if radius=None and
+                       H is not positive definite),
+          :onBoundary: set to True if trust-region boundary was hit,
+          :infDescent: set to True if a direction of infinite descent was
+                       found,
+          :hardCase:   set to True if the step has a component along an
+                       eigenvector of the smallest eigenvalue of H.
+        """
+        self.qp = qp
+        self.n = qp.c.shape[0]
+
+        self.prefix = 'MS: '
+        self.name = u'Moré-Sorensen'
+
+        self.boundary_tol = kwargs.get('boundary_tol', 1.0e-2)
+        self.hard_tol = kwargs.get('hard_tol', 1.0e-2)
+        self.maxiter = kwargs.get('maxiter', 50)
+
+        self.status = '?'
+        self.onBoundary = False
+        self.infDescent = False
+        self.hardCase = False
+        self.step = None
+        self.step_norm = 0.0
+        self.multiplier = 0.0
+        self.niter = 0
+        self.dir = None
+        self.qval = None
+
+        # Setup the logger. Install a NullHandler if no output needed.
+        logger_name = kwargs.get('logger_name', 'nlp.ms')
+        self.log = logging.getLogger(logger_name)
+        self.log.addHandler(logging.NullHandler())
+        self.log.propagate = False
+
+        self.hd_fmt = ' %-5s  %9s  %9s  %9s'
+        self.header = self.hd_fmt % ('Iter', 'lambda', '|s|', 'radius')
+        self.fmt = ' %-5d  %9.2e  %9.2e  %9.2e'
+
+    def _smallest_eigenpair(self, H):
+        evals, evecs = eigh(H, eigvals=(0, 0))
+        return evals[0], evecs[:, 0]
+
+    def solve(self, **kwargs):
+        """Solve the trust-region subproblem.
+
+        :keywords:
+            :radius: the trust-region radius (default: None).
+
+        Other keywords, such as the stopping tolerances and preconditioner of
+        iterative solvers, are accepted and ignored. The trust region is
+        defined in the Euclidian norm.
+        """
+        radius = kwargs.get('radius', None)
+        g = self.qp.c
+        n = self.n
+        H = dense_hessian(self.qp.H, n)
+        gnorm = np.linalg.norm(g)
+
+        self.onBoundary = self.infDescent = self.hardCase = False
+        self.status = 'residual small'
+
+        # Safeguards from Gershgorin bounds on the eigenvalues of H.
+        diag = H.diagonal()
+        radii = np.abs(H).sum(axis=1) - np.abs(diag)
+        Hnorm = min(max(np.max(diag + radii), -np.min(diag - radii)),
+                    np.linalg.norm(H, 'fro')) if n > 0 else 0.0
+        lam_L = max(0.0, -np.min(diag)) if n > 0 else 0.0
+        lam_U = np.inf
+        if radius is not None:
+            lam_L = max(lam_L, gnorm / radius - Hnorm)
+            lam_U = gnorm / radius + Hnorm
+
+        eigpair = None
+        lam = 0.0 if radius is None else lam_L
+        s = np.zeros(n)
+        snorm = 0.0
+        best = None   # Most recent step inside the trust region.
+        k = 0
+        done = False
+
+        self.log.info(self.header)
+        self.log.info('-' * len(self.header))
+
+        if gnorm == 0.0 and radius is not None and n > 0:
+            # s = 0 is optimal unless H has a negative eigenvalue.
+            k = 1
+            e1, v = self._smallest_eigenpair(H)
+            if e1 < 0:
+                s = radius * v
+                snorm = radius
+                lam = -e1
+                self.hardCase = self.onBoundary = True
+            done = True
+
+        while not done and k < self.maxiter:
+            k += 1
+            try:
+                L = cholesky(H + lam * np.eye(n), lower=True)
+            except LinAlgError:
+                if radius is None:
+                    # H is not positive definite.
+                    e1, v = self._smallest_eigenpair(H)
+                    self.status = 'infinite descent'
+                    self.dir = v if np.dot(g, v) <= 0 else -v
+                    s = np.zeros(n)
+                    snorm = 0.0
+                    self.infDescent = True
+                    done = True
+                    continue
+                lam_L = max(lam_L, lam)
+                lam = max(sqrt(lam_L * lam_U), lam_L + 0.01 * (lam_U - lam_L))
+                continue
+
+            s = cho_solve((L, True), -g)
+            snorm = np.linalg.norm(s)
+            self.log.info(self.fmt, k, lam,
+                          snorm, radius if radius is not None else np.inf)
+
+            if radius is None:
+                done = True
+                continue
+
+            if abs(snorm - radius) <= self.boundary_tol * radius:
+                if snorm > radius:
+                    s *= radius / snorm
+                    snorm = radius
+                self.onBoundary = True
+                done = True
+                continue
+
+            if snorm < radius:
+                best = (s, snorm, lam)
+                if lam == 0.0:
+                    done = True  # Interior solution.
+                    continue
+
+                # Potential hard case: move to the boundary along an
+                # approximate eigenvector of the smallest eigenvalue.
+                lam_U = min(lam_U, lam)
+                if eigpair is None:
+                    eigpair = self._smallest_eigenpair(H)
+                e1, v = eigpair
+                lam_L = max(lam_L, -e1)
+                tau = to_boundary(s, v, radius, xx=snorm**2)
+                sHs = np.dot(s, np.dot(H, s)) + lam * snorm**2
+                if tau**2 * max(e1 + lam, 0.0) <= \
+                        self.hard_tol * (2 - self.hard_tol) * \
+                        (sHs + lam * radius**2):
+                    # Pick the boundary point with the lowest model value.
+                    tau_neg = -to_boundary(s, -v, radius, xx=snorm**2)
+                    s_pos = s + tau * v
+                    s_neg = s + tau_neg * v
+                    if self.qp.obj(s_neg) < self.qp.obj(s_pos):
+                        s = s_neg
+                    else:
+                        s = s_pos
+                    snorm = radius
+                    self.hardCase = True
+                    self.onBoundary = True
+                    done = True
+                    continue
+            else:
+                lam_L = max(lam_L, lam)
+
+            # Newton step on the secular equation 1/Δ - 1/‖s(λ)‖ = 0.
+            w = solve_triangular(L, s, lower=True)
+            lam_new = lam + (snorm / np.linalg.norm(w))**2 * \
+                (snorm - radius) / radius
+            if lam_L < lam_new < lam_U:
+                lam = lam_new
+            else:
+                lam = max(sqrt(lam_L * lam_U), lam_L + 0.01 * (lam_U - lam_L))
+
+        if not done:
+            self.status = 'max iter'
+            if best is not None:
+                s, snorm, lam = best
+            elif snorm > radius:
+                s = s * (radius / snorm)
+                snorm = radius
+                self.onBoundary = True
+        elif self.onBoundary:
+            self.status = 'trust-region boundary active'
+        self.log.info(self.status)
+
+        self.step = s
+        self.step_norm = snorm
+        self.multiplier = lam
+        self.niter = k
+        self.qval = self.qp.obj(s)
+        return
+
+
+class AutoTRSolver(object):
+    """Choose a trust-region solver by the size and density of the Hessian.
+
+    Instances are meant to be passed as the `tr_solver` argument of
+    :class:`Trunk` and :class:`TRON`. Each subproblem whose Hessian is a
+    Numpy array or a sufficiently dense SciPy sparse matrix of size at most
+    `maxn` is solved by the Moré-Sorensen method. Other subproblems are
+    handed to an iterative solver.
+    """
+
+    #: Request explicit Hessians so that their density can be measured.
+    needs_matrix = True
+
+    def __init__(self, iterative=TruncatedCG, **kwargs):
+        """Instantiate a selector of trust-region solvers.
+
+        :parameters:
+            :iterative: class of the iterative solver     (`TruncatedCG`)
+
+        :keywords:
+            :maxn:          largest size solved exactly              (500)
+            :min_density:   smallest density of a sparse Hessian solved
+                            exactly                                   (0.05)
+            :operator_maxn: largest size of a Hessian given as an
+                            operator that is assembled and solved
+                            exactly                                   (100)
+
+        Other keywords are passed to the constructor of the solvers.
+        """
+        self.iterative = iterative
+        self.maxn = kwargs.pop('maxn', 500)
+        self.min_density = kwargs.pop('min_density', 0.05)
+        self.operator_maxn = kwargs.pop('operator_maxn', 100)
+        self.kwargs = kwargs
+
+    def exact(self, H, n):
+        """Return `True` if the subproblem with Hessian H is solved exactly."""
+        if isinstance(H, np.ndarray):
+            return n <= self.maxn
+        if sp.issparse(H):
+            return n <= self.maxn and H.nnz >= self.min_density * n * n
+        return n <= self.operator_maxn
+
+    def __call__(self, qp, **kwargs):
+        """Instantiate the solver chosen for the subproblem `qp`."""
+        options = dict(self.kwargs, **kwargs)
+        if self.exact(qp.H, qp.c.shape[0]):
+            return MoreSorensen(qp, **options)
+        return self.iterative(qp, **options)
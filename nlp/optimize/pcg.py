@@ -9,7 +9,7 @@ truncated preconditioned conjugate gradient algorithm as described in
 .. moduleauthor:: D. Orban <dominique.orban@gerad.ca>
 """
 
-from nlp.tools.utils import to_boundary
+from nlp.tools.utils import to_boundary, axpy, matvec
 from nlp.tools.exceptions import UserExitRequest
 import numpy as np
 from math import sqrt
@@ -108,23 +108,39 @@ class TruncatedCG(object):
           :abstol:     absolute stopping tolerance (default: 1.0e-8),
           :reltol:     relative stopping tolerance (default: 1.0e-6),
           :maxiter:    maximum number of iterations (default: 2n),
-          :prec:       a user-defined preconditioner.
+          :prec:       a user-defined preconditioner,
+          :hprod:      a callable such that `hprod(p, out)` stores the
+                       product of H with p into the array `out`
+                       (default: computed with `matvec`),
+          :store:      a callable that receives the pair (alpha*p, alpha*Hp)
+                       of each iteration that does not reach the
+                       trust-region boundary, e.g., to build a
+                       preconditioner for subsequent solves (default: None).
+                       The arrays are overwritten at the next iteration.
+          :bookkeeping: transfer the quantities of each iteration to the
+                       instance and call :meth:`post_iteration` (default:
+                       `True` if :meth:`post_iteration` is overridden).
+
+        The iterations operate on work vectors allocated once per solve.
         """
 
         radius = kwargs.get('radius', None)
         abstol = kwargs.get('absol', 1.0e-8)
         reltol = kwargs.get('reltol', 1.0e-6)
         maxiter = kwargs.get('maxiter', 2 * self.n)
-        prec = kwargs.get('prec', lambda v: v)
-
+        prec = kwargs.get('prec', None)
+        store = kwargs.get('store', None)
         qp = self.qp
         n = qp.n
         H = qp.H
+        hprod = kwargs.get('hprod', lambda v, out: matvec(H, v, out))
+        overridden = type(self).post_iteration != TruncatedCG.post_iteration
+        bookkeeping = kwargs.get('bookkeeping', overridden)
 
         # Initialization
         if 's0' in kwargs:
             s = kwargs['s0']
-            snorm2 = np.linalg.norm(s)
+            snorm2 = np.dot(s, s)
         else:
             s = np.zeros(n)
             snorm2 = 0.0
@@ -132,7 +148,8 @@ class TruncatedCG(object):
         self.qval = qp.obj(s)
         r = qp.grad(s)
 
-        y = prec(r)
+        # Without preconditioner, y is an alias of r.
+        y = r if prec is None else prec(r)
         ry = np.dot(r, y)
         sqrtry = sqrt(ry)
 
@@ -143,7 +160,12 @@ class TruncatedCG(object):
         exitIter = k > maxiter
         exitUser = False
 
+        # Work vectors.
         p = -y
+        Hp = np.empty(n)
+        if store is not None:
+            self.ds = np.empty(n)
+            self.dr = np.empty(n)
 
         onBoundary = False
         infDescent = False
@@ -155,7 +177,7 @@ class TruncatedCG(object):
                 not onBoundary and not infDescent:
 
             k += 1
-            Hp = H * p
+            hprod(p, Hp)
             pHp = np.dot(p, Hp)
 
             self.log.info(self.fmt % (k, ry, pHp))
@@ -178,45 +200,50 @@ class TruncatedCG(object):
 
             if radius is not None and (pHp <= 0 or alpha > sigma):
                 # p leads past the trust-region boundary. Move to the boundary.
-                s += sigma * p
+                axpy(sigma, p, s)
                 snorm2 = radius * radius
                 self.status = 'trust-region boundary active'
                 onBoundary = True
                 continue
 
             self.qval += alpha * np.dot(r, p) + 0.5 * alpha**2 * pHp
-            self.ds = alpha * p
-            self.dr = alpha * Hp
+
+            if store is not None:
+                np.multiply(p, alpha, out=self.ds)
+                np.multiply(Hp, alpha, out=self.dr)
+                store(self.ds, self.dr)
 
             # Move to next iterate.
-            s += self.ds
-            r += self.dr
-            y = prec(r)
+            axpy(alpha, p, s)
+            axpy(alpha, Hp, r)
+            if prec is not None:
+                y = prec(r)
             ry_next = np.dot(r, y)
             beta = ry_next / ry
             p *= beta
             p -= y  # p = -y + beta * p
             ry = ry_next
 
-            # Transfer useful quantities for post iteration.
-            self.pHp = pHp
-            self.r = r
-            self.y = y
-            self.p = p
-            self.step = s
-            self.step_norm2 = snorm2
-            self.ry = ry
-            self.alpha = alpha
-            self.beta = beta
-
             sqrtry = sqrt(ry)
             snorm2 = np.dot(s, s)
 
-            try:
-                self.post_iteration()
-            except UserExitRequest:
-                self.status = 'usr'
-                exitUser = True
+            if bookkeeping:
+                # Transfer useful quantities for post iteration.
+                self.pHp = pHp
+                self.r = r
+                self.y = y
+                self.p = p
+                self.step = s
+                self.step_norm2 = snorm2
+                self.ry = ry
+                self.alpha = alpha
+                self.beta = beta
+
+                try:
+                    self.post_iteration()
+                except UserExitRequest:
+                    self.status = 'usr'
+                    exitUser = True
 
             exitIter = k >= maxiter
             exitOptimal = sqrtry <= stop_tol
@@ -238,3 +265,210 @@ class TruncatedCG(object):
         self.onBoundary = onBoundary
         self.infDescent = infDescent
         return
+
+
+def block_product(H, P):
+    """Return the product of the operator `H` with the columns of `P`.
+
+    Matrices in Numpy or SciPy format perform the product in a single pass.
+    Other linear operators are applied to each column in turn.
+    """
+    if isinstance(H, np.ndarray) or hasattr(H, 'tocsr'):
+        return np.asarray(H.dot(P)).reshape(P.shape)
+    HP = np.empty(P.shape)
+    for j in range(P.shape[1]):
+        HP[:, j] = H * P[:, j]
+    return HP
+
+
+class BlockTruncatedCG(object):
+
+    def __init__(self, H, G, **kwargs):
+        """
+        Solve the k quadratic trust-region subproblems
+
+          minimize    g_j's + 1/2 s'Hs
+          subject to  s's  <=  radius_j
+
+        that share the Hessian H by means of a block version of the truncated
+        conjugate gradient algorithm. The k conjugate gradient recurrences
+        are advanced simultaneously so that each iteration requires a single
+        product between H and a block of directions. Each column is truncated
+        at its own trust-region boundary, or stops when its residual is small,
+        independently of the other columns.
+
+        :parameters:
+            :H:            symmetric linear operator or matrix of size n,
+                           not necessarily positive definite.
+            :G:            n-by-k array whose columns are the linear terms
+                           g_j.
+            :logger_name:  name of a logger object that can be used during the
+                           iterations                         (default None)
+
+        :returns:
+
+          Upon return, the following attributes are set:
+
+          :step:       n-by-k array of final steps,
+          :niter:      number of block iterations,
+          :niters:     number of iterations of each column,
+          :step_norm:  Euclidian norms of the steps,
+          :qval:       values of the quadratic models at the steps,
+          :status:     list of the final status of each column,
+          :onBoundary: boolean array, True where the trust-region boundary
+                       was hit,
+          :infDescent: boolean array, True where a direction of infinite
+                       descent was found. The direction is stored in the
+                       corresponding column of `dir`.
+        """
+        self.H = H
+        self.G = np.asarray(G, dtype=np.float)
+        if self.G.ndim == 1:
+            self.G = self.G.reshape(-1, 1)
+        self.n, self.k = self.G.shape
+
+        self.prefix = 'Bcg: '
+        self.name = 'Block Truncated CG'
+
+        self.status = ['?'] * self.k
+        self.step = None
+        self.step_norm = None
+        self.niter = 0
+        self.niters = None
+        self.qval = None
+        self.dir = None
+        self.onBoundary = None
+        self.infDescent = None
+
+        logger_name = kwargs.get('logger_name', 'nlp.trcg')
+        self.log = logging.getLogger(logger_name)
+        self.log.addHandler(logging.NullHandler())
+        self.log.propagate = False
+
+    def solve(self, **kwargs):
+        """
+        Solve the trust-region subproblems.
+
+        :keywords:
+
+          :radius:     trust-region radius, either a scalar or an array of
+                       size k (default: None),
+          :abstol:     absolute stopping tolerance (default: 1.0e-8),
+          :reltol:     relative stopping tolerance (default: 1.0e-6),
+          :maxiter:    maximum number of iterations (default: 2n),
+          :prec:       a user-defined preconditioner applied to each column.
+        """
+        radius = kwargs.get('radius', None)
+        abstol = kwargs.get('abstol', 1.0e-8)
+        reltol = kwargs.get('reltol', 1.0e-6)
+        maxiter = kwargs.get('maxiter', 2 * self.n)
+        prec = kwargs.get('prec', None)
+
+        n, k = self.n, self.k
+        if radius is not None:
+            radius = np.broadcast_to(np.asarray(radius, dtype=np.float),
+                                     (k,))
+
+        def precondition(R):
+            if prec is None:
+                return R.copy()
+            return np.column_stack([prec(R[:, j]) for j in range(R.shape[1])])
+
+        S = np.zeros((n, k))
+        R = self.G.copy()
+        Y = precondition(R)
+        P = -Y
+        ry = np.einsum('ij,ij->j', R, Y)
+        stop_tol = np.maximum(abstol, reltol * np.sqrt(ry))
+
+        qval = np.zeros(k)
+        ss = np.zeros(k)
+        niters = np.zeros(k, dtype=np.int)
+        onBoundary = np.zeros(k, dtype=np.bool)
+        infDescent = np.zeros(k, dtype=np.bool)
+        self.dir = np.zeros((n, k))
+        status = ['residual small'] * k
+
+        active = np.where(np.sqrt(ry) > stop_tol)[0]
+        niter = 0
+
+        self.log.info(self.prefix + '%d right-hand sides', k)
+
+        while active.size > 0 and niter < maxiter:
+            niter += 1
+            niters[active] += 1
+            Pa = P[:, active]
+            HP = block_product(self.H, Pa)
+            pHp = np.einsum('ij,ij->j', Pa, HP)
+            rp = np.einsum('ij,ij->j', R[:, active], Pa)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                alpha = np.where(pHp != 0, ry[active] / pHp, np.inf)
+
+            if radius is None:
+                # Directions of singularity or negative curvature.
+                infinite = pHp <= 0
+                boundary = np.zeros(active.size, dtype=np.bool)
+            else:
+                # Steplengths to the boundary.
+                Sa = S[:, active]
+                px = np.einsum('ij,ij->j', Pa, Sa)
+                pp = np.einsum('ij,ij->j', Pa, Pa)
+                d2 = radius[active]**2
+                rad = np.sqrt(np.maximum(px**2 + pp * (d2 - ss[active]), 0))
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    sigma = np.where(px > 0,
+                                     (d2 - ss[active]) / (px + rad),
+                                     np.where(rad > 0, (rad - px) / pp, 0.))
+                infinite = np.zeros(active.size, dtype=np.bool)
+                boundary = (pHp <= 0) | (alpha > sigma)
+
+            if np.any(infinite):
+                cols = active[infinite]
+                infDescent[cols] = True
+                self.dir[:, cols] = Pa[:, infinite]
+                for j in cols:
+                    status[j] = 'infinite descent'
+
+            if np.any(boundary):
+                cols = active[boundary]
+                sig = sigma[boundary]
+                S[:, cols] += sig * Pa[:, boundary]
+                qval[cols] += sig * rp[boundary] + \
+                    0.5 * sig**2 * pHp[boundary]
+                ss[cols] = radius[cols]**2
+                onBoundary[cols] = True
+                for j in cols:
+                    status[j] = 'trust-region boundary active'
+
+            # Advance the remaining columns.
+            move = ~(infinite | boundary)
+            cols = active[move]
+            a = alpha[move]
+            qval[cols] += a * rp[move] + 0.5 * a**2 * pHp[move]
+            S[:, cols] += a * Pa[:, move]
+            R[:, cols] += a * HP[:, move]
+            Yc = precondition(R[:, cols])
+            ry_next = np.einsum('ij,ij->j', R[:, cols], Yc)
+            beta = ry_next / ry[cols]
+            P[:, cols] = beta * P[:, cols] - Yc
+            ry[cols] = ry_next
+            ss[cols] = np.einsum('ij,ij->j', S[:, cols], S[:, cols])
+
+            active = cols[np.sqrt(ry_next) > stop_tol[cols]]
+            self.log.debug(self.prefix + 'iter %d, %d active', niter,
+                           active.size)
+
+        for j in active:
+            status[j] = 'max iter'
+
+        self.step = S
+        self.niter = niter
+        self.niters = niters
+        self.qval = qval
+        self.step_norm = np.sqrt(ss)
+        self.status = status
+        self.onBoundary = onBoundary
+        self.infDescent = infDescent
+        self.log.info(self.prefix + '%d iterations', niter)
+        return
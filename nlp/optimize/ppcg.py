@@ -16,7 +16,7 @@ from math import sqrt
 import numpy as np
 
 from nlp.optimize.projKrylov import ProjectedKrylov
-from nlp.tools.utils import to_boundary
+from nlp.tools.utils import to_boundary, axpy, matvec
 from nlp.tools.timing import cputime
 
 __docformat__ = 'restructuredtext'
@@ -204,9 +204,19 @@ class ProjectedCG(ProjectedKrylov):
                            -(self.btol * self.cur_iter[i] + s[i]) / p[i])
         return step_len
 
-    def solve(self):
-        """Solve."""
+    def solve(self, **kwargs):
+        """Solve.
+
+        :keywords:
+            :hprod: a callable such that `hprod(p, out)` stores the product
+                    of H with p into the array `out` (default: computed with
+                    `matvec`).
+
+        The iterations operate on work vectors allocated once per solve.
+        """
         n = self.n
+        H = self.qp.H
+        hprod = kwargs.get('hprod', lambda v, out: matvec(H, v, out))
         x_norm2 = 0.0  # Squared norm of current iterate x, not counting x_feas
 
         # Obtain initial projected residual
@@ -229,9 +239,12 @@ class ProjectedCG(ProjectedKrylov):
             g = self.qp.c
             r = g.copy()
 
-        # Initialize search direction
+        # Initialize search direction and work vectors.
         p = -g
         pHp = None
+        Hp = np.empty(n)
+        if self.precon is not None:
+            r_work = np.empty(n)
 
         self.resid_norm0 = np.dot(r, g)
         rg = self.resid_norm0
@@ -245,7 +258,7 @@ class ProjectedCG(ProjectedKrylov):
 
         while sqrt(rg) > threshold and iter < self.maxiter and not on_boundary:
 
-            Hp = self.qp.H * p
+            hprod(p, Hp)
             pHp = np.dot(p, Hp)
 
             # Display current iteration info
@@ -269,7 +282,7 @@ class ProjectedCG(ProjectedKrylov):
                 # p is a direction of singularity or negative curvature or
                 # next iterate will lie past the boundary of the trust region
                 # Move to boundary of trust-region
-                self.x += sigma * p
+                axpy(sigma, p, self.x)
                 x_norm2 = self.radius * self.radius
                 status = u'on boundary (σ = %g)' % sigma
                 self.inf_descent = (pHp <= 0.0)
@@ -280,14 +293,14 @@ class ProjectedCG(ProjectedKrylov):
             if (self.btol is not None) and (self.cur_iter is not None):
                 step_bnd = self.ftb(self.x, p)
                 if step_bnd < alpha:
-                    self.x += step_bnd * p
+                    axpy(step_bnd, p, self.x)
                     status = 'on boundary'
                     on_boundary = True
                     continue
 
             # Move on
-            self.x += alpha * p
-            r += alpha * Hp
+            axpy(alpha, p, self.x)
+            axpy(alpha, Hp, r)
 
             if self.qp.A is not None:
                 # Project current residual
@@ -308,10 +321,11 @@ class ProjectedCG(ProjectedKrylov):
 
             rg_next = np.dot(r, g)
             beta = rg_next / rg
-            p = -g + beta * p
+            p *= beta
+            p -= g  # p = -g + beta * p
             if self.precon is not None:
                 # Perform iterative semi-refinement
-                r = r - self.v
+                r = np.subtract(r, self.v, out=r_work)
             else:
                 r = g
             rg = rg_next
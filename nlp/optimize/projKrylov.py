@@ -41,14 +41,8 @@ References
 
 """
 
-from pysparse.sparse import spmatrix
-
-try:                            # To compute projections
-    from hsl.solvers.pyma57 import PyMa57Solver as LBLContext
-except ImportError:
-    from hsl.solvers.pyma27 import PyMa27Solver as LBLContext
-
 from nlp.tools import norms
+from nlp.tools.sparse_matrix import SparseMatrix, factorize_symmetric
 from nlp.tools.timing import cputime
 import logging
 
@@ -68,7 +62,8 @@ class ProjectedKrylov(object):
             :c:  the first part of the right-hand side vector.
 
         :keywords:
-            :A:  the `constraint` matrix. Must be given as an explicit matrix.
+            :A:  the `constraint` matrix. Must be given as an explicit matrix
+                 in SciPy, PySparse or CySparse format.
             :b:  the second part of the right-hand side vector
                  (default: ``None``, meaning the vector of zeros).
             :abstol:  absolute stopping tolerance (default: 1.0e-8).
@@ -84,7 +79,8 @@ class ProjectedKrylov(object):
             :proj: an existing factorization of the projector. If not ``None``,
                       ``factorize`` will be set to ``False``.
             :precon:  preconditioner. Normally this is a cheap approximation to
-                      ``H``. It must be specified as an explicit matrix.
+                      ``H``. It must be specified as an explicit symmetric
+                      matrix.
             :logger_name:  Name of a logger (Default: `None`).
         """
         self.prefix = 'Generic PK: '   # Should be overridden in subclass
@@ -149,26 +145,22 @@ class ProjectedKrylov(object):
             raise ValueError('No linear equality constraints were specified')
 
         # Form projection matrix
-        P = spmatrix.ll_mat_sym(self.n + self.m, self.nnzA + self.n)
+        P = SparseMatrix((self.n + self.m, self.n + self.m), symmetric=True)
         if self.precon is not None:
-            P[:self.n, :self.n] = self.precon
+            P.put_block(self.precon)
         else:
-            r = range(self.n)
-            P.put(1, r, r)
-            # for i in range(self.n):
-            #    P[i,i] = 1
-        P[self.n:, :self.n] = self.A
+            P.put(1.0, range(self.n))
+        P.put_block(self.A, row_offset=self.n)
 
         # Add regularization if requested.
         if self.dreg > 0.0:
-            r = range(self.n, self.n + self.m)
-            P.put(-self.dreg, r, r)
+            P.put(-self.dreg, range(self.n, self.n + self.m))
 
         msg = 'Factorizing projection matrix '
         msg += '(size %-d, nnz = %-d)...' % (P.shape[0], P.nnz)
         self.log.debug(msg)
         self.t_fact = cputime()
-        self.proj = LBLContext(P)
+        self.proj = factorize_symmetric(P)
         self.t_fact = cputime() - self.t_fact
         self.log.debug('... done (%-5.2fs)' % self.t_fact)
         self.factorized = True
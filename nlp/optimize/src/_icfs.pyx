@@ -0,0 +1,194 @@
+"""Incomplete Cholesky factorization with limited memory.
+
+Compiled kernel of
+:class:`nlp.optimize.precon.IncompleteCholeskyPreconditioner` following
+
+Chih-Jen Lin and Jorge J. More, *Incomplete Cholesky Factorizations with
+Limited Memory*, SIAM J. Sci. Comput., 21(1), 24-45, 1999.
+"""
+
+import numpy as np
+cimport numpy as cnp
+
+cimport cython
+from libc.stdlib cimport malloc, free, qsort
+from libc.string cimport const_void
+
+cdef extern from "math.h":
+        double sqrt(double x) nogil
+        double fabs(double x) nogil
+
+
+# Candidate entry of a column of the factor.
+cdef struct entry:
+    double mag
+    cnp.int64_t row
+
+
+cdef inline bint before(entry a, entry b) nogil:
+    # Decreasing magnitude; ties are broken by increasing row index.
+    return a.mag > b.mag or (a.mag == b.mag and a.row < b.row)
+
+
+cdef void select(entry *a, Py_ssize_t n, Py_ssize_t k) nogil:
+    # Reorder a[:n] so that a[:k] holds its first k entries in the order
+    # defined by `before`, by Hoare's selection algorithm.
+    cdef Py_ssize_t lo = 0, hi = n - 1, i, j
+    cdef entry pivot, tmp
+    while lo < hi:
+        pivot = a[(lo + hi) / 2]
+        i = lo
+        j = hi
+        while i <= j:
+            while before(a[i], pivot):
+                i += 1
+            while before(pivot, a[j]):
+                j -= 1
+            if i <= j:
+                tmp = a[i]
+                a[i] = a[j]
+                a[j] = tmp
+                i += 1
+                j -= 1
+        if k - 1 <= j:
+            hi = j
+        elif k - 1 >= i:
+            lo = i
+        else:
+            return
+
+
+cdef int by_row(const_void *a, const_void *b) nogil:
+    cdef entry *ea = <entry *> a
+    cdef entry *eb = <entry *> b
+    return (ea.row > eb.row) - (ea.row < eb.row)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def icfs(cnp.ndarray[cnp.int64_t, ndim=1] indptr,
+         cnp.ndarray[cnp.int64_t, ndim=1] indices,
+         cnp.ndarray[cnp.float64_t, ndim=1] data,
+         double alpha, int p):
+    """Incomplete Cholesky factor of A + alpha I.
+
+    A is the lower triangle of a symmetric matrix given by the arrays
+    `indptr`, `indices` and `data` of its CSC representation, with sorted
+    row indices. Column j of the factor L retains the nj + p entries of
+    largest magnitude below the diagonal, where nj is the number of
+    nonzeros below the diagonal in column j of A.
+
+    Return the arrays `(data, indices, indptr)` of L in CSC format, with
+    the diagonal first in each column and sorted row indices, or `None`
+    if a nonpositive pivot is encountered.
+
+    Columns are computed left to right. The columns k < j that contribute
+    to column j are found from linked lists: column k is listed under the
+    row of its next entry not yet used, as in left-looking sparse
+    Cholesky codes.
+    """
+    cdef Py_ssize_t n = indptr.shape[0] - 1
+    cdef Py_ssize_t maxnnz = indptr[n] + n * (p + 1)
+    cdef Py_ssize_t i, j, k, knext, q, r, t, end, nt, nc, nj, nkeep
+    cdef double d, ljk
+
+    # Work vector of column j and the rows it touches.
+    cdef cnp.ndarray[cnp.float64_t, ndim=1] w = np.zeros(n)
+    cdef cnp.ndarray[cnp.int64_t, ndim=1] mark = -np.ones(n, dtype=np.int64)
+    cdef cnp.ndarray[cnp.int64_t, ndim=1] touched = np.empty(n, dtype=np.int64)
+
+    # head[i] is the first column listed under row i, nxt[k] the next one.
+    # first[k] is the position in L of the next entry of column k to use.
+    cdef cnp.ndarray[cnp.int64_t, ndim=1] head = -np.ones(n, dtype=np.int64)
+    cdef cnp.ndarray[cnp.int64_t, ndim=1] nxt = np.empty(n, dtype=np.int64)
+    cdef cnp.ndarray[cnp.int64_t, ndim=1] first = np.empty(n, dtype=np.int64)
+
+    cdef cnp.ndarray[cnp.int64_t, ndim=1] L_indptr = \
+        np.zeros(n + 1, dtype=np.int64)
+    cdef cnp.ndarray[cnp.int64_t, ndim=1] L_indices = \
+        np.empty(maxnnz, dtype=np.int64)
+    cdef cnp.ndarray[cnp.float64_t, ndim=1] L_data = np.empty(maxnnz)
+
+    cdef entry *cand = <entry *> malloc(max(n, 1) * sizeof(entry))
+    if cand == NULL:
+        raise MemoryError()
+
+    try:
+        for j in range(n):
+            nt = 0
+            nj = 0
+            for q in range(indptr[j], indptr[j + 1]):
+                i = indices[q]
+                w[i] = data[q]
+                if i > j:
+                    nj += 1
+                if mark[i] != j:
+                    mark[i] = j
+                    touched[nt] = i
+                    nt += 1
+            if mark[j] != j:
+                mark[j] = j
+                touched[nt] = j
+                nt += 1
+            w[j] += alpha
+
+            # Subtract the contributions L[j:, k] L[j, k] of previous columns.
+            k = head[j]
+            while k != -1:
+                knext = nxt[k]
+                q = first[k]
+                end = L_indptr[k + 1]
+                ljk = L_data[q]
+                for r in range(q, end):
+                    i = L_indices[r]
+                    w[i] -= ljk * L_data[r]
+                    if mark[i] != j:
+                        mark[i] = j
+                        touched[nt] = i
+                        nt += 1
+                first[k] = q + 1
+                if q + 1 < end:
+                    i = L_indices[q + 1]
+                    nxt[k] = head[i]
+                    head[i] = k
+                k = knext
+
+            if w[j] <= 0:
+                return None
+            d = sqrt(w[j])
+
+            # Retain the nj + p largest entries below the diagonal.
+            nc = 0
+            for t in range(nt):
+                i = touched[t]
+                if i > j:
+                    cand[nc].mag = fabs(w[i])
+                    cand[nc].row = i
+                    nc += 1
+            nkeep = nj + p
+            if nc > nkeep:
+                select(cand, nc, nkeep)
+                nc = nkeep
+            qsort(cand, nc, sizeof(entry), by_row)
+
+            q = L_indptr[j]
+            L_indices[q] = j
+            L_data[q] = d
+            for t in range(nc):
+                L_indices[q + 1 + t] = cand[t].row
+                L_data[q + 1 + t] = w[cand[t].row] / d
+            L_indptr[j + 1] = q + 1 + nc
+            first[j] = q + 1
+            if nc > 0:
+                i = cand[0].row
+                nxt[j] = head[i]
+                head[i] = j
+
+            for t in range(nt):
+                w[touched[t]] = 0.0
+    finally:
+        free(cand)
+
+    nnz = L_indptr[n]
+    return L_data[:nnz], L_indices[:nnz], L_indptr
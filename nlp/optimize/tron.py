@@ -9,7 +9,6 @@ Constrained Optimization Problems*, SIAM J. Optim., 9(4), 1100–1127, 1999.
 
 import logging
 import numpy as np
-from pykrylov.linop import SymmetricallyReducedLinearOperator as ReducedHessian
 
 from nlp.model.nlpmodel import QPModel
 from nlp.model.linemodel import C1LineModel
@@ -18,13 +17,117 @@ from nlp.tr.trustregion import TrustRegionSolver
 from nlp.tr.trustregion import GeneralizedTrustRegion
 from nlp.tools import norms
 from nlp.tools.utils import where, projected_gradient_norm2, \
-    project, projected_step, breakpoints
+    project, projected_step, breakpoints, breakpoint_steps, to_boundary, \
+    matvec
 from nlp.tools.timing import cputime
 from nlp.tools.exceptions import UserExitRequest, LineSearchFailure
 
+try:
+    from scipy import sparse as sp
+    from scipy.sparse.linalg import splu
+except ImportError:
+    sp = None
+
 __docformat__ = "restructuredtext"
 
 
+class ReducedHessian(object):
+    u"""Restriction ZᵀHZ of a symmetric operator H to the free variables.
+
+    The set of free variables is computed by :meth:`reset` and only shrinks
+    afterwards, as variables reach their bounds, so that :meth:`shrink` only
+    examines the variables that are currently free. Products with an
+    operator H scatter their argument into a preallocated vector of full
+    size and gather the result into the free variables. When H is a SciPy
+    sparse matrix or an explicit matrix is supplied, products use the
+    submatrix in the free variables, which is extracted once per free set.
+
+    The following statistics are available after a call to :meth:`reset`:
+
+    :nfree:   current number of free variables,
+    :changes: number of variables that became active at each call to
+              :meth:`shrink`,
+    :nprod:   number of products.
+    """
+
+    def __init__(self, n):
+        """Instantiate a reduced operator for a problem with `n` variables."""
+        self.n = n
+        self.H = None
+        self.M = None
+        self.explicit = False
+        self.free = np.arange(n)
+        self.changes = []
+        self.nprod = 0
+        self._matrix = None
+        self._v = np.zeros(n)
+
+    @property
+    def nfree(self):
+        """Number of free variables."""
+        return self.free.shape[0]
+
+    @property
+    def shape(self):
+        return (self.nfree, self.nfree)
+
+    @property
+    def matrix(self):
+        """Submatrix of H in the free variables if H is explicit."""
+        if not self.explicit:
+            return None
+        if self._matrix is None:
+            self._matrix = self.M[self.free, :][:, self.free]
+        return self._matrix
+
+    def reset(self, H, x, l, u, matrix=None):
+        """Set the operator to H and free the variables strictly between
+        their bounds l and u at x.
+
+        `matrix` is H as a Numpy array or SciPy sparse matrix. It defaults
+        to H if H is a SciPy sparse matrix.
+        """
+        if matrix is None and sp is not None and sp.issparse(H):
+            matrix = H
+        self.H = H
+        self.M = matrix
+        self.explicit = matrix is not None
+        self.free = where((x > l) & (x < u))
+        self.changes = []
+        self.nprod = 0
+        self._matrix = None
+        self._v.fill(0.0)
+        return self.free
+
+    def shrink(self, x, l, u):
+        """Remove the variables that reached a bound from the free set.
+
+        Return the number of variables removed.
+        """
+        free = self.free
+        xfree = x[free]
+        keep = (xfree > l[free]) & (xfree < u[free])
+        nactive = free.shape[0] - np.count_nonzero(keep)
+        self.changes.append(nactive)
+        if nactive > 0:
+            self._v[free[~keep]] = 0.0
+            self.free = free[keep]
+            self._matrix = None
+        return nactive
+
+    def hprod(self, v, out):
+        """Store the product of ZᵀHZ with v into out."""
+        self.nprod += 1
+        if self.explicit:
+            return matvec(self.matrix, v, out)
+        # Only the free entries of the full vector are nonzero.
+        self._v[self.free] = v
+        return np.take(self.H * self._v, self.free, out=out)
+
+    def __mul__(self, v):
+        return self.hprod(v, np.empty(self.nfree))
+
+
 class TRON(object):
     u"""Trust-region Newton method for bound-constrained problems."""
 
@@ -37,6 +140,10 @@ class TRON(object):
 
         :parameters:
             :model:        a :class:`NLPModel` instance.
+            :tr_solver:    a solver for the trust-region subproblems in the
+                           free variables, e.g., :class:`TruncatedCG`,
+                           :class:`MoreSorensen` or an :class:`AutoTRSolver`
+                           instance.
 
         :keywords:
             :x0:           starting point                     (``model.x0``)
@@ -49,9 +156,26 @@ class TRON(object):
                            step is rejected                   (``False``)
             :logger_name:  name of a logger object that can be used in the post
                            iteration                          (``None``)
+            :factorize:    solve the subproblems by factorizing the reduced
+                           Hessian when ``model.hess`` returns a SciPy
+                           sparse matrix                      (``False``)
+            :factorize_maxn: largest number of free variables for which
+                           the reduced Hessian is factorized  (5000)
+            :preconditioner: a :class:`Preconditioner` instance, updated
+                           with the reduced Hessian before each
+                           conjugate gradient solve           (``None``)
+            :exact_cauchy: compute the Cauchy step by an exact search along
+                           the projected gradient path        (``True``)
+            :monotone:     use monotone descent strategy      (``True``)
+            :n_non_monotone: number of iterations for which non-strict descent
+                           is tolerated if ``monotone=False`` (25)
+            :tr:           a :class:`GeneralizedTrustRegion` instance that
+                           manages the radius, e.g., an
+                           :class:`AdaptiveTrustRegion`      (``None``)
         """
         self.model = model
-        self.tr = GeneralizedTrustRegion()
+        tr = kwargs.get("tr", None)
+        self.tr = GeneralizedTrustRegion() if tr is None else tr
 
         self.tr_solver = tr_solver
         self.solver = None
@@ -80,8 +204,15 @@ class TRON(object):
         self.maxiter = kwargs.get("maxiter", 100 * self.model.n)
         self.maxfuncall = kwargs.get("maxfuncall", 100000)
         self.ny = kwargs.get("ny", True)
+        self.factorize = kwargs.get("factorize", False) and sp is not None
+        self.factorize_maxn = kwargs.get("factorize_maxn", 5000)
+        self.preconditioner = kwargs.get("preconditioner", None)
+        self.exact_cauchy = kwargs.get("exact_cauchy", True)
+        self.monotone = kwargs.get("monotone", True)
+        self.n_non_monotone = kwargs.get("n_non_monotone", 25)
         self.cgtol = 0.1
         self.alphac = 1
+        self.reduced = ReducedHessian(self.model.n)
 
         self.hformat = "%-5s  %8s  %7s  %5s  %8s  %8s  %8s  %4s"
         self.header = self.hformat % ("iter", "f", u"‖P∇f‖", "inner",
@@ -96,8 +227,13 @@ class TRON(object):
         self.log.propagate = False
 
     def precon(self, v, **kwargs):
-        """Generic preconditioning method---must be overridden."""
-        return v
+        """Apply the preconditioner to v.
+
+        The identity is used unless a preconditioner was supplied.
+        """
+        if self.preconditioner is None:
+            return v
+        return self.preconditioner(v)
 
     def post_iteration(self, **kwargs):
         """Override this method to perform work at the end of an iteration.
@@ -126,11 +262,22 @@ class TRON(object):
            ‖s‖ ≤ Δ,      q(s) ≤ μ₀ gᵀs,
 
         where μ₀ ∈ (0, 1).
+
+        If `exact_cauchy` is set, the first minimizer of q along the
+        projected path inside the trust region is tried first. The search
+        by interpolation and extrapolation from α is used if that step does
+        not satisfy the sufficient decrease condition.
         """
         self.log.debug(u"computing Cauchy point with α=%g, δ=%d", alpha, delta)
         # Constant that defines sufficient decrease.
         mu0 = 0.01
 
+        if self.exact_cauchy:
+            (s, t, q, gts) = self.exact_cauchy_step(x, g, H, l, u, delta)
+            if t > 0 and q <= mu0 * gts:
+                return (s, t)
+            self.log.debug("exact Cauchy step rejected; searching")
+
         # Interpolation and extrapolation factors.
         interpf = 0.1
         extrapf = 10
@@ -186,7 +333,75 @@ class TRON(object):
             s = projected_step(x, -alpha * g, l, u)
         return (s, alpha)
 
-    def projected_newton_step(self, x, g, H, delta, l, u, s, cgtol, itermax):
+    def exact_cauchy_step(self, x, g, H, l, u, delta):
+        u"""Compute the first minimizer of q along the projected path.
+
+        The path s(t) = P[x - t g] - x is linear between consecutive
+        breakpoints, where variables reach their bounds, so that q is a
+        quadratic of t on each segment. The breakpoints are sorted once and
+        the segments are visited in order. The slope gᵀd + sᵀHd and
+        curvature dᵀHd of q along the current direction d are updated when
+        variables become fixed, which requires one Hessian product per
+        breakpoint visited. The search also stops on the boundary of the
+        trust region ‖s‖ ≤ Δ.
+
+        Return the step, the value of t, q(s) and gᵀs.
+        """
+        n = x.shape[0]
+        brpt = breakpoint_steps(x, -g, l, u)
+        order = np.argsort(brpt, kind='mergesort')
+        sorted_brpt = brpt[order]
+
+        # Variables whose breakpoint is zero do not move.
+        d = np.where(brpt > 0, -g, 0.0)
+        Hd = H * d
+        s = np.zeros(n)
+        e = np.zeros(n)
+        gd = np.dot(g, d)
+        slope = gd        # gᵀd + sᵀHd.
+        curv = np.dot(d, Hd)
+        t = 0.0
+        q = gts = 0.0
+        k = np.searchsorted(sorted_brpt, 0.0, side='right')
+
+        while slope < 0:
+            # Extent of the current segment and distance to the boundary.
+            t_next = sorted_brpt[k] if k < n else np.inf
+            sigma = to_boundary(s, d, delta)
+            dt_max = min(t_next - t, sigma)
+
+            dt = dt_max
+            if curv > 0:
+                dt = min(dt, -slope / curv)
+            q += dt * (slope + 0.5 * dt * curv)
+            gts += dt * gd
+            s += dt * d
+            t += dt
+            if dt < t_next - (t - dt) or k >= n:
+                break   # Minimizer or boundary reached inside the segment.
+
+            # Fix the variables that reach their bound at t_next.
+            j = np.searchsorted(sorted_brpt, t_next, side='right')
+            fixed = order[k:j]
+            k = j
+            e[fixed] = d[fixed]
+            He = H * e
+            eHd = np.dot(e, Hd)
+            slope = slope + dt * curv - np.dot(g, e) - np.dot(s, He)
+            curv = curv - 2 * eHd + np.dot(e, He)
+            gd -= np.dot(g, e)
+            Hd -= He
+            d[fixed] = 0.0
+            e[fixed] = 0.0
+            if not np.any(d):
+                break
+
+        # Recompute the step on the projected path to remove rounding.
+        s = projected_step(x, -t * g, l, u)
+        return (s, t, q, gts)
+
+    def projected_newton_step(self, x, g, H, delta, l, u, s, cgtol, itermax,
+                              matrix=None):
         u"""Generate a sequence of approximate minimizers to the QP subproblem.
 
             min q(x) subject to  l ≤ x ≤ u
@@ -194,6 +409,8 @@ class TRON(object):
         where q(x₀ + s) = gᵀs + ½ sᵀHs,
 
         x₀ is a base point provided by the user, H=Hᵀ and g is a vector.
+        If given, `matrix` is H as a Numpy array, from which the reduced
+        Hessians are extracted.
 
         At each stage we have an approximate minimizer xₖ, and generate
         a direction pₖ by using a preconditioned conjugate gradient
@@ -233,15 +450,18 @@ class TRON(object):
         # Compute the Cauchy point.
         x = project(x + s, l, u)
 
+        # Determine the free variables at the Cauchy point.
+        reduced = self.reduced
+        reduced.reset(H, x, l, u, matrix=matrix)
+
         # Start the main iteration loop.
         # There are at most n iterations because at each iteration
         # at least one variable becomes active.
         iters = 0
 
         while not (exitOptimal or exitPCG or exitIter):
-            # Determine the free variables at the current minimizer.
-            free_vars = where((x > l) & (x < u))
-            nfree = len(free_vars)
+            free_vars = reduced.free
+            nfree = reduced.nfree
 
             # Exit if there are no free constraints.
             if nfree == 0:
@@ -249,8 +469,9 @@ class TRON(object):
                 info = 1
                 continue
 
-            # Obtain the submatrix of H for the free variables.
-            ZHZ = ReducedHessian(H, free_vars)
+            # Obtain the restriction of H to the free variables.
+            explicit = reduced.explicit
+            ZHZ = reduced.matrix if explicit else reduced
 
             # Compute the norm of the reduced gradient Zᵀg
             gfree = g[free_vars] + Hs[free_vars]
@@ -260,26 +481,42 @@ class TRON(object):
             # to generate a direction p[k]
 
             tol = cgtol * gfnorm  # note: gfnorm ≠ norm(gfree)
-            qp = QPModel(gfree, ZHZ)
-            self.solver = TrustRegionSolver(qp, self.tr_solver)
-            self.solver.solve(prec=self.precon,
-                              radius=self.tr.radius,
-                              abstol=tol)
+            step = None
+            if self.factorize and explicit and nfree <= self.factorize_maxn:
+                step = self.factorized_step(ZHZ, gfree, self.tr.radius)
 
-            step = self.solver.step
-            iters += self.solver.niter
-
-            # Exit if the solver took no additional steps
-            if self.solver.niter == 0:
-                exitOptimal = True
-                info = 4
+            if step is not None:
+                boundary = False
+                iters += 1
+            else:
+                store = None
+                if self.preconditioner is not None:
+                    self.preconditioner.update(ZHZ, free=free_vars)
+                    store = getattr(self.preconditioner, 'store', None)
+                qp = QPModel(gfree, ZHZ)
+                self.solver = TrustRegionSolver(qp, self.tr_solver)
+                self.solver.solve(prec=self.precon,
+                                  radius=self.tr.radius,
+                                  abstol=tol, store=store,
+                                  hprod=reduced.hprod)
+
+                step = self.solver.step
+                iters += self.solver.niter
+                boundary = (self.solver.status ==
+                            "trust-region boundary active")
+
+                # Exit if the solver took no additional steps
+                if self.solver.niter == 0:
+                    exitOptimal = True
+                    info = 4
 
             # Use a projected search to obtain the next iterate
-            (xfree, proj_step) = self.projected_linesearch(x[free_vars],
-                                                           l[free_vars],
-                                                           u[free_vars],
-                                                           gfree, step, ZHZ,
-                                                           alpha=1.0)
+            (xfree, proj_step, Hp) = self.projected_linesearch(x[free_vars],
+                                                               l[free_vars],
+                                                               u[free_vars],
+                                                               gfree, step,
+                                                               reduced,
+                                                               alpha=1.0)
 
             # Update the minimizer and the step.
             # Note that s now contains x[k+1] - x[0]
@@ -287,8 +524,12 @@ class TRON(object):
             s[free_vars] += proj_step
 
             # Compute the gradient grad q(x[k+1]) = g + H*(x[k+1] - x[0])
-            # of q at x[k+1] for the free variables.
-            Hs = H * s
+            # of q at x[k+1] for the free variables. Only the free
+            # components of Hs are updated because the other variables
+            # remain fixed until the end of the loop.
+            if Hp is None:
+                Hp = reduced * proj_step
+            Hs[free_vars] += Hp
             gfree = g[free_vars] + Hs[free_vars]
             gfnormf = norms.norm2(gfree)
 
@@ -299,7 +540,7 @@ class TRON(object):
             if gfnormf <= cgtol * gfnorm:
                 exitOptimal = True
                 info = 1
-            elif self.solver.status == "trust-region boundary active":
+            elif boundary:
                 #  infotr == 3 or infotr == 4:
                 exitPCG = True
                 info = 2
@@ -307,9 +548,42 @@ class TRON(object):
                 exitIter = True
                 info = 3
 
+            # Variables that reached a bound leave the free set.
+            reduced.shrink(x, l, u)
+
+        self.log.debug("active set changes: %s", reduced.changes)
         self.log.debug("leaving projected_newton_step with info=%d", info)
         return (x, s, iters, info)
 
+    def factorized_step(self, H, g, delta):
+        u"""Compute the Newton step on the free variables by factorization.
+
+        Compute an LDLᵀ factorization of the sparse reduced Hessian H by
+        running SuperLU in symmetric mode with diagonal pivoting only, so
+        that P H Pᵀ = L U with U = D Lᵀ. By Sylvester's law of inertia,
+        H is positive definite if and only if no off-diagonal pivot was
+        needed and all the pivots in D are positive. In that case, return
+        the solution of H p = -g if it lies inside the trust region.
+        Return `None` otherwise, i.e., if H is singular or indefinite, in
+        which case the caller falls back on the iterative trust-region
+        solver.
+        """
+        try:
+            lu = splu(sp.csc_matrix(H), permc_spec='MMD_AT_PLUS_A',
+                      diag_pivot_thresh=0.0,
+                      options={'SymmetricMode': True})
+        except RuntimeError:
+            self.log.debug("reduced Hessian is singular")
+            return None
+        if np.any(lu.perm_r != lu.perm_c) or \
+                not np.all(lu.U.diagonal() > 0):
+            self.log.debug("reduced Hessian is not positive definite")
+            return None
+        p = lu.solve(-g)
+        if not np.all(np.isfinite(p)) or norms.norm2(p) > delta:
+            return None
+        return p
+
     def projected_linesearch(self, x, l, u, g, d, H, alpha=1.0):
         u"""Use a projected search to compute a satisfactory step.
 
@@ -333,6 +607,9 @@ class TRON(object):
         The search direction d must be a descent direction for the quadratic q
         at x such that the quadratic is decreasing along the ray  x + α d
         for 0 ≤ α ≤ 1.
+
+        Return the final iterate, the step s and the product Hs if it was
+        computed during the search, or `None` otherwise.
         """
         self.log.debug("performing projected linesearch")
         mu0 = 0.01
@@ -369,10 +646,13 @@ class TRON(object):
         if alpha < 1 and alpha < brptmin:
             alpha = brptmin
 
-        # Compute the final iterate and step.
-        s = projected_step(x, alpha * d, l, u)
+        # Compute the final iterate and step. The product of H with the step
+        # is known if the sufficient decrease condition was satisfied.
+        if search:
+            s = projected_step(x, alpha * d, l, u)
+            Hs = None
         x = project(x + alpha * d, l, u)
-        return (x, s)
+        return (x, s, Hs)
 
     def solve(self):
         """Solve method.
@@ -401,7 +681,7 @@ class TRON(object):
         cgitermax = model.n
 
         # Initialize the trust region radius
-        self.tr.radius = min(max(0.1 * self.pg0, 1.0), 100)
+        self.tr.initialize(min(max(0.1 * self.pg0, 1.0), 100))
 
         # Test for convergence or termination
         stoptol = max(self.gabstol, self.greltol * self.pg0)
@@ -412,6 +692,12 @@ class TRON(object):
         exitFunCall = model.obj.ncalls >= self.maxfuncall
         status = ""
 
+        # Initialize non-monotonicity parameters.
+        if not self.monotone:
+            fMin = fRef = fCan = self.f0
+            l = 0
+            sigRef = sigCan = 0
+
         tick = cputime()
 
         # Print out header and initial log.
@@ -428,8 +714,19 @@ class TRON(object):
                 self.g_old = self.g.copy()
                 self.x_old = self.x.copy()
 
-            # Wrap Hessian into an operator.
-            H = model.hop(self.x.copy())
+            # Assemble the Hessian if it is to be factorized or used by the
+            # subproblem solver or to build a preconditioner, otherwise wrap
+            # it into an operator. Products in the full space use an
+            # operator unless the Hessian is a SciPy sparse matrix.
+            H = Hmat = None
+            if self.factorize or \
+                    getattr(self.tr_solver, 'needs_matrix', False) or \
+                    getattr(self.preconditioner, 'needs_matrix', False):
+                H = model.hess(self.x.copy())
+            if isinstance(H, np.ndarray):
+                Hmat = H
+            if sp is None or not sp.issparse(H):
+                H = model.hop(self.x.copy())
 
             # Compute the Cauchy step and store in s.
             (s, self.alphac) = self.cauchy(self.x, self.g, H,
@@ -442,7 +739,8 @@ class TRON(object):
                                                             self.tr.radius,
                                                             model.Lvar,
                                                             model.Uvar, s,
-                                                            cgtol, cgitermax)
+                                                            cgtol, cgitermax,
+                                                            matrix=Hmat)
 
             snorm = norms.norm2(s)
             self.total_cgiter += cg_iter
@@ -471,6 +769,10 @@ class TRON(object):
             rho = self.tr.ratio(self.f, f_trial, m)
             ared = self.f - f_trial
 
+            if not self.monotone:
+                rhoHis = (fRef - f_trial) / (sigRef - m)
+                rho = max(rho, rhoHis)
+
             # On the first iteration, adjust the initial step bound.
             snorm = norms.norm2(s)
             if self.iter == 1:
@@ -501,6 +803,26 @@ class TRON(object):
                 if self.save_g:
                     self.dgrad = self.g - self.g_old
 
+                # Update non-monotonicity parameters.
+                if not self.monotone:
+                    sigRef = sigRef - m
+                    sigCan = sigCan - m
+                    if f_trial < fMin:
+                        fCan = f_trial
+                        fMin = f_trial
+                        sigCan = 0
+                        l = 0
+                    else:
+                        l = l + 1
+
+                    if f_trial > fCan:
+                        fCan = f_trial
+                        sigCan = 0
+
+                    if l == self.n_non_monotone:
+                        fRef = fCan
+                        sigRef = sigCan
+
             elif self.ny:
                 try:
                     # Trust-region step is rejected; backtrack.
@@ -12,6 +12,11 @@ import numpy as np
 import logging
 from math import sqrt
 
+try:
+    from scipy import sparse as sp
+except ImportError:
+    sp = None
+
 __docformat__ = "restructuredtext"
 
 
@@ -35,7 +40,9 @@ class Trunk(object):
             :nlp:       a :class:`NLPModel` instance.
             :tr:        a :class:`TrustRegion` instance.
             :tr_solver: a trust-region solver to be passed as argument to
-                        the :class:`TrustRegionSolver` constructor.
+                        the :class:`TrustRegionSolver` constructor, e.g.,
+                        :class:`TruncatedCG`, :class:`MoreSorensen` or an
+                        :class:`AutoTRSolver` instance.
 
         :keywords:
             :x0:           starting point                     (``nlp.x0``)
@@ -51,6 +58,8 @@ class Trunk(object):
                            is tolerated if ``monotone=False`` (25)
             :logger_name:  name of a logger object that can be used in the post
                            iteration                          (``None``)
+            :preconditioner: a :class:`Preconditioner` instance, updated
+                           with the Hessian at each iteration (``None``)
 
         Once a ``Trunk`` object has been instantiated and the problem is
         set up, solve problem by issuing a call to ``TRNK.solve()``.
@@ -93,6 +102,7 @@ class Trunk(object):
         self.monotone = kwargs.get("monotone", False)
         self.n_non_monotone = kwargs.get("n_non_monotone", 25)
         self.logger = kwargs.get("logger", None)
+        self.preconditioner = kwargs.get("preconditioner", None)
 
         self.hformat = "%-5s %8s %7s %5s %8s %7s %7s %4s"
         self.header = self.hformat % ("iter", "f", u"‖∇f‖", "inner", u"ρ",
@@ -109,8 +119,13 @@ class Trunk(object):
         self.log.propagate = False
 
     def precon(self, v, **kwargs):
-        """Generic preconditioning method---must be overridden."""
-        return v
+        """Apply the preconditioner to v.
+
+        The identity is used unless a preconditioner was supplied.
+        """
+        if self.preconditioner is None:
+            return v
+        return self.preconditioner(v)
 
     def post_iteration(self, **kwargs):
         """Perform work at the end of an iteration.
@@ -139,7 +154,7 @@ class Trunk(object):
         self.gNorm = norms.norm2(self.g)
         self.g0 = self.gNorm
 
-        self.tr.radius = min(max(0.1 * self.gNorm, 1.0), 100)
+        self.tr.initialize(min(max(0.1 * self.gNorm, 1.0), 100))
         cgtol = 1.0 if self.inexact else -1.0
         stoptol = max(self.abstol, self.reltol * self.g0)
         step_status = None
@@ -178,11 +193,25 @@ class Trunk(object):
             if self.inexact:
                 cgtol = max(stoptol, min(0.7 * cgtol, 0.01 * self.gNorm))
 
-            qp = QPModel(self.g, self.nlp.hop(self.x, self.nlp.pi0))
+            # Use the explicit Hessian if the subproblem solver or the
+            # preconditioner requires it.
+            H = None
+            store = None
+            precon = self.preconditioner
+            if getattr(self.tr_solver, 'needs_matrix', False) or \
+                    getattr(precon, 'needs_matrix', False):
+                H = nlp.hess(self.x, nlp.pi0)
+            if precon is not None:
+                precon.update(H)
+                store = getattr(precon, 'store', None)
+            if not isinstance(H, np.ndarray) and \
+                    (sp is None or not sp.issparse(H)):
+                H = nlp.hop(self.x, nlp.pi0)
+            qp = QPModel(self.g, H)
             self.solver = TrustRegionSolver(qp, self.tr_solver)
             self.solver.solve(prec=self.precon,
                               radius=self.tr.radius,
-                              reltol=cgtol)
+                              reltol=cgtol, store=store)
 
             step = self.solver.step
             snorm = self.solver.step_norm
@@ -88,3 +88,48 @@ def memoize_cheap(fcn):
         return _cached_value[0]
 
     return _memoized_fcn
+
+
+def memoize_point(size=2):
+    """Cache the values of a method at its `size` most recent points.
+
+    The point is the first argument of the method and is compared by value.
+    The method is evaluated at a private copy of the point, so that the
+    cached value does not change if the caller modifies its array in place.
+    Calls with further arguments bypass the cache.
+
+    The cache is stored on the instance. Use :func:`invalidate_point_cache`
+    to discard it, e.g., when the function the method depends on changes.
+    """
+    def decorator(fcn):
+
+        @functools.wraps(fcn)
+        def _memoized_fcn(self, x, *args, **kwargs):
+            if args or kwargs:
+                return fcn(self, x, *args, **kwargs)
+            caches = self.__dict__.setdefault('_point_cache', {})
+            cache = caches.setdefault(fcn, [])
+            for k, (xk, value) in enumerate(cache):
+                if np.array_equal(xk, x):
+                    if k > 0:
+                        cache.insert(0, cache.pop(k))
+                    return value
+            xk = np.array(x, copy=True)
+            value = fcn(self, xk)
+            cache.insert(0, (xk, value))
+            del cache[size:]
+            return value
+
+        return _memoized_fcn
+    return decorator
+
+
+def invalidate_point_cache(obj, name=None):
+    """Discard the values cached by :func:`memoize_point` for `obj`.
+
+    If `name` is given, only the cache of that method is discarded.
+    """
+    caches = obj.__dict__.get('_point_cache', {})
+    for fcn in caches.keys():
+        if name is None or fcn.__name__ == name:
+            del caches[fcn]
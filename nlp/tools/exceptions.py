@@ -47,3 +47,9 @@ class LineSearchFailure(Exception):
     """Exception raised when a linesearch fails."""
 
     pass
+
+
+class AmplError(Exception):
+    """Error raised when AMPL fails to process a model."""
+
+    pass
@@ -0,0 +1,435 @@
+"""Backend-neutral sparse matrices and symmetric factorizations.
+
+The solvers of NLP.py only require a few operations on explicit sparse
+matrices: assembling a matrix from coordinate triplets and from blocks of
+other matrices, overwriting values, scaling rows and columns, products with
+vectors, and factorizing symmetric matrices. :class:`SparseMatrix` implements
+those operations with Numpy arrays and converts to and from SciPy, PySparse
+and CySparse matrices. :func:`factorize_symmetric` factorizes a symmetric
+matrix with MA57 or MA27 if HSL is available, and with SciPy's SuperLU
+otherwise.
+"""
+
+import numpy as np
+from scipy import sparse as sp
+from scipy.sparse import linalg as spla
+
+try:
+    from hsl.solvers.pyma57 import PyMa57Solver as HSLSolver
+except ImportError:
+    try:
+        from hsl.solvers.pyma27 import PyMa27Solver as HSLSolver
+    except ImportError:
+        HSLSolver = None
+
+__docformat__ = 'restructuredtext'
+
+
+def is_symmetric(A):
+    """Return `True` if only one triangle of `A` is stored."""
+    if isinstance(A, SparseMatrix):
+        return A.symmetric
+    if hasattr(A, 'matrix'):                # PysparseMatrix
+        A = A.matrix
+    if hasattr(A, 'issym'):                 # PySparse ll_mat
+        return bool(A.issym)
+    if hasattr(A, 'is_symmetric'):          # CySparse
+        return bool(A.is_symmetric)
+    return False
+
+
+def coord(A):
+    """Return the coordinate triplets `(vals, rows, cols)` of `A`.
+
+    `A` may be a :class:`SparseMatrix`, a SciPy sparse matrix, a dense Numpy
+    array, a PySparse or CySparse matrix, or a tuple `(vals, rows, cols)`.
+    Only one triangle of matrices with symmetric storage is returned. Values
+    are returned as float64 and indices as int64 arrays.
+    """
+    if isinstance(A, tuple):
+        vals, rows, cols = A
+    elif isinstance(A, SparseMatrix):
+        vals, rows, cols = A.find()
+    elif sp.issparse(A):
+        A = A.tocoo()
+        vals, rows, cols = A.data, A.row, A.col
+    elif isinstance(A, np.ndarray):
+        rows, cols = np.nonzero(A)
+        vals = A[rows, cols]
+    elif hasattr(A, 'find'):
+        vals, rows, cols = A.find()
+    else:
+        raise TypeError('Cannot convert %s to coordinate format' % type(A))
+    return (np.asarray(vals, dtype=np.float64).ravel(),
+            np.asarray(rows, dtype=np.int64).ravel(),
+            np.asarray(cols, dtype=np.int64).ravel())
+
+
+class SparseMatrix(object):
+    """A sparse matrix in coordinate format with value updates.
+
+    Nonzero elements are stored in three arrays of values, row indices and
+    column indices. A sorted index of the positions is maintained so that
+    values can be overwritten in place by :meth:`put` at the cost of a binary
+    search. New positions are appended to the storage. This mimics the
+    `put` and `find` interface of PySparse matrices so that a matrix whose
+    sparsity pattern is fixed can be updated cheaply at each iteration of a
+    solver.
+
+    If `symmetric` is `True`, only the lower triangle is stored. Elements
+    put in the upper triangle are stored at the symmetric position.
+    """
+
+    # Let Numpy defer to our reflected operators, e.g., in `y * A`.
+    __array_ufunc__ = None
+
+    def __init__(self, shape, symmetric=False):
+        """Instantiate an empty sparse matrix of the given shape."""
+        nrow, ncol = shape
+        if symmetric and nrow != ncol:
+            raise ValueError('A symmetric matrix must be square')
+        self._shape = (int(nrow), int(ncol))
+        self.symmetric = symmetric
+        self.vals = np.empty(0, dtype=np.float64)
+        self.rows = np.empty(0, dtype=np.int64)
+        self.cols = np.empty(0, dtype=np.int64)
+        self._keys = None    # Sorted keys of stored positions.
+        self._perm = None    # Storage location of each sorted key.
+
+    @classmethod
+    def from_matrix(cls, A, symmetric=False, shape=None):
+        """Convert `A` to a :class:`SparseMatrix`.
+
+        `A` may be given in any format understood by :func:`coord`. If
+        `symmetric` is `True`, `A` is assumed to be symmetric and only its
+        lower triangle is kept.
+        """
+        if shape is None:
+            shape = A.shape
+        M = cls(shape, symmetric=symmetric)
+        vals, rows, cols = coord(A)
+        if symmetric and not is_symmetric(A):
+            lower = rows >= cols
+            vals, rows, cols = vals[lower], rows[lower], cols[lower]
+        M.put(vals, rows, cols)
+        return M
+
+    @property
+    def shape(self):
+        """Matrix shape."""
+        return self._shape
+
+    @property
+    def nnz(self):
+        """Number of stored elements."""
+        return self.vals.size
+
+    def _index(self):
+        if self._keys is None:
+            keys = self.rows * self._shape[1] + self.cols
+            self._perm = np.argsort(keys, kind='mergesort')
+            self._keys = keys[self._perm]
+        return self._keys, self._perm
+
+    def _lookup(self, keys):
+        """Return the storage location of `keys`, or -1 if not stored."""
+        skeys, perm = self._index()
+        pos = np.searchsorted(skeys, keys)
+        found = pos < skeys.size
+        found[found] = skeys[pos[found]] == keys[found]
+        loc = -np.ones(keys.size, dtype=np.int64)
+        loc[found] = perm[pos[found]]
+        return loc
+
+    def _positions(self, rows, cols):
+        rows = np.asarray(rows, dtype=np.int64).ravel()
+        cols = rows if cols is None else \
+            np.asarray(cols, dtype=np.int64).ravel()
+        if rows.size == 1 and cols.size > 1:
+            rows = np.repeat(rows, cols.size)
+        elif cols.size == 1 and rows.size > 1:
+            cols = np.repeat(cols, rows.size)
+        if rows.size != cols.size:
+            raise ValueError('Row and column indices must have equal length')
+        if rows.size > 0:
+            nrow, ncol = self._shape
+            if rows.min() < 0 or rows.max() >= nrow or \
+                    cols.min() < 0 or cols.max() >= ncol:
+                raise IndexError('Index out of range')
+        if self.symmetric:
+            upper = rows < cols
+            rows, cols = np.where(upper, cols, rows), np.where(upper, rows,
+                                                               cols)
+        return rows, cols
+
+    def put(self, vals, rows, cols=None):
+        """Set the elements at positions `(rows[k], cols[k])` to `vals[k]`.
+
+        `vals` may be a scalar. If `cols` is `None`, elements are set on the
+        diagonal. If a position appears several times, the last value is
+        kept.
+        """
+        rows, cols = self._positions(rows, cols)
+        k = rows.size
+        if k == 0:
+            return
+        values = np.empty(k, dtype=np.float64)
+        values[:] = vals
+        keys = rows * self._shape[1] + cols
+
+        # Keep the last occurrence of each position.
+        if k > 1:
+            _, first = np.unique(keys[::-1], return_index=True)
+            last = k - 1 - first
+            if last.size < k:
+                keys, rows, cols, values = (keys[last], rows[last],
+                                            cols[last], values[last])
+
+        loc = self._lookup(keys)
+        old = loc >= 0
+        self.vals[loc[old]] = values[old]
+        if not np.all(old):
+            new = ~old
+            self.vals = np.concatenate((self.vals, values[new]))
+            self.rows = np.concatenate((self.rows, rows[new]))
+            self.cols = np.concatenate((self.cols, cols[new]))
+            self._keys = self._perm = None
+
+    def put_block(self, A, row_offset=0, col_offset=0, scale=1.0):
+        """Copy `scale * A` into the block starting at the given offsets.
+
+        `A` may be given in any format understood by :func:`coord`.
+        """
+        vals, rows, cols = coord(A)
+        self.put(scale * vals, rows + row_offset, cols + col_offset)
+
+    def take(self, rows, cols=None):
+        """Return the elements at positions `(rows[k], cols[k])`.
+
+        If `cols` is `None`, diagonal elements are returned.
+        """
+        rows, cols = self._positions(rows, cols)
+        loc = self._lookup(rows * self._shape[1] + cols)
+        vals = np.zeros(rows.size, dtype=np.float64)
+        vals[loc >= 0] = self.vals[loc[loc >= 0]]
+        return vals
+
+    def find(self):
+        """Return copies of the coordinate triplets `(vals, rows, cols)`."""
+        return (self.vals.copy(), self.rows.copy(), self.cols.copy())
+
+    def row_scale(self, d):
+        """Scale the i-th row by `d[i]` in place."""
+        self.vals *= d[self.rows]
+
+    def col_scale(self, d):
+        """Scale the j-th column by `d[j]` in place."""
+        self.vals *= d[self.cols]
+
+    def copy(self):
+        """Return a copy of this matrix."""
+        M = SparseMatrix(self._shape, symmetric=self.symmetric)
+        M.vals, M.rows, M.cols = self.find()
+        return M
+
+    def _full(self):
+        """Return triplets of both triangles for symmetric matrices."""
+        if not self.symmetric:
+            return self.vals, self.rows, self.cols
+        off = self.rows != self.cols
+        return (np.concatenate((self.vals, self.vals[off])),
+                np.concatenate((self.rows, self.cols[off])),
+                np.concatenate((self.cols, self.rows[off])))
+
+    def matvec(self, x):
+        """Return the matrix-vector product with `x`."""
+        nrow, ncol = self._shape
+        x = np.asarray(x)
+        if x.shape != (ncol,):
+            raise ValueError('Shapes are inconsistent')
+        vals, rows, cols = self._full()
+        return np.bincount(rows, weights=vals * x[cols], minlength=nrow)
+
+    def rmatvec(self, y):
+        """Return the product of the transpose with `y`."""
+        if self.symmetric:
+            return self.matvec(y)
+        nrow, ncol = self._shape
+        y = np.asarray(y)
+        if y.shape != (nrow,):
+            raise ValueError('Shapes are inconsistent')
+        return np.bincount(self.cols, weights=self.vals * y[self.rows],
+                           minlength=ncol)
+
+    def __mul__(self, x):
+        if np.isscalar(x):
+            M = self.copy()
+            M.vals *= x
+            return M
+        return self.matvec(x)
+
+    def __rmul__(self, y):
+        if np.isscalar(y):
+            return self.__mul__(y)
+        return self.rmatvec(y)
+
+    def __neg__(self):
+        return self.__mul__(-1.0)
+
+    @property
+    def T(self):
+        """Transpose of this matrix."""
+        if self.symmetric:
+            return self
+        M = SparseMatrix(self._shape[::-1])
+        M.vals, M.rows, M.cols = self.vals, self.cols, self.rows
+        return M
+
+    def norm(self, ord='fro'):
+        """Return the Frobenius, 1- or infinity-norm of this matrix."""
+        vals, rows, cols = self._full()
+        if ord == 'fro':
+            return np.sqrt(np.dot(vals, vals))
+        if ord == 1:
+            sums = np.bincount(cols, weights=np.abs(vals),
+                               minlength=self._shape[1])
+        elif ord == np.inf:
+            sums = np.bincount(rows, weights=np.abs(vals),
+                               minlength=self._shape[0])
+        else:
+            raise ValueError('Unknown norm %r' % ord)
+        return np.max(sums) if sums.size > 0 else 0.0
+
+    def to_scipy(self, format='csr'):
+        """Convert to a SciPy sparse matrix.
+
+        Both triangles of symmetric matrices are stored in the result.
+        `format` is any format understood by SciPy's `asformat()`.
+        """
+        vals, rows, cols = self._full()
+        A = sp.coo_matrix((vals, (rows, cols)), shape=self._shape)
+        return A.asformat(format)
+
+    def to_pysparse(self):
+        """Convert to a `PysparseMatrix`."""
+        from pysparse.sparse.pysparseMatrix import PysparseMatrix
+        nrow, ncol = self._shape
+        A = PysparseMatrix(nrow=nrow, ncol=ncol, sizeHint=max(self.nnz, 1),
+                           symmetric=self.symmetric)
+        A.put(self.vals, self.rows, self.cols)
+        return A
+
+    def __repr__(self):
+        return '<%dx%d %sSparseMatrix with %d stored elements>' % (
+            self._shape[0], self._shape[1],
+            'symmetric ' if self.symmetric else '', self.nnz)
+
+
+class SuperLUContext(object):
+    """Factorization of a symmetric matrix with SciPy's SuperLU.
+
+    This class exposes the subset of the interface of the HSL `LBLContext`
+    classes used in NLP.py. SuperLU does not reveal the inertia of the matrix,
+    so that `neig` is always `None`. The condition number estimates `cond`
+    and `cond2`, and the error estimate `dirError` are not computed either.
+    If the matrix is singular, `isFullRank` is set to `False` and systems are
+    solved in the least-squares sense.
+    """
+
+    def __init__(self, K, **kwargs):
+        """Factorize the symmetric matrix `K`.
+
+        `K` should be a :class:`SparseMatrix` with symmetric storage. Keyword
+        arguments are accepted for compatibility with HSL and ignored.
+        """
+        self.neig = None
+        self.cond = self.cond2 = self.dirError = None
+        self.factorize(K)
+
+    def factorize(self, K):
+        """Factorize `K`, which should have the same shape as before."""
+        self.K = K.to_scipy('csc')
+        try:
+            self.lu = spla.splu(self.K)
+            self.isFullRank = True
+        except RuntimeError:                # Matrix is exactly singular.
+            self.lu = None
+            self.isFullRank = False
+        self.x = None
+        self.residual = None
+        self.berr = self.berr2 = self.relRes = None
+        self.matNorm = self.xNorm = None
+
+    def _solve(self, rhs):
+        if self.lu is not None:
+            return self.lu.solve(rhs)
+        return spla.lsqr(self.K, rhs, atol=1.0e-12, btol=1.0e-12)[0]
+
+    def _stats(self, rhs):
+        r = np.abs(self.residual)
+        absK = abs(self.K)
+        self.matNorm = np.max(absK * np.ones(absK.shape[1])) \
+            if absK.nnz else 0.0
+        self.xNorm = np.max(np.abs(self.x)) if self.x.size else 0.0
+        scale = absK * np.abs(self.x) + np.abs(rhs)
+        nz = scale > 0
+        self.berr = np.max(r[nz] / scale[nz]) if np.any(nz) else 0.0
+        self.berr2 = 0.0
+        denom = self.matNorm * self.xNorm + \
+            (np.max(np.abs(rhs)) if rhs.size else 0.0)
+        self.relRes = np.max(r) / denom if denom > 0 else 0.0
+
+    def solve(self, rhs, get_resid=True):
+        """Solve the system with right-hand side `rhs`.
+
+        The solution is stored in `x` and the residual in `residual`.
+        """
+        self.x = self._solve(rhs)
+        self.residual = rhs - self.K * self.x
+        self._stats(rhs)
+
+    def refine(self, rhs, tol=1.0e-8, nitref=3, **kwargs):
+        """Perform at most `nitref` steps of iterative refinement.
+
+        Iterative refinement stops as soon as the componentwise backward
+        error falls under `tol`.
+        """
+        for _ in range(nitref):
+            if self.berr <= tol:
+                break
+            self.x += self._solve(self.residual)
+            self.residual = rhs - self.K * self.x
+            self._stats(rhs)
+
+
+class HSLContext(object):
+    """Factorization of a symmetric :class:`SparseMatrix` with MA57/MA27."""
+
+    def __init__(self, K, **kwargs):
+        self.solver = HSLSolver(K.to_pysparse(), **kwargs)
+
+    def factorize(self, K):
+        """Factorize `K`, which should have the same pattern as before."""
+        self.solver.factorize(K.to_pysparse())
+
+    def __getattr__(self, name):
+        return getattr(self.solver, name)
+
+
+def factorize_symmetric(K, **kwargs):
+    """Factorize the symmetric matrix `K`.
+
+    `K` may be given in any format understood by :func:`coord`. MA57 or MA27
+    is used if HSL and PySparse are available, and SuperLU otherwise. The
+    result supports `factorize()`, `solve()` and `refine()`, and exposes the
+    solution `x`, the `residual` and `isFullRank` as HSL does. Keyword
+    arguments are passed to HSL.
+    """
+    if not isinstance(K, SparseMatrix):
+        K = SparseMatrix.from_matrix(K, symmetric=True)
+    if HSLSolver is not None:
+        try:
+            return HSLContext(K, **kwargs)
+        except ImportError:                 # PySparse is not installed.
+            pass
+    return SuperLUContext(K, **kwargs)
@@ -0,0 +1,274 @@
+"""An array-based sparse vector class.
+
+Unlike the dictionary-based :class:`nlp.tools.sparse_vector_class.SparseVector`,
+:class:`SparseVector` stores its nonzero elements in two Numpy arrays: a
+sorted array of int32 indices and an array of float64 values. All operations
+are vectorized.
+"""
+
+import numpy as np
+
+__docformat__ = 'restructuredtext'
+
+
+class SparseVector(object):
+    """A sparse vector stored as sorted index and value arrays.
+
+    To initialize a sparse vector in R^1000 with nonzero elements at
+    (0-based) indices 1, 10 and 100, use, e.g.,
+
+        v = SparseVector(1000, [1, 10, 100], [0.1, 0.01, 0.001])
+
+    Indices need not be sorted. Values associated with duplicate indices are
+    summed. To initialize an empty sparse vector, use
+
+        v = SparseVector(1000)
+    """
+
+    # Let Numpy defer to our reflected operators, e.g., in `x + v`.
+    __array_ufunc__ = None
+
+    def __init__(self, n, indices=None, values=None, **kwargs):
+        """Initialize a sparse vector of size `n`.
+
+        :keywords:
+            :check: set to `False` if `indices` are known to be sorted and
+                    free of duplicates and `values` are float64 arrays of
+                    the same length as `indices` (default: `True`).
+        """
+        n = int(n)
+        if n < 0:
+            raise ValueError("Vector size must be nonnegative")
+        self._n = n
+
+        if indices is None:
+            self.indices = np.empty(0, dtype=np.int32)
+            self.values = np.empty(0, dtype=np.float64)
+            return
+
+        if not kwargs.get('check', True):
+            self.indices = indices
+            self.values = values
+            return
+
+        indices = np.asarray(indices, dtype=np.int32).ravel()
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if indices.shape != values.shape:
+            raise ValueError("Indices and values must have the same length")
+        if indices.size > 0 and (indices.min() < 0 or indices.max() >= n):
+            raise IndexError("Index out of range")
+
+        if indices.size > 1 and np.any(indices[1:] <= indices[:-1]):
+            indices, inverse = np.unique(indices, return_inverse=True)
+            merged = np.zeros(indices.size, dtype=np.float64)
+            np.add.at(merged, inverse, values)
+            values = merged
+            indices = indices.astype(np.int32)
+
+        self.indices = indices
+        self.values = values
+
+    @classmethod
+    def from_array(cls, x):
+        """Build a sparse vector from the nonzero elements of a Numpy array."""
+        x = np.asarray(x, dtype=np.float64).ravel()
+        indices = np.flatnonzero(x).astype(np.int32)
+        return cls(x.size, indices, x[indices], check=False)
+
+    @classmethod
+    def from_dict(cls, n, d):
+        """Build a sparse vector of size `n` from a dictionary."""
+        indices = np.fromiter(d.keys(), dtype=np.int32, count=len(d))
+        values = np.fromiter(d.values(), dtype=np.float64, count=len(d))
+        return cls(n, indices, values)
+
+    @classmethod
+    def from_scipy(cls, s):
+        """Build a sparse vector from a SciPy sparse row or column vector."""
+        if min(s.shape) != 1:
+            raise ValueError("SciPy matrix must have a single row or column")
+        s = s.tocoo()
+        indices = s.col if s.shape[0] == 1 else s.row
+        return cls(max(s.shape), indices, s.data)
+
+    @property
+    def n(self):
+        """Vector size."""
+        return self._n
+
+    @property
+    def shape(self):
+        """Vector shape."""
+        return (self._n,)
+
+    @property
+    def nnz(self):
+        """Number of stored elements."""
+        return self.indices.size
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._n
+        if index < 0 or index >= self._n:
+            raise IndexError("Index out of range")
+        k = np.searchsorted(self.indices, index)
+        if k < self.indices.size and self.indices[k] == index:
+            return self.values[k]
+        return 0.0
+
+    def copy(self):
+        """Return a copy of this sparse vector."""
+        return SparseVector(self._n, self.indices.copy(), self.values.copy(),
+                            check=False)
+
+    def _check_size(self, other):
+        if other.shape[0] != self._n:
+            raise ValueError("Vector sizes do not match")
+
+    def __neg__(self):
+        return SparseVector(self._n, self.indices, -self.values, check=False)
+
+    def __add__(self, other):
+        """Add a sparse vector or a Numpy array.
+
+        The sum of two sparse vectors is sparse. The sum of a sparse vector and
+        a Numpy array is a Numpy array.
+        """
+        if isinstance(other, SparseVector):
+            self._check_size(other)
+            return SparseVector(self._n,
+                                np.concatenate((self.indices, other.indices)),
+                                np.concatenate((self.values, other.values)))
+        if isinstance(other, np.ndarray):
+            self._check_size(other)
+            rv = other.astype(np.float64)
+            rv[self.indices] += self.values
+            return rv
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, (SparseVector, np.ndarray)):
+            return self.__add__(-other)
+        return NotImplemented
+
+    def __rsub__(self, other):
+        if isinstance(other, np.ndarray):
+            return (-self).__add__(other)
+        return NotImplemented
+
+    def __mul__(self, other):
+        """Element by element multiplication.
+
+        For dot product, see :meth:`dot`.
+        """
+        if np.isscalar(other):
+            return SparseVector(self._n, self.indices, other * self.values,
+                                check=False)
+        if isinstance(other, SparseVector):
+            self._check_size(other)
+            indices, i, j = self._intersect(other)
+            return SparseVector(self._n, indices,
+                                self.values[i] * other.values[j], check=False)
+        if isinstance(other, np.ndarray):
+            self._check_size(other)
+            return SparseVector(self._n, self.indices,
+                                self.values * other[self.indices], check=False)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __imul__(self, other):
+        if np.isscalar(other):
+            self.values *= other
+            return self
+        if isinstance(other, np.ndarray):
+            self._check_size(other)
+            self.values *= other[self.indices]
+            return self
+        return NotImplemented
+
+    def __div__(self, other):
+        if np.isscalar(other):
+            return SparseVector(self._n, self.indices, self.values / other,
+                                check=False)
+        return NotImplemented
+
+    __truediv__ = __div__
+
+    def __idiv__(self, other):
+        if np.isscalar(other):
+            self.values /= other
+            return self
+        return NotImplemented
+
+    __itruediv__ = __idiv__
+
+    def _intersect(self, other):
+        """Return common indices and their positions in self and other."""
+        mask = np.in1d(self.indices, other.indices, assume_unique=True)
+        i = np.flatnonzero(mask)
+        indices = self.indices[i]
+        j = np.searchsorted(other.indices, indices)
+        return indices, i, j
+
+    def dot(self, other):
+        """Dot product with a sparse vector or a Numpy array."""
+        if isinstance(other, SparseVector):
+            self._check_size(other)
+            _, i, j = self._intersect(other)
+            return np.dot(self.values[i], other.values[j])
+        other = np.asarray(other)
+        self._check_size(other)
+        return np.dot(self.values, other[self.indices])
+
+    def norm(self, ord=2):
+        """Return the `ord`-norm of this sparse vector.
+
+        `ord` may be any positive number or `np.inf`.
+        """
+        if self.nnz == 0:
+            return 0.0
+        if ord == 2:
+            return np.sqrt(np.dot(self.values, self.values))
+        if ord == np.inf:
+            return np.max(np.abs(self.values))
+        if ord <= 0:
+            raise ValueError("Norm order must be positive")
+        return np.linalg.norm(self.values, ord)
+
+    def to_array(self):
+        """Convert sparse vector to (dense) Numpy array."""
+        rv = np.zeros(self._n, dtype=np.float64)
+        rv[self.indices] = self.values
+        return rv
+
+    def to_dict(self):
+        """Convert sparse vector to a dictionary."""
+        return dict(zip(self.indices.tolist(), self.values.tolist()))
+
+    def to_scipy(self, format='csr'):
+        """Convert sparse vector to a 1-by-n SciPy sparse matrix.
+
+        `format` is any format understood by SciPy's `asformat()`.
+        """
+        import scipy.sparse as sp
+        indptr = np.array([0, self.nnz], dtype=np.int32)
+        s = sp.csr_matrix((self.values, self.indices, indptr),
+                          shape=(1, self._n))
+        return s.asformat(format)
+
+    def __repr__(self):
+        return 'SparseVector(%d, %r, %r)' % (self._n, self.indices.tolist(),
+                                             self.values.tolist())
+
+    def __str__(self):
+        s = ' Sparse Vector of size %-d, %-d nonzeros\n' % (self._n, self.nnz)
+        s += ' Values:\n'
+        for k, v in zip(self.indices, self.values):
+            s += '  %-5d\t%-g\n' % (k, v)
+        return s
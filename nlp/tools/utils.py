@@ -6,6 +6,11 @@ import logging
 from math import copysign, sqrt
 from nlp.tools.norms import norm2
 
+try:
+    from scipy.linalg import blas
+except ImportError:
+    blas = None
+
 
 def Max(a):
     """A safeguarded max function. Returns -infinity for empty arrays."""
@@ -139,6 +144,32 @@ def to_boundary(x, p, delta, xx=None):
     return sigma
 
 
+def axpy(a, x, y):
+    """Overwrite y with a * x + y without allocating a temporary.
+
+    The BLAS routine is used for contiguous double-precision arrays.
+    """
+    if blas is not None and y.dtype == np.float64 and \
+            x.dtype == np.float64 and y.flags.c_contiguous and \
+            x.flags.c_contiguous:
+        blas.daxpy(x, y, a=a)
+    else:
+        y += a * x
+    return y
+
+
+def matvec(H, v, out):
+    """Store the product of H with v into out.
+
+    Numpy arrays write the product directly into `out`. Other linear
+    operators return a new vector that is copied into `out`.
+    """
+    if isinstance(H, np.ndarray):
+        return np.dot(H, v, out=out)
+    out[...] = H * v
+    return out
+
+
 def projected_gradient_norm2(x, g, l, u):
     """Compute the Euclidean norm of the projected gradient at x."""
     lower = where(x == l)
@@ -164,6 +195,23 @@ def projected_step(x, d, l, u):
     return project(x + d, l, u) - x
 
 
+def breakpoint_steps(x, d, l, u):
+    """Return the steps t at which each component of x + t d reaches a bound.
+
+    We assume that x is feasible. Components along which d is zero, or that
+    move towards an infinite bound, are assigned an infinite step.
+    Components already on the bound that d points to have a zero step.
+    """
+    steps = np.empty(x.shape)
+    steps.fill(np.inf)
+    pos = d > 0
+    neg = d < 0
+    with np.errstate(invalid='ignore'):
+        steps[pos] = (u[pos] - x[pos]) / d[pos]
+        steps[neg] = (l[neg] - x[neg]) / d[neg]
+    return steps
+
+
 def breakpoints(x, d, l, u):
     """Find the smallest and largest breakpoints on the half line x + t d.
 
@@ -243,10 +291,8 @@ def evaluate_model_methods_at_starting_point(model):
             ci = model.icons(i, x0)
             print ('c%d(x0) = %-g' % (i, ci))
             sgi = model.sigrad(i, x0)
-            k = sgi.keys()
-            ssgi = {}
-            for j in range(min(5, len(k))):
-                ssgi[k[j]] = sgi[k[j]]
+            ssgi = dict(zip(sgi.indices[:5].tolist(),
+                            sgi.values[:5].tolist()))
             print ('∇c%d(x0) = ' % i, ssgi)
     
     print()
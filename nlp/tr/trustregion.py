@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Class definition for Trust-Region Algorithm and Management."""
 
+from collections import deque
 import numpy as np
 
 __docformat__ = 'restructuredtext'
@@ -19,10 +20,20 @@ class TrustRegion(object):
             :eta2:          Radius increase threshold   (default: 0.99)
             :gamma1:        Radius decrease factor      (default: 1/3)
             :gamma2:        Radius increase factor      (default: 2.5)
+            :warm_start:    start each solve from the radius of the last
+                            successful step of the previous solve
+                                                        (default: False)
 
         Subclass and override :meth:`update_radius` to implement custom
         trust-region management rules.
 
+        The same instance may be shared by successive solves, for instance
+        the inner solves of an augmented Lagrangian method. With
+        `warm_start=True`, :meth:`initialize` then skips the radius chosen
+        by the solver in favor of the last radius that led to a successful
+        step, which avoids rejected steps while the radius shrinks back to
+        its previous value.
+
         See, e.g.,
 
         A. R. Conn, N. I. M. Gould and Ph. L. Toint, Trust-Region Methods,
@@ -35,6 +46,20 @@ class TrustRegion(object):
         self.gamma1 = kwargs.get('gamma1', 1.0 / 3)  # Radius decrease factor
         self.gamma2 = kwargs.get('gamma2', 2.5)    # Radius increase factor
         self.eps = np.finfo(np.double).eps  # Machine epsilon.
+        self.warm_start = kwargs.get('warm_start', False)
+        self.radius_success = None  # Radius after the last successful step.
+
+    def initialize(self, radius):
+        """Set the radius at the start of a solve.
+
+        `radius` is the initial radius chosen by the solver. It is replaced
+        by the radius recorded after the last successful step of a previous
+        solve if `warm_start` is set.
+        """
+        if self.warm_start and self.radius_success is not None:
+            self.radius = self.radius_success
+        else:
+            self.radius = radius
 
     def ratio(self, f, f_trial, m, check_positive=True):
         """Compute the ratio of actual versus predicted reduction.
@@ -64,9 +89,11 @@ class TrustRegion(object):
         """
         if ratio < self.eta1:
             self.radius = self.gamma1 * step_norm
-        elif ratio >= self.eta2:
-            self.radius = min(max(self.radius, self.gamma2 * step_norm),
-                              self.radius_max)
+        else:
+            if ratio >= self.eta2:
+                self.radius = min(max(self.radius, self.gamma2 * step_norm),
+                                  self.radius_max)
+            self.radius_success = self.radius
 
     def reset_radius(self):
         """Reset radius to original value."""
@@ -87,6 +114,9 @@ class GeneralizedTrustRegion(TrustRegion):
 
         :keywords:
             :radius:        Initial trust-region radius (default: 1.0)
+            :warm_start:    start each solve from the radius of the last
+                            successful step of the previous solve
+                                                        (default: False)
         """
         self.radius = self.radius0 = kwargs.get('radius', 1.0)
         self.radius_max = 1.0e+10
@@ -97,6 +127,8 @@ class GeneralizedTrustRegion(TrustRegion):
         self.gamma2 = 0.5
         self.gamma3 = 4.0
         self.eps = np.finfo(np.double).eps  # Machine epsilon.
+        self.warm_start = kwargs.get('warm_start', False)
+        self.radius_success = None
 
     def update_radius(self, ratio, step_norm, alpha):
         u"""Update the trust-region radius.
@@ -112,6 +144,7 @@ class GeneralizedTrustRegion(TrustRegion):
         if ratio <= self.eta0:
             self.radius = min(max(alpha, self.gamma1) * step_norm,
                               self.gamma2 * self.radius)
+            return
         elif ratio <= self.eta1:
             self.radius = max(self.gamma1 * self.radius,
                               min(alpha * step_norm,
@@ -123,6 +156,104 @@ class GeneralizedTrustRegion(TrustRegion):
         else:
             self.radius = max(self.radius, min(alpha * step_norm,
                                                self.gamma3 * self.radius))
+        self.radius_success = self.radius
+
+
+class AdaptiveTrustRegion(GeneralizedTrustRegion):
+    u"""Trust-region management based on the history of the step quality.
+
+    The rule of :class:`GeneralizedTrustRegion` is modified in two ways.
+
+    * The expansion factor γ3 is replaced by a factor γ ∈ [γmin, γ3]. It is
+      reduced to max(γmin, √γ) when a step is rejected right after the
+      radius was increased, so that the radius stops oscillating, and
+      raised to min(γ3, γ²) after `memory` consecutive very successful
+      steps, the last of which reached the boundary of the trust region.
+    * After k consecutive rejected steps, the radius is reduced by γ2ᵏ
+      instead of γ2, so that a radius much too large is corrected in fewer
+      function evaluations.
+
+    A step lies on the boundary if step_norm ≥ (1 - `boundary_tol`) × radius.
+
+    The interface is that of :class:`GeneralizedTrustRegion`. When
+    `alpha` is not supplied to :meth:`update_radius`, it is set to γ3.
+    """
+
+    def __init__(self, **kwargs):
+        """Instantiate an object allowing management of a trust region.
+
+        :keywords:
+            :radius:        Initial trust-region radius (default: 1.0)
+            :memory:        number of ratios retained   (default: 3)
+            :gamma_min:     smallest expansion factor   (default: 1.5)
+            :boundary_tol:  relative distance of a step to the boundary
+                            below which it lies on the boundary
+                                                        (default: 0.1)
+            :warm_start:    start each solve from the radius of the last
+                            successful step of the previous solve
+                                                        (default: False)
+        """
+        super(AdaptiveTrustRegion, self).__init__(**kwargs)
+        self.memory = kwargs.get('memory', 3)
+        self.gamma_min = kwargs.get('gamma_min', 1.5)
+        self.boundary_tol = kwargs.get('boundary_tol', 0.1)
+        self.gamma = self.gamma3
+        self.history = deque(maxlen=self.memory)
+        self.nreject = 0       # Number of consecutive rejected steps.
+        self.expanded = False  # Whether the last update increased radius.
+
+    def initialize(self, radius):
+        """Set the radius at the start of a solve and clear the history."""
+        super(AdaptiveTrustRegion, self).initialize(radius)
+        self.gamma = self.gamma3
+        self.history.clear()
+        self.nreject = 0
+        self.expanded = False
+
+    def update_radius(self, ratio, step_norm, alpha=None):
+        u"""Update the trust-region radius.
+
+        The rule implemented by this method is:
+
+        radius = min(max(α, γ1) * step_norm, γ2ᵏ*radius)     if ratio <= η0
+        radius = max(γ1*radius, min(α*step_norm, γ2*radius)) if ratio ∈ (η0,η1]
+        radius = max(γ1*radius, min(α*step_norm, γ*radius))  if ratio ∈ (η1,η2]
+        radius = max(radius, min(α*step_norm, γ*radius))     if ratio > η2,
+
+        where k is the number of consecutive rejected steps.
+        """
+        if alpha is None:
+            alpha = self.gamma3
+        radius = self.radius
+        boundary = step_norm >= (1 - self.boundary_tol) * radius
+        self.history.append(ratio)
+
+        if ratio <= self.eta0:
+            self.nreject += 1
+            if self.expanded:
+                self.gamma = max(self.gamma_min, np.sqrt(self.gamma))
+            self.radius = min(max(alpha, self.gamma1) * step_norm,
+                              self.gamma2**self.nreject * radius)
+            self.expanded = False
+            return
+
+        self.nreject = 0
+        if ratio <= self.eta1:
+            self.radius = max(self.gamma1 * radius,
+                              min(alpha * step_norm, self.gamma2 * radius))
+        else:
+            if ratio > self.eta2 and boundary and \
+                    len(self.history) == self.memory and \
+                    min(self.history) > self.eta2:
+                self.gamma = min(self.gamma3, self.gamma**2)
+            expand = min(alpha * step_norm, self.gamma * radius)
+            if ratio <= self.eta2:
+                self.radius = max(self.gamma1 * radius, expand)
+            else:
+                self.radius = max(radius, expand)
+        self.radius = min(self.radius, self.radius_max)
+        self.expanded = self.radius > radius
+        self.radius_success = self.radius
 
 
 class TrustRegionSolver(object):
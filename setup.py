@@ -74,6 +74,18 @@ nlp_ext.append(Extension(name="nlp.ls._modified_strong_wolfe_linesearch",
                          sources=mswls_src,
                          **mswls_params))
 
+#####################################
+# Incomplete Cholesky factorization #
+#####################################
+icfs_params = {}
+icfs_params['include_dirs'] = [np.get_include()]
+
+icfs_src = [os.path.join('nlp', 'optimize', 'src', '_icfs.c')]
+
+nlp_ext.append(Extension(name="nlp.optimize._icfs",
+                         sources=icfs_src,
+                         **icfs_params))
+
 CLASSIFIERS = """\
 Development Status :: 4 - Beta
 Intended Audience :: Science/Research
@@ -48,3 +48,25 @@ def rosenbrock_armijo_ascent(request):
 def test_c1rosenbrock_ascent(rosenbrock_armijo_ascent):
     with pytest.raises(ValueError):
         ArmijoLineSearch(rosenbrock_armijo_ascent)
+
+def test_c1rosenbrock_ref_value():
+    model = Rosenbrock(5)
+    x = np.zeros(5)
+    c1model = C1LineModel(model, x, -model.grad(x))
+    monotone = ArmijoLineSearch(c1model)
+    for step in monotone:
+        pass
+    assert monotone.step < 1
+    assert monotone.ref_value == monotone.value
+
+    # A large reference value accepts the initial step.
+    ref_value = c1model.obj(1.0) + 1
+    non_monotone = ArmijoLineSearch(c1model, ref_value=ref_value)
+    for step in non_monotone:
+        pass
+    assert non_monotone.step == 1
+    assert non_monotone.trial_value > non_monotone.value
+
+    # The reference value cannot be smaller than the initial value.
+    ls = ArmijoLineSearch(c1model, ref_value=-1.0)
+    assert ls.ref_value == ls.value
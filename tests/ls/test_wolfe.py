@@ -51,3 +51,31 @@ def rosenbrock_wolfe_ascent(request):
 def test_c1rosenbrock_ascent(rosenbrock_wolfe_ascent):
     with pytest.raises(ValueError):
         StrongWolfeLineSearch(rosenbrock_wolfe_ascent)
+
+
+def test_c1rosenbrock_search(rosenbrock_wolfe):
+    # The compiled driver visits the same steps as the iteration protocol.
+    linemodel = rosenbrock_wolfe.linemodel
+    steps = []
+    for step in StrongWolfeLineSearch(linemodel):
+        steps.append(step)
+    expected = steps[-1]
+
+    ls = StrongWolfeLineSearch(linemodel)
+    assert ls.search() == expected
+    assert ls.step == expected
+    assert np.allclose(ls.iterate, linemodel.x + expected * linemodel.d)
+    assert np.allclose(ls.trial_value, linemodel.obj(expected))
+    assert np.allclose(ls.trial_slope, linemodel.grad(expected))
+    assert ls.trial_value <= ls.value + ls.ftol * ls.step * ls.slope
+    assert abs(ls.trial_slope) <= ls.gtol * abs(ls.slope)
+
+    # The search may be completed after some iterations.
+    ls = StrongWolfeLineSearch(linemodel)
+    ls.next()
+    assert ls.search() == expected
+
+    # Once the search has terminated, search() returns the same step.
+    with pytest.raises(StopIteration):
+        ls.next()
+    assert ls.search() == expected
@@ -0,0 +1,104 @@
+"""Tests relative to the AMPL metadata cache."""
+
+import os
+import shutil
+import numpy as np
+import pytest
+from nlp.model.amplcache import AmplCache, nl_signature
+
+this_path = os.path.dirname(os.path.realpath(__file__))
+
+
+def make_metadata(n, m):
+    return {'dims': np.array([n, m, 2 * m, n, 0, 0, 0], dtype=np.int64),
+            'x0': -np.ones(n), 'pi0': np.zeros(m),
+            'Lvar': -np.inf * np.ones(n), 'Uvar': np.arange(n, dtype=float),
+            'Lcon': np.zeros(m), 'Ucon': np.inf * np.ones(m),
+            'jrows': np.repeat(np.arange(m), 2), 'jcols': np.arange(2 * m),
+            'hrows': np.arange(n), 'hcols': np.arange(n)}
+
+
+@pytest.fixture
+def nlfile(tmpdir):
+    fname = str(tmpdir.join('rosenbrock.nl'))
+    shutil.copy(os.path.join(this_path, 'rosenbrock.nl'), fname)
+    return fname
+
+
+def test_signature(nlfile):
+    sig = nl_signature(nlfile)
+    assert sig == nl_signature(os.path.join(this_path, 'rosenbrock.nl'))
+    with open(nlfile, 'a') as fp:
+        fp.write('\n')
+    assert nl_signature(nlfile) != sig
+
+
+def test_roundtrip(nlfile):
+    cache = AmplCache(nlfile)
+    assert cache.load() is None
+
+    data = make_metadata(5, 2)
+    assert cache.save(data)
+    assert os.path.isdir(os.path.join(os.path.dirname(nlfile),
+                                      'rosenbrock.nlcache', cache.key))
+
+    cached = AmplCache(nlfile).load()
+    for field in AmplCache.fields:
+        assert isinstance(cached[field], np.memmap)
+        assert np.all(cached[field] == data[field])
+
+    # Copy-on-write: modifications do not alter the cache.
+    cached['x0'][0] = 12.0
+    assert AmplCache(nlfile).load()['x0'][0] == -1.0
+
+
+def test_empty_arrays(nlfile):
+    cache = AmplCache(nlfile)
+    assert cache.save(make_metadata(3, 0))
+    cached = cache.load()
+    assert cached['pi0'].shape == (0,)
+    assert cached['jrows'].shape == (0,)
+
+
+def test_invalidation(nlfile):
+    cache = AmplCache(nlfile)
+    cache.save(make_metadata(5, 2))
+    old_path = cache.path
+
+    with open(nlfile, 'a') as fp:
+        fp.write('\n')
+    cache = AmplCache(nlfile)
+    assert cache.load() is None
+    assert cache.save(make_metadata(5, 1))
+    assert not os.path.isdir(old_path)
+    assert cache.load()['pi0'].shape == (1,)
+
+    cache.clear()
+    assert not os.path.isdir(cache.root)
+
+
+def test_cache_dir(nlfile, tmpdir):
+    cache_dir = str(tmpdir.mkdir('cache'))
+    cache = AmplCache(nlfile, cache_dir=cache_dir)
+    assert cache.save(make_metadata(5, 2))
+    assert cache.root == os.path.join(cache_dir, 'rosenbrock.nlcache')
+    assert AmplCache(nlfile, cache_dir=cache_dir).load() is not None
+    assert AmplCache(nlfile).load() is None
+
+
+def test_ampl_model(nlfile):
+    pytest.importorskip("nlp.model.amplmodel")
+    from nlp.model.amplmodel import AmplModel
+    model = AmplModel(nlfile)
+    cached = AmplModel(nlfile, cache=True)  # Creates the cache.
+    assert AmplCache(nlfile).load() is not None
+    cached = AmplModel(nlfile, cache=True)  # Loads from the cache.
+    assert cached.nnzj == model.nnzj
+    assert cached.nnzh == model.nnzh
+    assert np.all(cached.x0 == model.x0)
+    assert np.all(cached.Lvar == model.Lvar)
+    assert np.all(cached.Uvar == model.Uvar)
+    vals, rows, cols = model.hess(model.x0)
+    cvals, crows, ccols = cached.hess(cached.x0)
+    assert np.allclose(vals, cvals)
+    assert np.all(rows == crows) and np.all(cols == ccols)
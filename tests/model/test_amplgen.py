@@ -0,0 +1,114 @@
+"""Tests relative to the generation of nl files."""
+
+import os
+import stat
+import sys
+import pytest
+from nlp.model.amplgen import GenTemplate, generate_nl, generate_nl_files, \
+    nl_key
+from nlp.tools.exceptions import AmplError
+
+this_path = os.path.dirname(os.path.realpath(__file__))
+
+# A stand-in for the AMPL executable that writes the file named in the
+# `write g...` statement of the template and logs each call.
+FAKE_AMPL = """#!%s
+import sys
+template = open(sys.argv[1]).read()
+if 'fail' in template:
+    sys.stdout.write('syntax error\\n')
+    sys.exit(1)
+with open(%r, 'a') as log:
+    log.write(sys.argv[1] + '\\n')
+for line in template.splitlines():
+    if line.startswith('write g'):
+        open(line[7:-1] + '.nl', 'w').write(template)
+"""
+
+
+@pytest.fixture
+def ampl(tmpdir):
+    fname = str(tmpdir.join('ampl'))
+    with open(fname, 'w') as fp:
+        fp.write(FAKE_AMPL % (sys.executable, str(tmpdir.join('calls.log'))))
+    os.chmod(fname, os.stat(fname).st_mode | stat.S_IEXEC)
+    return fname
+
+
+def ncalls(tmpdir):
+    log = tmpdir.join('calls.log')
+    return len(log.readlines()) if log.check() else 0
+
+
+@pytest.fixture
+def model(tmpdir):
+    mod = tmpdir.join('toy.mod')
+    mod.write('var x; minimize f: (x - 1)^2;\n')
+    tmpdir.join('toy.dat').write('\n')
+    return str(mod)
+
+
+def test_template(model):
+    template = GenTemplate(model, 'toy.dat', {'presolve': 0}, stub='out')
+    lines = open(template).read().splitlines()
+    os.remove(template)
+    assert 'option presolve 0;' in lines
+    assert 'model %s;' % model in lines
+    assert 'data  toy.dat;' in lines
+    assert lines[-1] == 'write gout;'
+
+
+def test_key(model):
+    key = nl_key(model)
+    assert key == nl_key(model[:-4])
+    assert key != nl_key(model, opts=['option presolve 0'])
+    assert key != nl_key(model, data=model[:-4] + '.dat')
+
+
+def test_generate_once(model, ampl, tmpdir):
+    stub = generate_nl(model, ampl=ampl)
+    assert stub == model[:-4]
+    assert os.path.isfile(stub + '.nl')
+    assert ncalls(tmpdir) == 1
+
+    assert generate_nl(model, ampl=ampl) == stub
+    assert ncalls(tmpdir) == 1
+    generate_nl(model, ampl=ampl, force=True)
+    assert ncalls(tmpdir) == 2
+
+    # Changing the options or the model triggers regeneration.
+    generate_nl(model, opts={'presolve': 0}, ampl=ampl)
+    assert ncalls(tmpdir) == 3
+    with open(model, 'a') as fp:
+        fp.write('\n')
+    generate_nl(model, opts={'presolve': 0}, ampl=ampl)
+    assert ncalls(tmpdir) == 4
+
+
+def test_generate_data(model, ampl, tmpdir):
+    out_dir = str(tmpdir.mkdir('nl'))
+    stub = generate_nl(model, data=model[:-4] + '.dat', out_dir=out_dir,
+                       ampl=ampl)
+    assert stub == os.path.join(out_dir, 'toy_toy')
+    assert os.path.isfile(stub + '.nl')
+
+
+def test_errors(model, ampl, tmpdir):
+    with pytest.raises(AmplError):
+        generate_nl(model, opts=['fail'], ampl=ampl)
+    with pytest.raises(AmplError):
+        generate_nl(model, ampl=str(tmpdir.join('no_such_ampl')))
+
+
+def test_parallel(ampl, tmpdir):
+    models = []
+    for i in range(4):
+        mod = tmpdir.join('toy%d.mod' % i)
+        mod.write('var x; minimize f: (x - %d)^2;\n' % i)
+        models.append(str(mod))
+    stubs = generate_nl_files(models, processes=2, ampl=ampl)
+    assert stubs == [m[:-4] for m in models]
+    assert all(os.path.isfile(s + '.nl') for s in stubs)
+    assert ncalls(tmpdir) == 4
+    generate_nl_files([(m, None) for m in models], ampl=ampl)
+    assert ncalls(tmpdir) == 4
@@ -6,6 +6,7 @@ from helper import *
 import os
 import pytest
 from nlp.tools.dercheck import DerivativeChecker
+from nlp.tools.exceptions import ShapeError
 from nlp.tools.logs import config_logger
 import logging
 
@@ -428,6 +429,18 @@ class Test_AmplModelExtrasim(TestCase):
         for j in range(model.ncon):
             assert np.allclose(model.irow(j).to_array(), A[j, :])
 
+    def test_noisy(self):
+        from nlp.model.noisynlp import NoisyAmplModel
+        model = NoisyAmplModel(os.path.join(this_path, 'extrasim.nl'),
+                               noise_amplitude=1.0e-3)
+        x = model.x0
+        for noisy, exact in ((model.sgrad(x), self.model.sgrad(x)),
+                             (model.cost(), self.model.cost()),
+                             (model.sigrad(0, x), self.model.sigrad(0, x)),
+                             (model.irow(0), self.model.irow(0))):
+            assert np.all(noisy.indices == exact.indices)
+            assert np.allclose(noisy.values, exact.values, atol=1.0e-3)
+
     def test_cons_scaling(self):
         model = self.model
         log = config_logger("nlp.der",
@@ -480,3 +493,50 @@ class Test_AmplModelExtrasim(TestCase):
             assert (len(dcheck.chess_errs[j]) == 0)
 
         print( model.display_basic_info())
+
+
+@pytest.mark.parametrize("problem", ["hs007", "hs009", "hs010", "extrasim"])
+def test_ampl_jac_pos(problem):
+    pytest.importorskip("nlp.model.amplmodel")
+    model = AmplModel(os.path.join(this_path, problem + '.nl'))
+    m = model.ncon
+    x = model.x0 + 0.1
+    J = ndarray_from_coord(m, model.nvar, *model.jac(x), symmetric=False)
+    expected = np.vstack((J, -J[model.rangeC, :]))
+    expected[model.upperC, :] *= -1
+
+    Jpos = ndarray_from_coord(m + model.nrangeC, model.nvar,
+                              *model.jac_pos(x), symmetric=False)
+    assert np.allclose(Jpos, expected)
+    assert np.allclose(model.jop_pos(x).to_array(), expected)
+
+
+def test_ampl_objs():
+    pytest.importorskip("nlp.model.amplmodel")
+    model = AmplModel(os.path.join(this_path, 'hs010.nl'))
+    x = model.x0 + 0.1
+    assert model.nobj == 1
+    assert np.allclose(model.objs(x), [model.obj(x)])
+    assert np.allclose(model.grads(x), model.grad(x)[np.newaxis, :])
+
+
+def test_ampl_set_bounds():
+    pytest.importorskip("nlp.model.amplmodel")
+    model = AmplModel(os.path.join(this_path, 'hs010.nl'))
+    n, m = model.nvar, model.ncon
+    x = model.x0 + 0.1
+    c = model.cons(x)
+
+    model.set_bounds(Lvar=-np.ones(n), Uvar=np.ones(n),
+                     Lcon=-np.inf * np.ones(m), Ucon=np.arange(m, dtype=float))
+    assert model.rangeB == range(n)
+    assert model.upperC == range(m)
+    assert np.allclose(model.Ucon, np.arange(m))
+    assert np.allclose(model.cons(x), c)
+
+    model.set_bounds(Lcon=np.zeros(m), Ucon=np.zeros(m))
+    assert model.equalC == range(m)
+    assert np.allclose(model.Lvar, -1.)
+
+    with pytest.raises(ShapeError):
+        model.set_bounds(Lvar=np.zeros(n + 1))
@@ -102,6 +102,27 @@ def test_c2rosenbrock(c2rosenbrock_restriction):
                        2 * np.dot(d, model.hprod(x, 0, d)))
 
 
+def test_trial(c1rosenbrock_restriction):
+    linemodel = c1rosenbrock_restriction
+    model = linemodel.model
+    x = linemodel.x
+    d = linemodel.d
+    assert linemodel.trial(0) is x
+    xtd = linemodel.trial(0.5)
+    assert np.allclose(xtd, x + 0.5 * d)
+    assert linemodel.trial(0.5) is xtd
+
+    # The buffer is reused for another step.
+    assert linemodel.trial(2.0) is xtd
+    assert np.allclose(xtd, x + 2 * d)
+
+    f, slope = linemodel.obj_grad(2.0)
+    assert np.allclose(f, model.obj(x + 2 * d))
+    assert np.allclose(slope, np.dot(model.grad(x + 2 * d), d))
+    assert np.allclose(linemodel.gradval, model.grad(x + 2 * d))
+    assert linemodel.objval == f
+
+
 class BoundedRosenbrock(BoundConstrainedNLPModel):
     def __init__(self, nvar, Lvar, Uvar, **kwargs):
         assert (nvar > 1)
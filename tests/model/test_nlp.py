@@ -1,7 +1,7 @@
 """Tests relative to pure Python models."""
 
 from unittest import TestCase
-from nlp.model.nlpmodel import QPModel, LPModel
+from nlp.model.nlpmodel import NLPModel, QPModel, LPModel
 from pykrylov.linop.linop import LinearOperator, linop_from_ndarray
 import numpy as np
 
@@ -96,3 +96,76 @@ class Test_QPModel(TestCase):
 
         H = qp.hess(x, 0)
         assert (np.allclose(H * x, np.dot(self.H, x)))
+
+
+class Test_NLPModelClassification(TestCase):
+    def setUp(self):
+        inf = np.inf
+        self.model = NLPModel(6, 5,
+                              Lvar=np.array([-inf, 0., -inf, 1., 2., 0.]),
+                              Uvar=np.array([inf, inf, 3., 1., 4., inf]),
+                              Lcon=np.array([0., -inf, 1., -inf, -1.]),
+                              Ucon=np.array([0., 2., inf, inf, 1.]))
+
+    def test_constraints(self):
+        model = self.model
+        assert model.equalC == [0]
+        assert model.upperC == [1]
+        assert model.lowerC == [2]
+        assert model.rangeC == [4]
+        assert model.permC == [0, 2, 1, 4]
+        assert (model.nequalC, model.nlowerC, model.nupperC,
+                model.nrangeC) == (1, 1, 1, 1)
+
+    def test_bounds(self):
+        model = self.model
+        assert model.freeB == [0]
+        assert model.lowerB == [1, 5]
+        assert model.upperB == [2]
+        assert model.fixedB == [3]
+        assert model.rangeB == [4]
+        assert model.permB == [3, 1, 5, 2, 4, 0]
+        assert model.nbounds == 5
+
+
+class Test_NLPModelResiduals(TestCase):
+    def setUp(self):
+        inf = np.inf
+        A = np.array([[1., 0.], [0., 1.], [1., 1.], [1., -1.]])
+        self.lp = LPModel(np.ones(2), A=A,
+                          Lvar=np.array([0., -inf]),
+                          Uvar=np.array([inf, 1.]),
+                          Lcon=np.array([1., -inf, 0., -1.]),
+                          Ucon=np.array([1., 2., inf, 1.]))
+
+    def test_primal_feasibility(self):
+        lp = self.lp
+        x = np.array([3., 2.])
+        # cons_pos = [2, 0, 5, 2, 0]; bounds = [3, -1]
+        assert np.allclose(lp.cons_pos(x), [2., 0., 5., 2., 0.])
+        pFeas = lp.primal_feasibility(x)
+        assert np.allclose(pFeas, [2., 0., 0., 0., 0., 0., 1.])
+
+        x = np.array([-1., 0.])
+        pFeas = lp.primal_feasibility(x)
+        assert np.allclose(pFeas, [2., 0., 1., 0., 0., 1., 0.])
+
+    def test_complementarity(self):
+        lp = self.lp
+        x = np.array([3., 2.])
+        y = np.arange(1., 6.)
+        z = np.array([1., 2.])
+        cy, xz = lp.complementarity(x, y, z)
+        # Ordering: lowerC, upperC, rangeC, upper side of rangeC.
+        assert np.allclose(cy, [15., 0., 8., 0.])
+        assert np.allclose(xz, [3., -2.])
+
+    def test_kkt_check(self):
+        lp = self.lp
+        x = np.array([1., 0.])
+        z = np.zeros(2)
+        y = np.array([-1., 1., 1., 1., 1.])   # Equality multiplier is free.
+        lp.kkt_residuals(x, y, z)
+        y[4] = -1.
+        with self.assertRaises(ValueError):
+            lp.kkt_residuals(x, y, z)
@@ -0,0 +1,244 @@
+"""Tests relative to the assembly of SciPy sparse matrices."""
+
+from unittest import TestCase
+import numpy as np
+import pytest
+
+sp = pytest.importorskip("scipy.sparse")
+pytest.importorskip("pykrylov")
+
+from nlp.model.nlpmodel import NLPModel
+from nlp.model.scipymodel import CSRAssembler, SciPyNLPModel, \
+    SciPySlackModel, SciPyAugmentedLagrangian, gram_pattern
+
+
+class TripletModel(NLPModel):
+    """Small model that returns its derivatives in coordinate format."""
+
+    def __init__(self):
+        super(TripletModel, self).__init__(3, m=2)
+        self.jrows = np.array([1, 0, 0, 1, 1])
+        self.jcols = np.array([2, 0, 1, 0, 2])  # (1, 2) appears twice.
+        self.hrows = np.array([0, 1, 2, 2])
+        self.hcols = np.array([0, 1, 0, 2])
+
+    def jac(self, x, *args, **kwargs):
+        return (x[self.jcols] * np.arange(1, 6), self.jrows, self.jcols)
+
+    def hess(self, x, *args, **kwargs):
+        return (x[self.hcols] + x[self.hrows], self.hrows, self.hcols)
+
+
+class SciPyTripletModel(SciPyNLPModel, TripletModel):
+    pass
+
+
+class InequalityModel(NLPModel):
+    """Linear constraints with upper, lower, range and equality bounds."""
+
+    def __init__(self):
+        self.dense = np.array([[1., 2., 0.],
+                               [0., 1., -1.],
+                               [3., 0., 1.],
+                               [1., 1., 1.]])
+        super(InequalityModel, self).__init__(
+            3, m=4, Lcon=np.array([-np.inf, 0., -1., 2.]),
+            Ucon=np.array([1., np.inf, 1., 2.]))
+
+    def obj(self, x):
+        return 0.5 * np.dot(x, x)
+
+    def grad(self, x):
+        return x.copy()
+
+    def hprod(self, x, z, p, **kwargs):
+        return p.copy()
+
+    def hess(self, x, z=None, **kwargs):
+        diag = np.arange(3)
+        return (np.ones(3), diag, diag)
+
+    def cons(self, x):
+        return np.dot(self.dense, x)
+
+    def jac(self, x, *args, **kwargs):
+        rows, cols = np.nonzero(self.dense)
+        return (self.dense[rows, cols], rows, cols)
+
+    def jprod(self, x, p):
+        return np.dot(self.dense, p)
+
+    def jtprod(self, x, p):
+        return np.dot(self.dense.T, p)
+
+
+class SciPyInequalityModel(SciPyNLPModel, InequalityModel):
+    pass
+
+
+class Test_CSRAssembler(TestCase):
+
+    def setUp(self):
+        self.rows = np.array([2, 0, 1, 2, 0])
+        self.cols = np.array([1, 0, 3, 1, 2])
+
+    def test_assemble(self):
+        assemble = CSRAssembler((3, 4))
+        vals = np.array([1., 2., 3., 4., 5.])
+        A = assemble(vals, self.rows, self.cols)
+        assert sp.isspmatrix_csr(A)
+        B = sp.coo_matrix((vals, (self.rows, self.cols)), shape=(3, 4))
+        assert np.allclose(A.toarray(), B.toarray())
+        assert A.nnz == 4  # Duplicates are summed.
+
+    def test_reuse(self):
+        assemble = CSRAssembler((3, 4))
+        A = assemble(np.ones(5), self.rows, self.cols)
+        B = assemble(2 * np.ones(5), self.rows.copy(), self.cols.copy())
+        assert np.may_share_memory(A.indices, B.indices)
+        assert np.may_share_memory(A.indptr, B.indptr)
+        assert np.allclose(B.toarray(), 2 * A.toarray())
+        assert np.allclose(A.data.sum(), 5.0)
+
+        # A new pattern triggers a new analysis.
+        C = assemble(np.ones(2), np.array([0, 1]), np.array([1, 1]))
+        assert not np.may_share_memory(C.indices, A.indices)
+        assert np.allclose(C.toarray()[:, 1], [1., 1., 0.])
+
+    def test_symmetric(self):
+        assemble = CSRAssembler((3, 3), symmetric=True)
+        rows = np.array([0, 1, 2])
+        cols = np.array([0, 0, 1])
+        A = assemble(np.array([1., 2., 3.]), rows, cols)
+        assert np.allclose(A.toarray(), [[1., 2., 0.],
+                                         [2., 0., 3.],
+                                         [0., 3., 0.]])
+
+
+class Test_SciPyNLPModel(TestCase):
+
+    def setUp(self):
+        self.model = SciPyTripletModel()
+        self.x = np.array([1., 2., 3.])
+
+    def test_jac(self):
+        model = self.model
+        J = model.jac(self.x)
+        assert sp.isspmatrix_csr(J)
+        vals, rows, cols = TripletModel.jac(model, self.x)
+        expected = sp.coo_matrix((vals, (rows, cols)), shape=(2, 3))
+        assert np.allclose(J.toarray(), expected.toarray())
+
+        J2 = model.jac(2 * self.x)
+        assert np.may_share_memory(J2.indptr, J.indptr)
+        assert np.allclose(J2.toarray(), 2 * J.toarray())
+
+    def test_hess(self):
+        model = self.model
+        H = model.hess(self.x)
+        vals, rows, cols = TripletModel.hess(model, self.x)
+        expected = sp.coo_matrix((vals, (rows, cols)), shape=(3, 3))
+        assert np.allclose(H.toarray(), expected.toarray())
+        assert np.may_share_memory(model.hess(self.x).indices, H.indices)
+
+
+class Test_SciPySlackModel(TestCase):
+
+    def setUp(self):
+        self.model = SciPySlackModel(SciPyInequalityModel())
+        self.x = np.arange(1., self.model.n + 1)
+
+    def test_jac(self):
+        model = self.model
+        assert model.n == 6 and model.m == 4
+        dense = model.model.dense
+        expected = np.zeros((4, 6))
+        expected[:, :3] = dense
+        # Slacks are ordered as lowerC, upperC, rangeC.
+        expected[[1, 0, 2], [3, 4, 5]] = -1.0
+        J = model.jac(self.x)
+        assert np.allclose(J.toarray(), expected)
+        assert np.may_share_memory(model.jac(self.x).indptr, J.indptr)
+
+    def test_jop(self):
+        model = self.model
+        J = model.jac(self.x).toarray()
+        Jop = model.jop(self.x)
+        assert Jop.shape == (4, 6)
+        v = np.random.random(6)
+        u = np.random.random(4)
+        assert np.allclose(Jop * v, np.dot(J, v))
+        assert np.allclose(Jop.T * u, np.dot(J.T, u))
+        assert np.allclose(model.jprod(self.x, v), np.dot(J, v))
+        assert np.allclose(model.jtprod(self.x, u), np.dot(J.T, u))
+
+    def test_out(self):
+        model = self.model
+        x = self.x
+        u = np.random.random(4)
+        v = np.random.random(6)
+        J = model.jac(x).toarray()
+        out = np.nan * np.ones(6)
+        assert model.grad(x, out=out) is out
+        assert np.allclose(out, np.r_[x[:3], np.zeros(3)])
+        assert model.jtprod(x, u, out=out) is out
+        assert np.allclose(out, np.dot(J.T, u))
+        out[:] = np.nan
+        assert model.hprod(x, u, v, out=out) is out
+        assert np.allclose(out, np.r_[v[:3], np.zeros(3)])
+        assert np.allclose(model.cons(x), np.dot(J, x) - [0, 0, 0, 2])
+
+    def test_jop_cache(self):
+        model = self.model
+        x = self.x.copy()
+        v = np.random.random(6)
+        J1 = model.jop(x)
+        Jv = J1 * v
+        assert model.jop(self.x.copy()) is J1
+
+        # Operators are not affected by in-place changes of the point.
+        x[0] += 1
+        assert np.allclose(J1 * v, Jv)
+        J2 = model.jop(x)
+        assert J2 is not J1
+        assert model.jop(self.x) is J1
+        assert model.jop(x) is J2
+
+        model.invalidate_jop()
+        assert model.jop(x) is not J2
+
+
+class Test_SciPyAugmentedLagrangian(TestCase):
+
+    def setUp(self):
+        self.model = SciPyAugmentedLagrangian(SciPyInequalityModel(),
+                                              prox=0.5)
+        self.model.pi = np.array([1., -2., 0.5, 3.])
+        self.model.penalty = 4.0
+        self.model.xk = np.zeros(6)
+        self.x = np.arange(1., 7.)
+
+    def test_gram_pattern(self):
+        J = sp.csr_matrix(np.array([[1., 0., 2.],
+                                    [0., 0., 0.],
+                                    [3., 4., 0.]]))
+        pk, pl = gram_pattern(J.indptr, J.indices)
+        JTJ = sp.coo_matrix((J.data[pk] * J.data[pl],
+                             (J.indices[pk], J.indices[pl])), shape=(3, 3))
+        assert np.allclose(JTJ.toarray(), np.dot(J.T.toarray(), J.toarray()))
+
+    def test_hess(self):
+        model = self.model
+        H = model.hess(self.x)
+        assert sp.isspmatrix_csr(H)
+        expected = np.column_stack([model.hprod(self.x, None, e)
+                                    for e in np.eye(model.n)])
+        assert np.allclose(H.toarray(), expected)
+
+        # The structure is reused when the penalty changes.
+        model.penalty = 10.0
+        H2 = model.hess(self.x)
+        assert np.may_share_memory(H2.indices, H.indices)
+        expected = np.column_stack([model.hprod(self.x, None, e)
+                                    for e in np.eye(model.n)])
+        assert np.allclose(H2.toarray(), expected)
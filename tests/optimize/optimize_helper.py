@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Helper module for nlp.optimize tests."""
+
+import numpy as np
+
+from pykrylov.linop import LinearOperator
+from nlp.model.nlpmodel import NLPModel, QPModel
+
+
+def random_hessian(n, rng, convex=False, shift=1.0):
+    u"""Return a random symmetric matrix of order n drawn from `rng`.
+
+    The matrix is B + Bᵀ, which is indefinite, unless `convex` is set, in
+    which case it is BBᵀ + shift I.
+    """
+    B = rng.randn(n, n)
+    if convex:
+        return np.dot(B, B.T) + shift * np.eye(n)
+    return B + B.T
+
+
+def random_subproblem(n, convex=False, shift=1.0, seed=0):
+    """Return a random Hessian of order n and a random gradient."""
+    rng = np.random.RandomState(seed)
+    H = random_hessian(n, rng, convex=convex, shift=shift)
+    return (H, rng.randn(n))
+
+
+def operator_qp(g, H):
+    """Return the QP with gradient g and Hessian H as a linear operator."""
+    n = g.shape[0]
+    op = LinearOperator(n, n, lambda v: np.dot(H, v), symmetric=True)
+    return QPModel(g, op)
+
+
+class DoubleWell(NLPModel):
+    """Nonconvex quartic with coupling between neighbouring variables."""
+
+    def __init__(self, n=20):
+        rng = np.random.RandomState(0)
+        self.b = 0.1 * rng.randn(n)
+        super(DoubleWell, self).__init__(n, x0=0.01 * rng.randn(n))
+
+    def obj(self, x):
+        return 0.25 * np.sum((x**2 - 1)**2) + \
+            0.25 * np.sum(np.diff(x)**2) + np.dot(self.b, x)
+
+    def grad(self, x):
+        g = x**3 - x + self.b
+        dx = 0.5 * np.diff(x)
+        g[:-1] -= dx
+        g[1:] += dx
+        return g
+
+    def hprod(self, x, z, p, **kwargs):
+        Hp = (3 * x**2 - 1) * p
+        dp = 0.5 * np.diff(p)
+        Hp[:-1] -= dp
+        Hp[1:] += dp
+        return Hp
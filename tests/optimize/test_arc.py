@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Tests relative to the adaptive cubic regularization method."""
+
+from unittest import TestCase
+import numpy as np
+import pytest
+
+sp = pytest.importorskip("scipy.sparse")
+pytest.importorskip("pykrylov")
+
+from nlp.model.nlpmodel import QPModel
+from nlp.optimize.arc import ARC, GLRT, tridiagonal_cubic_subproblem
+from nlp.optimize.trunk import Trunk
+from nlp.optimize.gltr import GLTR
+from nlp.tr.trustregion import TrustRegion
+
+from optimize_helper import random_subproblem, operator_qp, DoubleWell
+
+
+class Test_GLRT(TestCase):
+
+    def setUp(self):
+        self.n = 30
+        self.H, self.g = random_subproblem(self.n)
+
+    def qp(self):
+        return operator_qp(self.g, self.H)
+
+    def check_optimality(self, s, sigma, M=None):
+        # The global minimizer satisfies (H + λM) s = -g with λ = σ‖s‖_M
+        # and H + λM positive semi-definite.
+        M = np.eye(self.n) if M is None else M
+        lam = sigma * np.sqrt(np.dot(s, np.dot(M, s)))
+        resid = self.g + np.dot(self.H + lam * M, s)
+        assert np.linalg.norm(resid) <= 1.0e-6 * np.linalg.norm(self.g)
+        L = np.linalg.cholesky(M)
+        Li = np.linalg.inv(L)
+        evals = np.linalg.eigvalsh(np.dot(Li, np.dot(self.H, Li.T)))
+        assert evals[0] + lam >= -1.0e-8
+
+    def test_solve(self):
+        glrt = GLRT(self.qp())
+        for sigma in (0.1, 1.0, 10.0):
+            glrt.solve(sigma=sigma, reltol=1.0e-12)
+            s = glrt.step
+            self.check_optimality(s, sigma)
+            q = QPModel(self.g, self.H).obj
+            assert np.allclose(glrt.qval, q(s))
+            assert np.allclose(glrt.mval,
+                               q(s) + sigma * np.linalg.norm(s)**3 / 3)
+            assert np.allclose(glrt.multiplier, sigma * glrt.step_norm)
+
+    def test_reuse(self):
+        # A second solve only performs the products needed to assemble the
+        # step if the Lanczos process has enough iterations already.
+        glrt = GLRT(self.qp())
+        glrt.solve(sigma=1.0, reltol=1.0e-12)
+        assert glrt.nprod == 2 * glrt.niter - 1
+        niter = glrt.niter
+        glrt.solve(sigma=2.0, reltol=1.0e-12)
+        assert glrt.niter <= niter
+        assert glrt.nprod == glrt.niter - 1
+        self.check_optimality(glrt.step, 2.0)
+
+    def test_precon(self):
+        # With a preconditioner, the regularization is defined in the M-norm.
+        d = 1 + np.arange(self.n, dtype=np.float)
+        glrt = GLRT(self.qp())
+        glrt.solve(sigma=1.0, prec=lambda v: v / d, reltol=1.0e-12)
+        self.check_optimality(glrt.step, 1.0, np.diag(d))
+
+    def test_tridiagonal(self):
+        diag = np.array([-2., 1., 3.])
+        off = np.array([0.5, -1.])
+        T = np.diag(diag) + np.diag(off, 1) + np.diag(off, -1)
+        for sigma in (0.1, 1.0, 10.0):
+            h, lam, mval = tridiagonal_cubic_subproblem(diag, off, 2.0, sigma)
+            assert np.allclose(lam, sigma * np.linalg.norm(h))
+            assert np.allclose(np.dot(T + lam * np.eye(3), h), [-2., 0., 0.])
+            assert lam >= -np.linalg.eigvalsh(T)[0]
+            assert np.allclose(mval, 2 * h[0] + 0.5 * np.dot(h, np.dot(T, h))
+                               + sigma * np.linalg.norm(h)**3 / 3)
+
+    def test_hard_case(self):
+        # T = diag(-1, 1) with a gradient orthogonal to the first
+        # eigenvector.
+        diag = np.array([-1., 1.])
+        off = np.array([0.])
+        h, lam, mval = tridiagonal_cubic_subproblem(diag, off, 0.0, 0.5)
+        assert np.allclose(lam, 1.0)
+        assert np.allclose(np.linalg.norm(h), 2.0)
+        assert np.allclose(mval, -2.0 + 0.5 * 8 / 3)
+
+
+class Test_ARC(TestCase):
+
+    def test_double_well(self):
+        model = DoubleWell()
+        arc = ARC(model, GLRT, reltol=1.0e-8)
+        arc.solve()
+        assert arc.status == 'opt'
+        assert np.linalg.norm(model.grad(arc.x)) <= 1.0e-6
+        assert len(arc.sigmas) == arc.iter + 1
+
+        # Same stationary point as Trunk with GLTR.
+        trunk = Trunk(DoubleWell(), TrustRegion(), GLTR, reltol=1.0e-8)
+        trunk.solve()
+        assert np.allclose(arc.x, trunk.x, atol=1.0e-5)
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""Tests relative to the regularized interior-point method for QPs."""
+
+from unittest import TestCase
+import numpy as np
+import pytest
+
+sp = pytest.importorskip("scipy.sparse")
+pytest.importorskip("pykrylov")
+
+from nlp.model.nlpmodel import NLPModel
+from nlp.optimize import cqp as cqp_module
+from nlp.optimize.cqp import SlackModel, RegQPInteriorPointSolver, \
+    RegQPInteriorPointSolver3x3, RegQPInteriorPointSolver29
+
+
+class RangeQP(NLPModel):
+    u"""A small convex QP with SciPy matrices.
+
+    minimize    ½ ‖x‖² - x₁ - 1.5 x₂
+    subject to  x₁ + x₂ + x₃ = 1,  -0.1 ≤ x₁ - x₂ ≤ 0.1,
+                x₁ ≥ 0,  0 ≤ x₂ ≤ 0.6.
+
+    The solution is (0.7, 0.6, -0.3).
+    """
+
+    def __init__(self):
+        super(RangeQP, self).__init__(3, m=2,
+                                      Lvar=np.array([0., 0., -np.inf]),
+                                      Uvar=np.array([np.inf, 0.6, np.inf]),
+                                      Lcon=np.array([1., -0.1]),
+                                      Ucon=np.array([1., 0.1]))
+        self.c = np.array([-1., -1.5, 0.])
+        self.J = sp.csr_matrix(np.array([[1., 1., 1.], [1., -1., 0.]]))
+
+    def obj(self, x):
+        return 0.5 * np.dot(x, x) + np.dot(self.c, x)
+
+    def grad(self, x):
+        return x + self.c
+
+    def cons(self, x):
+        return self.J * x
+
+    def jac(self, x):
+        return self.J
+
+    def A(self):
+        return self.J
+
+    def jop(self, x):
+        return self.J
+
+    def hess(self, x, z=None, **kwargs):
+        return sp.identity(self.n, format='csr')
+
+    def hprod(self, x, z, p, **kwargs):
+        return p.copy()
+
+
+class Test_SlackModel(TestCase):
+
+    def test_jac(self):
+        qp = SlackModel(RangeQP())
+        x = np.random.random(qp.n)
+        y = np.random.random(qp.m)
+        J = qp.A()
+        assert J.shape == (qp.m, qp.n)
+        assert np.allclose(qp.cons(x) - qp.cons(0 * x), J * x)
+        assert np.allclose(qp.jprod(x, x), J * x)
+        assert np.allclose(qp.jtprod(x, y), y * J)
+
+
+class Test_RegQPInteriorPointSolver(TestCase):
+
+    def test_solve(self):
+        expected = np.array([0.7, 0.6, -0.3])
+        for solver in (RegQPInteriorPointSolver, RegQPInteriorPointSolver3x3):
+            for scale in (True, False):
+                cqp = solver(SlackModel(RangeQP()), scale=scale,
+                             verbose=False)
+                cqp.solve(tolerance=1.0e-10)
+                assert cqp.short_status == 'opt'
+                assert np.allclose(cqp.x[:3], expected, atol=1.0e-3)
+
+    def test_mc29_missing(self):
+        if cqp_module.mc29ad is not None:
+            pytest.skip("HSL is available")
+        with pytest.raises(ImportError):
+            RegQPInteriorPointSolver29(SlackModel(RangeQP()), scale=True,
+                                       verbose=False)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Tests relative to the generalized Lanczos trust-region method."""
+
+from unittest import TestCase
+import numpy as np
+import pytest
+
+sp = pytest.importorskip("scipy.sparse")
+pytest.importorskip("pykrylov")
+
+from nlp.model.nlpmodel import QPModel
+from nlp.optimize.gltr import GLTR, tridiagonal_subproblem
+from nlp.optimize.moresorensen import MoreSorensen
+from nlp.optimize.pcg import TruncatedCG
+from nlp.optimize.trunk import Trunk
+from nlp.tr.trustregion import TrustRegion
+
+from optimize_helper import random_subproblem, operator_qp, DoubleWell
+
+
+class Test_GLTR(TestCase):
+
+    def setUp(self):
+        self.n = 30
+        self.H, self.g = random_subproblem(self.n)
+
+    def qp(self, H=None):
+        return operator_qp(self.g, self.H if H is None else H)
+
+    def test_interior(self):
+        # Inside the trust region, GLTR reproduces truncated CG.
+        H = np.dot(self.H, self.H) + np.eye(self.n)
+        gltr = GLTR(self.qp(H))
+        gltr.solve(radius=1.0e+3)
+        cg = TruncatedCG(self.qp(H))
+        cg.solve(radius=1.0e+3)
+        assert not gltr.onBoundary and gltr.status == 'residual small'
+        assert gltr.niter == cg.niter
+        assert np.allclose(gltr.step, cg.step)
+
+    def test_boundary(self):
+        radius = 1.0
+        gltr = GLTR(self.qp())
+        gltr.solve(radius=radius, reltol=1.0e-10, boundary_reltol=1.0e-10)
+        assert gltr.onBoundary
+        assert gltr.status == 'trust-region boundary active'
+        assert np.allclose(np.linalg.norm(gltr.step), radius)
+        assert gltr.nprod > gltr.niter
+        q = QPModel(self.g, self.H).obj
+        assert np.allclose(gltr.qval, q(gltr.step))
+
+        # The step is a global minimizer and improves on truncated CG.
+        ms = MoreSorensen(QPModel(self.g, self.H), boundary_tol=1.0e-10)
+        ms.solve(radius=radius)
+        assert np.allclose(gltr.qval, ms.qval)
+        assert np.allclose(gltr.multiplier, ms.multiplier, rtol=1.0e-4)
+        cg = TruncatedCG(self.qp())
+        cg.solve(radius=radius)
+        assert gltr.qval < q(cg.step)
+
+    def test_precon(self):
+        # With a preconditioner, the trust region is defined in the M-norm.
+        d = 1 + np.arange(self.n, dtype=np.float)
+        gltr = GLTR(self.qp())
+        gltr.solve(radius=1.0, prec=lambda v: v / d, reltol=1.0e-10,
+                   boundary_reltol=1.0e-10)
+        s = gltr.step
+        assert np.allclose(np.sqrt(np.dot(s, d * s)), 1.0)
+
+        # Solve the scaled problem exactly.
+        scale = 1 / np.sqrt(d)
+        ms = MoreSorensen(QPModel(scale * self.g,
+                                  scale[:, None] * self.H * scale),
+                          boundary_tol=1.0e-10)
+        ms.solve(radius=1.0)
+        assert np.allclose(gltr.qval, ms.qval)
+
+    def test_infinite_descent(self):
+        gltr = GLTR(self.qp())
+        gltr.solve()
+        assert gltr.infDescent and gltr.status == 'infinite descent'
+        assert np.dot(gltr.dir, np.dot(self.H, gltr.dir)) <= 0
+
+    def test_hard_case(self):
+        # T = diag(-1, 1) with a gradient orthogonal to the first
+        # eigenvector.
+        diag = np.array([-1., 1.])
+        off = np.array([0.])
+        h, lam, qval = tridiagonal_subproblem(diag, off, 0.0, 2.0)
+        assert np.allclose(np.linalg.norm(h), 2.0)
+        assert np.allclose(lam, 1.0)
+        assert np.allclose(qval, -2.0)
+
+
+class Test_Trunk(TestCase):
+
+    def test_gltr(self):
+        model = DoubleWell()
+        trunk = Trunk(model, TrustRegion(), GLTR, reltol=1.0e-8)
+        trunk.solve()
+        assert trunk.status == 'opt'
+        assert np.linalg.norm(model.grad(trunk.x)) <= 1.0e-6
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""Tests relative to the Moré-Sorensen trust-region solver."""
+
+from unittest import TestCase
+import numpy as np
+import pytest
+
+sp = pytest.importorskip("scipy.sparse")
+pytest.importorskip("pykrylov")
+
+from pykrylov.linop import LinearOperator
+from nlp.model.nlpmodel import NLPModel, QPModel
+from nlp.optimize.pcg import TruncatedCG
+from nlp.optimize.moresorensen import MoreSorensen, AutoTRSolver
+from nlp.optimize.trunk import Trunk
+from nlp.optimize.tron import TRON
+from nlp.tr.trustregion import TrustRegion
+
+from optimize_helper import random_subproblem
+
+
+class DenseQuartic(NLPModel):
+    u"""f(x) = ½ xᵀAx + ¼ Σ xᵢ⁴ - Σ xᵢ with a dense positive definite A and
+    a Hessian returned as a Numpy array."""
+
+    def __init__(self, n, **kwargs):
+        super(DenseQuartic, self).__init__(n, x0=np.zeros(n), **kwargs)
+        rng = np.random.RandomState(0)
+        B = rng.randn(n, n) / np.sqrt(n)
+        self.A = np.dot(B, B.T) + 0.1 * np.eye(n)
+
+    def obj(self, x):
+        return 0.5 * np.dot(x, np.dot(self.A, x)) + 0.25 * np.sum(x**4) - \
+            np.sum(x)
+
+    def grad(self, x):
+        return np.dot(self.A, x) + x**3 - 1
+
+    def hess(self, x, *args, **kwargs):
+        return self.A + np.diag(3 * x**2)
+
+    def hprod(self, x, z, v, **kwargs):
+        return np.dot(self.A, v) + 3 * x**2 * v
+
+
+class ChoiceRecorder(AutoTRSolver):
+    """Record the class of each subproblem solver."""
+
+    def __init__(self, *args, **kwargs):
+        super(ChoiceRecorder, self).__init__(*args, **kwargs)
+        self.choices = []
+
+    def __call__(self, qp, **kwargs):
+        solver = super(ChoiceRecorder, self).__call__(qp, **kwargs)
+        self.choices.append(type(solver))
+        return solver
+
+
+class Test_MoreSorensen(TestCase):
+
+    def setUp(self):
+        self.n = 10
+        self.H, self.g = random_subproblem(self.n)
+
+    def solve(self, H, g, radius):
+        ms = MoreSorensen(QPModel(g, H))
+        ms.solve(radius=radius)
+        return ms
+
+    def check_optimality(self, ms, H, g, radius):
+        # (H + lambda I) s = -g with H + lambda I positive semi-definite.
+        lam = ms.multiplier
+        n = g.shape[0]
+        assert lam >= 0
+        assert np.linalg.eigvalsh(H + lam * np.eye(n))[0] >= -1.0e-8
+        assert ms.step_norm <= radius * (1 + 1.0e-10)
+
+    def test_interior(self):
+        H = np.dot(self.H, self.H) + np.eye(self.n)
+        ms = self.solve(H, self.g, 1.0e+3)
+        assert not ms.onBoundary and ms.multiplier == 0.0
+        assert ms.status == 'residual small'
+        assert np.allclose(ms.step, np.linalg.solve(H, -self.g))
+
+    def test_boundary(self):
+        radius = 0.5
+        ms = self.solve(self.H, self.g, radius)
+        assert ms.onBoundary and ms.status == 'trust-region boundary active'
+        assert np.allclose(ms.step_norm, radius)
+        self.check_optimality(ms, self.H, self.g, radius)
+        resid = np.dot(self.H, ms.step) + ms.multiplier * ms.step + self.g
+        assert np.linalg.norm(resid) <= 0.05 * np.linalg.norm(self.g)
+
+        # The exact step improves on the truncated CG step.
+        cg = TruncatedCG(QPModel(self.g, self.H))
+        cg.solve(radius=radius)
+        assert ms.qval <= QPModel(self.g, self.H).obj(cg.step)
+
+    def test_hard_case(self):
+        H = np.diag([-1., 1., 2.])
+        g = np.array([0., 1., 1.])
+        ms = self.solve(H, g, 2.0)
+        assert ms.hardCase and ms.onBoundary
+        assert np.allclose(ms.step_norm, 2.0)
+        assert abs(ms.step[0]) > 1
+        assert np.allclose(ms.multiplier, 1.0, atol=0.1)
+
+        # Zero gradient.
+        ms = self.solve(H, np.zeros(3), 2.0)
+        assert np.allclose(np.abs(ms.step), [2., 0., 0.])
+
+    def test_formats(self):
+        radius = 0.5
+        ms = self.solve(self.H, self.g, radius)
+        op = LinearOperator(self.n, self.n, lambda v: np.dot(self.H, v),
+                            symmetric=True)
+        for H in (sp.csr_matrix(self.H), op):
+            ms2 = self.solve(H, self.g, radius)
+            assert np.allclose(ms2.step, ms.step)
+
+    def test_infinite_descent(self):
+        ms = self.solve(self.H, self.g, None)
+        assert ms.infDescent
+        assert np.dot(ms.dir, np.dot(self.H, ms.dir)) < 0
+
+
+class Test_AutoTRSolver(TestCase):
+
+    def test_choice(self):
+        n = 20
+        g = np.ones(n)
+        auto = AutoTRSolver(maxn=10, min_density=0.2, operator_maxn=0)
+        assert isinstance(auto(QPModel(g[:10], np.eye(10))), MoreSorensen)
+        assert isinstance(auto(QPModel(g, np.eye(n))), TruncatedCG)
+
+        auto = AutoTRSolver(maxn=50, min_density=0.2, operator_maxn=0)
+        dense = sp.csr_matrix(np.ones((n, n)))
+        assert isinstance(auto(QPModel(g, dense)), MoreSorensen)
+        assert isinstance(auto(QPModel(g, sp.eye(n).tocsr())), TruncatedCG)
+        op = LinearOperator(n, n, lambda v: v, symmetric=True)
+        assert isinstance(auto(QPModel(g, op)), TruncatedCG)
+
+    def test_dense_model(self):
+        # Hessians returned as Numpy arrays reach the selector as such and
+        # are solved exactly up to `maxn`, beyond `operator_maxn`.
+        model = DenseQuartic(200)
+        auto = ChoiceRecorder()
+        trunk = Trunk(model, TrustRegion(), auto)
+        trunk.solve()
+        assert trunk.status == 'opt'
+        assert len(auto.choices) == trunk.iter
+        assert set(auto.choices) == set([MoreSorensen])
+
+        model = DenseQuartic(200, Lvar=np.zeros(200), Uvar=0.5 * np.ones(200))
+        auto = ChoiceRecorder()
+        tron = TRON(model, auto)
+        tron.solve()
+        assert tron.status in ('gtol', 'fatol', 'frtol')
+        assert len(auto.choices) > 0
+        assert set(auto.choices) == set([MoreSorensen])
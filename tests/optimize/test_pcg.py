@@ -0,0 +1,125 @@
+"""Tests relative to the truncated conjugate gradient methods."""
+
+from unittest import TestCase
+import numpy as np
+import pytest
+
+pytest.importorskip("pykrylov")
+
+from pykrylov.linop import LinearOperator
+from nlp.model.nlpmodel import QPModel
+from nlp.optimize.pcg import TruncatedCG, BlockTruncatedCG
+
+from optimize_helper import random_hessian, random_subproblem, operator_qp
+
+
+class CountingCG(TruncatedCG):
+
+    def post_iteration(self):
+        self.count = getattr(self, 'count', 0) + 1
+
+
+class Test_TruncatedCG(TestCase):
+
+    def setUp(self):
+        self.n = 20
+        self.H, self.g = random_subproblem(self.n, convex=True)
+
+    def qp(self):
+        return operator_qp(self.g, self.H)
+
+    def test_hprod(self):
+        cg = TruncatedCG(self.qp())
+        cg.solve(reltol=1.0e-10)
+        calls = []
+
+        def hprod(v, out):
+            calls.append(out)
+            return np.dot(self.H, v, out=out)
+
+        cg2 = TruncatedCG(self.qp())
+        cg2.solve(reltol=1.0e-10, hprod=hprod)
+        assert np.allclose(cg.step, np.linalg.solve(self.H, -self.g))
+        assert np.allclose(cg2.step, cg.step)
+        assert cg2.niter == cg.niter == len(calls)
+        assert all(out is calls[0] for out in calls)
+
+    def test_store(self):
+        pairs = []
+        cg = TruncatedCG(self.qp())
+        cg.solve(radius=1.0, store=lambda s, y: pairs.append((s.copy(),
+                                                              y.copy())))
+        assert cg.onBoundary and len(pairs) == cg.niter - 1
+        for s, y in pairs:
+            assert np.allclose(np.dot(self.H, s), y)
+
+    def test_bookkeeping(self):
+        cg = TruncatedCG(self.qp())
+        cg.solve()
+        assert not hasattr(cg, 'p')
+
+        cg = CountingCG(self.qp())
+        cg.solve()
+        assert cg.count == cg.niter and hasattr(cg, 'p')
+
+        cg = CountingCG(self.qp())
+        cg.solve(bookkeeping=False)
+        assert not hasattr(cg, 'count')
+
+
+class Test_BlockTruncatedCG(TestCase):
+
+    def setUp(self):
+        n, k = 10, 4
+        rng = np.random.RandomState(0)
+        self.H = random_hessian(n, rng, convex=True)
+        self.G = rng.randn(n, k)
+        self.n, self.k = n, k
+
+    def truncated_cg(self, H, g, radius):
+        qp = QPModel(g, H)
+        cg = TruncatedCG(qp)
+        cg.solve(radius=radius, reltol=1.0e-10)
+        return cg
+
+    def test_columns(self):
+        # Each column reproduces the single right-hand side solver,
+        # including truncation at its own trust-region radius.
+        radius = np.array([0.01, 0.1, 1.0, 100.0])
+        H = LinearOperator(self.n, self.n, lambda v: np.dot(self.H, v),
+                           symmetric=True)
+        bcg = BlockTruncatedCG(self.H, self.G)
+        bcg.solve(radius=radius, reltol=1.0e-10)
+        for j in range(self.k):
+            cg = self.truncated_cg(H, self.G[:, j], radius[j])
+            assert np.allclose(bcg.step[:, j], cg.step)
+            assert bcg.status[j] == cg.status
+            assert bcg.niters[j] == cg.niter
+            s = bcg.step[:, j]
+            q = np.dot(self.G[:, j], s) + 0.5 * np.dot(s, np.dot(self.H, s))
+            assert np.allclose(bcg.qval[j], q)
+        assert bcg.niter == bcg.niters.max()
+        assert bcg.onBoundary[0] and not bcg.onBoundary[-1]
+        assert np.allclose(bcg.step[:, -1],
+                           np.linalg.solve(self.H, -self.G[:, -1]))
+
+    def test_operator(self):
+        # Block products are performed column by column for operators.
+        H = LinearOperator(self.n, self.n, lambda v: np.dot(self.H, v),
+                           symmetric=True)
+        bcg = BlockTruncatedCG(H, self.G)
+        bcg.solve(reltol=1.0e-12)
+        assert np.allclose(bcg.step, np.linalg.solve(self.H, -self.G))
+
+    def test_indefinite(self):
+        H = np.diag([1., 2., -1.])
+        G = np.array([[1., 0.], [1., 0.], [0., 1.]])
+        bcg = BlockTruncatedCG(H, G)
+        bcg.solve()
+        assert list(bcg.infDescent) == [False, True]
+        assert np.allclose(bcg.step[:, 0], [-1., -0.5, 0.])
+        assert np.dot(bcg.dir[:, 1], np.dot(H, bcg.dir[:, 1])) <= 0
+
+        bcg.solve(radius=2.0)
+        assert bcg.onBoundary[1]
+        assert np.allclose(bcg.step_norm[1], 2.0)
@@ -0,0 +1,58 @@
+"""Tests relative to the projected conjugate gradient method."""
+
+from unittest import TestCase
+import numpy as np
+import pytest
+
+sp = pytest.importorskip("scipy.sparse")
+pytest.importorskip("pykrylov")
+
+from nlp.model.nlpmodel import QPModel
+from nlp.optimize.ppcg import ProjectedCG
+
+from optimize_helper import random_hessian
+
+
+class Test_ProjectedCG(TestCase):
+
+    def setUp(self):
+        n, m = 6, 2
+        rng = np.random.RandomState(0)
+        self.H = sp.csr_matrix(random_hessian(n, rng, convex=True, shift=n))
+        self.A = sp.csr_matrix(rng.randn(m, n))
+        self.c = rng.randn(n)
+        self.n, self.m = n, m
+
+    def test_solve(self):
+        n, m = self.n, self.m
+        qp = QPModel(self.c, self.H, A=self.A)
+        ppcg = ProjectedCG(qp, abstol=1.0e-12, reltol=1.0e-12)
+        ppcg.solve()
+
+        K = np.zeros((n + m, n + m))
+        K[:n, :n] = self.H.toarray()
+        K[n:, :n] = self.A.toarray()
+        K[:n, n:] = self.A.toarray().T
+        sol = np.linalg.solve(K, np.concatenate((-self.c, np.zeros(m))))
+        assert ppcg.converged
+        assert np.allclose(ppcg.x, sol[:n])
+        assert np.allclose(self.A * ppcg.x, 0.0)
+
+    def test_radius(self):
+        qp = QPModel(self.c, self.H, A=self.A)
+        ppcg = ProjectedCG(qp, radius=1.0e-2)
+        ppcg.solve()
+        assert ppcg.on_boundary
+        assert np.allclose(np.linalg.norm(ppcg.x), 1.0e-2)
+        assert np.allclose(self.A * ppcg.x, 0.0)
+
+    def test_hprod(self):
+        H = self.H.toarray()
+        qp = QPModel(self.c, self.H, A=self.A)
+        ppcg = ProjectedCG(qp, abstol=1.0e-12, reltol=1.0e-12)
+        ppcg.solve()
+        qp = QPModel(self.c, self.H, A=self.A)
+        ppcg2 = ProjectedCG(qp, abstol=1.0e-12, reltol=1.0e-12)
+        ppcg2.solve(hprod=lambda v, out: np.dot(H, v, out=out))
+        assert ppcg2.converged and ppcg2.iter == ppcg.iter
+        assert np.allclose(ppcg2.x, ppcg.x)
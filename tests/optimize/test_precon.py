@@ -0,0 +1,201 @@
+"""Tests relative to the preconditioners of TRON and Trunk."""
+
+from unittest import TestCase
+import numpy as np
+import pytest
+
+sp = pytest.importorskip("scipy.sparse")
+pytest.importorskip("pykrylov")
+
+from nlp.model.nlpmodel import NLPModel
+from nlp.model.scipymodel import SciPyNLPModel
+from nlp.optimize import precon
+from nlp.optimize.pcg import TruncatedCG
+from nlp.optimize.precon import Preconditioner, DiagonalPreconditioner, \
+    BandedPreconditioner, IncompleteCholeskyPreconditioner, \
+    LBFGSPreconditioner
+from nlp.optimize.moresorensen import MoreSorensen, AutoTRSolver
+from nlp.optimize.trunk import Trunk
+from nlp.tr.trustregion import TrustRegion
+
+
+def laplacian(n):
+    """Tridiagonal matrix with stencil (-1, 2, -1)."""
+    return sp.diags([-np.ones(n - 1), 2 * np.ones(n), -np.ones(n - 1)],
+                    [-1, 0, 1], format='csr')
+
+
+class Test_Preconditioners(TestCase):
+
+    def setUp(self):
+        n = 20
+        rng = np.random.RandomState(0)
+        B = sp.random(n, n, density=0.1, random_state=rng)
+        self.H = (B * B.T + sp.eye(n)).tocsr()
+        self.v = rng.randn(n)
+        self.x = np.linalg.solve(self.H.toarray(), self.v)
+
+    def test_exact(self):
+        # Without dropping, the factorizations are complete.
+        n = self.H.shape[0]
+        for P in (BandedPreconditioner(bandwidth=n),
+                  IncompleteCholeskyPreconditioner(memory=n)):
+            P.update(self.H)
+            assert P.factorized and P.alpha == 0.0
+            assert np.allclose(P(self.v), self.x)
+
+    def test_diagonal(self):
+        P = DiagonalPreconditioner()
+        P.update(self.H)
+        assert np.allclose(P(self.v), self.v / self.H.diagonal())
+
+    def test_tridiagonal(self):
+        # The incomplete factorization of a tridiagonal matrix is exact.
+        H = laplacian(10)
+        v = np.arange(10.)
+        for P in (BandedPreconditioner(bandwidth=1),
+                  IncompleteCholeskyPreconditioner(memory=0)):
+            P.update(H)
+            assert np.allclose(H * P(v), v)
+
+    def test_shift(self):
+        H = self.H - 3 * sp.eye(self.H.shape[0])
+        P = IncompleteCholeskyPreconditioner()
+        P.update(H)
+        assert P.factorized and P.alpha > 0
+        assert np.all(np.isfinite(P(self.v)))
+
+    def test_compiled(self):
+        # The extension computes the same factors as the Python code.
+        if precon.icfs is None:
+            pytest.skip("nlp.optimize._icfs is not built")
+        for H in (self.H, self.H - 3 * sp.eye(self.H.shape[0])):
+            A = sp.tril(H, format='csc')
+            A.sort_indices()
+            args = (A.indptr.astype(np.int64), A.indices.astype(np.int64),
+                    A.data)
+            for p, alpha in ((0, 0.0), (2, 0.0), (2, 4.0)):
+                expected = precon._icfs(*(args + (alpha, p)))
+                factor = precon.icfs(*(args + (alpha, p)))
+                if expected is None:
+                    assert factor is None
+                else:
+                    for a, b in zip(factor, expected):
+                        assert np.allclose(a, b)
+
+    def test_operator(self):
+        # Preconditioners fall back on the identity without a matrix.
+        for P in (Preconditioner(), IncompleteCholeskyPreconditioner()):
+            P.update(None)
+            assert P(self.v) is self.v
+
+
+class Quartic(NLPModel):
+    """Quartic perturbation of a Laplacian quadratic."""
+
+    def __init__(self, n=50):
+        self.A = laplacian(n)
+        super(Quartic, self).__init__(n, x0=np.ones(n))
+
+    def obj(self, x):
+        return 0.25 * np.sum(x**4) + 0.5 * np.dot(x, self.A * x) - np.sum(x)
+
+    def grad(self, x):
+        return x**3 + self.A * x - 1
+
+    def hess(self, x, z=None, **kwargs):
+        H = (self.A + sp.diags(3 * x**2)).tocoo()
+        return (H.data, H.row, H.col)
+
+    def hprod(self, x, z, p, **kwargs):
+        return 3 * x**2 * p + self.A * p
+
+
+class SciPyQuartic(SciPyNLPModel, Quartic):
+    pass
+
+
+class Test_Trunk(TestCase):
+
+    def solve(self, tr_solver=TruncatedCG, **kwargs):
+        model = SciPyQuartic()
+        trunk = Trunk(model, TrustRegion(), tr_solver, reltol=1.0e-10,
+                      **kwargs)
+        trunk.solve()
+        assert np.linalg.norm(model.grad(trunk.x)) <= 1.0e-6
+        return trunk
+
+    def test_precon(self):
+        plain = self.solve()
+        icfs = self.solve(preconditioner=IncompleteCholeskyPreconditioner())
+        assert np.allclose(icfs.x, plain.x, atol=1.0e-6)
+        assert icfs.total_cgiter < plain.total_cgiter
+
+    def test_exact(self):
+        plain = self.solve()
+        exact = self.solve(tr_solver=MoreSorensen)
+        auto = self.solve(tr_solver=AutoTRSolver(min_density=0.0))
+        assert np.allclose(exact.x, plain.x, atol=1.0e-6)
+        assert exact.iter <= plain.iter
+        assert auto.iter == exact.iter
+
+
+class Test_LBFGSPreconditioner(TestCase):
+
+    def test_secant(self):
+        n = 6
+        rng = np.random.RandomState(1)
+        B = rng.randn(n, n)
+        H = np.dot(B, B.T) + np.eye(n)
+        P = LBFGSPreconditioner(n, memory=3)
+        v = rng.randn(n)
+        assert P(v) is v
+
+        for _ in range(5):
+            s = rng.randn(n)
+            P.store(s, np.dot(H, s))
+        assert P.npairs == 0  # Pairs take effect at the next update.
+        P.update()
+        assert P.npairs == 3
+        assert np.allclose(P(np.dot(H, s)), s)
+
+        # Pairs of negative curvature are discarded.
+        P.store(s, -s)
+        P.update()
+        assert P.npairs == 3
+
+    def test_memory(self):
+        # No more than `memory` pairs are kept, whether in use or pending.
+        n = 5
+        P = LBFGSPreconditioner(n, memory=2)
+        for k in range(10):
+            s = np.eye(n)[k % n]
+            P.store(s, 2 * s)
+            P.store(s, -s)  # Rejected right away.
+            assert len(P.pending) == min(k + 1, 2)
+        P.update()
+        assert P.npairs == 2
+        assert np.allclose(P.s[-1], s)
+        assert len(P.pending) == 0
+
+        with pytest.raises(ValueError):
+            LBFGSPreconditioner(n, memory=0)
+
+    def test_free(self):
+        P = LBFGSPreconditioner(4)
+        free = np.array([1, 3])
+        P.update(free=free)
+        P.store(np.array([1., 2.]), np.array([2., 4.]))
+        P.update(free=free)
+        assert np.allclose(P.s[0], [0., 1., 0., 2.])
+        assert P(np.array([1., 1.])).shape == (2,)
+
+    def test_trunk(self):
+        model = SciPyQuartic()
+        plain = Trunk(model, TrustRegion(), TruncatedCG, reltol=1.0e-10)
+        plain.solve()
+        lbfgs = Trunk(model, TrustRegion(), TruncatedCG, reltol=1.0e-10,
+                      preconditioner=LBFGSPreconditioner(model.n))
+        lbfgs.solve()
+        assert np.linalg.norm(model.grad(lbfgs.x)) <= 1.0e-6
+        assert lbfgs.total_cgiter < plain.total_cgiter
@@ -0,0 +1,252 @@
+"""Tests relative to the TRON solver."""
+
+from unittest import TestCase
+import numpy as np
+import pytest
+
+sp = pytest.importorskip("scipy.sparse")
+pytest.importorskip("pykrylov")
+
+from nlp.model.nlpmodel import NLPModel
+from nlp.model.scipymodel import SciPyNLPModel, SciPyAugmentedLagrangian
+from nlp.optimize.pcg import TruncatedCG
+from nlp.optimize.tron import TRON, ReducedHessian
+from nlp.optimize.precon import BandedPreconditioner
+from nlp.optimize.moresorensen import MoreSorensen
+from nlp.tr.trustregion import AdaptiveTrustRegion
+
+
+class BoundedQuartic(NLPModel):
+    """Separable quartic with one linear equality constraint and bounds."""
+
+    def __init__(self, n=8):
+        self.a = np.linspace(-1., 2., n)
+        super(BoundedQuartic, self).__init__(
+            n, m=1, Lcon=np.array([1.]), Ucon=np.array([1.]),
+            Lvar=-0.5 * np.ones(n), Uvar=np.ones(n))
+
+    def obj(self, x):
+        return 0.25 * np.sum((x - self.a)**4) + 0.5 * np.dot(x, x)
+
+    def grad(self, x):
+        return (x - self.a)**3 + x
+
+    def hess(self, x, z=None, **kwargs):
+        diag = np.arange(self.n)
+        return (3 * (x - self.a)**2 + 1, diag, diag)
+
+    def hprod(self, x, z, p, **kwargs):
+        return (3 * (x - self.a)**2 + 1) * p
+
+    def cons(self, x):
+        return np.array([np.sum(x)])
+
+    def jac(self, x, *args, **kwargs):
+        n = self.n
+        return (np.ones(n), np.zeros(n, dtype=np.int), np.arange(n))
+
+    def jprod(self, x, p):
+        return np.array([np.sum(p)])
+
+    def jtprod(self, x, p):
+        return p[0] * np.ones(self.n)
+
+
+class SciPyBoundedQuartic(SciPyNLPModel, BoundedQuartic):
+    pass
+
+
+class Test_TRON(TestCase):
+
+    def solve(self, tr_solver=TruncatedCG, **kwargs):
+        model = SciPyAugmentedLagrangian(SciPyBoundedQuartic())
+        model.pi = np.array([0.5])
+        tron = TRON(model, tr_solver, **kwargs)
+        tron.solve()
+        assert tron.status in ("gtol", "fatol", "frtol")
+        return tron
+
+    def test_factorize(self):
+        tron_cg = self.solve(greltol=1.0e-10)
+        tron_lu = self.solve(greltol=1.0e-10, factorize=True)
+        assert np.allclose(tron_lu.x, tron_cg.x, atol=1.0e-6)
+        assert tron_lu.total_cgiter < tron_cg.total_cgiter
+
+        model = tron_lu.model
+        assert np.all(tron_lu.x >= model.Lvar)
+        assert np.all(tron_lu.x <= model.Uvar)
+
+    def test_factorize_indefinite(self):
+        tron = self.solve(factorize=True)
+        g = np.array([1.0, 0.1])
+        for H in (sp.csr_matrix(np.diag([2.0, -1.0])),
+                  sp.csr_matrix(np.array([[0.0, 1.0], [1.0, 0.0]]))):
+            assert tron.factorized_step(H, g, 1.0e+3) is None
+        H = sp.csr_matrix(np.array([[4.0, 1.0], [1.0, 3.0]]))
+        p = tron.factorized_step(H, g, 1.0e+3)
+        assert np.allclose(H.dot(p), -g)
+        assert tron.factorized_step(H, g, 1.0e-3) is None
+
+    def test_precon(self):
+        tron_cg = self.solve(greltol=1.0e-10)
+        tron_pc = self.solve(greltol=1.0e-10,
+                             preconditioner=BandedPreconditioner(1))
+        assert np.allclose(tron_pc.x, tron_cg.x, atol=1.0e-6)
+
+    def test_exact(self):
+        tron_cg = self.solve(greltol=1.0e-10)
+        tron_ms = self.solve(MoreSorensen, greltol=1.0e-10)
+        assert np.allclose(tron_ms.x, tron_cg.x, atol=1.0e-6)
+        assert tron_ms.total_cgiter < tron_cg.total_cgiter
+
+    def test_non_monotone(self):
+        tron_mono = self.solve(greltol=1.0e-10)
+        tron_non_mono = self.solve(greltol=1.0e-10, monotone=False,
+                                   n_non_monotone=2)
+        assert np.allclose(tron_non_mono.x, tron_mono.x, atol=1.0e-6)
+
+    def test_exact_cauchy(self):
+        tron_search = self.solve(greltol=1.0e-10, exact_cauchy=False)
+        tron_exact = self.solve(greltol=1.0e-10)
+        assert np.allclose(tron_exact.x, tron_search.x, atol=1.0e-6)
+
+    def test_adaptive_tr(self):
+        tron_gen = self.solve(greltol=1.0e-10)
+        tr = AdaptiveTrustRegion(warm_start=True)
+        tron_ada = self.solve(greltol=1.0e-10, tr=tr)
+        assert tron_ada.tr is tr
+        assert np.allclose(tron_ada.x, tron_gen.x, atol=1.0e-6)
+
+        # A second solve starts from the last successful radius.
+        tron_warm = self.solve(greltol=1.0e-10, tr=tr)
+        assert np.allclose(tron_warm.x, tron_gen.x, atol=1.0e-6)
+
+
+class Test_Cauchy(TestCase):
+
+    def setUp(self):
+        self.H = np.array([[2., 1., 0.],
+                           [1., 3., 1.],
+                           [0., 1., 1.]])
+        self.g = np.array([-1., -2., 3.])
+        self.x = np.zeros(3)
+        self.l = np.array([-np.inf, -0.1, -0.5])
+        self.u = np.array([0.2, np.inf, 0.5])
+        self.tron = TRON(BoundedQuartic(3), TruncatedCG)
+
+    def path_minimum(self, delta):
+        # Sample the projected path up to the trust-region boundary, which
+        # is located by bisection.
+        q = lambda s: np.dot(self.g, s) + 0.5 * np.dot(s, np.dot(self.H, s))
+        step = lambda t: np.clip(self.x - t * self.g, self.l, self.u) - self.x
+        vals = []
+        t_prev = 0.0
+        for t in np.linspace(0, 2, 20001):
+            if np.linalg.norm(step(t)) > delta:
+                lo, hi = t_prev, t
+                for _ in range(60):
+                    mid = 0.5 * (lo + hi)
+                    if np.linalg.norm(step(mid)) > delta:
+                        hi = mid
+                    else:
+                        lo = mid
+                vals.append(q(step(lo)))
+                break
+            vals.append(q(step(t)))
+            t_prev = t
+        return min(vals)
+
+    def test_breakpoints(self):
+        # All variables reach a bound before the minimizer.
+        for delta in (0.1, 0.3, 10.0):
+            s, t, q, gts = self.tron.exact_cauchy_step(
+                self.x, self.g, sp.csr_matrix(self.H), self.l, self.u, delta)
+            assert np.linalg.norm(s) <= delta * (1 + 1.0e-12)
+            assert np.allclose(q, np.dot(self.g, s) +
+                               0.5 * np.dot(s, np.dot(self.H, s)))
+            assert np.allclose(gts, np.dot(self.g, s))
+            assert np.allclose(q, self.path_minimum(delta), atol=1.0e-6)
+
+    def test_products(self):
+        # One product for the first segment and one per breakpoint.
+        products = []
+
+        class Counting(object):
+            def __mul__(op, v):
+                products.append(v)
+                return np.dot(self.H, v)
+
+        self.tron.exact_cauchy_step(self.x, self.g, Counting(),
+                                    self.l, self.u, 10.0)
+        assert len(products) <= 4
+
+    def test_projected_linesearch(self):
+        # The product of H with the step is returned when the step satisfies
+        # the sufficient decrease condition, possibly after backtracking.
+        H = sp.csr_matrix(self.H)
+        for (d, alpha) in ((np.array([1., 2., -3.]), 1.0),
+                           (np.array([1., 4., -3.]), 0.5)):
+            (x, s, Hs) = self.tron.projected_linesearch(
+                self.x, self.l, self.u, self.g, d, H)
+            assert np.allclose(s, np.clip(alpha * d, self.l, self.u))
+            assert np.allclose(x, self.x + s)
+            assert np.allclose(Hs, np.dot(self.H, s))
+
+        # The step is not checked if it is feasible, or if it is moved
+        # to the nearest breakpoint.
+        for (d, alpha) in ((np.array([0.1, 3., -0.1]), 1.0),
+                           (np.array([1., 10., -3.]), 1.0 / 6)):
+            (x, s, Hs) = self.tron.projected_linesearch(
+                self.x, self.l, self.u, self.g, d, H)
+            assert np.allclose(s, np.clip(alpha * d, self.l, self.u))
+            assert Hs is None
+
+class Test_ReducedHessian(TestCase):
+
+    def setUp(self):
+        n = 6
+        self.H = np.diag(np.arange(1., n + 1)) + 0.5 * np.ones((n, n))
+        self.l = -np.ones(n)
+        self.u = np.ones(n)
+        self.x = np.array([-1., 0.5, 0., 1., 0.2, -0.3])
+
+    def check_products(self, H):
+        reduced = ReducedHessian(6)
+        free = reduced.reset(H, self.x, self.l, self.u)
+        assert np.all(free == [1, 2, 4, 5])
+        v = np.random.random(4)
+        expected = np.dot(self.H[np.ix_(free, free)], v)
+        assert np.allclose(reduced * v, expected)
+        out = np.empty(4)
+        assert reduced.hprod(v, out) is out
+        assert np.allclose(out, expected)
+
+        # Two variables become active.
+        x = self.x.copy()
+        x[2] = -1.
+        x[5] = 1.
+        assert reduced.shrink(x, self.l, self.u) == 2
+        assert reduced.shrink(x, self.l, self.u) == 0
+        assert reduced.changes == [2, 0]
+        assert reduced.shape == (2, 2)
+        assert np.all(reduced.free == [1, 4])
+        v = np.random.random(2)
+        expected = np.dot(self.H[np.ix_([1, 4], [1, 4])], v)
+        assert np.allclose(reduced * v, expected)
+        assert reduced.nprod == 3
+        return reduced
+
+    def test_operator(self):
+        H = self.H
+
+        class Operator(object):
+            def __mul__(op, v):
+                return np.dot(H, v)
+
+        reduced = self.check_products(Operator())
+        assert reduced.matrix is None
+
+    def test_sparse(self):
+        reduced = self.check_products(sp.csr_matrix(self.H))
+        assert np.allclose(reduced.matrix.toarray(),
+                           self.H[np.ix_([1, 4], [1, 4])])
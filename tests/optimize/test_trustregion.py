@@ -0,0 +1,77 @@
+"""Tests relative to the management of the trust-region radius."""
+
+from unittest import TestCase
+import numpy as np
+
+from nlp.tr.trustregion import TrustRegion, GeneralizedTrustRegion, \
+    AdaptiveTrustRegion
+
+
+class Test_WarmStart(TestCase):
+
+    def test_trust_region(self):
+        tr = TrustRegion(warm_start=True)
+        tr.initialize(3.0)
+        assert tr.radius == 3.0
+        tr.update_radius(1.0, 3.0)
+        assert tr.radius == 7.5
+        tr.update_radius(0.0, 1.0)
+        tr.initialize(3.0)
+        assert tr.radius == 7.5
+
+        tr.warm_start = False
+        tr.initialize(3.0)
+        assert tr.radius == 3.0
+
+    def test_generalized(self):
+        tr = GeneralizedTrustRegion(warm_start=True)
+        tr.initialize(1.0)
+        tr.update_radius(0.5, 0.8, tr.gamma3)
+        assert tr.radius_success == tr.radius
+        radius = tr.radius
+        tr.update_radius(-1.0, radius, tr.gamma3)
+        assert tr.radius < radius
+        tr.initialize(1.0)
+        assert tr.radius == radius
+
+
+class Test_AdaptiveTrustRegion(TestCase):
+
+    def setUp(self):
+        self.tr = AdaptiveTrustRegion(memory=2)
+        self.tr.initialize(1.0)
+
+    def test_interior(self):
+        # Very successful interior steps do not restore the expansion factor.
+        tr = self.tr
+        tr.gamma = 2.0
+        tr.update_radius(1.0, 0.5)
+        tr.update_radius(1.0, 0.5)
+        assert tr.gamma == 2.0
+        tr.update_radius(1.0, tr.radius)
+        assert tr.gamma == tr.gamma3
+
+    def test_rejections(self):
+        # Consecutive rejections shrink the radius faster.
+        tr = self.tr
+        tr.update_radius(-1.0, 1.0)
+        assert tr.radius == tr.gamma2
+        tr.update_radius(-1.0, tr.radius)
+        assert np.allclose(tr.radius, tr.gamma2**3)
+        tr.update_radius(0.5, tr.radius)
+        assert tr.nreject == 0
+
+    def test_expansion(self):
+        # A rejection after an increase damps the next increases, until
+        # `memory` very successful steps on the boundary.
+        tr = self.tr
+        tr.update_radius(1.0, 1.0)
+        tr.update_radius(-1.0, tr.radius)
+        assert tr.gamma == 2.0
+        radius = tr.radius
+        tr.update_radius(1.0, radius)
+        assert np.allclose(tr.radius, 2 * radius)
+        tr.update_radius(1.0, tr.radius)
+        assert tr.gamma == tr.gamma3
+        tr.initialize(1.0)
+        assert tr.gamma == tr.gamma3 and len(tr.history) == 0
@@ -0,0 +1,40 @@
+import numpy as np
+
+from nlp.tools.decorators import memoize_point, invalidate_point_cache
+
+
+class Squares(object):
+
+    def __init__(self):
+        self.nevals = 0
+
+    @memoize_point(size=2)
+    def square(self, x, scale=1.0):
+        self.nevals += 1
+        return scale * x * x
+
+
+def test_memoize_point():
+    f = Squares()
+    x = np.arange(3.)
+    y = f.square(x)
+    assert f.square(x.copy()) is y and f.nevals == 1
+
+    # Further arguments bypass the cache.
+    assert np.allclose(f.square(x, scale=2.0), 2 * y) and f.nevals == 2
+
+    # Only the two most recent points are kept.
+    f.square(x + 1)
+    assert f.square(x) is y and f.nevals == 3
+    f.square(x + 2)
+    f.square(x + 1)
+    assert f.nevals == 5
+    assert f.square(x) is not y
+
+    # Instances have separate caches.
+    assert Squares().square(x) is not y
+
+    invalidate_point_cache(f)
+    nevals = f.nevals
+    f.square(x)
+    assert f.nevals == nevals + 1
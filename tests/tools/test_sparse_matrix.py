@@ -0,0 +1,113 @@
+from unittest import TestCase
+import numpy as np
+import pytest
+
+sp = pytest.importorskip("scipy.sparse")
+
+from nlp.tools.sparse_matrix import SparseMatrix, SuperLUContext, coord, \
+    factorize_symmetric
+
+
+class Test_SparseMatrix(TestCase):
+
+    def setUp(self):
+        self.dense = np.array([[1., 0., 2.],
+                               [0., 3., 0.],
+                               [4., 0., 5.],
+                               [0., 6., 0.]])
+        self.A = SparseMatrix.from_matrix(sp.csr_matrix(self.dense))
+
+    def test_coord(self):
+        for B in (self.dense, sp.csc_matrix(self.dense), self.A):
+            vals, rows, cols = coord(B)
+            assert rows.dtype == np.int64 and vals.dtype == np.float64
+            C = np.zeros(self.dense.shape)
+            C[rows, cols] = vals
+            assert np.allclose(C, self.dense)
+
+    def test_put_take(self):
+        A = self.A
+        assert A.shape == (4, 3) and A.nnz == 6
+        assert np.allclose(A.take([0, 2, 3], [2, 0, 0]), [2., 4., 0.])
+
+        # Overwriting values does not create new elements.
+        A.put([7., 8.], [0, 1], [2, 1])
+        assert A.nnz == 6
+        assert np.allclose(A.take([0, 1], [2, 1]), [7., 8.])
+
+        # The last occurrence of a position wins.
+        A.put([1., 2.], [3, 3], [2, 2])
+        assert A.nnz == 7 and A.take([3], [2])[0] == 2.
+
+        A.put(-1.0, range(3))
+        assert np.allclose(A.take(range(3)), -1.0)
+        with pytest.raises(IndexError):
+            A.put(1.0, [4], [0])
+
+    def test_products(self):
+        A = self.A
+        x = np.arange(1., 4.)
+        y = np.arange(1., 5.)
+        assert np.allclose(A * x, np.dot(self.dense, x))
+        assert np.allclose(y * A, np.dot(y, self.dense))
+        assert np.allclose(A.T * y, np.dot(y, self.dense))
+        assert np.allclose((-A).to_scipy().toarray(), -self.dense)
+
+    def test_scale(self):
+        A = self.A
+        A.row_scale(np.array([1., 2., 3., 4.]))
+        A.col_scale(np.array([1., 0.5, 2.]))
+        expected = np.diag([1., 2., 3., 4.]).dot(self.dense)
+        expected = expected.dot(np.diag([1., 0.5, 2.]))
+        assert np.allclose(A.to_scipy().toarray(), expected)
+
+    def test_symmetric(self):
+        H = SparseMatrix((3, 3), symmetric=True)
+        H.put([1., 2., 3.], [0, 0, 2], [0, 2, 1])  # Upper elements mirrored.
+        assert np.all(H.rows >= H.cols)
+        full = np.array([[1., 0., 2.], [0., 0., 3.], [2., 3., 0.]])
+        assert np.allclose(H.to_scipy().toarray(), full)
+        x = np.arange(1., 4.)
+        assert np.allclose(H * x, np.dot(full, x))
+        assert np.allclose(H.norm('fro'), np.linalg.norm(full))
+        assert np.allclose(H.norm(np.inf), np.abs(full).sum(axis=1).max())
+
+        F = SparseMatrix.from_matrix(sp.csr_matrix(full), symmetric=True)
+        assert F.nnz == 3
+        assert np.allclose(F.to_scipy().toarray(), full)
+
+
+class Test_SuperLUContext(TestCase):
+
+    def setUp(self):
+        K = np.array([[4., 1., 0., 1.],
+                      [1., 3., 1., 0.],
+                      [0., 1., -2., 0.],
+                      [1., 0., 0., -1.]])
+        self.dense = K
+        self.K = SparseMatrix.from_matrix(sp.coo_matrix(K), symmetric=True)
+        self.rhs = np.arange(1., 5.)
+
+    def test_solve(self):
+        LBL = SuperLUContext(self.K)
+        assert LBL.isFullRank
+        LBL.solve(self.rhs)
+        LBL.refine(self.rhs, tol=1.0e-12, nitref=3)
+        assert np.allclose(LBL.x, np.linalg.solve(self.dense, self.rhs))
+        assert np.linalg.norm(LBL.residual) < 1.0e-12
+        assert LBL.berr < 1.0e-12
+
+        # Refactorize after a change of values.
+        self.K.put(5.0, [0])
+        LBL.factorize(self.K)
+        LBL.solve(self.rhs)
+        self.dense[0, 0] = 5.0
+        assert np.allclose(LBL.x, np.linalg.solve(self.dense, self.rhs))
+
+    def test_singular(self):
+        K = SparseMatrix((2, 2), symmetric=True)
+        K.put([1., 1., 1.], [0, 1, 1], [0, 0, 1])
+        LBL = factorize_symmetric(K)
+        assert not LBL.isFullRank
+        LBL.solve(np.array([1., 1.]))
+        assert np.allclose(LBL.x, [0.5, 0.5])
@@ -0,0 +1,93 @@
+from unittest import TestCase
+import numpy as np
+import pytest
+
+from nlp.tools.sparse_vector import SparseVector
+
+
+class Test_SparseVector(TestCase):
+
+    def setUp(self):
+        self.n = 6
+        self.u = SparseVector(6, [4, 1, 2, 1], [3., 1., -2., 1.])
+        self.v = SparseVector(6, [0, 2, 4], [1., 5., -1.])
+        self.du = np.array([0., 2., -2., 0., 3., 0.])
+        self.dv = np.array([1., 0., 5., 0., -1., 0.])
+
+    def test_init(self):
+        u = self.u
+        assert u.n == self.n and u.shape == (self.n,)
+        assert u.nnz == 3
+        assert u.indices.dtype == np.int32
+        assert u.values.dtype == np.float64
+        assert np.all(u.indices == [1, 2, 4])
+        assert np.allclose(u.values, [2., -2., 3.])
+        assert u[1] == 2. and u[3] == 0. and u[-2] == 3.
+        assert SparseVector(4).nnz == 0
+        with pytest.raises(IndexError):
+            SparseVector(4, [4], [1.])
+        with pytest.raises(ValueError):
+            SparseVector(4, [1, 2], [1.])
+
+    def test_conversions(self):
+        assert np.allclose(self.u.to_array(), self.du)
+        w = SparseVector.from_array(self.du)
+        assert np.all(w.indices == self.u.indices)
+        assert np.allclose(w.values, self.u.values)
+        w = SparseVector.from_dict(self.n, {4: 3., 1: 2., 2: -2.})
+        assert np.allclose(w.to_array(), self.du)
+        assert self.u.to_dict() == {1: 2., 2: -2., 4: 3.}
+
+    def test_scipy(self):
+        pytest.importorskip("scipy")
+        s = self.u.to_scipy()
+        assert s.shape == (1, self.n)
+        assert np.allclose(s.toarray().ravel(), self.du)
+        w = SparseVector.from_scipy(self.u.to_scipy('csc').T)
+        assert np.allclose(w.to_array(), self.du)
+
+    def test_add(self):
+        w = self.u + self.v
+        assert isinstance(w, SparseVector)
+        assert np.all(w.indices == [0, 1, 2, 4])
+        assert np.allclose(w.to_array(), self.du + self.dv)
+        assert np.allclose((self.u - self.v).to_array(), self.du - self.dv)
+
+        x = np.arange(self.n, dtype=np.float64)
+        assert np.allclose(self.u + x, self.du + x)
+        assert np.allclose(x + self.u, self.du + x)
+        assert np.allclose(x - self.u, x - self.du)
+        assert np.allclose(self.u - x, self.du - x)
+        with pytest.raises(ValueError):
+            self.u + SparseVector(3)
+
+    def test_scale(self):
+        assert np.allclose((2 * self.u).to_array(), 2 * self.du)
+        assert np.allclose((self.u * 2).to_array(), 2 * self.du)
+        assert np.allclose((self.u / 2).to_array(), self.du / 2)
+        assert np.allclose((-self.u).to_array(), -self.du)
+        w = self.u.copy()
+        w *= -1
+        assert np.allclose(w.to_array(), -self.du)
+        assert np.allclose(self.u.to_array(), self.du)
+
+    def test_elementwise(self):
+        w = self.u * self.v
+        assert np.all(w.indices == [2, 4])
+        assert np.allclose(w.to_array(), self.du * self.dv)
+        x = np.arange(self.n, dtype=np.float64)
+        assert np.allclose((self.u * x).to_array(), self.du * x)
+
+    def test_dot(self):
+        assert np.allclose(self.u.dot(self.v), np.dot(self.du, self.dv))
+        x = np.arange(self.n, dtype=np.float64)
+        assert np.allclose(self.u.dot(x), np.dot(self.du, x))
+        assert SparseVector(self.n).dot(self.v) == 0.0
+
+    def test_norm(self):
+        assert np.allclose(self.u.norm(), np.linalg.norm(self.du))
+        assert np.allclose(self.u.norm(1), np.linalg.norm(self.du, 1))
+        assert np.allclose(self.u.norm(np.inf),
+                           np.linalg.norm(self.du, np.inf))
+        assert np.allclose(self.u.norm(3), np.linalg.norm(self.du, 3))
+        assert SparseVector(self.n).norm() == 0.0
@@ -91,3 +91,73 @@ def test_roots_quadratic():
     roots = roots_quadratic(1., 0, -2., tol=1.0e-8, nitref=1)
     np.testing.assert_approx_equal(roots[0], -np.sqrt(2))
     np.testing.assert_approx_equal(roots[1], np.sqrt(2))
+
+
+def test_axpy():
+    x = np.array([1., 2., 3.])
+    y = np.ones(3)
+    assert axpy(2., x, y) is y
+    assert np.allclose(y, [3., 5., 7.])
+
+    # Non-contiguous arrays are updated as well.
+    z = np.ones(6)
+    axpy(-1., x, z[::2])
+    assert np.allclose(z, [0., 1., -1., 1., -2., 1.])
+
+
+def test_matvec():
+    H = np.array([[2., 1.], [1., 3.]])
+    v = np.array([1., -1.])
+    out = np.empty(2)
+    assert matvec(H, v, out) is out
+    assert np.allclose(out, [1., -2.])
+
+
+def test_breakpoint_steps():
+    x = np.array([0., 1., 0., 0.])
+    d = np.array([1., 1., -2., 0.])
+    l = np.array([-1., -1., -1., -1.])
+    u = np.array([2., 1., np.inf, 1.])
+    steps = breakpoint_steps(x, d, l, u)
+    assert np.allclose(steps, [2., 0., 0.5, np.inf])
+
+
+def test_evaluate_model_methods_at_starting_point(capsys):
+    from nlp.model.nlpmodel import NLPModel
+    from nlp.tools.sparse_vector import SparseVector
+
+    class LinCon(NLPModel):
+        # f(x) = |x|^2 / 2 and c(x) = x1 + 2 x2 + ... + 7 x7.
+        def __init__(self):
+            super(LinCon, self).__init__(8, m=1, name='lincon',
+                                         x0=np.ones(8))
+            self.a = np.arange(8, dtype=np.float)
+
+        def obj(self, x):
+            return 0.5 * np.dot(x, x)
+
+        def grad(self, x):
+            return x.copy()
+
+        def cons(self, x):
+            return np.array([np.dot(self.a, x)])
+
+        def icons(self, i, x):
+            return np.dot(self.a, x)
+
+        def sigrad(self, i, x):
+            return SparseVector.from_array(self.a)
+
+        def jac(self, x):
+            return (self.a[1:], np.zeros(7, dtype=np.int), np.arange(1, 8))
+
+        def hess(self, x, z):
+            return (np.ones(8), np.arange(8), np.arange(8))
+
+        def hprod(self, x, z, v):
+            return v.copy()
+
+    evaluate_model_methods_at_starting_point(LinCon())
+    out = capsys.readouterr()[0]
+    # The first five nonzero elements of the sparse constraint gradient.
+    assert str({1: 1., 2: 2., 3: 3., 4: 4., 5: 5.}) in out